@@ -1,5 +1,6 @@
 const CONST_RAW = [
   {
+    "cid": 9,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -8,8 +9,10 @@ const CONST_RAW = [
     "turn_out": 94406,
     "percent_invalid": 1.3336,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 37438,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 18261,
     "margin": 19177,
     "valid": 90092,
@@ -18,6 +21,7 @@ const CONST_RAW = [
     "ballot_surplus": -36
   },
   {
+    "cid": 18,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -26,8 +30,10 @@ const CONST_RAW = [
     "turn_out": 104102,
     "percent_invalid": 1.3189,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 38313,
     "runnerup_party": "ไทยสร้างไทย",
+    "runnerup_pid": 49,
     "runnerup_votes": 22492,
     "margin": 15821,
     "valid": 99736,
@@ -36,6 +42,7 @@ const CONST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 19,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -44,8 +51,10 @@ const CONST_RAW = [
     "turn_out": 102613,
     "percent_invalid": 1.24351,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 36985,
     "runnerup_party": "ไทยสร้างไทย",
+    "runnerup_pid": 49,
     "runnerup_votes": 22242,
     "margin": 14743,
     "valid": 99116,
@@ -54,6 +63,7 @@ const CONST_RAW = [
     "ballot_surplus": 2
   },
   {
+    "cid": 20,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -62,8 +72,10 @@ const CONST_RAW = [
     "turn_out": 106410,
     "percent_invalid": 1.1155,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 45797,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 18633,
     "margin": 27164,
     "valid": 101975,
@@ -72,6 +84,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 21,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -80,8 +93,10 @@ const CONST_RAW = [
     "turn_out": 100382,
     "percent_invalid": 1.02807,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 43186,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 22312,
     "margin": 20874,
     "valid": 96249,
@@ -90,6 +105,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 22,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -98,8 +114,10 @@ const CONST_RAW = [
     "turn_out": 101871,
     "percent_invalid": 1.17109,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 42218,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 29106,
     "margin": 13112,
     "valid": 97891,
@@ -108,6 +126,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 24,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -116,8 +135,10 @@ const CONST_RAW = [
     "turn_out": 101785,
     "percent_invalid": 1.28604,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 40129,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 27111,
     "margin": 13018,
     "valid": 97752,
@@ -126,6 +147,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 25,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -134,8 +156,10 @@ const CONST_RAW = [
     "turn_out": 85830,
     "percent_invalid": 2.02144,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 30439,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 19155,
     "margin": 11284,
     "valid": 81898,
@@ -144,6 +168,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 26,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -152,8 +177,10 @@ const CONST_RAW = [
     "turn_out": 89624,
     "percent_invalid": 2.19472,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 36884,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 17236,
     "margin": 19648,
     "valid": 85070,
@@ -162,6 +189,7 @@ const CONST_RAW = [
     "ballot_surplus": -2
   },
   {
+    "cid": 27,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -170,8 +198,10 @@ const CONST_RAW = [
     "turn_out": 101228,
     "percent_invalid": 1.27633,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 41841,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 26670,
     "margin": 15171,
     "valid": 96535,
@@ -180,6 +210,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 10,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -188,8 +219,10 @@ const CONST_RAW = [
     "turn_out": 96992,
     "percent_invalid": 1.41043,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 41148,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 17908,
     "margin": 23240,
     "valid": 92198,
@@ -198,6 +231,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 28,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -206,8 +240,10 @@ const CONST_RAW = [
     "turn_out": 90262,
     "percent_invalid": 1.86125,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 34749,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 34745,
     "margin": 4,
     "valid": 86092,
@@ -216,6 +252,7 @@ const CONST_RAW = [
     "ballot_surplus": 2
   },
   {
+    "cid": 29,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -224,8 +261,10 @@ const CONST_RAW = [
     "turn_out": 99180,
     "percent_invalid": 1.32486,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 44959,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 16496,
     "margin": 28463,
     "valid": 95539,
@@ -234,6 +273,7 @@ const CONST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 30,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -242,8 +282,10 @@ const CONST_RAW = [
     "turn_out": 97065,
     "percent_invalid": 1.30634,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 43083,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 16377,
     "margin": 26706,
     "valid": 92652,
@@ -252,6 +294,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 31,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -260,8 +303,10 @@ const CONST_RAW = [
     "turn_out": 105969,
     "percent_invalid": 1.19375,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 47225,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 17956,
     "margin": 29269,
     "valid": 101343,
@@ -270,6 +315,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 32,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -278,8 +324,10 @@ const CONST_RAW = [
     "turn_out": 103082,
     "percent_invalid": 1.56671,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 48317,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 18320,
     "margin": 29997,
     "valid": 97818,
@@ -288,6 +336,7 @@ const CONST_RAW = [
     "ballot_surplus": -2
   },
   {
+    "cid": 33,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -296,8 +345,10 @@ const CONST_RAW = [
     "turn_out": 92942,
     "percent_invalid": 1.41271,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 35623,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 28189,
     "margin": 7434,
     "valid": 88869,
@@ -306,6 +357,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 34,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -314,8 +366,10 @@ const CONST_RAW = [
     "turn_out": 101311,
     "percent_invalid": 1.91884,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 46570,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 19813,
     "margin": 26757,
     "valid": 96708,
@@ -324,6 +378,7 @@ const CONST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 35,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -332,8 +387,10 @@ const CONST_RAW = [
     "turn_out": 101144,
     "percent_invalid": 1.45535,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 50035,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 23351,
     "margin": 26684,
     "valid": 97753,
@@ -342,6 +399,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 36,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -350,8 +408,10 @@ const CONST_RAW = [
     "turn_out": 105489,
     "percent_invalid": 1.74047,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 47592,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 26479,
     "margin": 21113,
     "valid": 101245,
@@ -360,6 +420,7 @@ const CONST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 37,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -368,8 +429,10 @@ const CONST_RAW = [
     "turn_out": 108687,
     "percent_invalid": 1.92203,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 47652,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 23541,
     "margin": 24111,
     "valid": 103561,
@@ -378,6 +441,7 @@ const CONST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 11,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -386,8 +450,10 @@ const CONST_RAW = [
     "turn_out": 88098,
     "percent_invalid": 1.28266,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 35189,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 16233,
     "margin": 18956,
     "valid": 84283,
@@ -396,6 +462,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 38,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -404,8 +471,10 @@ const CONST_RAW = [
     "turn_out": 104742,
     "percent_invalid": 1.64595,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 49770,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 24520,
     "margin": 25250,
     "valid": 99788,
@@ -414,6 +483,7 @@ const CONST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 39,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -422,8 +492,10 @@ const CONST_RAW = [
     "turn_out": 110632,
     "percent_invalid": 1.45979,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 46405,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 23617,
     "margin": 22788,
     "valid": 105309,
@@ -432,6 +504,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 40,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -440,8 +513,10 @@ const CONST_RAW = [
     "turn_out": 101615,
     "percent_invalid": 1.74384,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 43115,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 18736,
     "margin": 24379,
     "valid": 96402,
@@ -450,6 +525,7 @@ const CONST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 41,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -458,8 +534,10 @@ const CONST_RAW = [
     "turn_out": 109252,
     "percent_invalid": 1.65764,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 45189,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 18628,
     "margin": 26561,
     "valid": 104231,
@@ -468,6 +546,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 12,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -476,8 +555,10 @@ const CONST_RAW = [
     "turn_out": 89246,
     "percent_invalid": 1.55973,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 33381,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 14908,
     "margin": 18473,
     "valid": 85368,
@@ -486,6 +567,7 @@ const CONST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 13,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -494,8 +576,10 @@ const CONST_RAW = [
     "turn_out": 99240,
     "percent_invalid": 1.22733,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 47147,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 15886,
     "margin": 31261,
     "valid": 95078,
@@ -504,6 +588,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 14,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -512,8 +597,10 @@ const CONST_RAW = [
     "turn_out": 108113,
     "percent_invalid": 1.33564,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 46082,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 24040,
     "margin": 22042,
     "valid": 103314,
@@ -522,6 +609,7 @@ const CONST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 15,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -530,8 +618,10 @@ const CONST_RAW = [
     "turn_out": 99646,
     "percent_invalid": 1.2996,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 45050,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 24882,
     "margin": 20168,
     "valid": 94975,
@@ -540,6 +630,7 @@ const CONST_RAW = [
     "ballot_surplus": -2
   },
   {
+    "cid": 16,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -548,8 +639,10 @@ const CONST_RAW = [
     "turn_out": 108227,
     "percent_invalid": 0.96094,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 40011,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 25174,
     "margin": 14837,
     "valid": 103549,
@@ -558,6 +651,7 @@ const CONST_RAW = [
     "ballot_surplus": 3
   },
   {
+    "cid": 17,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -566,8 +660,10 @@ const CONST_RAW = [
     "turn_out": 107795,
     "percent_invalid": 1.7858,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 50132,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 20573,
     "margin": 29559,
     "valid": 101921,
@@ -576,6 +672,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 325,
     "province_thai": "สมุทรปราการ",
     "province_eng": "SAMUT PRAKAN",
     "prov_id": "SPK",
@@ -584,8 +681,10 @@ const CONST_RAW = [
     "turn_out": 100175,
     "percent_invalid": 2.41677,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 46383,
     "runnerup_party": "พลังประชารัฐ",
+    "runnerup_pid": 38,
     "runnerup_votes": 21460,
     "margin": 24923,
     "valid": 95110,
@@ -594,6 +693,7 @@ const CONST_RAW = [
     "ballot_surplus": 2
   },
   {
+    "cid": 326,
     "province_thai": "สมุทรปราการ",
     "province_eng": "SAMUT PRAKAN",
     "prov_id": "SPK",
@@ -602,8 +702,10 @@ const CONST_RAW = [
     "turn_out": 99349,
     "percent_invalid": 2.31708,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 43435,
     "runnerup_party": "พลังประชารัฐ",
+    "runnerup_pid": 38,
     "runnerup_votes": 24725,
     "margin": 18710,
     "valid": 94926,
@@ -612,6 +714,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 327,
     "province_thai": "สมุทรปราการ",
     "province_eng": "SAMUT PRAKAN",
     "prov_id": "SPK",
@@ -620,8 +723,10 @@ const CONST_RAW = [
     "turn_out": 106238,
     "percent_invalid": 2.05764,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 50177,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 17484,
     "margin": 32693,
     "valid": 101108,
@@ -630,6 +735,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 328,
     "province_thai": "สมุทรปราการ",
     "province_eng": "SAMUT PRAKAN",
     "prov_id": "SPK",
@@ -638,8 +744,10 @@ const CONST_RAW = [
     "turn_out": 101810,
     "percent_invalid": 1.80729,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 49043,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 19038,
     "margin": 30005,
     "valid": 96700,
@@ -648,6 +756,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 329,
     "province_thai": "สมุทรปราการ",
     "province_eng": "SAMUT PRAKAN",
     "prov_id": "SPK",
@@ -656,8 +765,10 @@ const CONST_RAW = [
     "turn_out": 119975,
     "percent_invalid": 1.94874,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 60282,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 22505,
     "margin": 37777,
     "valid": 114386,
@@ -666,6 +777,7 @@ const CONST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 330,
     "province_thai": "สมุทรปราการ",
     "province_eng": "SAMUT PRAKAN",
     "prov_id": "SPK",
@@ -674,8 +786,10 @@ const CONST_RAW = [
     "turn_out": 102544,
     "percent_invalid": 3.0777,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 37730,
     "runnerup_party": "พลังประชารัฐ",
+    "runnerup_pid": 38,
     "runnerup_votes": 20909,
     "margin": 16821,
     "valid": 96672,
@@ -684,6 +798,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 331,
     "province_thai": "สมุทรปราการ",
     "province_eng": "SAMUT PRAKAN",
     "prov_id": "SPK",
@@ -692,8 +807,10 @@ const CONST_RAW = [
     "turn_out": 113796,
     "percent_invalid": 2.32258,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 39151,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 27455,
     "margin": 11696,
     "valid": 109232,
@@ -702,6 +819,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 332,
     "province_thai": "สมุทรปราการ",
     "province_eng": "SAMUT PRAKAN",
     "prov_id": "SPK",
@@ -710,8 +828,10 @@ const CONST_RAW = [
     "turn_out": 113255,
     "percent_invalid": 2.76897,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 46539,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 24814,
     "margin": 21725,
     "valid": 107511,
@@ -720,6 +840,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 158,
     "province_thai": "นนทบุรี",
     "province_eng": "NONTHABURI",
     "prov_id": "NBI",
@@ -728,8 +849,10 @@ const CONST_RAW = [
     "turn_out": 107099,
     "percent_invalid": 2.14381,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 45615,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 28166,
     "margin": 17449,
     "valid": 100698,
@@ -738,6 +861,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 159,
     "province_thai": "นนทบุรี",
     "province_eng": "NONTHABURI",
     "prov_id": "NBI",
@@ -746,8 +870,10 @@ const CONST_RAW = [
     "turn_out": 95418,
     "percent_invalid": 2.1191,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 39086,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 25079,
     "margin": 14007,
     "valid": 90006,
@@ -756,6 +882,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 160,
     "province_thai": "นนทบุรี",
     "province_eng": "NONTHABURI",
     "prov_id": "NBI",
@@ -764,8 +891,10 @@ const CONST_RAW = [
     "turn_out": 106509,
     "percent_invalid": 1.88153,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 44369,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 25626,
     "margin": 18743,
     "valid": 100310,
@@ -774,6 +903,7 @@ const CONST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 161,
     "province_thai": "นนทบุรี",
     "province_eng": "NONTHABURI",
     "prov_id": "NBI",
@@ -782,8 +912,10 @@ const CONST_RAW = [
     "turn_out": 96342,
     "percent_invalid": 1.63065,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 36249,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 25442,
     "margin": 10807,
     "valid": 91317,
@@ -792,6 +924,7 @@ const CONST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 162,
     "province_thai": "นนทบุรี",
     "province_eng": "NONTHABURI",
     "prov_id": "NBI",
@@ -800,8 +933,10 @@ const CONST_RAW = [
     "turn_out": 101916,
     "percent_invalid": 2.89748,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 48055,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 19897,
     "margin": 28158,
     "valid": 94393,
@@ -810,6 +945,7 @@ const CONST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 163,
     "province_thai": "นนทบุรี",
     "province_eng": "NONTHABURI",
     "prov_id": "NBI",
@@ -818,8 +954,10 @@ const CONST_RAW = [
     "turn_out": 107193,
     "percent_invalid": 2.10088,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 48169,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 24252,
     "margin": 23917,
     "valid": 100958,
@@ -828,6 +966,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 164,
     "province_thai": "นนทบุรี",
     "province_eng": "NONTHABURI",
     "prov_id": "NBI",
@@ -836,8 +975,10 @@ const CONST_RAW = [
     "turn_out": 105655,
     "percent_invalid": 2.2299,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 41356,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 16098,
     "margin": 25258,
     "valid": 99944,
@@ -846,6 +987,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 165,
     "province_thai": "นนทบุรี",
     "province_eng": "NONTHABURI",
     "prov_id": "NBI",
@@ -854,8 +996,10 @@ const CONST_RAW = [
     "turn_out": 103196,
     "percent_invalid": 2.98461,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 41734,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 24335,
     "margin": 17399,
     "valid": 96221,
@@ -864,6 +1008,7 @@ const CONST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 255,
     "province_thai": "ปทุมธานี",
     "province_eng": "PATHUM THANI",
     "prov_id": "PTE",
@@ -872,8 +1017,10 @@ const CONST_RAW = [
     "turn_out": 109016,
     "percent_invalid": 2.80326,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 29272,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 27439,
     "margin": 1833,
     "valid": 103463,
@@ -882,6 +1029,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 256,
     "province_thai": "ปทุมธานี",
     "province_eng": "PATHUM THANI",
     "prov_id": "PTE",
@@ -890,8 +1038,10 @@ const CONST_RAW = [
     "turn_out": 108556,
     "percent_invalid": 2.23848,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 40215,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 37011,
     "margin": 3204,
     "valid": 102344,
@@ -900,6 +1050,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 257,
     "province_thai": "ปทุมธานี",
     "province_eng": "PATHUM THANI",
     "prov_id": "PTE",
@@ -908,8 +1059,10 @@ const CONST_RAW = [
     "turn_out": 99771,
     "percent_invalid": 1.84222,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 43096,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 25619,
     "margin": 17477,
     "valid": 95288,
@@ -918,6 +1071,7 @@ const CONST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 258,
     "province_thai": "ปทุมธานี",
     "province_eng": "PATHUM THANI",
     "prov_id": "PTE",
@@ -926,8 +1080,10 @@ const CONST_RAW = [
     "turn_out": 106181,
     "percent_invalid": 2.08983,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 41705,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 24519,
     "margin": 17186,
     "valid": 100871,
@@ -936,6 +1092,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 259,
     "province_thai": "ปทุมธานี",
     "province_eng": "PATHUM THANI",
     "prov_id": "PTE",
@@ -944,8 +1101,10 @@ const CONST_RAW = [
     "turn_out": 115676,
     "percent_invalid": 2.16121,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 35078,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 33885,
     "margin": 1193,
     "valid": 110323,
@@ -954,6 +1113,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 260,
     "province_thai": "ปทุมธานี",
     "province_eng": "PATHUM THANI",
     "prov_id": "PTE",
@@ -962,8 +1122,10 @@ const CONST_RAW = [
     "turn_out": 112943,
     "percent_invalid": 1.56008,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 48900,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 22363,
     "margin": 26537,
     "valid": 107771,
@@ -972,6 +1134,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 261,
     "province_thai": "ปทุมธานี",
     "province_eng": "PATHUM THANI",
     "prov_id": "PTE",
@@ -980,8 +1143,10 @@ const CONST_RAW = [
     "turn_out": 112659,
     "percent_invalid": 2.36555,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 36227,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 30272,
     "margin": 5955,
     "valid": 107343,
@@ -990,16 +1155,19 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 400,
     "province_thai": "ปทุมธานี",
     "province_eng": "PATHUM THANI",
     "prov_id": "PTE",
     "cons_no": 8,
     "region": "Central",
     "turn_out": 0,
-    "percent_invalid": 0,
+    "percent_invalid": 0.0,
     "winner_party": "Unknown",
+    "winner_pid": -1,
     "winner_votes": 0,
     "runnerup_party": "Unknown",
+    "runnerup_pid": -1,
     "runnerup_votes": 0,
     "margin": 0,
     "valid": 0,
@@ -1008,6 +1176,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 4,
     "province_thai": "พระนครศรีอยุธยา",
     "province_eng": "PHRA NAKHON SI AYUTTHAYA",
     "prov_id": "AYA",
@@ -1016,8 +1185,10 @@ const CONST_RAW = [
     "turn_out": 110317,
     "percent_invalid": 3.24338,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 41081,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 35676,
     "margin": 5405,
     "valid": 102821,
@@ -1026,6 +1197,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 5,
     "province_thai": "พระนครศรีอยุธยา",
     "province_eng": "PHRA NAKHON SI AYUTTHAYA",
     "prov_id": "AYA",
@@ -1034,8 +1206,10 @@ const CONST_RAW = [
     "turn_out": 106945,
     "percent_invalid": 4.04881,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 27467,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 26804,
     "margin": 663,
     "valid": 100226,
@@ -1044,6 +1218,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 6,
     "province_thai": "พระนครศรีอยุธยา",
     "province_eng": "PHRA NAKHON SI AYUTTHAYA",
     "prov_id": "AYA",
@@ -1052,8 +1227,10 @@ const CONST_RAW = [
     "turn_out": 107899,
     "percent_invalid": 3.05471,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 47117,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 34584,
     "margin": 12533,
     "valid": 102673,
@@ -1062,6 +1239,7 @@ const CONST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 7,
     "province_thai": "พระนครศรีอยุธยา",
     "province_eng": "PHRA NAKHON SI AYUTTHAYA",
     "prov_id": "AYA",
@@ -1070,8 +1248,10 @@ const CONST_RAW = [
     "turn_out": 113956,
     "percent_invalid": 2.54572,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 50080,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 31073,
     "margin": 19007,
     "valid": 109107,
@@ -1080,6 +1260,7 @@ const CONST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 8,
     "province_thai": "พระนครศรีอยุธยา",
     "province_eng": "PHRA NAKHON SI AYUTTHAYA",
     "prov_id": "AYA",
@@ -1088,8 +1269,10 @@ const CONST_RAW = [
     "turn_out": 107231,
     "percent_invalid": 3.52044,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 37275,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 30120,
     "margin": 7155,
     "valid": 101511,
@@ -1098,6 +1281,7 @@ const CONST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 2,
     "province_thai": "อ่างทอง",
     "province_eng": "ANG THONG",
     "prov_id": "ATG",
@@ -1106,8 +1290,10 @@ const CONST_RAW = [
     "turn_out": 89918,
     "percent_invalid": 3.62886,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 44780,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 20886,
     "margin": 23894,
     "valid": 84595,
@@ -1116,6 +1302,7 @@ const CONST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 3,
     "province_thai": "อ่างทอง",
     "province_eng": "ANG THONG",
     "prov_id": "ATG",
@@ -1124,8 +1311,10 @@ const CONST_RAW = [
     "turn_out": 91466,
     "percent_invalid": 4.16002,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 47887,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 22071,
     "margin": 25816,
     "valid": 86144,
@@ -1134,6 +1323,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 140,
     "province_thai": "ลพบุรี",
     "province_eng": "LOP BURI",
     "prov_id": "LRI",
@@ -1142,8 +1332,10 @@ const CONST_RAW = [
     "turn_out": 93794,
     "percent_invalid": 2.91063,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 28405,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 25409,
     "margin": 2996,
     "valid": 87126,
@@ -1152,6 +1344,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 141,
     "province_thai": "ลพบุรี",
     "province_eng": "LOP BURI",
     "prov_id": "LRI",
@@ -1160,8 +1353,10 @@ const CONST_RAW = [
     "turn_out": 95559,
     "percent_invalid": 4.81273,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 26331,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 23041,
     "margin": 3290,
     "valid": 87925,
@@ -1170,6 +1365,7 @@ const CONST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 142,
     "province_thai": "ลพบุรี",
     "province_eng": "LOP BURI",
     "prov_id": "LRI",
@@ -1178,8 +1374,10 @@ const CONST_RAW = [
     "turn_out": 97574,
     "percent_invalid": 4.38539,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 43330,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 30123,
     "margin": 13207,
     "valid": 91298,
@@ -1188,6 +1386,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 143,
     "province_thai": "ลพบุรี",
     "province_eng": "LOP BURI",
     "prov_id": "LRI",
@@ -1196,8 +1395,10 @@ const CONST_RAW = [
     "turn_out": 89787,
     "percent_invalid": 5.47073,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 41413,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 18421,
     "margin": 22992,
     "valid": 83193,
@@ -1206,6 +1407,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 289,
     "province_thai": "สิงห์บุรี",
     "province_eng": "SING BURI",
     "prov_id": "SBR",
@@ -1214,8 +1416,10 @@ const CONST_RAW = [
     "turn_out": 131501,
     "percent_invalid": 4.62658,
     "winner_party": "พลังประชารัฐ",
+    "winner_pid": 38,
     "winner_votes": 42292,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 39290,
     "margin": 3002,
     "valid": 121478,
@@ -1224,6 +1428,7 @@ const CONST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 79,
     "province_thai": "ชัยนาท",
     "province_eng": "CHAI NAT",
     "prov_id": "CNT",
@@ -1232,8 +1437,10 @@ const CONST_RAW = [
     "turn_out": 102135,
     "percent_invalid": 4.55476,
     "winner_party": "รวมไทยสร้างชาติ",
+    "winner_pid": 50,
     "winner_votes": 43935,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 27497,
     "margin": 16438,
     "valid": 94988,
@@ -1242,6 +1449,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 80,
     "province_thai": "ชัยนาท",
     "province_eng": "CHAI NAT",
     "prov_id": "CNT",
@@ -1250,8 +1458,10 @@ const CONST_RAW = [
     "turn_out": 103343,
     "percent_invalid": 5.50884,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 52205,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 20676,
     "margin": 31529,
     "valid": 96042,
@@ -1260,6 +1470,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 333,
     "province_thai": "สระบุรี",
     "province_eng": "SARABURI",
     "prov_id": "SRI",
@@ -1268,8 +1479,10 @@ const CONST_RAW = [
     "turn_out": 103684,
     "percent_invalid": 3.56468,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 32444,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 29074,
     "margin": 3370,
     "valid": 96672,
@@ -1278,6 +1491,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 334,
     "province_thai": "สระบุรี",
     "province_eng": "SARABURI",
     "prov_id": "SRI",
@@ -1286,8 +1500,10 @@ const CONST_RAW = [
     "turn_out": 109753,
     "percent_invalid": 4.5001,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 38203,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 32412,
     "margin": 5791,
     "valid": 102734,
@@ -1296,6 +1512,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 335,
     "province_thai": "สระบุรี",
     "province_eng": "SARABURI",
     "prov_id": "SRI",
@@ -1304,8 +1521,10 @@ const CONST_RAW = [
     "turn_out": 103466,
     "percent_invalid": 3.78192,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 45417,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 27120,
     "margin": 18297,
     "valid": 97734,
@@ -1314,6 +1533,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 336,
     "province_thai": "สระบุรี",
     "province_eng": "SARABURI",
     "prov_id": "SRI",
@@ -1322,8 +1542,10 @@ const CONST_RAW = [
     "turn_out": 103760,
     "percent_invalid": 4.03624,
     "winner_party": "พลังประชารัฐ",
+    "winner_pid": 38,
     "winner_votes": 29676,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 26810,
     "margin": 2866,
     "valid": 96817,
@@ -1332,6 +1554,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 55,
     "province_thai": "ชลบุรี",
     "province_eng": "CHON BURI",
     "prov_id": "CBI",
@@ -1340,8 +1563,10 @@ const CONST_RAW = [
     "turn_out": 104984,
     "percent_invalid": 2.23367,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 36463,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 32542,
     "margin": 3921,
     "valid": 100046,
@@ -1350,6 +1575,7 @@ const CONST_RAW = [
     "ballot_surplus": 8
   },
   {
+    "cid": 64,
     "province_thai": "ชลบุรี",
     "province_eng": "CHON BURI",
     "prov_id": "CBI",
@@ -1358,8 +1584,10 @@ const CONST_RAW = [
     "turn_out": 93252,
     "percent_invalid": 2.39566,
     "winner_party": "พลังประชารัฐ",
+    "winner_pid": 38,
     "winner_votes": 27461,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 27387,
     "margin": 74,
     "valid": 87961,
@@ -1368,6 +1596,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 56,
     "province_thai": "ชลบุรี",
     "province_eng": "CHON BURI",
     "prov_id": "CBI",
@@ -1376,8 +1605,10 @@ const CONST_RAW = [
     "turn_out": 88518,
     "percent_invalid": 1.96344,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 30162,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 23381,
     "margin": 6781,
     "valid": 84875,
@@ -1386,6 +1617,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 57,
     "province_thai": "ชลบุรี",
     "province_eng": "CHON BURI",
     "prov_id": "CBI",
@@ -1394,8 +1626,10 @@ const CONST_RAW = [
     "turn_out": 98964,
     "percent_invalid": 2.53729,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 33183,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 30095,
     "margin": 3088,
     "valid": 94699,
@@ -1404,6 +1638,7 @@ const CONST_RAW = [
     "ballot_surplus": 2
   },
   {
+    "cid": 58,
     "province_thai": "ชลบุรี",
     "province_eng": "CHON BURI",
     "prov_id": "CBI",
@@ -1412,8 +1647,10 @@ const CONST_RAW = [
     "turn_out": 94166,
     "percent_invalid": 4.64605,
     "winner_party": "รวมไทยสร้างชาติ",
+    "winner_pid": 50,
     "winner_votes": 36128,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 24835,
     "margin": 11293,
     "valid": 88355,
@@ -1422,6 +1659,7 @@ const CONST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 59,
     "province_thai": "ชลบุรี",
     "province_eng": "CHON BURI",
     "prov_id": "CBI",
@@ -1430,8 +1668,10 @@ const CONST_RAW = [
     "turn_out": 111292,
     "percent_invalid": 3.7442,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 41939,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 33814,
     "margin": 8125,
     "valid": 105275,
@@ -1440,6 +1680,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 60,
     "province_thai": "ชลบุรี",
     "province_eng": "CHON BURI",
     "prov_id": "CBI",
@@ -1448,8 +1689,10 @@ const CONST_RAW = [
     "turn_out": 101948,
     "percent_invalid": 2.27273,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 37572,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 27879,
     "margin": 9693,
     "valid": 97578,
@@ -1458,6 +1701,7 @@ const CONST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 61,
     "province_thai": "ชลบุรี",
     "province_eng": "CHON BURI",
     "prov_id": "CBI",
@@ -1466,8 +1710,10 @@ const CONST_RAW = [
     "turn_out": 92544,
     "percent_invalid": 1.83048,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 40918,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 28983,
     "margin": 11935,
     "valid": 89027,
@@ -1476,6 +1722,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 62,
     "province_thai": "ชลบุรี",
     "province_eng": "CHON BURI",
     "prov_id": "CBI",
@@ -1484,8 +1731,10 @@ const CONST_RAW = [
     "turn_out": 97204,
     "percent_invalid": 3.16654,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 35270,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 32699,
     "margin": 2571,
     "valid": 91934,
@@ -1494,6 +1743,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 63,
     "province_thai": "ชลบุรี",
     "province_eng": "CHON BURI",
     "prov_id": "CBI",
@@ -1502,8 +1752,10 @@ const CONST_RAW = [
     "turn_out": 76391,
     "percent_invalid": 2.66524,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 30459,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 19327,
     "margin": 11132,
     "valid": 72840,
@@ -1512,6 +1764,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 284,
     "province_thai": "ระยอง",
     "province_eng": "RAYONG",
     "prov_id": "RYG",
@@ -1520,8 +1773,10 @@ const CONST_RAW = [
     "turn_out": 92475,
     "percent_invalid": 2.04163,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 37820,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 17829,
     "margin": 19991,
     "valid": 88281,
@@ -1530,6 +1785,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 285,
     "province_thai": "ระยอง",
     "province_eng": "RAYONG",
     "prov_id": "RYG",
@@ -1538,8 +1794,10 @@ const CONST_RAW = [
     "turn_out": 84238,
     "percent_invalid": 2.92267,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 38813,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 23298,
     "margin": 15515,
     "valid": 79281,
@@ -1548,6 +1806,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 286,
     "province_thai": "ระยอง",
     "province_eng": "RAYONG",
     "prov_id": "RYG",
@@ -1556,8 +1815,10 @@ const CONST_RAW = [
     "turn_out": 95520,
     "percent_invalid": 3.92902,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 29034,
     "runnerup_party": "พลังประชารัฐ",
+    "runnerup_pid": 38,
     "runnerup_votes": 21726,
     "margin": 7308,
     "valid": 89470,
@@ -1566,6 +1827,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 287,
     "province_thai": "ระยอง",
     "province_eng": "RAYONG",
     "prov_id": "RYG",
@@ -1574,8 +1836,10 @@ const CONST_RAW = [
     "turn_out": 91834,
     "percent_invalid": 3.49108,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 38707,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 27055,
     "margin": 11652,
     "valid": 86278,
@@ -1584,6 +1848,7 @@ const CONST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 288,
     "province_thai": "ระยอง",
     "province_eng": "RAYONG",
     "prov_id": "RYG",
@@ -1592,8 +1857,10 @@ const CONST_RAW = [
     "turn_out": 90537,
     "percent_invalid": 2.77014,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 34713,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 19082,
     "margin": 15631,
     "valid": 86090,
@@ -1602,6 +1869,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 98,
     "province_thai": "จันทบุรี",
     "province_eng": "CHANTHABURI",
     "prov_id": "CTI",
@@ -1610,8 +1878,10 @@ const CONST_RAW = [
     "turn_out": 114253,
     "percent_invalid": 2.86119,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 37600,
     "runnerup_party": "พลังประชารัฐ",
+    "runnerup_pid": 38,
     "runnerup_votes": 26055,
     "margin": 11545,
     "valid": 107873,
@@ -1620,6 +1890,7 @@ const CONST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 99,
     "province_thai": "จันทบุรี",
     "province_eng": "CHANTHABURI",
     "prov_id": "CTI",
@@ -1628,8 +1899,10 @@ const CONST_RAW = [
     "turn_out": 107992,
     "percent_invalid": 5.09019,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 34894,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 31610,
     "margin": 3284,
     "valid": 99264,
@@ -1638,6 +1911,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 100,
     "province_thai": "จันทบุรี",
     "province_eng": "CHANTHABURI",
     "prov_id": "CTI",
@@ -1646,8 +1920,10 @@ const CONST_RAW = [
     "turn_out": 106198,
     "percent_invalid": 4.72419,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 35428,
     "runnerup_party": "พลังประชารัฐ",
+    "runnerup_pid": 38,
     "runnerup_votes": 20519,
     "margin": 14909,
     "valid": 98622,
@@ -1656,6 +1932,7 @@ const CONST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 367,
     "province_thai": "ตราด",
     "province_eng": "TRAT",
     "prov_id": "TRT",
@@ -1664,8 +1941,10 @@ const CONST_RAW = [
     "turn_out": 129680,
     "percent_invalid": 4.60518,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 47046,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 24966,
     "margin": 22080,
     "valid": 121082,
@@ -1674,6 +1953,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 65,
     "province_thai": "ฉะเชิงเทรา",
     "province_eng": "CHACHOENGSAO",
     "prov_id": "CCO",
@@ -1682,8 +1962,10 @@ const CONST_RAW = [
     "turn_out": 122124,
     "percent_invalid": 2.52858,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 35488,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 33000,
     "margin": 2488,
     "valid": 116536,
@@ -1692,6 +1974,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 66,
     "province_thai": "ฉะเชิงเทรา",
     "province_eng": "CHACHOENGSAO",
     "prov_id": "CCO",
@@ -1700,8 +1983,10 @@ const CONST_RAW = [
     "turn_out": 119212,
     "percent_invalid": 3.89558,
     "winner_party": "พลังประชารัฐ",
+    "winner_pid": 38,
     "winner_votes": 42777,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 40785,
     "margin": 1992,
     "valid": 112133,
@@ -1710,6 +1995,7 @@ const CONST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 67,
     "province_thai": "ฉะเชิงเทรา",
     "province_eng": "CHACHOENGSAO",
     "prov_id": "CCO",
@@ -1718,8 +2004,10 @@ const CONST_RAW = [
     "turn_out": 113283,
     "percent_invalid": 5.35738,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 45874,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 34886,
     "margin": 10988,
     "valid": 105623,
@@ -1728,6 +2016,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 68,
     "province_thai": "ฉะเชิงเทรา",
     "province_eng": "CHACHOENGSAO",
     "prov_id": "CCO",
@@ -1736,8 +2025,10 @@ const CONST_RAW = [
     "turn_out": 122385,
     "percent_invalid": 3.40401,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 37381,
     "runnerup_party": "พลังประชารัฐ",
+    "runnerup_pid": 38,
     "runnerup_votes": 26873,
     "margin": 10508,
     "valid": 116346,
@@ -1746,6 +2037,7 @@ const CONST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 252,
     "province_thai": "ปราจีนบุรี",
     "province_eng": "PRACHIN BURI",
     "prov_id": "PRI",
@@ -1754,8 +2046,10 @@ const CONST_RAW = [
     "turn_out": 102871,
     "percent_invalid": 3.93114,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 35641,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 31197,
     "margin": 4444,
     "valid": 95465,
@@ -1764,6 +2058,7 @@ const CONST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 254,
     "province_thai": "ปราจีนบุรี",
     "province_eng": "PRACHIN BURI",
     "prov_id": "PRI",
@@ -1772,8 +2067,10 @@ const CONST_RAW = [
     "turn_out": 101602,
     "percent_invalid": 4.66231,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 30833,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 27327,
     "margin": 3506,
     "valid": 94966,
@@ -1782,6 +2079,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 219,
     "province_thai": "นครนายก",
     "province_eng": "NAKHON NAYOK",
     "prov_id": "NYK",
@@ -1790,8 +2088,10 @@ const CONST_RAW = [
     "turn_out": 84635,
     "percent_invalid": 3.53045,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 32030,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 25191,
     "margin": 6839,
     "valid": 79784,
@@ -1800,6 +2100,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 220,
     "province_thai": "นครนายก",
     "province_eng": "NAKHON NAYOK",
     "prov_id": "NYK",
@@ -1808,8 +2109,10 @@ const CONST_RAW = [
     "turn_out": 88973,
     "percent_invalid": 3.6438,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 39496,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 24479,
     "margin": 15017,
     "valid": 84123,
@@ -1818,6 +2121,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 303,
     "province_thai": "สระแก้ว",
     "province_eng": "SA KAEO",
     "prov_id": "SKW",
@@ -1826,8 +2130,10 @@ const CONST_RAW = [
     "turn_out": 107882,
     "percent_invalid": 4.66806,
     "winner_party": "พลังประชารัฐ",
+    "winner_pid": 38,
     "winner_votes": 42183,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 23918,
     "margin": 18265,
     "valid": 101222,
@@ -1836,6 +2142,7 @@ const CONST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 304,
     "province_thai": "สระแก้ว",
     "province_eng": "SA KAEO",
     "prov_id": "SKW",
@@ -1844,8 +2151,10 @@ const CONST_RAW = [
     "turn_out": 103004,
     "percent_invalid": 3.73189,
     "winner_party": "พลังประชารัฐ",
+    "winner_pid": 38,
     "winner_votes": 47173,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 27533,
     "margin": 19640,
     "valid": 97570,
@@ -1854,6 +2163,7 @@ const CONST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 305,
     "province_thai": "สระแก้ว",
     "province_eng": "SA KAEO",
     "prov_id": "SKW",
@@ -1862,8 +2172,10 @@ const CONST_RAW = [
     "turn_out": 110159,
     "percent_invalid": 4.528,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 54116,
     "runnerup_party": "พลังประชารัฐ",
+    "runnerup_pid": 38,
     "runnerup_votes": 24116,
     "margin": 30000,
     "valid": 103426,
@@ -1872,6 +2184,7 @@ const CONST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 172,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -1880,8 +2193,10 @@ const CONST_RAW = [
     "turn_out": 100575,
     "percent_invalid": 2.71439,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 37043,
     "runnerup_party": "ชาติพัฒนากล้า",
+    "runnerup_pid": 4,
     "runnerup_votes": 29142,
     "margin": 7901,
     "valid": 94025,
@@ -1890,6 +2205,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 181,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -1898,8 +2214,10 @@ const CONST_RAW = [
     "turn_out": 114700,
     "percent_invalid": 3.74368,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 51206,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 37466,
     "margin": 13740,
     "valid": 108903,
@@ -1908,6 +2226,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 182,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -1916,8 +2235,10 @@ const CONST_RAW = [
     "turn_out": 102477,
     "percent_invalid": 4.38147,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 60326,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 20982,
     "margin": 39344,
     "valid": 97011,
@@ -1926,6 +2247,7 @@ const CONST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 183,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -1934,8 +2256,10 @@ const CONST_RAW = [
     "turn_out": 104448,
     "percent_invalid": 4.03933,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 44072,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 30824,
     "margin": 13248,
     "valid": 98989,
@@ -1944,6 +2268,7 @@ const CONST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 184,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -1952,8 +2277,10 @@ const CONST_RAW = [
     "turn_out": 94218,
     "percent_invalid": 4.97357,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 47000,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 17398,
     "margin": 29602,
     "valid": 87887,
@@ -1962,6 +2289,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 185,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -1970,8 +2298,10 @@ const CONST_RAW = [
     "turn_out": 96450,
     "percent_invalid": 4.02385,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 32596,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 23829,
     "margin": 8767,
     "valid": 90645,
@@ -1980,6 +2310,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 186,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -1988,8 +2319,10 @@ const CONST_RAW = [
     "turn_out": 106452,
     "percent_invalid": 4.0638,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 44121,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 27915,
     "margin": 16206,
     "valid": 101264,
@@ -1998,6 +2331,7 @@ const CONST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 187,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -2006,8 +2340,10 @@ const CONST_RAW = [
     "turn_out": 97724,
     "percent_invalid": 3.85371,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 37412,
     "runnerup_party": "พลังประชารัฐ",
+    "runnerup_pid": 38,
     "runnerup_votes": 24895,
     "margin": 12517,
     "valid": 93136,
@@ -2016,6 +2352,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 173,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -2024,8 +2361,10 @@ const CONST_RAW = [
     "turn_out": 107146,
     "percent_invalid": 3.5447,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 42401,
     "runnerup_party": "ชาติพัฒนากล้า",
+    "runnerup_pid": 4,
     "runnerup_votes": 30062,
     "margin": 12339,
     "valid": 99896,
@@ -2034,6 +2373,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 174,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -2042,8 +2382,10 @@ const CONST_RAW = [
     "turn_out": 105476,
     "percent_invalid": 2.99025,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 38982,
     "runnerup_party": "ชาติพัฒนากล้า",
+    "runnerup_pid": 4,
     "runnerup_votes": 31768,
     "margin": 7214,
     "valid": 98837,
@@ -2052,6 +2394,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 175,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -2060,8 +2403,10 @@ const CONST_RAW = [
     "turn_out": 103657,
     "percent_invalid": 5.59731,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 37150,
     "runnerup_party": "ชาติพัฒนากล้า",
+    "runnerup_pid": 4,
     "runnerup_votes": 31216,
     "margin": 5934,
     "valid": 96267,
@@ -2070,6 +2415,7 @@ const CONST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 176,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -2078,8 +2424,10 @@ const CONST_RAW = [
     "turn_out": 102125,
     "percent_invalid": 4.70502,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 46479,
     "runnerup_party": "พลังประชารัฐ",
+    "runnerup_pid": 38,
     "runnerup_votes": 29118,
     "margin": 17361,
     "valid": 95662,
@@ -2088,6 +2436,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 177,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -2096,8 +2445,10 @@ const CONST_RAW = [
     "turn_out": 92005,
     "percent_invalid": 4.07587,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 32136,
     "runnerup_party": "พลังประชารัฐ",
+    "runnerup_pid": 38,
     "runnerup_votes": 19172,
     "margin": 12964,
     "valid": 86830,
@@ -2106,6 +2457,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 178,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -2114,8 +2466,10 @@ const CONST_RAW = [
     "turn_out": 91376,
     "percent_invalid": 3.73402,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 51348,
     "runnerup_party": "พลังประชารัฐ",
+    "runnerup_pid": 38,
     "runnerup_votes": 22130,
     "margin": 29218,
     "valid": 87029,
@@ -2124,6 +2478,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 179,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -2132,8 +2487,10 @@ const CONST_RAW = [
     "turn_out": 98058,
     "percent_invalid": 4.38516,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 51320,
     "runnerup_party": "พลังประชารัฐ",
+    "runnerup_pid": 38,
     "runnerup_votes": 23578,
     "margin": 27742,
     "valid": 92391,
@@ -2142,6 +2499,7 @@ const CONST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 180,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -2150,8 +2508,10 @@ const CONST_RAW = [
     "turn_out": 100191,
     "percent_invalid": 4.30378,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 38241,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 24527,
     "margin": 13714,
     "valid": 94994,
@@ -2160,6 +2520,7 @@ const CONST_RAW = [
     "ballot_surplus": -3
   },
   {
+    "cid": 45,
     "province_thai": "บุรีรัมย์",
     "province_eng": "BURI RAM",
     "prov_id": "BRM",
@@ -2168,8 +2529,10 @@ const CONST_RAW = [
     "turn_out": 90518,
     "percent_invalid": 5.21443,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 36739,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 28305,
     "margin": 8434,
     "valid": 83708,
@@ -2178,6 +2541,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 54,
     "province_thai": "บุรีรัมย์",
     "province_eng": "BURI RAM",
     "prov_id": "BRM",
@@ -2186,8 +2550,10 @@ const CONST_RAW = [
     "turn_out": 82599,
     "percent_invalid": 5.32694,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 39006,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 16230,
     "margin": 22776,
     "valid": 76999,
@@ -2196,6 +2562,7 @@ const CONST_RAW = [
     "ballot_surplus": 2
   },
   {
+    "cid": 46,
     "province_thai": "บุรีรัมย์",
     "province_eng": "BURI RAM",
     "prov_id": "BRM",
@@ -2204,8 +2571,10 @@ const CONST_RAW = [
     "turn_out": 88374,
     "percent_invalid": 5.06936,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 46729,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 16740,
     "margin": 29989,
     "valid": 82284,
@@ -2214,6 +2583,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 47,
     "province_thai": "บุรีรัมย์",
     "province_eng": "BURI RAM",
     "prov_id": "BRM",
@@ -2222,8 +2592,10 @@ const CONST_RAW = [
     "turn_out": 83920,
     "percent_invalid": 5.69352,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 38468,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 20017,
     "margin": 18451,
     "valid": 78061,
@@ -2232,6 +2604,7 @@ const CONST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 48,
     "province_thai": "บุรีรัมย์",
     "province_eng": "BURI RAM",
     "prov_id": "BRM",
@@ -2240,8 +2613,10 @@ const CONST_RAW = [
     "turn_out": 82154,
     "percent_invalid": 5.18782,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 37706,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 24054,
     "margin": 13652,
     "valid": 77059,
@@ -2250,6 +2625,7 @@ const CONST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 49,
     "province_thai": "บุรีรัมย์",
     "province_eng": "BURI RAM",
     "prov_id": "BRM",
@@ -2258,8 +2634,10 @@ const CONST_RAW = [
     "turn_out": 89915,
     "percent_invalid": 4.62437,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 47746,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 17144,
     "margin": 30602,
     "valid": 84322,
@@ -2268,6 +2646,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 50,
     "province_thai": "บุรีรัมย์",
     "province_eng": "BURI RAM",
     "prov_id": "BRM",
@@ -2276,8 +2655,10 @@ const CONST_RAW = [
     "turn_out": 87125,
     "percent_invalid": 4.39024,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 35362,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 20184,
     "margin": 15178,
     "valid": 81612,
@@ -2286,6 +2667,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 51,
     "province_thai": "บุรีรัมย์",
     "province_eng": "BURI RAM",
     "prov_id": "BRM",
@@ -2294,8 +2676,10 @@ const CONST_RAW = [
     "turn_out": 86865,
     "percent_invalid": 4.50814,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 28685,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 28470,
     "margin": 215,
     "valid": 81882,
@@ -2304,6 +2688,7 @@ const CONST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 52,
     "province_thai": "บุรีรัมย์",
     "province_eng": "BURI RAM",
     "prov_id": "BRM",
@@ -2312,8 +2697,10 @@ const CONST_RAW = [
     "turn_out": 92560,
     "percent_invalid": 4.9503,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 34429,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 23148,
     "margin": 11281,
     "valid": 86139,
@@ -2322,6 +2709,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 53,
     "province_thai": "บุรีรัมย์",
     "province_eng": "BURI RAM",
     "prov_id": "BRM",
@@ -2330,8 +2718,10 @@ const CONST_RAW = [
     "turn_out": 88326,
     "percent_invalid": 4.87512,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 45059,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 24682,
     "margin": 20377,
     "valid": 83019,
@@ -2340,6 +2730,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 337,
     "province_thai": "สุรินทร์",
     "province_eng": "SURIN",
     "prov_id": "SRN",
@@ -2348,8 +2739,10 @@ const CONST_RAW = [
     "turn_out": 100333,
     "percent_invalid": 3.43556,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 36305,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 26047,
     "margin": 10258,
     "valid": 94612,
@@ -2358,6 +2751,7 @@ const CONST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 338,
     "province_thai": "สุรินทร์",
     "province_eng": "SURIN",
     "prov_id": "SRN",
@@ -2366,8 +2760,10 @@ const CONST_RAW = [
     "turn_out": 101279,
     "percent_invalid": 3.82705,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 39570,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 35525,
     "margin": 4045,
     "valid": 95922,
@@ -2376,6 +2772,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 339,
     "province_thai": "สุรินทร์",
     "province_eng": "SURIN",
     "prov_id": "SRN",
@@ -2384,8 +2781,10 @@ const CONST_RAW = [
     "turn_out": 94821,
     "percent_invalid": 4.36929,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 44534,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 24342,
     "margin": 20192,
     "valid": 89833,
@@ -2394,6 +2793,7 @@ const CONST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 340,
     "province_thai": "สุรินทร์",
     "province_eng": "SURIN",
     "prov_id": "SRN",
@@ -2402,8 +2802,10 @@ const CONST_RAW = [
     "turn_out": 93230,
     "percent_invalid": 3.77454,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 35198,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 23403,
     "margin": 11795,
     "valid": 88110,
@@ -2412,6 +2814,7 @@ const CONST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 341,
     "province_thai": "สุรินทร์",
     "province_eng": "SURIN",
     "prov_id": "SRN",
@@ -2420,8 +2823,10 @@ const CONST_RAW = [
     "turn_out": 88718,
     "percent_invalid": 3.83913,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 36021,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 18572,
     "margin": 17449,
     "valid": 84087,
@@ -2430,6 +2835,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 342,
     "province_thai": "สุรินทร์",
     "province_eng": "SURIN",
     "prov_id": "SRN",
@@ -2438,8 +2844,10 @@ const CONST_RAW = [
     "turn_out": 89196,
     "percent_invalid": 5.35114,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 38611,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 28280,
     "margin": 10331,
     "valid": 83578,
@@ -2448,6 +2856,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 343,
     "province_thai": "สุรินทร์",
     "province_eng": "SURIN",
     "prov_id": "SRN",
@@ -2456,8 +2865,10 @@ const CONST_RAW = [
     "turn_out": 96743,
     "percent_invalid": 3.89796,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 42050,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 22894,
     "margin": 19156,
     "valid": 91499,
@@ -2466,6 +2877,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 344,
     "province_thai": "สุรินทร์",
     "province_eng": "SURIN",
     "prov_id": "SRN",
@@ -2474,8 +2886,10 @@ const CONST_RAW = [
     "turn_out": 91228,
     "percent_invalid": 5.94554,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 39558,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 23489,
     "margin": 16069,
     "valid": 84720,
@@ -2484,6 +2898,7 @@ const CONST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 345,
     "province_thai": "ศรีสะเกษ",
     "province_eng": "SI SA KET",
     "prov_id": "SSK",
@@ -2492,8 +2907,10 @@ const CONST_RAW = [
     "turn_out": 100569,
     "percent_invalid": 3.55577,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 42445,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 35940,
     "margin": 6505,
     "valid": 95568,
@@ -2502,6 +2919,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 346,
     "province_thai": "ศรีสะเกษ",
     "province_eng": "SI SA KET",
     "prov_id": "SSK",
@@ -2510,8 +2928,10 @@ const CONST_RAW = [
     "turn_out": 87917,
     "percent_invalid": 4.60093,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 42475,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 24821,
     "margin": 17654,
     "valid": 82157,
@@ -2520,6 +2940,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 347,
     "province_thai": "ศรีสะเกษ",
     "province_eng": "SI SA KET",
     "prov_id": "SSK",
@@ -2528,8 +2949,10 @@ const CONST_RAW = [
     "turn_out": 89855,
     "percent_invalid": 5.09265,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 37934,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 32162,
     "margin": 5772,
     "valid": 84363,
@@ -2538,6 +2961,7 @@ const CONST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 348,
     "province_thai": "ศรีสะเกษ",
     "province_eng": "SI SA KET",
     "prov_id": "SSK",
@@ -2546,8 +2970,10 @@ const CONST_RAW = [
     "turn_out": 86615,
     "percent_invalid": 5.16654,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 38410,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 28731,
     "margin": 9679,
     "valid": 81190,
@@ -2556,6 +2982,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 349,
     "province_thai": "ศรีสะเกษ",
     "province_eng": "SI SA KET",
     "prov_id": "SSK",
@@ -2564,8 +2991,10 @@ const CONST_RAW = [
     "turn_out": 87829,
     "percent_invalid": 6.08341,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 32884,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 25837,
     "margin": 7047,
     "valid": 81433,
@@ -2574,6 +3003,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 350,
     "province_thai": "ศรีสะเกษ",
     "province_eng": "SI SA KET",
     "prov_id": "SSK",
@@ -2582,8 +3012,10 @@ const CONST_RAW = [
     "turn_out": 89674,
     "percent_invalid": 6.01401,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 35379,
     "runnerup_party": "พลังประชารัฐ",
+    "runnerup_pid": 38,
     "runnerup_votes": 23573,
     "margin": 11806,
     "valid": 83105,
@@ -2592,6 +3024,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 351,
     "province_thai": "ศรีสะเกษ",
     "province_eng": "SI SA KET",
     "prov_id": "SSK",
@@ -2600,8 +3033,10 @@ const CONST_RAW = [
     "turn_out": 87119,
     "percent_invalid": 5.69221,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 52952,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 17953,
     "margin": 34999,
     "valid": 80860,
@@ -2610,6 +3045,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 352,
     "province_thai": "ศรีสะเกษ",
     "province_eng": "SI SA KET",
     "prov_id": "SSK",
@@ -2618,8 +3054,10 @@ const CONST_RAW = [
     "turn_out": 97459,
     "percent_invalid": 3.94627,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 42882,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 34811,
     "margin": 8071,
     "valid": 92860,
@@ -2628,6 +3066,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 353,
     "province_thai": "ศรีสะเกษ",
     "province_eng": "SI SA KET",
     "prov_id": "SSK",
@@ -2636,8 +3075,10 @@ const CONST_RAW = [
     "turn_out": 98658,
     "percent_invalid": 4.69703,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 38051,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 30637,
     "margin": 7414,
     "valid": 92818,
@@ -2646,6 +3087,7 @@ const CONST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 368,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -2654,8 +3096,10 @@ const CONST_RAW = [
     "turn_out": 104255,
     "percent_invalid": 2.05554,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 32468,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 31112,
     "margin": 1356,
     "valid": 99023,
@@ -2664,6 +3108,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 377,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -2672,8 +3117,10 @@ const CONST_RAW = [
     "turn_out": 101369,
     "percent_invalid": 3.13804,
     "winner_party": "เพื่อไทรวมพลัง",
+    "winner_pid": 58,
     "winner_votes": 63127,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 19351,
     "margin": 43776,
     "valid": 97428,
@@ -2682,6 +3129,7 @@ const CONST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 378,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -2690,8 +3138,10 @@ const CONST_RAW = [
     "turn_out": 93548,
     "percent_invalid": 2.98243,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 43797,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 24288,
     "margin": 19509,
     "valid": 89953,
@@ -2700,6 +3150,7 @@ const CONST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 369,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -2708,8 +3159,10 @@ const CONST_RAW = [
     "turn_out": 99861,
     "percent_invalid": 5.02098,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 38164,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 31953,
     "margin": 6211,
     "valid": 92346,
@@ -2718,6 +3171,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 370,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -2726,8 +3180,10 @@ const CONST_RAW = [
     "turn_out": 103707,
     "percent_invalid": 3.13286,
     "winner_party": "เพื่อไทรวมพลัง",
+    "winner_pid": 58,
     "winner_votes": 31218,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 22020,
     "margin": 9198,
     "valid": 99574,
@@ -2736,6 +3192,7 @@ const CONST_RAW = [
     "ballot_surplus": 2
   },
   {
+    "cid": 371,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -2744,8 +3201,10 @@ const CONST_RAW = [
     "turn_out": 109437,
     "percent_invalid": 4.74794,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 39462,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 31052,
     "margin": 8410,
     "valid": 100575,
@@ -2754,6 +3213,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 372,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -2762,8 +3222,10 @@ const CONST_RAW = [
     "turn_out": 93368,
     "percent_invalid": 3.07707,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 44121,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 30596,
     "margin": 13525,
     "valid": 89798,
@@ -2772,6 +3234,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 373,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -2780,8 +3243,10 @@ const CONST_RAW = [
     "turn_out": 88724,
     "percent_invalid": 3.60444,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 43430,
     "runnerup_party": "ไทยสร้างไทย",
+    "runnerup_pid": 49,
     "runnerup_votes": 22759,
     "margin": 20671,
     "valid": 84825,
@@ -2790,6 +3255,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 374,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -2798,8 +3264,10 @@ const CONST_RAW = [
     "turn_out": 91944,
     "percent_invalid": 3.01814,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 38533,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 33499,
     "margin": 5034,
     "valid": 88473,
@@ -2808,6 +3276,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 375,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -2816,8 +3285,10 @@ const CONST_RAW = [
     "turn_out": 96803,
     "percent_invalid": 3.48543,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 31773,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 27893,
     "margin": 3880,
     "valid": 92056,
@@ -2826,6 +3297,7 @@ const CONST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 376,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -2834,8 +3306,10 @@ const CONST_RAW = [
     "turn_out": 86559,
     "percent_invalid": 4.33115,
     "winner_party": "ไทยสร้างไทย",
+    "winner_pid": 49,
     "winner_votes": 31311,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 30851,
     "margin": 460,
     "valid": 81849,
@@ -2844,6 +3318,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 397,
     "province_thai": "ยโสธร",
     "province_eng": "YASOTHON",
     "prov_id": "YST",
@@ -2852,8 +3327,10 @@ const CONST_RAW = [
     "turn_out": 110491,
     "percent_invalid": 2.58573,
     "winner_party": "ไทยสร้างไทย",
+    "winner_pid": 49,
     "winner_votes": 53130,
     "runnerup_party": "ชาติไทยพัฒนา",
+    "runnerup_pid": 5,
     "runnerup_votes": 25214,
     "margin": 27916,
     "valid": 106293,
@@ -2862,6 +3339,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 398,
     "province_thai": "ยโสธร",
     "province_eng": "YASOTHON",
     "prov_id": "YST",
@@ -2870,8 +3348,10 @@ const CONST_RAW = [
     "turn_out": 98432,
     "percent_invalid": 3.21135,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 44851,
     "runnerup_party": "ไทยสร้างไทย",
+    "runnerup_pid": 49,
     "runnerup_votes": 34581,
     "margin": 10270,
     "valid": 94418,
@@ -2880,6 +3360,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 399,
     "province_thai": "ยโสธร",
     "province_eng": "YASOTHON",
     "prov_id": "YST",
@@ -2888,8 +3369,10 @@ const CONST_RAW = [
     "turn_out": 104532,
     "percent_invalid": 3.16841,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 38074,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 25205,
     "margin": 12869,
     "valid": 100298,
@@ -2898,6 +3381,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 81,
     "province_thai": "ชัยภูมิ",
     "province_eng": "CHAIYAPHUM",
     "prov_id": "CPM",
@@ -2906,8 +3390,10 @@ const CONST_RAW = [
     "turn_out": 96638,
     "percent_invalid": 3.78733,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 26130,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 24247,
     "margin": 1883,
     "valid": 91107,
@@ -2916,6 +3402,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 82,
     "province_thai": "ชัยภูมิ",
     "province_eng": "CHAIYAPHUM",
     "prov_id": "CPM",
@@ -2924,8 +3411,10 @@ const CONST_RAW = [
     "turn_out": 96809,
     "percent_invalid": 4.58119,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 61414,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 17823,
     "margin": 43591,
     "valid": 91083,
@@ -2934,6 +3423,7 @@ const CONST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 83,
     "province_thai": "ชัยภูมิ",
     "province_eng": "CHAIYAPHUM",
     "prov_id": "CPM",
@@ -2942,8 +3432,10 @@ const CONST_RAW = [
     "turn_out": 89484,
     "percent_invalid": 4.93608,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 35846,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 19142,
     "margin": 16704,
     "valid": 84249,
@@ -2952,6 +3444,7 @@ const CONST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 84,
     "province_thai": "ชัยภูมิ",
     "province_eng": "CHAIYAPHUM",
     "prov_id": "CPM",
@@ -2960,8 +3453,10 @@ const CONST_RAW = [
     "turn_out": 81576,
     "percent_invalid": 5.16328,
     "winner_party": "พลังประชารัฐ",
+    "winner_pid": 38,
     "winner_votes": 21432,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 18846,
     "margin": 2586,
     "valid": 76596,
@@ -2970,6 +3465,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 85,
     "province_thai": "ชัยภูมิ",
     "province_eng": "CHAIYAPHUM",
     "prov_id": "CPM",
@@ -2978,8 +3474,10 @@ const CONST_RAW = [
     "turn_out": 93540,
     "percent_invalid": 5.38272,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 35000,
     "runnerup_party": "พลังประชารัฐ",
+    "runnerup_pid": 38,
     "runnerup_votes": 31178,
     "margin": 3822,
     "valid": 87470,
@@ -2988,6 +3486,7 @@ const CONST_RAW = [
     "ballot_surplus": 2
   },
   {
+    "cid": 86,
     "province_thai": "ชัยภูมิ",
     "province_eng": "CHAIYAPHUM",
     "prov_id": "CPM",
@@ -2996,8 +3495,10 @@ const CONST_RAW = [
     "turn_out": 97337,
     "percent_invalid": 4.39915,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 38452,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 22816,
     "margin": 15636,
     "valid": 92261,
@@ -3006,6 +3507,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 87,
     "province_thai": "ชัยภูมิ",
     "province_eng": "CHAIYAPHUM",
     "prov_id": "CPM",
@@ -3014,8 +3516,10 @@ const CONST_RAW = [
     "turn_out": 89778,
     "percent_invalid": 3.82499,
     "winner_party": "พลังประชารัฐ",
+    "winner_pid": 38,
     "winner_votes": 38498,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 22980,
     "margin": 15518,
     "valid": 85479,
@@ -3024,6 +3528,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 0,
     "province_thai": "อำนาจเจริญ",
     "province_eng": "AMNAT CHAROEN",
     "prov_id": "ACR",
@@ -3032,8 +3537,10 @@ const CONST_RAW = [
     "turn_out": 105574,
     "percent_invalid": 3.18165,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 38275,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 21388,
     "margin": 16887,
     "valid": 100946,
@@ -3042,6 +3549,7 @@ const CONST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 1,
     "province_thai": "อำนาจเจริญ",
     "province_eng": "AMNAT CHAROEN",
     "prov_id": "ACR",
@@ -3050,8 +3558,10 @@ const CONST_RAW = [
     "turn_out": 111813,
     "percent_invalid": 3.42,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 46881,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 19188,
     "margin": 27693,
     "valid": 106888,
@@ -3060,6 +3570,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 42,
     "province_thai": "บึงกาฬ",
     "province_eng": "BUENG KAN",
     "prov_id": "BKN",
@@ -3068,8 +3579,10 @@ const CONST_RAW = [
     "turn_out": 75682,
     "percent_invalid": 3.41164,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 25295,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 25007,
     "margin": 288,
     "valid": 72241,
@@ -3078,6 +3591,7 @@ const CONST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 43,
     "province_thai": "บึงกาฬ",
     "province_eng": "BUENG KAN",
     "prov_id": "BKN",
@@ -3086,8 +3600,10 @@ const CONST_RAW = [
     "turn_out": 76441,
     "percent_invalid": 3.34899,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 26541,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 18713,
     "margin": 7828,
     "valid": 73052,
@@ -3096,6 +3612,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 44,
     "province_thai": "บึงกาฬ",
     "province_eng": "BUENG KAN",
     "prov_id": "BKN",
@@ -3104,8 +3621,10 @@ const CONST_RAW = [
     "turn_out": 79628,
     "percent_invalid": 4.0639,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 30277,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 21524,
     "margin": 8753,
     "valid": 75394,
@@ -3114,6 +3633,7 @@ const CONST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 166,
     "province_thai": "หนองบัวลำภู",
     "province_eng": "NONG BUA LAM PHU",
     "prov_id": "NBP",
@@ -3122,8 +3642,10 @@ const CONST_RAW = [
     "turn_out": 95960,
     "percent_invalid": 4.40288,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 26309,
     "runnerup_party": "พลังประชารัฐ",
+    "runnerup_pid": 38,
     "runnerup_votes": 25377,
     "margin": 932,
     "valid": 90284,
@@ -3132,6 +3654,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 167,
     "province_thai": "หนองบัวลำภู",
     "province_eng": "NONG BUA LAM PHU",
     "prov_id": "NBP",
@@ -3140,8 +3663,10 @@ const CONST_RAW = [
     "turn_out": 88961,
     "percent_invalid": 3.12272,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 32247,
     "runnerup_party": "ไทยสร้างไทย",
+    "runnerup_pid": 49,
     "runnerup_votes": 21661,
     "margin": 10586,
     "valid": 85316,
@@ -3150,6 +3675,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 168,
     "province_thai": "หนองบัวลำภู",
     "province_eng": "NONG BUA LAM PHU",
     "prov_id": "NBP",
@@ -3158,8 +3684,10 @@ const CONST_RAW = [
     "turn_out": 87226,
     "percent_invalid": 3.80277,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 32375,
     "runnerup_party": "ไทยสร้างไทย",
+    "runnerup_pid": 49,
     "runnerup_votes": 20746,
     "margin": 11629,
     "valid": 83043,
@@ -3168,6 +3696,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 104,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -3176,8 +3705,10 @@ const CONST_RAW = [
     "turn_out": 96838,
     "percent_invalid": 1.91041,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 39046,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 26592,
     "margin": 12454,
     "valid": 91799,
@@ -3186,6 +3717,7 @@ const CONST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 113,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -3194,8 +3726,10 @@ const CONST_RAW = [
     "turn_out": 92271,
     "percent_invalid": 3.79643,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 44173,
     "runnerup_party": "พลังประชารัฐ",
+    "runnerup_pid": 38,
     "runnerup_votes": 24296,
     "margin": 19877,
     "valid": 87904,
@@ -3204,6 +3738,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 114,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -3212,8 +3747,10 @@ const CONST_RAW = [
     "turn_out": 94907,
     "percent_invalid": 3.42757,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 37529,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 32864,
     "margin": 4665,
     "valid": 90944,
@@ -3222,6 +3759,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 105,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -3230,8 +3768,10 @@ const CONST_RAW = [
     "turn_out": 106220,
     "percent_invalid": 2.37243,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 38984,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 28502,
     "margin": 10482,
     "valid": 100727,
@@ -3240,6 +3780,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 106,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -3248,8 +3789,10 @@ const CONST_RAW = [
     "turn_out": 96745,
     "percent_invalid": 2.79291,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 36731,
     "runnerup_party": "ชาติไทยพัฒนา",
+    "runnerup_pid": 5,
     "runnerup_votes": 30085,
     "margin": 6646,
     "valid": 93239,
@@ -3258,6 +3801,7 @@ const CONST_RAW = [
     "ballot_surplus": 2
   },
   {
+    "cid": 107,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -3266,8 +3810,10 @@ const CONST_RAW = [
     "turn_out": 98738,
     "percent_invalid": 2.60791,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 33104,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 26948,
     "margin": 6156,
     "valid": 94639,
@@ -3276,6 +3822,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 108,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -3284,8 +3831,10 @@ const CONST_RAW = [
     "turn_out": 87102,
     "percent_invalid": 3.29728,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 50429,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 19127,
     "margin": 31302,
     "valid": 83050,
@@ -3294,6 +3843,7 @@ const CONST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 109,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -3302,8 +3852,10 @@ const CONST_RAW = [
     "turn_out": 90922,
     "percent_invalid": 3.30173,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 29293,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 29219,
     "margin": 74,
     "valid": 86539,
@@ -3312,6 +3864,7 @@ const CONST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 110,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -3320,8 +3873,10 @@ const CONST_RAW = [
     "turn_out": 98097,
     "percent_invalid": 3.81867,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 37980,
     "runnerup_party": "พลังประชารัฐ",
+    "runnerup_pid": 38,
     "runnerup_votes": 22490,
     "margin": 15490,
     "valid": 93393,
@@ -3330,6 +3885,7 @@ const CONST_RAW = [
     "ballot_surplus": 2
   },
   {
+    "cid": 111,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -3338,8 +3894,10 @@ const CONST_RAW = [
     "turn_out": 102147,
     "percent_invalid": 3.82684,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 43191,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 19879,
     "margin": 23312,
     "valid": 96553,
@@ -3348,6 +3906,7 @@ const CONST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 112,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -3356,8 +3915,10 @@ const CONST_RAW = [
     "turn_out": 87404,
     "percent_invalid": 3.89227,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 46057,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 15141,
     "margin": 30916,
     "valid": 83036,
@@ -3366,6 +3927,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 379,
     "province_thai": "อุดรธานี",
     "province_eng": "UDON THANI",
     "prov_id": "UDN",
@@ -3374,8 +3936,10 @@ const CONST_RAW = [
     "turn_out": 90592,
     "percent_invalid": 2.19445,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 32476,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 27176,
     "margin": 5300,
     "valid": 85692,
@@ -3384,6 +3948,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 388,
     "province_thai": "อุดรธานี",
     "province_eng": "UDON THANI",
     "prov_id": "UDN",
@@ -3392,8 +3957,10 @@ const CONST_RAW = [
     "turn_out": 83474,
     "percent_invalid": 4.2049,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 47763,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 20793,
     "margin": 26970,
     "valid": 78604,
@@ -3402,6 +3969,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 380,
     "province_thai": "อุดรธานี",
     "province_eng": "UDON THANI",
     "prov_id": "UDN",
@@ -3410,8 +3978,10 @@ const CONST_RAW = [
     "turn_out": 90418,
     "percent_invalid": 2.84457,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 40220,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 26489,
     "margin": 13731,
     "valid": 85226,
@@ -3420,6 +3990,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 381,
     "province_thai": "อุดรธานี",
     "province_eng": "UDON THANI",
     "prov_id": "UDN",
@@ -3428,8 +3999,10 @@ const CONST_RAW = [
     "turn_out": 82968,
     "percent_invalid": 3.98467,
     "winner_party": "ไทยสร้างไทย",
+    "winner_pid": 49,
     "winner_votes": 36250,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 20248,
     "margin": 16002,
     "valid": 78714,
@@ -3438,6 +4011,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 382,
     "province_thai": "อุดรธานี",
     "province_eng": "UDON THANI",
     "prov_id": "UDN",
@@ -3446,8 +4020,10 @@ const CONST_RAW = [
     "turn_out": 80439,
     "percent_invalid": 3.00352,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 21475,
     "runnerup_party": "ไทยสร้างไทย",
+    "runnerup_pid": 49,
     "runnerup_votes": 19030,
     "margin": 2445,
     "valid": 77462,
@@ -3456,6 +4032,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 383,
     "province_thai": "อุดรธานี",
     "province_eng": "UDON THANI",
     "prov_id": "UDN",
@@ -3464,8 +4041,10 @@ const CONST_RAW = [
     "turn_out": 77781,
     "percent_invalid": 3.26172,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 37890,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 22559,
     "margin": 15331,
     "valid": 74315,
@@ -3474,6 +4053,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 385,
     "province_thai": "อุดรธานี",
     "province_eng": "UDON THANI",
     "prov_id": "UDN",
@@ -3482,8 +4062,10 @@ const CONST_RAW = [
     "turn_out": 83997,
     "percent_invalid": 2.77391,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 33928,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 32943,
     "margin": 985,
     "valid": 80244,
@@ -3492,6 +4074,7 @@ const CONST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 386,
     "province_thai": "อุดรธานี",
     "province_eng": "UDON THANI",
     "prov_id": "UDN",
@@ -3500,8 +4083,10 @@ const CONST_RAW = [
     "turn_out": 82330,
     "percent_invalid": 3.32564,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 33537,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 24018,
     "margin": 9519,
     "valid": 78392,
@@ -3510,6 +4095,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 387,
     "province_thai": "อุดรธานี",
     "province_eng": "UDON THANI",
     "prov_id": "UDN",
@@ -3518,8 +4104,10 @@ const CONST_RAW = [
     "turn_out": 85776,
     "percent_invalid": 3.8414,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 43529,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 21666,
     "margin": 21863,
     "valid": 81226,
@@ -3528,6 +4116,7 @@ const CONST_RAW = [
     "ballot_surplus": 2
   },
   {
+    "cid": 130,
     "province_thai": "เลย",
     "province_eng": "LOEI",
     "prov_id": "LEI",
@@ -3536,8 +4125,10 @@ const CONST_RAW = [
     "turn_out": 96500,
     "percent_invalid": 3.91088,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 49831,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 24202,
     "margin": 25629,
     "valid": 89960,
@@ -3546,6 +4137,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 131,
     "province_thai": "เลย",
     "province_eng": "LOEI",
     "prov_id": "LEI",
@@ -3554,8 +4146,10 @@ const CONST_RAW = [
     "turn_out": 93344,
     "percent_invalid": 4.93765,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 50421,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 20444,
     "margin": 29977,
     "valid": 86945,
@@ -3564,6 +4158,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 132,
     "province_thai": "เลย",
     "province_eng": "LOEI",
     "prov_id": "LEI",
@@ -3572,8 +4167,10 @@ const CONST_RAW = [
     "turn_out": 98765,
     "percent_invalid": 3.99332,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 44272,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 19962,
     "margin": 24310,
     "valid": 93190,
@@ -3582,6 +4179,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 133,
     "province_thai": "เลย",
     "province_eng": "LOEI",
     "prov_id": "LEI",
@@ -3590,8 +4188,10 @@ const CONST_RAW = [
     "turn_out": 93584,
     "percent_invalid": 4.37895,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 45638,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 21686,
     "margin": 23952,
     "valid": 87711,
@@ -3600,6 +4200,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 169,
     "province_thai": "หนองคาย",
     "province_eng": "NONG KHAI",
     "prov_id": "NKI",
@@ -3608,8 +4209,10 @@ const CONST_RAW = [
     "turn_out": 97081,
     "percent_invalid": 3.70412,
     "winner_party": "พลังประชารัฐ",
+    "winner_pid": 38,
     "winner_votes": 33078,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 25783,
     "margin": 7295,
     "valid": 91626,
@@ -3618,6 +4221,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 170,
     "province_thai": "หนองคาย",
     "province_eng": "NONG KHAI",
     "prov_id": "NKI",
@@ -3626,8 +4230,10 @@ const CONST_RAW = [
     "turn_out": 87296,
     "percent_invalid": 4.83069,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 33527,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 26450,
     "margin": 7077,
     "valid": 82084,
@@ -3636,6 +4242,7 @@ const CONST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 171,
     "province_thai": "หนองคาย",
     "province_eng": "NONG KHAI",
     "prov_id": "NKI",
@@ -3644,8 +4251,10 @@ const CONST_RAW = [
     "turn_out": 92354,
     "percent_invalid": 3.80709,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 32539,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 24909,
     "margin": 7630,
     "valid": 87345,
@@ -3654,6 +4263,7 @@ const CONST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 147,
     "province_thai": "มหาสารคาม",
     "province_eng": "MAHA SARAKHAM",
     "prov_id": "MKM",
@@ -3662,8 +4272,10 @@ const CONST_RAW = [
     "turn_out": 95991,
     "percent_invalid": 2.0554,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 30859,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 26224,
     "margin": 4635,
     "valid": 91972,
@@ -3672,6 +4284,7 @@ const CONST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 148,
     "province_thai": "มหาสารคาม",
     "province_eng": "MAHA SARAKHAM",
     "prov_id": "MKM",
@@ -3680,8 +4293,10 @@ const CONST_RAW = [
     "turn_out": 90040,
     "percent_invalid": 3.65504,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 34062,
     "runnerup_party": "พลังประชารัฐ",
+    "runnerup_pid": 38,
     "runnerup_votes": 29338,
     "margin": 4724,
     "valid": 85707,
@@ -3690,6 +4305,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 149,
     "province_thai": "มหาสารคาม",
     "province_eng": "MAHA SARAKHAM",
     "prov_id": "MKM",
@@ -3698,8 +4314,10 @@ const CONST_RAW = [
     "turn_out": 92042,
     "percent_invalid": 3.56902,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 44122,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 33746,
     "margin": 10376,
     "valid": 88325,
@@ -3708,6 +4326,7 @@ const CONST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 150,
     "province_thai": "มหาสารคาม",
     "province_eng": "MAHA SARAKHAM",
     "prov_id": "MKM",
@@ -3716,8 +4335,10 @@ const CONST_RAW = [
     "turn_out": 88748,
     "percent_invalid": 2.48682,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 38744,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 31281,
     "margin": 7463,
     "valid": 85701,
@@ -3726,6 +4347,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 151,
     "province_thai": "มหาสารคาม",
     "province_eng": "MAHA SARAKHAM",
     "prov_id": "MKM",
@@ -3734,8 +4356,10 @@ const CONST_RAW = [
     "turn_out": 95987,
     "percent_invalid": 2.86497,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 45087,
     "runnerup_party": "พลังประชารัฐ",
+    "runnerup_pid": 38,
     "runnerup_votes": 21379,
     "margin": 23708,
     "valid": 92029,
@@ -3744,6 +4368,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 152,
     "province_thai": "มหาสารคาม",
     "province_eng": "MAHA SARAKHAM",
     "prov_id": "MKM",
@@ -3752,8 +4377,10 @@ const CONST_RAW = [
     "turn_out": 97770,
     "percent_invalid": 2.95183,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 46765,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 27080,
     "margin": 19685,
     "valid": 93713,
@@ -3762,6 +4389,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 275,
     "province_thai": "ร้อยเอ็ด",
     "province_eng": "ROI ET",
     "prov_id": "RET",
@@ -3770,8 +4398,10 @@ const CONST_RAW = [
     "turn_out": 97457,
     "percent_invalid": 2.11273,
     "winner_party": "ชาติไทยพัฒนา",
+    "winner_pid": 5,
     "winner_votes": 40436,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 32318,
     "margin": 8118,
     "valid": 93870,
@@ -3780,6 +4410,7 @@ const CONST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 276,
     "province_thai": "ร้อยเอ็ด",
     "province_eng": "ROI ET",
     "prov_id": "RET",
@@ -3788,8 +4419,10 @@ const CONST_RAW = [
     "turn_out": 96360,
     "percent_invalid": 3.1621,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 33466,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 27477,
     "margin": 5989,
     "valid": 92275,
@@ -3798,6 +4431,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 277,
     "province_thai": "ร้อยเอ็ด",
     "province_eng": "ROI ET",
     "prov_id": "RET",
@@ -3806,8 +4440,10 @@ const CONST_RAW = [
     "turn_out": 90229,
     "percent_invalid": 2.01931,
     "winner_party": "พลังประชารัฐ",
+    "winner_pid": 38,
     "winner_votes": 39181,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 31093,
     "margin": 8088,
     "valid": 87513,
@@ -3816,6 +4452,7 @@ const CONST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 278,
     "province_thai": "ร้อยเอ็ด",
     "province_eng": "ROI ET",
     "prov_id": "RET",
@@ -3824,8 +4461,10 @@ const CONST_RAW = [
     "turn_out": 87354,
     "percent_invalid": 3.68157,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 36822,
     "runnerup_party": "พลังประชารัฐ",
+    "runnerup_pid": 38,
     "runnerup_votes": 25853,
     "margin": 10969,
     "valid": 83127,
@@ -3834,6 +4473,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 279,
     "province_thai": "ร้อยเอ็ด",
     "province_eng": "ROI ET",
     "prov_id": "RET",
@@ -3842,8 +4482,10 @@ const CONST_RAW = [
     "turn_out": 88378,
     "percent_invalid": 3.43185,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 61288,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 15201,
     "margin": 46087,
     "valid": 84013,
@@ -3852,6 +4494,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 280,
     "province_thai": "ร้อยเอ็ด",
     "province_eng": "ROI ET",
     "prov_id": "RET",
@@ -3860,8 +4503,10 @@ const CONST_RAW = [
     "turn_out": 88342,
     "percent_invalid": 3.2544,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 36878,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 16306,
     "margin": 20572,
     "valid": 84460,
@@ -3870,6 +4515,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 281,
     "province_thai": "ร้อยเอ็ด",
     "province_eng": "ROI ET",
     "prov_id": "RET",
@@ -3878,8 +4524,10 @@ const CONST_RAW = [
     "turn_out": 92305,
     "percent_invalid": 2.42349,
     "winner_party": "ไทยสร้างไทย",
+    "winner_pid": 49,
     "winner_votes": 42492,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 20956,
     "margin": 21536,
     "valid": 89428,
@@ -3888,6 +4536,7 @@ const CONST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 282,
     "province_thai": "ร้อยเอ็ด",
     "province_eng": "ROI ET",
     "prov_id": "RET",
@@ -3896,8 +4545,10 @@ const CONST_RAW = [
     "turn_out": 93392,
     "percent_invalid": 2.01302,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 47305,
     "runnerup_party": "ไทยสร้างไทย",
+    "runnerup_pid": 49,
     "runnerup_votes": 20828,
     "margin": 26477,
     "valid": 90499,
@@ -3906,6 +4557,7 @@ const CONST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 124,
     "province_thai": "กาฬสินธุ์",
     "province_eng": "KALASIN",
     "prov_id": "KSN",
@@ -3914,8 +4566,10 @@ const CONST_RAW = [
     "turn_out": 94594,
     "percent_invalid": 3.37759,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 56569,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 23039,
     "margin": 33530,
     "valid": 89863,
@@ -3924,6 +4578,7 @@ const CONST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 125,
     "province_thai": "กาฬสินธุ์",
     "province_eng": "KALASIN",
     "prov_id": "KSN",
@@ -3932,8 +4587,10 @@ const CONST_RAW = [
     "turn_out": 90776,
     "percent_invalid": 3.31916,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 49784,
     "runnerup_party": "ไทยสร้างไทย",
+    "runnerup_pid": 49,
     "runnerup_votes": 23495,
     "margin": 26289,
     "valid": 87105,
@@ -3942,6 +4599,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 126,
     "province_thai": "กาฬสินธุ์",
     "province_eng": "KALASIN",
     "prov_id": "KSN",
@@ -3950,8 +4608,10 @@ const CONST_RAW = [
     "turn_out": 85608,
     "percent_invalid": 4.38861,
     "winner_party": "พลังประชารัฐ",
+    "winner_pid": 38,
     "winner_votes": 37044,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 21604,
     "margin": 15440,
     "valid": 80871,
@@ -3960,6 +4620,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 127,
     "province_thai": "กาฬสินธุ์",
     "province_eng": "KALASIN",
     "prov_id": "KSN",
@@ -3968,8 +4629,10 @@ const CONST_RAW = [
     "turn_out": 95030,
     "percent_invalid": 4.20499,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 31536,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 26766,
     "margin": 4770,
     "valid": 90030,
@@ -3978,6 +4641,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 128,
     "province_thai": "กาฬสินธุ์",
     "province_eng": "KALASIN",
     "prov_id": "KSN",
@@ -3986,8 +4650,10 @@ const CONST_RAW = [
     "turn_out": 97068,
     "percent_invalid": 4.34953,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 39998,
     "runnerup_party": "พลังประชารัฐ",
+    "runnerup_pid": 38,
     "runnerup_votes": 32286,
     "margin": 7712,
     "valid": 91506,
@@ -3996,6 +4662,7 @@ const CONST_RAW = [
     "ballot_surplus": 2
   },
   {
+    "cid": 129,
     "province_thai": "กาฬสินธุ์",
     "province_eng": "KALASIN",
     "prov_id": "KSN",
@@ -4004,8 +4671,10 @@ const CONST_RAW = [
     "turn_out": 94830,
     "percent_invalid": 4.31404,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 44002,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 22935,
     "margin": 21067,
     "valid": 88803,
@@ -4014,6 +4683,7 @@ const CONST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 313,
     "province_thai": "สกลนคร",
     "province_eng": "SAKON NAKHON",
     "prov_id": "SNK",
@@ -4022,8 +4692,10 @@ const CONST_RAW = [
     "turn_out": 96244,
     "percent_invalid": 2.84901,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 29716,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 27493,
     "margin": 2223,
     "valid": 90682,
@@ -4032,6 +4704,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 314,
     "province_thai": "สกลนคร",
     "province_eng": "SAKON NAKHON",
     "prov_id": "SNK",
@@ -4040,8 +4713,10 @@ const CONST_RAW = [
     "turn_out": 90918,
     "percent_invalid": 2.71673,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 27406,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 26700,
     "margin": 706,
     "valid": 87077,
@@ -4050,6 +4725,7 @@ const CONST_RAW = [
     "ballot_surplus": -2
   },
   {
+    "cid": 315,
     "province_thai": "สกลนคร",
     "province_eng": "SAKON NAKHON",
     "prov_id": "SNK",
@@ -4058,8 +4734,10 @@ const CONST_RAW = [
     "turn_out": 92272,
     "percent_invalid": 3.12012,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 49346,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 12737,
     "margin": 36609,
     "valid": 88312,
@@ -4068,6 +4746,7 @@ const CONST_RAW = [
     "ballot_surplus": 3
   },
   {
+    "cid": 316,
     "province_thai": "สกลนคร",
     "province_eng": "SAKON NAKHON",
     "prov_id": "SNK",
@@ -4076,8 +4755,10 @@ const CONST_RAW = [
     "turn_out": 88340,
     "percent_invalid": 2.75526,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 35690,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 20947,
     "margin": 14743,
     "valid": 84157,
@@ -4086,6 +4767,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 317,
     "province_thai": "สกลนคร",
     "province_eng": "SAKON NAKHON",
     "prov_id": "SNK",
@@ -4094,8 +4776,10 @@ const CONST_RAW = [
     "turn_out": 85443,
     "percent_invalid": 3.35194,
     "winner_party": "พลังประชารัฐ",
+    "winner_pid": 38,
     "winner_votes": 29085,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 25973,
     "margin": 3112,
     "valid": 81702,
@@ -4104,6 +4788,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 318,
     "province_thai": "สกลนคร",
     "province_eng": "SAKON NAKHON",
     "prov_id": "SNK",
@@ -4112,8 +4797,10 @@ const CONST_RAW = [
     "turn_out": 83631,
     "percent_invalid": 2.86257,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 39035,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 21506,
     "margin": 17529,
     "valid": 80143,
@@ -4122,6 +4809,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 319,
     "province_thai": "สกลนคร",
     "province_eng": "SAKON NAKHON",
     "prov_id": "SNK",
@@ -4130,8 +4818,10 @@ const CONST_RAW = [
     "turn_out": 82845,
     "percent_invalid": 2.92112,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 32195,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 27180,
     "margin": 5015,
     "valid": 79233,
@@ -4140,6 +4830,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 188,
     "province_thai": "นครพนม",
     "province_eng": "NAKHON PHANOM",
     "prov_id": "NPM",
@@ -4148,8 +4839,10 @@ const CONST_RAW = [
     "turn_out": 100285,
     "percent_invalid": 3.9647,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 44712,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 33977,
     "margin": 10735,
     "valid": 95494,
@@ -4158,6 +4851,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 189,
     "province_thai": "นครพนม",
     "province_eng": "NAKHON PHANOM",
     "prov_id": "NPM",
@@ -4166,8 +4860,10 @@ const CONST_RAW = [
     "turn_out": 99905,
     "percent_invalid": 3.74456,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 39856,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 30528,
     "margin": 9328,
     "valid": 94938,
@@ -4176,6 +4872,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 190,
     "province_thai": "นครพนม",
     "province_eng": "NAKHON PHANOM",
     "prov_id": "NPM",
@@ -4184,8 +4881,10 @@ const CONST_RAW = [
     "turn_out": 97928,
     "percent_invalid": 2.70811,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 41738,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 28966,
     "margin": 12772,
     "valid": 93958,
@@ -4194,6 +4893,7 @@ const CONST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 191,
     "province_thai": "นครพนม",
     "province_eng": "NAKHON PHANOM",
     "prov_id": "NPM",
@@ -4202,8 +4902,10 @@ const CONST_RAW = [
     "turn_out": 99880,
     "percent_invalid": 3.31298,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 25253,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 21658,
     "margin": 3595,
     "valid": 95673,
@@ -4212,6 +4914,7 @@ const CONST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 145,
     "province_thai": "มุกดาหาร",
     "province_eng": "MUKDAHAN",
     "prov_id": "MDH",
@@ -4220,8 +4923,10 @@ const CONST_RAW = [
     "turn_out": 106225,
     "percent_invalid": 3.45399,
     "winner_party": "พลังประชารัฐ",
+    "winner_pid": 38,
     "winner_votes": 33514,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 28451,
     "margin": 5063,
     "valid": 100842,
@@ -4230,6 +4935,7 @@ const CONST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 146,
     "province_thai": "มุกดาหาร",
     "province_eng": "MUKDAHAN",
     "prov_id": "MDH",
@@ -4238,8 +4944,10 @@ const CONST_RAW = [
     "turn_out": 102939,
     "percent_invalid": 3.45059,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 28555,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 23764,
     "margin": 4791,
     "valid": 97661,
@@ -4248,6 +4956,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 69,
     "province_thai": "เชียงใหม่",
     "province_eng": "CHIANG MAI",
     "prov_id": "CMI",
@@ -4256,8 +4965,10 @@ const CONST_RAW = [
     "turn_out": 108446,
     "percent_invalid": 1.97057,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 48823,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 30086,
     "margin": 18737,
     "valid": 102293,
@@ -4266,6 +4977,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 78,
     "province_thai": "เชียงใหม่",
     "province_eng": "CHIANG MAI",
     "prov_id": "CMI",
@@ -4274,8 +4986,10 @@ const CONST_RAW = [
     "turn_out": 99914,
     "percent_invalid": 7.19519,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 32638,
     "runnerup_party": "พลังประชารัฐ",
+    "runnerup_pid": 38,
     "runnerup_votes": 29138,
     "margin": 3500,
     "valid": 91720,
@@ -4284,6 +4998,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 70,
     "province_thai": "เชียงใหม่",
     "province_eng": "CHIANG MAI",
     "prov_id": "CMI",
@@ -4292,8 +5007,10 @@ const CONST_RAW = [
     "turn_out": 115112,
     "percent_invalid": 2.59052,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 51181,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 39091,
     "margin": 12090,
     "valid": 108017,
@@ -4302,6 +5019,7 @@ const CONST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 71,
     "province_thai": "เชียงใหม่",
     "province_eng": "CHIANG MAI",
     "prov_id": "CMI",
@@ -4310,8 +5028,10 @@ const CONST_RAW = [
     "turn_out": 113609,
     "percent_invalid": 3.14852,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 47469,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 43244,
     "margin": 4225,
     "valid": 107061,
@@ -4320,6 +5040,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 72,
     "province_thai": "เชียงใหม่",
     "province_eng": "CHIANG MAI",
     "prov_id": "CMI",
@@ -4328,8 +5049,10 @@ const CONST_RAW = [
     "turn_out": 114802,
     "percent_invalid": 2.43724,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 62009,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 21942,
     "margin": 40067,
     "valid": 108205,
@@ -4338,6 +5061,7 @@ const CONST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 73,
     "province_thai": "เชียงใหม่",
     "province_eng": "CHIANG MAI",
     "prov_id": "CMI",
@@ -4346,8 +5070,10 @@ const CONST_RAW = [
     "turn_out": 108428,
     "percent_invalid": 4.92677,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 38015,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 37738,
     "margin": 277,
     "valid": 100408,
@@ -4356,6 +5082,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 74,
     "province_thai": "เชียงใหม่",
     "province_eng": "CHIANG MAI",
     "prov_id": "CMI",
@@ -4364,8 +5091,10 @@ const CONST_RAW = [
     "turn_out": 96543,
     "percent_invalid": 4.93045,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 25828,
     "runnerup_party": "รวมแผ่นดิน",
+    "runnerup_pid": 34,
     "runnerup_votes": 21937,
     "margin": 3891,
     "valid": 90433,
@@ -4374,6 +5103,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 75,
     "province_thai": "เชียงใหม่",
     "province_eng": "CHIANG MAI",
     "prov_id": "CMI",
@@ -4382,8 +5112,10 @@ const CONST_RAW = [
     "turn_out": 103047,
     "percent_invalid": 6.17485,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 32990,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 29387,
     "margin": 3603,
     "valid": 93968,
@@ -4392,6 +5124,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 76,
     "province_thai": "เชียงใหม่",
     "province_eng": "CHIANG MAI",
     "prov_id": "CMI",
@@ -4400,8 +5133,10 @@ const CONST_RAW = [
     "turn_out": 118394,
     "percent_invalid": 3.07955,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 50878,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 35237,
     "margin": 15641,
     "valid": 112000,
@@ -4410,6 +5145,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 77,
     "province_thai": "เชียงใหม่",
     "province_eng": "CHIANG MAI",
     "prov_id": "CMI",
@@ -4418,8 +5154,10 @@ const CONST_RAW = [
     "turn_out": 110009,
     "percent_invalid": 4.56599,
     "winner_party": "พลังประชารัฐ",
+    "winner_pid": 38,
     "winner_votes": 31107,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 27032,
     "margin": 4075,
     "valid": 103315,
@@ -4428,6 +5166,7 @@ const CONST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 138,
     "province_thai": "ลำพูน",
     "province_eng": "LAMPHUN",
     "prov_id": "LPN",
@@ -4436,8 +5175,10 @@ const CONST_RAW = [
     "turn_out": 146167,
     "percent_invalid": 3.58836,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 60127,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 28328,
     "margin": 31799,
     "valid": 137569,
@@ -4446,6 +5187,7 @@ const CONST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 139,
     "province_thai": "ลำพูน",
     "province_eng": "LAMPHUN",
     "prov_id": "LPN",
@@ -4454,8 +5196,10 @@ const CONST_RAW = [
     "turn_out": 141389,
     "percent_invalid": 5.11072,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 47050,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 43266,
     "margin": 3784,
     "valid": 131375,
@@ -4464,6 +5208,7 @@ const CONST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 134,
     "province_thai": "ลำปาง",
     "province_eng": "LAMPANG",
     "prov_id": "LPG",
@@ -4472,8 +5217,10 @@ const CONST_RAW = [
     "turn_out": 120565,
     "percent_invalid": 3.68017,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 51579,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 34747,
     "margin": 16832,
     "valid": 111945,
@@ -4482,6 +5229,7 @@ const CONST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 135,
     "province_thai": "ลำปาง",
     "province_eng": "LAMPANG",
     "prov_id": "LPG",
@@ -4490,8 +5238,10 @@ const CONST_RAW = [
     "turn_out": 119599,
     "percent_invalid": 6.13634,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 41114,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 35484,
     "margin": 5630,
     "valid": 109622,
@@ -4500,6 +5250,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 136,
     "province_thai": "ลำปาง",
     "province_eng": "LAMPANG",
     "prov_id": "LPG",
@@ -4508,8 +5259,10 @@ const CONST_RAW = [
     "turn_out": 120834,
     "percent_invalid": 4.61708,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 41651,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 28756,
     "margin": 12895,
     "valid": 111311,
@@ -4518,6 +5271,7 @@ const CONST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 137,
     "province_thai": "ลำปาง",
     "province_eng": "LAMPANG",
     "prov_id": "LPG",
@@ -4526,8 +5280,10 @@ const CONST_RAW = [
     "turn_out": 122131,
     "percent_invalid": 5.5375,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 47027,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 27962,
     "margin": 19065,
     "valid": 113026,
@@ -4536,6 +5292,7 @@ const CONST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 391,
     "province_thai": "อุตรดิตถ์",
     "province_eng": "UTTARADIT",
     "prov_id": "UTT",
@@ -4544,8 +5301,10 @@ const CONST_RAW = [
     "turn_out": 90413,
     "percent_invalid": 3.71296,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 32820,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 25696,
     "margin": 7124,
     "valid": 85026,
@@ -4554,6 +5313,7 @@ const CONST_RAW = [
     "ballot_surplus": -2
   },
   {
+    "cid": 392,
     "province_thai": "อุตรดิตถ์",
     "province_eng": "UTTARADIT",
     "prov_id": "UTT",
@@ -4562,8 +5322,10 @@ const CONST_RAW = [
     "turn_out": 89997,
     "percent_invalid": 5.81908,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 36183,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 20952,
     "margin": 15231,
     "valid": 82656,
@@ -4572,6 +5334,7 @@ const CONST_RAW = [
     "ballot_surplus": 2
   },
   {
+    "cid": 393,
     "province_thai": "อุตรดิตถ์",
     "province_eng": "UTTARADIT",
     "prov_id": "UTT",
@@ -4580,8 +5343,10 @@ const CONST_RAW = [
     "turn_out": 92484,
     "percent_invalid": 4.36184,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 48779,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 18506,
     "margin": 30273,
     "valid": 86162,
@@ -4590,6 +5355,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 249,
     "province_thai": "แพร่",
     "province_eng": "PHRAE",
     "prov_id": "PRE",
@@ -4598,8 +5364,10 @@ const CONST_RAW = [
     "turn_out": 101847,
     "percent_invalid": 2.8425,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 41565,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 24022,
     "margin": 17543,
     "valid": 96577,
@@ -4608,6 +5376,7 @@ const CONST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 250,
     "province_thai": "แพร่",
     "province_eng": "PHRAE",
     "prov_id": "PRE",
@@ -4616,8 +5385,10 @@ const CONST_RAW = [
     "turn_out": 93210,
     "percent_invalid": 4.2077,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 32845,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 29063,
     "margin": 3782,
     "valid": 88027,
@@ -4626,6 +5397,7 @@ const CONST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 251,
     "province_thai": "แพร่",
     "province_eng": "PHRAE",
     "prov_id": "PRE",
@@ -4634,8 +5406,10 @@ const CONST_RAW = [
     "turn_out": 92824,
     "percent_invalid": 5.53413,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 33616,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 21781,
     "margin": 11835,
     "valid": 85967,
@@ -4644,6 +5418,7 @@ const CONST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 156,
     "province_thai": "น่าน",
     "province_eng": "NAN",
     "prov_id": "NAN",
@@ -4652,8 +5427,10 @@ const CONST_RAW = [
     "turn_out": 102972,
     "percent_invalid": 5.40341,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 56746,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 22834,
     "margin": 33912,
     "valid": 95483,
@@ -4662,6 +5439,7 @@ const CONST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 157,
     "province_thai": "น่าน",
     "province_eng": "NAN",
     "prov_id": "NAN",
@@ -4670,8 +5448,10 @@ const CONST_RAW = [
     "turn_out": 93629,
     "percent_invalid": 7.53826,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 29379,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 26621,
     "margin": 2758,
     "valid": 84675,
@@ -4680,6 +5460,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 267,
     "province_thai": "พะเยา",
     "province_eng": "PHAYAO",
     "prov_id": "PYO",
@@ -4688,8 +5469,10 @@ const CONST_RAW = [
     "turn_out": 101698,
     "percent_invalid": 4.3462,
     "winner_party": "พลังประชารัฐ",
+    "winner_pid": 38,
     "winner_votes": 53963,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 27862,
     "margin": 26101,
     "valid": 94159,
@@ -4698,6 +5481,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 268,
     "province_thai": "พะเยา",
     "province_eng": "PHAYAO",
     "prov_id": "PYO",
@@ -4706,8 +5490,10 @@ const CONST_RAW = [
     "turn_out": 99198,
     "percent_invalid": 5.75717,
     "winner_party": "พลังประชารัฐ",
+    "winner_pid": 38,
     "winner_votes": 32779,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 30405,
     "margin": 2374,
     "valid": 91494,
@@ -4716,6 +5502,7 @@ const CONST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 269,
     "province_thai": "พะเยา",
     "province_eng": "PHAYAO",
     "prov_id": "PYO",
@@ -4724,8 +5511,10 @@ const CONST_RAW = [
     "turn_out": 103270,
     "percent_invalid": 5.70059,
     "winner_party": "พลังประชารัฐ",
+    "winner_pid": 38,
     "winner_votes": 34720,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 23624,
     "margin": 11096,
     "valid": 95643,
@@ -4734,6 +5523,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 91,
     "province_thai": "เชียงราย",
     "province_eng": "CHIANG RAI",
     "prov_id": "CRI",
@@ -4742,8 +5532,10 @@ const CONST_RAW = [
     "turn_out": 109475,
     "percent_invalid": 3.314,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 43153,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 36100,
     "margin": 7053,
     "valid": 102861,
@@ -4752,6 +5544,7 @@ const CONST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 92,
     "province_thai": "เชียงราย",
     "province_eng": "CHIANG RAI",
     "prov_id": "CRI",
@@ -4760,8 +5553,10 @@ const CONST_RAW = [
     "turn_out": 103629,
     "percent_invalid": 5.12984,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 55778,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 33085,
     "margin": 22693,
     "valid": 96192,
@@ -4770,6 +5565,7 @@ const CONST_RAW = [
     "ballot_surplus": 2
   },
   {
+    "cid": 93,
     "province_thai": "เชียงราย",
     "province_eng": "CHIANG RAI",
     "prov_id": "CRI",
@@ -4778,8 +5574,10 @@ const CONST_RAW = [
     "turn_out": 110706,
     "percent_invalid": 6.79548,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 25056,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 23384,
     "margin": 1672,
     "valid": 101575,
@@ -4788,6 +5586,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 94,
     "province_thai": "เชียงราย",
     "province_eng": "CHIANG RAI",
     "prov_id": "CRI",
@@ -4796,8 +5595,10 @@ const CONST_RAW = [
     "turn_out": 113169,
     "percent_invalid": 4.37134,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 39589,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 25502,
     "margin": 14087,
     "valid": 106011,
@@ -4806,6 +5607,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 95,
     "province_thai": "เชียงราย",
     "province_eng": "CHIANG RAI",
     "prov_id": "CRI",
@@ -4814,8 +5616,10 @@ const CONST_RAW = [
     "turn_out": 103456,
     "percent_invalid": 4.4937,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 35162,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 27073,
     "margin": 8089,
     "valid": 97225,
@@ -4824,6 +5628,7 @@ const CONST_RAW = [
     "ballot_surplus": 2
   },
   {
+    "cid": 96,
     "province_thai": "เชียงราย",
     "province_eng": "CHIANG RAI",
     "prov_id": "CRI",
@@ -4832,8 +5637,10 @@ const CONST_RAW = [
     "turn_out": 87605,
     "percent_invalid": 6.27133,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 31789,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 18027,
     "margin": 13762,
     "valid": 80461,
@@ -4842,6 +5649,7 @@ const CONST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 97,
     "province_thai": "เชียงราย",
     "province_eng": "CHIANG RAI",
     "prov_id": "CRI",
@@ -4850,8 +5658,10 @@ const CONST_RAW = [
     "turn_out": 101295,
     "percent_invalid": 6.1701,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 31588,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 25889,
     "margin": 5699,
     "valid": 93009,
@@ -4860,6 +5670,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 153,
     "province_thai": "แม่ฮ่องสอน",
     "province_eng": "MAE HONG SON",
     "prov_id": "MSN",
@@ -4868,8 +5679,10 @@ const CONST_RAW = [
     "turn_out": 71189,
     "percent_invalid": 5.73263,
     "winner_party": "พลังประชารัฐ",
+    "winner_pid": 38,
     "winner_votes": 18772,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 13876,
     "margin": 4896,
     "valid": 65774,
@@ -4878,6 +5691,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 154,
     "province_thai": "แม่ฮ่องสอน",
     "province_eng": "MAE HONG SON",
     "prov_id": "MSN",
@@ -4886,8 +5700,10 @@ const CONST_RAW = [
     "turn_out": 76793,
     "percent_invalid": 7.44078,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 20346,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 17536,
     "margin": 2810,
     "valid": 69933,
@@ -4896,6 +5712,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 198,
     "province_thai": "นครสวรรค์",
     "province_eng": "NAKHON SAWAN",
     "prov_id": "NSN",
@@ -4904,8 +5721,10 @@ const CONST_RAW = [
     "turn_out": 105798,
     "percent_invalid": 3.12671,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 31671,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 27035,
     "margin": 4636,
     "valid": 99045,
@@ -4914,6 +5733,7 @@ const CONST_RAW = [
     "ballot_surplus": 2
   },
   {
+    "cid": 199,
     "province_thai": "นครสวรรค์",
     "province_eng": "NAKHON SAWAN",
     "prov_id": "NSN",
@@ -4922,8 +5742,10 @@ const CONST_RAW = [
     "turn_out": 107230,
     "percent_invalid": 4.69365,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 37510,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 24844,
     "margin": 12666,
     "valid": 99976,
@@ -4932,6 +5754,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 200,
     "province_thai": "นครสวรรค์",
     "province_eng": "NAKHON SAWAN",
     "prov_id": "NSN",
@@ -4940,8 +5763,10 @@ const CONST_RAW = [
     "turn_out": 109065,
     "percent_invalid": 4.84573,
     "winner_party": "รวมไทยสร้างชาติ",
+    "winner_pid": 50,
     "winner_votes": 32100,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 24317,
     "margin": 7783,
     "valid": 102038,
@@ -4950,6 +5775,7 @@ const CONST_RAW = [
     "ballot_surplus": 2
   },
   {
+    "cid": 201,
     "province_thai": "นครสวรรค์",
     "province_eng": "NAKHON SAWAN",
     "prov_id": "NSN",
@@ -4958,8 +5784,10 @@ const CONST_RAW = [
     "turn_out": 104726,
     "percent_invalid": 5.66144,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 32934,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 25073,
     "margin": 7861,
     "valid": 97571,
@@ -4968,6 +5796,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 202,
     "province_thai": "นครสวรรค์",
     "province_eng": "NAKHON SAWAN",
     "prov_id": "NSN",
@@ -4976,8 +5805,10 @@ const CONST_RAW = [
     "turn_out": 104880,
     "percent_invalid": 4.27918,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 46438,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 17352,
     "margin": 29086,
     "valid": 98476,
@@ -4986,6 +5817,7 @@ const CONST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 203,
     "province_thai": "นครสวรรค์",
     "province_eng": "NAKHON SAWAN",
     "prov_id": "NSN",
@@ -4994,8 +5826,10 @@ const CONST_RAW = [
     "turn_out": 97305,
     "percent_invalid": 5.06654,
     "winner_party": "ชาติพัฒนากล้า",
+    "winner_pid": 4,
     "winner_votes": 24089,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 22428,
     "margin": 1661,
     "valid": 91500,
@@ -5004,6 +5838,7 @@ const CONST_RAW = [
     "ballot_surplus": -2
   },
   {
+    "cid": 389,
     "province_thai": "อุทัยธานี",
     "province_eng": "UTHAI THANI",
     "prov_id": "UTI",
@@ -5012,8 +5847,10 @@ const CONST_RAW = [
     "turn_out": 92174,
     "percent_invalid": 4.96995,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 49525,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 15832,
     "margin": 33693,
     "valid": 84828,
@@ -5022,6 +5859,7 @@ const CONST_RAW = [
     "ballot_surplus": 2
   },
   {
+    "cid": 390,
     "province_thai": "อุทัยธานี",
     "province_eng": "UTHAI THANI",
     "prov_id": "UTI",
@@ -5030,8 +5868,10 @@ const CONST_RAW = [
     "turn_out": 93772,
     "percent_invalid": 5.65627,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 43505,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 18690,
     "margin": 24815,
     "valid": 86791,
@@ -5040,6 +5880,7 @@ const CONST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 115,
     "province_thai": "กำแพงเพชร",
     "province_eng": "KAMPHAENG PHET",
     "prov_id": "KPT",
@@ -5048,8 +5889,10 @@ const CONST_RAW = [
     "turn_out": 106015,
     "percent_invalid": 5.92369,
     "winner_party": "พลังประชารัฐ",
+    "winner_pid": 38,
     "winner_votes": 36187,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 28944,
     "margin": 7243,
     "valid": 96928,
@@ -5058,6 +5901,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 116,
     "province_thai": "กำแพงเพชร",
     "province_eng": "KAMPHAENG PHET",
     "prov_id": "KPT",
@@ -5066,8 +5910,10 @@ const CONST_RAW = [
     "turn_out": 105670,
     "percent_invalid": 7.10892,
     "winner_party": "พลังประชารัฐ",
+    "winner_pid": 38,
     "winner_votes": 41143,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 24196,
     "margin": 16947,
     "valid": 95664,
@@ -5076,6 +5922,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 117,
     "province_thai": "กำแพงเพชร",
     "province_eng": "KAMPHAENG PHET",
     "prov_id": "KPT",
@@ -5084,8 +5931,10 @@ const CONST_RAW = [
     "turn_out": 94604,
     "percent_invalid": 5.00085,
     "winner_party": "พลังประชารัฐ",
+    "winner_pid": 38,
     "winner_votes": 37149,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 19626,
     "margin": 17523,
     "valid": 87629,
@@ -5094,6 +5943,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 118,
     "province_thai": "กำแพงเพชร",
     "province_eng": "KAMPHAENG PHET",
     "prov_id": "KPT",
@@ -5102,8 +5952,10 @@ const CONST_RAW = [
     "turn_out": 97660,
     "percent_invalid": 5.79357,
     "winner_party": "พลังประชารัฐ",
+    "winner_pid": 38,
     "winner_votes": 36132,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 21741,
     "margin": 14391,
     "valid": 90372,
@@ -5112,6 +5964,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 360,
     "province_thai": "ตาก",
     "province_eng": "TAK",
     "prov_id": "TAK",
@@ -5120,8 +5973,10 @@ const CONST_RAW = [
     "turn_out": 111712,
     "percent_invalid": 4.46684,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 27664,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 21704,
     "margin": 5960,
     "valid": 103556,
@@ -5130,6 +5985,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 361,
     "province_thai": "ตาก",
     "province_eng": "TAK",
     "prov_id": "TAK",
@@ -5138,8 +5994,10 @@ const CONST_RAW = [
     "turn_out": 94674,
     "percent_invalid": 7.29028,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 24133,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 15705,
     "margin": 8428,
     "valid": 85630,
@@ -5148,6 +6006,7 @@ const CONST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 362,
     "province_thai": "ตาก",
     "province_eng": "TAK",
     "prov_id": "TAK",
@@ -5156,8 +6015,10 @@ const CONST_RAW = [
     "turn_out": 98798,
     "percent_invalid": 9.20262,
     "winner_party": "พลังประชารัฐ",
+    "winner_pid": 38,
     "winner_votes": 31550,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 17380,
     "margin": 14170,
     "valid": 88114,
@@ -5166,6 +6027,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 354,
     "province_thai": "สุโขทัย",
     "province_eng": "SUKHOTHAI",
     "prov_id": "STI",
@@ -5174,8 +6036,10 @@ const CONST_RAW = [
     "turn_out": 89158,
     "percent_invalid": 4.40678,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 32130,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 26117,
     "margin": 6013,
     "valid": 82373,
@@ -5184,6 +6048,7 @@ const CONST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 355,
     "province_thai": "สุโขทัย",
     "province_eng": "SUKHOTHAI",
     "prov_id": "STI",
@@ -5192,8 +6057,10 @@ const CONST_RAW = [
     "turn_out": 84373,
     "percent_invalid": 5.54324,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 31314,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 19781,
     "margin": 11533,
     "valid": 78406,
@@ -5202,6 +6069,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 356,
     "province_thai": "สุโขทัย",
     "province_eng": "SUKHOTHAI",
     "prov_id": "STI",
@@ -5210,8 +6078,10 @@ const CONST_RAW = [
     "turn_out": 91645,
     "percent_invalid": 4.77495,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 33259,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 24982,
     "margin": 8277,
     "valid": 86016,
@@ -5220,6 +6090,7 @@ const CONST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 357,
     "province_thai": "สุโขทัย",
     "province_eng": "SUKHOTHAI",
     "prov_id": "STI",
@@ -5228,8 +6099,10 @@ const CONST_RAW = [
     "turn_out": 89737,
     "percent_invalid": 5.43588,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 36738,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 18512,
     "margin": 18226,
     "valid": 83056,
@@ -5238,6 +6111,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 236,
     "province_thai": "พิษณุโลก",
     "province_eng": "PHITSANULOK",
     "prov_id": "PLK",
@@ -5246,8 +6120,10 @@ const CONST_RAW = [
     "turn_out": 104852,
     "percent_invalid": 2.31088,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 40842,
     "runnerup_party": "พลังประชารัฐ",
+    "runnerup_pid": 38,
     "runnerup_votes": 19096,
     "margin": 21746,
     "valid": 98763,
@@ -5256,6 +6132,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 237,
     "province_thai": "พิษณุโลก",
     "province_eng": "PHITSANULOK",
     "prov_id": "PLK",
@@ -5264,8 +6141,10 @@ const CONST_RAW = [
     "turn_out": 112980,
     "percent_invalid": 3.84227,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 30819,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 23516,
     "margin": 7303,
     "valid": 106057,
@@ -5274,6 +6153,7 @@ const CONST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 238,
     "province_thai": "พิษณุโลก",
     "province_eng": "PHITSANULOK",
     "prov_id": "PLK",
@@ -5282,8 +6162,10 @@ const CONST_RAW = [
     "turn_out": 100483,
     "percent_invalid": 5.44868,
     "winner_party": "รวมไทยสร้างชาติ",
+    "winner_pid": 50,
     "winner_votes": 22765,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 21969,
     "margin": 796,
     "valid": 93539,
@@ -5292,6 +6174,7 @@ const CONST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 239,
     "province_thai": "พิษณุโลก",
     "province_eng": "PHITSANULOK",
     "prov_id": "PLK",
@@ -5300,8 +6183,10 @@ const CONST_RAW = [
     "turn_out": 97594,
     "percent_invalid": 4.32301,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 40236,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 32818,
     "margin": 7418,
     "valid": 92136,
@@ -5310,6 +6195,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 240,
     "province_thai": "พิษณุโลก",
     "province_eng": "PHITSANULOK",
     "prov_id": "PLK",
@@ -5318,8 +6204,10 @@ const CONST_RAW = [
     "turn_out": 98759,
     "percent_invalid": 4.50187,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 25792,
     "runnerup_party": "พลังประชารัฐ",
+    "runnerup_pid": 38,
     "runnerup_votes": 16843,
     "margin": 8949,
     "valid": 92371,
@@ -5328,6 +6216,7 @@ const CONST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 224,
     "province_thai": "พิจิตร",
     "province_eng": "PHICHIT",
     "prov_id": "PCT",
@@ -5336,8 +6225,10 @@ const CONST_RAW = [
     "turn_out": 109211,
     "percent_invalid": 4.73945,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 43965,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 21985,
     "margin": 21980,
     "valid": 102297,
@@ -5346,6 +6237,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 225,
     "province_thai": "พิจิตร",
     "province_eng": "PHICHIT",
     "prov_id": "PCT",
@@ -5354,8 +6246,10 @@ const CONST_RAW = [
     "turn_out": 100611,
     "percent_invalid": 5.47057,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 33390,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 20646,
     "margin": 12744,
     "valid": 93805,
@@ -5364,6 +6258,7 @@ const CONST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 226,
     "province_thai": "พิจิตร",
     "province_eng": "PHICHIT",
     "prov_id": "PCT",
@@ -5372,8 +6267,10 @@ const CONST_RAW = [
     "turn_out": 105762,
     "percent_invalid": 5.00842,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 33996,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 24821,
     "margin": 9175,
     "valid": 99520,
@@ -5382,6 +6279,7 @@ const CONST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 243,
     "province_thai": "เพชรบูรณ์",
     "province_eng": "PHETCHABUN",
     "prov_id": "PNB",
@@ -5390,8 +6288,10 @@ const CONST_RAW = [
     "turn_out": 96631,
     "percent_invalid": 5.06359,
     "winner_party": "พลังประชารัฐ",
+    "winner_pid": 38,
     "winner_votes": 35905,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 24550,
     "margin": 11355,
     "valid": 89156,
@@ -5400,6 +6300,7 @@ const CONST_RAW = [
     "ballot_surplus": -2
   },
   {
+    "cid": 244,
     "province_thai": "เพชรบูรณ์",
     "province_eng": "PHETCHABUN",
     "prov_id": "PNB",
@@ -5408,8 +6309,10 @@ const CONST_RAW = [
     "turn_out": 99420,
     "percent_invalid": 5.28465,
     "winner_party": "พลังประชารัฐ",
+    "winner_pid": 38,
     "winner_votes": 38352,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 28857,
     "margin": 9495,
     "valid": 91696,
@@ -5418,6 +6321,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 245,
     "province_thai": "เพชรบูรณ์",
     "province_eng": "PHETCHABUN",
     "prov_id": "PNB",
@@ -5426,8 +6330,10 @@ const CONST_RAW = [
     "turn_out": 97258,
     "percent_invalid": 5.27669,
     "winner_party": "พลังประชารัฐ",
+    "winner_pid": 38,
     "winner_votes": 31707,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 26105,
     "margin": 5602,
     "valid": 90365,
@@ -5436,6 +6342,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 246,
     "province_thai": "เพชรบูรณ์",
     "province_eng": "PHETCHABUN",
     "prov_id": "PNB",
@@ -5444,8 +6351,10 @@ const CONST_RAW = [
     "turn_out": 86560,
     "percent_invalid": 5.60536,
     "winner_party": "พลังประชารัฐ",
+    "winner_pid": 38,
     "winner_votes": 41039,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 22599,
     "margin": 18440,
     "valid": 80372,
@@ -5454,6 +6363,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 247,
     "province_thai": "เพชรบูรณ์",
     "province_eng": "PHETCHABUN",
     "prov_id": "PNB",
@@ -5462,8 +6372,10 @@ const CONST_RAW = [
     "turn_out": 90939,
     "percent_invalid": 5.75661,
     "winner_party": "พลังประชารัฐ",
+    "winner_pid": 38,
     "winner_votes": 34971,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 24563,
     "margin": 10408,
     "valid": 84221,
@@ -5472,6 +6384,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 248,
     "province_thai": "เพชรบูรณ์",
     "province_eng": "PHETCHABUN",
     "prov_id": "PNB",
@@ -5480,8 +6393,10 @@ const CONST_RAW = [
     "turn_out": 93742,
     "percent_invalid": 4.99243,
     "winner_party": "พลังประชารัฐ",
+    "winner_pid": 38,
     "winner_votes": 47118,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 18881,
     "margin": 28237,
     "valid": 87668,
@@ -5490,6 +6405,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 270,
     "province_thai": "ราชบุรี",
     "province_eng": "RATCHABURI",
     "prov_id": "RBR",
@@ -5498,8 +6414,10 @@ const CONST_RAW = [
     "turn_out": 109540,
     "percent_invalid": 3.32755,
     "winner_party": "รวมไทยสร้างชาติ",
+    "winner_pid": 50,
     "winner_votes": 52941,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 29646,
     "margin": 23295,
     "valid": 101935,
@@ -5508,6 +6426,7 @@ const CONST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 271,
     "province_thai": "ราชบุรี",
     "province_eng": "RATCHABURI",
     "prov_id": "RBR",
@@ -5516,8 +6435,10 @@ const CONST_RAW = [
     "turn_out": 105493,
     "percent_invalid": 5.26006,
     "winner_party": "พลังประชารัฐ",
+    "winner_pid": 38,
     "winner_votes": 41807,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 27403,
     "margin": 14404,
     "valid": 95993,
@@ -5526,6 +6447,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 272,
     "province_thai": "ราชบุรี",
     "province_eng": "RATCHABURI",
     "prov_id": "RBR",
@@ -5534,8 +6456,10 @@ const CONST_RAW = [
     "turn_out": 119245,
     "percent_invalid": 3.85593,
     "winner_party": "พลังประชารัฐ",
+    "winner_pid": 38,
     "winner_votes": 49262,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 26114,
     "margin": 23148,
     "valid": 112219,
@@ -5544,6 +6468,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 273,
     "province_thai": "ราชบุรี",
     "province_eng": "RATCHABURI",
     "prov_id": "RBR",
@@ -5552,8 +6477,10 @@ const CONST_RAW = [
     "turn_out": 116293,
     "percent_invalid": 3.25471,
     "winner_party": "รวมไทยสร้างชาติ",
+    "winner_pid": 50,
     "winner_votes": 54815,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 22089,
     "margin": 32726,
     "valid": 110903,
@@ -5562,6 +6489,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 274,
     "province_thai": "ราชบุรี",
     "province_eng": "RATCHABURI",
     "prov_id": "RBR",
@@ -5570,8 +6498,10 @@ const CONST_RAW = [
     "turn_out": 114793,
     "percent_invalid": 2.86777,
     "winner_party": "พลังประชารัฐ",
+    "winner_pid": 38,
     "winner_votes": 44253,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 38284,
     "margin": 5969,
     "valid": 110005,
@@ -5580,6 +6510,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 119,
     "province_thai": "กาญจนบุรี",
     "province_eng": "KANCHANABURI",
     "prov_id": "KRI",
@@ -5588,8 +6519,10 @@ const CONST_RAW = [
     "turn_out": 105722,
     "percent_invalid": 3.75986,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 33183,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 25720,
     "margin": 7463,
     "valid": 98623,
@@ -5598,6 +6531,7 @@ const CONST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 120,
     "province_thai": "กาญจนบุรี",
     "province_eng": "KANCHANABURI",
     "prov_id": "KRI",
@@ -5606,8 +6540,10 @@ const CONST_RAW = [
     "turn_out": 107722,
     "percent_invalid": 3.5081,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 23278,
     "runnerup_party": "พลังประชารัฐ",
+    "runnerup_pid": 38,
     "runnerup_votes": 20165,
     "margin": 3113,
     "valid": 102428,
@@ -5616,6 +6552,7 @@ const CONST_RAW = [
     "ballot_surplus": 3
   },
   {
+    "cid": 121,
     "province_thai": "กาญจนบุรี",
     "province_eng": "KANCHANABURI",
     "prov_id": "KRI",
@@ -5624,8 +6561,10 @@ const CONST_RAW = [
     "turn_out": 113156,
     "percent_invalid": 3.64187,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 44813,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 44033,
     "margin": 780,
     "valid": 107426,
@@ -5634,6 +6573,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 122,
     "province_thai": "กาญจนบุรี",
     "province_eng": "KANCHANABURI",
     "prov_id": "KRI",
@@ -5642,8 +6582,10 @@ const CONST_RAW = [
     "turn_out": 103157,
     "percent_invalid": 5.62153,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 45812,
     "runnerup_party": "พลังประชารัฐ",
+    "runnerup_pid": 38,
     "runnerup_votes": 27466,
     "margin": 18346,
     "valid": 96256,
@@ -5652,6 +6594,7 @@ const CONST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 123,
     "province_thai": "กาญจนบุรี",
     "province_eng": "KANCHANABURI",
     "prov_id": "KRI",
@@ -5660,8 +6603,10 @@ const CONST_RAW = [
     "turn_out": 87805,
     "percent_invalid": 5.2981,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 31164,
     "runnerup_party": "พลังประชารัฐ",
+    "runnerup_pid": 38,
     "runnerup_votes": 21346,
     "margin": 9818,
     "valid": 81837,
@@ -5670,6 +6615,7 @@ const CONST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 320,
     "province_thai": "สุพรรณบุรี",
     "province_eng": "SUPHAN BURI",
     "prov_id": "SPB",
@@ -5678,8 +6624,10 @@ const CONST_RAW = [
     "turn_out": 101837,
     "percent_invalid": 6.90515,
     "winner_party": "ชาติไทยพัฒนา",
+    "winner_pid": 5,
     "winner_votes": 46324,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 26551,
     "margin": 19773,
     "valid": 91750,
@@ -5688,6 +6636,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 321,
     "province_thai": "สุพรรณบุรี",
     "province_eng": "SUPHAN BURI",
     "prov_id": "SPB",
@@ -5696,8 +6645,10 @@ const CONST_RAW = [
     "turn_out": 97621,
     "percent_invalid": 6.37977,
     "winner_party": "ชาติไทยพัฒนา",
+    "winner_pid": 5,
     "winner_votes": 43795,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 24571,
     "margin": 19224,
     "valid": 89686,
@@ -5706,6 +6657,7 @@ const CONST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 322,
     "province_thai": "สุพรรณบุรี",
     "province_eng": "SUPHAN BURI",
     "prov_id": "SPB",
@@ -5714,8 +6666,10 @@ const CONST_RAW = [
     "turn_out": 104692,
     "percent_invalid": 5.99186,
     "winner_party": "ชาติไทยพัฒนา",
+    "winner_pid": 5,
     "winner_votes": 39348,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 32990,
     "margin": 6358,
     "valid": 97074,
@@ -5724,6 +6678,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 323,
     "province_thai": "สุพรรณบุรี",
     "province_eng": "SUPHAN BURI",
     "prov_id": "SPB",
@@ -5732,8 +6687,10 @@ const CONST_RAW = [
     "turn_out": 108646,
     "percent_invalid": 5.54645,
     "winner_party": "ชาติไทยพัฒนา",
+    "winner_pid": 5,
     "winner_votes": 42639,
     "runnerup_party": "พลังประชารัฐ",
+    "runnerup_pid": 38,
     "runnerup_votes": 20400,
     "margin": 22239,
     "valid": 101388,
@@ -5742,6 +6699,7 @@ const CONST_RAW = [
     "ballot_surplus": 2
   },
   {
+    "cid": 324,
     "province_thai": "สุพรรณบุรี",
     "province_eng": "SUPHAN BURI",
     "prov_id": "SPB",
@@ -5750,8 +6708,10 @@ const CONST_RAW = [
     "turn_out": 114168,
     "percent_invalid": 6.22679,
     "winner_party": "ชาติไทยพัฒนา",
+    "winner_pid": 5,
     "winner_votes": 55877,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 24311,
     "margin": 31566,
     "valid": 104473,
@@ -5760,6 +6720,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 192,
     "province_thai": "นครปฐม",
     "province_eng": "NAKHON PATHOM",
     "prov_id": "NPT",
@@ -5768,8 +6729,10 @@ const CONST_RAW = [
     "turn_out": 107368,
     "percent_invalid": 2.7932,
     "winner_party": "ชาติไทยพัฒนา",
+    "winner_pid": 5,
     "winner_votes": 39899,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 27106,
     "margin": 12793,
     "valid": 102216,
@@ -5778,6 +6741,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 193,
     "province_thai": "นครปฐม",
     "province_eng": "NAKHON PATHOM",
     "prov_id": "NPT",
@@ -5786,8 +6750,10 @@ const CONST_RAW = [
     "turn_out": 99830,
     "percent_invalid": 2.90293,
     "winner_party": "รวมไทยสร้างชาติ",
+    "winner_pid": 50,
     "winner_votes": 33770,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 32056,
     "margin": 1714,
     "valid": 93691,
@@ -5796,6 +6762,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 194,
     "province_thai": "นครปฐม",
     "province_eng": "NAKHON PATHOM",
     "prov_id": "NPT",
@@ -5804,8 +6771,10 @@ const CONST_RAW = [
     "turn_out": 97261,
     "percent_invalid": 3.98001,
     "winner_party": "ชาติไทยพัฒนา",
+    "winner_pid": 5,
     "winner_votes": 42825,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 24814,
     "margin": 18011,
     "valid": 90960,
@@ -5814,6 +6783,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 195,
     "province_thai": "นครปฐม",
     "province_eng": "NAKHON PATHOM",
     "prov_id": "NPT",
@@ -5822,8 +6792,10 @@ const CONST_RAW = [
     "turn_out": 107157,
     "percent_invalid": 3.58166,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 24898,
     "runnerup_party": "ชาติไทยพัฒนา",
+    "runnerup_pid": 5,
     "runnerup_votes": 19861,
     "margin": 5037,
     "valid": 101691,
@@ -5832,6 +6804,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 196,
     "province_thai": "นครปฐม",
     "province_eng": "NAKHON PATHOM",
     "prov_id": "NPT",
@@ -5840,8 +6813,10 @@ const CONST_RAW = [
     "turn_out": 108608,
     "percent_invalid": 3.28981,
     "winner_party": "ชาติไทยพัฒนา",
+    "winner_pid": 5,
     "winner_votes": 36422,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 24896,
     "margin": 11526,
     "valid": 102473,
@@ -5850,6 +6825,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 197,
     "province_thai": "นครปฐม",
     "province_eng": "NAKHON PATHOM",
     "prov_id": "NPT",
@@ -5858,8 +6834,10 @@ const CONST_RAW = [
     "turn_out": 97550,
     "percent_invalid": 2.40697,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 38812,
     "runnerup_party": "ชาติไทยพัฒนา",
+    "runnerup_pid": 5,
     "runnerup_votes": 19742,
     "margin": 19070,
     "valid": 92194,
@@ -5868,6 +6846,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 300,
     "province_thai": "สมุทรสาคร",
     "province_eng": "SAMUT SAKHON",
     "prov_id": "SKN",
@@ -5876,8 +6855,10 @@ const CONST_RAW = [
     "turn_out": 117456,
     "percent_invalid": 2.80275,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 45550,
     "runnerup_party": "พลังประชารัฐ",
+    "runnerup_pid": 38,
     "runnerup_votes": 29890,
     "margin": 15660,
     "valid": 110869,
@@ -5886,6 +6867,7 @@ const CONST_RAW = [
     "ballot_surplus": -4
   },
   {
+    "cid": 301,
     "province_thai": "สมุทรสาคร",
     "province_eng": "SAMUT SAKHON",
     "prov_id": "SKN",
@@ -5894,8 +6876,10 @@ const CONST_RAW = [
     "turn_out": 112852,
     "percent_invalid": 2.6362,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 46896,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 22370,
     "margin": 24526,
     "valid": 106995,
@@ -5904,6 +6888,7 @@ const CONST_RAW = [
     "ballot_surplus": 2
   },
   {
+    "cid": 302,
     "province_thai": "สมุทรสาคร",
     "province_eng": "SAMUT SAKHON",
     "prov_id": "SKN",
@@ -5912,8 +6897,10 @@ const CONST_RAW = [
     "turn_out": 119698,
     "percent_invalid": 3.59321,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 37511,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 29986,
     "margin": 7525,
     "valid": 112623,
@@ -5922,16 +6909,19 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 401,
     "province_thai": "สมุทรสาคร",
     "province_eng": "SAMUT SAKHON",
     "prov_id": "SKN",
     "cons_no": 4,
     "region": "Central",
     "turn_out": 0,
-    "percent_invalid": 0,
+    "percent_invalid": 0.0,
     "winner_party": "Unknown",
+    "winner_pid": -1,
     "winner_votes": 0,
     "runnerup_party": "Unknown",
+    "runnerup_pid": -1,
     "runnerup_votes": 0,
     "margin": 0,
     "valid": 0,
@@ -5940,6 +6930,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 299,
     "province_thai": "สมุทรสงคราม",
     "province_eng": "SAMUT SONGKHRAM",
     "prov_id": "SKM",
@@ -5948,8 +6939,10 @@ const CONST_RAW = [
     "turn_out": 120853,
     "percent_invalid": 3.5597,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 42882,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 21953,
     "margin": 20929,
     "valid": 113574,
@@ -5958,6 +6951,7 @@ const CONST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 221,
     "province_thai": "เพชรบุรี",
     "province_eng": "PHETCHABURI",
     "prov_id": "PBI",
@@ -5966,8 +6960,10 @@ const CONST_RAW = [
     "turn_out": 104809,
     "percent_invalid": 2.99879,
     "winner_party": "รวมไทยสร้างชาติ",
+    "winner_pid": 50,
     "winner_votes": 40235,
     "runnerup_party": "ชาติไทยพัฒนา",
+    "runnerup_pid": 5,
     "runnerup_votes": 25700,
     "margin": 14535,
     "valid": 99652,
@@ -5976,6 +6972,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 222,
     "province_thai": "เพชรบุรี",
     "province_eng": "PHETCHABURI",
     "prov_id": "PBI",
@@ -5984,8 +6981,10 @@ const CONST_RAW = [
     "turn_out": 113627,
     "percent_invalid": 3.60214,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 44482,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 33901,
     "margin": 10581,
     "valid": 107853,
@@ -5994,6 +6993,7 @@ const CONST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 223,
     "province_thai": "เพชรบุรี",
     "province_eng": "PHETCHABURI",
     "prov_id": "PBI",
@@ -6002,8 +7002,10 @@ const CONST_RAW = [
     "turn_out": 110142,
     "percent_invalid": 3.7261,
     "winner_party": "รวมไทยสร้างชาติ",
+    "winner_pid": 50,
     "winner_votes": 48107,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 25238,
     "margin": 22869,
     "valid": 104138,
@@ -6012,6 +7014,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 227,
     "province_thai": "ประจวบคีรีขันธ์",
     "province_eng": "PRACHUAP KHIRI KHAN",
     "prov_id": "PKN",
@@ -6020,8 +7023,10 @@ const CONST_RAW = [
     "turn_out": 114565,
     "percent_invalid": 3.87204,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 36719,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 34486,
     "margin": 2233,
     "valid": 107884,
@@ -6030,6 +7035,7 @@ const CONST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 228,
     "province_thai": "ประจวบคีรีขันธ์",
     "province_eng": "PRACHUAP KHIRI KHAN",
     "prov_id": "PKN",
@@ -6038,8 +7044,10 @@ const CONST_RAW = [
     "turn_out": 110411,
     "percent_invalid": 3.40274,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 42736,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 26197,
     "margin": 16539,
     "valid": 104193,
@@ -6048,6 +7056,7 @@ const CONST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 229,
     "province_thai": "ประจวบคีรีขันธ์",
     "province_eng": "PRACHUAP KHIRI KHAN",
     "prov_id": "PKN",
@@ -6056,8 +7065,10 @@ const CONST_RAW = [
     "turn_out": 103476,
     "percent_invalid": 4.07727,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 23215,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 18215,
     "margin": 5000,
     "valid": 97118,
@@ -6066,6 +7077,7 @@ const CONST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 204,
     "province_thai": "นครศรีธรรมราช",
     "province_eng": "NAKHON SI THAMMARAT",
     "prov_id": "NST",
@@ -6074,8 +7086,10 @@ const CONST_RAW = [
     "turn_out": 91015,
     "percent_invalid": 2.55782,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 20334,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 18875,
     "margin": 1459,
     "valid": 85937,
@@ -6084,6 +7098,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 205,
     "province_thai": "นครศรีธรรมราช",
     "province_eng": "NAKHON SI THAMMARAT",
     "prov_id": "NST",
@@ -6092,8 +7107,10 @@ const CONST_RAW = [
     "turn_out": 98651,
     "percent_invalid": 3.70093,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 31617,
     "runnerup_party": "พลังประชารัฐ",
+    "runnerup_pid": 38,
     "runnerup_votes": 19718,
     "margin": 11899,
     "valid": 91267,
@@ -6102,6 +7119,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 206,
     "province_thai": "นครศรีธรรมราช",
     "province_eng": "NAKHON SI THAMMARAT",
     "prov_id": "NST",
@@ -6110,8 +7128,10 @@ const CONST_RAW = [
     "turn_out": 94474,
     "percent_invalid": 3.21676,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 31827,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 21277,
     "margin": 10550,
     "valid": 89740,
@@ -6120,6 +7140,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 207,
     "province_thai": "นครศรีธรรมราช",
     "province_eng": "NAKHON SI THAMMARAT",
     "prov_id": "NST",
@@ -6128,8 +7149,10 @@ const CONST_RAW = [
     "turn_out": 93949,
     "percent_invalid": 4.39068,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 22394,
     "runnerup_party": "ชาติพัฒนากล้า",
+    "runnerup_pid": 4,
     "runnerup_votes": 18196,
     "margin": 4198,
     "valid": 85540,
@@ -6138,6 +7161,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 208,
     "province_thai": "นครศรีธรรมราช",
     "province_eng": "NAKHON SI THAMMARAT",
     "prov_id": "NST",
@@ -6146,8 +7170,10 @@ const CONST_RAW = [
     "turn_out": 94919,
     "percent_invalid": 2.94672,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 48403,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 23827,
     "margin": 24576,
     "valid": 89576,
@@ -6156,6 +7182,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 209,
     "province_thai": "นครศรีธรรมราช",
     "province_eng": "NAKHON SI THAMMARAT",
     "prov_id": "NST",
@@ -6164,8 +7191,10 @@ const CONST_RAW = [
     "turn_out": 85160,
     "percent_invalid": 2.68201,
     "winner_party": "พลังประชารัฐ",
+    "winner_pid": 38,
     "winner_votes": 26285,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 22314,
     "margin": 3971,
     "valid": 80408,
@@ -6174,6 +7203,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 210,
     "province_thai": "นครศรีธรรมราช",
     "province_eng": "NAKHON SI THAMMARAT",
     "prov_id": "NST",
@@ -6182,8 +7212,10 @@ const CONST_RAW = [
     "turn_out": 90304,
     "percent_invalid": 2.94118,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 27943,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 20842,
     "margin": 7101,
     "valid": 84747,
@@ -6192,6 +7224,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 211,
     "province_thai": "นครศรีธรรมราช",
     "province_eng": "NAKHON SI THAMMARAT",
     "prov_id": "NST",
@@ -6200,8 +7233,10 @@ const CONST_RAW = [
     "turn_out": 90014,
     "percent_invalid": 3.575,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 23393,
     "runnerup_party": "พลังประชารัฐ",
+    "runnerup_pid": 38,
     "runnerup_votes": 17448,
     "margin": 5945,
     "valid": 82858,
@@ -6210,6 +7245,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 212,
     "province_thai": "นครศรีธรรมราช",
     "province_eng": "NAKHON SI THAMMARAT",
     "prov_id": "NST",
@@ -6218,8 +7254,10 @@ const CONST_RAW = [
     "turn_out": 90381,
     "percent_invalid": 3.40116,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 35976,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 26523,
     "margin": 9453,
     "valid": 85254,
@@ -6228,6 +7266,7 @@ const CONST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 101,
     "province_thai": "กระบี่",
     "province_eng": "KRABI",
     "prov_id": "KBI",
@@ -6236,8 +7275,10 @@ const CONST_RAW = [
     "turn_out": 102097,
     "percent_invalid": 3.44868,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 39520,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 30877,
     "margin": 8643,
     "valid": 96391,
@@ -6246,6 +7287,7 @@ const CONST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 102,
     "province_thai": "กระบี่",
     "province_eng": "KRABI",
     "prov_id": "KBI",
@@ -6254,8 +7296,10 @@ const CONST_RAW = [
     "turn_out": 93287,
     "percent_invalid": 3.78617,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 44378,
     "runnerup_party": "พลังประชารัฐ",
+    "runnerup_pid": 38,
     "runnerup_votes": 13903,
     "margin": 30475,
     "valid": 87158,
@@ -6264,6 +7308,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 103,
     "province_thai": "กระบี่",
     "province_eng": "KRABI",
     "prov_id": "KBI",
@@ -6272,8 +7317,10 @@ const CONST_RAW = [
     "turn_out": 99453,
     "percent_invalid": 3.56148,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 52499,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 25484,
     "margin": 27015,
     "valid": 94001,
@@ -6282,6 +7329,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 241,
     "province_thai": "พังงา",
     "province_eng": "PHANGNGA",
     "prov_id": "PNA",
@@ -6290,8 +7338,10 @@ const CONST_RAW = [
     "turn_out": 77533,
     "percent_invalid": 3.08643,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 34457,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 15850,
     "margin": 18607,
     "valid": 72616,
@@ -6300,6 +7350,7 @@ const CONST_RAW = [
     "ballot_surplus": -2
   },
   {
+    "cid": 242,
     "province_thai": "พังงา",
     "province_eng": "PHANGNGA",
     "prov_id": "PNA",
@@ -6308,8 +7359,10 @@ const CONST_RAW = [
     "turn_out": 84059,
     "percent_invalid": 4.1459,
     "winner_party": "พลังประชารัฐ",
+    "winner_pid": 38,
     "winner_votes": 21506,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 21397,
     "margin": 109,
     "valid": 75493,
@@ -6318,6 +7371,7 @@ const CONST_RAW = [
     "ballot_surplus": -2
   },
   {
+    "cid": 230,
     "province_thai": "ภูเก็ต",
     "province_eng": "PHUKET",
     "prov_id": "PKT",
@@ -6326,8 +7380,10 @@ const CONST_RAW = [
     "turn_out": 76178,
     "percent_invalid": 2.62018,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 21252,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 16483,
     "margin": 4769,
     "valid": 70733,
@@ -6336,6 +7392,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 231,
     "province_thai": "ภูเก็ต",
     "province_eng": "PHUKET",
     "prov_id": "PKT",
@@ -6344,8 +7401,10 @@ const CONST_RAW = [
     "turn_out": 75074,
     "percent_invalid": 2.81456,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 21913,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 14967,
     "margin": 6946,
     "valid": 70176,
@@ -6354,6 +7413,7 @@ const CONST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 232,
     "province_thai": "ภูเก็ต",
     "province_eng": "PHUKET",
     "prov_id": "PKT",
@@ -6362,8 +7422,10 @@ const CONST_RAW = [
     "turn_out": 83826,
     "percent_invalid": 2.89051,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 20421,
     "runnerup_party": "ชาติพัฒนากล้า",
+    "runnerup_pid": 4,
     "runnerup_votes": 16469,
     "margin": 3952,
     "valid": 78282,
@@ -6372,6 +7434,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 306,
     "province_thai": "สุราษฎร์ธานี",
     "province_eng": "SURAT THANI",
     "prov_id": "SNI",
@@ -6380,8 +7443,10 @@ const CONST_RAW = [
     "turn_out": 88545,
     "percent_invalid": 2.13903,
     "winner_party": "รวมไทยสร้างชาติ",
+    "winner_pid": 50,
     "winner_votes": 27978,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 23031,
     "margin": 4947,
     "valid": 82701,
@@ -6390,6 +7455,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 307,
     "province_thai": "สุราษฎร์ธานี",
     "province_eng": "SURAT THANI",
     "prov_id": "SNI",
@@ -6398,8 +7464,10 @@ const CONST_RAW = [
     "turn_out": 84772,
     "percent_invalid": 3.09182,
     "winner_party": "รวมไทยสร้างชาติ",
+    "winner_pid": 50,
     "winner_votes": 24625,
     "runnerup_party": "พลังประชารัฐ",
+    "runnerup_pid": 38,
     "runnerup_votes": 21378,
     "margin": 3247,
     "valid": 80009,
@@ -6408,6 +7476,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 308,
     "province_thai": "สุราษฎร์ธานี",
     "province_eng": "SURAT THANI",
     "prov_id": "SNI",
@@ -6416,8 +7485,10 @@ const CONST_RAW = [
     "turn_out": 92608,
     "percent_invalid": 3.34204,
     "winner_party": "รวมไทยสร้างชาติ",
+    "winner_pid": 50,
     "winner_votes": 46456,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 17783,
     "margin": 28673,
     "valid": 86371,
@@ -6426,6 +7497,7 @@ const CONST_RAW = [
     "ballot_surplus": 2
   },
   {
+    "cid": 309,
     "province_thai": "สุราษฎร์ธานี",
     "province_eng": "SURAT THANI",
     "prov_id": "SNI",
@@ -6434,8 +7506,10 @@ const CONST_RAW = [
     "turn_out": 89546,
     "percent_invalid": 2.6746,
     "winner_party": "รวมไทยสร้างชาติ",
+    "winner_pid": 50,
     "winner_votes": 26043,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 21836,
     "margin": 4207,
     "valid": 81814,
@@ -6444,6 +7518,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 310,
     "province_thai": "สุราษฎร์ธานี",
     "province_eng": "SURAT THANI",
     "prov_id": "SNI",
@@ -6452,8 +7527,10 @@ const CONST_RAW = [
     "turn_out": 86830,
     "percent_invalid": 3.73719,
     "winner_party": "รวมไทยสร้างชาติ",
+    "winner_pid": 50,
     "winner_votes": 25520,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 19854,
     "margin": 5666,
     "valid": 79136,
@@ -6462,6 +7539,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 311,
     "province_thai": "สุราษฎร์ธานี",
     "province_eng": "SURAT THANI",
     "prov_id": "SNI",
@@ -6470,8 +7548,10 @@ const CONST_RAW = [
     "turn_out": 96741,
     "percent_invalid": 3.23441,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 43112,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 26801,
     "margin": 16311,
     "valid": 90991,
@@ -6480,6 +7560,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 312,
     "province_thai": "สุราษฎร์ธานี",
     "province_eng": "SURAT THANI",
     "prov_id": "SNI",
@@ -6488,8 +7569,10 @@ const CONST_RAW = [
     "turn_out": 90881,
     "percent_invalid": 2.62761,
     "winner_party": "รวมไทยสร้างชาติ",
+    "winner_pid": 50,
     "winner_votes": 30359,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 20219,
     "margin": 10140,
     "valid": 83524,
@@ -6498,6 +7581,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 283,
     "province_thai": "ระนอง",
     "province_eng": "RANONG",
     "prov_id": "RNG",
@@ -6506,8 +7590,10 @@ const CONST_RAW = [
     "turn_out": 105944,
     "percent_invalid": 3.79351,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 44717,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 22853,
     "margin": 21864,
     "valid": 99407,
@@ -6516,6 +7602,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 88,
     "province_thai": "ชุมพร",
     "province_eng": "CHUMPHON",
     "prov_id": "CPN",
@@ -6524,8 +7611,10 @@ const CONST_RAW = [
     "turn_out": 108261,
     "percent_invalid": 2.26305,
     "winner_party": "รวมไทยสร้างชาติ",
+    "winner_pid": 50,
     "winner_votes": 36222,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 32084,
     "margin": 4138,
     "valid": 102510,
@@ -6534,6 +7623,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 89,
     "province_thai": "ชุมพร",
     "province_eng": "CHUMPHON",
     "prov_id": "CPN",
@@ -6542,8 +7632,10 @@ const CONST_RAW = [
     "turn_out": 108613,
     "percent_invalid": 3.18931,
     "winner_party": "รวมไทยสร้างชาติ",
+    "winner_pid": 50,
     "winner_votes": 32501,
     "runnerup_party": "พลังประชารัฐ",
+    "runnerup_pid": 38,
     "runnerup_votes": 25231,
     "margin": 7270,
     "valid": 101760,
@@ -6552,6 +7644,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 90,
     "province_thai": "ชุมพร",
     "province_eng": "CHUMPHON",
     "prov_id": "CPN",
@@ -6560,8 +7653,10 @@ const CONST_RAW = [
     "turn_out": 101559,
     "percent_invalid": 3.60382,
     "winner_party": "รวมไทยสร้างชาติ",
+    "winner_pid": 50,
     "winner_votes": 41231,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 27414,
     "margin": 13817,
     "valid": 94678,
@@ -6570,6 +7665,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 290,
     "province_thai": "สงขลา",
     "province_eng": "SONGKHLA",
     "prov_id": "SKA",
@@ -6578,8 +7674,10 @@ const CONST_RAW = [
     "turn_out": 102285,
     "percent_invalid": 2.73452,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 40521,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 19112,
     "margin": 21409,
     "valid": 95993,
@@ -6588,6 +7686,7 @@ const CONST_RAW = [
     "ballot_surplus": 2
   },
   {
+    "cid": 291,
     "province_thai": "สงขลา",
     "province_eng": "SONGKHLA",
     "prov_id": "SKA",
@@ -6596,8 +7695,10 @@ const CONST_RAW = [
     "turn_out": 86476,
     "percent_invalid": 2.36713,
     "winner_party": "รวมไทยสร้างชาติ",
+    "winner_pid": 50,
     "winner_votes": 20553,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 20385,
     "margin": 168,
     "valid": 82316,
@@ -6606,6 +7707,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 292,
     "province_thai": "สงขลา",
     "province_eng": "SONGKHLA",
     "prov_id": "SKA",
@@ -6614,8 +7716,10 @@ const CONST_RAW = [
     "turn_out": 107756,
     "percent_invalid": 2.91492,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 39577,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 20703,
     "margin": 18874,
     "valid": 101092,
@@ -6624,6 +7728,7 @@ const CONST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 293,
     "province_thai": "สงขลา",
     "province_eng": "SONGKHLA",
     "prov_id": "SKA",
@@ -6632,8 +7737,10 @@ const CONST_RAW = [
     "turn_out": 102834,
     "percent_invalid": 3.88101,
     "winner_party": "พลังประชารัฐ",
+    "winner_pid": 38,
     "winner_votes": 35289,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 34036,
     "margin": 1253,
     "valid": 96619,
@@ -6642,6 +7749,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 294,
     "province_thai": "สงขลา",
     "province_eng": "SONGKHLA",
     "prov_id": "SKA",
@@ -6650,8 +7758,10 @@ const CONST_RAW = [
     "turn_out": 103190,
     "percent_invalid": 5.03343,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 54343,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 14230,
     "margin": 40113,
     "valid": 92196,
@@ -6660,6 +7770,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 295,
     "province_thai": "สงขลา",
     "province_eng": "SONGKHLA",
     "prov_id": "SKA",
@@ -6668,8 +7779,10 @@ const CONST_RAW = [
     "turn_out": 92676,
     "percent_invalid": 3.24032,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 34835,
     "runnerup_party": "พลังประชารัฐ",
+    "runnerup_pid": 38,
     "runnerup_votes": 33648,
     "margin": 1187,
     "valid": 87971,
@@ -6678,6 +7791,7 @@ const CONST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 296,
     "province_thai": "สงขลา",
     "province_eng": "SONGKHLA",
     "prov_id": "SKA",
@@ -6686,8 +7800,10 @@ const CONST_RAW = [
     "turn_out": 99374,
     "percent_invalid": 5.33741,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 31926,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 28723,
     "margin": 3203,
     "valid": 90326,
@@ -6696,6 +7812,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 297,
     "province_thai": "สงขลา",
     "province_eng": "SONGKHLA",
     "prov_id": "SKA",
@@ -6704,8 +7821,10 @@ const CONST_RAW = [
     "turn_out": 97417,
     "percent_invalid": 4.04652,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 42932,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 25375,
     "margin": 17557,
     "valid": 90444,
@@ -6714,6 +7833,7 @@ const CONST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 298,
     "province_thai": "สงขลา",
     "province_eng": "SONGKHLA",
     "prov_id": "SKA",
@@ -6722,8 +7842,10 @@ const CONST_RAW = [
     "turn_out": 107213,
     "percent_invalid": 2.63401,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 38200,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 26865,
     "margin": 11335,
     "valid": 100430,
@@ -6732,6 +7854,7 @@ const CONST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 358,
     "province_thai": "สตูล",
     "province_eng": "SATUN",
     "prov_id": "STN",
@@ -6740,8 +7863,10 @@ const CONST_RAW = [
     "turn_out": 88647,
     "percent_invalid": 3.96517,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 36810,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 13687,
     "margin": 23123,
     "valid": 81297,
@@ -6750,6 +7875,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 359,
     "province_thai": "สตูล",
     "province_eng": "SATUN",
     "prov_id": "STN",
@@ -6758,8 +7884,10 @@ const CONST_RAW = [
     "turn_out": 105508,
     "percent_invalid": 3.27937,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 55621,
     "runnerup_party": "พลังประชารัฐ",
+    "runnerup_pid": 38,
     "runnerup_votes": 19957,
     "margin": 35664,
     "valid": 99761,
@@ -6768,6 +7896,7 @@ const CONST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 363,
     "province_thai": "ตรัง",
     "province_eng": "TRANG",
     "prov_id": "TRG",
@@ -6776,8 +7905,10 @@ const CONST_RAW = [
     "turn_out": 102067,
     "percent_invalid": 2.09372,
     "winner_party": "รวมไทยสร้างชาติ",
+    "winner_pid": 50,
     "winner_votes": 25965,
     "runnerup_party": "พลังประชารัฐ",
+    "runnerup_pid": 38,
     "runnerup_votes": 21018,
     "margin": 4947,
     "valid": 96244,
@@ -6786,6 +7917,7 @@ const CONST_RAW = [
     "ballot_surplus": -23
   },
   {
+    "cid": 364,
     "province_thai": "ตรัง",
     "province_eng": "TRANG",
     "prov_id": "TRG",
@@ -6794,8 +7926,10 @@ const CONST_RAW = [
     "turn_out": 104800,
     "percent_invalid": 2.98282,
     "winner_party": "พลังประชารัฐ",
+    "winner_pid": 38,
     "winner_votes": 63185,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 17239,
     "margin": 45946,
     "valid": 98665,
@@ -6804,6 +7938,7 @@ const CONST_RAW = [
     "ballot_surplus": -3
   },
   {
+    "cid": 365,
     "province_thai": "ตรัง",
     "province_eng": "TRANG",
     "prov_id": "TRG",
@@ -6812,8 +7947,10 @@ const CONST_RAW = [
     "turn_out": 95612,
     "percent_invalid": 3.37092,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 31846,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 16483,
     "margin": 15363,
     "valid": 85914,
@@ -6822,6 +7959,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 366,
     "province_thai": "ตรัง",
     "province_eng": "TRANG",
     "prov_id": "TRG",
@@ -6830,8 +7968,10 @@ const CONST_RAW = [
     "turn_out": 101994,
     "percent_invalid": 2.72467,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 29594,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 29202,
     "margin": 392,
     "valid": 96660,
@@ -6840,6 +7980,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 233,
     "province_thai": "พัทลุง",
     "province_eng": "PHATTHALUNG",
     "prov_id": "PLG",
@@ -6848,8 +7989,10 @@ const CONST_RAW = [
     "turn_out": 113907,
     "percent_invalid": 2.84443,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 49471,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 38132,
     "margin": 11339,
     "valid": 108573,
@@ -6858,6 +8001,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 234,
     "province_thai": "พัทลุง",
     "province_eng": "PHATTHALUNG",
     "prov_id": "PLG",
@@ -6866,8 +8010,10 @@ const CONST_RAW = [
     "turn_out": 122339,
     "percent_invalid": 2.9451,
     "winner_party": "รวมไทยสร้างชาติ",
+    "winner_pid": 50,
     "winner_votes": 41201,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 39581,
     "margin": 1620,
     "valid": 116434,
@@ -6876,6 +8022,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 235,
     "province_thai": "พัทลุง",
     "province_eng": "PHATTHALUNG",
     "prov_id": "PLG",
@@ -6884,8 +8031,10 @@ const CONST_RAW = [
     "turn_out": 116331,
     "percent_invalid": 4.40983,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 47848,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 31165,
     "margin": 16683,
     "valid": 106699,
@@ -6894,6 +8043,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 262,
     "province_thai": "ปัตตานี",
     "province_eng": "PATTANI",
     "prov_id": "PTN",
@@ -6902,8 +8052,10 @@ const CONST_RAW = [
     "turn_out": 75246,
     "percent_invalid": 3.07923,
     "winner_party": "ประชาชาติ",
+    "winner_pid": 35,
     "winner_votes": 14452,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 12770,
     "margin": 1682,
     "valid": 70318,
@@ -6912,6 +8064,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 263,
     "province_thai": "ปัตตานี",
     "province_eng": "PATTANI",
     "prov_id": "PTN",
@@ -6920,8 +8073,10 @@ const CONST_RAW = [
     "turn_out": 84368,
     "percent_invalid": 3.38873,
     "winner_party": "พลังประชารัฐ",
+    "winner_pid": 38,
     "winner_votes": 23483,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 14833,
     "margin": 8650,
     "valid": 79936,
@@ -6930,6 +8085,7 @@ const CONST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 264,
     "province_thai": "ปัตตานี",
     "province_eng": "PATTANI",
     "prov_id": "PTN",
@@ -6938,8 +8094,10 @@ const CONST_RAW = [
     "turn_out": 71581,
     "percent_invalid": 3.78313,
     "winner_party": "ประชาชาติ",
+    "winner_pid": 35,
     "winner_votes": 23636,
     "runnerup_party": "พลังประชารัฐ",
+    "runnerup_pid": 38,
     "runnerup_votes": 20294,
     "margin": 3342,
     "valid": 67707,
@@ -6948,6 +8106,7 @@ const CONST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 265,
     "province_thai": "ปัตตานี",
     "province_eng": "PATTANI",
     "prov_id": "PTN",
@@ -6956,8 +8115,10 @@ const CONST_RAW = [
     "turn_out": 83889,
     "percent_invalid": 3.06357,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 21556,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 19360,
     "margin": 2196,
     "valid": 80181,
@@ -6966,6 +8127,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 266,
     "province_thai": "ปัตตานี",
     "province_eng": "PATTANI",
     "prov_id": "PTN",
@@ -6974,8 +8136,10 @@ const CONST_RAW = [
     "turn_out": 78884,
     "percent_invalid": 4.13645,
     "winner_party": "ประชาชาติ",
+    "winner_pid": 35,
     "winner_votes": 37068,
     "runnerup_party": "พลังประชารัฐ",
+    "runnerup_pid": 38,
     "runnerup_votes": 26544,
     "margin": 10524,
     "valid": 74495,
@@ -6984,6 +8148,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 394,
     "province_thai": "ยะลา",
     "province_eng": "YALA",
     "prov_id": "YLA",
@@ -6992,8 +8157,10 @@ const CONST_RAW = [
     "turn_out": 99228,
     "percent_invalid": 3.64111,
     "winner_party": "ประชาชาติ",
+    "winner_pid": 35,
     "winner_votes": 23682,
     "runnerup_party": "พลังประชารัฐ",
+    "runnerup_pid": 38,
     "runnerup_votes": 20451,
     "margin": 3231,
     "valid": 91672,
@@ -7002,6 +8169,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 395,
     "province_thai": "ยะลา",
     "province_eng": "YALA",
     "prov_id": "YLA",
@@ -7010,8 +8178,10 @@ const CONST_RAW = [
     "turn_out": 100319,
     "percent_invalid": 4.26041,
     "winner_party": "ประชาชาติ",
+    "winner_pid": 35,
     "winner_votes": 51946,
     "runnerup_party": "พลังประชารัฐ",
+    "runnerup_pid": 38,
     "runnerup_votes": 24611,
     "margin": 27335,
     "valid": 93349,
@@ -7020,6 +8190,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 396,
     "province_thai": "ยะลา",
     "province_eng": "YALA",
     "prov_id": "YLA",
@@ -7028,8 +8199,10 @@ const CONST_RAW = [
     "turn_out": 97956,
     "percent_invalid": 4.31724,
     "winner_party": "ประชาชาติ",
+    "winner_pid": 35,
     "winner_votes": 31741,
     "runnerup_party": "พลังประชารัฐ",
+    "runnerup_pid": 38,
     "runnerup_votes": 24885,
     "margin": 6856,
     "valid": 90913,
@@ -7038,6 +8211,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 214,
     "province_thai": "นราธิวาส",
     "province_eng": "NARATHIWAT",
     "prov_id": "NWT",
@@ -7046,8 +8220,10 @@ const CONST_RAW = [
     "turn_out": 98791,
     "percent_invalid": 6.39734,
     "winner_party": "รวมไทยสร้างชาติ",
+    "winner_pid": 50,
     "winner_votes": 29006,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 26370,
     "margin": 2636,
     "valid": 90225,
@@ -7056,6 +8232,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 215,
     "province_thai": "นราธิวาส",
     "province_eng": "NARATHIWAT",
     "prov_id": "NWT",
@@ -7064,8 +8241,10 @@ const CONST_RAW = [
     "turn_out": 81596,
     "percent_invalid": 6.50154,
     "winner_party": "พลังประชารัฐ",
+    "winner_pid": 38,
     "winner_votes": 31289,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 17447,
     "margin": 13842,
     "valid": 74188,
@@ -7074,6 +8253,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 216,
     "province_thai": "นราธิวาส",
     "province_eng": "NARATHIWAT",
     "prov_id": "NWT",
@@ -7082,8 +8262,10 @@ const CONST_RAW = [
     "turn_out": 80412,
     "percent_invalid": 8.42909,
     "winner_party": "พลังประชารัฐ",
+    "winner_pid": 38,
     "winner_votes": 34411,
     "runnerup_party": "ประชาชาติ",
+    "runnerup_pid": 35,
     "runnerup_votes": 29951,
     "margin": 4460,
     "valid": 72022,
@@ -7092,6 +8274,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 217,
     "province_thai": "นราธิวาส",
     "province_eng": "NARATHIWAT",
     "prov_id": "NWT",
@@ -7100,8 +8283,10 @@ const CONST_RAW = [
     "turn_out": 85575,
     "percent_invalid": 7.21823,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 30966,
     "runnerup_party": "ประชาชาติ",
+    "runnerup_pid": 35,
     "runnerup_votes": 27166,
     "margin": 3800,
     "valid": 78257,
@@ -7110,6 +8295,7 @@ const CONST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 218,
     "province_thai": "นราธิวาส",
     "province_eng": "NARATHIWAT",
     "prov_id": "NWT",
@@ -7118,8 +8304,10 @@ const CONST_RAW = [
     "turn_out": 95803,
     "percent_invalid": 6.80354,
     "winner_party": "ประชาชาติ",
+    "winner_pid": 35,
     "winner_votes": 31457,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 21909,
     "margin": 9548,
     "valid": 88486,
@@ -7131,6 +8319,7 @@ const CONST_RAW = [
 
 const PARTYLIST_RAW = [
   {
+    "cid": 9,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7139,8 +8328,10 @@ const PARTYLIST_RAW = [
     "turn_out": 94406,
     "percent_invalid": 1.52956,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 41177,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 23999,
     "margin": 17178,
     "valid": 91090,
@@ -7149,6 +8340,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -36
   },
   {
+    "cid": 18,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7157,8 +8349,10 @@ const PARTYLIST_RAW = [
     "turn_out": 104102,
     "percent_invalid": 1.44858,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 50659,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 19661,
     "margin": 30998,
     "valid": 101089,
@@ -7167,6 +8361,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 19,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7175,8 +8370,10 @@ const PARTYLIST_RAW = [
     "turn_out": 102611,
     "percent_invalid": 1.27764,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 49810,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 21929,
     "margin": 27881,
     "valid": 99961,
@@ -7185,6 +8382,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 2
   },
   {
+    "cid": 20,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7193,8 +8391,10 @@ const PARTYLIST_RAW = [
     "turn_out": 106410,
     "percent_invalid": 1.20383,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 52394,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 20565,
     "margin": 31829,
     "valid": 103557,
@@ -7203,6 +8403,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 21,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7211,8 +8412,10 @@ const PARTYLIST_RAW = [
     "turn_out": 100382,
     "percent_invalid": 0.99719,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 48193,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 21001,
     "margin": 27192,
     "valid": 97835,
@@ -7221,6 +8424,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 22,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7229,8 +8433,10 @@ const PARTYLIST_RAW = [
     "turn_out": 101871,
     "percent_invalid": 1.1544,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 48195,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 22951,
     "margin": 25244,
     "valid": 99080,
@@ -7239,6 +8445,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 24,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7247,8 +8454,10 @@ const PARTYLIST_RAW = [
     "turn_out": 101785,
     "percent_invalid": 1.02962,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 53654,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 20069,
     "margin": 33585,
     "valid": 99423,
@@ -7257,6 +8466,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 25,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7265,8 +8475,10 @@ const PARTYLIST_RAW = [
     "turn_out": 85830,
     "percent_invalid": 2.25329,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 40088,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 18276,
     "margin": 21812,
     "valid": 82499,
@@ -7275,6 +8487,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 26,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7283,8 +8496,10 @@ const PARTYLIST_RAW = [
     "turn_out": 89624,
     "percent_invalid": 1.93921,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 43974,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 17307,
     "margin": 26667,
     "valid": 86516,
@@ -7293,6 +8508,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -2
   },
   {
+    "cid": 27,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7301,8 +8517,10 @@ const PARTYLIST_RAW = [
     "turn_out": 101228,
     "percent_invalid": 1.09653,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 49445,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 20140,
     "margin": 29305,
     "valid": 98590,
@@ -7311,6 +8529,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 10,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7319,8 +8538,10 @@ const PARTYLIST_RAW = [
     "turn_out": 96992,
     "percent_invalid": 1.6125,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 44807,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 22902,
     "margin": 21905,
     "valid": 93546,
@@ -7329,6 +8550,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 28,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7337,8 +8559,10 @@ const PARTYLIST_RAW = [
     "turn_out": 90260,
     "percent_invalid": 1.55661,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 46160,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 21619,
     "margin": 24541,
     "valid": 87736,
@@ -7347,6 +8571,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 2
   },
   {
+    "cid": 29,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7355,8 +8580,10 @@ const PARTYLIST_RAW = [
     "turn_out": 99180,
     "percent_invalid": 1.33293,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 51303,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 17785,
     "margin": 33518,
     "valid": 96321,
@@ -7365,6 +8592,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 30,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7373,8 +8601,10 @@ const PARTYLIST_RAW = [
     "turn_out": 97065,
     "percent_invalid": 1.37125,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 47266,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 20371,
     "margin": 26895,
     "valid": 94010,
@@ -7383,6 +8613,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 31,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7391,8 +8622,10 @@ const PARTYLIST_RAW = [
     "turn_out": 105969,
     "percent_invalid": 1.29944,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 52093,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 21846,
     "margin": 30247,
     "valid": 102901,
@@ -7401,6 +8634,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 32,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7409,8 +8643,10 @@ const PARTYLIST_RAW = [
     "turn_out": 103081,
     "percent_invalid": 1.63755,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 50055,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 20879,
     "margin": 29176,
     "valid": 99535,
@@ -7419,6 +8655,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -2
   },
   {
+    "cid": 33,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7427,8 +8664,10 @@ const PARTYLIST_RAW = [
     "turn_out": 92943,
     "percent_invalid": 1.5601,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 46200,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 17558,
     "margin": 28642,
     "valid": 90009,
@@ -7437,6 +8676,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 34,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7445,8 +8685,10 @@ const PARTYLIST_RAW = [
     "turn_out": 101310,
     "percent_invalid": 1.55266,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 52667,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 18054,
     "margin": 34613,
     "valid": 98262,
@@ -7455,6 +8697,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 35,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7463,8 +8706,10 @@ const PARTYLIST_RAW = [
     "turn_out": 101144,
     "percent_invalid": 1.39504,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 54268,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 19089,
     "margin": 35179,
     "valid": 98462,
@@ -7473,6 +8718,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 36,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7481,8 +8727,10 @@ const PARTYLIST_RAW = [
     "turn_out": 105488,
     "percent_invalid": 1.56511,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 53314,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 22118,
     "margin": 31196,
     "valid": 102415,
@@ -7491,6 +8739,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 37,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7499,8 +8748,10 @@ const PARTYLIST_RAW = [
     "turn_out": 108688,
     "percent_invalid": 1.66992,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 52825,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 22360,
     "margin": 30465,
     "valid": 105148,
@@ -7509,6 +8760,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 11,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7517,8 +8769,10 @@ const PARTYLIST_RAW = [
     "turn_out": 88098,
     "percent_invalid": 1.61638,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 40670,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 20537,
     "margin": 20133,
     "valid": 85081,
@@ -7527,6 +8781,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 38,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7535,8 +8790,10 @@ const PARTYLIST_RAW = [
     "turn_out": 104741,
     "percent_invalid": 1.5715,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 53994,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 20319,
     "margin": 33675,
     "valid": 101347,
@@ -7545,6 +8802,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 39,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7553,8 +8811,10 @@ const PARTYLIST_RAW = [
     "turn_out": 110632,
     "percent_invalid": 1.5773,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 50542,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 23292,
     "margin": 27250,
     "valid": 106855,
@@ -7563,6 +8823,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 40,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7571,8 +8832,10 @@ const PARTYLIST_RAW = [
     "turn_out": 101616,
     "percent_invalid": 1.9308,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 47418,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 19937,
     "margin": 27481,
     "valid": 97772,
@@ -7581,6 +8844,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 41,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7589,8 +8853,10 @@ const PARTYLIST_RAW = [
     "turn_out": 109252,
     "percent_invalid": 1.86907,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 48486,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 22457,
     "margin": 26029,
     "valid": 105270,
@@ -7599,6 +8865,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 12,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7607,8 +8874,10 @@ const PARTYLIST_RAW = [
     "turn_out": 89246,
     "percent_invalid": 1.76591,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 40333,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 19956,
     "margin": 20377,
     "valid": 86062,
@@ -7617,6 +8886,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 13,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7625,8 +8895,10 @@ const PARTYLIST_RAW = [
     "turn_out": 99240,
     "percent_invalid": 1.21725,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 48587,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 19476,
     "margin": 29111,
     "valid": 96436,
@@ -7635,6 +8907,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 14,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7643,8 +8916,10 @@ const PARTYLIST_RAW = [
     "turn_out": 108114,
     "percent_invalid": 1.3791,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 50559,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 23899,
     "margin": 26660,
     "valid": 104815,
@@ -7653,6 +8928,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 15,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7661,8 +8937,10 @@ const PARTYLIST_RAW = [
     "turn_out": 99646,
     "percent_invalid": 1.33573,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 46782,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 21483,
     "margin": 25299,
     "valid": 96465,
@@ -7671,6 +8949,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -2
   },
   {
+    "cid": 16,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7679,8 +8958,10 @@ const PARTYLIST_RAW = [
     "turn_out": 108227,
     "percent_invalid": 1.34162,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 48721,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 22752,
     "margin": 25969,
     "valid": 104916,
@@ -7689,6 +8970,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 3
   },
   {
+    "cid": 17,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7697,8 +8979,10 @@ const PARTYLIST_RAW = [
     "turn_out": 107795,
     "percent_invalid": 1.21527,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 51232,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 21360,
     "margin": 29872,
     "valid": 104648,
@@ -7707,6 +8991,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 325,
     "province_thai": "สมุทรปราการ",
     "province_eng": "SAMUT PRAKAN",
     "prov_id": "SPK",
@@ -7715,8 +9000,10 @@ const PARTYLIST_RAW = [
     "turn_out": 100173,
     "percent_invalid": 2.49668,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 51623,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 17283,
     "margin": 34340,
     "valid": 96122,
@@ -7725,6 +9012,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 2
   },
   {
+    "cid": 326,
     "province_thai": "สมุทรปราการ",
     "province_eng": "SAMUT PRAKAN",
     "prov_id": "SPK",
@@ -7733,8 +9021,10 @@ const PARTYLIST_RAW = [
     "turn_out": 99349,
     "percent_invalid": 2.53148,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 53062,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 19986,
     "margin": 33076,
     "valid": 95701,
@@ -7743,6 +9033,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 327,
     "province_thai": "สมุทรปราการ",
     "province_eng": "SAMUT PRAKAN",
     "prov_id": "SPK",
@@ -7751,8 +9042,10 @@ const PARTYLIST_RAW = [
     "turn_out": 106238,
     "percent_invalid": 2.23366,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 54385,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 19063,
     "margin": 35322,
     "valid": 102265,
@@ -7761,6 +9054,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 328,
     "province_thai": "สมุทรปราการ",
     "province_eng": "SAMUT PRAKAN",
     "prov_id": "SPK",
@@ -7769,8 +9063,10 @@ const PARTYLIST_RAW = [
     "turn_out": 101810,
     "percent_invalid": 1.87506,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 55649,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 17478,
     "margin": 38171,
     "valid": 98461,
@@ -7779,6 +9075,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 329,
     "province_thai": "สมุทรปราการ",
     "province_eng": "SAMUT PRAKAN",
     "prov_id": "SPK",
@@ -7787,8 +9084,10 @@ const PARTYLIST_RAW = [
     "turn_out": 119975,
     "percent_invalid": 1.92373,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 66797,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 24356,
     "margin": 42441,
     "valid": 116109,
@@ -7797,6 +9096,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 330,
     "province_thai": "สมุทรปราการ",
     "province_eng": "SAMUT PRAKAN",
     "prov_id": "SPK",
@@ -7805,8 +9105,10 @@ const PARTYLIST_RAW = [
     "turn_out": 102544,
     "percent_invalid": 2.93435,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 48268,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 20769,
     "margin": 27499,
     "valid": 97956,
@@ -7815,6 +9117,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 331,
     "province_thai": "สมุทรปราการ",
     "province_eng": "SAMUT PRAKAN",
     "prov_id": "SPK",
@@ -7823,8 +9126,10 @@ const PARTYLIST_RAW = [
     "turn_out": 113796,
     "percent_invalid": 2.74614,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 57679,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 23955,
     "margin": 33724,
     "valid": 109282,
@@ -7833,6 +9138,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 332,
     "province_thai": "สมุทรปราการ",
     "province_eng": "SAMUT PRAKAN",
     "prov_id": "SPK",
@@ -7841,8 +9147,10 @@ const PARTYLIST_RAW = [
     "turn_out": 113255,
     "percent_invalid": 2.75043,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 60288,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 23591,
     "margin": 36697,
     "valid": 108741,
@@ -7851,6 +9159,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 158,
     "province_thai": "นนทบุรี",
     "province_eng": "NONTHABURI",
     "prov_id": "NBI",
@@ -7859,8 +9168,10 @@ const PARTYLIST_RAW = [
     "turn_out": 107099,
     "percent_invalid": 1.63307,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 49104,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 22643,
     "margin": 26461,
     "valid": 103275,
@@ -7869,6 +9180,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 159,
     "province_thai": "นนทบุรี",
     "province_eng": "NONTHABURI",
     "prov_id": "NBI",
@@ -7877,8 +9189,10 @@ const PARTYLIST_RAW = [
     "turn_out": 95418,
     "percent_invalid": 2.07718,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 43969,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 19090,
     "margin": 24879,
     "valid": 91672,
@@ -7887,6 +9201,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 160,
     "province_thai": "นนทบุรี",
     "province_eng": "NONTHABURI",
     "prov_id": "NBI",
@@ -7895,8 +9210,10 @@ const PARTYLIST_RAW = [
     "turn_out": 106509,
     "percent_invalid": 1.80079,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 51929,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 19490,
     "margin": 32439,
     "valid": 102620,
@@ -7905,6 +9222,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 161,
     "province_thai": "นนทบุรี",
     "province_eng": "NONTHABURI",
     "prov_id": "NBI",
@@ -7913,8 +9231,10 @@ const PARTYLIST_RAW = [
     "turn_out": 96341,
     "percent_invalid": 1.48742,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 43694,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 20184,
     "margin": 23510,
     "valid": 93077,
@@ -7923,6 +9243,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 162,
     "province_thai": "นนทบุรี",
     "province_eng": "NONTHABURI",
     "prov_id": "NBI",
@@ -7931,8 +9252,10 @@ const PARTYLIST_RAW = [
     "turn_out": 101915,
     "percent_invalid": 1.84762,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 48985,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 19936,
     "margin": 29049,
     "valid": 98032,
@@ -7941,6 +9264,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 163,
     "province_thai": "นนทบุรี",
     "province_eng": "NONTHABURI",
     "prov_id": "NBI",
@@ -7949,8 +9273,10 @@ const PARTYLIST_RAW = [
     "turn_out": 107193,
     "percent_invalid": 1.92177,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 52729,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 22719,
     "margin": 30010,
     "valid": 103108,
@@ -7959,6 +9285,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 164,
     "province_thai": "นนทบุรี",
     "province_eng": "NONTHABURI",
     "prov_id": "NBI",
@@ -7967,8 +9294,10 @@ const PARTYLIST_RAW = [
     "turn_out": 105655,
     "percent_invalid": 2.09077,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 51015,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 22545,
     "margin": 28470,
     "valid": 101757,
@@ -7977,6 +9306,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 165,
     "province_thai": "นนทบุรี",
     "province_eng": "NONTHABURI",
     "prov_id": "NBI",
@@ -7985,8 +9315,10 @@ const PARTYLIST_RAW = [
     "turn_out": 103196,
     "percent_invalid": 2.11733,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 47928,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 25074,
     "margin": 22854,
     "valid": 99159,
@@ -7995,6 +9327,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 255,
     "province_thai": "ปทุมธานี",
     "province_eng": "PATHUM THANI",
     "prov_id": "PTE",
@@ -8003,8 +9336,10 @@ const PARTYLIST_RAW = [
     "turn_out": 109016,
     "percent_invalid": 2.84821,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 48694,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 29548,
     "margin": 19146,
     "valid": 104489,
@@ -8013,6 +9348,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 256,
     "province_thai": "ปทุมธานี",
     "province_eng": "PATHUM THANI",
     "prov_id": "PTE",
@@ -8021,8 +9357,10 @@ const PARTYLIST_RAW = [
     "turn_out": 108556,
     "percent_invalid": 1.82763,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 51666,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 28124,
     "margin": 23542,
     "valid": 104931,
@@ -8031,6 +9369,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 257,
     "province_thai": "ปทุมธานี",
     "province_eng": "PATHUM THANI",
     "prov_id": "PTE",
@@ -8039,8 +9378,10 @@ const PARTYLIST_RAW = [
     "turn_out": 99771,
     "percent_invalid": 1.38918,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 53444,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 25416,
     "margin": 28028,
     "valid": 97225,
@@ -8049,6 +9390,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 258,
     "province_thai": "ปทุมธานี",
     "province_eng": "PATHUM THANI",
     "prov_id": "PTE",
@@ -8057,8 +9399,10 @@ const PARTYLIST_RAW = [
     "turn_out": 106181,
     "percent_invalid": 1.97022,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 52756,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 24968,
     "margin": 27788,
     "valid": 102708,
@@ -8067,6 +9411,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 259,
     "province_thai": "ปทุมธานี",
     "province_eng": "PATHUM THANI",
     "prov_id": "PTE",
@@ -8075,8 +9420,10 @@ const PARTYLIST_RAW = [
     "turn_out": 115676,
     "percent_invalid": 2.19492,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 51613,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 35182,
     "margin": 16431,
     "valid": 111706,
@@ -8085,6 +9432,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 260,
     "province_thai": "ปทุมธานี",
     "province_eng": "PATHUM THANI",
     "prov_id": "PTE",
@@ -8093,8 +9441,10 @@ const PARTYLIST_RAW = [
     "turn_out": 112943,
     "percent_invalid": 1.34316,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 56988,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 25606,
     "margin": 31382,
     "valid": 109788,
@@ -8103,6 +9453,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 261,
     "province_thai": "ปทุมธานี",
     "province_eng": "PATHUM THANI",
     "prov_id": "PTE",
@@ -8111,8 +9462,10 @@ const PARTYLIST_RAW = [
     "turn_out": 112659,
     "percent_invalid": 2.55284,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 49469,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 32231,
     "margin": 17238,
     "valid": 108399,
@@ -8121,16 +9474,19 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 400,
     "province_thai": "ปทุมธานี",
     "province_eng": "PATHUM THANI",
     "prov_id": "PTE",
     "cons_no": 8,
     "region": "Central",
     "turn_out": 0,
-    "percent_invalid": 0,
+    "percent_invalid": 0.0,
     "winner_party": "Unknown",
+    "winner_pid": -1,
     "winner_votes": 0,
     "runnerup_party": "Unknown",
+    "runnerup_pid": -1,
     "runnerup_votes": 0,
     "margin": 0,
     "valid": 0,
@@ -8139,6 +9495,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 4,
     "province_thai": "พระนครศรีอยุธยา",
     "province_eng": "PHRA NAKHON SI AYUTTHAYA",
     "prov_id": "AYA",
@@ -8147,8 +9504,10 @@ const PARTYLIST_RAW = [
     "turn_out": 110317,
     "percent_invalid": 3.3023,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 49110,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 23913,
     "margin": 25197,
     "valid": 104364,
@@ -8157,6 +9516,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 5,
     "province_thai": "พระนครศรีอยุธยา",
     "province_eng": "PHRA NAKHON SI AYUTTHAYA",
     "prov_id": "AYA",
@@ -8165,8 +9525,10 @@ const PARTYLIST_RAW = [
     "turn_out": 106945,
     "percent_invalid": 3.8805,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 43759,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 30469,
     "margin": 13290,
     "valid": 101306,
@@ -8175,6 +9537,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 6,
     "province_thai": "พระนครศรีอยุธยา",
     "province_eng": "PHRA NAKHON SI AYUTTHAYA",
     "prov_id": "AYA",
@@ -8183,8 +9546,10 @@ const PARTYLIST_RAW = [
     "turn_out": 107899,
     "percent_invalid": 3.19465,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 50739,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 28872,
     "margin": 21867,
     "valid": 103161,
@@ -8193,6 +9558,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 7,
     "province_thai": "พระนครศรีอยุธยา",
     "province_eng": "PHRA NAKHON SI AYUTTHAYA",
     "prov_id": "AYA",
@@ -8201,8 +9567,10 @@ const PARTYLIST_RAW = [
     "turn_out": 113956,
     "percent_invalid": 2.83969,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 51563,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 32381,
     "margin": 19182,
     "valid": 109476,
@@ -8211,6 +9579,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 8,
     "province_thai": "พระนครศรีอยุธยา",
     "province_eng": "PHRA NAKHON SI AYUTTHAYA",
     "prov_id": "AYA",
@@ -8219,8 +9588,10 @@ const PARTYLIST_RAW = [
     "turn_out": 107231,
     "percent_invalid": 3.9261,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 39118,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 37551,
     "margin": 1567,
     "valid": 101798,
@@ -8229,6 +9600,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 2,
     "province_thai": "อ่างทอง",
     "province_eng": "ANG THONG",
     "prov_id": "ATG",
@@ -8237,8 +9609,10 @@ const PARTYLIST_RAW = [
     "turn_out": 89918,
     "percent_invalid": 3.93581,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 35131,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 26909,
     "margin": 8222,
     "valid": 85071,
@@ -8247,6 +9621,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 3,
     "province_thai": "อ่างทอง",
     "province_eng": "ANG THONG",
     "prov_id": "ATG",
@@ -8255,8 +9630,10 @@ const PARTYLIST_RAW = [
     "turn_out": 91466,
     "percent_invalid": 4.30652,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 32038,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 31427,
     "margin": 611,
     "valid": 86519,
@@ -8265,6 +9642,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 140,
     "province_thai": "ลพบุรี",
     "province_eng": "LOP BURI",
     "prov_id": "LRI",
@@ -8273,8 +9651,10 @@ const PARTYLIST_RAW = [
     "turn_out": 93794,
     "percent_invalid": 3.67934,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 36334,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 25448,
     "margin": 10886,
     "valid": 88316,
@@ -8283,6 +9663,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 141,
     "province_thai": "ลพบุรี",
     "province_eng": "LOP BURI",
     "prov_id": "LRI",
@@ -8291,8 +9672,10 @@ const PARTYLIST_RAW = [
     "turn_out": 95560,
     "percent_invalid": 5.13604,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 38725,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 23918,
     "margin": 14807,
     "valid": 88936,
@@ -8301,6 +9684,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 142,
     "province_thai": "ลพบุรี",
     "province_eng": "LOP BURI",
     "prov_id": "LRI",
@@ -8309,8 +9693,10 @@ const PARTYLIST_RAW = [
     "turn_out": 97574,
     "percent_invalid": 4.87015,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 32518,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 31192,
     "margin": 1326,
     "valid": 91563,
@@ -8319,6 +9705,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 143,
     "province_thai": "ลพบุรี",
     "province_eng": "LOP BURI",
     "prov_id": "LRI",
@@ -8327,8 +9714,10 @@ const PARTYLIST_RAW = [
     "turn_out": 89787,
     "percent_invalid": 6.36172,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 30853,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 28041,
     "margin": 2812,
     "valid": 83045,
@@ -8337,6 +9726,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 289,
     "province_thai": "สิงห์บุรี",
     "province_eng": "SING BURI",
     "prov_id": "SBR",
@@ -8345,8 +9735,10 @@ const PARTYLIST_RAW = [
     "turn_out": 131502,
     "percent_invalid": 5.03719,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 48951,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 36956,
     "margin": 11995,
     "valid": 122720,
@@ -8355,6 +9747,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 79,
     "province_thai": "ชัยนาท",
     "province_eng": "CHAI NAT",
     "prov_id": "CNT",
@@ -8363,8 +9756,10 @@ const PARTYLIST_RAW = [
     "turn_out": 102135,
     "percent_invalid": 4.39614,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 36703,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 24630,
     "margin": 12073,
     "valid": 96040,
@@ -8373,6 +9768,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 80,
     "province_thai": "ชัยนาท",
     "province_eng": "CHAI NAT",
     "prov_id": "CNT",
@@ -8381,8 +9777,10 @@ const PARTYLIST_RAW = [
     "turn_out": 103343,
     "percent_invalid": 5.84171,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 32988,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 29034,
     "margin": 3954,
     "valid": 96196,
@@ -8391,6 +9789,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 333,
     "province_thai": "สระบุรี",
     "province_eng": "SARABURI",
     "prov_id": "SRI",
@@ -8399,8 +9798,10 @@ const PARTYLIST_RAW = [
     "turn_out": 103684,
     "percent_invalid": 3.71224,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 45805,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 23715,
     "margin": 22090,
     "valid": 97920,
@@ -8409,6 +9810,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 334,
     "province_thai": "สระบุรี",
     "province_eng": "SARABURI",
     "prov_id": "SRI",
@@ -8417,8 +9819,10 @@ const PARTYLIST_RAW = [
     "turn_out": 109753,
     "percent_invalid": 4.56024,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 44403,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 30862,
     "margin": 13541,
     "valid": 103359,
@@ -8427,6 +9831,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 335,
     "province_thai": "สระบุรี",
     "province_eng": "SARABURI",
     "prov_id": "SRI",
@@ -8435,8 +9840,10 @@ const PARTYLIST_RAW = [
     "turn_out": 103466,
     "percent_invalid": 4.01968,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 45490,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 24131,
     "margin": 21359,
     "valid": 97841,
@@ -8445,6 +9852,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 336,
     "province_thai": "สระบุรี",
     "province_eng": "SARABURI",
     "prov_id": "SRI",
@@ -8453,8 +9861,10 @@ const PARTYLIST_RAW = [
     "turn_out": 103759,
     "percent_invalid": 4.73983,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 42673,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 28520,
     "margin": 14153,
     "valid": 97217,
@@ -8463,6 +9873,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 55,
     "province_thai": "ชลบุรี",
     "province_eng": "CHON BURI",
     "prov_id": "CBI",
@@ -8471,8 +9882,10 @@ const PARTYLIST_RAW = [
     "turn_out": 104984,
     "percent_invalid": 2.5261,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 46346,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 26724,
     "margin": 19622,
     "valid": 100842,
@@ -8481,6 +9894,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 8
   },
   {
+    "cid": 64,
     "province_thai": "ชลบุรี",
     "province_eng": "CHON BURI",
     "prov_id": "CBI",
@@ -8489,8 +9903,10 @@ const PARTYLIST_RAW = [
     "turn_out": 93252,
     "percent_invalid": 2.4289,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 41190,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 24267,
     "margin": 16923,
     "valid": 88841,
@@ -8499,6 +9915,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 56,
     "province_thai": "ชลบุรี",
     "province_eng": "CHON BURI",
     "prov_id": "CBI",
@@ -8507,8 +9924,10 @@ const PARTYLIST_RAW = [
     "turn_out": 88518,
     "percent_invalid": 2.32495,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 39330,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 23819,
     "margin": 15511,
     "valid": 85234,
@@ -8517,6 +9936,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 57,
     "province_thai": "ชลบุรี",
     "province_eng": "CHON BURI",
     "prov_id": "CBI",
@@ -8525,8 +9945,10 @@ const PARTYLIST_RAW = [
     "turn_out": 98962,
     "percent_invalid": 3.36392,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 46564,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 20484,
     "margin": 26080,
     "valid": 94583,
@@ -8535,6 +9957,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 2
   },
   {
+    "cid": 58,
     "province_thai": "ชลบุรี",
     "province_eng": "CHON BURI",
     "prov_id": "CBI",
@@ -8543,8 +9966,10 @@ const PARTYLIST_RAW = [
     "turn_out": 94167,
     "percent_invalid": 5.14936,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 36843,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 22816,
     "margin": 14027,
     "valid": 88249,
@@ -8553,6 +9978,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 59,
     "province_thai": "ชลบุรี",
     "province_eng": "CHON BURI",
     "prov_id": "CBI",
@@ -8561,8 +9987,10 @@ const PARTYLIST_RAW = [
     "turn_out": 111292,
     "percent_invalid": 4.38935,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 39505,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 26910,
     "margin": 12595,
     "valid": 104933,
@@ -8571,6 +9999,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 60,
     "province_thai": "ชลบุรี",
     "province_eng": "CHON BURI",
     "prov_id": "CBI",
@@ -8579,8 +10008,10 @@ const PARTYLIST_RAW = [
     "turn_out": 101947,
     "percent_invalid": 2.62686,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 49017,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 20800,
     "margin": 28217,
     "valid": 98028,
@@ -8589,6 +10020,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 61,
     "province_thai": "ชลบุรี",
     "province_eng": "CHON BURI",
     "prov_id": "CBI",
@@ -8597,8 +10029,10 @@ const PARTYLIST_RAW = [
     "turn_out": 92544,
     "percent_invalid": 2.29404,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 52304,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 21543,
     "margin": 30761,
     "valid": 89548,
@@ -8607,6 +10041,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 62,
     "province_thai": "ชลบุรี",
     "province_eng": "CHON BURI",
     "prov_id": "CBI",
@@ -8615,8 +10050,10 @@ const PARTYLIST_RAW = [
     "turn_out": 97204,
     "percent_invalid": 3.09041,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 45421,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 26422,
     "margin": 18999,
     "valid": 93133,
@@ -8625,6 +10062,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 63,
     "province_thai": "ชลบุรี",
     "province_eng": "CHON BURI",
     "prov_id": "CBI",
@@ -8633,8 +10071,10 @@ const PARTYLIST_RAW = [
     "turn_out": 76391,
     "percent_invalid": 2.69927,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 38989,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 17016,
     "margin": 21973,
     "valid": 73516,
@@ -8643,6 +10083,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 284,
     "province_thai": "ระยอง",
     "province_eng": "RAYONG",
     "prov_id": "RYG",
@@ -8651,8 +10092,10 @@ const PARTYLIST_RAW = [
     "turn_out": 92473,
     "percent_invalid": 2.45044,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 48836,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 14419,
     "margin": 34417,
     "valid": 88915,
@@ -8661,6 +10104,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 285,
     "province_thai": "ระยอง",
     "province_eng": "RAYONG",
     "prov_id": "RYG",
@@ -8669,8 +10113,10 @@ const PARTYLIST_RAW = [
     "turn_out": 84238,
     "percent_invalid": 3.08056,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 43398,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 12596,
     "margin": 30802,
     "valid": 80177,
@@ -8679,6 +10125,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 286,
     "province_thai": "ระยอง",
     "province_eng": "RAYONG",
     "prov_id": "RYG",
@@ -8687,8 +10134,10 @@ const PARTYLIST_RAW = [
     "turn_out": 95520,
     "percent_invalid": 4.27659,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 43199,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 16380,
     "margin": 26819,
     "valid": 89821,
@@ -8697,6 +10146,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 287,
     "province_thai": "ระยอง",
     "province_eng": "RAYONG",
     "prov_id": "RYG",
@@ -8705,8 +10155,10 @@ const PARTYLIST_RAW = [
     "turn_out": 91835,
     "percent_invalid": 3.15893,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 47615,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 16754,
     "margin": 30861,
     "valid": 87692,
@@ -8715,6 +10167,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 288,
     "province_thai": "ระยอง",
     "province_eng": "RAYONG",
     "prov_id": "RYG",
@@ -8723,8 +10176,10 @@ const PARTYLIST_RAW = [
     "turn_out": 90537,
     "percent_invalid": 2.94907,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 47681,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 17344,
     "margin": 30337,
     "valid": 86789,
@@ -8733,6 +10188,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 98,
     "province_thai": "จันทบุรี",
     "province_eng": "CHANTHABURI",
     "prov_id": "CTI",
@@ -8741,8 +10197,10 @@ const PARTYLIST_RAW = [
     "turn_out": 114252,
     "percent_invalid": 3.36362,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 52013,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 22089,
     "margin": 29924,
     "valid": 107781,
@@ -8751,6 +10209,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 99,
     "province_thai": "จันทบุรี",
     "province_eng": "CHANTHABURI",
     "prov_id": "CTI",
@@ -8759,8 +10218,10 @@ const PARTYLIST_RAW = [
     "turn_out": 107992,
     "percent_invalid": 5.39114,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 44243,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 21714,
     "margin": 22529,
     "valid": 99846,
@@ -8769,6 +10230,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 100,
     "province_thai": "จันทบุรี",
     "province_eng": "CHANTHABURI",
     "prov_id": "CTI",
@@ -8777,8 +10239,10 @@ const PARTYLIST_RAW = [
     "turn_out": 106198,
     "percent_invalid": 5.07919,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 44743,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 23169,
     "margin": 21574,
     "valid": 98921,
@@ -8787,6 +10251,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 367,
     "province_thai": "ตราด",
     "province_eng": "TRAT",
     "prov_id": "TRT",
@@ -8795,8 +10260,10 @@ const PARTYLIST_RAW = [
     "turn_out": 129680,
     "percent_invalid": 4.93523,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 54755,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 22416,
     "margin": 32339,
     "valid": 121333,
@@ -8805,6 +10272,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 65,
     "province_thai": "ฉะเชิงเทรา",
     "province_eng": "CHACHOENGSAO",
     "prov_id": "CCO",
@@ -8813,8 +10281,10 @@ const PARTYLIST_RAW = [
     "turn_out": 122124,
     "percent_invalid": 3.39491,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 49702,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 29200,
     "margin": 20502,
     "valid": 116411,
@@ -8823,6 +10293,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 66,
     "province_thai": "ฉะเชิงเทรา",
     "province_eng": "CHACHOENGSAO",
     "prov_id": "CCO",
@@ -8831,8 +10302,10 @@ const PARTYLIST_RAW = [
     "turn_out": 119212,
     "percent_invalid": 4.49955,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 42084,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 34526,
     "margin": 7558,
     "valid": 112152,
@@ -8841,6 +10314,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 67,
     "province_thai": "ฉะเชิงเทรา",
     "province_eng": "CHACHOENGSAO",
     "prov_id": "CCO",
@@ -8849,8 +10323,10 @@ const PARTYLIST_RAW = [
     "turn_out": 113283,
     "percent_invalid": 5.61779,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 40393,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 40305,
     "margin": 88,
     "valid": 105928,
@@ -8859,6 +10335,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 68,
     "province_thai": "ฉะเชิงเทรา",
     "province_eng": "CHACHOENGSAO",
     "prov_id": "CCO",
@@ -8867,8 +10344,10 @@ const PARTYLIST_RAW = [
     "turn_out": 122386,
     "percent_invalid": 4.08298,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 55774,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 26055,
     "margin": 29719,
     "valid": 116143,
@@ -8877,6 +10356,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 252,
     "province_thai": "ปราจีนบุรี",
     "province_eng": "PRACHIN BURI",
     "prov_id": "PRI",
@@ -8885,8 +10365,10 @@ const PARTYLIST_RAW = [
     "turn_out": 102872,
     "percent_invalid": 4.15662,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 44322,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 22483,
     "margin": 21839,
     "valid": 96647,
@@ -8895,6 +10377,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 254,
     "province_thai": "ปราจีนบุรี",
     "province_eng": "PRACHIN BURI",
     "prov_id": "PRI",
@@ -8903,8 +10386,10 @@ const PARTYLIST_RAW = [
     "turn_out": 101602,
     "percent_invalid": 4.93888,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 44298,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 23136,
     "margin": 21162,
     "valid": 95441,
@@ -8913,6 +10398,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 219,
     "province_thai": "นครนายก",
     "province_eng": "NAKHON NAYOK",
     "prov_id": "NYK",
@@ -8921,8 +10407,10 @@ const PARTYLIST_RAW = [
     "turn_out": 84634,
     "percent_invalid": 4.61753,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 29980,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 21788,
     "margin": 8192,
     "valid": 79334,
@@ -8931,6 +10419,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 220,
     "province_thai": "นครนายก",
     "province_eng": "NAKHON NAYOK",
     "prov_id": "NYK",
@@ -8939,8 +10428,10 @@ const PARTYLIST_RAW = [
     "turn_out": 88973,
     "percent_invalid": 4.73402,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 30895,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 26495,
     "margin": 4400,
     "valid": 83728,
@@ -8949,6 +10440,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 303,
     "province_thai": "สระแก้ว",
     "province_eng": "SA KAEO",
     "prov_id": "SKW",
@@ -8957,8 +10449,10 @@ const PARTYLIST_RAW = [
     "turn_out": 107883,
     "percent_invalid": 4.9702,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 42802,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 25120,
     "margin": 17682,
     "valid": 101418,
@@ -8967,6 +10461,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 304,
     "province_thai": "สระแก้ว",
     "province_eng": "SA KAEO",
     "prov_id": "SKW",
@@ -8975,8 +10470,10 @@ const PARTYLIST_RAW = [
     "turn_out": 103003,
     "percent_invalid": 4.4688,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 41414,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 27716,
     "margin": 13698,
     "valid": 97339,
@@ -8985,6 +10482,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 305,
     "province_thai": "สระแก้ว",
     "province_eng": "SA KAEO",
     "prov_id": "SKW",
@@ -8993,8 +10491,10 @@ const PARTYLIST_RAW = [
     "turn_out": 110160,
     "percent_invalid": 4.56972,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 40687,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 34205,
     "margin": 6482,
     "valid": 103875,
@@ -9003,6 +10503,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 172,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -9011,8 +10512,10 @@ const PARTYLIST_RAW = [
     "turn_out": 100575,
     "percent_invalid": 2.84166,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 43070,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 14455,
     "margin": 28615,
     "valid": 95753,
@@ -9021,6 +10524,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 181,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -9029,8 +10533,10 @@ const PARTYLIST_RAW = [
     "turn_out": 114700,
     "percent_invalid": 4.98431,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 39761,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 37451,
     "margin": 2310,
     "valid": 107800,
@@ -9039,6 +10545,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 182,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -9047,8 +10554,10 @@ const PARTYLIST_RAW = [
     "turn_out": 102478,
     "percent_invalid": 4.52487,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 49603,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 28804,
     "margin": 20799,
     "valid": 97289,
@@ -9057,6 +10566,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 183,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -9065,8 +10575,10 @@ const PARTYLIST_RAW = [
     "turn_out": 104449,
     "percent_invalid": 4.63767,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 37899,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 34643,
     "margin": 3256,
     "valid": 98628,
@@ -9075,6 +10587,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 184,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -9083,8 +10596,10 @@ const PARTYLIST_RAW = [
     "turn_out": 94218,
     "percent_invalid": 4.53841,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 38950,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 30840,
     "margin": 8110,
     "valid": 89051,
@@ -9093,6 +10608,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 185,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -9101,8 +10617,10 @@ const PARTYLIST_RAW = [
     "turn_out": 96450,
     "percent_invalid": 4.25091,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 42125,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 23718,
     "margin": 18407,
     "valid": 91092,
@@ -9111,6 +10629,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 186,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -9119,8 +10638,10 @@ const PARTYLIST_RAW = [
     "turn_out": 106451,
     "percent_invalid": 4.39169,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 48122,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 30890,
     "margin": 17232,
     "valid": 101250,
@@ -9129,6 +10650,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 187,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -9137,8 +10659,10 @@ const PARTYLIST_RAW = [
     "turn_out": 97724,
     "percent_invalid": 4.833,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 44072,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 27582,
     "margin": 16490,
     "valid": 92408,
@@ -9147,6 +10671,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 173,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -9155,8 +10680,10 @@ const PARTYLIST_RAW = [
     "turn_out": 107146,
     "percent_invalid": 3.40097,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 53418,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 18347,
     "margin": 35071,
     "valid": 101797,
@@ -9165,6 +10692,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 174,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -9173,8 +10701,10 @@ const PARTYLIST_RAW = [
     "turn_out": 105476,
     "percent_invalid": 3.79707,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 48643,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 20642,
     "margin": 28001,
     "valid": 99814,
@@ -9183,6 +10713,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 175,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -9191,8 +10722,10 @@ const PARTYLIST_RAW = [
     "turn_out": 103658,
     "percent_invalid": 4.71261,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 35599,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 34572,
     "margin": 1027,
     "valid": 97863,
@@ -9201,6 +10734,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 176,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -9209,8 +10743,10 @@ const PARTYLIST_RAW = [
     "turn_out": 102125,
     "percent_invalid": 4.77454,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 39373,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 32027,
     "margin": 7346,
     "valid": 96231,
@@ -9219,6 +10755,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 177,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -9227,8 +10764,10 @@ const PARTYLIST_RAW = [
     "turn_out": 92005,
     "percent_invalid": 4.60192,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 37310,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 29362,
     "margin": 7948,
     "valid": 87129,
@@ -9237,6 +10776,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 178,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -9245,8 +10785,10 @@ const PARTYLIST_RAW = [
     "turn_out": 91376,
     "percent_invalid": 4.47054,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 43218,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 24191,
     "margin": 19027,
     "valid": 86745,
@@ -9255,6 +10797,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 179,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -9263,8 +10806,10 @@ const PARTYLIST_RAW = [
     "turn_out": 98057,
     "percent_invalid": 4.30056,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 42719,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 28080,
     "margin": 14639,
     "valid": 93095,
@@ -9273,6 +10818,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 180,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -9281,8 +10827,10 @@ const PARTYLIST_RAW = [
     "turn_out": 100194,
     "percent_invalid": 4.74879,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 36924,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 30303,
     "margin": 6621,
     "valid": 94818,
@@ -9291,6 +10839,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -3
   },
   {
+    "cid": 45,
     "province_thai": "บุรีรัมย์",
     "province_eng": "BURI RAM",
     "prov_id": "BRM",
@@ -9299,8 +10848,10 @@ const PARTYLIST_RAW = [
     "turn_out": 90518,
     "percent_invalid": 5.0211,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 30487,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 22142,
     "margin": 8345,
     "valid": 84863,
@@ -9309,6 +10860,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 54,
     "province_thai": "บุรีรัมย์",
     "province_eng": "BURI RAM",
     "prov_id": "BRM",
@@ -9317,8 +10869,10 @@ const PARTYLIST_RAW = [
     "turn_out": 82599,
     "percent_invalid": 5.28941,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 25674,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 19191,
     "margin": 6483,
     "valid": 77550,
@@ -9327,6 +10881,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 2
   },
   {
+    "cid": 46,
     "province_thai": "บุรีรัมย์",
     "province_eng": "BURI RAM",
     "prov_id": "BRM",
@@ -9335,8 +10890,10 @@ const PARTYLIST_RAW = [
     "turn_out": 88374,
     "percent_invalid": 5.67588,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 27119,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 24630,
     "margin": 2489,
     "valid": 82451,
@@ -9345,6 +10902,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 47,
     "province_thai": "บุรีรัมย์",
     "province_eng": "BURI RAM",
     "prov_id": "BRM",
@@ -9353,8 +10911,10 @@ const PARTYLIST_RAW = [
     "turn_out": 83920,
     "percent_invalid": 5.41945,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 26562,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 20679,
     "margin": 5883,
     "valid": 78807,
@@ -9363,6 +10923,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 48,
     "province_thai": "บุรีรัมย์",
     "province_eng": "BURI RAM",
     "prov_id": "BRM",
@@ -9371,8 +10932,10 @@ const PARTYLIST_RAW = [
     "turn_out": 82154,
     "percent_invalid": 5.32536,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 27934,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 22153,
     "margin": 5781,
     "valid": 77287,
@@ -9381,6 +10944,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 49,
     "province_thai": "บุรีรัมย์",
     "province_eng": "BURI RAM",
     "prov_id": "BRM",
@@ -9389,8 +10953,10 @@ const PARTYLIST_RAW = [
     "turn_out": 89915,
     "percent_invalid": 4.6733,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 26667,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 24637,
     "margin": 2030,
     "valid": 85063,
@@ -9399,6 +10965,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 50,
     "province_thai": "บุรีรัมย์",
     "province_eng": "BURI RAM",
     "prov_id": "BRM",
@@ -9407,8 +10974,10 @@ const PARTYLIST_RAW = [
     "turn_out": 87125,
     "percent_invalid": 4.65768,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 25901,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 24599,
     "margin": 1302,
     "valid": 82332,
@@ -9417,6 +10986,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 51,
     "province_thai": "บุรีรัมย์",
     "province_eng": "BURI RAM",
     "prov_id": "BRM",
@@ -9425,8 +10995,10 @@ const PARTYLIST_RAW = [
     "turn_out": 86865,
     "percent_invalid": 4.35734,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 30687,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 27202,
     "margin": 3485,
     "valid": 82428,
@@ -9435,6 +11007,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 52,
     "province_thai": "บุรีรัมย์",
     "province_eng": "BURI RAM",
     "prov_id": "BRM",
@@ -9443,8 +11016,10 @@ const PARTYLIST_RAW = [
     "turn_out": 92560,
     "percent_invalid": 4.71586,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 31036,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 25523,
     "margin": 5513,
     "valid": 87176,
@@ -9453,6 +11028,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 53,
     "province_thai": "บุรีรัมย์",
     "province_eng": "BURI RAM",
     "prov_id": "BRM",
@@ -9461,8 +11037,10 @@ const PARTYLIST_RAW = [
     "turn_out": 88326,
     "percent_invalid": 4.83097,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 32346,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 24975,
     "margin": 7371,
     "valid": 83379,
@@ -9471,6 +11049,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 337,
     "province_thai": "สุรินทร์",
     "province_eng": "SURIN",
     "prov_id": "SRN",
@@ -9479,8 +11058,10 @@ const PARTYLIST_RAW = [
     "turn_out": 100332,
     "percent_invalid": 4.18909,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 36382,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 28268,
     "margin": 8114,
     "valid": 94825,
@@ -9489,6 +11070,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 338,
     "province_thai": "สุรินทร์",
     "province_eng": "SURIN",
     "prov_id": "SRN",
@@ -9497,8 +11079,10 @@ const PARTYLIST_RAW = [
     "turn_out": 101279,
     "percent_invalid": 4.48464,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 38998,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 31177,
     "margin": 7821,
     "valid": 95925,
@@ -9507,6 +11091,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 339,
     "province_thai": "สุรินทร์",
     "province_eng": "SURIN",
     "prov_id": "SRN",
@@ -9515,8 +11100,10 @@ const PARTYLIST_RAW = [
     "turn_out": 94822,
     "percent_invalid": 4.28487,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 41245,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 27535,
     "margin": 13710,
     "valid": 90174,
@@ -9525,6 +11112,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 340,
     "province_thai": "สุรินทร์",
     "province_eng": "SURIN",
     "prov_id": "SRN",
@@ -9533,8 +11121,10 @@ const PARTYLIST_RAW = [
     "turn_out": 93229,
     "percent_invalid": 3.48711,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 44011,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 28030,
     "margin": 15981,
     "valid": 89322,
@@ -9543,6 +11133,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 341,
     "province_thai": "สุรินทร์",
     "province_eng": "SURIN",
     "prov_id": "SRN",
@@ -9551,8 +11142,10 @@ const PARTYLIST_RAW = [
     "turn_out": 88718,
     "percent_invalid": 5.25823,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 37755,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 26290,
     "margin": 11465,
     "valid": 83399,
@@ -9561,6 +11154,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 342,
     "province_thai": "สุรินทร์",
     "province_eng": "SURIN",
     "prov_id": "SRN",
@@ -9569,8 +11163,10 @@ const PARTYLIST_RAW = [
     "turn_out": 89196,
     "percent_invalid": 4.76927,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 38073,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 24968,
     "margin": 13105,
     "valid": 84420,
@@ -9579,6 +11175,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 343,
     "province_thai": "สุรินทร์",
     "province_eng": "SURIN",
     "prov_id": "SRN",
@@ -9587,8 +11184,10 @@ const PARTYLIST_RAW = [
     "turn_out": 96743,
     "percent_invalid": 4.49748,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 35628,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 31123,
     "margin": 4505,
     "valid": 91742,
@@ -9597,6 +11196,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 344,
     "province_thai": "สุรินทร์",
     "province_eng": "SURIN",
     "prov_id": "SRN",
@@ -9605,8 +11205,10 @@ const PARTYLIST_RAW = [
     "turn_out": 91229,
     "percent_invalid": 4.73753,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 37835,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 28176,
     "margin": 9659,
     "valid": 86299,
@@ -9615,6 +11217,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 345,
     "province_thai": "ศรีสะเกษ",
     "province_eng": "SI SA KET",
     "prov_id": "SSK",
@@ -9623,8 +11226,10 @@ const PARTYLIST_RAW = [
     "turn_out": 100569,
     "percent_invalid": 3.73574,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 46727,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 29915,
     "margin": 16812,
     "valid": 95874,
@@ -9633,6 +11238,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 346,
     "province_thai": "ศรีสะเกษ",
     "province_eng": "SI SA KET",
     "prov_id": "SSK",
@@ -9641,8 +11247,10 @@ const PARTYLIST_RAW = [
     "turn_out": 87917,
     "percent_invalid": 4.10501,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 41471,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 26523,
     "margin": 14948,
     "valid": 83619,
@@ -9651,6 +11259,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 347,
     "province_thai": "ศรีสะเกษ",
     "province_eng": "SI SA KET",
     "prov_id": "SSK",
@@ -9659,8 +11268,10 @@ const PARTYLIST_RAW = [
     "turn_out": 89856,
     "percent_invalid": 5.15046,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 43618,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 21900,
     "margin": 21718,
     "valid": 84792,
@@ -9669,6 +11280,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 348,
     "province_thai": "ศรีสะเกษ",
     "province_eng": "SI SA KET",
     "prov_id": "SSK",
@@ -9677,8 +11289,10 @@ const PARTYLIST_RAW = [
     "turn_out": 86615,
     "percent_invalid": 4.86867,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 40782,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 22034,
     "margin": 18748,
     "valid": 81829,
@@ -9687,6 +11301,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 349,
     "province_thai": "ศรีสะเกษ",
     "province_eng": "SI SA KET",
     "prov_id": "SSK",
@@ -9695,8 +11310,10 @@ const PARTYLIST_RAW = [
     "turn_out": 87829,
     "percent_invalid": 5.92401,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 37355,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 26724,
     "margin": 10631,
     "valid": 82031,
@@ -9705,6 +11322,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 350,
     "province_thai": "ศรีสะเกษ",
     "province_eng": "SI SA KET",
     "prov_id": "SSK",
@@ -9713,8 +11331,10 @@ const PARTYLIST_RAW = [
     "turn_out": 89674,
     "percent_invalid": 5.39398,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 40265,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 26616,
     "margin": 13649,
     "valid": 84369,
@@ -9723,6 +11343,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 351,
     "province_thai": "ศรีสะเกษ",
     "province_eng": "SI SA KET",
     "prov_id": "SSK",
@@ -9731,8 +11352,10 @@ const PARTYLIST_RAW = [
     "turn_out": 87119,
     "percent_invalid": 4.07029,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 46546,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 23379,
     "margin": 23167,
     "valid": 83104,
@@ -9741,6 +11364,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 352,
     "province_thai": "ศรีสะเกษ",
     "province_eng": "SI SA KET",
     "prov_id": "SSK",
@@ -9749,8 +11373,10 @@ const PARTYLIST_RAW = [
     "turn_out": 97459,
     "percent_invalid": 4.0181,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 45764,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 22514,
     "margin": 23250,
     "valid": 93023,
@@ -9759,6 +11385,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 353,
     "province_thai": "ศรีสะเกษ",
     "province_eng": "SI SA KET",
     "prov_id": "SSK",
@@ -9767,8 +11394,10 @@ const PARTYLIST_RAW = [
     "turn_out": 98658,
     "percent_invalid": 3.70877,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 48024,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 24592,
     "margin": 23432,
     "valid": 94336,
@@ -9777,6 +11406,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 368,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -9785,8 +11415,10 @@ const PARTYLIST_RAW = [
     "turn_out": 104255,
     "percent_invalid": 2.88523,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 42881,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 27969,
     "margin": 14912,
     "valid": 99624,
@@ -9795,6 +11427,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 377,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -9803,8 +11436,10 @@ const PARTYLIST_RAW = [
     "turn_out": 101370,
     "percent_invalid": 4.48555,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 43722,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 27753,
     "margin": 15969,
     "valid": 96251,
@@ -9813,6 +11448,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 378,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -9821,8 +11457,10 @@ const PARTYLIST_RAW = [
     "turn_out": 93547,
     "percent_invalid": 3.81519,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 38545,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 27929,
     "margin": 10616,
     "valid": 89348,
@@ -9831,6 +11469,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 369,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -9839,8 +11478,10 @@ const PARTYLIST_RAW = [
     "turn_out": 99861,
     "percent_invalid": 3.77525,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 33695,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 30718,
     "margin": 2977,
     "valid": 94954,
@@ -9849,6 +11490,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 370,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -9857,8 +11499,10 @@ const PARTYLIST_RAW = [
     "turn_out": 103705,
     "percent_invalid": 4.54462,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 41449,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 26937,
     "margin": 14512,
     "valid": 98383,
@@ -9867,6 +11511,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 2
   },
   {
+    "cid": 371,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -9875,8 +11520,10 @@ const PARTYLIST_RAW = [
     "turn_out": 109437,
     "percent_invalid": 3.4842,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 40758,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 40455,
     "margin": 303,
     "valid": 104074,
@@ -9885,6 +11532,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 372,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -9893,8 +11541,10 @@ const PARTYLIST_RAW = [
     "turn_out": 93368,
     "percent_invalid": 3.86535,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 38561,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 26705,
     "margin": 11856,
     "valid": 89254,
@@ -9903,6 +11553,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 373,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -9911,8 +11562,10 @@ const PARTYLIST_RAW = [
     "turn_out": 88724,
     "percent_invalid": 4.22546,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 37094,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 21277,
     "margin": 15817,
     "valid": 84520,
@@ -9921,6 +11574,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 374,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -9929,8 +11583,10 @@ const PARTYLIST_RAW = [
     "turn_out": 91944,
     "percent_invalid": 4.12534,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 40622,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 24184,
     "margin": 16438,
     "valid": 87658,
@@ -9939,6 +11595,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 375,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -9947,8 +11604,10 @@ const PARTYLIST_RAW = [
     "turn_out": 96805,
     "percent_invalid": 4.45638,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 35356,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 28800,
     "margin": 6556,
     "valid": 91597,
@@ -9957,6 +11616,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 376,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -9965,8 +11625,10 @@ const PARTYLIST_RAW = [
     "turn_out": 86559,
     "percent_invalid": 4.69622,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 33468,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 23192,
     "margin": 10276,
     "valid": 81993,
@@ -9975,6 +11637,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 397,
     "province_thai": "ยโสธร",
     "province_eng": "YASOTHON",
     "prov_id": "YST",
@@ -9983,8 +11646,10 @@ const PARTYLIST_RAW = [
     "turn_out": 110492,
     "percent_invalid": 2.9975,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 42534,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 33949,
     "margin": 8585,
     "valid": 106467,
@@ -9993,6 +11658,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 398,
     "province_thai": "ยโสธร",
     "province_eng": "YASOTHON",
     "prov_id": "YST",
@@ -10001,8 +11667,10 @@ const PARTYLIST_RAW = [
     "turn_out": 98432,
     "percent_invalid": 2.86797,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 52600,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 24010,
     "margin": 28590,
     "valid": 95205,
@@ -10011,6 +11679,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 399,
     "province_thai": "ยโสธร",
     "province_eng": "YASOTHON",
     "prov_id": "YST",
@@ -10019,8 +11688,10 @@ const PARTYLIST_RAW = [
     "turn_out": 104532,
     "percent_invalid": 2.99526,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 50543,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 30022,
     "margin": 20521,
     "valid": 100940,
@@ -10029,6 +11700,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 81,
     "province_thai": "ชัยภูมิ",
     "province_eng": "CHAIYAPHUM",
     "prov_id": "CPM",
@@ -10037,8 +11709,10 @@ const PARTYLIST_RAW = [
     "turn_out": 96638,
     "percent_invalid": 3.78526,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 35845,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 34219,
     "margin": 1626,
     "valid": 91992,
@@ -10047,6 +11721,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 82,
     "province_thai": "ชัยภูมิ",
     "province_eng": "CHAIYAPHUM",
     "prov_id": "CPM",
@@ -10055,8 +11730,10 @@ const PARTYLIST_RAW = [
     "turn_out": 96808,
     "percent_invalid": 4.24655,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 45801,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 28543,
     "margin": 17258,
     "valid": 91999,
@@ -10065,6 +11742,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 83,
     "province_thai": "ชัยภูมิ",
     "province_eng": "CHAIYAPHUM",
     "prov_id": "CPM",
@@ -10073,8 +11751,10 @@ const PARTYLIST_RAW = [
     "turn_out": 89483,
     "percent_invalid": 5.61559,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 37456,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 25643,
     "margin": 11813,
     "valid": 83766,
@@ -10083,6 +11763,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 84,
     "province_thai": "ชัยภูมิ",
     "province_eng": "CHAIYAPHUM",
     "prov_id": "CPM",
@@ -10091,8 +11772,10 @@ const PARTYLIST_RAW = [
     "turn_out": 81576,
     "percent_invalid": 4.51726,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 32315,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 26285,
     "margin": 6030,
     "valid": 77438,
@@ -10101,6 +11784,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 85,
     "province_thai": "ชัยภูมิ",
     "province_eng": "CHAIYAPHUM",
     "prov_id": "CPM",
@@ -10109,8 +11793,10 @@ const PARTYLIST_RAW = [
     "turn_out": 93538,
     "percent_invalid": 4.61631,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 38213,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 28803,
     "margin": 9410,
     "valid": 88504,
@@ -10119,6 +11805,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 2
   },
   {
+    "cid": 86,
     "province_thai": "ชัยภูมิ",
     "province_eng": "CHAIYAPHUM",
     "prov_id": "CPM",
@@ -10127,8 +11814,10 @@ const PARTYLIST_RAW = [
     "turn_out": 97337,
     "percent_invalid": 4.36011,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 39256,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 30848,
     "margin": 8408,
     "valid": 92620,
@@ -10137,6 +11826,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 87,
     "province_thai": "ชัยภูมิ",
     "province_eng": "CHAIYAPHUM",
     "prov_id": "CPM",
@@ -10145,8 +11835,10 @@ const PARTYLIST_RAW = [
     "turn_out": 89778,
     "percent_invalid": 3.72808,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 37038,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 30865,
     "margin": 6173,
     "valid": 85850,
@@ -10155,6 +11847,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 0,
     "province_thai": "อำนาจเจริญ",
     "province_eng": "AMNAT CHAROEN",
     "prov_id": "ACR",
@@ -10163,8 +11856,10 @@ const PARTYLIST_RAW = [
     "turn_out": 105574,
     "percent_invalid": 3.35215,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 33892,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 33576,
     "margin": 316,
     "valid": 101353,
@@ -10173,6 +11868,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 1,
     "province_thai": "อำนาจเจริญ",
     "province_eng": "AMNAT CHAROEN",
     "prov_id": "ACR",
@@ -10181,8 +11877,10 @@ const PARTYLIST_RAW = [
     "turn_out": 111813,
     "percent_invalid": 3.69367,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 36248,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 35581,
     "margin": 667,
     "valid": 106961,
@@ -10191,6 +11889,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 42,
     "province_thai": "บึงกาฬ",
     "province_eng": "BUENG KAN",
     "prov_id": "BKN",
@@ -10199,8 +11898,10 @@ const PARTYLIST_RAW = [
     "turn_out": 75682,
     "percent_invalid": 3.28744,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 35797,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 23994,
     "margin": 11803,
     "valid": 72729,
@@ -10209,6 +11910,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 43,
     "province_thai": "บึงกาฬ",
     "province_eng": "BUENG KAN",
     "prov_id": "BKN",
@@ -10217,8 +11919,10 @@ const PARTYLIST_RAW = [
     "turn_out": 76441,
     "percent_invalid": 3.54391,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 34191,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 24533,
     "margin": 9658,
     "valid": 73359,
@@ -10227,6 +11931,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 44,
     "province_thai": "บึงกาฬ",
     "province_eng": "BUENG KAN",
     "prov_id": "BKN",
@@ -10235,8 +11940,10 @@ const PARTYLIST_RAW = [
     "turn_out": 79628,
     "percent_invalid": 3.48747,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 36141,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 26014,
     "margin": 10127,
     "valid": 76318,
@@ -10245,6 +11952,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 166,
     "province_thai": "หนองบัวลำภู",
     "province_eng": "NONG BUA LAM PHU",
     "prov_id": "NBP",
@@ -10253,8 +11961,10 @@ const PARTYLIST_RAW = [
     "turn_out": 95960,
     "percent_invalid": 3.42018,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 40533,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 32799,
     "margin": 7734,
     "valid": 91833,
@@ -10263,6 +11973,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 167,
     "province_thai": "หนองบัวลำภู",
     "province_eng": "NONG BUA LAM PHU",
     "prov_id": "NBP",
@@ -10271,8 +11982,10 @@ const PARTYLIST_RAW = [
     "turn_out": 88961,
     "percent_invalid": 3.37114,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 37746,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 28988,
     "margin": 8758,
     "valid": 85519,
@@ -10281,6 +11994,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 168,
     "province_thai": "หนองบัวลำภู",
     "province_eng": "NONG BUA LAM PHU",
     "prov_id": "NBP",
@@ -10289,8 +12003,10 @@ const PARTYLIST_RAW = [
     "turn_out": 87226,
     "percent_invalid": 3.48405,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 39126,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 26790,
     "margin": 12336,
     "valid": 83709,
@@ -10299,6 +12015,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 104,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -10307,8 +12024,10 @@ const PARTYLIST_RAW = [
     "turn_out": 96839,
     "percent_invalid": 2.50209,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 44819,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 25655,
     "margin": 19164,
     "valid": 92981,
@@ -10317,6 +12036,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 113,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -10325,8 +12045,10 @@ const PARTYLIST_RAW = [
     "turn_out": 92271,
     "percent_invalid": 4.24402,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 47259,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 24775,
     "margin": 22484,
     "valid": 87939,
@@ -10335,6 +12057,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 114,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -10343,8 +12066,10 @@ const PARTYLIST_RAW = [
     "turn_out": 94907,
     "percent_invalid": 4.08927,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 45864,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 26803,
     "margin": 19061,
     "valid": 90567,
@@ -10353,6 +12078,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 105,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -10361,8 +12087,10 @@ const PARTYLIST_RAW = [
     "turn_out": 106220,
     "percent_invalid": 2.74713,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 45064,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 34638,
     "margin": 10426,
     "valid": 101911,
@@ -10371,6 +12099,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 106,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -10379,8 +12108,10 @@ const PARTYLIST_RAW = [
     "turn_out": 96743,
     "percent_invalid": 3.99512,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 38145,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 35749,
     "margin": 2396,
     "valid": 92380,
@@ -10389,6 +12120,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 2
   },
   {
+    "cid": 107,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -10397,8 +12129,10 @@ const PARTYLIST_RAW = [
     "turn_out": 98738,
     "percent_invalid": 4.07138,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 38501,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 35112,
     "margin": 3389,
     "valid": 93910,
@@ -10407,6 +12141,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 108,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -10415,8 +12150,10 @@ const PARTYLIST_RAW = [
     "turn_out": 87101,
     "percent_invalid": 4.24679,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 40475,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 27446,
     "margin": 13029,
     "valid": 82886,
@@ -10425,6 +12162,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 109,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -10433,8 +12171,10 @@ const PARTYLIST_RAW = [
     "turn_out": 90923,
     "percent_invalid": 4.32674,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 37772,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 29426,
     "margin": 8346,
     "valid": 86381,
@@ -10443,6 +12183,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 110,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -10451,8 +12192,10 @@ const PARTYLIST_RAW = [
     "turn_out": 98095,
     "percent_invalid": 4.15108,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 44529,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 29418,
     "margin": 15111,
     "valid": 93513,
@@ -10461,6 +12204,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 2
   },
   {
+    "cid": 111,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -10469,8 +12213,10 @@ const PARTYLIST_RAW = [
     "turn_out": 102146,
     "percent_invalid": 3.93456,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 44302,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 32873,
     "margin": 11429,
     "valid": 97348,
@@ -10479,6 +12225,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 112,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -10487,8 +12234,10 @@ const PARTYLIST_RAW = [
     "turn_out": 87404,
     "percent_invalid": 4.15542,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 41974,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 26589,
     "margin": 15385,
     "valid": 83282,
@@ -10497,6 +12246,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 379,
     "province_thai": "อุดรธานี",
     "province_eng": "UDON THANI",
     "prov_id": "UDN",
@@ -10505,8 +12255,10 @@ const PARTYLIST_RAW = [
     "turn_out": 90592,
     "percent_invalid": 2.56866,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 39529,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 26599,
     "margin": 12930,
     "valid": 86820,
@@ -10515,6 +12267,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 388,
     "province_thai": "อุดรธานี",
     "province_eng": "UDON THANI",
     "prov_id": "UDN",
@@ -10523,8 +12276,10 @@ const PARTYLIST_RAW = [
     "turn_out": 83474,
     "percent_invalid": 3.92098,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 39167,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 27585,
     "margin": 11582,
     "valid": 79627,
@@ -10533,6 +12288,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 380,
     "province_thai": "อุดรธานี",
     "province_eng": "UDON THANI",
     "prov_id": "UDN",
@@ -10541,8 +12297,10 @@ const PARTYLIST_RAW = [
     "turn_out": 90418,
     "percent_invalid": 3.15977,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 37024,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 34194,
     "margin": 2830,
     "valid": 86426,
@@ -10551,6 +12309,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 381,
     "province_thai": "อุดรธานี",
     "province_eng": "UDON THANI",
     "prov_id": "UDN",
@@ -10559,8 +12318,10 @@ const PARTYLIST_RAW = [
     "turn_out": 82968,
     "percent_invalid": 4.15823,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 32096,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 28124,
     "margin": 3972,
     "valid": 79084,
@@ -10569,6 +12330,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 382,
     "province_thai": "อุดรธานี",
     "province_eng": "UDON THANI",
     "prov_id": "UDN",
@@ -10577,8 +12339,10 @@ const PARTYLIST_RAW = [
     "turn_out": 80439,
     "percent_invalid": 3.68354,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 33209,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 24956,
     "margin": 8253,
     "valid": 77060,
@@ -10587,6 +12351,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 383,
     "province_thai": "อุดรธานี",
     "province_eng": "UDON THANI",
     "prov_id": "UDN",
@@ -10595,8 +12360,10 @@ const PARTYLIST_RAW = [
     "turn_out": 77781,
     "percent_invalid": 3.41729,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 36683,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 26633,
     "margin": 10050,
     "valid": 74693,
@@ -10605,6 +12372,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 385,
     "province_thai": "อุดรธานี",
     "province_eng": "UDON THANI",
     "prov_id": "UDN",
@@ -10613,8 +12381,10 @@ const PARTYLIST_RAW = [
     "turn_out": 83998,
     "percent_invalid": 3.41199,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 36301,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 31191,
     "margin": 5110,
     "valid": 80481,
@@ -10623,6 +12393,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 386,
     "province_thai": "อุดรธานี",
     "province_eng": "UDON THANI",
     "prov_id": "UDN",
@@ -10631,8 +12402,10 @@ const PARTYLIST_RAW = [
     "turn_out": 82330,
     "percent_invalid": 4.04105,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 36527,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 27505,
     "margin": 9022,
     "valid": 78463,
@@ -10641,6 +12414,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 387,
     "province_thai": "อุดรธานี",
     "province_eng": "UDON THANI",
     "prov_id": "UDN",
@@ -10649,8 +12423,10 @@ const PARTYLIST_RAW = [
     "turn_out": 85776,
     "percent_invalid": 3.40655,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 39407,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 29012,
     "margin": 10395,
     "valid": 82178,
@@ -10659,6 +12435,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 2
   },
   {
+    "cid": 130,
     "province_thai": "เลย",
     "province_eng": "LOEI",
     "prov_id": "LEI",
@@ -10667,8 +12444,10 @@ const PARTYLIST_RAW = [
     "turn_out": 96500,
     "percent_invalid": 3.41036,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 41419,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 31170,
     "margin": 10249,
     "valid": 91927,
@@ -10677,6 +12456,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 131,
     "province_thai": "เลย",
     "province_eng": "LOEI",
     "prov_id": "LEI",
@@ -10685,8 +12465,10 @@ const PARTYLIST_RAW = [
     "turn_out": 93344,
     "percent_invalid": 5.13691,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 39351,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 29920,
     "margin": 9431,
     "valid": 87782,
@@ -10695,6 +12477,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 132,
     "province_thai": "เลย",
     "province_eng": "LOEI",
     "prov_id": "LEI",
@@ -10703,8 +12486,10 @@ const PARTYLIST_RAW = [
     "turn_out": 98765,
     "percent_invalid": 4.44591,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 34804,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 32413,
     "margin": 2391,
     "valid": 93380,
@@ -10713,6 +12498,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 133,
     "province_thai": "เลย",
     "province_eng": "LOEI",
     "prov_id": "LEI",
@@ -10721,8 +12507,10 @@ const PARTYLIST_RAW = [
     "turn_out": 93584,
     "percent_invalid": 4.54137,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 41289,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 27784,
     "margin": 13505,
     "valid": 88412,
@@ -10731,6 +12519,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 169,
     "province_thai": "หนองคาย",
     "province_eng": "NONG KHAI",
     "prov_id": "NKI",
@@ -10739,8 +12528,10 @@ const PARTYLIST_RAW = [
     "turn_out": 97081,
     "percent_invalid": 3.75254,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 36907,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 35642,
     "margin": 1265,
     "valid": 92317,
@@ -10749,6 +12540,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 170,
     "province_thai": "หนองคาย",
     "province_eng": "NONG KHAI",
     "prov_id": "NKI",
@@ -10757,8 +12549,10 @@ const PARTYLIST_RAW = [
     "turn_out": 87295,
     "percent_invalid": 4.03803,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 39244,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 29915,
     "margin": 9329,
     "valid": 83263,
@@ -10767,6 +12561,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 171,
     "province_thai": "หนองคาย",
     "province_eng": "NONG KHAI",
     "prov_id": "NKI",
@@ -10775,8 +12570,10 @@ const PARTYLIST_RAW = [
     "turn_out": 92353,
     "percent_invalid": 4.30197,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 42444,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 30504,
     "margin": 11940,
     "valid": 87706,
@@ -10785,6 +12582,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 147,
     "province_thai": "มหาสารคาม",
     "province_eng": "MAHA SARAKHAM",
     "prov_id": "MKM",
@@ -10793,8 +12591,10 @@ const PARTYLIST_RAW = [
     "turn_out": 95991,
     "percent_invalid": 2.80755,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 38602,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 36876,
     "margin": 1726,
     "valid": 92345,
@@ -10803,6 +12603,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 148,
     "province_thai": "มหาสารคาม",
     "province_eng": "MAHA SARAKHAM",
     "prov_id": "MKM",
@@ -10811,8 +12612,10 @@ const PARTYLIST_RAW = [
     "turn_out": 90040,
     "percent_invalid": 3.71057,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 39368,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 27718,
     "margin": 11650,
     "valid": 86177,
@@ -10821,6 +12624,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 149,
     "province_thai": "มหาสารคาม",
     "province_eng": "MAHA SARAKHAM",
     "prov_id": "MKM",
@@ -10829,8 +12633,10 @@ const PARTYLIST_RAW = [
     "turn_out": 92042,
     "percent_invalid": 3.27459,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 46042,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 24298,
     "margin": 21744,
     "valid": 88620,
@@ -10839,6 +12645,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 150,
     "province_thai": "มหาสารคาม",
     "province_eng": "MAHA SARAKHAM",
     "prov_id": "MKM",
@@ -10847,8 +12654,10 @@ const PARTYLIST_RAW = [
     "turn_out": 88748,
     "percent_invalid": 3.32515,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 44657,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 23902,
     "margin": 20755,
     "valid": 85282,
@@ -10857,6 +12666,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 151,
     "province_thai": "มหาสารคาม",
     "province_eng": "MAHA SARAKHAM",
     "prov_id": "MKM",
@@ -10865,8 +12675,10 @@ const PARTYLIST_RAW = [
     "turn_out": 95987,
     "percent_invalid": 2.94207,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 47164,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 29130,
     "margin": 18034,
     "valid": 92643,
@@ -10875,6 +12687,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 152,
     "province_thai": "มหาสารคาม",
     "province_eng": "MAHA SARAKHAM",
     "prov_id": "MKM",
@@ -10883,8 +12696,10 @@ const PARTYLIST_RAW = [
     "turn_out": 97770,
     "percent_invalid": 3.02956,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 50177,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 29249,
     "margin": 20928,
     "valid": 94264,
@@ -10893,6 +12708,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 275,
     "province_thai": "ร้อยเอ็ด",
     "province_eng": "ROI ET",
     "prov_id": "RET",
@@ -10901,8 +12717,10 @@ const PARTYLIST_RAW = [
     "turn_out": 97457,
     "percent_invalid": 2.77558,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 40949,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 33261,
     "margin": 7688,
     "valid": 93819,
@@ -10911,6 +12729,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 276,
     "province_thai": "ร้อยเอ็ด",
     "province_eng": "ROI ET",
     "prov_id": "RET",
@@ -10919,8 +12738,10 @@ const PARTYLIST_RAW = [
     "turn_out": 96360,
     "percent_invalid": 3.22022,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 45602,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 31403,
     "margin": 14199,
     "valid": 92804,
@@ -10929,6 +12750,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 277,
     "province_thai": "ร้อยเอ็ด",
     "province_eng": "ROI ET",
     "prov_id": "RET",
@@ -10937,8 +12759,10 @@ const PARTYLIST_RAW = [
     "turn_out": 90229,
     "percent_invalid": 3.26946,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 41491,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 27580,
     "margin": 13911,
     "valid": 86839,
@@ -10947,6 +12771,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 278,
     "province_thai": "ร้อยเอ็ด",
     "province_eng": "ROI ET",
     "prov_id": "RET",
@@ -10955,8 +12780,10 @@ const PARTYLIST_RAW = [
     "turn_out": 87354,
     "percent_invalid": 3.1504,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 44001,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 25885,
     "margin": 18116,
     "valid": 84220,
@@ -10965,6 +12792,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 279,
     "province_thai": "ร้อยเอ็ด",
     "province_eng": "ROI ET",
     "prov_id": "RET",
@@ -10973,8 +12801,10 @@ const PARTYLIST_RAW = [
     "turn_out": 88378,
     "percent_invalid": 3.28928,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 47433,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 24657,
     "margin": 22776,
     "valid": 84879,
@@ -10983,6 +12813,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 280,
     "province_thai": "ร้อยเอ็ด",
     "province_eng": "ROI ET",
     "prov_id": "RET",
@@ -10991,8 +12822,10 @@ const PARTYLIST_RAW = [
     "turn_out": 88342,
     "percent_invalid": 3.11517,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 48371,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 22836,
     "margin": 25535,
     "valid": 85210,
@@ -11001,6 +12834,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 281,
     "province_thai": "ร้อยเอ็ด",
     "province_eng": "ROI ET",
     "prov_id": "RET",
@@ -11009,8 +12843,10 @@ const PARTYLIST_RAW = [
     "turn_out": 92305,
     "percent_invalid": 2.66399,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 49144,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 25035,
     "margin": 24109,
     "valid": 89541,
@@ -11019,6 +12855,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 282,
     "province_thai": "ร้อยเอ็ด",
     "province_eng": "ROI ET",
     "prov_id": "RET",
@@ -11027,8 +12864,10 @@ const PARTYLIST_RAW = [
     "turn_out": 93392,
     "percent_invalid": 2.80324,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 49965,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 25071,
     "margin": 24894,
     "valid": 90302,
@@ -11037,6 +12876,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 124,
     "province_thai": "กาฬสินธุ์",
     "province_eng": "KALASIN",
     "prov_id": "KSN",
@@ -11045,8 +12885,10 @@ const PARTYLIST_RAW = [
     "turn_out": 94595,
     "percent_invalid": 3.18093,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 42068,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 31513,
     "margin": 10555,
     "valid": 90803,
@@ -11055,6 +12897,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 125,
     "province_thai": "กาฬสินธุ์",
     "province_eng": "KALASIN",
     "prov_id": "KSN",
@@ -11063,8 +12906,10 @@ const PARTYLIST_RAW = [
     "turn_out": 90776,
     "percent_invalid": 3.37644,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 48534,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 20619,
     "margin": 27915,
     "valid": 87287,
@@ -11073,6 +12918,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 126,
     "province_thai": "กาฬสินธุ์",
     "province_eng": "KALASIN",
     "prov_id": "KSN",
@@ -11081,8 +12927,10 @@ const PARTYLIST_RAW = [
     "turn_out": 85608,
     "percent_invalid": 4.43533,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 31199,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 27820,
     "margin": 3379,
     "valid": 81268,
@@ -11091,6 +12939,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 127,
     "province_thai": "กาฬสินธุ์",
     "province_eng": "KALASIN",
     "prov_id": "KSN",
@@ -11099,8 +12948,10 @@ const PARTYLIST_RAW = [
     "turn_out": 95030,
     "percent_invalid": 4.17658,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 41097,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 28113,
     "margin": 12984,
     "valid": 90565,
@@ -11109,6 +12960,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 128,
     "province_thai": "กาฬสินธุ์",
     "province_eng": "KALASIN",
     "prov_id": "KSN",
@@ -11117,8 +12969,10 @@ const PARTYLIST_RAW = [
     "turn_out": 97066,
     "percent_invalid": 3.48732,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 50454,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 26803,
     "margin": 23651,
     "valid": 93158,
@@ -11127,6 +12981,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 2
   },
   {
+    "cid": 129,
     "province_thai": "กาฬสินธุ์",
     "province_eng": "KALASIN",
     "prov_id": "KSN",
@@ -11135,8 +12990,10 @@ const PARTYLIST_RAW = [
     "turn_out": 94831,
     "percent_invalid": 3.75194,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 42272,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 31946,
     "margin": 10326,
     "valid": 90531,
@@ -11145,6 +13002,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 313,
     "province_thai": "สกลนคร",
     "province_eng": "SAKON NAKHON",
     "prov_id": "SNK",
@@ -11153,8 +13011,10 @@ const PARTYLIST_RAW = [
     "turn_out": 96244,
     "percent_invalid": 2.83446,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 36034,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 34055,
     "margin": 1979,
     "valid": 92244,
@@ -11163,6 +13023,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 314,
     "province_thai": "สกลนคร",
     "province_eng": "SAKON NAKHON",
     "prov_id": "SNK",
@@ -11171,8 +13032,10 @@ const PARTYLIST_RAW = [
     "turn_out": 90918,
     "percent_invalid": 3.13029,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 40630,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 28316,
     "margin": 12314,
     "valid": 87406,
@@ -11181,6 +13044,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -2
   },
   {
+    "cid": 315,
     "province_thai": "สกลนคร",
     "province_eng": "SAKON NAKHON",
     "prov_id": "SNK",
@@ -11189,8 +13053,10 @@ const PARTYLIST_RAW = [
     "turn_out": 92272,
     "percent_invalid": 2.87628,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 50610,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 23853,
     "margin": 26757,
     "valid": 89007,
@@ -11199,6 +13065,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 3
   },
   {
+    "cid": 316,
     "province_thai": "สกลนคร",
     "province_eng": "SAKON NAKHON",
     "prov_id": "SNK",
@@ -11207,8 +13074,10 @@ const PARTYLIST_RAW = [
     "turn_out": 88340,
     "percent_invalid": 3.5352,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 40716,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 27157,
     "margin": 13559,
     "valid": 84520,
@@ -11217,6 +13086,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 317,
     "province_thai": "สกลนคร",
     "province_eng": "SAKON NAKHON",
     "prov_id": "SNK",
@@ -11225,8 +13095,10 @@ const PARTYLIST_RAW = [
     "turn_out": 85443,
     "percent_invalid": 3.66209,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 34579,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 30979,
     "margin": 3600,
     "valid": 81811,
@@ -11235,6 +13107,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 318,
     "province_thai": "สกลนคร",
     "province_eng": "SAKON NAKHON",
     "prov_id": "SNK",
@@ -11243,8 +13116,10 @@ const PARTYLIST_RAW = [
     "turn_out": 83631,
     "percent_invalid": 2.89127,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 39091,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 27934,
     "margin": 11157,
     "valid": 80746,
@@ -11253,6 +13128,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 319,
     "province_thai": "สกลนคร",
     "province_eng": "SAKON NAKHON",
     "prov_id": "SNK",
@@ -11261,8 +13137,10 @@ const PARTYLIST_RAW = [
     "turn_out": 82845,
     "percent_invalid": 3.30255,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 37951,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 27964,
     "margin": 9987,
     "valid": 79636,
@@ -11271,6 +13149,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 188,
     "province_thai": "นครพนม",
     "province_eng": "NAKHON PHANOM",
     "prov_id": "NPM",
@@ -11279,8 +13158,10 @@ const PARTYLIST_RAW = [
     "turn_out": 100285,
     "percent_invalid": 3.78521,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 50429,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 22453,
     "margin": 27976,
     "valid": 96040,
@@ -11289,6 +13170,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 189,
     "province_thai": "นครพนม",
     "province_eng": "NAKHON PHANOM",
     "prov_id": "NPM",
@@ -11297,8 +13179,10 @@ const PARTYLIST_RAW = [
     "turn_out": 99905,
     "percent_invalid": 3.87969,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 45200,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 26675,
     "margin": 18525,
     "valid": 95389,
@@ -11307,6 +13191,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 190,
     "province_thai": "นครพนม",
     "province_eng": "NAKHON PHANOM",
     "prov_id": "NPM",
@@ -11315,8 +13200,10 @@ const PARTYLIST_RAW = [
     "turn_out": 97929,
     "percent_invalid": 3.35243,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 45945,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 30467,
     "margin": 15478,
     "valid": 94047,
@@ -11325,6 +13212,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 191,
     "province_thai": "นครพนม",
     "province_eng": "NAKHON PHANOM",
     "prov_id": "NPM",
@@ -11333,8 +13221,10 @@ const PARTYLIST_RAW = [
     "turn_out": 99881,
     "percent_invalid": 4.17397,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 39708,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 26010,
     "margin": 13698,
     "valid": 95186,
@@ -11343,6 +13233,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 145,
     "province_thai": "มุกดาหาร",
     "province_eng": "MUKDAHAN",
     "prov_id": "MDH",
@@ -11351,8 +13242,10 @@ const PARTYLIST_RAW = [
     "turn_out": 106225,
     "percent_invalid": 3.67522,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 42681,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 39853,
     "margin": 2828,
     "valid": 101533,
@@ -11361,6 +13254,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 146,
     "province_thai": "มุกดาหาร",
     "province_eng": "MUKDAHAN",
     "prov_id": "MDH",
@@ -11369,8 +13263,10 @@ const PARTYLIST_RAW = [
     "turn_out": 102939,
     "percent_invalid": 4.32781,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 41183,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 34015,
     "margin": 7168,
     "valid": 97677,
@@ -11379,6 +13275,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 69,
     "province_thai": "เชียงใหม่",
     "province_eng": "CHIANG MAI",
     "prov_id": "CMI",
@@ -11387,8 +13284,10 @@ const PARTYLIST_RAW = [
     "turn_out": 108446,
     "percent_invalid": 2.06278,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 53718,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 28127,
     "margin": 25591,
     "valid": 104406,
@@ -11397,6 +13296,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 78,
     "province_thai": "เชียงใหม่",
     "province_eng": "CHIANG MAI",
     "prov_id": "CMI",
@@ -11405,8 +13305,10 @@ const PARTYLIST_RAW = [
     "turn_out": 99914,
     "percent_invalid": 6.57766,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 35651,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 32683,
     "margin": 2968,
     "valid": 92812,
@@ -11415,6 +13317,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 70,
     "province_thai": "เชียงใหม่",
     "province_eng": "CHIANG MAI",
     "prov_id": "CMI",
@@ -11423,8 +13326,10 @@ const PARTYLIST_RAW = [
     "turn_out": 115111,
     "percent_invalid": 2.56882,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 55132,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 37664,
     "margin": 17468,
     "valid": 110301,
@@ -11433,6 +13338,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 71,
     "province_thai": "เชียงใหม่",
     "province_eng": "CHIANG MAI",
     "prov_id": "CMI",
@@ -11441,8 +13347,10 @@ const PARTYLIST_RAW = [
     "turn_out": 113609,
     "percent_invalid": 2.76475,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 50778,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 41474,
     "margin": 9304,
     "valid": 108999,
@@ -11451,6 +13359,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 72,
     "province_thai": "เชียงใหม่",
     "province_eng": "CHIANG MAI",
     "prov_id": "CMI",
@@ -11459,8 +13368,10 @@ const PARTYLIST_RAW = [
     "turn_out": 114801,
     "percent_invalid": 2.5505,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 58461,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 32612,
     "margin": 25849,
     "valid": 110140,
@@ -11469,6 +13380,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 73,
     "province_thai": "เชียงใหม่",
     "province_eng": "CHIANG MAI",
     "prov_id": "CMI",
@@ -11477,8 +13389,10 @@ const PARTYLIST_RAW = [
     "turn_out": 108428,
     "percent_invalid": 4.30701,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 44651,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 37400,
     "margin": 7251,
     "valid": 102471,
@@ -11487,6 +13401,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 74,
     "province_thai": "เชียงใหม่",
     "province_eng": "CHIANG MAI",
     "prov_id": "CMI",
@@ -11495,8 +13410,10 @@ const PARTYLIST_RAW = [
     "turn_out": 96543,
     "percent_invalid": 5.00192,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 37022,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 29829,
     "margin": 7193,
     "valid": 90959,
@@ -11505,6 +13422,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 75,
     "province_thai": "เชียงใหม่",
     "province_eng": "CHIANG MAI",
     "prov_id": "CMI",
@@ -11513,8 +13431,10 @@ const PARTYLIST_RAW = [
     "turn_out": 103047,
     "percent_invalid": 5.69546,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 41587,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 31805,
     "margin": 9782,
     "valid": 96204,
@@ -11523,6 +13443,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 76,
     "province_thai": "เชียงใหม่",
     "province_eng": "CHIANG MAI",
     "prov_id": "CMI",
@@ -11531,8 +13452,10 @@ const PARTYLIST_RAW = [
     "turn_out": 118394,
     "percent_invalid": 3.13276,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 52647,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 44353,
     "margin": 8294,
     "valid": 113448,
@@ -11541,6 +13464,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 77,
     "province_thai": "เชียงใหม่",
     "province_eng": "CHIANG MAI",
     "prov_id": "CMI",
@@ -11549,8 +13473,10 @@ const PARTYLIST_RAW = [
     "turn_out": 110009,
     "percent_invalid": 4.73507,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 42757,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 39371,
     "margin": 3386,
     "valid": 103981,
@@ -11559,6 +13485,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 138,
     "province_thai": "ลำพูน",
     "province_eng": "LAMPHUN",
     "prov_id": "LPN",
@@ -11567,8 +13494,10 @@ const PARTYLIST_RAW = [
     "turn_out": 146167,
     "percent_invalid": 3.31744,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 65196,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 50786,
     "margin": 14410,
     "valid": 139639,
@@ -11577,6 +13506,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 139,
     "province_thai": "ลำพูน",
     "province_eng": "LAMPHUN",
     "prov_id": "LPN",
@@ -11585,8 +13515,10 @@ const PARTYLIST_RAW = [
     "turn_out": 141389,
     "percent_invalid": 4.94593,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 52807,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 49960,
     "margin": 2847,
     "valid": 132874,
@@ -11595,6 +13527,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 134,
     "province_thai": "ลำปาง",
     "province_eng": "LAMPANG",
     "prov_id": "LPG",
@@ -11603,8 +13536,10 @@ const PARTYLIST_RAW = [
     "turn_out": 120565,
     "percent_invalid": 3.18086,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 52919,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 38140,
     "margin": 14779,
     "valid": 114743,
@@ -11613,6 +13548,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 135,
     "province_thai": "ลำปาง",
     "province_eng": "LAMPANG",
     "prov_id": "LPG",
@@ -11621,8 +13557,10 @@ const PARTYLIST_RAW = [
     "turn_out": 119599,
     "percent_invalid": 4.60121,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 44633,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 42689,
     "margin": 1944,
     "valid": 112901,
@@ -11631,6 +13569,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 136,
     "province_thai": "ลำปาง",
     "province_eng": "LAMPANG",
     "prov_id": "LPG",
@@ -11639,8 +13578,10 @@ const PARTYLIST_RAW = [
     "turn_out": 120833,
     "percent_invalid": 3.93932,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 50598,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 38733,
     "margin": 11865,
     "valid": 114246,
@@ -11649,6 +13590,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 137,
     "province_thai": "ลำปาง",
     "province_eng": "LAMPANG",
     "prov_id": "LPG",
@@ -11657,8 +13599,10 @@ const PARTYLIST_RAW = [
     "turn_out": 122131,
     "percent_invalid": 4.24872,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 46341,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 44686,
     "margin": 1655,
     "valid": 115711,
@@ -11667,6 +13611,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 391,
     "province_thai": "อุตรดิตถ์",
     "province_eng": "UTTARADIT",
     "prov_id": "UTT",
@@ -11675,8 +13620,10 @@ const PARTYLIST_RAW = [
     "turn_out": 90413,
     "percent_invalid": 4.13436,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 32264,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 30470,
     "margin": 1794,
     "valid": 85452,
@@ -11685,6 +13632,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -2
   },
   {
+    "cid": 392,
     "province_thai": "อุตรดิตถ์",
     "province_eng": "UTTARADIT",
     "prov_id": "UTT",
@@ -11693,8 +13641,10 @@ const PARTYLIST_RAW = [
     "turn_out": 89997,
     "percent_invalid": 5.05461,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 31399,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 29327,
     "margin": 2072,
     "valid": 84474,
@@ -11703,6 +13653,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 2
   },
   {
+    "cid": 393,
     "province_thai": "อุตรดิตถ์",
     "province_eng": "UTTARADIT",
     "prov_id": "UTT",
@@ -11711,8 +13662,10 @@ const PARTYLIST_RAW = [
     "turn_out": 92484,
     "percent_invalid": 4.1272,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 41368,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 28228,
     "margin": 13140,
     "valid": 87662,
@@ -11721,6 +13674,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 249,
     "province_thai": "แพร่",
     "province_eng": "PHRAE",
     "prov_id": "PRE",
@@ -11729,8 +13683,10 @@ const PARTYLIST_RAW = [
     "turn_out": 101848,
     "percent_invalid": 2.82578,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 41265,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 36809,
     "margin": 4456,
     "valid": 98000,
@@ -11739,6 +13695,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 250,
     "province_thai": "แพร่",
     "province_eng": "PHRAE",
     "prov_id": "PRE",
@@ -11747,8 +13704,10 @@ const PARTYLIST_RAW = [
     "turn_out": 93210,
     "percent_invalid": 3.57365,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 40461,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 27970,
     "margin": 12491,
     "valid": 89211,
@@ -11757,6 +13716,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 251,
     "province_thai": "แพร่",
     "province_eng": "PHRAE",
     "prov_id": "PRE",
@@ -11765,8 +13725,10 @@ const PARTYLIST_RAW = [
     "turn_out": 92824,
     "percent_invalid": 4.0399,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 38878,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 30472,
     "margin": 8406,
     "valid": 88304,
@@ -11775,6 +13737,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 156,
     "province_thai": "น่าน",
     "province_eng": "NAN",
     "prov_id": "NAN",
@@ -11783,8 +13746,10 @@ const PARTYLIST_RAW = [
     "turn_out": 102972,
     "percent_invalid": 3.89135,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 45033,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 34314,
     "margin": 10719,
     "valid": 97930,
@@ -11793,6 +13758,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 157,
     "province_thai": "น่าน",
     "province_eng": "NAN",
     "prov_id": "NAN",
@@ -11801,8 +13767,10 @@ const PARTYLIST_RAW = [
     "turn_out": 93629,
     "percent_invalid": 4.89165,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 32939,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 32817,
     "margin": 122,
     "valid": 88076,
@@ -11811,6 +13779,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 267,
     "province_thai": "พะเยา",
     "province_eng": "PHAYAO",
     "prov_id": "PYO",
@@ -11819,8 +13788,10 @@ const PARTYLIST_RAW = [
     "turn_out": 101698,
     "percent_invalid": 3.45041,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 41544,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 30041,
     "margin": 11503,
     "valid": 96878,
@@ -11829,6 +13800,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 268,
     "province_thai": "พะเยา",
     "province_eng": "PHAYAO",
     "prov_id": "PYO",
@@ -11837,8 +13809,10 @@ const PARTYLIST_RAW = [
     "turn_out": 99197,
     "percent_invalid": 3.79245,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 44775,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 32859,
     "margin": 11916,
     "valid": 94577,
@@ -11847,6 +13821,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 269,
     "province_thai": "พะเยา",
     "province_eng": "PHAYAO",
     "prov_id": "PYO",
@@ -11855,8 +13830,10 @@ const PARTYLIST_RAW = [
     "turn_out": 103270,
     "percent_invalid": 4.44563,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 40668,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 33675,
     "margin": 6993,
     "valid": 97868,
@@ -11865,6 +13842,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 91,
     "province_thai": "เชียงราย",
     "province_eng": "CHIANG RAI",
     "prov_id": "CRI",
@@ -11873,8 +13851,10 @@ const PARTYLIST_RAW = [
     "turn_out": 109475,
     "percent_invalid": 3.35602,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 49688,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 35530,
     "margin": 14158,
     "valid": 104346,
@@ -11883,6 +13863,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 92,
     "province_thai": "เชียงราย",
     "province_eng": "CHIANG RAI",
     "prov_id": "CRI",
@@ -11891,8 +13872,10 @@ const PARTYLIST_RAW = [
     "turn_out": 103629,
     "percent_invalid": 4.13301,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 45501,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 38486,
     "margin": 7015,
     "valid": 98388,
@@ -11901,6 +13884,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 2
   },
   {
+    "cid": 93,
     "province_thai": "เชียงราย",
     "province_eng": "CHIANG RAI",
     "prov_id": "CRI",
@@ -11909,8 +13893,10 @@ const PARTYLIST_RAW = [
     "turn_out": 110706,
     "percent_invalid": 5.30956,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 40391,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 37678,
     "margin": 2713,
     "valid": 103964,
@@ -11919,6 +13905,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 94,
     "province_thai": "เชียงราย",
     "province_eng": "CHIANG RAI",
     "prov_id": "CRI",
@@ -11927,8 +13914,10 @@ const PARTYLIST_RAW = [
     "turn_out": 113169,
     "percent_invalid": 3.87209,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 48079,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 40831,
     "margin": 7248,
     "valid": 107968,
@@ -11937,6 +13926,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 95,
     "province_thai": "เชียงราย",
     "province_eng": "CHIANG RAI",
     "prov_id": "CRI",
@@ -11945,8 +13935,10 @@ const PARTYLIST_RAW = [
     "turn_out": 103456,
     "percent_invalid": 3.66146,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 49547,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 32344,
     "margin": 17203,
     "valid": 98948,
@@ -11955,6 +13947,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 2
   },
   {
+    "cid": 96,
     "province_thai": "เชียงราย",
     "province_eng": "CHIANG RAI",
     "prov_id": "CRI",
@@ -11963,8 +13956,10 @@ const PARTYLIST_RAW = [
     "turn_out": 87605,
     "percent_invalid": 5.65379,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 38624,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 27084,
     "margin": 11540,
     "valid": 81939,
@@ -11973,6 +13968,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 97,
     "province_thai": "เชียงราย",
     "province_eng": "CHIANG RAI",
     "prov_id": "CRI",
@@ -11981,8 +13977,10 @@ const PARTYLIST_RAW = [
     "turn_out": 101295,
     "percent_invalid": 4.95089,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 42125,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 35775,
     "margin": 6350,
     "valid": 95460,
@@ -11991,6 +13989,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 153,
     "province_thai": "แม่ฮ่องสอน",
     "province_eng": "MAE HONG SON",
     "prov_id": "MSN",
@@ -11999,8 +13998,10 @@ const PARTYLIST_RAW = [
     "turn_out": 71189,
     "percent_invalid": 4.21554,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 29837,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 14838,
     "margin": 14999,
     "valid": 67485,
@@ -12009,6 +14010,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 154,
     "province_thai": "แม่ฮ่องสอน",
     "province_eng": "MAE HONG SON",
     "prov_id": "MSN",
@@ -12017,8 +14019,10 @@ const PARTYLIST_RAW = [
     "turn_out": 76793,
     "percent_invalid": 6.06435,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 26514,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 17041,
     "margin": 9473,
     "valid": 71569,
@@ -12027,6 +14031,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 198,
     "province_thai": "นครสวรรค์",
     "province_eng": "NAKHON SAWAN",
     "prov_id": "NSN",
@@ -12035,8 +14040,10 @@ const PARTYLIST_RAW = [
     "turn_out": 105798,
     "percent_invalid": 3.57568,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 43341,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 21539,
     "margin": 21802,
     "valid": 100159,
@@ -12045,6 +14052,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 2
   },
   {
+    "cid": 199,
     "province_thai": "นครสวรรค์",
     "province_eng": "NAKHON SAWAN",
     "prov_id": "NSN",
@@ -12053,8 +14061,10 @@ const PARTYLIST_RAW = [
     "turn_out": 107230,
     "percent_invalid": 5.29236,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 35414,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 33586,
     "margin": 1828,
     "valid": 100142,
@@ -12063,6 +14073,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 200,
     "province_thai": "นครสวรรค์",
     "province_eng": "NAKHON SAWAN",
     "prov_id": "NSN",
@@ -12071,8 +14082,10 @@ const PARTYLIST_RAW = [
     "turn_out": 109065,
     "percent_invalid": 5.5499,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 36371,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 34691,
     "margin": 1680,
     "valid": 101960,
@@ -12081,6 +14094,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 2
   },
   {
+    "cid": 201,
     "province_thai": "นครสวรรค์",
     "province_eng": "NAKHON SAWAN",
     "prov_id": "NSN",
@@ -12089,8 +14103,10 @@ const PARTYLIST_RAW = [
     "turn_out": 104726,
     "percent_invalid": 6.33463,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 39828,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 30369,
     "margin": 9459,
     "valid": 97226,
@@ -12099,6 +14115,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 202,
     "province_thai": "นครสวรรค์",
     "province_eng": "NAKHON SAWAN",
     "prov_id": "NSN",
@@ -12107,8 +14124,10 @@ const PARTYLIST_RAW = [
     "turn_out": 104881,
     "percent_invalid": 5.62066,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 34995,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 29010,
     "margin": 5985,
     "valid": 97671,
@@ -12117,6 +14136,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 203,
     "province_thai": "นครสวรรค์",
     "province_eng": "NAKHON SAWAN",
     "prov_id": "NSN",
@@ -12125,8 +14145,10 @@ const PARTYLIST_RAW = [
     "turn_out": 97307,
     "percent_invalid": 6.55657,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 31392,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 29534,
     "margin": 1858,
     "valid": 90168,
@@ -12135,6 +14157,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -2
   },
   {
+    "cid": 389,
     "province_thai": "อุทัยธานี",
     "province_eng": "UTHAI THANI",
     "prov_id": "UTI",
@@ -12143,8 +14166,10 @@ const PARTYLIST_RAW = [
     "turn_out": 92174,
     "percent_invalid": 4.23764,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 31564,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 18060,
     "margin": 13504,
     "valid": 86718,
@@ -12153,6 +14178,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 2
   },
   {
+    "cid": 390,
     "province_thai": "อุทัยธานี",
     "province_eng": "UTHAI THANI",
     "prov_id": "UTI",
@@ -12161,8 +14187,10 @@ const PARTYLIST_RAW = [
     "turn_out": 93772,
     "percent_invalid": 4.81594,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 32624,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 21129,
     "margin": 11495,
     "valid": 88228,
@@ -12171,6 +14199,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 115,
     "province_thai": "กำแพงเพชร",
     "province_eng": "KAMPHAENG PHET",
     "prov_id": "KPT",
@@ -12179,8 +14208,10 @@ const PARTYLIST_RAW = [
     "turn_out": 106015,
     "percent_invalid": 6.40004,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 40145,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 23168,
     "margin": 16977,
     "valid": 97632,
@@ -12189,6 +14220,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 116,
     "province_thai": "กำแพงเพชร",
     "province_eng": "KAMPHAENG PHET",
     "prov_id": "KPT",
@@ -12197,8 +14229,10 @@ const PARTYLIST_RAW = [
     "turn_out": 105670,
     "percent_invalid": 6.59127,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 38763,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 24753,
     "margin": 14010,
     "valid": 97285,
@@ -12207,6 +14241,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 117,
     "province_thai": "กำแพงเพชร",
     "province_eng": "KAMPHAENG PHET",
     "prov_id": "KPT",
@@ -12215,8 +14250,10 @@ const PARTYLIST_RAW = [
     "turn_out": 94604,
     "percent_invalid": 6.83481,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 33652,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 25340,
     "margin": 8312,
     "valid": 87050,
@@ -12225,6 +14262,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 118,
     "province_thai": "กำแพงเพชร",
     "province_eng": "KAMPHAENG PHET",
     "prov_id": "KPT",
@@ -12233,8 +14271,10 @@ const PARTYLIST_RAW = [
     "turn_out": 97660,
     "percent_invalid": 5.93692,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 31477,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 29382,
     "margin": 2095,
     "valid": 90926,
@@ -12243,6 +14283,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 360,
     "province_thai": "ตาก",
     "province_eng": "TAK",
     "prov_id": "TAK",
@@ -12251,8 +14292,10 @@ const PARTYLIST_RAW = [
     "turn_out": 111712,
     "percent_invalid": 5.59653,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 40049,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 25115,
     "margin": 14934,
     "valid": 103451,
@@ -12261,6 +14304,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 361,
     "province_thai": "ตาก",
     "province_eng": "TAK",
     "prov_id": "TAK",
@@ -12269,8 +14313,10 @@ const PARTYLIST_RAW = [
     "turn_out": 94674,
     "percent_invalid": 6.23719,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 39925,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 17892,
     "margin": 22033,
     "valid": 87466,
@@ -12279,6 +14325,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 362,
     "province_thai": "ตาก",
     "province_eng": "TAK",
     "prov_id": "TAK",
@@ -12287,8 +14334,10 @@ const PARTYLIST_RAW = [
     "turn_out": 98798,
     "percent_invalid": 7.04873,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 34052,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 22574,
     "margin": 11478,
     "valid": 90977,
@@ -12297,6 +14346,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 354,
     "province_thai": "สุโขทัย",
     "province_eng": "SUKHOTHAI",
     "prov_id": "STI",
@@ -12305,8 +14355,10 @@ const PARTYLIST_RAW = [
     "turn_out": 89158,
     "percent_invalid": 4.59185,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 32668,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 26867,
     "margin": 5801,
     "valid": 83628,
@@ -12315,6 +14367,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 355,
     "province_thai": "สุโขทัย",
     "province_eng": "SUKHOTHAI",
     "prov_id": "STI",
@@ -12323,8 +14376,10 @@ const PARTYLIST_RAW = [
     "turn_out": 84373,
     "percent_invalid": 5.0739,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 28168,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 28033,
     "margin": 135,
     "valid": 79345,
@@ -12333,6 +14388,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 356,
     "province_thai": "สุโขทัย",
     "province_eng": "SUKHOTHAI",
     "prov_id": "STI",
@@ -12341,8 +14397,10 @@ const PARTYLIST_RAW = [
     "turn_out": 91645,
     "percent_invalid": 4.89825,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 37961,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 25567,
     "margin": 12394,
     "valid": 86292,
@@ -12351,6 +14409,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 357,
     "province_thai": "สุโขทัย",
     "province_eng": "SUKHOTHAI",
     "prov_id": "STI",
@@ -12359,8 +14418,10 @@ const PARTYLIST_RAW = [
     "turn_out": 89737,
     "percent_invalid": 5.22638,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 32836,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 29482,
     "margin": 3354,
     "valid": 84182,
@@ -12369,6 +14430,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 236,
     "province_thai": "พิษณุโลก",
     "province_eng": "PHITSANULOK",
     "prov_id": "PLK",
@@ -12377,8 +14439,10 @@ const PARTYLIST_RAW = [
     "turn_out": 104852,
     "percent_invalid": 2.80109,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 46452,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 20264,
     "margin": 26188,
     "valid": 99661,
@@ -12387,6 +14451,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 237,
     "province_thai": "พิษณุโลก",
     "province_eng": "PHITSANULOK",
     "prov_id": "PLK",
@@ -12395,8 +14460,10 @@ const PARTYLIST_RAW = [
     "turn_out": 112980,
     "percent_invalid": 3.61391,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 40223,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 39161,
     "margin": 1062,
     "valid": 107389,
@@ -12405,6 +14472,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 238,
     "province_thai": "พิษณุโลก",
     "province_eng": "PHITSANULOK",
     "prov_id": "PLK",
@@ -12413,8 +14481,10 @@ const PARTYLIST_RAW = [
     "turn_out": 100483,
     "percent_invalid": 5.52133,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 33029,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 28214,
     "margin": 4815,
     "valid": 93978,
@@ -12423,6 +14493,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 239,
     "province_thai": "พิษณุโลก",
     "province_eng": "PHITSANULOK",
     "prov_id": "PLK",
@@ -12431,8 +14502,10 @@ const PARTYLIST_RAW = [
     "turn_out": 97594,
     "percent_invalid": 4.98699,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 40606,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 29718,
     "margin": 10888,
     "valid": 91867,
@@ -12441,6 +14514,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 240,
     "province_thai": "พิษณุโลก",
     "province_eng": "PHITSANULOK",
     "prov_id": "PLK",
@@ -12449,8 +14523,10 @@ const PARTYLIST_RAW = [
     "turn_out": 98759,
     "percent_invalid": 4.96056,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 35477,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 22432,
     "margin": 13045,
     "valid": 92563,
@@ -12459,6 +14535,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 224,
     "province_thai": "พิจิตร",
     "province_eng": "PHICHIT",
     "prov_id": "PCT",
@@ -12467,8 +14544,10 @@ const PARTYLIST_RAW = [
     "turn_out": 109211,
     "percent_invalid": 4.5728,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 33524,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 31956,
     "margin": 1568,
     "valid": 103083,
@@ -12477,6 +14556,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 225,
     "province_thai": "พิจิตร",
     "province_eng": "PHICHIT",
     "prov_id": "PCT",
@@ -12485,8 +14565,10 @@ const PARTYLIST_RAW = [
     "turn_out": 100611,
     "percent_invalid": 4.76588,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 33524,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 29737,
     "margin": 3787,
     "valid": 95011,
@@ -12495,6 +14577,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 226,
     "province_thai": "พิจิตร",
     "province_eng": "PHICHIT",
     "prov_id": "PCT",
@@ -12503,8 +14586,10 @@ const PARTYLIST_RAW = [
     "turn_out": 105762,
     "percent_invalid": 4.62926,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 31769,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 30340,
     "margin": 1429,
     "valid": 99972,
@@ -12513,6 +14598,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 243,
     "province_thai": "เพชรบูรณ์",
     "province_eng": "PHETCHABUN",
     "prov_id": "PNB",
@@ -12521,8 +14607,10 @@ const PARTYLIST_RAW = [
     "turn_out": 96631,
     "percent_invalid": 4.48717,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 35078,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 25777,
     "margin": 9301,
     "valid": 90710,
@@ -12531,6 +14619,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -2
   },
   {
+    "cid": 244,
     "province_thai": "เพชรบูรณ์",
     "province_eng": "PHETCHABUN",
     "prov_id": "PNB",
@@ -12539,8 +14628,10 @@ const PARTYLIST_RAW = [
     "turn_out": 99420,
     "percent_invalid": 4.57453,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 33635,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 30926,
     "margin": 2709,
     "valid": 93516,
@@ -12549,6 +14640,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 245,
     "province_thai": "เพชรบูรณ์",
     "province_eng": "PHETCHABUN",
     "prov_id": "PNB",
@@ -12557,8 +14649,10 @@ const PARTYLIST_RAW = [
     "turn_out": 97258,
     "percent_invalid": 4.97954,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 35539,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 20414,
     "margin": 15125,
     "valid": 91103,
@@ -12567,6 +14661,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 246,
     "province_thai": "เพชรบูรณ์",
     "province_eng": "PHETCHABUN",
     "prov_id": "PNB",
@@ -12575,8 +14670,10 @@ const PARTYLIST_RAW = [
     "turn_out": 86560,
     "percent_invalid": 5.17098,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 31260,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 25098,
     "margin": 6162,
     "valid": 81268,
@@ -12585,6 +14682,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 247,
     "province_thai": "เพชรบูรณ์",
     "province_eng": "PHETCHABUN",
     "prov_id": "PNB",
@@ -12593,8 +14691,10 @@ const PARTYLIST_RAW = [
     "turn_out": 90939,
     "percent_invalid": 4.77903,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 32441,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 30143,
     "margin": 2298,
     "valid": 85757,
@@ -12603,6 +14703,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 248,
     "province_thai": "เพชรบูรณ์",
     "province_eng": "PHETCHABUN",
     "prov_id": "PNB",
@@ -12611,8 +14712,10 @@ const PARTYLIST_RAW = [
     "turn_out": 93742,
     "percent_invalid": 5.23458,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 33704,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 31336,
     "margin": 2368,
     "valid": 87920,
@@ -12621,6 +14724,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 270,
     "province_thai": "ราชบุรี",
     "province_eng": "RATCHABURI",
     "prov_id": "RBR",
@@ -12629,8 +14733,10 @@ const PARTYLIST_RAW = [
     "turn_out": 109540,
     "percent_invalid": 3.92459,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 47846,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 22988,
     "margin": 24858,
     "valid": 102699,
@@ -12639,6 +14745,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 271,
     "province_thai": "ราชบุรี",
     "province_eng": "RATCHABURI",
     "prov_id": "RBR",
@@ -12647,8 +14754,10 @@ const PARTYLIST_RAW = [
     "turn_out": 105493,
     "percent_invalid": 5.32832,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 43969,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 22202,
     "margin": 21767,
     "valid": 97853,
@@ -12657,6 +14766,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 272,
     "province_thai": "ราชบุรี",
     "province_eng": "RATCHABURI",
     "prov_id": "RBR",
@@ -12665,8 +14775,10 @@ const PARTYLIST_RAW = [
     "turn_out": 119245,
     "percent_invalid": 5.05598,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 47382,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 22795,
     "margin": 24587,
     "valid": 111267,
@@ -12675,6 +14787,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 273,
     "province_thai": "ราชบุรี",
     "province_eng": "RATCHABURI",
     "prov_id": "RBR",
@@ -12683,8 +14796,10 @@ const PARTYLIST_RAW = [
     "turn_out": 116293,
     "percent_invalid": 4.5308,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 47636,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 22211,
     "margin": 25425,
     "valid": 109245,
@@ -12693,6 +14808,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 274,
     "province_thai": "ราชบุรี",
     "province_eng": "RATCHABURI",
     "prov_id": "RBR",
@@ -12701,8 +14817,10 @@ const PARTYLIST_RAW = [
     "turn_out": 114793,
     "percent_invalid": 4.15792,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 46775,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 19345,
     "margin": 27430,
     "valid": 108474,
@@ -12711,6 +14829,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 119,
     "province_thai": "กาญจนบุรี",
     "province_eng": "KANCHANABURI",
     "prov_id": "KRI",
@@ -12719,8 +14838,10 @@ const PARTYLIST_RAW = [
     "turn_out": 105722,
     "percent_invalid": 4.28482,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 41531,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 25589,
     "margin": 15942,
     "valid": 99192,
@@ -12729,6 +14850,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 120,
     "province_thai": "กาญจนบุรี",
     "province_eng": "KANCHANABURI",
     "prov_id": "KRI",
@@ -12737,8 +14859,10 @@ const PARTYLIST_RAW = [
     "turn_out": 107722,
     "percent_invalid": 4.36215,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 39058,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 29229,
     "margin": 9829,
     "valid": 101681,
@@ -12747,6 +14871,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 3
   },
   {
+    "cid": 121,
     "province_thai": "กาญจนบุรี",
     "province_eng": "KANCHANABURI",
     "prov_id": "KRI",
@@ -12755,8 +14880,10 @@ const PARTYLIST_RAW = [
     "turn_out": 113156,
     "percent_invalid": 4.55301,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 40977,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 36071,
     "margin": 4906,
     "valid": 106658,
@@ -12765,6 +14892,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 122,
     "province_thai": "กาญจนบุรี",
     "province_eng": "KANCHANABURI",
     "prov_id": "KRI",
@@ -12773,8 +14901,10 @@ const PARTYLIST_RAW = [
     "turn_out": 103157,
     "percent_invalid": 5.96082,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 39467,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 32265,
     "margin": 7202,
     "valid": 96191,
@@ -12783,6 +14913,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 123,
     "province_thai": "กาญจนบุรี",
     "province_eng": "KANCHANABURI",
     "prov_id": "KRI",
@@ -12791,8 +14922,10 @@ const PARTYLIST_RAW = [
     "turn_out": 87806,
     "percent_invalid": 5.82193,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 32094,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 24426,
     "margin": 7668,
     "valid": 81787,
@@ -12801,6 +14934,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 320,
     "province_thai": "สุพรรณบุรี",
     "province_eng": "SUPHAN BURI",
     "prov_id": "SPB",
@@ -12809,8 +14943,10 @@ const PARTYLIST_RAW = [
     "turn_out": 101837,
     "percent_invalid": 3.4732,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 38241,
     "runnerup_party": "ชาติไทยพัฒนา",
+    "runnerup_pid": 5,
     "runnerup_votes": 25288,
     "margin": 12953,
     "valid": 96748,
@@ -12819,6 +14955,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 321,
     "province_thai": "สุพรรณบุรี",
     "province_eng": "SUPHAN BURI",
     "prov_id": "SPB",
@@ -12827,8 +14964,10 @@ const PARTYLIST_RAW = [
     "turn_out": 97620,
     "percent_invalid": 3.1766,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 34094,
     "runnerup_party": "ชาติไทยพัฒนา",
+    "runnerup_pid": 5,
     "runnerup_votes": 26156,
     "margin": 7938,
     "valid": 93653,
@@ -12837,6 +14976,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 322,
     "province_thai": "สุพรรณบุรี",
     "province_eng": "SUPHAN BURI",
     "prov_id": "SPB",
@@ -12845,8 +14985,10 @@ const PARTYLIST_RAW = [
     "turn_out": 104692,
     "percent_invalid": 4.22191,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 34832,
     "runnerup_party": "ชาติไทยพัฒนา",
+    "runnerup_pid": 5,
     "runnerup_votes": 23880,
     "margin": 10952,
     "valid": 99216,
@@ -12855,6 +14997,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 323,
     "province_thai": "สุพรรณบุรี",
     "province_eng": "SUPHAN BURI",
     "prov_id": "SPB",
@@ -12863,8 +15006,10 @@ const PARTYLIST_RAW = [
     "turn_out": 108644,
     "percent_invalid": 4.88384,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 35933,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 32374,
     "margin": 3559,
     "valid": 102481,
@@ -12873,6 +15018,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 2
   },
   {
+    "cid": 324,
     "province_thai": "สุพรรณบุรี",
     "province_eng": "SUPHAN BURI",
     "prov_id": "SPB",
@@ -12881,8 +15027,10 @@ const PARTYLIST_RAW = [
     "turn_out": 114168,
     "percent_invalid": 4.13689,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 39111,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 29857,
     "margin": 9254,
     "valid": 108363,
@@ -12891,6 +15039,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 192,
     "province_thai": "นครปฐม",
     "province_eng": "NAKHON PATHOM",
     "prov_id": "NPT",
@@ -12899,8 +15048,10 @@ const PARTYLIST_RAW = [
     "turn_out": 107368,
     "percent_invalid": 3.60629,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 48088,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 21648,
     "margin": 26440,
     "valid": 102027,
@@ -12909,6 +15060,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 193,
     "province_thai": "นครปฐม",
     "province_eng": "NAKHON PATHOM",
     "prov_id": "NPT",
@@ -12917,8 +15069,10 @@ const PARTYLIST_RAW = [
     "turn_out": 99830,
     "percent_invalid": 2.939,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 46909,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 19077,
     "margin": 27832,
     "valid": 94961,
@@ -12927,6 +15081,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 194,
     "province_thai": "นครปฐม",
     "province_eng": "NAKHON PATHOM",
     "prov_id": "NPT",
@@ -12935,8 +15090,10 @@ const PARTYLIST_RAW = [
     "turn_out": 97261,
     "percent_invalid": 3.73017,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 40180,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 28165,
     "margin": 12015,
     "valid": 92164,
@@ -12945,6 +15102,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 195,
     "province_thai": "นครปฐม",
     "province_eng": "NAKHON PATHOM",
     "prov_id": "NPT",
@@ -12953,8 +15111,10 @@ const PARTYLIST_RAW = [
     "turn_out": 107157,
     "percent_invalid": 3.5518,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 42303,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 34487,
     "margin": 7816,
     "valid": 102113,
@@ -12963,6 +15123,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 196,
     "province_thai": "นครปฐม",
     "province_eng": "NAKHON PATHOM",
     "prov_id": "NPT",
@@ -12971,8 +15132,10 @@ const PARTYLIST_RAW = [
     "turn_out": 108608,
     "percent_invalid": 3.18209,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 46561,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 24453,
     "margin": 22108,
     "valid": 103393,
@@ -12981,6 +15144,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 197,
     "province_thai": "นครปฐม",
     "province_eng": "NAKHON PATHOM",
     "prov_id": "NPT",
@@ -12989,8 +15153,10 @@ const PARTYLIST_RAW = [
     "turn_out": 97550,
     "percent_invalid": 2.26038,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 49695,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 18985,
     "margin": 30710,
     "valid": 93886,
@@ -12999,6 +15165,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 300,
     "province_thai": "สมุทรสาคร",
     "province_eng": "SAMUT SAKHON",
     "prov_id": "SKN",
@@ -13007,8 +15174,10 @@ const PARTYLIST_RAW = [
     "turn_out": 117460,
     "percent_invalid": 2.7686,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 59222,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 22150,
     "margin": 37072,
     "valid": 112359,
@@ -13017,6 +15186,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -4
   },
   {
+    "cid": 301,
     "province_thai": "สมุทรสาคร",
     "province_eng": "SAMUT SAKHON",
     "prov_id": "SKN",
@@ -13025,8 +15195,10 @@ const PARTYLIST_RAW = [
     "turn_out": 112850,
     "percent_invalid": 2.4475,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 58322,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 23821,
     "margin": 34501,
     "valid": 108584,
@@ -13035,6 +15207,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 2
   },
   {
+    "cid": 302,
     "province_thai": "สมุทรสาคร",
     "province_eng": "SAMUT SAKHON",
     "prov_id": "SKN",
@@ -13043,8 +15216,10 @@ const PARTYLIST_RAW = [
     "turn_out": 119698,
     "percent_invalid": 3.68761,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 54616,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 21582,
     "margin": 33034,
     "valid": 113324,
@@ -13053,16 +15228,19 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 401,
     "province_thai": "สมุทรสาคร",
     "province_eng": "SAMUT SAKHON",
     "prov_id": "SKN",
     "cons_no": 4,
     "region": "Central",
     "turn_out": 0,
-    "percent_invalid": 0,
+    "percent_invalid": 0.0,
     "winner_party": "Unknown",
+    "winner_pid": -1,
     "winner_votes": 0,
     "runnerup_party": "Unknown",
+    "runnerup_pid": -1,
     "runnerup_votes": 0,
     "margin": 0,
     "valid": 0,
@@ -13071,6 +15249,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 299,
     "province_thai": "สมุทรสงคราม",
     "province_eng": "SAMUT SONGKHRAM",
     "prov_id": "SKM",
@@ -13079,8 +15258,10 @@ const PARTYLIST_RAW = [
     "turn_out": 120854,
     "percent_invalid": 3.84431,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 54294,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 22455,
     "margin": 31839,
     "valid": 113843,
@@ -13089,6 +15270,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 221,
     "province_thai": "เพชรบุรี",
     "province_eng": "PHETCHABURI",
     "prov_id": "PBI",
@@ -13097,8 +15279,10 @@ const PARTYLIST_RAW = [
     "turn_out": 104809,
     "percent_invalid": 3.79452,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 38451,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 25502,
     "margin": 12949,
     "valid": 99165,
@@ -13107,6 +15291,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 222,
     "province_thai": "เพชรบุรี",
     "province_eng": "PHETCHABURI",
     "prov_id": "PBI",
@@ -13115,8 +15300,10 @@ const PARTYLIST_RAW = [
     "turn_out": 113627,
     "percent_invalid": 4.8976,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 42799,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 21383,
     "margin": 21416,
     "valid": 106718,
@@ -13125,6 +15312,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 223,
     "province_thai": "เพชรบุรี",
     "province_eng": "PHETCHABURI",
     "prov_id": "PBI",
@@ -13133,8 +15321,10 @@ const PARTYLIST_RAW = [
     "turn_out": 110142,
     "percent_invalid": 4.58317,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 38649,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 22683,
     "margin": 15966,
     "valid": 103602,
@@ -13143,6 +15333,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 227,
     "province_thai": "ประจวบคีรีขันธ์",
     "province_eng": "PRACHUAP KHIRI KHAN",
     "prov_id": "PKN",
@@ -13151,8 +15342,10 @@ const PARTYLIST_RAW = [
     "turn_out": 114565,
     "percent_invalid": 5.13158,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 41982,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 18132,
     "margin": 23850,
     "valid": 106893,
@@ -13161,6 +15354,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 228,
     "province_thai": "ประจวบคีรีขันธ์",
     "province_eng": "PRACHUAP KHIRI KHAN",
     "prov_id": "PKN",
@@ -13169,8 +15363,10 @@ const PARTYLIST_RAW = [
     "turn_out": 110410,
     "percent_invalid": 3.94529,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 41347,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 22356,
     "margin": 18991,
     "valid": 104612,
@@ -13179,6 +15375,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 229,
     "province_thai": "ประจวบคีรีขันธ์",
     "province_eng": "PRACHUAP KHIRI KHAN",
     "prov_id": "PKN",
@@ -13187,8 +15384,10 @@ const PARTYLIST_RAW = [
     "turn_out": 103476,
     "percent_invalid": 5.07171,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 36639,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 24151,
     "margin": 12488,
     "valid": 96807,
@@ -13197,6 +15396,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 204,
     "province_thai": "นครศรีธรรมราช",
     "province_eng": "NAKHON SI THAMMARAT",
     "prov_id": "NST",
@@ -13205,8 +15405,10 @@ const PARTYLIST_RAW = [
     "turn_out": 91015,
     "percent_invalid": 3.72906,
     "winner_party": "รวมไทยสร้างชาติ",
+    "winner_pid": 50,
     "winner_votes": 34578,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 27785,
     "margin": 6793,
     "valid": 86058,
@@ -13215,6 +15417,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 205,
     "province_thai": "นครศรีธรรมราช",
     "province_eng": "NAKHON SI THAMMARAT",
     "prov_id": "NST",
@@ -13223,8 +15426,10 @@ const PARTYLIST_RAW = [
     "turn_out": 98651,
     "percent_invalid": 4.43381,
     "winner_party": "รวมไทยสร้างชาติ",
+    "winner_pid": 50,
     "winner_votes": 37891,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 28049,
     "margin": 9842,
     "valid": 92410,
@@ -13233,6 +15438,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 206,
     "province_thai": "นครศรีธรรมราช",
     "province_eng": "NAKHON SI THAMMARAT",
     "prov_id": "NST",
@@ -13241,8 +15447,10 @@ const PARTYLIST_RAW = [
     "turn_out": 94474,
     "percent_invalid": 5.02678,
     "winner_party": "รวมไทยสร้างชาติ",
+    "winner_pid": 50,
     "winner_votes": 42181,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 22435,
     "margin": 19746,
     "valid": 88723,
@@ -13251,6 +15459,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 207,
     "province_thai": "นครศรีธรรมราช",
     "province_eng": "NAKHON SI THAMMARAT",
     "prov_id": "NST",
@@ -13259,8 +15468,10 @@ const PARTYLIST_RAW = [
     "turn_out": 93949,
     "percent_invalid": 4.48541,
     "winner_party": "รวมไทยสร้างชาติ",
+    "winner_pid": 50,
     "winner_votes": 34814,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 24004,
     "margin": 10810,
     "valid": 87975,
@@ -13269,6 +15480,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 208,
     "province_thai": "นครศรีธรรมราช",
     "province_eng": "NAKHON SI THAMMARAT",
     "prov_id": "NST",
@@ -13277,8 +15489,10 @@ const PARTYLIST_RAW = [
     "turn_out": 94919,
     "percent_invalid": 4.09718,
     "winner_party": "รวมไทยสร้างชาติ",
+    "winner_pid": 50,
     "winner_votes": 31626,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 25877,
     "margin": 5749,
     "valid": 89437,
@@ -13287,6 +15501,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 209,
     "province_thai": "นครศรีธรรมราช",
     "province_eng": "NAKHON SI THAMMARAT",
     "prov_id": "NST",
@@ -13295,8 +15510,10 @@ const PARTYLIST_RAW = [
     "turn_out": 85160,
     "percent_invalid": 3.60263,
     "winner_party": "รวมไทยสร้างชาติ",
+    "winner_pid": 50,
     "winner_votes": 27191,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 24527,
     "margin": 2664,
     "valid": 80505,
@@ -13305,6 +15522,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 210,
     "province_thai": "นครศรีธรรมราช",
     "province_eng": "NAKHON SI THAMMARAT",
     "prov_id": "NST",
@@ -13313,8 +15531,10 @@ const PARTYLIST_RAW = [
     "turn_out": 90304,
     "percent_invalid": 4.29438,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 28990,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 24613,
     "margin": 4377,
     "valid": 84800,
@@ -13323,6 +15543,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 211,
     "province_thai": "นครศรีธรรมราช",
     "province_eng": "NAKHON SI THAMMARAT",
     "prov_id": "NST",
@@ -13331,8 +15552,10 @@ const PARTYLIST_RAW = [
     "turn_out": 90014,
     "percent_invalid": 4.73926,
     "winner_party": "รวมไทยสร้างชาติ",
+    "winner_pid": 50,
     "winner_votes": 27441,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 24245,
     "margin": 3196,
     "valid": 83710,
@@ -13341,6 +15564,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 212,
     "province_thai": "นครศรีธรรมราช",
     "province_eng": "NAKHON SI THAMMARAT",
     "prov_id": "NST",
@@ -13349,8 +15573,10 @@ const PARTYLIST_RAW = [
     "turn_out": 90382,
     "percent_invalid": 4.36923,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 29687,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 25407,
     "margin": 4280,
     "valid": 85108,
@@ -13359,6 +15585,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 101,
     "province_thai": "กระบี่",
     "province_eng": "KRABI",
     "prov_id": "KBI",
@@ -13367,8 +15594,10 @@ const PARTYLIST_RAW = [
     "turn_out": 102097,
     "percent_invalid": 3.67298,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 31614,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 23688,
     "margin": 7926,
     "valid": 96881,
@@ -13377,6 +15606,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 102,
     "province_thai": "กระบี่",
     "province_eng": "KRABI",
     "prov_id": "KBI",
@@ -13385,8 +15615,10 @@ const PARTYLIST_RAW = [
     "turn_out": 93287,
     "percent_invalid": 5.11111,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 26368,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 25195,
     "margin": 1173,
     "valid": 87076,
@@ -13395,6 +15627,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 103,
     "province_thai": "กระบี่",
     "province_eng": "KRABI",
     "prov_id": "KBI",
@@ -13403,8 +15636,10 @@ const PARTYLIST_RAW = [
     "turn_out": 99453,
     "percent_invalid": 3.95564,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 26595,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 19452,
     "margin": 7143,
     "valid": 94309,
@@ -13413,6 +15648,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 241,
     "province_thai": "พังงา",
     "province_eng": "PHANGNGA",
     "prov_id": "PNA",
@@ -13421,8 +15657,10 @@ const PARTYLIST_RAW = [
     "turn_out": 77533,
     "percent_invalid": 3.89383,
     "winner_party": "รวมไทยสร้างชาติ",
+    "winner_pid": 50,
     "winner_votes": 23950,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 22634,
     "margin": 1316,
     "valid": 72872,
@@ -13431,6 +15669,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -2
   },
   {
+    "cid": 242,
     "province_thai": "พังงา",
     "province_eng": "PHANGNGA",
     "prov_id": "PNA",
@@ -13439,8 +15678,10 @@ const PARTYLIST_RAW = [
     "turn_out": 84059,
     "percent_invalid": 4.17088,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 24716,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 22172,
     "margin": 2544,
     "valid": 78389,
@@ -13449,6 +15690,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -2
   },
   {
+    "cid": 230,
     "province_thai": "ภูเก็ต",
     "province_eng": "PHUKET",
     "prov_id": "PKT",
@@ -13457,8 +15699,10 @@ const PARTYLIST_RAW = [
     "turn_out": 76178,
     "percent_invalid": 2.57555,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 29731,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 25446,
     "margin": 4285,
     "valid": 72881,
@@ -13467,6 +15711,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 231,
     "province_thai": "ภูเก็ต",
     "province_eng": "PHUKET",
     "prov_id": "PKT",
@@ -13475,8 +15720,10 @@ const PARTYLIST_RAW = [
     "turn_out": 75073,
     "percent_invalid": 2.63477,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 30072,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 22589,
     "margin": 7483,
     "valid": 71631,
@@ -13485,6 +15732,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 232,
     "province_thai": "ภูเก็ต",
     "province_eng": "PHUKET",
     "prov_id": "PKT",
@@ -13493,8 +15741,10 @@ const PARTYLIST_RAW = [
     "turn_out": 83826,
     "percent_invalid": 2.92033,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 32762,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 23157,
     "margin": 9605,
     "valid": 79798,
@@ -13503,6 +15753,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 306,
     "province_thai": "สุราษฎร์ธานี",
     "province_eng": "SURAT THANI",
     "prov_id": "SNI",
@@ -13511,8 +15762,10 @@ const PARTYLIST_RAW = [
     "turn_out": 88545,
     "percent_invalid": 2.54447,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 33547,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 30439,
     "margin": 3108,
     "valid": 84526,
@@ -13521,6 +15774,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 307,
     "province_thai": "สุราษฎร์ธานี",
     "province_eng": "SURAT THANI",
     "prov_id": "SNI",
@@ -13529,8 +15783,10 @@ const PARTYLIST_RAW = [
     "turn_out": 84772,
     "percent_invalid": 3.77011,
     "winner_party": "รวมไทยสร้างชาติ",
+    "winner_pid": 50,
     "winner_votes": 28467,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 27452,
     "margin": 1015,
     "valid": 80209,
@@ -13539,6 +15795,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 308,
     "province_thai": "สุราษฎร์ธานี",
     "province_eng": "SURAT THANI",
     "prov_id": "SNI",
@@ -13547,8 +15804,10 @@ const PARTYLIST_RAW = [
     "turn_out": 92608,
     "percent_invalid": 4.04285,
     "winner_party": "รวมไทยสร้างชาติ",
+    "winner_pid": 50,
     "winner_votes": 32543,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 28468,
     "margin": 4075,
     "valid": 87170,
@@ -13557,6 +15816,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 2
   },
   {
+    "cid": 309,
     "province_thai": "สุราษฎร์ธานี",
     "province_eng": "SURAT THANI",
     "prov_id": "SNI",
@@ -13565,8 +15825,10 @@ const PARTYLIST_RAW = [
     "turn_out": 89546,
     "percent_invalid": 3.64617,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 29374,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 24245,
     "margin": 5129,
     "valid": 83809,
@@ -13575,6 +15837,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 310,
     "province_thai": "สุราษฎร์ธานี",
     "province_eng": "SURAT THANI",
     "prov_id": "SNI",
@@ -13583,8 +15846,10 @@ const PARTYLIST_RAW = [
     "turn_out": 86830,
     "percent_invalid": 3.94103,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 28309,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 24318,
     "margin": 3991,
     "valid": 81216,
@@ -13593,6 +15858,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 311,
     "province_thai": "สุราษฎร์ธานี",
     "province_eng": "SURAT THANI",
     "prov_id": "SNI",
@@ -13601,8 +15867,10 @@ const PARTYLIST_RAW = [
     "turn_out": 96741,
     "percent_invalid": 4.00141,
     "winner_party": "รวมไทยสร้างชาติ",
+    "winner_pid": 50,
     "winner_votes": 28702,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 27975,
     "margin": 727,
     "valid": 91012,
@@ -13611,6 +15879,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 312,
     "province_thai": "สุราษฎร์ธานี",
     "province_eng": "SURAT THANI",
     "prov_id": "SNI",
@@ -13619,8 +15888,10 @@ const PARTYLIST_RAW = [
     "turn_out": 90881,
     "percent_invalid": 3.12497,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 32310,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 28650,
     "margin": 3660,
     "valid": 85780,
@@ -13629,6 +15900,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 283,
     "province_thai": "ระนอง",
     "province_eng": "RANONG",
     "prov_id": "RNG",
@@ -13637,8 +15909,10 @@ const PARTYLIST_RAW = [
     "turn_out": 105944,
     "percent_invalid": 4.1201,
     "winner_party": "รวมไทยสร้างชาติ",
+    "winner_pid": 50,
     "winner_votes": 39075,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 30550,
     "margin": 8525,
     "valid": 99867,
@@ -13647,6 +15921,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 88,
     "province_thai": "ชุมพร",
     "province_eng": "CHUMPHON",
     "prov_id": "CPN",
@@ -13655,8 +15930,10 @@ const PARTYLIST_RAW = [
     "turn_out": 108261,
     "percent_invalid": 3.76313,
     "winner_party": "รวมไทยสร้างชาติ",
+    "winner_pid": 50,
     "winner_votes": 49903,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 28043,
     "margin": 21860,
     "valid": 102149,
@@ -13665,6 +15942,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 89,
     "province_thai": "ชุมพร",
     "province_eng": "CHUMPHON",
     "prov_id": "CPN",
@@ -13673,8 +15951,10 @@ const PARTYLIST_RAW = [
     "turn_out": 108613,
     "percent_invalid": 4.43685,
     "winner_party": "รวมไทยสร้างชาติ",
+    "winner_pid": 50,
     "winner_votes": 44992,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 28390,
     "margin": 16602,
     "valid": 101897,
@@ -13683,6 +15963,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 90,
     "province_thai": "ชุมพร",
     "province_eng": "CHUMPHON",
     "prov_id": "CPN",
@@ -13691,8 +15972,10 @@ const PARTYLIST_RAW = [
     "turn_out": 101559,
     "percent_invalid": 3.6629,
     "winner_party": "รวมไทยสร้างชาติ",
+    "winner_pid": 50,
     "winner_votes": 38123,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 27568,
     "margin": 10555,
     "valid": 95711,
@@ -13701,6 +15984,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 290,
     "province_thai": "สงขลา",
     "province_eng": "SONGKHLA",
     "prov_id": "SKA",
@@ -13709,8 +15993,10 @@ const PARTYLIST_RAW = [
     "turn_out": 102283,
     "percent_invalid": 3.58711,
     "winner_party": "รวมไทยสร้างชาติ",
+    "winner_pid": 50,
     "winner_votes": 35792,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 31055,
     "margin": 4737,
     "valid": 96535,
@@ -13719,6 +16005,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 2
   },
   {
+    "cid": 291,
     "province_thai": "สงขลา",
     "province_eng": "SONGKHLA",
     "prov_id": "SKA",
@@ -13727,8 +16014,10 @@ const PARTYLIST_RAW = [
     "turn_out": 86476,
     "percent_invalid": 2.68283,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 30324,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 28833,
     "margin": 1491,
     "valid": 82763,
@@ -13737,6 +16026,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 292,
     "province_thai": "สงขลา",
     "province_eng": "SONGKHLA",
     "prov_id": "SKA",
@@ -13745,8 +16035,10 @@ const PARTYLIST_RAW = [
     "turn_out": 107757,
     "percent_invalid": 3.4949,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 32224,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 29963,
     "margin": 2261,
     "valid": 102169,
@@ -13755,6 +16047,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 293,
     "province_thai": "สงขลา",
     "province_eng": "SONGKHLA",
     "prov_id": "SKA",
@@ -13763,8 +16056,10 @@ const PARTYLIST_RAW = [
     "turn_out": 102834,
     "percent_invalid": 5.19284,
     "winner_party": "รวมไทยสร้างชาติ",
+    "winner_pid": 50,
     "winner_votes": 35878,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 24870,
     "margin": 11008,
     "valid": 96117,
@@ -13773,6 +16068,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 294,
     "province_thai": "สงขลา",
     "province_eng": "SONGKHLA",
     "prov_id": "SKA",
@@ -13781,8 +16077,10 @@ const PARTYLIST_RAW = [
     "turn_out": 103190,
     "percent_invalid": 5.1817,
     "winner_party": "รวมไทยสร้างชาติ",
+    "winner_pid": 50,
     "winner_votes": 31462,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 28454,
     "margin": 3008,
     "valid": 95396,
@@ -13791,6 +16089,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 295,
     "province_thai": "สงขลา",
     "province_eng": "SONGKHLA",
     "prov_id": "SKA",
@@ -13799,8 +16098,10 @@ const PARTYLIST_RAW = [
     "turn_out": 92676,
     "percent_invalid": 3.93198,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 29342,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 22339,
     "margin": 7003,
     "valid": 87814,
@@ -13809,6 +16110,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 296,
     "province_thai": "สงขลา",
     "province_eng": "SONGKHLA",
     "prov_id": "SKA",
@@ -13817,8 +16119,10 @@ const PARTYLIST_RAW = [
     "turn_out": 99374,
     "percent_invalid": 4.89565,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 24842,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 14154,
     "margin": 10688,
     "valid": 93163,
@@ -13827,6 +16131,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 297,
     "province_thai": "สงขลา",
     "province_eng": "SONGKHLA",
     "prov_id": "SKA",
@@ -13835,8 +16140,10 @@ const PARTYLIST_RAW = [
     "turn_out": 97418,
     "percent_invalid": 4.80096,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 26337,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 18531,
     "margin": 7806,
     "valid": 91075,
@@ -13845,6 +16152,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 298,
     "province_thai": "สงขลา",
     "province_eng": "SONGKHLA",
     "prov_id": "SKA",
@@ -13853,8 +16161,10 @@ const PARTYLIST_RAW = [
     "turn_out": 107214,
     "percent_invalid": 3.55271,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 35069,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 27771,
     "margin": 7298,
     "valid": 101589,
@@ -13863,6 +16173,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 358,
     "province_thai": "สตูล",
     "province_eng": "SATUN",
     "prov_id": "STN",
@@ -13871,8 +16182,10 @@ const PARTYLIST_RAW = [
     "turn_out": 88647,
     "percent_invalid": 4.53146,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 27841,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 19903,
     "margin": 7938,
     "valid": 82407,
@@ -13881,6 +16194,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 359,
     "province_thai": "สตูล",
     "province_eng": "SATUN",
     "prov_id": "STN",
@@ -13889,8 +16203,10 @@ const PARTYLIST_RAW = [
     "turn_out": 105509,
     "percent_invalid": 3.98449,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 34849,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 18662,
     "margin": 16187,
     "valid": 99587,
@@ -13899,6 +16215,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -1
   },
   {
+    "cid": 363,
     "province_thai": "ตรัง",
     "province_eng": "TRANG",
     "prov_id": "TRG",
@@ -13907,8 +16224,10 @@ const PARTYLIST_RAW = [
     "turn_out": 102067,
     "percent_invalid": 3.05192,
     "winner_party": "รวมไทยสร้างชาติ",
+    "winner_pid": 50,
     "winner_votes": 34380,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 30281,
     "margin": 4099,
     "valid": 96504,
@@ -13917,6 +16236,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -23
   },
   {
+    "cid": 364,
     "province_thai": "ตรัง",
     "province_eng": "TRANG",
     "prov_id": "TRG",
@@ -13925,8 +16245,10 @@ const PARTYLIST_RAW = [
     "turn_out": 104800,
     "percent_invalid": 3.92939,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 32108,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 24462,
     "margin": 7646,
     "valid": 98647,
@@ -13935,6 +16257,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": -3
   },
   {
+    "cid": 365,
     "province_thai": "ตรัง",
     "province_eng": "TRANG",
     "prov_id": "TRG",
@@ -13943,8 +16266,10 @@ const PARTYLIST_RAW = [
     "turn_out": 95612,
     "percent_invalid": 4.37602,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 29197,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 27450,
     "margin": 1747,
     "valid": 88158,
@@ -13953,6 +16278,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 366,
     "province_thai": "ตรัง",
     "province_eng": "TRANG",
     "prov_id": "TRG",
@@ -13961,8 +16287,10 @@ const PARTYLIST_RAW = [
     "turn_out": 101994,
     "percent_invalid": 3.98357,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 31466,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 27871,
     "margin": 3595,
     "valid": 96148,
@@ -13971,6 +16299,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 233,
     "province_thai": "พัทลุง",
     "province_eng": "PHATTHALUNG",
     "prov_id": "PLG",
@@ -13979,8 +16308,10 @@ const PARTYLIST_RAW = [
     "turn_out": 113907,
     "percent_invalid": 3.39312,
     "winner_party": "ก้าวไกล",
+    "winner_pid": 23,
     "winner_votes": 32735,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 30896,
     "margin": 1839,
     "valid": 108434,
@@ -13989,6 +16320,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 234,
     "province_thai": "พัทลุง",
     "province_eng": "PHATTHALUNG",
     "prov_id": "PLG",
@@ -13997,8 +16329,10 @@ const PARTYLIST_RAW = [
     "turn_out": 122339,
     "percent_invalid": 3.93497,
     "winner_party": "รวมไทยสร้างชาติ",
+    "winner_pid": 50,
     "winner_votes": 37393,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 34482,
     "margin": 2911,
     "valid": 116006,
@@ -14007,6 +16341,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 235,
     "province_thai": "พัทลุง",
     "province_eng": "PHATTHALUNG",
     "prov_id": "PLG",
@@ -14015,8 +16350,10 @@ const PARTYLIST_RAW = [
     "turn_out": 116331,
     "percent_invalid": 4.14421,
     "winner_party": "รวมไทยสร้างชาติ",
+    "winner_pid": 50,
     "winner_votes": 30118,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 28966,
     "margin": 1152,
     "valid": 109343,
@@ -14025,6 +16362,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 262,
     "province_thai": "ปัตตานี",
     "province_eng": "PATTANI",
     "prov_id": "PTN",
@@ -14033,8 +16371,10 @@ const PARTYLIST_RAW = [
     "turn_out": 75246,
     "percent_invalid": 4.03477,
     "winner_party": "ประชาชาติ",
+    "winner_pid": 35,
     "winner_votes": 25916,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 22967,
     "margin": 2949,
     "valid": 70873,
@@ -14043,6 +16383,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 263,
     "province_thai": "ปัตตานี",
     "province_eng": "PATTANI",
     "prov_id": "PTN",
@@ -14051,8 +16392,10 @@ const PARTYLIST_RAW = [
     "turn_out": 84368,
     "percent_invalid": 5.04457,
     "winner_party": "ประชาชาติ",
+    "winner_pid": 35,
     "winner_votes": 30608,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 18089,
     "margin": 12519,
     "valid": 79068,
@@ -14061,6 +16404,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 264,
     "province_thai": "ปัตตานี",
     "province_eng": "PATTANI",
     "prov_id": "PTN",
@@ -14069,8 +16413,10 @@ const PARTYLIST_RAW = [
     "turn_out": 71580,
     "percent_invalid": 5.20397,
     "winner_party": "ประชาชาติ",
+    "winner_pid": 35,
     "winner_votes": 38383,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 13918,
     "margin": 24465,
     "valid": 67130,
@@ -14079,6 +16425,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 1
   },
   {
+    "cid": 265,
     "province_thai": "ปัตตานี",
     "province_eng": "PATTANI",
     "prov_id": "PTN",
@@ -14087,8 +16434,10 @@ const PARTYLIST_RAW = [
     "turn_out": 83889,
     "percent_invalid": 4.86834,
     "winner_party": "ประชาชาติ",
+    "winner_pid": 35,
     "winner_votes": 41464,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 16087,
     "margin": 25377,
     "valid": 79041,
@@ -14097,6 +16446,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 266,
     "province_thai": "ปัตตานี",
     "province_eng": "PATTANI",
     "prov_id": "PTN",
@@ -14105,8 +16455,10 @@ const PARTYLIST_RAW = [
     "turn_out": 78884,
     "percent_invalid": 5.53851,
     "winner_party": "ประชาชาติ",
+    "winner_pid": 35,
     "winner_votes": 43773,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 14212,
     "margin": 29561,
     "valid": 73882,
@@ -14115,6 +16467,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 394,
     "province_thai": "ยะลา",
     "province_eng": "YALA",
     "prov_id": "YLA",
@@ -14123,8 +16476,10 @@ const PARTYLIST_RAW = [
     "turn_out": 99228,
     "percent_invalid": 4.60152,
     "winner_party": "ประชาชาติ",
+    "winner_pid": 35,
     "winner_votes": 30196,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 26281,
     "margin": 3915,
     "valid": 92742,
@@ -14133,6 +16488,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 395,
     "province_thai": "ยะลา",
     "province_eng": "YALA",
     "prov_id": "YLA",
@@ -14141,8 +16497,10 @@ const PARTYLIST_RAW = [
     "turn_out": 100319,
     "percent_invalid": 6.25106,
     "winner_party": "ประชาชาติ",
+    "winner_pid": 35,
     "winner_votes": 55426,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 19011,
     "margin": 36415,
     "valid": 92745,
@@ -14151,6 +16509,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 396,
     "province_thai": "ยะลา",
     "province_eng": "YALA",
     "prov_id": "YLA",
@@ -14159,8 +16518,10 @@ const PARTYLIST_RAW = [
     "turn_out": 97956,
     "percent_invalid": 5.19111,
     "winner_party": "ประชาชาติ",
+    "winner_pid": 35,
     "winner_votes": 40863,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 21094,
     "margin": 19769,
     "valid": 91342,
@@ -14169,6 +16530,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 214,
     "province_thai": "นราธิวาส",
     "province_eng": "NARATHIWAT",
     "prov_id": "NWT",
@@ -14177,8 +16539,10 @@ const PARTYLIST_RAW = [
     "turn_out": 98791,
     "percent_invalid": 5.06726,
     "winner_party": "ประชาชาติ",
+    "winner_pid": 35,
     "winner_votes": 38405,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 21755,
     "margin": 16650,
     "valid": 92391,
@@ -14187,6 +16551,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 215,
     "province_thai": "นราธิวาส",
     "province_eng": "NARATHIWAT",
     "prov_id": "NWT",
@@ -14195,8 +16560,10 @@ const PARTYLIST_RAW = [
     "turn_out": 81596,
     "percent_invalid": 5.81524,
     "winner_party": "ประชาชาติ",
+    "winner_pid": 35,
     "winner_votes": 27817,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 15852,
     "margin": 11965,
     "valid": 76050,
@@ -14205,6 +16572,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 216,
     "province_thai": "นราธิวาส",
     "province_eng": "NARATHIWAT",
     "prov_id": "NWT",
@@ -14213,8 +16581,10 @@ const PARTYLIST_RAW = [
     "turn_out": 80412,
     "percent_invalid": 5.96055,
     "winner_party": "ประชาชาติ",
+    "winner_pid": 35,
     "winner_votes": 37850,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 13853,
     "margin": 23997,
     "valid": 75013,
@@ -14223,6 +16593,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 217,
     "province_thai": "นราธิวาส",
     "province_eng": "NARATHIWAT",
     "prov_id": "NWT",
@@ -14231,8 +16602,10 @@ const PARTYLIST_RAW = [
     "turn_out": 85575,
     "percent_invalid": 5.98072,
     "winner_party": "ประชาชาติ",
+    "winner_pid": 35,
     "winner_votes": 39147,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 16166,
     "margin": 22981,
     "valid": 79713,
@@ -14241,6 +16614,7 @@ const PARTYLIST_RAW = [
     "ballot_surplus": 0
   },
   {
+    "cid": 218,
     "province_thai": "นราธิวาส",
     "province_eng": "NARATHIWAT",
     "prov_id": "NWT",
@@ -14249,8 +16623,10 @@ const PARTYLIST_RAW = [
     "turn_out": 95803,
     "percent_invalid": 6.23884,
     "winner_party": "ประชาชาติ",
+    "winner_pid": 35,
     "winner_votes": 47279,
     "runnerup_party": "ก้าวไกล",
+    "runnerup_pid": 23,
     "runnerup_votes": 18116,
     "margin": 29163,
     "valid": 89229,
@@ -1,5 +1,6 @@
 const CONST_RAW = [
   {
+    "cid": 101,
     "province_thai": "กระบี่",
     "province_eng": "KRABI",
     "prov_id": "KBI",
@@ -11,14 +12,17 @@ const CONST_RAW = [
     "invalid": 2599,
     "blank": 4407,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 47972,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 19641,
     "margin": 28331,
     "percent_invalid": 2.80630149115135,
     "ballot_surplus": 6
   },
   {
+    "cid": 102,
     "province_thai": "กระบี่",
     "province_eng": "KRABI",
     "prov_id": "KBI",
@@ -30,14 +34,17 @@ const CONST_RAW = [
     "invalid": 2435,
     "blank": 4055,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 39705,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 19674,
     "margin": 20031,
     "percent_invalid": 3.100449469676713,
     "ballot_surplus": -75
   },
   {
+    "cid": 103,
     "province_thai": "กระบี่",
     "province_eng": "KRABI",
     "prov_id": "KBI",
@@ -49,14 +56,17 @@ const CONST_RAW = [
     "invalid": 2749,
     "blank": 3715,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 45246,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 14920,
     "margin": 30326,
     "percent_invalid": 3.0610767774622794,
     "ballot_surplus": 4077
   },
   {
+    "cid": 9,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -68,14 +78,17 @@ const CONST_RAW = [
     "invalid": 1083,
     "blank": 4012,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 32564,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 14018,
     "margin": 18546,
     "percent_invalid": 1.3805147293145865,
     "ballot_surplus": 294
   },
   {
+    "cid": 10,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -87,14 +100,17 @@ const CONST_RAW = [
     "invalid": 1319,
     "blank": 4640,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 37055,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 15002,
     "margin": 22053,
     "percent_invalid": 1.557775888133031,
     "ballot_surplus": 122
   },
   {
+    "cid": 11,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -106,14 +122,17 @@ const CONST_RAW = [
     "invalid": 1353,
     "blank": 3975,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 32753,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 18263,
     "margin": 14490,
     "percent_invalid": 1.7346376235592764,
     "ballot_surplus": -328
   },
   {
+    "cid": 12,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -125,14 +144,17 @@ const CONST_RAW = [
     "invalid": 1370,
     "blank": 3052,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 30477,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 21776,
     "margin": 8701,
     "percent_invalid": 1.8325307651150349,
     "ballot_surplus": 189
   },
   {
+    "cid": 13,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -144,14 +166,17 @@ const CONST_RAW = [
     "invalid": 1223,
     "blank": 4298,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 43394,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 21113,
     "margin": 22281,
     "percent_invalid": 1.32656492358422,
     "ballot_surplus": 371
   },
   {
+    "cid": 14,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -163,14 +188,17 @@ const CONST_RAW = [
     "invalid": 1327,
     "blank": 4865,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 41394,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 12395,
     "margin": 28999,
     "percent_invalid": 1.3802931172573045,
     "ballot_surplus": 154
   },
   {
+    "cid": 15,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -182,14 +210,17 @@ const CONST_RAW = [
     "invalid": 1556,
     "blank": 5317,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 38574,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 11394,
     "margin": 27180,
     "percent_invalid": 1.781135531135531,
     "ballot_surplus": -77
   },
   {
+    "cid": 16,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -201,14 +232,17 @@ const CONST_RAW = [
     "invalid": 1530,
     "blank": 5452,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 39081,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 14919,
     "margin": 24162,
     "percent_invalid": 1.6420008800266155,
     "ballot_surplus": 572
   },
   {
+    "cid": 17,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -220,14 +254,17 @@ const CONST_RAW = [
     "invalid": 1523,
     "blank": 5773,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 47108,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 16267,
     "margin": 30841,
     "percent_invalid": 1.5547479532044346,
     "ballot_surplus": 461
   },
   {
+    "cid": 18,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -239,14 +276,17 @@ const CONST_RAW = [
     "invalid": 1415,
     "blank": 5428,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 37489,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 17889,
     "margin": 19600,
     "percent_invalid": 1.5613448530791045,
     "ballot_surplus": -62
   },
   {
+    "cid": 19,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -258,14 +298,17 @@ const CONST_RAW = [
     "invalid": 1171,
     "blank": 4000,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 36844,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 23498,
     "margin": 13346,
     "percent_invalid": 1.229654520634254,
     "ballot_surplus": 184
   },
   {
+    "cid": 20,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -277,14 +320,17 @@ const CONST_RAW = [
     "invalid": 1483,
     "blank": 5251,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 44824,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 14631,
     "margin": 30193,
     "percent_invalid": 1.473291012229408,
     "ballot_surplus": 81
   },
   {
+    "cid": 21,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -296,14 +342,17 @@ const CONST_RAW = [
     "invalid": 1185,
     "blank": 4731,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 39644,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 13459,
     "margin": 26185,
     "percent_invalid": 1.3810223061324383,
     "ballot_surplus": -522
   },
   {
+    "cid": 22,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -315,33 +364,39 @@ const CONST_RAW = [
     "invalid": 1306,
     "blank": 3752,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 36911,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 23065,
     "margin": 13846,
     "percent_invalid": 1.4666906248596199,
     "ballot_surplus": -166
   },
   {
+    "cid": 23,
     "province_thai": "กรุงเทพมหานคร",
-    "province_eng": "",
-    "prov_id": "",
+    "province_eng": "BANGKOK",
+    "prov_id": "BKK",
     "cons_no": 15,
-    "region": "",
+    "region": "Central",
     "turn_out": 87827,
     "total_used": 87827,
     "valid": 81890,
     "invalid": 1269,
     "blank": 4668,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 35586,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 20601,
     "margin": 14985,
     "percent_invalid": 1.4448859690072529,
     "ballot_surplus": -440
   },
   {
+    "cid": 24,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -353,14 +408,17 @@ const CONST_RAW = [
     "invalid": 1310,
     "blank": 4277,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 41727,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 14124,
     "margin": 27603,
     "percent_invalid": 1.4342961000284669,
     "ballot_surplus": -15
   },
   {
+    "cid": 25,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -372,14 +430,17 @@ const CONST_RAW = [
     "invalid": 1844,
     "blank": 5144,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 27187,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 15271,
     "margin": 11916,
     "percent_invalid": 2.4549678484416813,
     "ballot_surplus": -217
   },
   {
+    "cid": 26,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -391,14 +452,17 @@ const CONST_RAW = [
     "invalid": 1334,
     "blank": 4869,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 31027,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 19113,
     "margin": 11914,
     "percent_invalid": 1.683068382538481,
     "ballot_surplus": 66
   },
   {
+    "cid": 27,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -410,14 +474,17 @@ const CONST_RAW = [
     "invalid": 1517,
     "blank": 4493,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 38566,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 16377,
     "margin": 22189,
     "percent_invalid": 1.6880501185084624,
     "ballot_surplus": 0
   },
   {
+    "cid": 28,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -429,14 +496,17 @@ const CONST_RAW = [
     "invalid": 1611,
     "blank": 3289,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 31037,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 25374,
     "margin": 5663,
     "percent_invalid": 2.041488728092963,
     "ballot_surplus": 186
   },
   {
+    "cid": 29,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -448,14 +518,17 @@ const CONST_RAW = [
     "invalid": 1387,
     "blank": 3571,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 41256,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 19685,
     "margin": 21571,
     "percent_invalid": 1.5764767392959844,
     "ballot_surplus": -230
   },
   {
+    "cid": 30,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -467,14 +540,17 @@ const CONST_RAW = [
     "invalid": 1419,
     "blank": 4925,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 39831,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 16643,
     "margin": 23188,
     "percent_invalid": 1.6266966250917094,
     "ballot_surplus": -87
   },
   {
+    "cid": 31,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -486,14 +562,17 @@ const CONST_RAW = [
     "invalid": 1016,
     "blank": 4892,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 44381,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 16632,
     "margin": 27749,
     "percent_invalid": 1.0684165141859634,
     "ballot_surplus": 4250
   },
   {
+    "cid": 32,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -505,14 +584,17 @@ const CONST_RAW = [
     "invalid": 1800,
     "blank": 5381,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 43857,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 14391,
     "margin": 29466,
     "percent_invalid": 1.9660957707095421,
     "ballot_surplus": 29
   },
   {
+    "cid": 33,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -524,14 +606,17 @@ const CONST_RAW = [
     "invalid": 1348,
     "blank": 3650,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 33581,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 20596,
     "margin": 12985,
     "percent_invalid": 1.6381489403072138,
     "ballot_surplus": -14
   },
   {
+    "cid": 34,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -543,14 +628,17 @@ const CONST_RAW = [
     "invalid": 1707,
     "blank": 4730,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 40407,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 15641,
     "margin": 24766,
     "percent_invalid": 1.9112773199570048,
     "ballot_surplus": -15
   },
   {
+    "cid": 35,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -562,14 +650,17 @@ const CONST_RAW = [
     "invalid": 1503,
     "blank": 4096,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 40639,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 25765,
     "margin": 14874,
     "percent_invalid": 1.650378829471835,
     "ballot_surplus": 0
   },
   {
+    "cid": 36,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -581,14 +672,17 @@ const CONST_RAW = [
     "invalid": 1534,
     "blank": 4464,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 37355,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 10169,
     "margin": 27186,
     "percent_invalid": 1.9871753351901031,
     "ballot_surplus": 396
   },
   {
+    "cid": 37,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -600,14 +694,17 @@ const CONST_RAW = [
     "invalid": 1762,
     "blank": 5245,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 42268,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 15968,
     "margin": 26300,
     "percent_invalid": 1.8392292356029687,
     "ballot_surplus": 108
   },
   {
+    "cid": 38,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -619,14 +716,17 @@ const CONST_RAW = [
     "invalid": 1438,
     "blank": 5356,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 44737,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 13620,
     "margin": 31117,
     "percent_invalid": 1.4888131943222174,
     "ballot_surplus": -1757
   },
   {
+    "cid": 39,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -638,14 +738,17 @@ const CONST_RAW = [
     "invalid": 1887,
     "blank": 6684,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 42717,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 14350,
     "margin": 28367,
     "percent_invalid": 1.8465241897604507,
     "ballot_surplus": -137
   },
   {
+    "cid": 40,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -657,14 +760,17 @@ const CONST_RAW = [
     "invalid": 2145,
     "blank": 5729,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 36963,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 12436,
     "margin": 24527,
     "percent_invalid": 2.4394959512328267,
     "ballot_surplus": -90
   },
   {
+    "cid": 41,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -676,14 +782,17 @@ const CONST_RAW = [
     "invalid": 1884,
     "blank": 5347,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 39831,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 14177,
     "margin": 25654,
     "percent_invalid": 2.076605125378892,
     "ballot_surplus": 45
   },
   {
+    "cid": 119,
     "province_thai": "กาญจนบุรี",
     "province_eng": "KANCHANABURI",
     "prov_id": "KRI",
@@ -695,14 +804,17 @@ const CONST_RAW = [
     "invalid": 3275,
     "blank": 6060,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 33177,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 23090,
     "margin": 10087,
     "percent_invalid": 3.9321390836615113,
     "ballot_surplus": 92
   },
   {
+    "cid": 120,
     "province_thai": "กาญจนบุรี",
     "province_eng": "KANCHANABURI",
     "prov_id": "KRI",
@@ -714,14 +826,17 @@ const CONST_RAW = [
     "invalid": 2700,
     "blank": 2693,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 37773,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 25590,
     "margin": 12183,
     "percent_invalid": 2.8351219102421403,
     "ballot_surplus": -105
   },
   {
+    "cid": 121,
     "province_thai": "กาญจนบุรี",
     "province_eng": "KANCHANABURI",
     "prov_id": "KRI",
@@ -733,14 +848,17 @@ const CONST_RAW = [
     "invalid": 3334,
     "blank": 2002,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 46896,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 37533,
     "margin": 9363,
     "percent_invalid": 3.2102450531991717,
     "ballot_surplus": 79
   },
   {
+    "cid": 122,
     "province_thai": "กาญจนบุรี",
     "province_eng": "KANCHANABURI",
     "prov_id": "KRI",
@@ -752,14 +870,17 @@ const CONST_RAW = [
     "invalid": 5324,
     "blank": 4736,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 49369,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 15683,
     "margin": 33686,
     "percent_invalid": 6.033271383890123,
     "ballot_surplus": 341
   },
   {
+    "cid": 123,
     "province_thai": "กาญจนบุรี",
     "province_eng": "KANCHANABURI",
     "prov_id": "KRI",
@@ -771,14 +892,17 @@ const CONST_RAW = [
     "invalid": 3951,
     "blank": 1864,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 37019,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 25773,
     "margin": 11246,
     "percent_invalid": 4.670102361646297,
     "ballot_surplus": 104
   },
   {
+    "cid": 124,
     "province_thai": "กาฬสินธุ์",
     "province_eng": "KALASIN",
     "prov_id": "KSN",
@@ -790,14 +914,17 @@ const CONST_RAW = [
     "invalid": 2392,
     "blank": 2917,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 29962,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 18019,
     "margin": 11943,
     "percent_invalid": 3.1649003029942184,
     "ballot_surplus": 827
   },
   {
+    "cid": 125,
     "province_thai": "กาฬสินธุ์",
     "province_eng": "KALASIN",
     "prov_id": "KSN",
@@ -809,14 +936,17 @@ const CONST_RAW = [
     "invalid": 2805,
     "blank": 3140,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 43248,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 17811,
     "margin": 25437,
     "percent_invalid": 3.433754850714294,
     "ballot_surplus": 46
   },
   {
+    "cid": 126,
     "province_thai": "กาฬสินธุ์",
     "province_eng": "KALASIN",
     "prov_id": "KSN",
@@ -828,14 +958,17 @@ const CONST_RAW = [
     "invalid": 2349,
     "blank": 1771,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 25564,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 13884,
     "margin": 11680,
     "percent_invalid": 3.057678039128907,
     "ballot_surplus": -124
   },
   {
+    "cid": 127,
     "province_thai": "กาฬสินธุ์",
     "province_eng": "KALASIN",
     "prov_id": "KSN",
@@ -847,14 +980,17 @@ const CONST_RAW = [
     "invalid": 2368,
     "blank": 1522,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 34051,
     "runnerup_party": "พลังประชารัฐ",
+    "runnerup_pid": 38,
     "runnerup_votes": 24218,
     "margin": 9833,
     "percent_invalid": 2.8792373911774716,
     "ballot_surplus": 623
   },
   {
+    "cid": 128,
     "province_thai": "กาฬสินธุ์",
     "province_eng": "KALASIN",
     "prov_id": "KSN",
@@ -866,14 +1002,17 @@ const CONST_RAW = [
     "invalid": 2137,
     "blank": 1497,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 43680,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 20906,
     "margin": 22774,
     "percent_invalid": 2.569868680552215,
     "ballot_surplus": -726
   },
   {
+    "cid": 129,
     "province_thai": "กาฬสินธุ์",
     "province_eng": "KALASIN",
     "prov_id": "KSN",
@@ -885,14 +1024,17 @@ const CONST_RAW = [
     "invalid": 2260,
     "blank": 1428,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 54428,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 13867,
     "margin": 40561,
     "percent_invalid": 2.68363929987888,
     "ballot_surplus": 553
   },
   {
+    "cid": 115,
     "province_thai": "กำแพงเพชร",
     "province_eng": "KAMPHAENG PHET",
     "prov_id": "KPT",
@@ -904,14 +1046,17 @@ const CONST_RAW = [
     "invalid": 4771,
     "blank": 4683,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 42461,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 28101,
     "margin": 14360,
     "percent_invalid": 5.243952033941152,
     "ballot_surplus": 363
   },
   {
+    "cid": 116,
     "province_thai": "กำแพงเพชร",
     "province_eng": "KAMPHAENG PHET",
     "prov_id": "KPT",
@@ -923,14 +1068,17 @@ const CONST_RAW = [
     "invalid": 4344,
     "blank": 2522,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 39701,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 31308,
     "margin": 8393,
     "percent_invalid": 4.5490721735852215,
     "ballot_surplus": -122
   },
   {
+    "cid": 117,
     "province_thai": "กำแพงเพชร",
     "province_eng": "KAMPHAENG PHET",
     "prov_id": "KPT",
@@ -942,14 +1090,17 @@ const CONST_RAW = [
     "invalid": 3808,
     "blank": 2323,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 30571,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 27994,
     "margin": 2577,
     "percent_invalid": 4.79917325166673,
     "ballot_surplus": -689
   },
   {
+    "cid": 118,
     "province_thai": "กำแพงเพชร",
     "province_eng": "KAMPHAENG PHET",
     "prov_id": "KPT",
@@ -961,14 +1112,17 @@ const CONST_RAW = [
     "invalid": 4008,
     "blank": 2342,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 35163,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 25872,
     "margin": 9291,
     "percent_invalid": 4.802530674846626,
     "ballot_surplus": -400
   },
   {
+    "cid": 104,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -980,14 +1134,17 @@ const CONST_RAW = [
     "invalid": 2510,
     "blank": 5219,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 33395,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 22129,
     "margin": 11266,
     "percent_invalid": 2.9079871168060802,
     "ballot_surplus": 5382
   },
   {
+    "cid": 105,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -999,14 +1156,17 @@ const CONST_RAW = [
     "invalid": 2640,
     "blank": 6032,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 38712,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 25333,
     "margin": 13379,
     "percent_invalid": 2.643251198974739,
     "ballot_surplus": 543
   },
   {
+    "cid": 106,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -1018,14 +1178,17 @@ const CONST_RAW = [
     "invalid": 3714,
     "blank": 1822,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 27524,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 26913,
     "margin": 611,
     "percent_invalid": 4.456336540999736,
     "ballot_surplus": 145
   },
   {
+    "cid": 107,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -1037,14 +1200,17 @@ const CONST_RAW = [
     "invalid": 2664,
     "blank": 2169,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 38701,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 21645,
     "margin": 17056,
     "percent_invalid": 2.886584533368007,
     "ballot_surplus": 125
   },
   {
+    "cid": 108,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -1056,14 +1222,17 @@ const CONST_RAW = [
     "invalid": 2459,
     "blank": 1390,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 34658,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 30322,
     "margin": 4336,
     "percent_invalid": 3.0252700474889886,
     "ballot_surplus": -51
   },
   {
+    "cid": 109,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -1075,14 +1244,17 @@ const CONST_RAW = [
     "invalid": 3809,
     "blank": 2451,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 43245,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 19305,
     "margin": 23940,
     "percent_invalid": 4.412906215605631,
     "ballot_surplus": 134
   },
   {
+    "cid": 110,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -1094,14 +1266,17 @@ const CONST_RAW = [
     "invalid": 4330,
     "blank": 2608,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 32378,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 20861,
     "margin": 11517,
     "percent_invalid": 4.874808610285508,
     "ballot_surplus": 199
   },
   {
+    "cid": 111,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -1113,14 +1288,17 @@ const CONST_RAW = [
     "invalid": 3417,
     "blank": 2982,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 32333,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 26379,
     "margin": 5954,
     "percent_invalid": 3.7486835176408633,
     "ballot_surplus": -198
   },
   {
+    "cid": 112,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -1132,14 +1310,17 @@ const CONST_RAW = [
     "invalid": 2267,
     "blank": 1039,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 40153,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 19215,
     "margin": 20938,
     "percent_invalid": 2.9797973159478963,
     "ballot_surplus": 99
   },
   {
+    "cid": 113,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -1151,14 +1332,17 @@ const CONST_RAW = [
     "invalid": 3746,
     "blank": 1297,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 36642,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 29951,
     "margin": 6691,
     "percent_invalid": 4.532036391792489,
     "ballot_surplus": -1105
   },
   {
+    "cid": 114,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -1170,14 +1354,17 @@ const CONST_RAW = [
     "invalid": 4043,
     "blank": 2059,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 47777,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 13467,
     "margin": 34310,
     "percent_invalid": 5.003836728631897,
     "ballot_surplus": -68
   },
   {
+    "cid": 98,
     "province_thai": "จันทบุรี",
     "province_eng": "CHANTHABURI",
     "prov_id": "CTI",
@@ -1189,14 +1376,17 @@ const CONST_RAW = [
     "invalid": 3058,
     "blank": 6128,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 31182,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 28065,
     "margin": 3117,
     "percent_invalid": 2.908171028606208,
     "ballot_surplus": 208
   },
   {
+    "cid": 99,
     "province_thai": "จันทบุรี",
     "province_eng": "CHANTHABURI",
     "prov_id": "CTI",
@@ -1208,14 +1398,17 @@ const CONST_RAW = [
     "invalid": 4595,
     "blank": 5401,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 37377,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 25889,
     "margin": 11488,
     "percent_invalid": 4.881131955214685,
     "ballot_surplus": -168
   },
   {
+    "cid": 100,
     "province_thai": "จันทบุรี",
     "province_eng": "CHANTHABURI",
     "prov_id": "CTI",
@@ -1227,14 +1420,17 @@ const CONST_RAW = [
     "invalid": 4032,
     "blank": 5344,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 30286,
     "runnerup_party": "พลังประชารัฐ",
+    "runnerup_pid": 38,
     "runnerup_votes": 25697,
     "margin": 4589,
     "percent_invalid": 4.179754315036542,
     "ballot_surplus": 0
   },
   {
+    "cid": 65,
     "province_thai": "ฉะเชิงเทรา",
     "province_eng": "CHACHOENGSAO",
     "prov_id": "CCO",
@@ -1246,14 +1442,17 @@ const CONST_RAW = [
     "invalid": 4789,
     "blank": 8615,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 36976,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 33404,
     "margin": 3572,
     "percent_invalid": 4.549600045600501,
     "ballot_surplus": -261
   },
   {
+    "cid": 66,
     "province_thai": "ฉะเชิงเทรา",
     "province_eng": "CHACHOENGSAO",
     "prov_id": "CCO",
@@ -1265,14 +1464,17 @@ const CONST_RAW = [
     "invalid": 4230,
     "blank": 4105,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 48727,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 30804,
     "margin": 17923,
     "percent_invalid": 3.710396126451703,
     "ballot_surplus": 401
   },
   {
+    "cid": 67,
     "province_thai": "ฉะเชิงเทรา",
     "province_eng": "CHACHOENGSAO",
     "prov_id": "CCO",
@@ -1284,14 +1486,17 @@ const CONST_RAW = [
     "invalid": 5117,
     "blank": 5096,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 49678,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 20386,
     "margin": 29292,
     "percent_invalid": 5.199199341590546,
     "ballot_surplus": 394
   },
   {
+    "cid": 68,
     "province_thai": "ฉะเชิงเทรา",
     "province_eng": "CHACHOENGSAO",
     "prov_id": "CCO",
@@ -1303,14 +1508,17 @@ const CONST_RAW = [
     "invalid": 4360,
     "blank": 5465,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 45411,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 34283,
     "margin": 11128,
     "percent_invalid": 3.709186190938016,
     "ballot_surplus": 156
   },
   {
+    "cid": 55,
     "province_thai": "ชลบุรี",
     "province_eng": "CHON BURI",
     "prov_id": "CBI",
@@ -1322,14 +1530,17 @@ const CONST_RAW = [
     "invalid": 2127,
     "blank": 4328,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 43703,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 39920,
     "margin": 3783,
     "percent_invalid": 2.1507877120957795,
     "ballot_surplus": 452
   },
   {
+    "cid": 56,
     "province_thai": "ชลบุรี",
     "province_eng": "CHON BURI",
     "prov_id": "CBI",
@@ -1341,14 +1552,17 @@ const CONST_RAW = [
     "invalid": 1776,
     "blank": 3140,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 28143,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 27060,
     "margin": 1083,
     "percent_invalid": 2.2517496703519626,
     "ballot_surplus": 0
   },
   {
+    "cid": 57,
     "province_thai": "ชลบุรี",
     "province_eng": "CHON BURI",
     "prov_id": "CBI",
@@ -1360,14 +1574,17 @@ const CONST_RAW = [
     "invalid": 3120,
     "blank": 4649,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 39906,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 34946,
     "margin": 4960,
     "percent_invalid": 3.3676938852609424,
     "ballot_surplus": 0
   },
   {
+    "cid": 58,
     "province_thai": "ชลบุรี",
     "province_eng": "CHON BURI",
     "prov_id": "CBI",
@@ -1379,14 +1596,17 @@ const CONST_RAW = [
     "invalid": 3736,
     "blank": 3895,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 43072,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 22859,
     "margin": 20213,
     "percent_invalid": 4.4598304882416135,
     "ballot_surplus": 44
   },
   {
+    "cid": 59,
     "province_thai": "ชลบุรี",
     "province_eng": "CHON BURI",
     "prov_id": "CBI",
@@ -1398,14 +1618,17 @@ const CONST_RAW = [
     "invalid": 3471,
     "blank": 4533,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 49881,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 23056,
     "margin": 26825,
     "percent_invalid": 3.553912785280596,
     "ballot_surplus": 2924
   },
   {
+    "cid": 60,
     "province_thai": "ชลบุรี",
     "province_eng": "CHON BURI",
     "prov_id": "CBI",
@@ -1417,14 +1640,17 @@ const CONST_RAW = [
     "invalid": 2068,
     "blank": 4349,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 36759,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 33008,
     "margin": 3751,
     "percent_invalid": 2.3433958843259903,
     "ballot_surplus": -499
   },
   {
+    "cid": 61,
     "province_thai": "ชลบุรี",
     "province_eng": "CHON BURI",
     "prov_id": "CBI",
@@ -1436,14 +1662,17 @@ const CONST_RAW = [
     "invalid": 1993,
     "blank": 3722,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 37862,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 30427,
     "margin": 7435,
     "percent_invalid": 2.364848830034648,
     "ballot_surplus": 224
   },
   {
+    "cid": 62,
     "province_thai": "ชลบุรี",
     "province_eng": "CHON BURI",
     "prov_id": "CBI",
@@ -1455,14 +1684,17 @@ const CONST_RAW = [
     "invalid": 2844,
     "blank": 3807,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 35060,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 31463,
     "margin": 3597,
     "percent_invalid": 3.282207526918949,
     "ballot_surplus": 194
   },
   {
+    "cid": 63,
     "province_thai": "ชลบุรี",
     "province_eng": "CHON BURI",
     "prov_id": "CBI",
@@ -1474,14 +1706,17 @@ const CONST_RAW = [
     "invalid": 2878,
     "blank": 3231,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 24410,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 21976,
     "margin": 2434,
     "percent_invalid": 4.599060372654926,
     "ballot_surplus": -179
   },
   {
+    "cid": 64,
     "province_thai": "ชลบุรี",
     "province_eng": "CHON BURI",
     "prov_id": "CBI",
@@ -1493,14 +1728,17 @@ const CONST_RAW = [
     "invalid": 1900,
     "blank": 4465,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 25552,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 22072,
     "margin": 3480,
     "percent_invalid": 2.259000332905312,
     "ballot_surplus": 4734
   },
   {
+    "cid": 79,
     "province_thai": "ชัยนาท",
     "province_eng": "CHAI NAT",
     "prov_id": "CNT",
@@ -1512,14 +1750,17 @@ const CONST_RAW = [
     "invalid": 5224,
     "blank": 7148,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 33605,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 24658,
     "margin": 8947,
     "percent_invalid": 6.13455147550994,
     "ballot_surplus": -21
   },
   {
+    "cid": 80,
     "province_thai": "ชัยนาท",
     "province_eng": "CHAI NAT",
     "prov_id": "CNT",
@@ -1531,14 +1772,17 @@ const CONST_RAW = [
     "invalid": 4664,
     "blank": 5377,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 52108,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 15985,
     "margin": 36123,
     "percent_invalid": 5.155528043684921,
     "ballot_surplus": 190
   },
   {
+    "cid": 81,
     "province_thai": "ชัยภูมิ",
     "province_eng": "CHAIYAPHUM",
     "prov_id": "CPM",
@@ -1550,14 +1794,17 @@ const CONST_RAW = [
     "invalid": 514,
     "blank": 563,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 7812,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 3678,
     "margin": 4134,
     "percent_invalid": 3.4468884120171674,
     "ballot_surplus": -329
   },
   {
+    "cid": 82,
     "province_thai": "ชัยภูมิ",
     "province_eng": "CHAIYAPHUM",
     "prov_id": "CPM",
@@ -1569,14 +1816,17 @@ const CONST_RAW = [
     "invalid": 4233,
     "blank": 3178,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 52437,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 14055,
     "margin": 38382,
     "percent_invalid": 5.088535468282304,
     "ballot_surplus": 76
   },
   {
+    "cid": 83,
     "province_thai": "ชัยภูมิ",
     "province_eng": "CHAIYAPHUM",
     "prov_id": "CPM",
@@ -1588,14 +1838,17 @@ const CONST_RAW = [
     "invalid": 3486,
     "blank": 1644,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 44269,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 14531,
     "margin": 29738,
     "percent_invalid": 4.643171102053864,
     "ballot_surplus": -611
   },
   {
+    "cid": 84,
     "province_thai": "ชัยภูมิ",
     "province_eng": "CHAIYAPHUM",
     "prov_id": "CPM",
@@ -1607,14 +1860,17 @@ const CONST_RAW = [
     "invalid": 1940,
     "blank": 548,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 27557,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 12666,
     "margin": 14891,
     "percent_invalid": 3.53769284073088,
     "ballot_surplus": 246
   },
   {
+    "cid": 85,
     "province_thai": "ชัยภูมิ",
     "province_eng": "CHAIYAPHUM",
     "prov_id": "CPM",
@@ -1626,14 +1882,17 @@ const CONST_RAW = [
     "invalid": 2358,
     "blank": 981,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 26551,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 21560,
     "margin": 4991,
     "percent_invalid": 3.0391689329397966,
     "ballot_surplus": -142
   },
   {
+    "cid": 86,
     "province_thai": "ชัยภูมิ",
     "province_eng": "CHAIYAPHUM",
     "prov_id": "CPM",
@@ -1645,14 +1904,17 @@ const CONST_RAW = [
     "invalid": 3633,
     "blank": 1945,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 47868,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 16078,
     "margin": 31790,
     "percent_invalid": 4.294935451837141,
     "ballot_surplus": -37
   },
   {
+    "cid": 87,
     "province_thai": "ชัยภูมิ",
     "province_eng": "CHAIYAPHUM",
     "prov_id": "CPM",
@@ -1664,14 +1926,17 @@ const CONST_RAW = [
     "invalid": 1916,
     "blank": 785,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 37660,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 22123,
     "margin": 15537,
     "percent_invalid": 2.541788272751393,
     "ballot_surplus": -914
   },
   {
+    "cid": 88,
     "province_thai": "ชุมพร",
     "province_eng": "CHUMPHON",
     "prov_id": "CPN",
@@ -1683,14 +1948,17 @@ const CONST_RAW = [
     "invalid": 2321,
     "blank": 5040,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 43318,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 32047,
     "margin": 11271,
     "percent_invalid": 2.3699392454178794,
     "ballot_surplus": 5694
   },
   {
+    "cid": 89,
     "province_thai": "ชุมพร",
     "province_eng": "CHUMPHON",
     "prov_id": "CPN",
@@ -1702,14 +1970,17 @@ const CONST_RAW = [
     "invalid": 2554,
     "blank": 3582,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 33428,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 22142,
     "margin": 11286,
     "percent_invalid": 2.5015426506165706,
     "ballot_surplus": -200
   },
   {
+    "cid": 90,
     "province_thai": "ชุมพร",
     "province_eng": "CHUMPHON",
     "prov_id": "CPN",
@@ -1721,14 +1992,17 @@ const CONST_RAW = [
     "invalid": 2453,
     "blank": 3427,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 39753,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 26755,
     "margin": 12998,
     "percent_invalid": 2.641781721842893,
     "ballot_surplus": -609
   },
   {
+    "cid": 363,
     "province_thai": "ตรัง",
     "province_eng": "TRANG",
     "prov_id": "TRG",
@@ -1740,14 +2014,17 @@ const CONST_RAW = [
     "invalid": 2037,
     "blank": 6184,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 33921,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 32523,
     "margin": 1398,
     "percent_invalid": 2.163522814172827,
     "ballot_surplus": 74
   },
   {
+    "cid": 364,
     "province_thai": "ตรัง",
     "province_eng": "TRANG",
     "prov_id": "TRG",
@@ -1759,14 +2036,17 @@ const CONST_RAW = [
     "invalid": 2031,
     "blank": 3085,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 39583,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 34765,
     "margin": 4818,
     "percent_invalid": 2.2443228907674455,
     "ballot_surplus": -430
   },
   {
+    "cid": 365,
     "province_thai": "ตรัง",
     "province_eng": "TRANG",
     "prov_id": "TRG",
@@ -1778,14 +2058,17 @@ const CONST_RAW = [
     "invalid": 2211,
     "blank": 3872,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 42376,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 26574,
     "margin": 15802,
     "percent_invalid": 2.6258283651219685,
     "ballot_surplus": -5470
   },
   {
+    "cid": 366,
     "province_thai": "ตรัง",
     "province_eng": "TRANG",
     "prov_id": "TRG",
@@ -1797,14 +2080,17 @@ const CONST_RAW = [
     "invalid": 2009,
     "blank": 3582,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 48284,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 27805,
     "margin": 20479,
     "percent_invalid": 2.130073370371941,
     "ballot_surplus": -323
   },
   {
+    "cid": 367,
     "province_thai": "ตราด",
     "province_eng": "TRAT",
     "prov_id": "TRT",
@@ -1816,14 +2102,17 @@ const CONST_RAW = [
     "invalid": 4161,
     "blank": 4345,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 62391,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 22492,
     "margin": 39899,
     "percent_invalid": 3.6841266468338287,
     "ballot_surplus": -155
   },
   {
+    "cid": 360,
     "province_thai": "ตาก",
     "province_eng": "TAK",
     "prov_id": "TAK",
@@ -1835,14 +2124,17 @@ const CONST_RAW = [
     "invalid": 3426,
     "blank": 4277,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 34932,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 23595,
     "margin": 11337,
     "percent_invalid": 3.6899017749439946,
     "ballot_surplus": -256
   },
   {
+    "cid": 361,
     "province_thai": "ตาก",
     "province_eng": "TAK",
     "prov_id": "TAK",
@@ -1854,14 +2146,17 @@ const CONST_RAW = [
     "invalid": 9037,
     "blank": 17504,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 23734,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 17990,
     "margin": 5744,
     "percent_invalid": 10.630138919929893,
     "ballot_surplus": -21
   },
   {
+    "cid": 362,
     "province_thai": "ตาก",
     "province_eng": "TAK",
     "prov_id": "TAK",
@@ -1873,14 +2168,17 @@ const CONST_RAW = [
     "invalid": 6870,
     "blank": 2447,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 28767,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 17467,
     "margin": 11300,
     "percent_invalid": 7.88658018597176,
     "ballot_surplus": 171
   },
   {
+    "cid": 219,
     "province_thai": "นครนายก",
     "province_eng": "NAKHON NAYOK",
     "prov_id": "NYK",
@@ -1892,14 +2190,17 @@ const CONST_RAW = [
     "invalid": 2365,
     "blank": 2693,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 30340,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 27289,
     "margin": 3051,
     "percent_invalid": 3.218519072957635,
     "ballot_surplus": -568
   },
   {
+    "cid": 220,
     "province_thai": "นครนายก",
     "province_eng": "NAKHON NAYOK",
     "prov_id": "NYK",
@@ -1911,14 +2212,17 @@ const CONST_RAW = [
     "invalid": 3041,
     "blank": 3358,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 32672,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 27168,
     "margin": 5504,
     "percent_invalid": 3.7295494125438444,
     "ballot_surplus": 0
   },
   {
+    "cid": 192,
     "province_thai": "นครปฐม",
     "province_eng": "NAKHON PATHOM",
     "prov_id": "NPT",
@@ -1930,14 +2234,17 @@ const CONST_RAW = [
     "invalid": 3320,
     "blank": 4384,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 51585,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 25116,
     "margin": 26469,
     "percent_invalid": 3.528799039146286,
     "ballot_surplus": 466
   },
   {
+    "cid": 193,
     "province_thai": "นครปฐม",
     "province_eng": "NAKHON PATHOM",
     "prov_id": "NPT",
@@ -1949,14 +2256,17 @@ const CONST_RAW = [
     "invalid": 2337,
     "blank": 4753,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 41154,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 27977,
     "margin": 13177,
     "percent_invalid": 2.6729955392885736,
     "ballot_surplus": -749
   },
   {
+    "cid": 194,
     "province_thai": "นครปฐม",
     "province_eng": "NAKHON PATHOM",
     "prov_id": "NPT",
@@ -1968,14 +2278,17 @@ const CONST_RAW = [
     "invalid": 3012,
     "blank": 4418,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 46059,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 21777,
     "margin": 24282,
     "percent_invalid": 3.401698590531262,
     "ballot_surplus": 283
   },
   {
+    "cid": 195,
     "province_thai": "นครปฐม",
     "province_eng": "NAKHON PATHOM",
     "prov_id": "NPT",
@@ -1987,14 +2300,17 @@ const CONST_RAW = [
     "invalid": 3415,
     "blank": 3190,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 47660,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 23283,
     "margin": 24377,
     "percent_invalid": 3.5014867220342456,
     "ballot_surplus": -122
   },
   {
+    "cid": 196,
     "province_thai": "นครปฐม",
     "province_eng": "NAKHON PATHOM",
     "prov_id": "NPT",
@@ -2006,14 +2322,17 @@ const CONST_RAW = [
     "invalid": 2765,
     "blank": 4262,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 39070,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 23648,
     "margin": 15422,
     "percent_invalid": 2.7154964988263948,
     "ballot_surplus": -139
   },
   {
+    "cid": 197,
     "province_thai": "นครปฐม",
     "province_eng": "NAKHON PATHOM",
     "prov_id": "NPT",
@@ -2025,14 +2344,17 @@ const CONST_RAW = [
     "invalid": 2268,
     "blank": 4909,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 35930,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 35035,
     "margin": 895,
     "percent_invalid": 2.4808575803981623,
     "ballot_surplus": 58
   },
   {
+    "cid": 188,
     "province_thai": "นครพนม",
     "province_eng": "NAKHON PHANOM",
     "prov_id": "NPM",
@@ -2044,14 +2366,17 @@ const CONST_RAW = [
     "invalid": 2419,
     "blank": 1013,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 57294,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 19699,
     "margin": 37595,
     "percent_invalid": 2.730556496218535,
     "ballot_surplus": 1189
   },
   {
+    "cid": 189,
     "province_thai": "นครพนม",
     "province_eng": "NAKHON PHANOM",
     "prov_id": "NPM",
@@ -2063,14 +2388,17 @@ const CONST_RAW = [
     "invalid": 3743,
     "blank": 4086,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 48579,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 16385,
     "margin": 32194,
     "percent_invalid": 4.17065941657567,
     "ballot_surplus": -246
   },
   {
+    "cid": 190,
     "province_thai": "นครพนม",
     "province_eng": "NAKHON PHANOM",
     "prov_id": "NPM",
@@ -2082,14 +2410,17 @@ const CONST_RAW = [
     "invalid": 2797,
     "blank": 2071,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 34970,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 33223,
     "margin": 1747,
     "percent_invalid": 3.144746014256482,
     "ballot_surplus": -104
   },
   {
+    "cid": 191,
     "province_thai": "นครพนม",
     "province_eng": "NAKHON PHANOM",
     "prov_id": "NPM",
@@ -2101,14 +2432,17 @@ const CONST_RAW = [
     "invalid": 2228,
     "blank": 1631,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 38829,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 33139,
     "margin": 5690,
     "percent_invalid": 2.4455835702446684,
     "ballot_surplus": -496
   },
   {
+    "cid": 172,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -2120,14 +2454,17 @@ const CONST_RAW = [
     "invalid": 2167,
     "blank": 6831,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 30597,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 21898,
     "margin": 8699,
     "percent_invalid": 2.5492618081289335,
     "ballot_surplus": -111
   },
   {
+    "cid": 173,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -2139,14 +2476,17 @@ const CONST_RAW = [
     "invalid": 2931,
     "blank": 5103,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 37543,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 34078,
     "margin": 3465,
     "percent_invalid": 3.071135932604755,
     "ballot_surplus": -53
   },
   {
+    "cid": 174,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -2158,14 +2498,17 @@ const CONST_RAW = [
     "invalid": 3425,
     "blank": 6001,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 35910,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 35380,
     "margin": 530,
     "percent_invalid": 3.5192815527994985,
     "ballot_surplus": 5
   },
   {
+    "cid": 175,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -2177,14 +2520,17 @@ const CONST_RAW = [
     "invalid": 3412,
     "blank": 4885,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 29438,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 22446,
     "margin": 6992,
     "percent_invalid": 4.288425524427184,
     "ballot_surplus": 1806
   },
   {
+    "cid": 176,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -2196,14 +2542,17 @@ const CONST_RAW = [
     "invalid": 3689,
     "blank": 3495,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 37213,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 29409,
     "margin": 7804,
     "percent_invalid": 4.047352599126676,
     "ballot_surplus": -129
   },
   {
+    "cid": 177,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -2215,14 +2564,17 @@ const CONST_RAW = [
     "invalid": 2021,
     "blank": 1773,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 26753,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 18142,
     "margin": 8611,
     "percent_invalid": 2.4680954997862856,
     "ballot_surplus": 540
   },
   {
+    "cid": 178,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -2234,14 +2586,17 @@ const CONST_RAW = [
     "invalid": 2474,
     "blank": 1847,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 37355,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 19170,
     "margin": 18185,
     "percent_invalid": 3.4072441812422536,
     "ballot_surplus": 104
   },
   {
+    "cid": 179,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -2253,14 +2608,17 @@ const CONST_RAW = [
     "invalid": 4488,
     "blank": 2964,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 48178,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 11397,
     "margin": 36781,
     "percent_invalid": 5.7277043238552245,
     "ballot_surplus": -47
   },
   {
+    "cid": 180,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -2272,14 +2630,17 @@ const CONST_RAW = [
     "invalid": 2651,
     "blank": 1552,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 37991,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 23360,
     "margin": 14631,
     "percent_invalid": 3.1839254401767914,
     "ballot_surplus": -3967
   },
   {
+    "cid": 181,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -2291,14 +2652,17 @@ const CONST_RAW = [
     "invalid": 3772,
     "blank": 3114,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 40401,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 35460,
     "margin": 4941,
     "percent_invalid": 3.666443103062821,
     "ballot_surplus": 434
   },
   {
+    "cid": 182,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -2310,14 +2674,17 @@ const CONST_RAW = [
     "invalid": 3689,
     "blank": 3929,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 49937,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 13223,
     "margin": 36714,
     "percent_invalid": 4.3265114642584885,
     "ballot_surplus": -158
   },
   {
+    "cid": 183,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -2329,14 +2696,17 @@ const CONST_RAW = [
     "invalid": 4225,
     "blank": 3686,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 44512,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 15296,
     "margin": 29216,
     "percent_invalid": 4.900653033765209,
     "ballot_surplus": -4163
   },
   {
+    "cid": 184,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -2348,14 +2718,17 @@ const CONST_RAW = [
     "invalid": 6106,
     "blank": 4789,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 26258,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 22693,
     "margin": 3565,
     "percent_invalid": 8.510816235504013,
     "ballot_surplus": -273
   },
   {
+    "cid": 185,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -2367,14 +2740,17 @@ const CONST_RAW = [
     "invalid": 4731,
     "blank": 5557,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 29772,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 26528,
     "margin": 3244,
     "percent_invalid": 5.7608708887887685,
     "ballot_surplus": 197
   },
   {
+    "cid": 186,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -2386,14 +2762,17 @@ const CONST_RAW = [
     "invalid": 2489,
     "blank": 1509,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 34252,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 25057,
     "margin": 9195,
     "percent_invalid": 2.771097751057671,
     "ballot_surplus": -3229
   },
   {
+    "cid": 187,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -2405,14 +2784,17 @@ const CONST_RAW = [
     "invalid": 2785,
     "blank": 2218,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 29821,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 28972,
     "margin": 849,
     "percent_invalid": 3.358456436539041,
     "ballot_surplus": 598
   },
   {
+    "cid": 204,
     "province_thai": "นครศรีธรรมราช",
     "province_eng": "NAKHON SI THAMMARAT",
     "prov_id": "NST",
@@ -2424,14 +2806,17 @@ const CONST_RAW = [
     "invalid": 2897,
     "blank": 4789,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 37124,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 28132,
     "margin": 8992,
     "percent_invalid": 3.0769067369069494,
     "ballot_surplus": 0
   },
   {
+    "cid": 205,
     "province_thai": "นครศรีธรรมราช",
     "province_eng": "NAKHON SI THAMMARAT",
     "prov_id": "NST",
@@ -2443,14 +2828,17 @@ const CONST_RAW = [
     "invalid": 2663,
     "blank": 5093,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 42139,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 19272,
     "margin": 22867,
     "percent_invalid": 2.966337692427652,
     "ballot_surplus": 55
   },
   {
+    "cid": 206,
     "province_thai": "นครศรีธรรมราช",
     "province_eng": "NAKHON SI THAMMARAT",
     "prov_id": "NST",
@@ -2462,14 +2850,17 @@ const CONST_RAW = [
     "invalid": 2548,
     "blank": 2365,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 44848,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 33535,
     "margin": 11313,
     "percent_invalid": 2.745778419560977,
     "ballot_surplus": -52
   },
   {
+    "cid": 207,
     "province_thai": "นครศรีธรรมราช",
     "province_eng": "NAKHON SI THAMMARAT",
     "prov_id": "NST",
@@ -2481,14 +2872,17 @@ const CONST_RAW = [
     "invalid": 2248,
     "blank": 3568,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 41929,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 34682,
     "margin": 7247,
     "percent_invalid": 2.3112354005593025,
     "ballot_surplus": -371
   },
   {
+    "cid": 208,
     "province_thai": "นครศรีธรรมราช",
     "province_eng": "NAKHON SI THAMMARAT",
     "prov_id": "NST",
@@ -2500,14 +2894,17 @@ const CONST_RAW = [
     "invalid": 1882,
     "blank": 3455,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 34752,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 29194,
     "margin": 5558,
     "percent_invalid": 1.9618471802355886,
     "ballot_surplus": 240
   },
   {
+    "cid": 209,
     "province_thai": "นครศรีธรรมราช",
     "province_eng": "NAKHON SI THAMMARAT",
     "prov_id": "NST",
@@ -2519,14 +2916,17 @@ const CONST_RAW = [
     "invalid": 1908,
     "blank": 2806,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 41070,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 20768,
     "margin": 20302,
     "percent_invalid": 1.9245899655026328,
     "ballot_surplus": 203
   },
   {
+    "cid": 210,
     "province_thai": "นครศรีธรรมราช",
     "province_eng": "NAKHON SI THAMMARAT",
     "prov_id": "NST",
@@ -2538,14 +2938,17 @@ const CONST_RAW = [
     "invalid": 4910,
     "blank": 10807,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 36880,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 27461,
     "margin": 9419,
     "percent_invalid": 5.170979326614219,
     "ballot_surplus": -33
   },
   {
+    "cid": 211,
     "province_thai": "นครศรีธรรมราช",
     "province_eng": "NAKHON SI THAMMARAT",
     "prov_id": "NST",
@@ -2557,14 +2960,17 @@ const CONST_RAW = [
     "invalid": 2458,
     "blank": 4191,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 47916,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 21524,
     "margin": 26392,
     "percent_invalid": 2.6843438755897253,
     "ballot_surplus": -386
   },
   {
+    "cid": 212,
     "province_thai": "นครศรีธรรมราช",
     "province_eng": "NAKHON SI THAMMARAT",
     "prov_id": "NST",
@@ -2576,14 +2982,17 @@ const CONST_RAW = [
     "invalid": 2107,
     "blank": 2709,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 35278,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 27856,
     "margin": 7422,
     "percent_invalid": 2.6803887645023408,
     "ballot_surplus": -390
   },
   {
+    "cid": 198,
     "province_thai": "นครสวรรค์",
     "province_eng": "NAKHON SAWAN",
     "prov_id": "NSN",
@@ -2595,14 +3004,17 @@ const CONST_RAW = [
     "invalid": 3084,
     "blank": 4502,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 44878,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 24567,
     "margin": 20311,
     "percent_invalid": 3.5843793584379355,
     "ballot_surplus": -609
   },
   {
+    "cid": 199,
     "province_thai": "นครสวรรค์",
     "province_eng": "NAKHON SAWAN",
     "prov_id": "NSN",
@@ -2614,14 +3026,17 @@ const CONST_RAW = [
     "invalid": 3671,
     "blank": 3058,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 44634,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 27012,
     "margin": 17622,
     "percent_invalid": 3.737527998371004,
     "ballot_surplus": -433
   },
   {
+    "cid": 200,
     "province_thai": "นครสวรรค์",
     "province_eng": "NAKHON SAWAN",
     "prov_id": "NSN",
@@ -2633,14 +3048,17 @@ const CONST_RAW = [
     "invalid": 4481,
     "blank": 3518,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 50364,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 17949,
     "margin": 32415,
     "percent_invalid": 4.973914973914974,
     "ballot_surplus": 81
   },
   {
+    "cid": 201,
     "province_thai": "นครสวรรค์",
     "province_eng": "NAKHON SAWAN",
     "prov_id": "NSN",
@@ -2652,14 +3070,17 @@ const CONST_RAW = [
     "invalid": 4857,
     "blank": 2689,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 51575,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 11113,
     "margin": 40462,
     "percent_invalid": 5.9727738904807,
     "ballot_surplus": 3
   },
   {
+    "cid": 202,
     "province_thai": "นครสวรรค์",
     "province_eng": "NAKHON SAWAN",
     "prov_id": "NSN",
@@ -2671,14 +3092,17 @@ const CONST_RAW = [
     "invalid": 3790,
     "blank": 2603,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 56499,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 11900,
     "margin": 44599,
     "percent_invalid": 4.5577535926883535,
     "ballot_surplus": -472
   },
   {
+    "cid": 203,
     "province_thai": "นครสวรรค์",
     "province_eng": "NAKHON SAWAN",
     "prov_id": "NSN",
@@ -2690,14 +3114,17 @@ const CONST_RAW = [
     "invalid": 3107,
     "blank": 1152,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 33389,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 29956,
     "margin": 3433,
     "percent_invalid": 3.8863733019788356,
     "ballot_surplus": -301
   },
   {
+    "cid": 158,
     "province_thai": "นนทบุรี",
     "province_eng": "NONTHABURI",
     "prov_id": "NBI",
@@ -2709,14 +3136,17 @@ const CONST_RAW = [
     "invalid": 1616,
     "blank": 5219,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 38190,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 18285,
     "margin": 19905,
     "percent_invalid": 1.7387000634797674,
     "ballot_surplus": -31
   },
   {
+    "cid": 159,
     "province_thai": "นนทบุรี",
     "province_eng": "NONTHABURI",
     "prov_id": "NBI",
@@ -2728,14 +3158,17 @@ const CONST_RAW = [
     "invalid": 1692,
     "blank": 5311,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 35675,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 18844,
     "margin": 16831,
     "percent_invalid": 2.0335805199331753,
     "ballot_surplus": -138
   },
   {
+    "cid": 160,
     "province_thai": "นนทบุรี",
     "province_eng": "NONTHABURI",
     "prov_id": "NBI",
@@ -2747,14 +3180,17 @@ const CONST_RAW = [
     "invalid": 1896,
     "blank": 5956,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 35655,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 12683,
     "margin": 22972,
     "percent_invalid": 2.3534084702844944,
     "ballot_surplus": -18
   },
   {
+    "cid": 161,
     "province_thai": "นนทบุรี",
     "province_eng": "NONTHABURI",
     "prov_id": "NBI",
@@ -2766,14 +3202,17 @@ const CONST_RAW = [
     "invalid": 1765,
     "blank": 4365,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 28502,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 22506,
     "margin": 5996,
     "percent_invalid": 2.2849671171870956,
     "ballot_surplus": 599
   },
   {
+    "cid": 162,
     "province_thai": "นนทบุรี",
     "province_eng": "NONTHABURI",
     "prov_id": "NBI",
@@ -2785,14 +3224,17 @@ const CONST_RAW = [
     "invalid": 2083,
     "blank": 5924,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 39741,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 30248,
     "margin": 9493,
     "percent_invalid": 2.104529335098053,
     "ballot_surplus": -215
   },
   {
+    "cid": 163,
     "province_thai": "นนทบุรี",
     "province_eng": "NONTHABURI",
     "prov_id": "NBI",
@@ -2804,14 +3246,17 @@ const CONST_RAW = [
     "invalid": 3445,
     "blank": 7023,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 42126,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 24213,
     "margin": 17913,
     "percent_invalid": 3.2840487697924714,
     "ballot_surplus": -136
   },
   {
+    "cid": 164,
     "province_thai": "นนทบุรี",
     "province_eng": "NONTHABURI",
     "prov_id": "NBI",
@@ -2823,14 +3268,17 @@ const CONST_RAW = [
     "invalid": 2480,
     "blank": 5962,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 37481,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 17660,
     "margin": 19821,
     "percent_invalid": 2.6119560180309223,
     "ballot_surplus": 432
   },
   {
+    "cid": 165,
     "province_thai": "นนทบุรี",
     "province_eng": "NONTHABURI",
     "prov_id": "NBI",
@@ -2842,14 +3290,17 @@ const CONST_RAW = [
     "invalid": 2125,
     "blank": 5696,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 36749,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 27663,
     "margin": 9086,
     "percent_invalid": 2.1672173948517113,
     "ballot_surplus": 246
   },
   {
+    "cid": 214,
     "province_thai": "นราธิวาส",
     "province_eng": "NARATHIWAT",
     "prov_id": "NWT",
@@ -2861,14 +3312,17 @@ const CONST_RAW = [
     "invalid": 2606,
     "blank": 2723,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 37791,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 32308,
     "margin": 5483,
     "percent_invalid": 2.8179979886890796,
     "ballot_surplus": -2500
   },
   {
+    "cid": 215,
     "province_thai": "นราธิวาส",
     "province_eng": "NARATHIWAT",
     "prov_id": "NWT",
@@ -2880,14 +3334,17 @@ const CONST_RAW = [
     "invalid": 3258,
     "blank": 3733,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 40265,
     "runnerup_party": "ประชาชาติ",
+    "runnerup_pid": 35,
     "runnerup_votes": 10259,
     "margin": 30006,
     "percent_invalid": 4.493359261864372,
     "ballot_surplus": 2093
   },
   {
+    "cid": 216,
     "province_thai": "นราธิวาส",
     "province_eng": "NARATHIWAT",
     "prov_id": "NWT",
@@ -2899,14 +3356,17 @@ const CONST_RAW = [
     "invalid": 2392,
     "blank": 1193,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 36053,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 35940,
     "margin": 113,
     "percent_invalid": 2.911356969851876,
     "ballot_surplus": 6921
   },
   {
+    "cid": 217,
     "province_thai": "นราธิวาส",
     "province_eng": "NARATHIWAT",
     "prov_id": "NWT",
@@ -2918,14 +3378,17 @@ const CONST_RAW = [
     "invalid": 2228,
     "blank": 1016,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 39681,
     "runnerup_party": "ประชาชาติ",
+    "runnerup_pid": 35,
     "runnerup_votes": 32979,
     "margin": 6702,
     "percent_invalid": 2.72325029945975,
     "ballot_surplus": -298
   },
   {
+    "cid": 218,
     "province_thai": "นราธิวาส",
     "province_eng": "NARATHIWAT",
     "prov_id": "NWT",
@@ -2937,33 +3400,39 @@ const CONST_RAW = [
     "invalid": 2854,
     "blank": 1397,
     "winner_party": "ประชาชาติ",
+    "winner_pid": 35,
     "winner_votes": 42706,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 31022,
     "margin": 11684,
     "percent_invalid": 3.3625128126583173,
     "ballot_surplus": -351
   },
   {
+    "cid": 155,
     "province_thai": "น่าน",
-    "province_eng": "",
-    "prov_id": "",
+    "province_eng": "NAN",
+    "prov_id": "NAN",
     "cons_no": 1,
-    "region": "",
+    "region": "North",
     "turn_out": 92148,
     "total_used": 92148,
     "valid": 82286,
     "invalid": 4053,
     "blank": 5809,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 26359,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 20347,
     "margin": 6012,
     "percent_invalid": 4.398359161349133,
     "ballot_surplus": 349
   },
   {
+    "cid": 156,
     "province_thai": "น่าน",
     "province_eng": "NAN",
     "prov_id": "NAN",
@@ -2975,14 +3444,17 @@ const CONST_RAW = [
     "invalid": 3300,
     "blank": 4341,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 35904,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 27409,
     "margin": 8495,
     "percent_invalid": 3.5334553981561787,
     "ballot_surplus": 8806
   },
   {
+    "cid": 157,
     "province_thai": "น่าน",
     "province_eng": "NAN",
     "prov_id": "NAN",
@@ -2994,14 +3466,17 @@ const CONST_RAW = [
     "invalid": 4982,
     "blank": 3974,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 20029,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 14516,
     "margin": 5513,
     "percent_invalid": 6.498232616379928,
     "ballot_surplus": -240
   },
   {
+    "cid": 42,
     "province_thai": "บึงกาฬ",
     "province_eng": "BUENG KAN",
     "prov_id": "BKN",
@@ -3013,14 +3488,17 @@ const CONST_RAW = [
     "invalid": 2694,
     "blank": 1404,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 34556,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 16310,
     "margin": 18246,
     "percent_invalid": 4.02859193683455,
     "ballot_surplus": -3677
   },
   {
+    "cid": 43,
     "province_thai": "บึงกาฬ",
     "province_eng": "BUENG KAN",
     "prov_id": "BKN",
@@ -3032,14 +3510,17 @@ const CONST_RAW = [
     "invalid": 1819,
     "blank": 1049,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 25911,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 19708,
     "margin": 6203,
     "percent_invalid": 2.4727104658591954,
     "ballot_surplus": 996
   },
   {
+    "cid": 44,
     "province_thai": "บึงกาฬ",
     "province_eng": "BUENG KAN",
     "prov_id": "BKN",
@@ -3051,14 +3532,17 @@ const CONST_RAW = [
     "invalid": 3457,
     "blank": 2084,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 32501,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 13397,
     "margin": 19104,
     "percent_invalid": 4.988240047328398,
     "ballot_surplus": -81
   },
   {
+    "cid": 45,
     "province_thai": "บุรีรัมย์",
     "province_eng": "BURI RAM",
     "prov_id": "BRM",
@@ -3070,14 +3554,17 @@ const CONST_RAW = [
     "invalid": 3400,
     "blank": 2915,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 53235,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 11436,
     "margin": 41799,
     "percent_invalid": 4.428813338543702,
     "ballot_surplus": 144
   },
   {
+    "cid": 46,
     "province_thai": "บุรีรัมย์",
     "province_eng": "BURI RAM",
     "prov_id": "BRM",
@@ -3089,14 +3576,17 @@ const CONST_RAW = [
     "invalid": 3510,
     "blank": 3391,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 54410,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 13625,
     "margin": 40785,
     "percent_invalid": 4.245796540462078,
     "ballot_surplus": -75
   },
   {
+    "cid": 47,
     "province_thai": "บุรีรัมย์",
     "province_eng": "BURI RAM",
     "prov_id": "BRM",
@@ -3108,14 +3598,17 @@ const CONST_RAW = [
     "invalid": 3142,
     "blank": 1340,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 51914,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 7391,
     "margin": 44523,
     "percent_invalid": 4.612584045333098,
     "ballot_surplus": 86
   },
   {
+    "cid": 48,
     "province_thai": "บุรีรัมย์",
     "province_eng": "BURI RAM",
     "prov_id": "BRM",
@@ -3127,14 +3620,17 @@ const CONST_RAW = [
     "invalid": 3058,
     "blank": 1800,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 49024,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 11225,
     "margin": 37799,
     "percent_invalid": 4.301710555930677,
     "ballot_surplus": 5042
   },
   {
+    "cid": 49,
     "province_thai": "บุรีรัมย์",
     "province_eng": "BURI RAM",
     "prov_id": "BRM",
@@ -3146,14 +3642,17 @@ const CONST_RAW = [
     "invalid": 2920,
     "blank": 2477,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 50853,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 10178,
     "margin": 40675,
     "percent_invalid": 3.7450301397973584,
     "ballot_surplus": 5719
   },
   {
+    "cid": 50,
     "province_thai": "บุรีรัมย์",
     "province_eng": "BURI RAM",
     "prov_id": "BRM",
@@ -3165,14 +3664,17 @@ const CONST_RAW = [
     "invalid": 2667,
     "blank": 2534,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 47010,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 8372,
     "margin": 38638,
     "percent_invalid": 3.837078813339856,
     "ballot_surplus": -397
   },
   {
+    "cid": 51,
     "province_thai": "บุรีรัมย์",
     "province_eng": "BURI RAM",
     "prov_id": "BRM",
@@ -3184,14 +3686,17 @@ const CONST_RAW = [
     "invalid": 2802,
     "blank": 2023,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 42445,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 12811,
     "margin": 29634,
     "percent_invalid": 3.939986219891165,
     "ballot_surplus": 562
   },
   {
+    "cid": 52,
     "province_thai": "บุรีรัมย์",
     "province_eng": "BURI RAM",
     "prov_id": "BRM",
@@ -3203,14 +3708,17 @@ const CONST_RAW = [
     "invalid": 3042,
     "blank": 3305,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 49860,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 14410,
     "margin": 35450,
     "percent_invalid": 3.8148027388327357,
     "ballot_surplus": 100
   },
   {
+    "cid": 53,
     "province_thai": "บุรีรัมย์",
     "province_eng": "BURI RAM",
     "prov_id": "BRM",
@@ -3222,14 +3730,17 @@ const CONST_RAW = [
     "invalid": 3038,
     "blank": 1975,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 50073,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 5665,
     "margin": 44408,
     "percent_invalid": 4.5321637426900585,
     "ballot_surplus": -5483
   },
   {
+    "cid": 54,
     "province_thai": "บุรีรัมย์",
     "province_eng": "BURI RAM",
     "prov_id": "BRM",
@@ -3241,14 +3752,17 @@ const CONST_RAW = [
     "invalid": 2705,
     "blank": 1927,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 47751,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 6224,
     "margin": 41527,
     "percent_invalid": 4.151510965821017,
     "ballot_surplus": -14
   },
   {
+    "cid": 255,
     "province_thai": "ปทุมธานี",
     "province_eng": "PATHUM THANI",
     "prov_id": "PTE",
@@ -3260,14 +3774,17 @@ const CONST_RAW = [
     "invalid": 2728,
     "blank": 4277,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 30452,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 23490,
     "margin": 6962,
     "percent_invalid": 2.825683892151684,
     "ballot_surplus": -7
   },
   {
+    "cid": 256,
     "province_thai": "ปทุมธานี",
     "province_eng": "PATHUM THANI",
     "prov_id": "PTE",
@@ -3279,14 +3796,17 @@ const CONST_RAW = [
     "invalid": 1936,
     "blank": 3616,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 34695,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 30206,
     "margin": 4489,
     "percent_invalid": 1.9832814292738896,
     "ballot_surplus": 118
   },
   {
+    "cid": 257,
     "province_thai": "ปทุมธานี",
     "province_eng": "PATHUM THANI",
     "prov_id": "PTE",
@@ -3298,14 +3818,17 @@ const CONST_RAW = [
     "invalid": 2794,
     "blank": 6353,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 39732,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 21803,
     "margin": 17929,
     "percent_invalid": 3.144979738856371,
     "ballot_surplus": 14
   },
   {
+    "cid": 258,
     "province_thai": "ปทุมธานี",
     "province_eng": "PATHUM THANI",
     "prov_id": "PTE",
@@ -3317,14 +3840,17 @@ const CONST_RAW = [
     "invalid": 2367,
     "blank": 4908,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 36892,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 16662,
     "margin": 20230,
     "percent_invalid": 2.608781907155138,
     "ballot_surplus": 50
   },
   {
+    "cid": 259,
     "province_thai": "ปทุมธานี",
     "province_eng": "PATHUM THANI",
     "prov_id": "PTE",
@@ -3336,14 +3862,17 @@ const CONST_RAW = [
     "invalid": 1572,
     "blank": 4711,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 30721,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 12184,
     "margin": 18537,
     "percent_invalid": 1.9634292565947242,
     "ballot_surplus": -413
   },
   {
+    "cid": 260,
     "province_thai": "ปทุมธานี",
     "province_eng": "PATHUM THANI",
     "prov_id": "PTE",
@@ -3355,14 +3884,17 @@ const CONST_RAW = [
     "invalid": 1644,
     "blank": 4659,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 38628,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 9439,
     "margin": 29189,
     "percent_invalid": 1.9666953775480907,
     "ballot_surplus": 665
   },
   {
+    "cid": 261,
     "province_thai": "ปทุมธานี",
     "province_eng": "PATHUM THANI",
     "prov_id": "PTE",
@@ -3374,14 +3906,17 @@ const CONST_RAW = [
     "invalid": 2068,
     "blank": 3578,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 44519,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 25783,
     "margin": 18736,
     "percent_invalid": 2.3709886380573484,
     "ballot_surplus": -274
   },
   {
+    "cid": 400,
     "province_thai": "ปทุมธานี",
     "province_eng": "PATHUM THANI",
     "prov_id": "PTE",
@@ -3393,14 +3928,17 @@ const CONST_RAW = [
     "invalid": 3095,
     "blank": 3412,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 36814,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 23271,
     "margin": 13543,
     "percent_invalid": 3.844959314243121,
     "ballot_surplus": -461
   },
   {
+    "cid": 227,
     "province_thai": "ประจวบคีรีขันธ์",
     "province_eng": "PRACHUAP KHIRI KHAN",
     "prov_id": "PKN",
@@ -3412,14 +3950,17 @@ const CONST_RAW = [
     "invalid": 3127,
     "blank": 2148,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 47612,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 40856,
     "margin": 6756,
     "percent_invalid": 2.912793188889096,
     "ballot_surplus": -243
   },
   {
+    "cid": 228,
     "province_thai": "ประจวบคีรีขันธ์",
     "province_eng": "PRACHUAP KHIRI KHAN",
     "prov_id": "PKN",
@@ -3431,14 +3972,17 @@ const CONST_RAW = [
     "invalid": 2591,
     "blank": 4182,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 41386,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 21456,
     "margin": 19930,
     "percent_invalid": 2.634709836182264,
     "ballot_surplus": -247
   },
   {
+    "cid": 229,
     "province_thai": "ประจวบคีรีขันธ์",
     "province_eng": "PRACHUAP KHIRI KHAN",
     "prov_id": "PKN",
@@ -3450,14 +3994,17 @@ const CONST_RAW = [
     "invalid": 2411,
     "blank": 1968,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 31101,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 23915,
     "margin": 7186,
     "percent_invalid": 2.586882114998766,
     "ballot_surplus": -61
   },
   {
+    "cid": 252,
     "province_thai": "ปราจีนบุรี",
     "province_eng": "PRACHIN BURI",
     "prov_id": "PRI",
@@ -3469,33 +4016,39 @@ const CONST_RAW = [
     "invalid": 3509,
     "blank": 7790,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 40077,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 27069,
     "margin": 13008,
     "percent_invalid": 3.9047894596278825,
     "ballot_surplus": -400
   },
   {
+    "cid": 253,
     "province_thai": "ปราจีนบุรี",
-    "province_eng": "",
-    "prov_id": "",
+    "province_eng": "PRACHIN BURI",
+    "prov_id": "PRI",
     "cons_no": 2,
-    "region": "",
+    "region": "Central",
     "turn_out": 101887,
     "total_used": 101887,
     "valid": 94564,
     "invalid": 3353,
     "blank": 3970,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 41694,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 30981,
     "margin": 10713,
     "percent_invalid": 3.2909007037207885,
     "ballot_surplus": 303
   },
   {
+    "cid": 254,
     "province_thai": "ปราจีนบุรี",
     "province_eng": "PRACHIN BURI",
     "prov_id": "PRI",
@@ -3507,14 +4060,17 @@ const CONST_RAW = [
     "invalid": 4326,
     "blank": 4256,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 42918,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 21562,
     "margin": 21356,
     "percent_invalid": 5.021532461200943,
     "ballot_surplus": 261
   },
   {
+    "cid": 262,
     "province_thai": "ปัตตานี",
     "province_eng": "PATTANI",
     "prov_id": "PTN",
@@ -3526,14 +4082,17 @@ const CONST_RAW = [
     "invalid": 1946,
     "blank": 2285,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 22538,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 15127,
     "margin": 7411,
     "percent_invalid": 2.95403485336086,
     "ballot_surplus": -4373
   },
   {
+    "cid": 263,
     "province_thai": "ปัตตานี",
     "province_eng": "PATTANI",
     "prov_id": "PTN",
@@ -3545,14 +4104,17 @@ const CONST_RAW = [
     "invalid": 2713,
     "blank": 2613,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 36360,
     "runnerup_party": "ประชาชาติ",
+    "runnerup_pid": 35,
     "runnerup_votes": 13377,
     "margin": 22983,
     "percent_invalid": 3.5117013565289428,
     "ballot_surplus": 2853
   },
   {
+    "cid": 264,
     "province_thai": "ปัตตานี",
     "province_eng": "PATTANI",
     "prov_id": "PTN",
@@ -3564,14 +4126,17 @@ const CONST_RAW = [
     "invalid": 2490,
     "blank": 1483,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 28280,
     "runnerup_party": "ประชาชาติ",
+    "runnerup_pid": 35,
     "runnerup_votes": 23025,
     "margin": 5255,
     "percent_invalid": 3.820952322494514,
     "ballot_surplus": 102
   },
   {
+    "cid": 265,
     "province_thai": "ปัตตานี",
     "province_eng": "PATTANI",
     "prov_id": "PTN",
@@ -3583,14 +4148,17 @@ const CONST_RAW = [
     "invalid": 2003,
     "blank": 921,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 27479,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 24367,
     "margin": 3112,
     "percent_invalid": 2.6386162743212447,
     "ballot_surplus": -3110
   },
   {
+    "cid": 266,
     "province_thai": "ปัตตานี",
     "province_eng": "PATTANI",
     "prov_id": "PTN",
@@ -3602,14 +4170,17 @@ const CONST_RAW = [
     "invalid": 2953,
     "blank": 1571,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 32162,
     "runnerup_party": "ประชาชาติ",
+    "runnerup_pid": 35,
     "runnerup_votes": 21989,
     "margin": 10173,
     "percent_invalid": 4.208950969213228,
     "ballot_surplus": 232
   },
   {
+    "cid": 4,
     "province_thai": "พระนครศรีอยุธยา",
     "province_eng": "PHRA NAKHON SI AYUTTHAYA",
     "prov_id": "AYA",
@@ -3621,14 +4192,17 @@ const CONST_RAW = [
     "invalid": 3338,
     "blank": 4841,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 43361,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 34926,
     "margin": 8435,
     "percent_invalid": 3.3687567491194605,
     "ballot_surplus": 848
   },
   {
+    "cid": 5,
     "province_thai": "พระนครศรีอยุธยา",
     "province_eng": "PHRA NAKHON SI AYUTTHAYA",
     "prov_id": "AYA",
@@ -3640,14 +4214,17 @@ const CONST_RAW = [
     "invalid": 3371,
     "blank": 4455,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 51200,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 24678,
     "margin": 26522,
     "percent_invalid": 3.437200481269246,
     "ballot_surplus": 446
   },
   {
+    "cid": 6,
     "province_thai": "พระนครศรีอยุธยา",
     "province_eng": "PHRA NAKHON SI AYUTTHAYA",
     "prov_id": "AYA",
@@ -3659,14 +4236,17 @@ const CONST_RAW = [
     "invalid": 3436,
     "blank": 3466,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 54931,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 28912,
     "margin": 26019,
     "percent_invalid": 3.4293470666906205,
     "ballot_surplus": 233
   },
   {
+    "cid": 7,
     "province_thai": "พระนครศรีอยุธยา",
     "province_eng": "PHRA NAKHON SI AYUTTHAYA",
     "prov_id": "AYA",
@@ -3678,14 +4258,17 @@ const CONST_RAW = [
     "invalid": 2797,
     "blank": 3749,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 47001,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 27851,
     "margin": 19150,
     "percent_invalid": 2.7268118626552535,
     "ballot_surplus": 862
   },
   {
+    "cid": 8,
     "province_thai": "พระนครศรีอยุธยา",
     "province_eng": "PHRA NAKHON SI AYUTTHAYA",
     "prov_id": "AYA",
@@ -3697,14 +4280,17 @@ const CONST_RAW = [
     "invalid": 4153,
     "blank": 2667,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 44041,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 25654,
     "margin": 18387,
     "percent_invalid": 4.231407990055732,
     "ballot_surplus": -86
   },
   {
+    "cid": 267,
     "province_thai": "พะเยา",
     "province_eng": "PHAYAO",
     "prov_id": "PYO",
@@ -3716,14 +4302,17 @@ const CONST_RAW = [
     "invalid": 2652,
     "blank": 3079,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 61641,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 13063,
     "margin": 48578,
     "percent_invalid": 3.114101525346109,
     "ballot_surplus": 75
   },
   {
+    "cid": 268,
     "province_thai": "พะเยา",
     "province_eng": "PHAYAO",
     "prov_id": "PYO",
@@ -3735,14 +4324,17 @@ const CONST_RAW = [
     "invalid": 3837,
     "blank": 3280,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 52697,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 19683,
     "margin": 33014,
     "percent_invalid": 4.183521048442492,
     "ballot_surplus": -278
   },
   {
+    "cid": 269,
     "province_thai": "พะเยา",
     "province_eng": "PHAYAO",
     "prov_id": "PYO",
@@ -3754,14 +4346,17 @@ const CONST_RAW = [
     "invalid": 4223,
     "blank": 2581,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 55450,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 11442,
     "margin": 44008,
     "percent_invalid": 4.972798568097784,
     "ballot_surplus": 522
   },
   {
+    "cid": 241,
     "province_thai": "พังงา",
     "province_eng": "PHANGNGA",
     "prov_id": "PNA",
@@ -3773,14 +4368,17 @@ const CONST_RAW = [
     "invalid": 2801,
     "blank": 4823,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 34785,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 14816,
     "margin": 19969,
     "percent_invalid": 3.937140688472513,
     "ballot_surplus": 268
   },
   {
+    "cid": 242,
     "province_thai": "พังงา",
     "province_eng": "PHANGNGA",
     "prov_id": "PNA",
@@ -3792,14 +4390,17 @@ const CONST_RAW = [
     "invalid": 2717,
     "blank": 4555,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 25124,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 22456,
     "margin": 2668,
     "percent_invalid": 3.4225178243015146,
     "ballot_surplus": -313
   },
   {
+    "cid": 233,
     "province_thai": "พัทลุง",
     "province_eng": "PHATTHALUNG",
     "prov_id": "PLG",
@@ -3811,14 +4412,17 @@ const CONST_RAW = [
     "invalid": 1918,
     "blank": 2953,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 40279,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 38326,
     "margin": 1953,
     "percent_invalid": 1.757037769899506,
     "ballot_surplus": 8421
   },
   {
+    "cid": 234,
     "province_thai": "พัทลุง",
     "province_eng": "PHATTHALUNG",
     "prov_id": "PLG",
@@ -3830,14 +4434,17 @@ const CONST_RAW = [
     "invalid": 2277,
     "blank": 2718,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 55709,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 34079,
     "margin": 21630,
     "percent_invalid": 1.9610545081861324,
     "ballot_surplus": 7445
   },
   {
+    "cid": 235,
     "province_thai": "พัทลุง",
     "province_eng": "PHATTHALUNG",
     "prov_id": "PLG",
@@ -3849,14 +4456,17 @@ const CONST_RAW = [
     "invalid": 2990,
     "blank": 3599,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 44245,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 28907,
     "margin": 15338,
     "percent_invalid": 2.859438058259855,
     "ballot_surplus": -222
   },
   {
+    "cid": 224,
     "province_thai": "พิจิตร",
     "province_eng": "PHICHIT",
     "prov_id": "PCT",
@@ -3868,14 +4478,17 @@ const CONST_RAW = [
     "invalid": 4786,
     "blank": 4274,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 50052,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 21619,
     "margin": 28433,
     "percent_invalid": 5.082297971753212,
     "ballot_surplus": 477
   },
   {
+    "cid": 225,
     "province_thai": "พิจิตร",
     "province_eng": "PHICHIT",
     "prov_id": "PCT",
@@ -3887,14 +4500,17 @@ const CONST_RAW = [
     "invalid": 4109,
     "blank": 3369,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 44182,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 19199,
     "margin": 24983,
     "percent_invalid": 4.757604177521507,
     "ballot_surplus": 297
   },
   {
+    "cid": 226,
     "province_thai": "พิจิตร",
     "province_eng": "PHICHIT",
     "prov_id": "PCT",
@@ -3906,14 +4522,17 @@ const CONST_RAW = [
     "invalid": 3378,
     "blank": 1708,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 36214,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 30372,
     "margin": 5842,
     "percent_invalid": 3.758888134687928,
     "ballot_surplus": 392
   },
   {
+    "cid": 236,
     "province_thai": "พิษณุโลก",
     "province_eng": "PHITSANULOK",
     "prov_id": "PLK",
@@ -3925,14 +4544,17 @@ const CONST_RAW = [
     "invalid": 2929,
     "blank": 6141,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 32516,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 31628,
     "margin": 888,
     "percent_invalid": 3.1389990354731543,
     "ballot_surplus": -467
   },
   {
+    "cid": 237,
     "province_thai": "พิษณุโลก",
     "province_eng": "PHITSANULOK",
     "prov_id": "PLK",
@@ -3944,14 +4566,17 @@ const CONST_RAW = [
     "invalid": 4544,
     "blank": 6808,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 38287,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 26672,
     "margin": 11615,
     "percent_invalid": 5.057261466205162,
     "ballot_surplus": 39
   },
   {
+    "cid": 238,
     "province_thai": "พิษณุโลก",
     "province_eng": "PHITSANULOK",
     "prov_id": "PLK",
@@ -3963,14 +4588,17 @@ const CONST_RAW = [
     "invalid": 4011,
     "blank": 2804,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 40704,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 21078,
     "margin": 19626,
     "percent_invalid": 4.394556928740468,
     "ballot_surplus": 475
   },
   {
+    "cid": 239,
     "province_thai": "พิษณุโลก",
     "province_eng": "PHITSANULOK",
     "prov_id": "PLK",
@@ -3982,14 +4610,17 @@ const CONST_RAW = [
     "invalid": 3141,
     "blank": 2242,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 40713,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 27898,
     "margin": 12815,
     "percent_invalid": 3.517751147944899,
     "ballot_surplus": 4662
   },
   {
+    "cid": 240,
     "province_thai": "พิษณุโลก",
     "province_eng": "PHITSANULOK",
     "prov_id": "PLK",
@@ -4001,14 +4632,17 @@ const CONST_RAW = [
     "invalid": 3963,
     "blank": 2489,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 31777,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 28058,
     "margin": 3719,
     "percent_invalid": 4.66438331979803,
     "ballot_surplus": -5104
   },
   {
+    "cid": 230,
     "province_thai": "ภูเก็ต",
     "province_eng": "PHUKET",
     "prov_id": "PKT",
@@ -4020,14 +4654,17 @@ const CONST_RAW = [
     "invalid": 1873,
     "blank": 4302,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 18463,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 16221,
     "margin": 2242,
     "percent_invalid": 2.6931040432507043,
     "ballot_surplus": -134
   },
   {
+    "cid": 231,
     "province_thai": "ภูเก็ต",
     "province_eng": "PHUKET",
     "prov_id": "PKT",
@@ -4039,14 +4676,17 @@ const CONST_RAW = [
     "invalid": 2751,
     "blank": 4834,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 21359,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 18945,
     "margin": 2414,
     "percent_invalid": 4.264917910794846,
     "ballot_surplus": -170
   },
   {
+    "cid": 232,
     "province_thai": "ภูเก็ต",
     "province_eng": "PHUKET",
     "prov_id": "PKT",
@@ -4058,14 +4698,17 @@ const CONST_RAW = [
     "invalid": 2035,
     "blank": 4667,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 29323,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 19199,
     "margin": 10124,
     "percent_invalid": 2.591069405008976,
     "ballot_surplus": 27
   },
   {
+    "cid": 147,
     "province_thai": "มหาสารคาม",
     "province_eng": "MAHA SARAKHAM",
     "prov_id": "MKM",
@@ -4077,14 +4720,17 @@ const CONST_RAW = [
     "invalid": 1957,
     "blank": 3287,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 30711,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 21311,
     "margin": 9400,
     "percent_invalid": 2.3003232441962975,
     "ballot_surplus": 45
   },
   {
+    "cid": 148,
     "province_thai": "มหาสารคาม",
     "province_eng": "MAHA SARAKHAM",
     "prov_id": "MKM",
@@ -4096,14 +4742,17 @@ const CONST_RAW = [
     "invalid": 1940,
     "blank": 1415,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 30045,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 18760,
     "margin": 11285,
     "percent_invalid": 2.6880603012290254,
     "ballot_surplus": -401
   },
   {
+    "cid": 149,
     "province_thai": "มหาสารคาม",
     "province_eng": "MAHA SARAKHAM",
     "prov_id": "MKM",
@@ -4115,14 +4764,17 @@ const CONST_RAW = [
     "invalid": 1858,
     "blank": 613,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 35150,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 31887,
     "margin": 3263,
     "percent_invalid": 2.415433816073425,
     "ballot_surplus": 185
   },
   {
+    "cid": 150,
     "province_thai": "มหาสารคาม",
     "province_eng": "MAHA SARAKHAM",
     "prov_id": "MKM",
@@ -4134,14 +4786,17 @@ const CONST_RAW = [
     "invalid": 2797,
     "blank": 1267,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 29448,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 20412,
     "margin": 9036,
     "percent_invalid": 3.4694054751361345,
     "ballot_surplus": -569
   },
   {
+    "cid": 151,
     "province_thai": "มหาสารคาม",
     "province_eng": "MAHA SARAKHAM",
     "prov_id": "MKM",
@@ -4153,14 +4808,17 @@ const CONST_RAW = [
     "invalid": 2769,
     "blank": 3430,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 32999,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 15726,
     "margin": 17273,
     "percent_invalid": 3.7035055572645685,
     "ballot_surplus": 4
   },
   {
+    "cid": 152,
     "province_thai": "มหาสารคาม",
     "province_eng": "MAHA SARAKHAM",
     "prov_id": "MKM",
@@ -4172,14 +4830,17 @@ const CONST_RAW = [
     "invalid": 2325,
     "blank": 2003,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 36685,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 28872,
     "margin": 7813,
     "percent_invalid": 2.6932165693633583,
     "ballot_surplus": -321
   },
   {
+    "cid": 145,
     "province_thai": "มุกดาหาร",
     "province_eng": "MUKDAHAN",
     "prov_id": "MDH",
@@ -4191,14 +4852,17 @@ const CONST_RAW = [
     "invalid": 2917,
     "blank": 2266,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 29345,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 21666,
     "margin": 7679,
     "percent_invalid": 3.0745393987942156,
     "ballot_surplus": 170
   },
   {
+    "cid": 146,
     "province_thai": "มุกดาหาร",
     "province_eng": "MUKDAHAN",
     "prov_id": "MDH",
@@ -4210,14 +4874,17 @@ const CONST_RAW = [
     "invalid": 3594,
     "blank": 2205,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 39782,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 21700,
     "margin": 18082,
     "percent_invalid": 3.9859372054077435,
     "ballot_surplus": 409
   },
   {
+    "cid": 394,
     "province_thai": "ยะลา",
     "province_eng": "YALA",
     "prov_id": "YLA",
@@ -4229,14 +4896,17 @@ const CONST_RAW = [
     "invalid": 2802,
     "blank": 4474,
     "winner_party": "ประชาชาติ",
+    "winner_pid": 35,
     "winner_votes": 29562,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 19129,
     "margin": 10433,
     "percent_invalid": 3.1610297601588413,
     "ballot_surplus": 405
   },
   {
+    "cid": 395,
     "province_thai": "ยะลา",
     "province_eng": "YALA",
     "prov_id": "YLA",
@@ -4248,14 +4918,17 @@ const CONST_RAW = [
     "invalid": 4990,
     "blank": 3597,
     "winner_party": "ประชาชาติ",
+    "winner_pid": 35,
     "winner_votes": 44309,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 23060,
     "margin": 21249,
     "percent_invalid": 5.428338319282024,
     "ballot_surplus": 3254
   },
   {
+    "cid": 396,
     "province_thai": "ยะลา",
     "province_eng": "YALA",
     "prov_id": "YLA",
@@ -4267,14 +4940,17 @@ const CONST_RAW = [
     "invalid": 3987,
     "blank": 4319,
     "winner_party": "ประชาชาติ",
+    "winner_pid": 35,
     "winner_votes": 33171,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 24675,
     "margin": 8496,
     "percent_invalid": 4.375884890191301,
     "ballot_surplus": -22
   },
   {
+    "cid": 397,
     "province_thai": "ยโสธร",
     "province_eng": "YASOTHON",
     "prov_id": "YST",
@@ -4286,14 +4962,17 @@ const CONST_RAW = [
     "invalid": 2747,
     "blank": 2016,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 46760,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 34668,
     "margin": 12092,
     "percent_invalid": 2.7352929461903055,
     "ballot_surplus": 8102
   },
   {
+    "cid": 398,
     "province_thai": "ยโสธร",
     "province_eng": "YASOTHON",
     "prov_id": "YST",
@@ -4305,14 +4984,17 @@ const CONST_RAW = [
     "invalid": 1694,
     "blank": 788,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 46438,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 25938,
     "margin": 20500,
     "percent_invalid": 2.078629625993914,
     "ballot_surplus": -87
   },
   {
+    "cid": 399,
     "province_thai": "ยโสธร",
     "province_eng": "YASOTHON",
     "prov_id": "YST",
@@ -4324,14 +5006,17 @@ const CONST_RAW = [
     "invalid": 3394,
     "blank": 1898,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 41851,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 28272,
     "margin": 13579,
     "percent_invalid": 3.641748124939644,
     "ballot_surplus": -816
   },
   {
+    "cid": 283,
     "province_thai": "ระนอง",
     "province_eng": "RANONG",
     "prov_id": "RNG",
@@ -4343,14 +5028,17 @@ const CONST_RAW = [
     "invalid": 4533,
     "blank": 7386,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 56553,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 13643,
     "margin": 42910,
     "percent_invalid": 4.9547481636935995,
     "ballot_surplus": 68
   },
   {
+    "cid": 284,
     "province_thai": "ระยอง",
     "province_eng": "RAYONG",
     "prov_id": "RYG",
@@ -4362,14 +5050,17 @@ const CONST_RAW = [
     "invalid": 2232,
     "blank": 3609,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 33569,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 26002,
     "margin": 7567,
     "percent_invalid": 2.620548765453841,
     "ballot_surplus": 0
   },
   {
+    "cid": 285,
     "province_thai": "ระยอง",
     "province_eng": "RAYONG",
     "prov_id": "RYG",
@@ -4381,14 +5072,17 @@ const CONST_RAW = [
     "invalid": 3408,
     "blank": 5067,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 30488,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 25516,
     "margin": 4972,
     "percent_invalid": 4.740773714301612,
     "ballot_surplus": -26
   },
   {
+    "cid": 286,
     "province_thai": "ระยอง",
     "province_eng": "RAYONG",
     "prov_id": "RYG",
@@ -4400,14 +5094,17 @@ const CONST_RAW = [
     "invalid": 3348,
     "blank": 4955,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 25516,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 22787,
     "margin": 2729,
     "percent_invalid": 4.17899269799663,
     "ballot_surplus": -187
   },
   {
+    "cid": 287,
     "province_thai": "ระยอง",
     "province_eng": "RAYONG",
     "prov_id": "RYG",
@@ -4419,14 +5116,17 @@ const CONST_RAW = [
     "invalid": 1994,
     "blank": 2344,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 32408,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 15785,
     "margin": 16623,
     "percent_invalid": 3.454788017395222,
     "ballot_surplus": 5077
   },
   {
+    "cid": 288,
     "province_thai": "ระยอง",
     "province_eng": "RAYONG",
     "prov_id": "RYG",
@@ -4438,14 +5138,17 @@ const CONST_RAW = [
     "invalid": 3288,
     "blank": 4575,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 35743,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 28154,
     "margin": 7589,
     "percent_invalid": 3.857389223242882,
     "ballot_surplus": -115
   },
   {
+    "cid": 270,
     "province_thai": "ราชบุรี",
     "province_eng": "RATCHABURI",
     "prov_id": "RBR",
@@ -4457,14 +5160,17 @@ const CONST_RAW = [
     "invalid": 3249,
     "blank": 5066,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 53723,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 26748,
     "margin": 26975,
     "percent_invalid": 3.231131840919714,
     "ballot_surplus": -376
   },
   {
+    "cid": 271,
     "province_thai": "ราชบุรี",
     "province_eng": "RATCHABURI",
     "prov_id": "RBR",
@@ -4476,14 +5182,17 @@ const CONST_RAW = [
     "invalid": 4636,
     "blank": 5979,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 41282,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 23928,
     "margin": 17354,
     "percent_invalid": 4.943853774540647,
     "ballot_surplus": -201
   },
   {
+    "cid": 272,
     "province_thai": "ราชบุรี",
     "province_eng": "RATCHABURI",
     "prov_id": "RBR",
@@ -4495,14 +5204,17 @@ const CONST_RAW = [
     "invalid": 5586,
     "blank": 7545,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 48792,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 23353,
     "margin": 25439,
     "percent_invalid": 5.480607909892762,
     "ballot_surplus": -2631
   },
   {
+    "cid": 273,
     "province_thai": "ราชบุรี",
     "province_eng": "RATCHABURI",
     "prov_id": "RBR",
@@ -4514,14 +5226,17 @@ const CONST_RAW = [
     "invalid": 2688,
     "blank": 2458,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 52731,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 24904,
     "margin": 27827,
     "percent_invalid": 2.496864985369932,
     "ballot_surplus": 137
   },
   {
+    "cid": 274,
     "province_thai": "ราชบุรี",
     "province_eng": "RATCHABURI",
     "prov_id": "RBR",
@@ -4533,14 +5248,17 @@ const CONST_RAW = [
     "invalid": 2915,
     "blank": 2627,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 41923,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 37575,
     "margin": 4348,
     "percent_invalid": 2.7509602408387837,
     "ballot_surplus": 572
   },
   {
+    "cid": 275,
     "province_thai": "ร้อยเอ็ด",
     "province_eng": "ROI ET",
     "prov_id": "RET",
@@ -4552,14 +5270,17 @@ const CONST_RAW = [
     "invalid": 2317,
     "blank": 1938,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 46309,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 18102,
     "margin": 28207,
     "percent_invalid": 2.7979712595097213,
     "ballot_surplus": 271
   },
   {
+    "cid": 276,
     "province_thai": "ร้อยเอ็ด",
     "province_eng": "ROI ET",
     "prov_id": "RET",
@@ -4571,14 +5292,17 @@ const CONST_RAW = [
     "invalid": 2860,
     "blank": 1709,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 41159,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 21685,
     "margin": 19474,
     "percent_invalid": 3.313483328312904,
     "ballot_surplus": -384
   },
   {
+    "cid": 277,
     "province_thai": "ร้อยเอ็ด",
     "province_eng": "ROI ET",
     "prov_id": "RET",
@@ -4590,14 +5314,17 @@ const CONST_RAW = [
     "invalid": 1975,
     "blank": 1324,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 33009,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 27564,
     "margin": 5445,
     "percent_invalid": 2.6257711125292493,
     "ballot_surplus": -6324
   },
   {
+    "cid": 278,
     "province_thai": "ร้อยเอ็ด",
     "province_eng": "ROI ET",
     "prov_id": "RET",
@@ -4609,14 +5336,17 @@ const CONST_RAW = [
     "invalid": 1898,
     "blank": 1546,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 21382,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 20703,
     "margin": 679,
     "percent_invalid": 2.3621067303863,
     "ballot_surplus": -119
   },
   {
+    "cid": 279,
     "province_thai": "ร้อยเอ็ด",
     "province_eng": "ROI ET",
     "prov_id": "RET",
@@ -4628,14 +5358,17 @@ const CONST_RAW = [
     "invalid": 4171,
     "blank": 2649,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 39346,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 10238,
     "margin": 29108,
     "percent_invalid": 6.115387434938787,
     "ballot_surplus": -8233
   },
   {
+    "cid": 280,
     "province_thai": "ร้อยเอ็ด",
     "province_eng": "ROI ET",
     "prov_id": "RET",
@@ -4647,14 +5380,17 @@ const CONST_RAW = [
     "invalid": 2696,
     "blank": 1082,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 30715,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 18930,
     "margin": 11785,
     "percent_invalid": 3.863239045080675,
     "ballot_surplus": 321
   },
   {
+    "cid": 281,
     "province_thai": "ร้อยเอ็ด",
     "province_eng": "ROI ET",
     "prov_id": "RET",
@@ -4666,14 +5402,17 @@ const CONST_RAW = [
     "invalid": 2289,
     "blank": 522,
     "winner_party": "ไทยสร้างไทย",
+    "winner_pid": 49,
     "winner_votes": 39470,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 27265,
     "margin": 12205,
     "percent_invalid": 3.1098853323188957,
     "ballot_surplus": -116
   },
   {
+    "cid": 282,
     "province_thai": "ร้อยเอ็ด",
     "province_eng": "ROI ET",
     "prov_id": "RET",
@@ -4685,14 +5424,17 @@ const CONST_RAW = [
     "invalid": 1986,
     "blank": 1528,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 24500,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 22137,
     "margin": 2363,
     "percent_invalid": 2.4502183729365608,
     "ballot_surplus": 0
   },
   {
+    "cid": 140,
     "province_thai": "ลพบุรี",
     "province_eng": "LOP BURI",
     "prov_id": "LRI",
@@ -4704,14 +5446,17 @@ const CONST_RAW = [
     "invalid": 3424,
     "blank": 5073,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 35960,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 20781,
     "margin": 15179,
     "percent_invalid": 3.5214744117163077,
     "ballot_surplus": 128
   },
   {
+    "cid": 141,
     "province_thai": "ลพบุรี",
     "province_eng": "LOP BURI",
     "prov_id": "LRI",
@@ -4723,14 +5468,17 @@ const CONST_RAW = [
     "invalid": 3842,
     "blank": 4296,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 55191,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 22624,
     "margin": 32567,
     "percent_invalid": 3.4617290624859214,
     "ballot_surplus": 139
   },
   {
+    "cid": 142,
     "province_thai": "ลพบุรี",
     "province_eng": "LOP BURI",
     "prov_id": "LRI",
@@ -4742,14 +5490,17 @@ const CONST_RAW = [
     "invalid": 3661,
     "blank": 2636,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 46398,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 25894,
     "margin": 20504,
     "percent_invalid": 3.6677119128004247,
     "ballot_surplus": 4489
   },
   {
+    "cid": 143,
     "province_thai": "ลพบุรี",
     "province_eng": "LOP BURI",
     "prov_id": "LRI",
@@ -4761,14 +5512,17 @@ const CONST_RAW = [
     "invalid": 4531,
     "blank": 2981,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 47865,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 31093,
     "margin": 16772,
     "percent_invalid": 4.130054326029096,
     "ballot_surplus": -555
   },
   {
+    "cid": 134,
     "province_thai": "ลำปาง",
     "province_eng": "LAMPANG",
     "prov_id": "LPG",
@@ -4780,14 +5534,17 @@ const CONST_RAW = [
     "invalid": 4381,
     "blank": 8368,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 44799,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 22423,
     "margin": 22376,
     "percent_invalid": 4.1680937702173,
     "ballot_surplus": 885
   },
   {
+    "cid": 135,
     "province_thai": "ลำปาง",
     "province_eng": "LAMPANG",
     "prov_id": "LPG",
@@ -4799,14 +5556,17 @@ const CONST_RAW = [
     "invalid": 7364,
     "blank": 5150,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 33987,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 31810,
     "margin": 2177,
     "percent_invalid": 6.971570307396643,
     "ballot_surplus": -182
   },
   {
+    "cid": 136,
     "province_thai": "ลำปาง",
     "province_eng": "LAMPANG",
     "prov_id": "LPG",
@@ -4818,14 +5578,17 @@ const CONST_RAW = [
     "invalid": 4161,
     "blank": 6599,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 33259,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 25321,
     "margin": 7938,
     "percent_invalid": 4.208003397955159,
     "ballot_surplus": -98
   },
   {
+    "cid": 137,
     "province_thai": "ลำปาง",
     "province_eng": "LAMPANG",
     "prov_id": "LPG",
@@ -4837,14 +5600,17 @@ const CONST_RAW = [
     "invalid": 6329,
     "blank": 4468,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 36082,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 28443,
     "margin": 7639,
     "percent_invalid": 5.747940676965553,
     "ballot_surplus": -507
   },
   {
+    "cid": 138,
     "province_thai": "ลำพูน",
     "province_eng": "LAMPHUN",
     "prov_id": "LPN",
@@ -4856,14 +5622,17 @@ const CONST_RAW = [
     "invalid": 4760,
     "blank": 7852,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 54610,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 24334,
     "margin": 30276,
     "percent_invalid": 4.101998431588835,
     "ballot_surplus": 1858
   },
   {
+    "cid": 139,
     "province_thai": "ลำพูน",
     "province_eng": "LAMPHUN",
     "prov_id": "LPN",
@@ -4875,14 +5644,17 @@ const CONST_RAW = [
     "invalid": 7266,
     "blank": 6880,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 46583,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 33089,
     "margin": 13494,
     "percent_invalid": 5.800271413746308,
     "ballot_surplus": 133
   },
   {
+    "cid": 345,
     "province_thai": "ศรีสะเกษ",
     "province_eng": "SI SA KET",
     "prov_id": "SSK",
@@ -4894,14 +5666,17 @@ const CONST_RAW = [
     "invalid": 1964,
     "blank": 1434,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 44088,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 21119,
     "margin": 22969,
     "percent_invalid": 2.3921463545346033,
     "ballot_surplus": -73
   },
   {
+    "cid": 346,
     "province_thai": "ศรีสะเกษ",
     "province_eng": "SI SA KET",
     "prov_id": "SSK",
@@ -4913,14 +5688,17 @@ const CONST_RAW = [
     "invalid": 2191,
     "blank": 1351,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 32241,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 27264,
     "margin": 4977,
     "percent_invalid": 2.97985773933385,
     "ballot_surplus": -686
   },
   {
+    "cid": 347,
     "province_thai": "ศรีสะเกษ",
     "province_eng": "SI SA KET",
     "prov_id": "SSK",
@@ -4932,14 +5710,17 @@ const CONST_RAW = [
     "invalid": 3067,
     "blank": 2228,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 49781,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 8930,
     "margin": 40851,
     "percent_invalid": 3.8913418595209097,
     "ballot_surplus": 296
   },
   {
+    "cid": 348,
     "province_thai": "ศรีสะเกษ",
     "province_eng": "SI SA KET",
     "prov_id": "SSK",
@@ -4951,14 +5732,17 @@ const CONST_RAW = [
     "invalid": 2520,
     "blank": 1692,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 38705,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 18545,
     "margin": 20160,
     "percent_invalid": 3.4998055663574243,
     "ballot_surplus": 500
   },
   {
+    "cid": 349,
     "province_thai": "ศรีสะเกษ",
     "province_eng": "SI SA KET",
     "prov_id": "SSK",
@@ -4970,14 +5754,17 @@ const CONST_RAW = [
     "invalid": 3280,
     "blank": 1848,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 37079,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 24402,
     "margin": 12677,
     "percent_invalid": 4.063580162790985,
     "ballot_surplus": 324
   },
   {
+    "cid": 350,
     "province_thai": "ศรีสะเกษ",
     "province_eng": "SI SA KET",
     "prov_id": "SSK",
@@ -4989,14 +5776,17 @@ const CONST_RAW = [
     "invalid": 2850,
     "blank": 1245,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 26211,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 25995,
     "margin": 216,
     "percent_invalid": 4.015668150820042,
     "ballot_surplus": 10408
   },
   {
+    "cid": 351,
     "province_thai": "ศรีสะเกษ",
     "province_eng": "SI SA KET",
     "prov_id": "SSK",
@@ -5008,14 +5798,17 @@ const CONST_RAW = [
     "invalid": 3877,
     "blank": 760,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 31868,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 28597,
     "margin": 3271,
     "percent_invalid": 5.4072524407252445,
     "ballot_surplus": 34
   },
   {
+    "cid": 352,
     "province_thai": "ศรีสะเกษ",
     "province_eng": "SI SA KET",
     "prov_id": "SSK",
@@ -5027,14 +5820,17 @@ const CONST_RAW = [
     "invalid": 2679,
     "blank": 1530,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 53218,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 8786,
     "margin": 44432,
     "percent_invalid": 3.522080380737021,
     "ballot_surplus": 455
   },
   {
+    "cid": 353,
     "province_thai": "ศรีสะเกษ",
     "province_eng": "SI SA KET",
     "prov_id": "SSK",
@@ -5046,14 +5842,17 @@ const CONST_RAW = [
     "invalid": 2521,
     "blank": 1568,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 37040,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 17859,
     "margin": 19181,
     "percent_invalid": 2.8967688560003677,
     "ballot_surplus": 63
   },
   {
+    "cid": 313,
     "province_thai": "สกลนคร",
     "province_eng": "SAKON NAKHON",
     "prov_id": "SNK",
@@ -5065,14 +5864,17 @@ const CONST_RAW = [
     "invalid": 2142,
     "blank": 3517,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 25107,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 21567,
     "margin": 3540,
     "percent_invalid": 2.409855431175114,
     "ballot_surplus": -295
   },
   {
+    "cid": 314,
     "province_thai": "สกลนคร",
     "province_eng": "SAKON NAKHON",
     "prov_id": "SNK",
@@ -5084,14 +5886,17 @@ const CONST_RAW = [
     "invalid": 3076,
     "blank": 1682,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 23501,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 20045,
     "margin": 3456,
     "percent_invalid": 3.6844500874398105,
     "ballot_surplus": 123
   },
   {
+    "cid": 315,
     "province_thai": "สกลนคร",
     "province_eng": "SAKON NAKHON",
     "prov_id": "SNK",
@@ -5103,14 +5908,17 @@ const CONST_RAW = [
     "invalid": 3743,
     "blank": 3113,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 44745,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 10191,
     "margin": 34554,
     "percent_invalid": 4.850456147625959,
     "ballot_surplus": -206
   },
   {
+    "cid": 316,
     "province_thai": "สกลนคร",
     "province_eng": "SAKON NAKHON",
     "prov_id": "SNK",
@@ -5122,14 +5930,17 @@ const CONST_RAW = [
     "invalid": 3172,
     "blank": 3406,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 27273,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 16206,
     "margin": 11067,
     "percent_invalid": 4.2264593409814655,
     "ballot_surplus": -3175
   },
   {
+    "cid": 317,
     "province_thai": "สกลนคร",
     "province_eng": "SAKON NAKHON",
     "prov_id": "SNK",
@@ -5141,14 +5952,17 @@ const CONST_RAW = [
     "invalid": 2018,
     "blank": 1297,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 26101,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 20000,
     "margin": 6101,
     "percent_invalid": 2.7281330269027984,
     "ballot_surplus": -365
   },
   {
+    "cid": 318,
     "province_thai": "สกลนคร",
     "province_eng": "SAKON NAKHON",
     "prov_id": "SNK",
@@ -5160,14 +5974,17 @@ const CONST_RAW = [
     "invalid": 2918,
     "blank": 1904,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 32790,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 21434,
     "margin": 11356,
     "percent_invalid": 4.015798962332962,
     "ballot_surplus": -4589
   },
   {
+    "cid": 319,
     "province_thai": "สกลนคร",
     "province_eng": "SAKON NAKHON",
     "prov_id": "SNK",
@@ -5179,14 +5996,17 @@ const CONST_RAW = [
     "invalid": 2735,
     "blank": 2796,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 23035,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 16597,
     "margin": 6438,
     "percent_invalid": 3.6217490333174425,
     "ballot_surplus": -448
   },
   {
+    "cid": 290,
     "province_thai": "สงขลา",
     "province_eng": "SONGKHLA",
     "prov_id": "SKA",
@@ -5198,14 +6018,17 @@ const CONST_RAW = [
     "invalid": 2732,
     "blank": 7065,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 41498,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 19851,
     "margin": 21647,
     "percent_invalid": 2.9808730946743625,
     "ballot_surplus": -81
   },
   {
+    "cid": 291,
     "province_thai": "สงขลา",
     "province_eng": "SONGKHLA",
     "prov_id": "SKA",
@@ -5217,14 +6040,17 @@ const CONST_RAW = [
     "invalid": 1341,
     "blank": 2544,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 30686,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 21162,
     "margin": 9524,
     "percent_invalid": 1.7097395229048997,
     "ballot_surplus": -543
   },
   {
+    "cid": 292,
     "province_thai": "สงขลา",
     "province_eng": "SONGKHLA",
     "prov_id": "SKA",
@@ -5236,14 +6062,17 @@ const CONST_RAW = [
     "invalid": 3169,
     "blank": 8852,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 35127,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 25514,
     "margin": 9613,
     "percent_invalid": 3.15138376475502,
     "ballot_surplus": 507
   },
   {
+    "cid": 293,
     "province_thai": "สงขลา",
     "province_eng": "SONGKHLA",
     "prov_id": "SKA",
@@ -5255,14 +6084,17 @@ const CONST_RAW = [
     "invalid": 2541,
     "blank": 2879,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 43872,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 23288,
     "margin": 20584,
     "percent_invalid": 2.612665412258244,
     "ballot_surplus": -84
   },
   {
+    "cid": 294,
     "province_thai": "สงขลา",
     "province_eng": "SONGKHLA",
     "prov_id": "SKA",
@@ -5274,14 +6106,17 @@ const CONST_RAW = [
     "invalid": 3632,
     "blank": 5986,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 48514,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 23322,
     "margin": 25192,
     "percent_invalid": 3.783096889777722,
     "ballot_surplus": 125
   },
   {
+    "cid": 295,
     "province_thai": "สงขลา",
     "province_eng": "SONGKHLA",
     "prov_id": "SKA",
@@ -5293,14 +6128,17 @@ const CONST_RAW = [
     "invalid": 2151,
     "blank": 2137,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 43976,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 23797,
     "margin": 20179,
     "percent_invalid": 2.554419466315152,
     "ballot_surplus": -3617
   },
   {
+    "cid": 296,
     "province_thai": "สงขลา",
     "province_eng": "SONGKHLA",
     "prov_id": "SKA",
@@ -5312,14 +6150,17 @@ const CONST_RAW = [
     "invalid": 2638,
     "blank": 2786,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 34425,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 24743,
     "margin": 9682,
     "percent_invalid": 2.8091323422924566,
     "ballot_surplus": 623
   },
   {
+    "cid": 297,
     "province_thai": "สงขลา",
     "province_eng": "SONGKHLA",
     "prov_id": "SKA",
@@ -5331,14 +6172,17 @@ const CONST_RAW = [
     "invalid": 2252,
     "blank": 2537,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 38399,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 32781,
     "margin": 5618,
     "percent_invalid": 2.530081227741015,
     "ballot_surplus": -589
   },
   {
+    "cid": 298,
     "province_thai": "สงขลา",
     "province_eng": "SONGKHLA",
     "prov_id": "SKA",
@@ -5350,14 +6194,17 @@ const CONST_RAW = [
     "invalid": 2983,
     "blank": 6306,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 46357,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 28040,
     "margin": 18317,
     "percent_invalid": 2.8804557744302817,
     "ballot_surplus": 260
   },
   {
+    "cid": 358,
     "province_thai": "สตูล",
     "province_eng": "SATUN",
     "prov_id": "STN",
@@ -5369,14 +6216,17 @@ const CONST_RAW = [
     "invalid": 2382,
     "blank": 4355,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 36435,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 16228,
     "margin": 20207,
     "percent_invalid": 2.8419055800136013,
     "ballot_surplus": 4839
   },
   {
+    "cid": 359,
     "province_thai": "สตูล",
     "province_eng": "SATUN",
     "prov_id": "STN",
@@ -5388,14 +6238,17 @@ const CONST_RAW = [
     "invalid": 2930,
     "blank": 4989,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 51667,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 12966,
     "margin": 38701,
     "percent_invalid": 3.284053845033009,
     "ballot_surplus": 277
   },
   {
+    "cid": 325,
     "province_thai": "สมุทรปราการ",
     "province_eng": "SAMUT PRAKAN",
     "prov_id": "SPK",
@@ -5407,14 +6260,17 @@ const CONST_RAW = [
     "invalid": 3986,
     "blank": 4666,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 41275,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 22508,
     "margin": 18767,
     "percent_invalid": 4.3497713805558895,
     "ballot_surplus": 27
   },
   {
+    "cid": 326,
     "province_thai": "สมุทรปราการ",
     "province_eng": "SAMUT PRAKAN",
     "prov_id": "SPK",
@@ -5426,14 +6282,17 @@ const CONST_RAW = [
     "invalid": 2357,
     "blank": 4199,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 37424,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 27817,
     "margin": 9607,
     "percent_invalid": 2.645787730818881,
     "ballot_surplus": -242
   },
   {
+    "cid": 327,
     "province_thai": "สมุทรปราการ",
     "province_eng": "SAMUT PRAKAN",
     "prov_id": "SPK",
@@ -5445,14 +6304,17 @@ const CONST_RAW = [
     "invalid": 2232,
     "blank": 4999,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 41362,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 12234,
     "margin": 29128,
     "percent_invalid": 2.517510912597706,
     "ballot_surplus": -3199
   },
   {
+    "cid": 328,
     "province_thai": "สมุทรปราการ",
     "province_eng": "SAMUT PRAKAN",
     "prov_id": "SPK",
@@ -5464,14 +6326,17 @@ const CONST_RAW = [
     "invalid": 1513,
     "blank": 5521,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 43764,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 14169,
     "margin": 29595,
     "percent_invalid": 1.6719525267147732,
     "ballot_surplus": 1839
   },
   {
+    "cid": 329,
     "province_thai": "สมุทรปราการ",
     "province_eng": "SAMUT PRAKAN",
     "prov_id": "SPK",
@@ -5483,14 +6348,17 @@ const CONST_RAW = [
     "invalid": 2530,
     "blank": 7169,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 50599,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 13627,
     "margin": 36972,
     "percent_invalid": 2.5647003963627886,
     "ballot_surplus": 386
   },
   {
+    "cid": 330,
     "province_thai": "สมุทรปราการ",
     "province_eng": "SAMUT PRAKAN",
     "prov_id": "SPK",
@@ -5502,14 +6370,17 @@ const CONST_RAW = [
     "invalid": 2553,
     "blank": 4208,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 33686,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 31359,
     "margin": 2327,
     "percent_invalid": 2.9360689107908873,
     "ballot_surplus": 172
   },
   {
+    "cid": 331,
     "province_thai": "สมุทรปราการ",
     "province_eng": "SAMUT PRAKAN",
     "prov_id": "SPK",
@@ -5521,14 +6392,17 @@ const CONST_RAW = [
     "invalid": 2612,
     "blank": 4860,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 43609,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 27420,
     "margin": 16189,
     "percent_invalid": 2.6207796116991924,
     "ballot_surplus": -170
   },
   {
+    "cid": 332,
     "province_thai": "สมุทรปราการ",
     "province_eng": "SAMUT PRAKAN",
     "prov_id": "SPK",
@@ -5540,14 +6414,17 @@ const CONST_RAW = [
     "invalid": 3255,
     "blank": 5009,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 37562,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 26213,
     "margin": 11349,
     "percent_invalid": 3.095165646038568,
     "ballot_surplus": -693
   },
   {
+    "cid": 299,
     "province_thai": "สมุทรสงคราม",
     "province_eng": "SAMUT SONGKHRAM",
     "prov_id": "SKM",
@@ -5559,14 +6436,17 @@ const CONST_RAW = [
     "invalid": 4271,
     "blank": 6509,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 37509,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 26780,
     "margin": 10729,
     "percent_invalid": 3.9739474296347983,
     "ballot_surplus": 686
   },
   {
+    "cid": 300,
     "province_thai": "สมุทรสาคร",
     "province_eng": "SAMUT SAKHON",
     "prov_id": "SKN",
@@ -5578,14 +6458,17 @@ const CONST_RAW = [
     "invalid": 2245,
     "blank": 4366,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 30284,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 21200,
     "margin": 9084,
     "percent_invalid": 2.7563260445186555,
     "ballot_surplus": 7
   },
   {
+    "cid": 301,
     "province_thai": "สมุทรสาคร",
     "province_eng": "SAMUT SAKHON",
     "prov_id": "SKN",
@@ -5597,14 +6480,17 @@ const CONST_RAW = [
     "invalid": 2950,
     "blank": 3939,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 32629,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 26049,
     "margin": 6580,
     "percent_invalid": 3.769486327625862,
     "ballot_surplus": -34
   },
   {
+    "cid": 302,
     "province_thai": "สมุทรสาคร",
     "province_eng": "SAMUT SAKHON",
     "prov_id": "SKN",
@@ -5616,14 +6502,17 @@ const CONST_RAW = [
     "invalid": 2905,
     "blank": 3474,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 28126,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 25118,
     "margin": 3008,
     "percent_invalid": 3.8172452760768443,
     "ballot_surplus": 678
   },
   {
+    "cid": 401,
     "province_thai": "สมุทรสาคร",
     "province_eng": "SAMUT SAKHON",
     "prov_id": "SKN",
@@ -5635,14 +6524,17 @@ const CONST_RAW = [
     "invalid": 2462,
     "blank": 3496,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 40131,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 20625,
     "margin": 19506,
     "percent_invalid": 3.136625388574632,
     "ballot_surplus": 1
   },
   {
+    "cid": 333,
     "province_thai": "สระบุรี",
     "province_eng": "SARABURI",
     "prov_id": "SRI",
@@ -5654,14 +6546,17 @@ const CONST_RAW = [
     "invalid": 3459,
     "blank": 6271,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 29968,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 29118,
     "margin": 850,
     "percent_invalid": 3.7665378123809004,
     "ballot_surplus": 68
   },
   {
+    "cid": 334,
     "province_thai": "สระบุรี",
     "province_eng": "SARABURI",
     "prov_id": "SRI",
@@ -5673,14 +6568,17 @@ const CONST_RAW = [
     "invalid": 4256,
     "blank": 3493,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 34896,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 26004,
     "margin": 8892,
     "percent_invalid": 4.330440268210539,
     "ballot_surplus": -415
   },
   {
+    "cid": 335,
     "province_thai": "สระบุรี",
     "province_eng": "SARABURI",
     "prov_id": "SRI",
@@ -5692,14 +6590,17 @@ const CONST_RAW = [
     "invalid": 2411,
     "blank": 2768,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 35796,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 18381,
     "margin": 17415,
     "percent_invalid": 3.703646809425789,
     "ballot_surplus": -1177
   },
   {
+    "cid": 336,
     "province_thai": "สระบุรี",
     "province_eng": "SARABURI",
     "prov_id": "SRI",
@@ -5711,14 +6612,17 @@ const CONST_RAW = [
     "invalid": 4089,
     "blank": 5556,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 45409,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 26771,
     "margin": 18638,
     "percent_invalid": 4.305343511450381,
     "ballot_surplus": 136
   },
   {
+    "cid": 303,
     "province_thai": "สระแก้ว",
     "province_eng": "SA KAEO",
     "prov_id": "SKW",
@@ -5730,14 +6634,17 @@ const CONST_RAW = [
     "invalid": 3596,
     "blank": 3995,
     "winner_party": "พลังประชารัฐ",
+    "winner_pid": 38,
     "winner_votes": 53324,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 18444,
     "margin": 34880,
     "percent_invalid": 3.862803862803863,
     "ballot_surplus": -193
   },
   {
+    "cid": 304,
     "province_thai": "สระแก้ว",
     "province_eng": "SA KAEO",
     "prov_id": "SKW",
@@ -5749,14 +6656,17 @@ const CONST_RAW = [
     "invalid": 3520,
     "blank": 3514,
     "winner_party": "พลังประชารัฐ",
+    "winner_pid": 38,
     "winner_votes": 56364,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 13788,
     "margin": 42576,
     "percent_invalid": 4.039337640430098,
     "ballot_surplus": -99
   },
   {
+    "cid": 305,
     "province_thai": "สระแก้ว",
     "province_eng": "SA KAEO",
     "prov_id": "SKW",
@@ -5768,14 +6678,17 @@ const CONST_RAW = [
     "invalid": 4905,
     "blank": 3554,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 36075,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 31397,
     "margin": 4678,
     "percent_invalid": 5.13198782133777,
     "ballot_surplus": 416
   },
   {
+    "cid": 289,
     "province_thai": "สิงห์บุรี",
     "province_eng": "SING BURI",
     "prov_id": "SBR",
@@ -5787,14 +6700,17 @@ const CONST_RAW = [
     "invalid": 5170,
     "blank": 6807,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 61861,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 30275,
     "margin": 31586,
     "percent_invalid": 4.2917742377327475,
     "ballot_surplus": -83
   },
   {
+    "cid": 320,
     "province_thai": "สุพรรณบุรี",
     "province_eng": "SUPHAN BURI",
     "prov_id": "SPB",
@@ -5806,14 +6722,17 @@ const CONST_RAW = [
     "invalid": 2835,
     "blank": 4194,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 59148,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 20262,
     "margin": 38886,
     "percent_invalid": 3.029784869243676,
     "ballot_surplus": -334
   },
   {
+    "cid": 321,
     "province_thai": "สุพรรณบุรี",
     "province_eng": "SUPHAN BURI",
     "prov_id": "SPB",
@@ -5825,14 +6744,17 @@ const CONST_RAW = [
     "invalid": 3138,
     "blank": 2980,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 42523,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 19564,
     "margin": 22959,
     "percent_invalid": 3.8392365571664526,
     "ballot_surplus": -35
   },
   {
+    "cid": 322,
     "province_thai": "สุพรรณบุรี",
     "province_eng": "SUPHAN BURI",
     "prov_id": "SPB",
@@ -5844,14 +6766,17 @@ const CONST_RAW = [
     "invalid": 3251,
     "blank": 1854,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 45123,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 38182,
     "margin": 6941,
     "percent_invalid": 3.1758281477429247,
     "ballot_surplus": 806
   },
   {
+    "cid": 323,
     "province_thai": "สุพรรณบุรี",
     "province_eng": "SUPHAN BURI",
     "prov_id": "SPB",
@@ -5863,14 +6788,17 @@ const CONST_RAW = [
     "invalid": 4344,
     "blank": 3571,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 52830,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 17185,
     "margin": 35645,
     "percent_invalid": 4.7789304612812025,
     "ballot_surplus": 1125
   },
   {
+    "cid": 324,
     "province_thai": "สุพรรณบุรี",
     "province_eng": "SUPHAN BURI",
     "prov_id": "SPB",
@@ -5882,14 +6810,17 @@ const CONST_RAW = [
     "invalid": 4373,
     "blank": 5233,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 57191,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 23645,
     "margin": 33546,
     "percent_invalid": 4.23043436200058,
     "ballot_surplus": 2946
   },
   {
+    "cid": 306,
     "province_thai": "สุราษฎร์ธานี",
     "province_eng": "SURAT THANI",
     "prov_id": "SNI",
@@ -5901,14 +6832,17 @@ const CONST_RAW = [
     "invalid": 1540,
     "blank": 4916,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 26079,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 21962,
     "margin": 4117,
     "percent_invalid": 1.9702164679392047,
     "ballot_surplus": 140
   },
   {
+    "cid": 307,
     "province_thai": "สุราษฎร์ธานี",
     "province_eng": "SURAT THANI",
     "prov_id": "SNI",
@@ -5920,14 +6854,17 @@ const CONST_RAW = [
     "invalid": 1997,
     "blank": 2567,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 25384,
     "runnerup_party": "ไทรวมพลัง",
+    "runnerup_pid": 72,
     "runnerup_votes": 18976,
     "margin": 6408,
     "percent_invalid": 2.524556590774054,
     "ballot_surplus": -16
   },
   {
+    "cid": 308,
     "province_thai": "สุราษฎร์ธานี",
     "province_eng": "SURAT THANI",
     "prov_id": "SNI",
@@ -5939,14 +6876,17 @@ const CONST_RAW = [
     "invalid": 2117,
     "blank": 3182,
     "winner_party": "ไทรวมพลัง",
+    "winner_pid": 72,
     "winner_votes": 38780,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 22884,
     "margin": 15896,
     "percent_invalid": 2.348334424120068,
     "ballot_surplus": 597
   },
   {
+    "cid": 309,
     "province_thai": "สุราษฎร์ธานี",
     "province_eng": "SURAT THANI",
     "prov_id": "SNI",
@@ -5958,14 +6898,17 @@ const CONST_RAW = [
     "invalid": 1747,
     "blank": 2098,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 40589,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 26407,
     "margin": 14182,
     "percent_invalid": 1.9218076212267887,
     "ballot_surplus": 262
   },
   {
+    "cid": 310,
     "province_thai": "สุราษฎร์ธานี",
     "province_eng": "SURAT THANI",
     "prov_id": "SNI",
@@ -5977,14 +6920,17 @@ const CONST_RAW = [
     "invalid": 1968,
     "blank": 2575,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 28737,
     "runnerup_party": "ไทรวมพลัง",
+    "runnerup_pid": 72,
     "runnerup_votes": 26005,
     "margin": 2732,
     "percent_invalid": 2.2874145706448465,
     "ballot_surplus": 312
   },
   {
+    "cid": 311,
     "province_thai": "สุราษฎร์ธานี",
     "province_eng": "SURAT THANI",
     "prov_id": "SNI",
@@ -5996,14 +6942,17 @@ const CONST_RAW = [
     "invalid": 2114,
     "blank": 1708,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 29721,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 28366,
     "margin": 1355,
     "percent_invalid": 2.2022439136187013,
     "ballot_surplus": -23
   },
   {
+    "cid": 312,
     "province_thai": "สุราษฎร์ธานี",
     "province_eng": "SURAT THANI",
     "prov_id": "SNI",
@@ -6015,14 +6964,17 @@ const CONST_RAW = [
     "invalid": 1872,
     "blank": 2532,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 38674,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 27876,
     "margin": 10798,
     "percent_invalid": 2.042865249465276,
     "ballot_surplus": 629
   },
   {
+    "cid": 337,
     "province_thai": "สุรินทร์",
     "province_eng": "SURIN",
     "prov_id": "SRN",
@@ -6034,14 +6986,17 @@ const CONST_RAW = [
     "invalid": 3303,
     "blank": 4230,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 43547,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 21756,
     "margin": 21791,
     "percent_invalid": 3.7279488944820036,
     "ballot_surplus": -14
   },
   {
+    "cid": 338,
     "province_thai": "สุรินทร์",
     "province_eng": "SURIN",
     "prov_id": "SRN",
@@ -6053,14 +7008,17 @@ const CONST_RAW = [
     "invalid": 2850,
     "blank": 2311,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 50102,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 16027,
     "margin": 34075,
     "percent_invalid": 3.193348870562926,
     "ballot_surplus": 1168
   },
   {
+    "cid": 339,
     "province_thai": "สุรินทร์",
     "province_eng": "SURIN",
     "prov_id": "SRN",
@@ -6072,14 +7030,17 @@ const CONST_RAW = [
     "invalid": 2455,
     "blank": 2012,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 44112,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 13062,
     "margin": 31050,
     "percent_invalid": 3.2907964933915985,
     "ballot_surplus": 1
   },
   {
+    "cid": 340,
     "province_thai": "สุรินทร์",
     "province_eng": "SURIN",
     "prov_id": "SRN",
@@ -6091,14 +7052,17 @@ const CONST_RAW = [
     "invalid": 2121,
     "blank": 1631,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 40070,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 13037,
     "margin": 27033,
     "percent_invalid": 2.9379579737647696,
     "ballot_surplus": 738
   },
   {
+    "cid": 341,
     "province_thai": "สุรินทร์",
     "province_eng": "SURIN",
     "prov_id": "SRN",
@@ -6110,14 +7074,17 @@ const CONST_RAW = [
     "invalid": 1949,
     "blank": 808,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 37432,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 16211,
     "margin": 21221,
     "percent_invalid": 2.759646017699115,
     "ballot_surplus": 847
   },
   {
+    "cid": 342,
     "province_thai": "สุรินทร์",
     "province_eng": "SURIN",
     "prov_id": "SRN",
@@ -6129,14 +7096,17 @@ const CONST_RAW = [
     "invalid": 3007,
     "blank": 1714,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 48468,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 10432,
     "margin": 38036,
     "percent_invalid": 3.9224126685972185,
     "ballot_surplus": 181
   },
   {
+    "cid": 343,
     "province_thai": "สุรินทร์",
     "province_eng": "SURIN",
     "prov_id": "SRN",
@@ -6148,14 +7118,17 @@ const CONST_RAW = [
     "invalid": 4081,
     "blank": 2209,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 40998,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 23348,
     "margin": 17650,
     "percent_invalid": 4.682408554775345,
     "ballot_surplus": -494
   },
   {
+    "cid": 344,
     "province_thai": "สุรินทร์",
     "province_eng": "SURIN",
     "prov_id": "SRN",
@@ -6167,14 +7140,17 @@ const CONST_RAW = [
     "invalid": 3934,
     "blank": 1571,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 49285,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 12277,
     "margin": 37008,
     "percent_invalid": 5.131282037904183,
     "ballot_surplus": 325
   },
   {
+    "cid": 354,
     "province_thai": "สุโขทัย",
     "province_eng": "SUKHOTHAI",
     "prov_id": "STI",
@@ -6186,14 +7162,17 @@ const CONST_RAW = [
     "invalid": 3765,
     "blank": 4969,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 28967,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 19947,
     "margin": 9020,
     "percent_invalid": 4.970231416086916,
     "ballot_surplus": 354
   },
   {
+    "cid": 355,
     "province_thai": "สุโขทัย",
     "province_eng": "SUKHOTHAI",
     "prov_id": "STI",
@@ -6205,14 +7184,17 @@ const CONST_RAW = [
     "invalid": 3470,
     "blank": 3234,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 31272,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 18338,
     "margin": 12934,
     "percent_invalid": 4.661409707016294,
     "ballot_surplus": 155
   },
   {
+    "cid": 356,
     "province_thai": "สุโขทัย",
     "province_eng": "SUKHOTHAI",
     "prov_id": "STI",
@@ -6224,14 +7206,17 @@ const CONST_RAW = [
     "invalid": 4178,
     "blank": 4896,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 44192,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 11257,
     "margin": 32935,
     "percent_invalid": 5.646174844926145,
     "ballot_surplus": -16
   },
   {
+    "cid": 357,
     "province_thai": "สุโขทัย",
     "province_eng": "SUKHOTHAI",
     "prov_id": "STI",
@@ -6243,14 +7228,17 @@ const CONST_RAW = [
     "invalid": 2678,
     "blank": 1484,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 44904,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 18844,
     "margin": 26060,
     "percent_invalid": 3.4169930971125257,
     "ballot_surplus": -352
   },
   {
+    "cid": 169,
     "province_thai": "หนองคาย",
     "province_eng": "NONG KHAI",
     "prov_id": "NKI",
@@ -6262,14 +7250,17 @@ const CONST_RAW = [
     "invalid": 3520,
     "blank": 2197,
     "winner_party": "พลังประชารัฐ",
+    "winner_pid": 38,
     "winner_votes": 28866,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 22701,
     "margin": 6165,
     "percent_invalid": 4.146933389882425,
     "ballot_surplus": 414
   },
   {
+    "cid": 170,
     "province_thai": "หนองคาย",
     "province_eng": "NONG KHAI",
     "prov_id": "NKI",
@@ -6281,14 +7272,17 @@ const CONST_RAW = [
     "invalid": 3169,
     "blank": 1148,
     "winner_party": "พลังประชารัฐ",
+    "winner_pid": 38,
     "winner_votes": 28739,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 25116,
     "margin": 3623,
     "percent_invalid": 3.8892979872361315,
     "ballot_surplus": -594
   },
   {
+    "cid": 171,
     "province_thai": "หนองคาย",
     "province_eng": "NONG KHAI",
     "prov_id": "NKI",
@@ -6300,14 +7294,17 @@ const CONST_RAW = [
     "invalid": 5071,
     "blank": 3004,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 34208,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 18589,
     "margin": 15619,
     "percent_invalid": 6.4509973539588845,
     "ballot_surplus": -79
   },
   {
+    "cid": 166,
     "province_thai": "หนองบัวลำภู",
     "province_eng": "NONG BUA LAM PHU",
     "prov_id": "NBP",
@@ -6319,14 +7316,17 @@ const CONST_RAW = [
     "invalid": 2222,
     "blank": 2276,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 29441,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 21285,
     "margin": 8156,
     "percent_invalid": 2.530578775937863,
     "ballot_surplus": -4580
   },
   {
+    "cid": 167,
     "province_thai": "หนองบัวลำภู",
     "province_eng": "NONG BUA LAM PHU",
     "prov_id": "NBP",
@@ -6338,14 +7338,17 @@ const CONST_RAW = [
     "invalid": 2329,
     "blank": 1652,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 34756,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 15071,
     "margin": 19685,
     "percent_invalid": 2.938282196205087,
     "ballot_surplus": -51
   },
   {
+    "cid": 168,
     "province_thai": "หนองบัวลำภู",
     "province_eng": "NONG BUA LAM PHU",
     "prov_id": "NBP",
@@ -6357,14 +7360,17 @@ const CONST_RAW = [
     "invalid": 2781,
     "blank": 1784,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 24943,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 22639,
     "margin": 2304,
     "percent_invalid": 3.525250988743535,
     "ballot_surplus": -59
   },
   {
+    "cid": 0,
     "province_thai": "อำนาจเจริญ",
     "province_eng": "AMNAT CHAROEN",
     "prov_id": "ACR",
@@ -6376,14 +7382,17 @@ const CONST_RAW = [
     "invalid": 2654,
     "blank": 3086,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 40261,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 19263,
     "margin": 20998,
     "percent_invalid": 3.1081650817445077,
     "ballot_surplus": 95
   },
   {
+    "cid": 1,
     "province_thai": "อำนาจเจริญ",
     "province_eng": "AMNAT CHAROEN",
     "prov_id": "ACR",
@@ -6395,14 +7404,17 @@ const CONST_RAW = [
     "invalid": 5450,
     "blank": 3703,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 40690,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 18076,
     "margin": 22614,
     "percent_invalid": 5.556575110621725,
     "ballot_surplus": 369
   },
   {
+    "cid": 379,
     "province_thai": "อุดรธานี",
     "province_eng": "UDON THANI",
     "prov_id": "UDN",
@@ -6414,14 +7426,17 @@ const CONST_RAW = [
     "invalid": 2345,
     "blank": 5466,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 29523,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 28071,
     "margin": 1452,
     "percent_invalid": 2.87398583229159,
     "ballot_surplus": 1255
   },
   {
+    "cid": 380,
     "province_thai": "อุดรธานี",
     "province_eng": "UDON THANI",
     "prov_id": "UDN",
@@ -6433,14 +7448,17 @@ const CONST_RAW = [
     "invalid": 2463,
     "blank": 2990,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 23226,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 18973,
     "margin": 4253,
     "percent_invalid": 3.5020119150872304,
     "ballot_surplus": -284
   },
   {
+    "cid": 381,
     "province_thai": "อุดรธานี",
     "province_eng": "UDON THANI",
     "prov_id": "UDN",
@@ -6452,14 +7470,17 @@ const CONST_RAW = [
     "invalid": 2315,
     "blank": 1124,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 30573,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 25549,
     "margin": 5024,
     "percent_invalid": 3.2342791678891265,
     "ballot_surplus": -176
   },
   {
+    "cid": 382,
     "province_thai": "อุดรธานี",
     "province_eng": "UDON THANI",
     "prov_id": "UDN",
@@ -6471,14 +7492,17 @@ const CONST_RAW = [
     "invalid": 2136,
     "blank": 1385,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 27927,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 21119,
     "margin": 6808,
     "percent_invalid": 3.1524883405159696,
     "ballot_surplus": 204
   },
   {
+    "cid": 383,
     "province_thai": "อุดรธานี",
     "province_eng": "UDON THANI",
     "prov_id": "UDN",
@@ -6490,33 +7514,39 @@ const CONST_RAW = [
     "invalid": 2143,
     "blank": 1409,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 26690,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 18769,
     "margin": 7921,
     "percent_invalid": 3.24859399396668,
     "ballot_surplus": 217
   },
   {
+    "cid": 384,
     "province_thai": "อุดรธานี",
-    "province_eng": "",
-    "prov_id": "",
+    "province_eng": "UDON THANI",
+    "prov_id": "UDN",
     "cons_no": 6,
-    "region": "",
+    "region": "Northeast",
     "turn_out": 77238,
     "total_used": 77238,
     "valid": 73916,
     "invalid": 2264,
     "blank": 1058,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 35147,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 14417,
     "margin": 20730,
     "percent_invalid": 2.931199668556928,
     "ballot_surplus": 671
   },
   {
+    "cid": 385,
     "province_thai": "อุดรธานี",
     "province_eng": "UDON THANI",
     "prov_id": "UDN",
@@ -6528,14 +7558,17 @@ const CONST_RAW = [
     "invalid": 3024,
     "blank": 2453,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 24883,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 24367,
     "margin": 516,
     "percent_invalid": 4.50623630917788,
     "ballot_surplus": 892
   },
   {
+    "cid": 386,
     "province_thai": "อุดรธานี",
     "province_eng": "UDON THANI",
     "prov_id": "UDN",
@@ -6547,14 +7580,17 @@ const CONST_RAW = [
     "invalid": 2746,
     "blank": 2184,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 36105,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 13396,
     "margin": 22709,
     "percent_invalid": 3.7866982914351115,
     "ballot_surplus": -314
   },
   {
+    "cid": 387,
     "province_thai": "อุดรธานี",
     "province_eng": "UDON THANI",
     "prov_id": "UDN",
@@ -6566,14 +7602,17 @@ const CONST_RAW = [
     "invalid": 4683,
     "blank": 2275,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 27505,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 19751,
     "margin": 7754,
     "percent_invalid": 6.374030216414864,
     "ballot_surplus": 154
   },
   {
+    "cid": 388,
     "province_thai": "อุดรธานี",
     "province_eng": "UDON THANI",
     "prov_id": "UDN",
@@ -6585,14 +7624,17 @@ const CONST_RAW = [
     "invalid": 4324,
     "blank": 1766,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 29422,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 18489,
     "margin": 10933,
     "percent_invalid": 6.044593555602153,
     "ballot_surplus": -112
   },
   {
+    "cid": 391,
     "province_thai": "อุตรดิตถ์",
     "province_eng": "UTTARADIT",
     "prov_id": "UTT",
@@ -6604,14 +7646,17 @@ const CONST_RAW = [
     "invalid": 3137,
     "blank": 2884,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 34929,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 19435,
     "margin": 15494,
     "percent_invalid": 4.0603683713224346,
     "ballot_surplus": 327
   },
   {
+    "cid": 392,
     "province_thai": "อุตรดิตถ์",
     "province_eng": "UTTARADIT",
     "prov_id": "UTT",
@@ -6623,14 +7668,17 @@ const CONST_RAW = [
     "invalid": 3485,
     "blank": 3639,
     "winner_party": "โอกาสใหม่",
+    "winner_pid": 73,
     "winner_votes": 29747,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 17270,
     "margin": 12477,
     "percent_invalid": 4.765225476522548,
     "ballot_surplus": -228
   },
   {
+    "cid": 393,
     "province_thai": "อุตรดิตถ์",
     "province_eng": "UTTARADIT",
     "prov_id": "UTT",
@@ -6642,14 +7690,17 @@ const CONST_RAW = [
     "invalid": 4376,
     "blank": 4185,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 38074,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 17027,
     "margin": 21047,
     "percent_invalid": 5.808335545526944,
     "ballot_surplus": 30
   },
   {
+    "cid": 389,
     "province_thai": "อุทัยธานี",
     "province_eng": "UTHAI THANI",
     "prov_id": "UTI",
@@ -6661,14 +7712,17 @@ const CONST_RAW = [
     "invalid": 3026,
     "blank": 4361,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 50705,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 12088,
     "margin": 38617,
     "percent_invalid": 3.95111378058653,
     "ballot_surplus": -429
   },
   {
+    "cid": 390,
     "province_thai": "อุทัยธานี",
     "province_eng": "UTHAI THANI",
     "prov_id": "UTI",
@@ -6680,14 +7734,17 @@ const CONST_RAW = [
     "invalid": 3149,
     "blank": 2565,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 50967,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 10529,
     "margin": 40438,
     "percent_invalid": 4.111610173917585,
     "ballot_surplus": 746
   },
   {
+    "cid": 368,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -6699,14 +7756,17 @@ const CONST_RAW = [
     "invalid": 3834,
     "blank": 6153,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 29779,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 21416,
     "margin": 8363,
     "percent_invalid": 4.437140509449466,
     "ballot_surplus": -415
   },
   {
+    "cid": 369,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -6718,14 +7778,17 @@ const CONST_RAW = [
     "invalid": 2147,
     "blank": 2645,
     "winner_party": "ไทรวมพลัง",
+    "winner_pid": 72,
     "winner_votes": 33858,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 31303,
     "margin": 2555,
     "percent_invalid": 2.531809766394264,
     "ballot_surplus": 246
   },
   {
+    "cid": 370,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -6737,14 +7800,17 @@ const CONST_RAW = [
     "invalid": 3261,
     "blank": 3916,
     "winner_party": "ไทรวมพลัง",
+    "winner_pid": 72,
     "winner_votes": 41261,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 20959,
     "margin": 20302,
     "percent_invalid": 3.7077463587679502,
     "ballot_surplus": -314
   },
   {
+    "cid": 371,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -6756,14 +7822,17 @@ const CONST_RAW = [
     "invalid": 4933,
     "blank": 6381,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 35628,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 27211,
     "margin": 8417,
     "percent_invalid": 4.650833906870186,
     "ballot_surplus": -21
   },
   {
+    "cid": 372,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -6775,14 +7844,17 @@ const CONST_RAW = [
     "invalid": 2665,
     "blank": 1937,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 46827,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 11155,
     "margin": 35672,
     "percent_invalid": 3.5740149666067644,
     "ballot_surplus": -103
   },
   {
+    "cid": 373,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -6794,14 +7866,17 @@ const CONST_RAW = [
     "invalid": 3912,
     "blank": 1590,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 31887,
     "runnerup_party": "ไทรวมพลัง",
+    "runnerup_pid": 72,
     "runnerup_votes": 30154,
     "margin": 1733,
     "percent_invalid": 4.884992882295647,
     "ballot_surplus": -83
   },
   {
+    "cid": 374,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -6813,14 +7888,17 @@ const CONST_RAW = [
     "invalid": 2418,
     "blank": 937,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 42705,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 33189,
     "margin": 9516,
     "percent_invalid": 2.8066347080194536,
     "ballot_surplus": 250
   },
   {
+    "cid": 375,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -6832,14 +7910,17 @@ const CONST_RAW = [
     "invalid": 2553,
     "blank": 1643,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 32711,
     "runnerup_party": "ไทรวมพลัง",
+    "runnerup_pid": 72,
     "runnerup_votes": 28707,
     "margin": 4004,
     "percent_invalid": 3.245614035087719,
     "ballot_surplus": -2163
   },
   {
+    "cid": 376,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -6851,14 +7932,17 @@ const CONST_RAW = [
     "invalid": 3354,
     "blank": 1071,
     "winner_party": "ไทรวมพลัง",
+    "winner_pid": 72,
     "winner_votes": 39071,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 14218,
     "margin": 24853,
     "percent_invalid": 4.506368570967916,
     "ballot_surplus": -65
   },
   {
+    "cid": 377,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -6870,14 +7954,17 @@ const CONST_RAW = [
     "invalid": 4622,
     "blank": 2386,
     "winner_party": "ไทรวมพลัง",
+    "winner_pid": 72,
     "winner_votes": 59424,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 7065,
     "margin": 52359,
     "percent_invalid": 5.495054213429713,
     "ballot_surplus": -849
   },
   {
+    "cid": 378,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -6889,14 +7976,17 @@ const CONST_RAW = [
     "invalid": 3056,
     "blank": 2523,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 54260,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 11256,
     "margin": 43004,
     "percent_invalid": 3.8013732709722357,
     "ballot_surplus": -565
   },
   {
+    "cid": 2,
     "province_thai": "อ่างทอง",
     "province_eng": "ANG THONG",
     "prov_id": "ATG",
@@ -6908,14 +7998,17 @@ const CONST_RAW = [
     "invalid": 2578,
     "blank": 2919,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 52703,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 16923,
     "margin": 35780,
     "percent_invalid": 3.2016890213611524,
     "ballot_surplus": -169
   },
   {
+    "cid": 3,
     "province_thai": "อ่างทอง",
     "province_eng": "ANG THONG",
     "prov_id": "ATG",
@@ -6927,14 +8020,17 @@ const CONST_RAW = [
     "invalid": 3152,
     "blank": 3096,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 57385,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 13263,
     "margin": 44122,
     "percent_invalid": 3.8454499981699954,
     "ballot_surplus": 2869
   },
   {
+    "cid": 91,
     "province_thai": "เชียงราย",
     "province_eng": "CHIANG RAI",
     "prov_id": "CRI",
@@ -6946,14 +8042,17 @@ const CONST_RAW = [
     "invalid": 3284,
     "blank": 5885,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 40692,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 31072,
     "margin": 9620,
     "percent_invalid": 3.4410134434234103,
     "ballot_surplus": 21
   },
   {
+    "cid": 92,
     "province_thai": "เชียงราย",
     "province_eng": "CHIANG RAI",
     "prov_id": "CRI",
@@ -6965,14 +8064,17 @@ const CONST_RAW = [
     "invalid": 5991,
     "blank": 5244,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 32754,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 23647,
     "margin": 9107,
     "percent_invalid": 6.345322826639553,
     "ballot_surplus": -768
   },
   {
+    "cid": 93,
     "province_thai": "เชียงราย",
     "province_eng": "CHIANG RAI",
     "prov_id": "CRI",
@@ -6984,14 +8086,17 @@ const CONST_RAW = [
     "invalid": 7793,
     "blank": 4316,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 32028,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 23401,
     "margin": 8627,
     "percent_invalid": 8.304914958011851,
     "ballot_surplus": 247
   },
   {
+    "cid": 94,
     "province_thai": "เชียงราย",
     "province_eng": "CHIANG RAI",
     "prov_id": "CRI",
@@ -7003,14 +8108,17 @@ const CONST_RAW = [
     "invalid": 5568,
     "blank": 4820,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 31901,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 26992,
     "margin": 4909,
     "percent_invalid": 5.925736726158169,
     "ballot_surplus": 314
   },
   {
+    "cid": 95,
     "province_thai": "เชียงราย",
     "province_eng": "CHIANG RAI",
     "prov_id": "CRI",
@@ -7022,14 +8130,17 @@ const CONST_RAW = [
     "invalid": 4253,
     "blank": 2800,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 49323,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 15314,
     "margin": 34009,
     "percent_invalid": 4.872543965171564,
     "ballot_surplus": 143
   },
   {
+    "cid": 96,
     "province_thai": "เชียงราย",
     "province_eng": "CHIANG RAI",
     "prov_id": "CRI",
@@ -7041,14 +8152,17 @@ const CONST_RAW = [
     "invalid": 4916,
     "blank": 3700,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 26778,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 23469,
     "margin": 3309,
     "percent_invalid": 6.1076668861583565,
     "ballot_surplus": 18
   },
   {
+    "cid": 97,
     "province_thai": "เชียงราย",
     "province_eng": "CHIANG RAI",
     "prov_id": "CRI",
@@ -7060,14 +8174,17 @@ const CONST_RAW = [
     "invalid": 4242,
     "blank": 3989,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 31482,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 23694,
     "margin": 7788,
     "percent_invalid": 4.557859675513055,
     "ballot_surplus": -129
   },
   {
+    "cid": 69,
     "province_thai": "เชียงใหม่",
     "province_eng": "CHIANG MAI",
     "prov_id": "CMI",
@@ -7079,14 +8196,17 @@ const CONST_RAW = [
     "invalid": 2306,
     "blank": 5958,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 40228,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 18570,
     "margin": 21658,
     "percent_invalid": 2.5642736411351303,
     "ballot_surplus": -656
   },
   {
+    "cid": 70,
     "province_thai": "เชียงใหม่",
     "province_eng": "CHIANG MAI",
     "prov_id": "CMI",
@@ -7098,14 +8218,17 @@ const CONST_RAW = [
     "invalid": 3245,
     "blank": 7646,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 43744,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 24147,
     "margin": 19597,
     "percent_invalid": 3.246298519407763,
     "ballot_surplus": -987
   },
   {
+    "cid": 71,
     "province_thai": "เชียงใหม่",
     "province_eng": "CHIANG MAI",
     "prov_id": "CMI",
@@ -7117,14 +8240,17 @@ const CONST_RAW = [
     "invalid": 3632,
     "blank": 6847,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 41778,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 26221,
     "margin": 15557,
     "percent_invalid": 3.6927832116639894,
     "ballot_surplus": -734
   },
   {
+    "cid": 72,
     "province_thai": "เชียงใหม่",
     "province_eng": "CHIANG MAI",
     "prov_id": "CMI",
@@ -7136,14 +8262,17 @@ const CONST_RAW = [
     "invalid": 2563,
     "blank": 5867,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 42345,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 20501,
     "margin": 21844,
     "percent_invalid": 2.5031252441597,
     "ballot_surplus": 102
   },
   {
+    "cid": 73,
     "province_thai": "เชียงใหม่",
     "province_eng": "CHIANG MAI",
     "prov_id": "CMI",
@@ -7155,14 +8284,17 @@ const CONST_RAW = [
     "invalid": 4048,
     "blank": 5403,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 34191,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 30329,
     "margin": 3862,
     "percent_invalid": 4.402967217037569,
     "ballot_surplus": 9
   },
   {
+    "cid": 74,
     "province_thai": "เชียงใหม่",
     "province_eng": "CHIANG MAI",
     "prov_id": "CMI",
@@ -7174,14 +8306,17 @@ const CONST_RAW = [
     "invalid": 5720,
     "blank": 2860,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 30287,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 21582,
     "margin": 8705,
     "percent_invalid": 7.132258506963927,
     "ballot_surplus": 481
   },
   {
+    "cid": 75,
     "province_thai": "เชียงใหม่",
     "province_eng": "CHIANG MAI",
     "prov_id": "CMI",
@@ -7193,14 +8328,17 @@ const CONST_RAW = [
     "invalid": 4249,
     "blank": 3082,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 31146,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 19362,
     "margin": 11784,
     "percent_invalid": 4.569799956979996,
     "ballot_surplus": -471
   },
   {
+    "cid": 76,
     "province_thai": "เชียงใหม่",
     "province_eng": "CHIANG MAI",
     "prov_id": "CMI",
@@ -7212,14 +8350,17 @@ const CONST_RAW = [
     "invalid": 3529,
     "blank": 6072,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 54200,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 26586,
     "margin": 27614,
     "percent_invalid": 3.225039981722641,
     "ballot_surplus": -333
   },
   {
+    "cid": 77,
     "province_thai": "เชียงใหม่",
     "province_eng": "CHIANG MAI",
     "prov_id": "CMI",
@@ -7231,14 +8372,17 @@ const CONST_RAW = [
     "invalid": 5372,
     "blank": 2995,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 40927,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 19840,
     "margin": 21087,
     "percent_invalid": 5.572729724683085,
     "ballot_surplus": 219
   },
   {
+    "cid": 78,
     "province_thai": "เชียงใหม่",
     "province_eng": "CHIANG MAI",
     "prov_id": "CMI",
@@ -7250,14 +8394,17 @@ const CONST_RAW = [
     "invalid": 9247,
     "blank": 1395,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 32218,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 29980,
     "margin": 2238,
     "percent_invalid": 10.46182739738426,
     "ballot_surplus": 271
   },
   {
+    "cid": 221,
     "province_thai": "เพชรบุรี",
     "province_eng": "PHETCHABURI",
     "prov_id": "PBI",
@@ -7269,14 +8416,17 @@ const CONST_RAW = [
     "invalid": 3637,
     "blank": 5194,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 58584,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 17417,
     "margin": 41167,
     "percent_invalid": 3.967751789142957,
     "ballot_surplus": -178
   },
   {
+    "cid": 222,
     "province_thai": "เพชรบุรี",
     "province_eng": "PHETCHABURI",
     "prov_id": "PBI",
@@ -7288,14 +8438,17 @@ const CONST_RAW = [
     "invalid": 4380,
     "blank": 4674,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 63365,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 16712,
     "margin": 46653,
     "percent_invalid": 4.476559385955051,
     "ballot_surplus": 404
   },
   {
+    "cid": 223,
     "province_thai": "เพชรบุรี",
     "province_eng": "PHETCHABURI",
     "prov_id": "PBI",
@@ -7307,14 +8460,17 @@ const CONST_RAW = [
     "invalid": 3580,
     "blank": 4093,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 67129,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 12514,
     "margin": 54615,
     "percent_invalid": 3.7165458962273945,
     "ballot_surplus": 286
   },
   {
+    "cid": 243,
     "province_thai": "เพชรบูรณ์",
     "province_eng": "PHETCHABUN",
     "prov_id": "PNB",
@@ -7326,14 +8482,17 @@ const CONST_RAW = [
     "invalid": 3480,
     "blank": 4276,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 48580,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 21364,
     "margin": 27216,
     "percent_invalid": 4.093491583640149,
     "ballot_surplus": 157
   },
   {
+    "cid": 244,
     "province_thai": "เพชรบูรณ์",
     "province_eng": "PHETCHABUN",
     "prov_id": "PNB",
@@ -7345,14 +8504,17 @@ const CONST_RAW = [
     "invalid": 2383,
     "blank": 1554,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 38334,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 37339,
     "margin": 995,
     "percent_invalid": 2.664981715295407,
     "ballot_surplus": 142
   },
   {
+    "cid": 245,
     "province_thai": "เพชรบูรณ์",
     "province_eng": "PHETCHABUN",
     "prov_id": "PNB",
@@ -7364,14 +8526,17 @@ const CONST_RAW = [
     "invalid": 3469,
     "blank": 2971,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 37503,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 18150,
     "margin": 19353,
     "percent_invalid": 3.9525556593669533,
     "ballot_surplus": 5823
   },
   {
+    "cid": 246,
     "province_thai": "เพชรบูรณ์",
     "province_eng": "PHETCHABUN",
     "prov_id": "PNB",
@@ -7383,14 +8548,17 @@ const CONST_RAW = [
     "invalid": 2769,
     "blank": 2098,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 44994,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 9439,
     "margin": 35555,
     "percent_invalid": 4.062440398468333,
     "ballot_surplus": 34
   },
   {
+    "cid": 247,
     "province_thai": "เพชรบูรณ์",
     "province_eng": "PHETCHABUN",
     "prov_id": "PNB",
@@ -7402,14 +8570,17 @@ const CONST_RAW = [
     "invalid": 4831,
     "blank": 2977,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 42489,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 15743,
     "margin": 26746,
     "percent_invalid": 6.330258399287174,
     "ballot_surplus": -631
   },
   {
+    "cid": 248,
     "province_thai": "เพชรบูรณ์",
     "province_eng": "PHETCHABUN",
     "prov_id": "PNB",
@@ -7421,14 +8592,17 @@ const CONST_RAW = [
     "invalid": 3684,
     "blank": 2554,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 58578,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 14252,
     "margin": 44326,
     "percent_invalid": 4.241112543746546,
     "ballot_surplus": -331
   },
   {
+    "cid": 130,
     "province_thai": "เลย",
     "province_eng": "LOEI",
     "prov_id": "LEI",
@@ -7440,14 +8614,17 @@ const CONST_RAW = [
     "invalid": 4370,
     "blank": 3914,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 40796,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 17150,
     "margin": 23646,
     "percent_invalid": 4.908347560427711,
     "ballot_surplus": -24
   },
   {
+    "cid": 131,
     "province_thai": "เลย",
     "province_eng": "LOEI",
     "prov_id": "LEI",
@@ -7459,14 +8636,17 @@ const CONST_RAW = [
     "invalid": 5791,
     "blank": 3845,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 26033,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 15967,
     "margin": 10066,
     "percent_invalid": 7.728649788466415,
     "ballot_surplus": 331
   },
   {
+    "cid": 132,
     "province_thai": "เลย",
     "province_eng": "LOEI",
     "prov_id": "LEI",
@@ -7478,14 +8658,17 @@ const CONST_RAW = [
     "invalid": 4041,
     "blank": 3722,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 47786,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 13781,
     "margin": 34005,
     "percent_invalid": 4.929010538641687,
     "ballot_surplus": 284
   },
   {
+    "cid": 133,
     "province_thai": "เลย",
     "province_eng": "LOEI",
     "prov_id": "LEI",
@@ -7497,14 +8680,17 @@ const CONST_RAW = [
     "invalid": 6039,
     "blank": 3969,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 28118,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 17103,
     "margin": 11015,
     "percent_invalid": 7.809388335704124,
     "ballot_surplus": -48
   },
   {
+    "cid": 249,
     "province_thai": "แพร่",
     "province_eng": "PHRAE",
     "prov_id": "PRE",
@@ -7516,14 +8702,17 @@ const CONST_RAW = [
     "invalid": 2335,
     "blank": 2561,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 34337,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 21705,
     "margin": 12632,
     "percent_invalid": 2.7288557504645485,
     "ballot_surplus": -836
   },
   {
+    "cid": 250,
     "province_thai": "แพร่",
     "province_eng": "PHRAE",
     "prov_id": "PRE",
@@ -7535,14 +8724,17 @@ const CONST_RAW = [
     "invalid": 2920,
     "blank": 1714,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 50300,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 11658,
     "margin": 38642,
     "percent_invalid": 3.8215393474590686,
     "ballot_surplus": 179
   },
   {
+    "cid": 251,
     "province_thai": "แพร่",
     "province_eng": "PHRAE",
     "prov_id": "PRE",
@@ -7554,14 +8746,17 @@ const CONST_RAW = [
     "invalid": 5976,
     "blank": 4516,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 23574,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 21142,
     "margin": 2432,
     "percent_invalid": 7.216519743992271,
     "ballot_surplus": 11036
   },
   {
+    "cid": 153,
     "province_thai": "แม่ฮ่องสอน",
     "province_eng": "MAE HONG SON",
     "prov_id": "MSN",
@@ -7573,14 +8768,17 @@ const CONST_RAW = [
     "invalid": 3690,
     "blank": 2991,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 33724,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 17878,
     "margin": 15846,
     "percent_invalid": 5.721817336021089,
     "ballot_surplus": -40
   },
   {
+    "cid": 154,
     "province_thai": "แม่ฮ่องสอน",
     "province_eng": "MAE HONG SON",
     "prov_id": "MSN",
@@ -7592,8 +8790,10 @@ const CONST_RAW = [
     "invalid": 4990,
     "blank": 1695,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 23410,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 23123,
     "margin": 287,
     "percent_invalid": 7.100271773929623,
@@ -7603,6 +8803,7 @@ const CONST_RAW = [
 
 const PARTYLIST_RAW = [
   {
+    "cid": 101,
     "province_thai": "กระบี่",
     "province_eng": "KRABI",
     "prov_id": "KBI",
@@ -7614,14 +8815,17 @@ const PARTYLIST_RAW = [
     "invalid": 3254,
     "blank": 2526,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 32568,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 21428,
     "margin": 11140,
     "percent_invalid": 3.513773256881229,
     "ballot_surplus": 6
   },
   {
+    "cid": 102,
     "province_thai": "กระบี่",
     "province_eng": "KRABI",
     "prov_id": "KBI",
@@ -7633,14 +8837,17 @@ const PARTYLIST_RAW = [
     "invalid": 2804,
     "blank": 1741,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 44106,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 10752,
     "margin": 33354,
     "percent_invalid": 3.5668854627792195,
     "ballot_surplus": -75
   },
   {
+    "cid": 103,
     "province_thai": "กระบี่",
     "province_eng": "KRABI",
     "prov_id": "KBI",
@@ -7652,14 +8859,17 @@ const PARTYLIST_RAW = [
     "invalid": 3064,
     "blank": 1826,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 43386,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 12020,
     "margin": 31366,
     "percent_invalid": 3.574094811496827,
     "ballot_surplus": 4077
   },
   {
+    "cid": 9,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7671,14 +8881,17 @@ const PARTYLIST_RAW = [
     "invalid": 1590,
     "blank": 2050,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 32377,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 15663,
     "margin": 16714,
     "percent_invalid": 2.034418783187256,
     "ballot_surplus": 294
   },
   {
+    "cid": 10,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7690,14 +8903,17 @@ const PARTYLIST_RAW = [
     "invalid": 1432,
     "blank": 2314,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 37773,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 16954,
     "margin": 20819,
     "percent_invalid": 1.6936723832052039,
     "ballot_surplus": 122
   },
   {
+    "cid": 11,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7709,14 +8925,17 @@ const PARTYLIST_RAW = [
     "invalid": 1381,
     "blank": 1939,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 34103,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 14769,
     "margin": 19334,
     "percent_invalid": 1.7631212736348896,
     "ballot_surplus": -328
   },
   {
+    "cid": 12,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7728,14 +8947,17 @@ const PARTYLIST_RAW = [
     "invalid": 1586,
     "blank": 1722,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 31995,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 14666,
     "margin": 17329,
     "percent_invalid": 2.1268321465449036,
     "ballot_surplus": 189
   },
   {
+    "cid": 13,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7747,14 +8969,17 @@ const PARTYLIST_RAW = [
     "invalid": 1372,
     "blank": 2109,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 43941,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 18375,
     "margin": 25566,
     "percent_invalid": 1.4941952908888938,
     "ballot_surplus": 371
   },
   {
+    "cid": 14,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7766,14 +8991,17 @@ const PARTYLIST_RAW = [
     "invalid": 1732,
     "blank": 2450,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 42985,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 16772,
     "margin": 26213,
     "percent_invalid": 1.8044486117622545,
     "ballot_surplus": 154
   },
   {
+    "cid": 15,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7785,14 +9013,17 @@ const PARTYLIST_RAW = [
     "invalid": 1600,
     "blank": 2597,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 38647,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 15684,
     "margin": 22963,
     "percent_invalid": 1.8298889486144312,
     "ballot_surplus": -77
   },
   {
+    "cid": 16,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7804,14 +9035,17 @@ const PARTYLIST_RAW = [
     "invalid": 1576,
     "blank": 2438,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 40056,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 18254,
     "margin": 21802,
     "percent_invalid": 1.7018151975552602,
     "ballot_surplus": 572
   },
   {
+    "cid": 17,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7823,14 +9057,17 @@ const PARTYLIST_RAW = [
     "invalid": 1493,
     "blank": 2674,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 44763,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 18571,
     "margin": 26192,
     "percent_invalid": 1.531329169102639,
     "ballot_surplus": 461
   },
   {
+    "cid": 18,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7842,14 +9079,17 @@ const PARTYLIST_RAW = [
     "invalid": 1676,
     "blank": 2612,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 40209,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 14679,
     "margin": 25530,
     "percent_invalid": 1.8480741876081994,
     "ballot_surplus": -62
   },
   {
+    "cid": 19,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7861,14 +9101,17 @@ const PARTYLIST_RAW = [
     "invalid": 1664,
     "blank": 2395,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 42627,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 17545,
     "margin": 25082,
     "percent_invalid": 1.7507312248805842,
     "ballot_surplus": 184
   },
   {
+    "cid": 20,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7880,14 +9123,17 @@ const PARTYLIST_RAW = [
     "invalid": 1412,
     "blank": 2440,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 46787,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 17405,
     "margin": 29382,
     "percent_invalid": 1.403885541569727,
     "ballot_surplus": 81
   },
   {
+    "cid": 21,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7899,14 +9145,17 @@ const PARTYLIST_RAW = [
     "invalid": 1260,
     "blank": 2049,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 40040,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 16144,
     "margin": 23896,
     "percent_invalid": 1.4595496246872393,
     "ballot_surplus": -522
   },
   {
+    "cid": 22,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7918,33 +9167,39 @@ const PARTYLIST_RAW = [
     "invalid": 1436,
     "blank": 2052,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 39743,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 17491,
     "margin": 22252,
     "percent_invalid": 1.6096850128909317,
     "ballot_surplus": -166
   },
   {
+    "cid": 23,
     "province_thai": "กรุงเทพมหานคร",
-    "province_eng": "",
-    "prov_id": "",
+    "province_eng": "BANGKOK",
+    "prov_id": "BKK",
     "cons_no": 15,
-    "region": "",
+    "region": "Central",
     "turn_out": 88267,
     "total_used": 88267,
     "valid": 84493,
     "invalid": 1533,
     "blank": 2241,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 38643,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 15597,
     "margin": 23046,
     "percent_invalid": 1.7367759185199454,
     "ballot_surplus": -440
   },
   {
+    "cid": 24,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7956,14 +9211,17 @@ const PARTYLIST_RAW = [
     "invalid": 1342,
     "blank": 2306,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 44383,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 15146,
     "margin": 29237,
     "percent_invalid": 1.4690910683203975,
     "ballot_surplus": -15
   },
   {
+    "cid": 25,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7975,14 +9233,17 @@ const PARTYLIST_RAW = [
     "invalid": 2098,
     "blank": 3003,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 29705,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 12632,
     "margin": 17073,
     "percent_invalid": 2.7850789857958316,
     "ballot_surplus": -217
   },
   {
+    "cid": 26,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7994,14 +9255,17 @@ const PARTYLIST_RAW = [
     "invalid": 2113,
     "blank": 2498,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 32917,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 11988,
     "margin": 20929,
     "percent_invalid": 2.668131424097785,
     "ballot_surplus": 66
   },
   {
+    "cid": 27,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -8013,14 +9277,17 @@ const PARTYLIST_RAW = [
     "invalid": 1496,
     "blank": 2107,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 40246,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 16764,
     "margin": 23482,
     "percent_invalid": 1.6646822526622675,
     "ballot_surplus": 0
   },
   {
+    "cid": 28,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -8032,14 +9299,17 @@ const PARTYLIST_RAW = [
     "invalid": 1764,
     "blank": 2191,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 35327,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 11771,
     "margin": 23556,
     "percent_invalid": 2.240654413352471,
     "ballot_surplus": 186
   },
   {
+    "cid": 29,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -8051,14 +9321,17 @@ const PARTYLIST_RAW = [
     "invalid": 1407,
     "blank": 2267,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 41951,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 14498,
     "margin": 27453,
     "percent_invalid": 1.5950391674507716,
     "ballot_surplus": -230
   },
   {
+    "cid": 30,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -8070,14 +9343,17 @@ const PARTYLIST_RAW = [
     "invalid": 1401,
     "blank": 2357,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 40358,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 16861,
     "margin": 23497,
     "percent_invalid": 1.604461800982604,
     "ballot_surplus": -87
   },
   {
+    "cid": 31,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -8089,14 +9365,17 @@ const PARTYLIST_RAW = [
     "invalid": 1242,
     "blank": 2356,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 42830,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 17497,
     "margin": 25333,
     "percent_invalid": 1.3671789000924661,
     "ballot_surplus": 4250
   },
   {
+    "cid": 32,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -8108,14 +9387,17 @@ const PARTYLIST_RAW = [
     "invalid": 1702,
     "blank": 2739,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 43108,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 16191,
     "margin": 26917,
     "percent_invalid": 1.8596418386635054,
     "ballot_surplus": 29
   },
   {
+    "cid": 33,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -8127,14 +9409,17 @@ const PARTYLIST_RAW = [
     "invalid": 1811,
     "blank": 2211,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 37538,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 13989,
     "margin": 23549,
     "percent_invalid": 2.2004325532793856,
     "ballot_surplus": -14
   },
   {
+    "cid": 34,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -8146,14 +9431,17 @@ const PARTYLIST_RAW = [
     "invalid": 1947,
     "blank": 2396,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 42042,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 13939,
     "margin": 28103,
     "percent_invalid": 2.179632138099343,
     "ballot_surplus": -15
   },
   {
+    "cid": 35,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -8165,14 +9453,17 @@ const PARTYLIST_RAW = [
     "invalid": 1721,
     "blank": 2489,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 43607,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 12656,
     "margin": 30951,
     "percent_invalid": 1.8897551334138574,
     "ballot_surplus": 0
   },
   {
+    "cid": 36,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -8184,14 +9475,17 @@ const PARTYLIST_RAW = [
     "invalid": 1463,
     "blank": 2205,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 37579,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 12057,
     "margin": 25522,
     "percent_invalid": 1.9049727209989713,
     "ballot_surplus": 396
   },
   {
+    "cid": 37,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -8203,14 +9497,17 @@ const PARTYLIST_RAW = [
     "invalid": 2254,
     "blank": 2708,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 43249,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 15443,
     "margin": 27806,
     "percent_invalid": 2.355449196910955,
     "ballot_surplus": 108
   },
   {
+    "cid": 38,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -8222,14 +9519,17 @@ const PARTYLIST_RAW = [
     "invalid": 1828,
     "blank": 2710,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 47043,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 15448,
     "margin": 31595,
     "percent_invalid": 1.8587814203205075,
     "ballot_surplus": -1757
   },
   {
+    "cid": 39,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -8241,14 +9541,17 @@ const PARTYLIST_RAW = [
     "invalid": 1977,
     "blank": 3358,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 44164,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 18651,
     "margin": 25513,
     "percent_invalid": 1.9320036353330923,
     "ballot_surplus": -137
   },
   {
+    "cid": 40,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -8260,14 +9563,17 @@ const PARTYLIST_RAW = [
     "invalid": 1992,
     "blank": 2732,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 38742,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 15240,
     "margin": 23502,
     "percent_invalid": 2.2631734417959963,
     "ballot_surplus": -90
   },
   {
+    "cid": 41,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -8279,14 +9585,17 @@ const PARTYLIST_RAW = [
     "invalid": 1664,
     "blank": 2616,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 39428,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 16369,
     "margin": 23059,
     "percent_invalid": 1.8350242611380678,
     "ballot_surplus": 45
   },
   {
+    "cid": 119,
     "province_thai": "กาญจนบุรี",
     "province_eng": "KANCHANABURI",
     "prov_id": "KRI",
@@ -8298,14 +9607,17 @@ const PARTYLIST_RAW = [
     "invalid": 4211,
     "blank": 4523,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 26832,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 12364,
     "margin": 14468,
     "percent_invalid": 5.061541420260589,
     "ballot_surplus": 92
   },
   {
+    "cid": 120,
     "province_thai": "กาญจนบุรี",
     "province_eng": "KANCHANABURI",
     "prov_id": "KRI",
@@ -8317,14 +9629,17 @@ const PARTYLIST_RAW = [
     "invalid": 5400,
     "blank": 3370,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 26944,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 18351,
     "margin": 8593,
     "percent_invalid": 5.663998993066845,
     "ballot_surplus": -105
   },
   {
+    "cid": 121,
     "province_thai": "กาญจนบุรี",
     "province_eng": "KANCHANABURI",
     "prov_id": "KRI",
@@ -8336,14 +9651,17 @@ const PARTYLIST_RAW = [
     "invalid": 6023,
     "blank": 2984,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 28503,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 24182,
     "margin": 4321,
     "percent_invalid": 5.803846746839347,
     "ballot_surplus": 79
   },
   {
+    "cid": 122,
     "province_thai": "กาญจนบุรี",
     "province_eng": "KANCHANABURI",
     "prov_id": "KRI",
@@ -8355,14 +9673,17 @@ const PARTYLIST_RAW = [
     "invalid": 7163,
     "blank": 3628,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 22467,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 16810,
     "margin": 5657,
     "percent_invalid": 8.148754877535465,
     "ballot_surplus": 341
   },
   {
+    "cid": 123,
     "province_thai": "กาญจนบุรี",
     "province_eng": "KANCHANABURI",
     "prov_id": "KRI",
@@ -8374,14 +9695,17 @@ const PARTYLIST_RAW = [
     "invalid": 5209,
     "blank": 2055,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 22227,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 15573,
     "margin": 6654,
     "percent_invalid": 6.164642950128997,
     "ballot_surplus": 104
   },
   {
+    "cid": 124,
     "province_thai": "กาฬสินธุ์",
     "province_eng": "KALASIN",
     "prov_id": "KSN",
@@ -8393,14 +9717,17 @@ const PARTYLIST_RAW = [
     "invalid": 3921,
     "blank": 2041,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 20724,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 20213,
     "margin": 511,
     "percent_invalid": 5.245344606164384,
     "ballot_surplus": 827
   },
   {
+    "cid": 125,
     "province_thai": "กาฬสินธุ์",
     "province_eng": "KALASIN",
     "prov_id": "KSN",
@@ -8412,14 +9739,17 @@ const PARTYLIST_RAW = [
     "invalid": 3952,
     "blank": 1832,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 29334,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 19886,
     "margin": 9448,
     "percent_invalid": 4.840586455666744,
     "ballot_surplus": 46
   },
   {
+    "cid": 126,
     "province_thai": "กาฬสินธุ์",
     "province_eng": "KALASIN",
     "prov_id": "KSN",
@@ -8431,14 +9761,17 @@ const PARTYLIST_RAW = [
     "invalid": 4498,
     "blank": 1761,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 16996,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 15375,
     "margin": 1621,
     "percent_invalid": 5.84558202399054,
     "ballot_surplus": -124
   },
   {
+    "cid": 127,
     "province_thai": "กาฬสินธุ์",
     "province_eng": "KALASIN",
     "prov_id": "KSN",
@@ -8450,14 +9783,17 @@ const PARTYLIST_RAW = [
     "invalid": 4515,
     "blank": 1569,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 25284,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 16405,
     "margin": 8879,
     "percent_invalid": 5.5316646451280915,
     "ballot_surplus": 623
   },
   {
+    "cid": 128,
     "province_thai": "กาฬสินธุ์",
     "province_eng": "KALASIN",
     "prov_id": "KSN",
@@ -8469,14 +9805,17 @@ const PARTYLIST_RAW = [
     "invalid": 4288,
     "blank": 1512,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 27109,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 16481,
     "margin": 10628,
     "percent_invalid": 5.111942967501967,
     "ballot_surplus": -726
   },
   {
+    "cid": 129,
     "province_thai": "กาฬสินธุ์",
     "province_eng": "KALASIN",
     "prov_id": "KSN",
@@ -8488,14 +9827,17 @@ const PARTYLIST_RAW = [
     "invalid": 4332,
     "blank": 1398,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 36615,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 15621,
     "margin": 20994,
     "percent_invalid": 5.178039946928677,
     "ballot_surplus": 553
   },
   {
+    "cid": 115,
     "province_thai": "กำแพงเพชร",
     "province_eng": "KAMPHAENG PHET",
     "prov_id": "KPT",
@@ -8507,14 +9849,17 @@ const PARTYLIST_RAW = [
     "invalid": 5911,
     "blank": 3530,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 27695,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 12109,
     "margin": 15586,
     "percent_invalid": 6.522986603103136,
     "ballot_surplus": 363
   },
   {
+    "cid": 116,
     "province_thai": "กำแพงเพชร",
     "province_eng": "KAMPHAENG PHET",
     "prov_id": "KPT",
@@ -8526,14 +9871,17 @@ const PARTYLIST_RAW = [
     "invalid": 7225,
     "blank": 2782,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 22971,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 13585,
     "margin": 9386,
     "percent_invalid": 7.5564247913485465,
     "ballot_surplus": -122
   },
   {
+    "cid": 117,
     "province_thai": "กำแพงเพชร",
     "province_eng": "KAMPHAENG PHET",
     "prov_id": "KPT",
@@ -8545,14 +9893,17 @@ const PARTYLIST_RAW = [
     "invalid": 6244,
     "blank": 2362,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 18993,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 13527,
     "margin": 5466,
     "percent_invalid": 7.801489329801589,
     "ballot_surplus": -689
   },
   {
+    "cid": 118,
     "province_thai": "กำแพงเพชร",
     "province_eng": "KAMPHAENG PHET",
     "prov_id": "KPT",
@@ -8564,14 +9915,17 @@ const PARTYLIST_RAW = [
     "invalid": 6117,
     "blank": 2266,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 19418,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 17227,
     "margin": 2191,
     "percent_invalid": 7.294647967945049,
     "ballot_surplus": -400
   },
   {
+    "cid": 104,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -8583,14 +9937,17 @@ const PARTYLIST_RAW = [
     "invalid": 2737,
     "blank": 2580,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 31032,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 15226,
     "margin": 15806,
     "percent_invalid": 3.3818514308308205,
     "ballot_surplus": 5382
   },
   {
+    "cid": 105,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -8602,14 +9959,17 @@ const PARTYLIST_RAW = [
     "invalid": 3387,
     "blank": 3220,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 39399,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 17550,
     "margin": 21849,
     "percent_invalid": 3.409708659673425,
     "ballot_surplus": 543
   },
   {
+    "cid": 106,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -8621,14 +9981,17 @@ const PARTYLIST_RAW = [
     "invalid": 4166,
     "blank": 1524,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 24467,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 22899,
     "margin": 1568,
     "percent_invalid": 5.007392093464909,
     "ballot_surplus": 145
   },
   {
+    "cid": 107,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -8640,14 +10003,17 @@ const PARTYLIST_RAW = [
     "invalid": 4573,
     "blank": 1974,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 27089,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 24483,
     "margin": 2606,
     "percent_invalid": 4.961807213228592,
     "ballot_surplus": 125
   },
   {
+    "cid": 108,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -8659,14 +10025,17 @@ const PARTYLIST_RAW = [
     "invalid": 4691,
     "blank": 1175,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 28424,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 17307,
     "margin": 11117,
     "percent_invalid": 5.767646588715528,
     "ballot_surplus": -51
   },
   {
+    "cid": 109,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -8678,14 +10047,17 @@ const PARTYLIST_RAW = [
     "invalid": 5062,
     "blank": 2025,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 24124,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 20321,
     "margin": 3803,
     "percent_invalid": 5.873684454810225,
     "ballot_surplus": 134
   },
   {
+    "cid": 110,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -8697,14 +10069,17 @@ const PARTYLIST_RAW = [
     "invalid": 5026,
     "blank": 1865,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 27492,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 21840,
     "margin": 5652,
     "percent_invalid": 5.671086036671368,
     "ballot_surplus": 199
   },
   {
+    "cid": 111,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -8716,14 +10091,17 @@ const PARTYLIST_RAW = [
     "invalid": 4413,
     "blank": 2131,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 24446,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 23434,
     "margin": 1012,
     "percent_invalid": 4.830870279146141,
     "ballot_surplus": -198
   },
   {
+    "cid": 112,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -8735,14 +10113,17 @@ const PARTYLIST_RAW = [
     "invalid": 3677,
     "blank": 864,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 33581,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 14207,
     "margin": 19374,
     "percent_invalid": 4.839431429323506,
     "ballot_surplus": 99
   },
   {
+    "cid": 113,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -8754,14 +10135,17 @@ const PARTYLIST_RAW = [
     "invalid": 4228,
     "blank": 933,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 30510,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 16974,
     "margin": 13536,
     "percent_invalid": 5.047695228089445,
     "ballot_surplus": -1105
   },
   {
+    "cid": 114,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -8773,14 +10157,17 @@ const PARTYLIST_RAW = [
     "invalid": 4359,
     "blank": 1613,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 19572,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 19537,
     "margin": 35,
     "percent_invalid": 5.3903989315658,
     "ballot_surplus": -68
   },
   {
+    "cid": 98,
     "province_thai": "จันทบุรี",
     "province_eng": "CHANTHABURI",
     "prov_id": "CTI",
@@ -8792,14 +10179,17 @@ const PARTYLIST_RAW = [
     "invalid": 4217,
     "blank": 5355,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 34554,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 24318,
     "margin": 10236,
     "percent_invalid": 4.018333587437109,
     "ballot_surplus": 208
   },
   {
+    "cid": 99,
     "province_thai": "จันทบุรี",
     "province_eng": "CHANTHABURI",
     "prov_id": "CTI",
@@ -8811,14 +10201,17 @@ const PARTYLIST_RAW = [
     "invalid": 5244,
     "blank": 4980,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 25461,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 19005,
     "margin": 6456,
     "percent_invalid": 5.56062180561152,
     "ballot_surplus": -168
   },
   {
+    "cid": 100,
     "province_thai": "จันทบุรี",
     "province_eng": "CHANTHABURI",
     "prov_id": "CTI",
@@ -8830,14 +10223,17 @@ const PARTYLIST_RAW = [
     "invalid": 5477,
     "blank": 4493,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 25094,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 20591,
     "margin": 4503,
     "percent_invalid": 5.677706940341056,
     "ballot_surplus": 0
   },
   {
+    "cid": 65,
     "province_thai": "ฉะเชิงเทรา",
     "province_eng": "CHACHOENGSAO",
     "prov_id": "CCO",
@@ -8849,14 +10245,17 @@ const PARTYLIST_RAW = [
     "invalid": 3886,
     "blank": 5116,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 38831,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 16081,
     "margin": 22750,
     "percent_invalid": 3.6826094785023167,
     "ballot_surplus": -261
   },
   {
+    "cid": 66,
     "province_thai": "ฉะเชิงเทรา",
     "province_eng": "CHACHOENGSAO",
     "prov_id": "CCO",
@@ -8868,14 +10267,17 @@ const PARTYLIST_RAW = [
     "invalid": 6316,
     "blank": 3917,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 31824,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 16571,
     "margin": 15253,
     "percent_invalid": 5.55971233154054,
     "ballot_surplus": 401
   },
   {
+    "cid": 67,
     "province_thai": "ฉะเชิงเทรา",
     "province_eng": "CHACHOENGSAO",
     "prov_id": "CCO",
@@ -8887,14 +10289,17 @@ const PARTYLIST_RAW = [
     "invalid": 6452,
     "blank": 3328,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 29212,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 13222,
     "margin": 15990,
     "percent_invalid": 6.581994389186432,
     "ballot_surplus": 394
   },
   {
+    "cid": 68,
     "province_thai": "ฉะเชิงเทรา",
     "province_eng": "CHACHOENGSAO",
     "prov_id": "CCO",
@@ -8906,14 +10311,17 @@ const PARTYLIST_RAW = [
     "invalid": 6242,
     "blank": 4122,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 43219,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 14525,
     "margin": 28694,
     "percent_invalid": 5.317318340574154,
     "ballot_surplus": 156
   },
   {
+    "cid": 55,
     "province_thai": "ชลบุรี",
     "province_eng": "CHON BURI",
     "prov_id": "CBI",
@@ -8925,14 +10333,17 @@ const PARTYLIST_RAW = [
     "invalid": 2910,
     "blank": 2845,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 41689,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 26989,
     "margin": 14700,
     "percent_invalid": 2.956055342231974,
     "ballot_surplus": 452
   },
   {
+    "cid": 56,
     "province_thai": "ชลบุรี",
     "province_eng": "CHON BURI",
     "prov_id": "CBI",
@@ -8944,14 +10355,17 @@ const PARTYLIST_RAW = [
     "invalid": 2150,
     "blank": 2442,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 31912,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 19906,
     "margin": 12006,
     "percent_invalid": 2.72593569327518,
     "ballot_surplus": 0
   },
   {
+    "cid": 57,
     "province_thai": "ชลบุรี",
     "province_eng": "CHON BURI",
     "prov_id": "CBI",
@@ -8963,14 +10377,17 @@ const PARTYLIST_RAW = [
     "invalid": 3183,
     "blank": 3009,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 38208,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 20342,
     "margin": 17866,
     "percent_invalid": 3.4356953964056345,
     "ballot_surplus": 0
   },
   {
+    "cid": 58,
     "province_thai": "ชลบุรี",
     "province_eng": "CHON BURI",
     "prov_id": "CBI",
@@ -8982,14 +10399,17 @@ const PARTYLIST_RAW = [
     "invalid": 4745,
     "blank": 2770,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 25507,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 18882,
     "margin": 6625,
     "percent_invalid": 5.667295702649118,
     "ballot_surplus": 44
   },
   {
+    "cid": 59,
     "province_thai": "ชลบุรี",
     "province_eng": "CHON BURI",
     "prov_id": "CBI",
@@ -9001,14 +10421,17 @@ const PARTYLIST_RAW = [
     "invalid": 4768,
     "blank": 3407,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 28186,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 23176,
     "margin": 5010,
     "percent_invalid": 5.032561772373684,
     "ballot_surplus": 2924
   },
   {
+    "cid": 60,
     "province_thai": "ชลบุรี",
     "province_eng": "CHON BURI",
     "prov_id": "CBI",
@@ -9020,14 +10443,17 @@ const PARTYLIST_RAW = [
     "invalid": 2867,
     "blank": 2631,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 37762,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 21277,
     "margin": 16485,
     "percent_invalid": 3.230531736284043,
     "ballot_surplus": -499
   },
   {
+    "cid": 61,
     "province_thai": "ชลบุรี",
     "province_eng": "CHON BURI",
     "prov_id": "CBI",
@@ -9039,14 +10465,17 @@ const PARTYLIST_RAW = [
     "invalid": 2185,
     "blank": 2354,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 40997,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 16868,
     "margin": 24129,
     "percent_invalid": 2.599581211630895,
     "ballot_surplus": 224
   },
   {
+    "cid": 62,
     "province_thai": "ชลบุรี",
     "province_eng": "CHON BURI",
     "prov_id": "CBI",
@@ -9058,14 +10487,17 @@ const PARTYLIST_RAW = [
     "invalid": 3093,
     "blank": 2543,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 35044,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 19690,
     "margin": 15354,
     "percent_invalid": 3.577583714070904,
     "ballot_surplus": 194
   },
   {
+    "cid": 63,
     "province_thai": "ชลบุรี",
     "province_eng": "CHON BURI",
     "prov_id": "CBI",
@@ -9077,14 +10509,17 @@ const PARTYLIST_RAW = [
     "invalid": 1872,
     "blank": 1912,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 26747,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 13750,
     "margin": 12997,
     "percent_invalid": 2.982934174673742,
     "ballot_surplus": -179
   },
   {
+    "cid": 64,
     "province_thai": "ชลบุรี",
     "province_eng": "CHON BURI",
     "prov_id": "CBI",
@@ -9096,14 +10531,17 @@ const PARTYLIST_RAW = [
     "invalid": 2585,
     "blank": 3899,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 28237,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 17289,
     "margin": 10948,
     "percent_invalid": 3.256733943104795,
     "ballot_surplus": 4734
   },
   {
+    "cid": 79,
     "province_thai": "ชัยนาท",
     "province_eng": "CHAI NAT",
     "prov_id": "CNT",
@@ -9115,14 +10553,17 @@ const PARTYLIST_RAW = [
     "invalid": 5214,
     "blank": 4283,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 22957,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 13427,
     "margin": 9530,
     "percent_invalid": 6.121298926952969,
     "ballot_surplus": -21
   },
   {
+    "cid": 80,
     "province_thai": "ชัยนาท",
     "province_eng": "CHAI NAT",
     "prov_id": "CNT",
@@ -9134,14 +10575,17 @@ const PARTYLIST_RAW = [
     "invalid": 6749,
     "blank": 3661,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 25116,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 21733,
     "margin": 3383,
     "percent_invalid": 7.47596260357127,
     "ballot_surplus": 190
   },
   {
+    "cid": 81,
     "province_thai": "ชัยภูมิ",
     "province_eng": "CHAIYAPHUM",
     "prov_id": "CPM",
@@ -9153,14 +10597,17 @@ const PARTYLIST_RAW = [
     "invalid": 814,
     "blank": 443,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 4253,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 4004,
     "margin": 249,
     "percent_invalid": 5.340856899153599,
     "ballot_surplus": -329
   },
   {
+    "cid": 82,
     "province_thai": "ชัยภูมิ",
     "province_eng": "CHAIYAPHUM",
     "prov_id": "CPM",
@@ -9172,14 +10619,17 @@ const PARTYLIST_RAW = [
     "invalid": 4745,
     "blank": 2629,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 24104,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 19328,
     "margin": 4776,
     "percent_invalid": 5.709232231593893,
     "ballot_surplus": 76
   },
   {
+    "cid": 83,
     "province_thai": "ชัยภูมิ",
     "province_eng": "CHAIYAPHUM",
     "prov_id": "CPM",
@@ -9191,14 +10641,17 @@ const PARTYLIST_RAW = [
     "invalid": 5282,
     "blank": 1936,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 16407,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 14882,
     "margin": 1525,
     "percent_invalid": 6.978556989787155,
     "ballot_surplus": -611
   },
   {
+    "cid": 84,
     "province_thai": "ชัยภูมิ",
     "province_eng": "CHAIYAPHUM",
     "prov_id": "CPM",
@@ -9210,14 +10663,17 @@ const PARTYLIST_RAW = [
     "invalid": 3283,
     "blank": 867,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 12728,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 10485,
     "margin": 2243,
     "percent_invalid": 6.0137016412661195,
     "ballot_surplus": 246
   },
   {
+    "cid": 85,
     "province_thai": "ชัยภูมิ",
     "province_eng": "CHAIYAPHUM",
     "prov_id": "CPM",
@@ -9229,14 +10685,17 @@ const PARTYLIST_RAW = [
     "invalid": 4807,
     "blank": 1395,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 19955,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 14737,
     "margin": 5218,
     "percent_invalid": 6.184307015399658,
     "ballot_surplus": -142
   },
   {
+    "cid": 86,
     "province_thai": "ชัยภูมิ",
     "province_eng": "CHAIYAPHUM",
     "prov_id": "CPM",
@@ -9248,14 +10707,17 @@ const PARTYLIST_RAW = [
     "invalid": 5371,
     "blank": 1637,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 19957,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 19072,
     "margin": 885,
     "percent_invalid": 6.346824224519941,
     "ballot_surplus": -37
   },
   {
+    "cid": 87,
     "province_thai": "ชัยภูมิ",
     "province_eng": "CHAIYAPHUM",
     "prov_id": "CPM",
@@ -9267,14 +10729,17 @@ const PARTYLIST_RAW = [
     "invalid": 4141,
     "blank": 1270,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 25997,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 16115,
     "margin": 9882,
     "percent_invalid": 5.427687629433507,
     "ballot_surplus": -914
   },
   {
+    "cid": 88,
     "province_thai": "ชุมพร",
     "province_eng": "CHUMPHON",
     "prov_id": "CPN",
@@ -9286,14 +10751,17 @@ const PARTYLIST_RAW = [
     "invalid": 2883,
     "blank": 2311,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 40051,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 23521,
     "margin": 16530,
     "percent_invalid": 3.1255081796598043,
     "ballot_surplus": 5694
   },
   {
+    "cid": 89,
     "province_thai": "ชุมพร",
     "province_eng": "CHUMPHON",
     "prov_id": "CPN",
@@ -9305,14 +10773,17 @@ const PARTYLIST_RAW = [
     "invalid": 3562,
     "blank": 2214,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 47139,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 19066,
     "margin": 28073,
     "percent_invalid": 3.4820180454949807,
     "ballot_surplus": -200
   },
   {
+    "cid": 90,
     "province_thai": "ชุมพร",
     "province_eng": "CHUMPHON",
     "prov_id": "CPN",
@@ -9324,14 +10795,17 @@ const PARTYLIST_RAW = [
     "invalid": 3062,
     "blank": 1955,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 45243,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 18202,
     "margin": 27041,
     "percent_invalid": 3.2761627595947056,
     "ballot_surplus": -609
   },
   {
+    "cid": 363,
     "province_thai": "ตรัง",
     "province_eng": "TRANG",
     "prov_id": "TRG",
@@ -9343,14 +10817,17 @@ const PARTYLIST_RAW = [
     "invalid": 2440,
     "blank": 3230,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 50395,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 18673,
     "margin": 31722,
     "percent_invalid": 2.5935925508620503,
     "ballot_surplus": 74
   },
   {
+    "cid": 364,
     "province_thai": "ตรัง",
     "province_eng": "TRANG",
     "prov_id": "TRG",
@@ -9362,14 +10839,17 @@ const PARTYLIST_RAW = [
     "invalid": 2790,
     "blank": 2018,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 57478,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 10738,
     "margin": 46740,
     "percent_invalid": 3.0684630189716797,
     "ballot_surplus": -430
   },
   {
+    "cid": 365,
     "province_thai": "ตรัง",
     "province_eng": "TRANG",
     "prov_id": "TRG",
@@ -9381,14 +10861,17 @@ const PARTYLIST_RAW = [
     "invalid": 2650,
     "blank": 2310,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 58320,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 12483,
     "margin": 45837,
     "percent_invalid": 2.9552145597287893,
     "ballot_surplus": -5470
   },
   {
+    "cid": 366,
     "province_thai": "ตรัง",
     "province_eng": "TRANG",
     "prov_id": "TRG",
@@ -9400,14 +10883,17 @@ const PARTYLIST_RAW = [
     "invalid": 2747,
     "blank": 2061,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 58078,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 15089,
     "margin": 42989,
     "percent_invalid": 2.9026088610403744,
     "ballot_surplus": -323
   },
   {
+    "cid": 367,
     "province_thai": "ตราด",
     "province_eng": "TRAT",
     "prov_id": "TRT",
@@ -9419,14 +10905,17 @@ const PARTYLIST_RAW = [
     "invalid": 5726,
     "blank": 3786,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 32024,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 26367,
     "margin": 5657,
     "percent_invalid": 5.062821068267624,
     "ballot_surplus": -155
   },
   {
+    "cid": 360,
     "province_thai": "ตาก",
     "province_eng": "TAK",
     "prov_id": "TAK",
@@ -9438,14 +10927,17 @@ const PARTYLIST_RAW = [
     "invalid": 5771,
     "blank": 3803,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 24122,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 15604,
     "margin": 8518,
     "percent_invalid": 6.198444749957037,
     "ballot_surplus": -256
   },
   {
+    "cid": 361,
     "province_thai": "ตาก",
     "province_eng": "TAK",
     "prov_id": "TAK",
@@ -9457,14 +10949,17 @@ const PARTYLIST_RAW = [
     "invalid": 5630,
     "blank": 4339,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 27873,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 13680,
     "margin": 14193,
     "percent_invalid": 6.620881059340969,
     "ballot_surplus": -21
   },
   {
+    "cid": 362,
     "province_thai": "ตาก",
     "province_eng": "TAK",
     "prov_id": "TAK",
@@ -9476,14 +10971,17 @@ const PARTYLIST_RAW = [
     "invalid": 6310,
     "blank": 2058,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 20622,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 9564,
     "margin": 11058,
     "percent_invalid": 7.257962479439607,
     "ballot_surplus": 171
   },
   {
+    "cid": 219,
     "province_thai": "นครนายก",
     "province_eng": "NAKHON NAYOK",
     "prov_id": "NYK",
@@ -9495,14 +10993,17 @@ const PARTYLIST_RAW = [
     "invalid": 4249,
     "blank": 2830,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 19174,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 14132,
     "margin": 5042,
     "percent_invalid": 5.738092344258532,
     "ballot_surplus": -568
   },
   {
+    "cid": 220,
     "province_thai": "นครนายก",
     "province_eng": "NAKHON NAYOK",
     "prov_id": "NYK",
@@ -9514,14 +11015,17 @@ const PARTYLIST_RAW = [
     "invalid": 4718,
     "blank": 2936,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 21893,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 15479,
     "margin": 6414,
     "percent_invalid": 5.7862591675047215,
     "ballot_surplus": 0
   },
   {
+    "cid": 192,
     "province_thai": "นครปฐม",
     "province_eng": "NAKHON PATHOM",
     "prov_id": "NPT",
@@ -9533,14 +11037,17 @@ const PARTYLIST_RAW = [
     "invalid": 3866,
     "blank": 3862,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 33466,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 20946,
     "margin": 12520,
     "percent_invalid": 4.129591847634511,
     "ballot_surplus": 466
   },
   {
+    "cid": 193,
     "province_thai": "นครปฐม",
     "province_eng": "NAKHON PATHOM",
     "prov_id": "NPT",
@@ -9552,14 +11059,17 @@ const PARTYLIST_RAW = [
     "invalid": 3935,
     "blank": 4327,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 33107,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 13825,
     "margin": 19282,
     "percent_invalid": 4.462513750439447,
     "ballot_surplus": -749
   },
   {
+    "cid": 194,
     "province_thai": "นครปฐม",
     "province_eng": "NAKHON PATHOM",
     "prov_id": "NPT",
@@ -9571,14 +11081,17 @@ const PARTYLIST_RAW = [
     "invalid": 4400,
     "blank": 3840,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 28665,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 18080,
     "margin": 10585,
     "percent_invalid": 4.985214307565062,
     "ballot_surplus": 283
   },
   {
+    "cid": 195,
     "province_thai": "นครปฐม",
     "province_eng": "NAKHON PATHOM",
     "prov_id": "NPT",
@@ -9590,14 +11103,17 @@ const PARTYLIST_RAW = [
     "invalid": 4788,
     "blank": 3127,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 30740,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 21002,
     "margin": 9738,
     "percent_invalid": 4.903125384016713,
     "ballot_surplus": -122
   },
   {
+    "cid": 196,
     "province_thai": "นครปฐม",
     "province_eng": "NAKHON PATHOM",
     "prov_id": "NPT",
@@ -9609,14 +11125,17 @@ const PARTYLIST_RAW = [
     "invalid": 4264,
     "blank": 3714,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 35474,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 23472,
     "margin": 12002,
     "percent_invalid": 4.181950138286813,
     "ballot_surplus": -139
   },
   {
+    "cid": 197,
     "province_thai": "นครปฐม",
     "province_eng": "NAKHON PATHOM",
     "prov_id": "NPT",
@@ -9628,14 +11147,17 @@ const PARTYLIST_RAW = [
     "invalid": 2733,
     "blank": 3203,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 38864,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 18376,
     "margin": 20488,
     "percent_invalid": 2.9913968608392985,
     "ballot_surplus": 58
   },
   {
+    "cid": 188,
     "province_thai": "นครพนม",
     "province_eng": "NAKHON PHANOM",
     "prov_id": "NPM",
@@ -9647,14 +11169,17 @@ const PARTYLIST_RAW = [
     "invalid": 4134,
     "blank": 911,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 32422,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 25000,
     "margin": 7422,
     "percent_invalid": 4.729922998592693,
     "ballot_surplus": 1189
   },
   {
+    "cid": 189,
     "province_thai": "นครพนม",
     "province_eng": "NAKHON PHANOM",
     "prov_id": "NPM",
@@ -9666,14 +11191,17 @@ const PARTYLIST_RAW = [
     "invalid": 4303,
     "blank": 2585,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 35727,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 21785,
     "margin": 13942,
     "percent_invalid": 4.781536136545471,
     "ballot_surplus": -246
   },
   {
+    "cid": 190,
     "province_thai": "นครพนม",
     "province_eng": "NAKHON PHANOM",
     "prov_id": "NPM",
@@ -9685,14 +11213,17 @@ const PARTYLIST_RAW = [
     "invalid": 3889,
     "blank": 1727,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 33128,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 20273,
     "margin": 12855,
     "percent_invalid": 4.367405610583294,
     "ballot_surplus": -104
   },
   {
+    "cid": 191,
     "province_thai": "นครพนม",
     "province_eng": "NAKHON PHANOM",
     "prov_id": "NPM",
@@ -9704,14 +11235,17 @@ const PARTYLIST_RAW = [
     "invalid": 3810,
     "blank": 1391,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 31687,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 19158,
     "margin": 12529,
     "percent_invalid": 4.159434054956932,
     "ballot_surplus": -496
   },
   {
+    "cid": 172,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -9723,14 +11257,17 @@ const PARTYLIST_RAW = [
     "invalid": 2491,
     "blank": 4052,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 31127,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 15251,
     "margin": 15876,
     "percent_invalid": 2.9265942948446826,
     "ballot_surplus": -111
   },
   {
+    "cid": 173,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -9742,14 +11279,17 @@ const PARTYLIST_RAW = [
     "invalid": 3960,
     "blank": 4346,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 35568,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 15401,
     "margin": 20167,
     "percent_invalid": 4.147031102733271,
     "ballot_surplus": -53
   },
   {
+    "cid": 174,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -9761,14 +11301,17 @@ const PARTYLIST_RAW = [
     "invalid": 4107,
     "blank": 4236,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 36362,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 16200,
     "margin": 20162,
     "percent_invalid": 4.220272103251264,
     "ballot_surplus": 5
   },
   {
+    "cid": 175,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -9780,14 +11323,17 @@ const PARTYLIST_RAW = [
     "invalid": 3883,
     "blank": 3420,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 22910,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 14697,
     "margin": 8213,
     "percent_invalid": 4.993762619442623,
     "ballot_surplus": 1806
   },
   {
+    "cid": 176,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -9799,14 +11345,17 @@ const PARTYLIST_RAW = [
     "invalid": 5626,
     "blank": 3194,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 21291,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 21258,
     "margin": 33,
     "percent_invalid": 6.163790742262394,
     "ballot_surplus": -129
   },
   {
+    "cid": 177,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -9818,14 +11367,17 @@ const PARTYLIST_RAW = [
     "invalid": 4584,
     "blank": 1586,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 20277,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 18884,
     "margin": 1393,
     "percent_invalid": 5.635257237691315,
     "ballot_surplus": 540
   },
   {
+    "cid": 178,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -9837,14 +11389,17 @@ const PARTYLIST_RAW = [
     "invalid": 4207,
     "blank": 1670,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 22097,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 15172,
     "margin": 6925,
     "percent_invalid": 5.8022784321297545,
     "ballot_surplus": 104
   },
   {
+    "cid": 179,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -9856,14 +11411,17 @@ const PARTYLIST_RAW = [
     "invalid": 4210,
     "blank": 2604,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 23551,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 15911,
     "margin": 7640,
     "percent_invalid": 5.369692486256904,
     "ballot_surplus": -47
   },
   {
+    "cid": 180,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -9875,14 +11433,17 @@ const PARTYLIST_RAW = [
     "invalid": 4843,
     "blank": 1871,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 24562,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 19243,
     "margin": 5319,
     "percent_invalid": 5.552052643043025,
     "ballot_surplus": -3967
   },
   {
+    "cid": 181,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -9894,14 +11455,17 @@ const PARTYLIST_RAW = [
     "invalid": 6222,
     "blank": 3512,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 26225,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 22685,
     "margin": 3540,
     "percent_invalid": 6.07350285519059,
     "ballot_surplus": 434
   },
   {
+    "cid": 182,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -9913,14 +11477,17 @@ const PARTYLIST_RAW = [
     "invalid": 5001,
     "blank": 3092,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 25989,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 17627,
     "margin": 8362,
     "percent_invalid": 5.854395186308137,
     "ballot_surplus": -158
   },
   {
+    "cid": 183,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -9932,14 +11499,17 @@ const PARTYLIST_RAW = [
     "invalid": 5551,
     "blank": 3403,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 23421,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 16752,
     "margin": 6669,
     "percent_invalid": 6.142117376294592,
     "ballot_surplus": -4163
   },
   {
+    "cid": 184,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -9951,14 +11521,17 @@ const PARTYLIST_RAW = [
     "invalid": 4332,
     "blank": 3216,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 21042,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 15975,
     "margin": 5067,
     "percent_invalid": 6.015246400155519,
     "ballot_surplus": -273
   },
   {
+    "cid": 185,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -9970,14 +11543,17 @@ const PARTYLIST_RAW = [
     "invalid": 3537,
     "blank": 3766,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 30378,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 12640,
     "margin": 17738,
     "percent_invalid": 4.317310743842004,
     "ballot_surplus": 197
   },
   {
+    "cid": 186,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -9989,14 +11565,17 @@ const PARTYLIST_RAW = [
     "invalid": 5270,
     "blank": 1967,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 22596,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 21560,
     "margin": 1036,
     "percent_invalid": 5.663682575847134,
     "ballot_surplus": -3229
   },
   {
+    "cid": 187,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -10008,14 +11587,17 @@ const PARTYLIST_RAW = [
     "invalid": 4954,
     "blank": 1896,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 18939,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 17347,
     "margin": 1592,
     "percent_invalid": 6.017466930654584,
     "ballot_surplus": 598
   },
   {
+    "cid": 204,
     "province_thai": "นครศรีธรรมราช",
     "province_eng": "NAKHON SI THAMMARAT",
     "prov_id": "NST",
@@ -10027,14 +11609,17 @@ const PARTYLIST_RAW = [
     "invalid": 3015,
     "blank": 2315,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 38863,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 20133,
     "margin": 18730,
     "percent_invalid": 3.20223466060561,
     "ballot_surplus": 0
   },
   {
+    "cid": 205,
     "province_thai": "นครศรีธรรมราช",
     "province_eng": "NAKHON SI THAMMARAT",
     "prov_id": "NST",
@@ -10046,14 +11631,17 @@ const PARTYLIST_RAW = [
     "invalid": 3387,
     "blank": 2121,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 50613,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 11883,
     "margin": 38730,
     "percent_invalid": 3.775120097192345,
     "ballot_surplus": 55
   },
   {
+    "cid": 206,
     "province_thai": "นครศรีธรรมราช",
     "province_eng": "NAKHON SI THAMMARAT",
     "prov_id": "NST",
@@ -10065,14 +11653,17 @@ const PARTYLIST_RAW = [
     "invalid": 3286,
     "blank": 1165,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 57468,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 11259,
     "margin": 46209,
     "percent_invalid": 3.53907958082478,
     "ballot_surplus": -52
   },
   {
+    "cid": 207,
     "province_thai": "นครศรีธรรมราช",
     "province_eng": "NAKHON SI THAMMARAT",
     "prov_id": "NST",
@@ -10084,14 +11675,17 @@ const PARTYLIST_RAW = [
     "invalid": 3174,
     "blank": 1600,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 59076,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 13648,
     "margin": 45428,
     "percent_invalid": 3.2508833922261484,
     "ballot_surplus": -371
   },
   {
+    "cid": 208,
     "province_thai": "นครศรีธรรมราช",
     "province_eng": "NAKHON SI THAMMARAT",
     "prov_id": "NST",
@@ -10103,14 +11697,17 @@ const PARTYLIST_RAW = [
     "invalid": 2910,
     "blank": 2353,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 50902,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 13958,
     "margin": 36944,
     "percent_invalid": 3.0410701222698298,
     "ballot_surplus": 240
   },
   {
+    "cid": 209,
     "province_thai": "นครศรีธรรมราช",
     "province_eng": "NAKHON SI THAMMARAT",
     "prov_id": "NST",
@@ -10122,14 +11719,17 @@ const PARTYLIST_RAW = [
     "invalid": 3058,
     "blank": 1536,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 60478,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 12707,
     "margin": 47771,
     "percent_invalid": 3.090918279678577,
     "ballot_surplus": 203
   },
   {
+    "cid": 210,
     "province_thai": "นครศรีธรรมราช",
     "province_eng": "NAKHON SI THAMMARAT",
     "prov_id": "NST",
@@ -10141,14 +11741,17 @@ const PARTYLIST_RAW = [
     "invalid": 3577,
     "blank": 3847,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 48067,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 13479,
     "margin": 34588,
     "percent_invalid": 3.7658181205651355,
     "ballot_surplus": -33
   },
   {
+    "cid": 211,
     "province_thai": "นครศรีธรรมราช",
     "province_eng": "NAKHON SI THAMMARAT",
     "prov_id": "NST",
@@ -10160,14 +11763,17 @@ const PARTYLIST_RAW = [
     "invalid": 3426,
     "blank": 2020,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 45987,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 15758,
     "margin": 30229,
     "percent_invalid": 3.725775931443983,
     "ballot_surplus": -386
   },
   {
+    "cid": 212,
     "province_thai": "นครศรีธรรมราช",
     "province_eng": "NAKHON SI THAMMARAT",
     "prov_id": "NST",
@@ -10179,14 +11785,17 @@ const PARTYLIST_RAW = [
     "invalid": 2519,
     "blank": 1312,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 43116,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 12471,
     "margin": 30645,
     "percent_invalid": 3.188688321223322,
     "ballot_surplus": -390
   },
   {
+    "cid": 198,
     "province_thai": "นครสวรรค์",
     "province_eng": "NAKHON SAWAN",
     "prov_id": "NSN",
@@ -10198,14 +11807,17 @@ const PARTYLIST_RAW = [
     "invalid": 3539,
     "blank": 3182,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 27379,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 25574,
     "margin": 1805,
     "percent_invalid": 4.0842941061062445,
     "ballot_surplus": -609
   },
   {
+    "cid": 199,
     "province_thai": "นครสวรรค์",
     "province_eng": "NAKHON SAWAN",
     "prov_id": "NSN",
@@ -10217,14 +11829,17 @@ const PARTYLIST_RAW = [
     "invalid": 5988,
     "blank": 2739,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 27144,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 24691,
     "margin": 2453,
     "percent_invalid": 6.069759662655976,
     "ballot_surplus": -433
   },
   {
+    "cid": 200,
     "province_thai": "นครสวรรค์",
     "province_eng": "NAKHON SAWAN",
     "prov_id": "NSN",
@@ -10236,14 +11851,17 @@ const PARTYLIST_RAW = [
     "invalid": 6178,
     "blank": 3132,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 22674,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 11683,
     "margin": 10991,
     "percent_invalid": 6.863758068637581,
     "ballot_surplus": 81
   },
   {
+    "cid": 201,
     "province_thai": "นครสวรรค์",
     "province_eng": "NAKHON SAWAN",
     "prov_id": "NSN",
@@ -10255,14 +11873,17 @@ const PARTYLIST_RAW = [
     "invalid": 6366,
     "blank": 2079,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 18251,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 16585,
     "margin": 1666,
     "percent_invalid": 7.82871759555315,
     "ballot_surplus": 3
   },
   {
+    "cid": 202,
     "province_thai": "นครสวรรค์",
     "province_eng": "NAKHON SAWAN",
     "prov_id": "NSN",
@@ -10274,14 +11895,17 @@ const PARTYLIST_RAW = [
     "invalid": 6055,
     "blank": 2636,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 22896,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 18289,
     "margin": 4607,
     "percent_invalid": 7.240484532507444,
     "ballot_surplus": -472
   },
   {
+    "cid": 203,
     "province_thai": "นครสวรรค์",
     "province_eng": "NAKHON SAWAN",
     "prov_id": "NSN",
@@ -10293,14 +11917,17 @@ const PARTYLIST_RAW = [
     "invalid": 6389,
     "blank": 1531,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 17321,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 15743,
     "margin": 1578,
     "percent_invalid": 7.961668348972547,
     "ballot_surplus": -301
   },
   {
+    "cid": 158,
     "province_thai": "นนทบุรี",
     "province_eng": "NONTHABURI",
     "prov_id": "NBI",
@@ -10312,14 +11939,17 @@ const PARTYLIST_RAW = [
     "invalid": 1795,
     "blank": 2726,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 39671,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 17545,
     "margin": 22126,
     "percent_invalid": 1.93064727773356,
     "ballot_surplus": -31
   },
   {
+    "cid": 159,
     "province_thai": "นนทบุรี",
     "province_eng": "NONTHABURI",
     "prov_id": "NBI",
@@ -10331,14 +11961,17 @@ const PARTYLIST_RAW = [
     "invalid": 1706,
     "blank": 2962,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 36127,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 15508,
     "margin": 20619,
     "percent_invalid": 2.0470116749259066,
     "ballot_surplus": -138
   },
   {
+    "cid": 160,
     "province_thai": "นนทบุรี",
     "province_eng": "NONTHABURI",
     "prov_id": "NBI",
@@ -10350,14 +11983,17 @@ const PARTYLIST_RAW = [
     "invalid": 1663,
     "blank": 2918,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 36132,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 13961,
     "margin": 22171,
     "percent_invalid": 2.0637363182844806,
     "ballot_surplus": -18
   },
   {
+    "cid": 161,
     "province_thai": "นนทบุรี",
     "province_eng": "NONTHABURI",
     "prov_id": "NBI",
@@ -10369,14 +12005,17 @@ const PARTYLIST_RAW = [
     "invalid": 1383,
     "blank": 2432,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 32344,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 16166,
     "margin": 16178,
     "percent_invalid": 1.8044229891056167,
     "ballot_surplus": 599
   },
   {
+    "cid": 162,
     "province_thai": "นนทบุรี",
     "province_eng": "NONTHABURI",
     "prov_id": "NBI",
@@ -10388,14 +12027,17 @@ const PARTYLIST_RAW = [
     "invalid": 2301,
     "blank": 3193,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 41652,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 21336,
     "margin": 20316,
     "percent_invalid": 2.319743527703847,
     "ballot_surplus": -215
   },
   {
+    "cid": 163,
     "province_thai": "นนทบุรี",
     "province_eng": "NONTHABURI",
     "prov_id": "NBI",
@@ -10407,14 +12049,17 @@ const PARTYLIST_RAW = [
     "invalid": 2426,
     "blank": 3760,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 46625,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 18773,
     "margin": 27852,
     "percent_invalid": 2.3096623094719004,
     "ballot_surplus": -136
   },
   {
+    "cid": 164,
     "province_thai": "นนทบุรี",
     "province_eng": "NONTHABURI",
     "prov_id": "NBI",
@@ -10426,14 +12071,17 @@ const PARTYLIST_RAW = [
     "invalid": 2351,
     "blank": 3640,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 40439,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 15436,
     "margin": 25003,
     "percent_invalid": 2.4874095391256503,
     "ballot_surplus": 432
   },
   {
+    "cid": 165,
     "province_thai": "นนทบุรี",
     "province_eng": "NONTHABURI",
     "prov_id": "NBI",
@@ -10445,14 +12093,17 @@ const PARTYLIST_RAW = [
     "invalid": 2622,
     "blank": 3270,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 39743,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 20694,
     "margin": 19049,
     "percent_invalid": 2.6808171277835715,
     "ballot_surplus": 246
   },
   {
+    "cid": 214,
     "province_thai": "นราธิวาส",
     "province_eng": "NARATHIWAT",
     "prov_id": "NWT",
@@ -10464,14 +12115,17 @@ const PARTYLIST_RAW = [
     "invalid": 5586,
     "blank": 2234,
     "winner_party": "ประชาชาติ",
+    "winner_pid": 35,
     "winner_votes": 26389,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 22249,
     "margin": 4140,
     "percent_invalid": 5.881423923686787,
     "ballot_surplus": -2500
   },
   {
+    "cid": 215,
     "province_thai": "นราธิวาส",
     "province_eng": "NARATHIWAT",
     "prov_id": "NWT",
@@ -10483,14 +12137,17 @@ const PARTYLIST_RAW = [
     "invalid": 4683,
     "blank": 1930,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 14722,
     "runnerup_party": "ประชาชาติ",
+    "runnerup_pid": 35,
     "runnerup_votes": 13506,
     "margin": 1216,
     "percent_invalid": 6.650666060726559,
     "ballot_surplus": 2093
   },
   {
+    "cid": 216,
     "province_thai": "นราธิวาส",
     "province_eng": "NARATHIWAT",
     "prov_id": "NWT",
@@ -10502,14 +12159,17 @@ const PARTYLIST_RAW = [
     "invalid": 4632,
     "blank": 807,
     "winner_party": "ประชาชาติ",
+    "winner_pid": 35,
     "winner_votes": 20935,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 15386,
     "margin": 5549,
     "percent_invalid": 6.156299840510367,
     "ballot_surplus": 6921
   },
   {
+    "cid": 217,
     "province_thai": "นราธิวาส",
     "province_eng": "NARATHIWAT",
     "prov_id": "NWT",
@@ -10521,14 +12181,17 @@ const PARTYLIST_RAW = [
     "invalid": 4431,
     "blank": 973,
     "winner_party": "ประชาชาติ",
+    "winner_pid": 35,
     "winner_votes": 27823,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 16312,
     "margin": 11511,
     "percent_invalid": 5.3962879968823065,
     "ballot_surplus": -298
   },
   {
+    "cid": 218,
     "province_thai": "นราธิวาส",
     "province_eng": "NARATHIWAT",
     "prov_id": "NWT",
@@ -10540,33 +12203,39 @@ const PARTYLIST_RAW = [
     "invalid": 5196,
     "blank": 1165,
     "winner_party": "ประชาชาติ",
+    "winner_pid": 35,
     "winner_votes": 32314,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 17303,
     "margin": 15011,
     "percent_invalid": 6.096587975782606,
     "ballot_surplus": -351
   },
   {
+    "cid": 155,
     "province_thai": "น่าน",
-    "province_eng": "",
-    "prov_id": "",
+    "province_eng": "NAN",
+    "prov_id": "NAN",
     "cons_no": 1,
-    "region": "",
+    "region": "North",
     "turn_out": 91799,
     "total_used": 91799,
     "valid": 83071,
     "invalid": 4411,
     "blank": 4317,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 29405,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 17210,
     "margin": 12195,
     "percent_invalid": 4.805063235982963,
     "ballot_surplus": 349
   },
   {
+    "cid": 156,
     "province_thai": "น่าน",
     "province_eng": "NAN",
     "prov_id": "NAN",
@@ -10578,14 +12247,17 @@ const PARTYLIST_RAW = [
     "invalid": 3785,
     "blank": 3099,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 22844,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 17902,
     "margin": 4942,
     "percent_invalid": 4.474682870890326,
     "ballot_surplus": 8806
   },
   {
+    "cid": 157,
     "province_thai": "น่าน",
     "province_eng": "NAN",
     "prov_id": "NAN",
@@ -10597,14 +12269,17 @@ const PARTYLIST_RAW = [
     "invalid": 4500,
     "blank": 2912,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 22053,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 17258,
     "margin": 4795,
     "percent_invalid": 5.851222905587268,
     "ballot_surplus": -240
   },
   {
+    "cid": 42,
     "province_thai": "บึงกาฬ",
     "province_eng": "BUENG KAN",
     "prov_id": "BKN",
@@ -10616,14 +12291,17 @@ const PARTYLIST_RAW = [
     "invalid": 2994,
     "blank": 1327,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 22037,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 16428,
     "margin": 5609,
     "percent_invalid": 4.243858878226481,
     "ballot_surplus": -3677
   },
   {
+    "cid": 43,
     "province_thai": "บึงกาฬ",
     "province_eng": "BUENG KAN",
     "prov_id": "BKN",
@@ -10635,14 +12313,17 @@ const PARTYLIST_RAW = [
     "invalid": 3178,
     "blank": 1111,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 23027,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 15497,
     "margin": 7530,
     "percent_invalid": 4.379401105185552,
     "ballot_surplus": 996
   },
   {
+    "cid": 44,
     "province_thai": "บึงกาฬ",
     "province_eng": "BUENG KAN",
     "prov_id": "BKN",
@@ -10654,14 +12335,17 @@ const PARTYLIST_RAW = [
     "invalid": 3244,
     "blank": 1584,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 19084,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 14869,
     "margin": 4215,
     "percent_invalid": 4.675429493831431,
     "ballot_surplus": -81
   },
   {
+    "cid": 45,
     "province_thai": "บุรีรัมย์",
     "province_eng": "BURI RAM",
     "prov_id": "BRM",
@@ -10673,14 +12357,17 @@ const PARTYLIST_RAW = [
     "invalid": 3523,
     "blank": 1579,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 44304,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 12638,
     "margin": 31666,
     "percent_invalid": 4.597656148043745,
     "ballot_surplus": 144
   },
   {
+    "cid": 46,
     "province_thai": "บุรีรัมย์",
     "province_eng": "BURI RAM",
     "prov_id": "BRM",
@@ -10692,14 +12379,17 @@ const PARTYLIST_RAW = [
     "invalid": 4143,
     "blank": 1694,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 44114,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 16461,
     "margin": 27653,
     "percent_invalid": 5.0069490603661855,
     "ballot_surplus": -75
   },
   {
+    "cid": 47,
     "province_thai": "บุรีรัมย์",
     "province_eng": "BURI RAM",
     "prov_id": "BRM",
@@ -10711,14 +12401,17 @@ const PARTYLIST_RAW = [
     "invalid": 3345,
     "blank": 836,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 40973,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 9383,
     "margin": 31590,
     "percent_invalid": 4.916803857008467,
     "ballot_surplus": 86
   },
   {
+    "cid": 48,
     "province_thai": "บุรีรัมย์",
     "province_eng": "BURI RAM",
     "prov_id": "BRM",
@@ -10730,14 +12423,17 @@ const PARTYLIST_RAW = [
     "invalid": 3538,
     "blank": 1055,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 32276,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 9829,
     "margin": 22447,
     "percent_invalid": 5.356872482815008,
     "ballot_surplus": 5042
   },
   {
+    "cid": 49,
     "province_thai": "บุรีรัมย์",
     "province_eng": "BURI RAM",
     "prov_id": "BRM",
@@ -10749,14 +12445,17 @@ const PARTYLIST_RAW = [
     "invalid": 3602,
     "blank": 1298,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 36583,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 10624,
     "margin": 25959,
     "percent_invalid": 4.985398125977495,
     "ballot_surplus": 5719
   },
   {
+    "cid": 50,
     "province_thai": "บุรีรัมย์",
     "province_eng": "BURI RAM",
     "prov_id": "BRM",
@@ -10768,14 +12467,17 @@ const PARTYLIST_RAW = [
     "invalid": 3318,
     "blank": 1348,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 37725,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 9731,
     "margin": 27994,
     "percent_invalid": 4.746577400111583,
     "ballot_surplus": -397
   },
   {
+    "cid": 51,
     "province_thai": "บุรีรัมย์",
     "province_eng": "BURI RAM",
     "prov_id": "BRM",
@@ -10787,14 +12489,17 @@ const PARTYLIST_RAW = [
     "invalid": 3656,
     "blank": 1292,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 33112,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 10416,
     "margin": 22696,
     "percent_invalid": 5.181773084827439,
     "ballot_surplus": 562
   },
   {
+    "cid": 52,
     "province_thai": "บุรีรัมย์",
     "province_eng": "BURI RAM",
     "prov_id": "BRM",
@@ -10806,14 +12511,17 @@ const PARTYLIST_RAW = [
     "invalid": 4018,
     "blank": 2132,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 36783,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 15429,
     "margin": 21354,
     "percent_invalid": 5.045076718314457,
     "ballot_surplus": 100
   },
   {
+    "cid": 53,
     "province_thai": "บุรีรัมย์",
     "province_eng": "BURI RAM",
     "prov_id": "BRM",
@@ -10825,14 +12533,17 @@ const PARTYLIST_RAW = [
     "invalid": 4071,
     "blank": 1512,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 37393,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 11057,
     "margin": 26336,
     "percent_invalid": 5.614010894297731,
     "ballot_surplus": -5483
   },
   {
+    "cid": 54,
     "province_thai": "บุรีรัมย์",
     "province_eng": "BURI RAM",
     "prov_id": "BRM",
@@ -10844,14 +12555,17 @@ const PARTYLIST_RAW = [
     "invalid": 3554,
     "blank": 1136,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 36620,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 8260,
     "margin": 28360,
     "percent_invalid": 5.453345813321876,
     "ballot_surplus": -14
   },
   {
+    "cid": 255,
     "province_thai": "ปทุมธานี",
     "province_eng": "PATHUM THANI",
     "prov_id": "PTE",
@@ -10863,14 +12577,17 @@ const PARTYLIST_RAW = [
     "invalid": 3184,
     "blank": 3372,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 37705,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 13821,
     "margin": 23884,
     "percent_invalid": 3.297773174520974,
     "ballot_surplus": -7
   },
   {
+    "cid": 256,
     "province_thai": "ปทุมธานี",
     "province_eng": "PATHUM THANI",
     "prov_id": "PTE",
@@ -10882,14 +12599,17 @@ const PARTYLIST_RAW = [
     "invalid": 3080,
     "blank": 2859,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 37910,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 17633,
     "margin": 20277,
     "percent_invalid": 3.1590391597776364,
     "ballot_surplus": 118
   },
   {
+    "cid": 257,
     "province_thai": "ปทุมธานี",
     "province_eng": "PATHUM THANI",
     "prov_id": "PTE",
@@ -10901,14 +12621,17 @@ const PARTYLIST_RAW = [
     "invalid": 1755,
     "blank": 3025,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 42752,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 15442,
     "margin": 27310,
     "percent_invalid": 1.9757728592979533,
     "ballot_surplus": 14
   },
   {
+    "cid": 258,
     "province_thai": "ปทุมธานี",
     "province_eng": "PATHUM THANI",
     "prov_id": "PTE",
@@ -10920,14 +12643,17 @@ const PARTYLIST_RAW = [
     "invalid": 2348,
     "blank": 2667,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 40367,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 13330,
     "margin": 27037,
     "percent_invalid": 2.589267991442624,
     "ballot_surplus": 50
   },
   {
+    "cid": 259,
     "province_thai": "ปทุมธานี",
     "province_eng": "PATHUM THANI",
     "prov_id": "PTE",
@@ -10939,14 +12665,17 @@ const PARTYLIST_RAW = [
     "invalid": 1742,
     "blank": 2501,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 34201,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 13341,
     "margin": 20860,
     "percent_invalid": 2.1645936105968167,
     "ballot_surplus": -413
   },
   {
+    "cid": 260,
     "province_thai": "ปทุมธานี",
     "province_eng": "PATHUM THANI",
     "prov_id": "PTE",
@@ -10958,14 +12687,17 @@ const PARTYLIST_RAW = [
     "invalid": 1415,
     "blank": 2505,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 39883,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 12627,
     "margin": 27256,
     "percent_invalid": 1.706320016399966,
     "ballot_surplus": 665
   },
   {
+    "cid": 261,
     "province_thai": "ปทุมธานี",
     "province_eng": "PATHUM THANI",
     "prov_id": "PTE",
@@ -10977,14 +12709,17 @@ const PARTYLIST_RAW = [
     "invalid": 2790,
     "blank": 2528,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 33644,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 22365,
     "margin": 11279,
     "percent_invalid": 3.188753643065318,
     "ballot_surplus": -274
   },
   {
+    "cid": 400,
     "province_thai": "ปทุมธานี",
     "province_eng": "PATHUM THANI",
     "prov_id": "PTE",
@@ -10996,14 +12731,17 @@ const PARTYLIST_RAW = [
     "invalid": 3088,
     "blank": 2466,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 28560,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 18742,
     "margin": 9818,
     "percent_invalid": 3.814417708384801,
     "ballot_surplus": -461
   },
   {
+    "cid": 227,
     "province_thai": "ประจวบคีรีขันธ์",
     "province_eng": "PRACHUAP KHIRI KHAN",
     "prov_id": "PKN",
@@ -11015,14 +12753,17 @@ const PARTYLIST_RAW = [
     "invalid": 6600,
     "blank": 2978,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 23963,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 23141,
     "margin": 822,
     "percent_invalid": 6.134000018587879,
     "ballot_surplus": -243
   },
   {
+    "cid": 228,
     "province_thai": "ประจวบคีรีขันธ์",
     "province_eng": "PRACHUAP KHIRI KHAN",
     "prov_id": "PKN",
@@ -11034,14 +12775,17 @@ const PARTYLIST_RAW = [
     "invalid": 4368,
     "blank": 3272,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 29936,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 14948,
     "margin": 14988,
     "percent_invalid": 4.430559500142005,
     "ballot_surplus": -247
   },
   {
+    "cid": 229,
     "province_thai": "ประจวบคีรีขันธ์",
     "province_eng": "PRACHUAP KHIRI KHAN",
     "prov_id": "PKN",
@@ -11053,14 +12797,17 @@ const PARTYLIST_RAW = [
     "invalid": 4621,
     "blank": 1894,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 28753,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 18113,
     "margin": 10640,
     "percent_invalid": 4.95485835602925,
     "ballot_surplus": -61
   },
   {
+    "cid": 252,
     "province_thai": "ปราจีนบุรี",
     "province_eng": "PRACHIN BURI",
     "prov_id": "PRI",
@@ -11072,33 +12819,39 @@ const PARTYLIST_RAW = [
     "invalid": 4390,
     "blank": 5114,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 29525,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 18600,
     "margin": 10925,
     "percent_invalid": 4.863511477443942,
     "ballot_surplus": -400
   },
   {
+    "cid": 253,
     "province_thai": "ปราจีนบุรี",
-    "province_eng": "",
-    "prov_id": "",
+    "province_eng": "PRACHIN BURI",
+    "prov_id": "PRI",
     "cons_no": 2,
-    "region": "",
+    "region": "Central",
     "turn_out": 101584,
     "total_used": 101584,
     "valid": 93228,
     "invalid": 4923,
     "blank": 3433,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 33840,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 20615,
     "margin": 13225,
     "percent_invalid": 4.846235627657899,
     "ballot_surplus": 303
   },
   {
+    "cid": 254,
     "province_thai": "ปราจีนบุรี",
     "province_eng": "PRACHIN BURI",
     "prov_id": "PRI",
@@ -11110,14 +12863,17 @@ const PARTYLIST_RAW = [
     "invalid": 4879,
     "blank": 3495,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 25513,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 17008,
     "margin": 8505,
     "percent_invalid": 5.680653874813711,
     "ballot_surplus": 261
   },
   {
+    "cid": 262,
     "province_thai": "ปัตตานี",
     "province_eng": "PATTANI",
     "prov_id": "PTN",
@@ -11129,14 +12885,17 @@ const PARTYLIST_RAW = [
     "invalid": 3061,
     "blank": 1911,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 21801,
     "runnerup_party": "ประชาชาติ",
+    "runnerup_pid": 35,
     "runnerup_votes": 15956,
     "margin": 5845,
     "percent_invalid": 4.3573574001053395,
     "ballot_surplus": -4373
   },
   {
+    "cid": 263,
     "province_thai": "ปัตตานี",
     "province_eng": "PATTANI",
     "prov_id": "PTN",
@@ -11148,14 +12907,17 @@ const PARTYLIST_RAW = [
     "invalid": 4110,
     "blank": 1482,
     "winner_party": "ประชาชาติ",
+    "winner_pid": 35,
     "winner_votes": 16806,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 16527,
     "margin": 279,
     "percent_invalid": 5.523970807628724,
     "ballot_surplus": 2853
   },
   {
+    "cid": 264,
     "province_thai": "ปัตตานี",
     "province_eng": "PATTANI",
     "prov_id": "PTN",
@@ -11167,14 +12929,17 @@ const PARTYLIST_RAW = [
     "invalid": 3546,
     "blank": 1033,
     "winner_party": "ประชาชาติ",
+    "winner_pid": 35,
     "winner_votes": 24702,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 15744,
     "margin": 8958,
     "percent_invalid": 5.449934680703912,
     "ballot_surplus": 102
   },
   {
+    "cid": 265,
     "province_thai": "ปัตตานี",
     "province_eng": "PATTANI",
     "prov_id": "PTN",
@@ -11186,14 +12951,17 @@ const PARTYLIST_RAW = [
     "invalid": 3881,
     "blank": 1153,
     "winner_party": "ประชาชาติ",
+    "winner_pid": 35,
     "winner_votes": 24922,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 20072,
     "margin": 4850,
     "percent_invalid": 4.9113526784019435,
     "ballot_surplus": -3110
   },
   {
+    "cid": 266,
     "province_thai": "ปัตตานี",
     "province_eng": "PATTANI",
     "prov_id": "PTN",
@@ -11205,14 +12973,17 @@ const PARTYLIST_RAW = [
     "invalid": 4158,
     "blank": 1066,
     "winner_party": "ประชาชาติ",
+    "winner_pid": 35,
     "winner_votes": 28523,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 16373,
     "margin": 12150,
     "percent_invalid": 5.946116005033749,
     "ballot_surplus": 232
   },
   {
+    "cid": 4,
     "province_thai": "พระนครศรีอยุธยา",
     "province_eng": "PHRA NAKHON SI AYUTTHAYA",
     "prov_id": "AYA",
@@ -11224,14 +12995,17 @@ const PARTYLIST_RAW = [
     "invalid": 4026,
     "blank": 4119,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 36315,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 23300,
     "margin": 13015,
     "percent_invalid": 4.09816875171775,
     "ballot_surplus": 848
   },
   {
+    "cid": 5,
     "province_thai": "พระนครศรีอยุธยา",
     "province_eng": "PHRA NAKHON SI AYUTTHAYA",
     "prov_id": "AYA",
@@ -11243,14 +13017,17 @@ const PARTYLIST_RAW = [
     "invalid": 5460,
     "blank": 4108,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 30265,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 24093,
     "margin": 6172,
     "percent_invalid": 5.59265784406113,
     "ballot_surplus": 446
   },
   {
+    "cid": 6,
     "province_thai": "พระนครศรีอยุธยา",
     "province_eng": "PHRA NAKHON SI AYUTTHAYA",
     "prov_id": "AYA",
@@ -11262,14 +13039,17 @@ const PARTYLIST_RAW = [
     "invalid": 4544,
     "blank": 3332,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 36514,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 22638,
     "margin": 13876,
     "percent_invalid": 4.545772851412051,
     "ballot_surplus": 233
   },
   {
+    "cid": 7,
     "province_thai": "พระนครศรีอยุธยา",
     "province_eng": "PHRA NAKHON SI AYUTTHAYA",
     "prov_id": "AYA",
@@ -11281,14 +13061,17 @@ const PARTYLIST_RAW = [
     "invalid": 3972,
     "blank": 3142,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 36678,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 26311,
     "margin": 10367,
     "percent_invalid": 3.9051439358187827,
     "ballot_surplus": 862
   },
   {
+    "cid": 8,
     "province_thai": "พระนครศรีอยุธยา",
     "province_eng": "PHRA NAKHON SI AYUTTHAYA",
     "prov_id": "AYA",
@@ -11300,14 +13083,17 @@ const PARTYLIST_RAW = [
     "invalid": 5331,
     "blank": 2855,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 27598,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 25511,
     "margin": 2087,
     "percent_invalid": 5.426893202895157,
     "ballot_surplus": -86
   },
   {
+    "cid": 267,
     "province_thai": "พะเยา",
     "province_eng": "PHAYAO",
     "prov_id": "PYO",
@@ -11319,14 +13105,17 @@ const PARTYLIST_RAW = [
     "invalid": 3339,
     "blank": 1670,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 48433,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 16730,
     "margin": 31703,
     "percent_invalid": 3.9242648614343136,
     "ballot_surplus": 75
   },
   {
+    "cid": 268,
     "province_thai": "พะเยา",
     "province_eng": "PHAYAO",
     "prov_id": "PYO",
@@ -11338,14 +13127,17 @@ const PARTYLIST_RAW = [
     "invalid": 4145,
     "blank": 2031,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 30456,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 23461,
     "margin": 6995,
     "percent_invalid": 4.50567965650307,
     "ballot_surplus": -278
   },
   {
+    "cid": 269,
     "province_thai": "พะเยา",
     "province_eng": "PHAYAO",
     "prov_id": "PYO",
@@ -11357,14 +13149,17 @@ const PARTYLIST_RAW = [
     "invalid": 4841,
     "blank": 1778,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 34824,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 16565,
     "margin": 18259,
     "percent_invalid": 5.7357819905213265,
     "ballot_surplus": 522
   },
   {
+    "cid": 241,
     "province_thai": "พังงา",
     "province_eng": "PHANGNGA",
     "prov_id": "PNA",
@@ -11376,14 +13171,17 @@ const PARTYLIST_RAW = [
     "invalid": 2506,
     "blank": 2281,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 30620,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 12528,
     "margin": 18092,
     "percent_invalid": 3.535802469135802,
     "ballot_surplus": 268
   },
   {
+    "cid": 242,
     "province_thai": "พังงา",
     "province_eng": "PHANGNGA",
     "prov_id": "PNA",
@@ -11395,14 +13193,17 @@ const PARTYLIST_RAW = [
     "invalid": 3212,
     "blank": 2789,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 32147,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 15396,
     "margin": 16751,
     "percent_invalid": 4.030163490131621,
     "ballot_surplus": -313
   },
   {
+    "cid": 233,
     "province_thai": "พัทลุง",
     "province_eng": "PHATTHALUNG",
     "prov_id": "PLG",
@@ -11414,14 +13215,17 @@ const PARTYLIST_RAW = [
     "invalid": 3086,
     "blank": 1771,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 50453,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 17342,
     "margin": 33111,
     "percent_invalid": 3.063331348024618,
     "ballot_surplus": 8421
   },
   {
+    "cid": 234,
     "province_thai": "พัทลุง",
     "province_eng": "PHATTHALUNG",
     "prov_id": "PLG",
@@ -11433,14 +13237,17 @@ const PARTYLIST_RAW = [
     "invalid": 3431,
     "blank": 1510,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 58443,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 16054,
     "margin": 42389,
     "percent_invalid": 3.157381333627814,
     "ballot_surplus": 7445
   },
   {
+    "cid": 235,
     "province_thai": "พัทลุง",
     "province_eng": "PHATTHALUNG",
     "prov_id": "PLG",
@@ -11452,14 +13259,17 @@ const PARTYLIST_RAW = [
     "invalid": 3405,
     "blank": 1685,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 56809,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 16456,
     "margin": 40353,
     "percent_invalid": 3.2494178722754516,
     "ballot_surplus": -222
   },
   {
+    "cid": 224,
     "province_thai": "พิจิตร",
     "province_eng": "PHICHIT",
     "prov_id": "PCT",
@@ -11471,14 +13281,17 @@ const PARTYLIST_RAW = [
     "invalid": 5921,
     "blank": 3153,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 25486,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 24727,
     "margin": 759,
     "percent_invalid": 6.319575635319607,
     "ballot_surplus": 477
   },
   {
+    "cid": 225,
     "province_thai": "พิจิตร",
     "province_eng": "PHICHIT",
     "prov_id": "PCT",
@@ -11490,14 +13303,17 @@ const PARTYLIST_RAW = [
     "invalid": 5913,
     "blank": 2521,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 24091,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 20225,
     "margin": 3866,
     "percent_invalid": 6.869989543394911,
     "ballot_surplus": 297
   },
   {
+    "cid": 226,
     "province_thai": "พิจิตร",
     "province_eng": "PHICHIT",
     "prov_id": "PCT",
@@ -11509,14 +13325,17 @@ const PARTYLIST_RAW = [
     "invalid": 6339,
     "blank": 1920,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 22199,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 19812,
     "margin": 2387,
     "percent_invalid": 7.0846605196982395,
     "ballot_surplus": 392
   },
   {
+    "cid": 236,
     "province_thai": "พิษณุโลก",
     "province_eng": "PHITSANULOK",
     "prov_id": "PLK",
@@ -11528,14 +13347,17 @@ const PARTYLIST_RAW = [
     "invalid": 3249,
     "blank": 4706,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 36121,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 15135,
     "margin": 20986,
     "percent_invalid": 3.4646021945679646,
     "ballot_surplus": -467
   },
   {
+    "cid": 237,
     "province_thai": "พิษณุโลก",
     "province_eng": "PHITSANULOK",
     "prov_id": "PLK",
@@ -11547,14 +13369,17 @@ const PARTYLIST_RAW = [
     "invalid": 4897,
     "blank": 4856,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 27592,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 15968,
     "margin": 11624,
     "percent_invalid": 5.45250077940587,
     "ballot_surplus": 39
   },
   {
+    "cid": 238,
     "province_thai": "พิษณุโลก",
     "province_eng": "PHITSANULOK",
     "prov_id": "PLK",
@@ -11566,14 +13391,17 @@ const PARTYLIST_RAW = [
     "invalid": 6148,
     "blank": 2520,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 23211,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 18490,
     "margin": 4721,
     "percent_invalid": 6.771148826503079,
     "ballot_surplus": 475
   },
   {
+    "cid": 239,
     "province_thai": "พิษณุโลก",
     "province_eng": "PHITSANULOK",
     "prov_id": "PLK",
@@ -11585,14 +13413,17 @@ const PARTYLIST_RAW = [
     "invalid": 5236,
     "blank": 2049,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 21570,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 20526,
     "margin": 1044,
     "percent_invalid": 6.187077562981519,
     "ballot_surplus": 4662
   },
   {
+    "cid": 240,
     "province_thai": "พิษณุโลก",
     "province_eng": "PHITSANULOK",
     "prov_id": "PLK",
@@ -11604,14 +13435,17 @@ const PARTYLIST_RAW = [
     "invalid": 5425,
     "blank": 2968,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 22333,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 17555,
     "margin": 4778,
     "percent_invalid": 6.023293770193301,
     "ballot_surplus": -5104
   },
   {
+    "cid": 230,
     "province_thai": "ภูเก็ต",
     "province_eng": "PHUKET",
     "prov_id": "PKT",
@@ -11623,14 +13457,17 @@ const PARTYLIST_RAW = [
     "invalid": 1894,
     "blank": 2108,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 22574,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 18568,
     "margin": 4006,
     "percent_invalid": 2.7180620533279756,
     "ballot_surplus": -134
   },
   {
+    "cid": 231,
     "province_thai": "ภูเก็ต",
     "province_eng": "PHUKET",
     "prov_id": "PKT",
@@ -11642,14 +13479,17 @@ const PARTYLIST_RAW = [
     "invalid": 1772,
     "blank": 2441,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 20211,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 16945,
     "margin": 3266,
     "percent_invalid": 2.73993784113927,
     "ballot_surplus": -170
   },
   {
+    "cid": 232,
     "province_thai": "ภูเก็ต",
     "province_eng": "PHUKET",
     "prov_id": "PKT",
@@ -11661,14 +13501,17 @@ const PARTYLIST_RAW = [
     "invalid": 2218,
     "blank": 3059,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 24272,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 22729,
     "margin": 1543,
     "percent_invalid": 2.8250458528632567,
     "ballot_surplus": 27
   },
   {
+    "cid": 147,
     "province_thai": "มหาสารคาม",
     "province_eng": "MAHA SARAKHAM",
     "prov_id": "MKM",
@@ -11680,14 +13523,17 @@ const PARTYLIST_RAW = [
     "invalid": 3167,
     "blank": 2339,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 26286,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 21095,
     "margin": 5191,
     "percent_invalid": 3.724567799600141,
     "ballot_surplus": 45
   },
   {
+    "cid": 148,
     "province_thai": "มหาสารคาม",
     "province_eng": "MAHA SARAKHAM",
     "prov_id": "MKM",
@@ -11699,14 +13545,17 @@ const PARTYLIST_RAW = [
     "invalid": 3544,
     "blank": 1253,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 21578,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 14777,
     "margin": 6801,
     "percent_invalid": 4.883426114755002,
     "ballot_surplus": -401
   },
   {
+    "cid": 149,
     "province_thai": "มหาสารคาม",
     "province_eng": "MAHA SARAKHAM",
     "prov_id": "MKM",
@@ -11718,14 +13567,17 @@ const PARTYLIST_RAW = [
     "invalid": 3260,
     "blank": 787,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 28696,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 15977,
     "margin": 12719,
     "percent_invalid": 4.248276581049558,
     "ballot_surplus": 185
   },
   {
+    "cid": 150,
     "province_thai": "มหาสารคาม",
     "province_eng": "MAHA SARAKHAM",
     "prov_id": "MKM",
@@ -11737,14 +13589,17 @@ const PARTYLIST_RAW = [
     "invalid": 3921,
     "blank": 1080,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 23667,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 18364,
     "margin": 5303,
     "percent_invalid": 4.829531457850914,
     "ballot_surplus": -569
   },
   {
+    "cid": 151,
     "province_thai": "มหาสารคาม",
     "province_eng": "MAHA SARAKHAM",
     "prov_id": "MKM",
@@ -11756,14 +13611,17 @@ const PARTYLIST_RAW = [
     "invalid": 3400,
     "blank": 1973,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 25726,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 17601,
     "margin": 8125,
     "percent_invalid": 4.5477040782205105,
     "ballot_surplus": 4
   },
   {
+    "cid": 152,
     "province_thai": "มหาสารคาม",
     "province_eng": "MAHA SARAKHAM",
     "prov_id": "MKM",
@@ -11775,14 +13633,17 @@ const PARTYLIST_RAW = [
     "invalid": 3823,
     "blank": 1518,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 30310,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 19918,
     "margin": 10392,
     "percent_invalid": 4.412053226234579,
     "ballot_surplus": -321
   },
   {
+    "cid": 145,
     "province_thai": "มุกดาหาร",
     "province_eng": "MUKDAHAN",
     "prov_id": "MDH",
@@ -11794,14 +13655,17 @@ const PARTYLIST_RAW = [
     "invalid": 4708,
     "blank": 2201,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 28725,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 23628,
     "margin": 5097,
     "percent_invalid": 4.971173948852237,
     "ballot_surplus": 170
   },
   {
+    "cid": 146,
     "province_thai": "มุกดาหาร",
     "province_eng": "MUKDAHAN",
     "prov_id": "MDH",
@@ -11813,14 +13677,17 @@ const PARTYLIST_RAW = [
     "invalid": 4896,
     "blank": 1979,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 27480,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 18110,
     "margin": 9370,
     "percent_invalid": 5.454666993471334,
     "ballot_surplus": 409
   },
   {
+    "cid": 394,
     "province_thai": "ยะลา",
     "province_eng": "YALA",
     "prov_id": "YLA",
@@ -11832,14 +13699,17 @@ const PARTYLIST_RAW = [
     "invalid": 3854,
     "blank": 3012,
     "winner_party": "ประชาชาติ",
+    "winner_pid": 35,
     "winner_votes": 22624,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 21612,
     "margin": 1012,
     "percent_invalid": 4.3677822228770244,
     "ballot_surplus": 405
   },
   {
+    "cid": 395,
     "province_thai": "ยะลา",
     "province_eng": "YALA",
     "prov_id": "YLA",
@@ -11851,14 +13721,17 @@ const PARTYLIST_RAW = [
     "invalid": 5405,
     "blank": 1904,
     "winner_party": "ประชาชาติ",
+    "winner_pid": 35,
     "winner_votes": 42213,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 16596,
     "margin": 25617,
     "percent_invalid": 6.095566758015586,
     "ballot_surplus": 3254
   },
   {
+    "cid": 396,
     "province_thai": "ยะลา",
     "province_eng": "YALA",
     "prov_id": "YLA",
@@ -11870,14 +13743,17 @@ const PARTYLIST_RAW = [
     "invalid": 4584,
     "blank": 2663,
     "winner_party": "ประชาชาติ",
+    "winner_pid": 35,
     "winner_votes": 30535,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 21286,
     "margin": 9249,
     "percent_invalid": 5.0299006967685305,
     "ballot_surplus": -22
   },
   {
+    "cid": 397,
     "province_thai": "ยโสธร",
     "province_eng": "YASOTHON",
     "prov_id": "YST",
@@ -11889,14 +13765,17 @@ const PARTYLIST_RAW = [
     "invalid": 3785,
     "blank": 1782,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 32861,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 18240,
     "margin": 14621,
     "percent_invalid": 4.099603578623573,
     "ballot_surplus": 8102
   },
   {
+    "cid": 398,
     "province_thai": "ยโสธร",
     "province_eng": "YASOTHON",
     "prov_id": "YST",
@@ -11908,14 +13787,17 @@ const PARTYLIST_RAW = [
     "invalid": 3297,
     "blank": 1020,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 30311,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 19674,
     "margin": 10637,
     "percent_invalid": 4.041283110451933,
     "ballot_surplus": -87
   },
   {
+    "cid": 399,
     "province_thai": "ยโสธร",
     "province_eng": "YASOTHON",
     "prov_id": "YST",
@@ -11927,14 +13809,17 @@ const PARTYLIST_RAW = [
     "invalid": 3833,
     "blank": 1595,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 31532,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 20397,
     "margin": 11135,
     "percent_invalid": 4.07709572080457,
     "ballot_surplus": -816
   },
   {
+    "cid": 283,
     "province_thai": "ระนอง",
     "province_eng": "RANONG",
     "prov_id": "RNG",
@@ -11946,14 +13831,17 @@ const PARTYLIST_RAW = [
     "invalid": 3532,
     "blank": 2939,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 27631,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 26913,
     "margin": 718,
     "percent_invalid": 3.8634872019251802,
     "ballot_surplus": 68
   },
   {
+    "cid": 284,
     "province_thai": "ระยอง",
     "province_eng": "RAYONG",
     "prov_id": "RYG",
@@ -11965,14 +13853,17 @@ const PARTYLIST_RAW = [
     "invalid": 2223,
     "blank": 2557,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 36531,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 16485,
     "margin": 20046,
     "percent_invalid": 2.609982036560882,
     "ballot_surplus": 0
   },
   {
+    "cid": 285,
     "province_thai": "ระยอง",
     "province_eng": "RAYONG",
     "prov_id": "RYG",
@@ -11984,14 +13875,17 @@ const PARTYLIST_RAW = [
     "invalid": 2053,
     "blank": 2488,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 28490,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 16608,
     "margin": 11882,
     "percent_invalid": 2.854838485392071,
     "ballot_surplus": -26
   },
   {
+    "cid": 286,
     "province_thai": "ระยอง",
     "province_eng": "RAYONG",
     "prov_id": "RYG",
@@ -12003,14 +13897,17 @@ const PARTYLIST_RAW = [
     "invalid": 3503,
     "blank": 3788,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 25462,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 16754,
     "margin": 8708,
     "percent_invalid": 4.362282384000399,
     "ballot_surplus": -187
   },
   {
+    "cid": 287,
     "province_thai": "ระยอง",
     "province_eng": "RAYONG",
     "prov_id": "RYG",
@@ -12022,14 +13919,17 @@ const PARTYLIST_RAW = [
     "invalid": 2206,
     "blank": 1723,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 16511,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 11490,
     "margin": 5021,
     "percent_invalid": 4.190729483282675,
     "ballot_surplus": 5077
   },
   {
+    "cid": 288,
     "province_thai": "ระยอง",
     "province_eng": "RAYONG",
     "prov_id": "RYG",
@@ -12041,14 +13941,17 @@ const PARTYLIST_RAW = [
     "invalid": 2960,
     "blank": 2737,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 37449,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 15487,
     "margin": 21962,
     "percent_invalid": 3.467910115518898,
     "ballot_surplus": -115
   },
   {
+    "cid": 270,
     "province_thai": "ราชบุรี",
     "province_eng": "RATCHABURI",
     "prov_id": "RBR",
@@ -12060,14 +13963,17 @@ const PARTYLIST_RAW = [
     "invalid": 4666,
     "blank": 5097,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 33473,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 21553,
     "margin": 11920,
     "percent_invalid": 4.623051848329023,
     "ballot_surplus": -376
   },
   {
+    "cid": 271,
     "province_thai": "ราชบุรี",
     "province_eng": "RATCHABURI",
     "prov_id": "RBR",
@@ -12079,14 +13985,17 @@ const PARTYLIST_RAW = [
     "invalid": 6020,
     "blank": 4968,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 26270,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 11951,
     "margin": 14319,
     "percent_invalid": 6.406027199012493,
     "ballot_surplus": -201
   },
   {
+    "cid": 272,
     "province_thai": "ราชบุรี",
     "province_eng": "RATCHABURI",
     "prov_id": "RBR",
@@ -12098,14 +14007,17 @@ const PARTYLIST_RAW = [
     "invalid": 6174,
     "blank": 5524,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 30775,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 13052,
     "margin": 17723,
     "percent_invalid": 5.905082541079251,
     "ballot_surplus": -2631
   },
   {
+    "cid": 273,
     "province_thai": "ราชบุรี",
     "province_eng": "RATCHABURI",
     "prov_id": "RBR",
@@ -12117,14 +14029,17 @@ const PARTYLIST_RAW = [
     "invalid": 5523,
     "blank": 4054,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 35147,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 22903,
     "margin": 12244,
     "percent_invalid": 5.136814300861251,
     "ballot_surplus": 137
   },
   {
+    "cid": 274,
     "province_thai": "ราชบุรี",
     "province_eng": "RATCHABURI",
     "prov_id": "RBR",
@@ -12136,14 +14051,17 @@ const PARTYLIST_RAW = [
     "invalid": 5839,
     "blank": 3431,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 29618,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 23136,
     "margin": 6482,
     "percent_invalid": 5.540321279805676,
     "ballot_surplus": 572
   },
   {
+    "cid": 275,
     "province_thai": "ร้อยเอ็ด",
     "province_eng": "ROI ET",
     "prov_id": "RET",
@@ -12155,14 +14073,17 @@ const PARTYLIST_RAW = [
     "invalid": 3068,
     "blank": 1874,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 21811,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 19973,
     "margin": 1838,
     "percent_invalid": 3.717030736984941,
     "ballot_surplus": 271
   },
   {
+    "cid": 276,
     "province_thai": "ร้อยเอ็ด",
     "province_eng": "ROI ET",
     "prov_id": "RET",
@@ -12174,14 +14095,17 @@ const PARTYLIST_RAW = [
     "invalid": 3718,
     "blank": 1540,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 26596,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 21021,
     "margin": 5575,
     "percent_invalid": 4.288449560543496,
     "ballot_surplus": -384
   },
   {
+    "cid": 277,
     "province_thai": "ร้อยเอ็ด",
     "province_eng": "ROI ET",
     "prov_id": "RET",
@@ -12193,14 +14117,17 @@ const PARTYLIST_RAW = [
     "invalid": 3807,
     "blank": 1552,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 27925,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 19476,
     "margin": 8449,
     "percent_invalid": 4.66887417218543,
     "ballot_surplus": -6324
   },
   {
+    "cid": 278,
     "province_thai": "ร้อยเอ็ด",
     "province_eng": "ROI ET",
     "prov_id": "RET",
@@ -12212,14 +14139,17 @@ const PARTYLIST_RAW = [
     "invalid": 3182,
     "blank": 1295,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 27823,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 19024,
     "margin": 8799,
     "percent_invalid": 3.954219532502392,
     "ballot_surplus": -119
   },
   {
+    "cid": 279,
     "province_thai": "ร้อยเอ็ด",
     "province_eng": "ROI ET",
     "prov_id": "RET",
@@ -12231,14 +14161,17 @@ const PARTYLIST_RAW = [
     "invalid": 3067,
     "blank": 1977,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 31713,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 18192,
     "margin": 13521,
     "percent_invalid": 4.012402208325702,
     "ballot_surplus": -8233
   },
   {
+    "cid": 280,
     "province_thai": "ร้อยเอ็ด",
     "province_eng": "ROI ET",
     "prov_id": "RET",
@@ -12250,14 +14183,17 @@ const PARTYLIST_RAW = [
     "invalid": 2956,
     "blank": 952,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 29943,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 12605,
     "margin": 17338,
     "percent_invalid": 4.25538040739941,
     "ballot_surplus": 321
   },
   {
+    "cid": 281,
     "province_thai": "ร้อยเอ็ด",
     "province_eng": "ROI ET",
     "prov_id": "RET",
@@ -12269,14 +14205,17 @@ const PARTYLIST_RAW = [
     "invalid": 2922,
     "blank": 638,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 30750,
     "runnerup_party": "ไทยสร้างไทย",
+    "runnerup_pid": 49,
     "runnerup_votes": 12905,
     "margin": 17845,
     "percent_invalid": 3.9636462289744983,
     "ballot_surplus": -116
   },
   {
+    "cid": 282,
     "province_thai": "ร้อยเอ็ด",
     "province_eng": "ROI ET",
     "prov_id": "RET",
@@ -12288,14 +14227,17 @@ const PARTYLIST_RAW = [
     "invalid": 2867,
     "blank": 1104,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 28207,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 17692,
     "margin": 10515,
     "percent_invalid": 3.5371480741234236,
     "ballot_surplus": 0
   },
   {
+    "cid": 140,
     "province_thai": "ลพบุรี",
     "province_eng": "LOP BURI",
     "prov_id": "LRI",
@@ -12307,14 +14249,17 @@ const PARTYLIST_RAW = [
     "invalid": 6081,
     "blank": 4245,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 26305,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 19921,
     "margin": 6384,
     "percent_invalid": 6.262357884330203,
     "ballot_surplus": 128
   },
   {
+    "cid": 141,
     "province_thai": "ลพบุรี",
     "province_eng": "LOP BURI",
     "prov_id": "LRI",
@@ -12326,14 +14271,17 @@ const PARTYLIST_RAW = [
     "invalid": 6120,
     "blank": 4058,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 30862,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 28628,
     "margin": 2234,
     "percent_invalid": 5.521173520018765,
     "ballot_surplus": 139
   },
   {
+    "cid": 142,
     "province_thai": "ลพบุรี",
     "province_eng": "LOP BURI",
     "prov_id": "LRI",
@@ -12345,14 +14293,17 @@ const PARTYLIST_RAW = [
     "invalid": 5958,
     "blank": 2534,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 21629,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 21594,
     "margin": 35,
     "percent_invalid": 6.25,
     "ballot_surplus": 4489
   },
   {
+    "cid": 143,
     "province_thai": "ลพบุรี",
     "province_eng": "LOP BURI",
     "prov_id": "LRI",
@@ -12364,14 +14315,17 @@ const PARTYLIST_RAW = [
     "invalid": 6837,
     "blank": 3296,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 29661,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 22101,
     "margin": 7560,
     "percent_invalid": 6.200629404242584,
     "ballot_surplus": -555
   },
   {
+    "cid": 134,
     "province_thai": "ลำปาง",
     "province_eng": "LAMPANG",
     "prov_id": "LPG",
@@ -12383,14 +14337,17 @@ const PARTYLIST_RAW = [
     "invalid": 4002,
     "blank": 5062,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 42013,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 20897,
     "margin": 21116,
     "percent_invalid": 3.8398434126824212,
     "ballot_surplus": 885
   },
   {
+    "cid": 135,
     "province_thai": "ลำปาง",
     "province_eng": "LAMPANG",
     "prov_id": "LPG",
@@ -12402,14 +14359,17 @@ const PARTYLIST_RAW = [
     "invalid": 6526,
     "blank": 3522,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 33421,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 22525,
     "margin": 10896,
     "percent_invalid": 6.167600722042132,
     "ballot_surplus": -182
   },
   {
+    "cid": 136,
     "province_thai": "ลำปาง",
     "province_eng": "LAMPANG",
     "prov_id": "LPG",
@@ -12421,14 +14381,17 @@ const PARTYLIST_RAW = [
     "invalid": 5651,
     "blank": 4930,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 34539,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 18916,
     "margin": 15623,
     "percent_invalid": 5.709176508622868,
     "ballot_surplus": -98
   },
   {
+    "cid": 137,
     "province_thai": "ลำปาง",
     "province_eng": "LAMPANG",
     "prov_id": "LPG",
@@ -12440,14 +14403,17 @@ const PARTYLIST_RAW = [
     "invalid": 6391,
     "blank": 3351,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 35159,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 21527,
     "margin": 13632,
     "percent_invalid": 5.7776451869530625,
     "ballot_surplus": -507
   },
   {
+    "cid": 138,
     "province_thai": "ลำพูน",
     "province_eng": "LAMPHUN",
     "prov_id": "LPN",
@@ -12459,14 +14425,17 @@ const PARTYLIST_RAW = [
     "invalid": 4891,
     "blank": 5486,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 49525,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 24703,
     "margin": 24822,
     "percent_invalid": 4.283474772952191,
     "ballot_surplus": 1858
   },
   {
+    "cid": 139,
     "province_thai": "ลำพูน",
     "province_eng": "LAMPHUN",
     "prov_id": "LPN",
@@ -12478,14 +14447,17 @@ const PARTYLIST_RAW = [
     "invalid": 7808,
     "blank": 5172,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 44244,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 26872,
     "margin": 17372,
     "percent_invalid": 6.239561440661036,
     "ballot_surplus": 133
   },
   {
+    "cid": 345,
     "province_thai": "ศรีสะเกษ",
     "province_eng": "SI SA KET",
     "prov_id": "SSK",
@@ -12497,14 +14469,17 @@ const PARTYLIST_RAW = [
     "invalid": 3296,
     "blank": 1524,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 24457,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 21279,
     "margin": 3178,
     "percent_invalid": 4.010952236081533,
     "ballot_surplus": -73
   },
   {
+    "cid": 346,
     "province_thai": "ศรีสะเกษ",
     "province_eng": "SI SA KET",
     "prov_id": "SSK",
@@ -12516,14 +14491,17 @@ const PARTYLIST_RAW = [
     "invalid": 3758,
     "blank": 1334,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 22913,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 16047,
     "margin": 6866,
     "percent_invalid": 5.0638028377777475,
     "ballot_surplus": -686
   },
   {
+    "cid": 347,
     "province_thai": "ศรีสะเกษ",
     "province_eng": "SI SA KET",
     "prov_id": "SSK",
@@ -12535,14 +14513,17 @@ const PARTYLIST_RAW = [
     "invalid": 4593,
     "blank": 1840,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 19489,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 16854,
     "margin": 2635,
     "percent_invalid": 5.849465104431991,
     "ballot_surplus": 296
   },
   {
+    "cid": 348,
     "province_thai": "ศรีสะเกษ",
     "province_eng": "SI SA KET",
     "prov_id": "SSK",
@@ -12554,14 +14535,17 @@ const PARTYLIST_RAW = [
     "invalid": 4303,
     "blank": 1328,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 23975,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 9700,
     "margin": 14275,
     "percent_invalid": 6.017845155515776,
     "ballot_surplus": 500
   },
   {
+    "cid": 349,
     "province_thai": "ศรีสะเกษ",
     "province_eng": "SI SA KET",
     "prov_id": "SSK",
@@ -12573,14 +14557,17 @@ const PARTYLIST_RAW = [
     "invalid": 4824,
     "blank": 1565,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 22142,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 18605,
     "margin": 3537,
     "percent_invalid": 6.00052243354521,
     "ballot_surplus": 324
   },
   {
+    "cid": 350,
     "province_thai": "ศรีสะเกษ",
     "province_eng": "SI SA KET",
     "prov_id": "SSK",
@@ -12592,14 +14579,17 @@ const PARTYLIST_RAW = [
     "invalid": 3930,
     "blank": 764,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 17564,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 16342,
     "margin": 1222,
     "percent_invalid": 6.489003368337626,
     "ballot_surplus": 10408
   },
   {
+    "cid": 351,
     "province_thai": "ศรีสะเกษ",
     "province_eng": "SI SA KET",
     "prov_id": "SSK",
@@ -12611,14 +14601,17 @@ const PARTYLIST_RAW = [
     "invalid": 3957,
     "blank": 743,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 28269,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 15903,
     "margin": 12366,
     "percent_invalid": 5.521446711132197,
     "ballot_surplus": 34
   },
   {
+    "cid": 352,
     "province_thai": "ศรีสะเกษ",
     "province_eng": "SI SA KET",
     "prov_id": "SSK",
@@ -12630,14 +14623,17 @@ const PARTYLIST_RAW = [
     "invalid": 3793,
     "blank": 1409,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 27366,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 17048,
     "margin": 10318,
     "percent_invalid": 5.016664903184848,
     "ballot_surplus": 455
   },
   {
+    "cid": 353,
     "province_thai": "ศรีสะเกษ",
     "province_eng": "SI SA KET",
     "prov_id": "SSK",
@@ -12649,14 +14645,17 @@ const PARTYLIST_RAW = [
     "invalid": 3612,
     "blank": 1517,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 31194,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 16871,
     "margin": 14323,
     "percent_invalid": 4.1533950439832115,
     "ballot_surplus": 63
   },
   {
+    "cid": 313,
     "province_thai": "สกลนคร",
     "province_eng": "SAKON NAKHON",
     "prov_id": "SNK",
@@ -12668,14 +14667,17 @@ const PARTYLIST_RAW = [
     "invalid": 3489,
     "blank": 3126,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 26812,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 18666,
     "margin": 8146,
     "percent_invalid": 3.9123121776183005,
     "ballot_surplus": -295
   },
   {
+    "cid": 314,
     "province_thai": "สกลนคร",
     "province_eng": "SAKON NAKHON",
     "prov_id": "SNK",
@@ -12687,14 +14689,17 @@ const PARTYLIST_RAW = [
     "invalid": 3545,
     "blank": 1673,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 23679,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 20735,
     "margin": 2944,
     "percent_invalid": 4.25248611494308,
     "ballot_surplus": 123
   },
   {
+    "cid": 315,
     "province_thai": "สกลนคร",
     "province_eng": "SAKON NAKHON",
     "prov_id": "SNK",
@@ -12706,14 +14711,17 @@ const PARTYLIST_RAW = [
     "invalid": 3396,
     "blank": 2529,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 31526,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 15673,
     "margin": 15853,
     "percent_invalid": 4.389071264248972,
     "ballot_surplus": -206
   },
   {
+    "cid": 316,
     "province_thai": "สกลนคร",
     "province_eng": "SAKON NAKHON",
     "prov_id": "SNK",
@@ -12725,14 +14733,17 @@ const PARTYLIST_RAW = [
     "invalid": 3836,
     "blank": 2825,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 23378,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 18330,
     "margin": 5048,
     "percent_invalid": 4.90374044435354,
     "ballot_surplus": -3175
   },
   {
+    "cid": 317,
     "province_thai": "สกลนคร",
     "province_eng": "SAKON NAKHON",
     "prov_id": "SNK",
@@ -12744,14 +14755,17 @@ const PARTYLIST_RAW = [
     "invalid": 3404,
     "blank": 1399,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 22264,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 15918,
     "margin": 6346,
     "percent_invalid": 4.5792695231048635,
     "ballot_surplus": -365
   },
   {
+    "cid": 318,
     "province_thai": "สกลนคร",
     "province_eng": "SAKON NAKHON",
     "prov_id": "SNK",
@@ -12763,14 +14777,17 @@ const PARTYLIST_RAW = [
     "invalid": 3018,
     "blank": 1682,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 22779,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 18912,
     "margin": 3867,
     "percent_invalid": 3.9066949722984514,
     "ballot_surplus": -4589
   },
   {
+    "cid": 319,
     "province_thai": "สกลนคร",
     "province_eng": "SAKON NAKHON",
     "prov_id": "SNK",
@@ -12782,14 +14799,17 @@ const PARTYLIST_RAW = [
     "invalid": 3532,
     "blank": 2002,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 23454,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 18845,
     "margin": 4609,
     "percent_invalid": 4.649570849349692,
     "ballot_surplus": -448
   },
   {
+    "cid": 290,
     "province_thai": "สงขลา",
     "province_eng": "SONGKHLA",
     "prov_id": "SKA",
@@ -12801,14 +14821,17 @@ const PARTYLIST_RAW = [
     "invalid": 2870,
     "blank": 3420,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 37656,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 21708,
     "margin": 15948,
     "percent_invalid": 3.1286791959185454,
     "ballot_surplus": -81
   },
   {
+    "cid": 291,
     "province_thai": "สงขลา",
     "province_eng": "SONGKHLA",
     "prov_id": "SKA",
@@ -12820,14 +14843,17 @@ const PARTYLIST_RAW = [
     "invalid": 1740,
     "blank": 2039,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 28051,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 24805,
     "margin": 3246,
     "percent_invalid": 2.2032009724473256,
     "ballot_surplus": -543
   },
   {
+    "cid": 292,
     "province_thai": "สงขลา",
     "province_eng": "SONGKHLA",
     "prov_id": "SKA",
@@ -12839,14 +14865,17 @@ const PARTYLIST_RAW = [
     "invalid": 2604,
     "blank": 3238,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 45286,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 23987,
     "margin": 21299,
     "percent_invalid": 2.6026466237556467,
     "ballot_surplus": 507
   },
   {
+    "cid": 293,
     "province_thai": "สงขลา",
     "province_eng": "SONGKHLA",
     "prov_id": "SKA",
@@ -12858,14 +14887,17 @@ const PARTYLIST_RAW = [
     "invalid": 3757,
     "blank": 1614,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 55744,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 12566,
     "margin": 43178,
     "percent_invalid": 3.859627495094564,
     "ballot_surplus": -84
   },
   {
+    "cid": 294,
     "province_thai": "สงขลา",
     "province_eng": "SONGKHLA",
     "prov_id": "SKA",
@@ -12877,14 +14909,17 @@ const PARTYLIST_RAW = [
     "invalid": 3694,
     "blank": 2398,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 58101,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 13461,
     "margin": 44640,
     "percent_invalid": 3.85269239995411,
     "ballot_surplus": 125
   },
   {
+    "cid": 295,
     "province_thai": "สงขลา",
     "province_eng": "SONGKHLA",
     "prov_id": "SKA",
@@ -12896,14 +14931,17 @@ const PARTYLIST_RAW = [
     "invalid": 2920,
     "blank": 1727,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 39381,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 17959,
     "margin": 21422,
     "percent_invalid": 3.324831481144106,
     "ballot_surplus": -3617
   },
   {
+    "cid": 296,
     "province_thai": "สงขลา",
     "province_eng": "SONGKHLA",
     "prov_id": "SKA",
@@ -12915,14 +14953,17 @@ const PARTYLIST_RAW = [
     "invalid": 3807,
     "blank": 1610,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 39707,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 15540,
     "margin": 24167,
     "percent_invalid": 4.081041968162084,
     "ballot_surplus": 623
   },
   {
+    "cid": 297,
     "province_thai": "สงขลา",
     "province_eng": "SONGKHLA",
     "prov_id": "SKA",
@@ -12934,14 +14975,17 @@ const PARTYLIST_RAW = [
     "invalid": 3562,
     "blank": 1584,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 38710,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 15453,
     "margin": 23257,
     "percent_invalid": 3.9755351681957185,
     "ballot_surplus": -589
   },
   {
+    "cid": 298,
     "province_thai": "สงขลา",
     "province_eng": "SONGKHLA",
     "prov_id": "SKA",
@@ -12953,14 +14997,17 @@ const PARTYLIST_RAW = [
     "invalid": 2911,
     "blank": 2743,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 47669,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 23928,
     "margin": 23741,
     "percent_invalid": 2.818005808325266,
     "ballot_surplus": 260
   },
   {
+    "cid": 358,
     "province_thai": "สตูล",
     "province_eng": "SATUN",
     "prov_id": "STN",
@@ -12972,14 +15019,17 @@ const PARTYLIST_RAW = [
     "invalid": 3350,
     "blank": 2700,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 23498,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 17618,
     "margin": 5880,
     "percent_invalid": 4.241687558560612,
     "ballot_surplus": 4839
   },
   {
+    "cid": 359,
     "province_thai": "สตูล",
     "province_eng": "SATUN",
     "prov_id": "STN",
@@ -12991,14 +15041,17 @@ const PARTYLIST_RAW = [
     "invalid": 3261,
     "blank": 2755,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 38415,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 17202,
     "margin": 21213,
     "percent_invalid": 3.6664343055024626,
     "ballot_surplus": 277
   },
   {
+    "cid": 325,
     "province_thai": "สมุทรปราการ",
     "province_eng": "SAMUT PRAKAN",
     "prov_id": "SPK",
@@ -13010,14 +15063,17 @@ const PARTYLIST_RAW = [
     "invalid": 2840,
     "blank": 2877,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 41013,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 14417,
     "margin": 26596,
     "percent_invalid": 3.10009824254994,
     "ballot_surplus": 27
   },
   {
+    "cid": 326,
     "province_thai": "สมุทรปราการ",
     "province_eng": "SAMUT PRAKAN",
     "prov_id": "SPK",
@@ -13029,14 +15085,17 @@ const PARTYLIST_RAW = [
     "invalid": 2883,
     "blank": 3037,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 39579,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 15371,
     "margin": 24208,
     "percent_invalid": 3.2274676189729865,
     "ballot_surplus": -242
   },
   {
+    "cid": 327,
     "province_thai": "สมุทรปราการ",
     "province_eng": "SAMUT PRAKAN",
     "prov_id": "SPK",
@@ -13048,14 +15107,17 @@ const PARTYLIST_RAW = [
     "invalid": 2110,
     "blank": 3157,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 43100,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 14174,
     "margin": 28926,
     "percent_invalid": 2.297023666964227,
     "ballot_surplus": -3199
   },
   {
+    "cid": 328,
     "province_thai": "สมุทรปราการ",
     "province_eng": "SAMUT PRAKAN",
     "prov_id": "SPK",
@@ -13067,14 +15129,17 @@ const PARTYLIST_RAW = [
     "invalid": 1482,
     "blank": 2818,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 44594,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 14194,
     "margin": 30400,
     "percent_invalid": 1.6716673810544362,
     "ballot_surplus": 1839
   },
   {
+    "cid": 329,
     "province_thai": "สมุทรปราการ",
     "province_eng": "SAMUT PRAKAN",
     "prov_id": "SPK",
@@ -13086,14 +15151,17 @@ const PARTYLIST_RAW = [
     "invalid": 1967,
     "blank": 3628,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 49542,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 14489,
     "margin": 35053,
     "percent_invalid": 2.0018115020201304,
     "ballot_surplus": 386
   },
   {
+    "cid": 330,
     "province_thai": "สมุทรปราการ",
     "province_eng": "SAMUT PRAKAN",
     "prov_id": "SPK",
@@ -13105,14 +15173,17 @@ const PARTYLIST_RAW = [
     "invalid": 3198,
     "blank": 2988,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 33792,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 21000,
     "margin": 12792,
     "percent_invalid": 3.685138451965292,
     "ballot_surplus": 172
   },
   {
+    "cid": 331,
     "province_thai": "สมุทรปราการ",
     "province_eng": "SAMUT PRAKAN",
     "prov_id": "SPK",
@@ -13124,14 +15195,17 @@ const PARTYLIST_RAW = [
     "invalid": 3120,
     "blank": 3832,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 46042,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 15982,
     "margin": 30060,
     "percent_invalid": 3.1251565082385935,
     "ballot_surplus": -170
   },
   {
+    "cid": 332,
     "province_thai": "สมุทรปราการ",
     "province_eng": "SAMUT PRAKAN",
     "prov_id": "SPK",
@@ -13143,14 +15217,17 @@ const PARTYLIST_RAW = [
     "invalid": 3831,
     "blank": 3368,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 44832,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 14234,
     "margin": 30598,
     "percent_invalid": 3.6190332240664294,
     "ballot_surplus": -693
   },
   {
+    "cid": 299,
     "province_thai": "สมุทรสงคราม",
     "province_eng": "SAMUT SONGKHRAM",
     "prov_id": "SKM",
@@ -13162,14 +15239,17 @@ const PARTYLIST_RAW = [
     "invalid": 4762,
     "blank": 4988,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 35461,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 18567,
     "margin": 16894,
     "percent_invalid": 4.459260785286874,
     "ballot_surplus": 686
   },
   {
+    "cid": 300,
     "province_thai": "สมุทรสาคร",
     "province_eng": "SAMUT SAKHON",
     "prov_id": "SKN",
@@ -13181,14 +15261,17 @@ const PARTYLIST_RAW = [
     "invalid": 2379,
     "blank": 2654,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 34169,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 12006,
     "margin": 22163,
     "percent_invalid": 2.9210972225632967,
     "ballot_surplus": 7
   },
   {
+    "cid": 301,
     "province_thai": "สมุทรสาคร",
     "province_eng": "SAMUT SAKHON",
     "prov_id": "SKN",
@@ -13200,14 +15283,17 @@ const PARTYLIST_RAW = [
     "invalid": 2934,
     "blank": 2854,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 30649,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 14941,
     "margin": 15708,
     "percent_invalid": 3.7474135949114875,
     "ballot_surplus": -34
   },
   {
+    "cid": 302,
     "province_thai": "สมุทรสาคร",
     "province_eng": "SAMUT SAKHON",
     "prov_id": "SKN",
@@ -13219,14 +15305,17 @@ const PARTYLIST_RAW = [
     "invalid": 2325,
     "blank": 2458,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 32749,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 10593,
     "margin": 22156,
     "percent_invalid": 3.0825731862537125,
     "ballot_surplus": 678
   },
   {
+    "cid": 401,
     "province_thai": "สมุทรสาคร",
     "province_eng": "SAMUT SAKHON",
     "prov_id": "SKN",
@@ -13238,14 +15327,17 @@ const PARTYLIST_RAW = [
     "invalid": 3938,
     "blank": 3048,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 26410,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 15668,
     "margin": 10742,
     "percent_invalid": 5.017135722566919,
     "ballot_surplus": 1
   },
   {
+    "cid": 333,
     "province_thai": "สระบุรี",
     "province_eng": "SARABURI",
     "prov_id": "SRI",
@@ -13257,14 +15349,17 @@ const PARTYLIST_RAW = [
     "invalid": 4200,
     "blank": 4106,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 32507,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 17068,
     "margin": 15439,
     "percent_invalid": 4.5768086567066595,
     "ballot_surplus": 68
   },
   {
+    "cid": 334,
     "province_thai": "สระบุรี",
     "province_eng": "SARABURI",
     "prov_id": "SRI",
@@ -13276,14 +15371,17 @@ const PARTYLIST_RAW = [
     "invalid": 5896,
     "blank": 3637,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 30677,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 16367,
     "margin": 14310,
     "percent_invalid": 5.973899651454973,
     "ballot_surplus": -415
   },
   {
+    "cid": 335,
     "province_thai": "สระบุรี",
     "province_eng": "SARABURI",
     "prov_id": "SRI",
@@ -13295,14 +15393,17 @@ const PARTYLIST_RAW = [
     "invalid": 3527,
     "blank": 2924,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 22743,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 13180,
     "margin": 9563,
     "percent_invalid": 5.321765371557903,
     "ballot_surplus": -1177
   },
   {
+    "cid": 336,
     "province_thai": "สระบุรี",
     "province_eng": "SARABURI",
     "prov_id": "SRI",
@@ -13314,14 +15415,17 @@ const PARTYLIST_RAW = [
     "invalid": 5589,
     "blank": 5001,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 32443,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 12228,
     "margin": 20215,
     "percent_invalid": 5.893145225065637,
     "ballot_surplus": 136
   },
   {
+    "cid": 303,
     "province_thai": "สระแก้ว",
     "province_eng": "SA KAEO",
     "prov_id": "SKW",
@@ -13333,14 +15437,17 @@ const PARTYLIST_RAW = [
     "invalid": 5716,
     "blank": 3029,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 23285,
     "runnerup_party": "พลังประชารัฐ",
+    "runnerup_pid": 38,
     "runnerup_votes": 16809,
     "margin": 6476,
     "percent_invalid": 6.127393177968827,
     "ballot_surplus": -193
   },
   {
+    "cid": 304,
     "province_thai": "สระแก้ว",
     "province_eng": "SA KAEO",
     "prov_id": "SKW",
@@ -13352,14 +15459,17 @@ const PARTYLIST_RAW = [
     "invalid": 4621,
     "blank": 2806,
     "winner_party": "พลังประชารัฐ",
+    "winner_pid": 38,
     "winner_votes": 21638,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 18488,
     "margin": 3150,
     "percent_invalid": 5.2967607345086085,
     "ballot_surplus": -99
   },
   {
+    "cid": 305,
     "province_thai": "สระแก้ว",
     "province_eng": "SA KAEO",
     "prov_id": "SKW",
@@ -13371,14 +15481,17 @@ const PARTYLIST_RAW = [
     "invalid": 5825,
     "blank": 3122,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 18652,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 16607,
     "margin": 2045,
     "percent_invalid": 6.121205115541031,
     "ballot_surplus": 416
   },
   {
+    "cid": 289,
     "province_thai": "สิงห์บุรี",
     "province_eng": "SING BURI",
     "prov_id": "SBR",
@@ -13390,14 +15503,17 @@ const PARTYLIST_RAW = [
     "invalid": 6676,
     "blank": 5248,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 34678,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 24068,
     "margin": 10610,
     "percent_invalid": 5.538134819902775,
     "ballot_surplus": -83
   },
   {
+    "cid": 320,
     "province_thai": "สุพรรณบุรี",
     "province_eng": "SUPHAN BURI",
     "prov_id": "SPB",
@@ -13409,14 +15525,17 @@ const PARTYLIST_RAW = [
     "invalid": 4598,
     "blank": 3442,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 37488,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 27731,
     "margin": 9757,
     "percent_invalid": 4.896437889356264,
     "ballot_surplus": -334
   },
   {
+    "cid": 321,
     "province_thai": "สุพรรณบุรี",
     "province_eng": "SUPHAN BURI",
     "prov_id": "SPB",
@@ -13428,14 +15547,17 @@ const PARTYLIST_RAW = [
     "invalid": 3927,
     "blank": 2710,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 30409,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 23237,
     "margin": 7172,
     "percent_invalid": 4.802494802494802,
     "ballot_surplus": -35
   },
   {
+    "cid": 322,
     "province_thai": "สุพรรณบุรี",
     "province_eng": "SUPHAN BURI",
     "prov_id": "SPB",
@@ -13447,14 +15569,17 @@ const PARTYLIST_RAW = [
     "invalid": 6260,
     "blank": 2645,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 32689,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 27725,
     "margin": 4964,
     "percent_invalid": 6.163783342030897,
     "ballot_surplus": 806
   },
   {
+    "cid": 323,
     "province_thai": "สุพรรณบุรี",
     "province_eng": "SUPHAN BURI",
     "prov_id": "SPB",
@@ -13466,14 +15591,17 @@ const PARTYLIST_RAW = [
     "invalid": 5849,
     "blank": 2626,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 29771,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 24503,
     "margin": 5268,
     "percent_invalid": 6.515249404059081,
     "ballot_surplus": 1125
   },
   {
+    "cid": 324,
     "province_thai": "สุพรรณบุรี",
     "province_eng": "SUPHAN BURI",
     "prov_id": "SPB",
@@ -13485,14 +15613,17 @@ const PARTYLIST_RAW = [
     "invalid": 5644,
     "blank": 3827,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 32012,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 27840,
     "margin": 4172,
     "percent_invalid": 5.62017047717677,
     "ballot_surplus": 2946
   },
   {
+    "cid": 306,
     "province_thai": "สุราษฎร์ธานี",
     "province_eng": "SURAT THANI",
     "prov_id": "SNI",
@@ -13504,14 +15635,17 @@ const PARTYLIST_RAW = [
     "invalid": 1540,
     "blank": 2368,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 29290,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 23017,
     "margin": 6273,
     "percent_invalid": 1.9737516661540038,
     "ballot_surplus": 140
   },
   {
+    "cid": 307,
     "province_thai": "สุราษฎร์ธานี",
     "province_eng": "SURAT THANI",
     "prov_id": "SNI",
@@ -13523,14 +15657,17 @@ const PARTYLIST_RAW = [
     "invalid": 2596,
     "blank": 1613,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 38302,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 13662,
     "margin": 24640,
     "percent_invalid": 3.2811334824757643,
     "ballot_surplus": -16
   },
   {
+    "cid": 308,
     "province_thai": "สุราษฎร์ธานี",
     "province_eng": "SURAT THANI",
     "prov_id": "SNI",
@@ -13542,14 +15679,17 @@ const PARTYLIST_RAW = [
     "invalid": 2888,
     "blank": 1870,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 50396,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 14200,
     "margin": 36196,
     "percent_invalid": 3.2249419331784885,
     "ballot_surplus": 597
   },
   {
+    "cid": 309,
     "province_thai": "สุราษฎร์ธานี",
     "province_eng": "SURAT THANI",
     "prov_id": "SNI",
@@ -13561,14 +15701,17 @@ const PARTYLIST_RAW = [
     "invalid": 2676,
     "blank": 1410,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 54347,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 12236,
     "margin": 42111,
     "percent_invalid": 2.9522737803667174,
     "ballot_surplus": 262
   },
   {
+    "cid": 310,
     "province_thai": "สุราษฎร์ธานี",
     "province_eng": "SURAT THANI",
     "prov_id": "SNI",
@@ -13580,14 +15723,17 @@ const PARTYLIST_RAW = [
     "invalid": 2891,
     "blank": 1538,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 54015,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 10657,
     "margin": 43358,
     "percent_invalid": 3.37245112220615,
     "ballot_surplus": 312
   },
   {
+    "cid": 311,
     "province_thai": "สุราษฎร์ธานี",
     "province_eng": "SURAT THANI",
     "prov_id": "SNI",
@@ -13599,14 +15745,17 @@ const PARTYLIST_RAW = [
     "invalid": 3297,
     "blank": 1328,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 56783,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 12314,
     "margin": 44469,
     "percent_invalid": 3.433802699550075,
     "ballot_surplus": -23
   },
   {
+    "cid": 312,
     "province_thai": "สุราษฎร์ธานี",
     "province_eng": "SURAT THANI",
     "prov_id": "SNI",
@@ -13618,14 +15767,17 @@ const PARTYLIST_RAW = [
     "invalid": 2598,
     "blank": 1728,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 47534,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 15907,
     "margin": 31627,
     "percent_invalid": 2.854725460678849,
     "ballot_surplus": 629
   },
   {
+    "cid": 337,
     "province_thai": "สุรินทร์",
     "province_eng": "SURIN",
     "prov_id": "SRN",
@@ -13637,14 +15789,17 @@ const PARTYLIST_RAW = [
     "invalid": 3816,
     "blank": 2663,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 28433,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 24289,
     "margin": 4144,
     "percent_invalid": 4.306268690402302,
     "ballot_surplus": -14
   },
   {
+    "cid": 338,
     "province_thai": "สุรินทร์",
     "province_eng": "SURIN",
     "prov_id": "SRN",
@@ -13656,14 +15811,17 @@ const PARTYLIST_RAW = [
     "invalid": 4404,
     "blank": 1689,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 30479,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 19172,
     "margin": 11307,
     "percent_invalid": 5.0,
     "ballot_surplus": 1168
   },
   {
+    "cid": 339,
     "province_thai": "สุรินทร์",
     "province_eng": "SURIN",
     "prov_id": "SRN",
@@ -13675,14 +15833,17 @@ const PARTYLIST_RAW = [
     "invalid": 3539,
     "blank": 1562,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 22158,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 17060,
     "margin": 5098,
     "percent_invalid": 4.743904237208617,
     "ballot_surplus": 1
   },
   {
+    "cid": 340,
     "province_thai": "สุรินทร์",
     "province_eng": "SURIN",
     "prov_id": "SRN",
@@ -13694,14 +15855,17 @@ const PARTYLIST_RAW = [
     "invalid": 3275,
     "blank": 1336,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 19958,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 19503,
     "margin": 455,
     "percent_invalid": 4.583304177454342,
     "ballot_surplus": 738
   },
   {
+    "cid": 341,
     "province_thai": "สุรินทร์",
     "province_eng": "SURIN",
     "prov_id": "SRN",
@@ -13713,14 +15877,17 @@ const PARTYLIST_RAW = [
     "invalid": 4101,
     "blank": 830,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 18999,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 15302,
     "margin": 3697,
     "percent_invalid": 5.877210582131904,
     "ballot_surplus": 847
   },
   {
+    "cid": 342,
     "province_thai": "สุรินทร์",
     "province_eng": "SURIN",
     "prov_id": "SRN",
@@ -13732,14 +15899,17 @@ const PARTYLIST_RAW = [
     "invalid": 4132,
     "blank": 1306,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 24507,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 15162,
     "margin": 9345,
     "percent_invalid": 5.402649023940587,
     "ballot_surplus": 181
   },
   {
+    "cid": 343,
     "province_thai": "สุรินทร์",
     "province_eng": "SURIN",
     "prov_id": "SRN",
@@ -13751,14 +15921,17 @@ const PARTYLIST_RAW = [
     "invalid": 4255,
     "blank": 1702,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 26665,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 19473,
     "margin": 7192,
     "percent_invalid": 4.854535082715345,
     "ballot_surplus": -494
   },
   {
+    "cid": 344,
     "province_thai": "สุรินทร์",
     "province_eng": "SURIN",
     "prov_id": "SRN",
@@ -13770,14 +15943,17 @@ const PARTYLIST_RAW = [
     "invalid": 4308,
     "blank": 1508,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 24266,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 13367,
     "margin": 10899,
     "percent_invalid": 5.643027429200178,
     "ballot_surplus": 325
   },
   {
+    "cid": 354,
     "province_thai": "สุโขทัย",
     "province_eng": "SUKHOTHAI",
     "prov_id": "STI",
@@ -13789,14 +15965,17 @@ const PARTYLIST_RAW = [
     "invalid": 4681,
     "blank": 3201,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 20263,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 14738,
     "margin": 5525,
     "percent_invalid": 6.2084698330172285,
     "ballot_surplus": 354
   },
   {
+    "cid": 355,
     "province_thai": "สุโขทัย",
     "province_eng": "SUKHOTHAI",
     "prov_id": "STI",
@@ -13808,14 +15987,17 @@ const PARTYLIST_RAW = [
     "invalid": 4968,
     "blank": 2252,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 19100,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 14883,
     "margin": 4217,
     "percent_invalid": 6.687666585897746,
     "ballot_surplus": 155
   },
   {
+    "cid": 356,
     "province_thai": "สุโขทัย",
     "province_eng": "SUKHOTHAI",
     "prov_id": "STI",
@@ -13827,14 +16009,17 @@ const PARTYLIST_RAW = [
     "invalid": 5110,
     "blank": 3234,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 17752,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 17057,
     "margin": 695,
     "percent_invalid": 6.904192506721792,
     "ballot_surplus": -16
   },
   {
+    "cid": 357,
     "province_thai": "สุโขทัย",
     "province_eng": "SUKHOTHAI",
     "prov_id": "STI",
@@ -13846,14 +16031,17 @@ const PARTYLIST_RAW = [
     "invalid": 4898,
     "blank": 1712,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 21464,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 17033,
     "margin": 4431,
     "percent_invalid": 6.221657669101302,
     "ballot_surplus": -352
   },
   {
+    "cid": 169,
     "province_thai": "หนองคาย",
     "province_eng": "NONG KHAI",
     "prov_id": "NKI",
@@ -13865,14 +16053,17 @@ const PARTYLIST_RAW = [
     "invalid": 4449,
     "blank": 2029,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 21824,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 21311,
     "margin": 513,
     "percent_invalid": 5.267083392527348,
     "ballot_surplus": 414
   },
   {
+    "cid": 170,
     "province_thai": "หนองคาย",
     "province_eng": "NONG KHAI",
     "prov_id": "NKI",
@@ -13884,14 +16075,17 @@ const PARTYLIST_RAW = [
     "invalid": 4501,
     "blank": 1186,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 24343,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 19883,
     "margin": 4460,
     "percent_invalid": 5.4840753466384,
     "ballot_surplus": -594
   },
   {
+    "cid": 171,
     "province_thai": "หนองคาย",
     "province_eng": "NONG KHAI",
     "prov_id": "NKI",
@@ -13903,14 +16097,17 @@ const PARTYLIST_RAW = [
     "invalid": 4207,
     "blank": 1997,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 23048,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 18541,
     "margin": 4507,
     "percent_invalid": 5.3464994217596296,
     "ballot_surplus": -79
   },
   {
+    "cid": 166,
     "province_thai": "หนองบัวลำภู",
     "province_eng": "NONG BUA LAM PHU",
     "prov_id": "NBP",
@@ -13922,14 +16119,17 @@ const PARTYLIST_RAW = [
     "invalid": 4262,
     "blank": 2011,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 27338,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 22161,
     "margin": 5177,
     "percent_invalid": 4.613253090295066,
     "ballot_surplus": -4580
   },
   {
+    "cid": 167,
     "province_thai": "หนองบัวลำภู",
     "province_eng": "NONG BUA LAM PHU",
     "prov_id": "NBP",
@@ -13941,14 +16141,17 @@ const PARTYLIST_RAW = [
     "invalid": 3921,
     "blank": 1309,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 25944,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 19657,
     "margin": 6287,
     "percent_invalid": 4.943579398600518,
     "ballot_surplus": -51
   },
   {
+    "cid": 168,
     "province_thai": "หนองบัวลำภู",
     "province_eng": "NONG BUA LAM PHU",
     "prov_id": "NBP",
@@ -13960,14 +16163,17 @@ const PARTYLIST_RAW = [
     "invalid": 4063,
     "blank": 1488,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 19253,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 19070,
     "margin": 183,
     "percent_invalid": 5.14649068362319,
     "ballot_surplus": -59
   },
   {
+    "cid": 0,
     "province_thai": "อำนาจเจริญ",
     "province_eng": "AMNAT CHAROEN",
     "prov_id": "ACR",
@@ -13979,14 +16185,17 @@ const PARTYLIST_RAW = [
     "invalid": 3730,
     "blank": 2113,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 23132,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 19301,
     "margin": 3831,
     "percent_invalid": 4.373160751761575,
     "ballot_surplus": 95
   },
   {
+    "cid": 1,
     "province_thai": "อำนาจเจริญ",
     "province_eng": "AMNAT CHAROEN",
     "prov_id": "ACR",
@@ -13998,14 +16207,17 @@ const PARTYLIST_RAW = [
     "invalid": 4785,
     "blank": 2391,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 22123,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 21471,
     "margin": 652,
     "percent_invalid": 4.896994258696386,
     "ballot_surplus": 369
   },
   {
+    "cid": 379,
     "province_thai": "อุดรธานี",
     "province_eng": "UDON THANI",
     "prov_id": "UDN",
@@ -14017,14 +16229,17 @@ const PARTYLIST_RAW = [
     "invalid": 2150,
     "blank": 2966,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 31463,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 17009,
     "margin": 14454,
     "percent_invalid": 2.676159772962073,
     "ballot_surplus": 1255
   },
   {
+    "cid": 380,
     "province_thai": "อุดรธานี",
     "province_eng": "UDON THANI",
     "prov_id": "UDN",
@@ -14036,14 +16251,17 @@ const PARTYLIST_RAW = [
     "invalid": 3218,
     "blank": 2070,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 21849,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 20936,
     "margin": 913,
     "percent_invalid": 4.557105430857467,
     "ballot_surplus": -284
   },
   {
+    "cid": 381,
     "province_thai": "อุดรธานี",
     "province_eng": "UDON THANI",
     "prov_id": "UDN",
@@ -14055,14 +16273,17 @@ const PARTYLIST_RAW = [
     "invalid": 3757,
     "blank": 1030,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 26749,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 14576,
     "margin": 12173,
     "percent_invalid": 5.236018006215768,
     "ballot_surplus": -176
   },
   {
+    "cid": 382,
     "province_thai": "อุดรธานี",
     "province_eng": "UDON THANI",
     "prov_id": "UDN",
@@ -14074,14 +16295,17 @@ const PARTYLIST_RAW = [
     "invalid": 3657,
     "blank": 991,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 24612,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 15217,
     "margin": 9395,
     "percent_invalid": 5.413607295120796,
     "ballot_surplus": 204
   },
   {
+    "cid": 383,
     "province_thai": "อุดรธานี",
     "province_eng": "UDON THANI",
     "prov_id": "UDN",
@@ -14093,33 +16317,39 @@ const PARTYLIST_RAW = [
     "invalid": 3155,
     "blank": 1078,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 22633,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 15032,
     "margin": 7601,
     "percent_invalid": 4.798479087452471,
     "ballot_surplus": 217
   },
   {
+    "cid": 384,
     "province_thai": "อุดรธานี",
-    "province_eng": "",
-    "prov_id": "",
+    "province_eng": "UDON THANI",
+    "prov_id": "UDN",
     "cons_no": 6,
-    "region": "",
+    "region": "Northeast",
     "turn_out": 76567,
     "total_used": 76567,
     "valid": 72005,
     "invalid": 3346,
     "blank": 1216,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 19772,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 17122,
     "margin": 2650,
     "percent_invalid": 4.370028863609649,
     "ballot_surplus": 671
   },
   {
+    "cid": 385,
     "province_thai": "อุดรธานี",
     "province_eng": "UDON THANI",
     "prov_id": "UDN",
@@ -14131,14 +16361,17 @@ const PARTYLIST_RAW = [
     "invalid": 3227,
     "blank": 1593,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 20630,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 18527,
     "margin": 2103,
     "percent_invalid": 4.873518085026052,
     "ballot_surplus": 892
   },
   {
+    "cid": 386,
     "province_thai": "อุดรธานี",
     "province_eng": "UDON THANI",
     "prov_id": "UDN",
@@ -14150,14 +16383,17 @@ const PARTYLIST_RAW = [
     "invalid": 4154,
     "blank": 1656,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 19284,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 18589,
     "margin": 695,
     "percent_invalid": 5.703615218794194,
     "ballot_surplus": -314
   },
   {
+    "cid": 387,
     "province_thai": "อุดรธานี",
     "province_eng": "UDON THANI",
     "prov_id": "UDN",
@@ -14169,14 +16405,17 @@ const PARTYLIST_RAW = [
     "invalid": 4280,
     "blank": 1623,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 23220,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 17681,
     "margin": 5539,
     "percent_invalid": 5.837743466637569,
     "ballot_surplus": 154
   },
   {
+    "cid": 388,
     "province_thai": "อุดรธานี",
     "province_eng": "UDON THANI",
     "prov_id": "UDN",
@@ -14188,14 +16427,17 @@ const PARTYLIST_RAW = [
     "invalid": 4062,
     "blank": 1720,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 23025,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 15609,
     "margin": 7416,
     "percent_invalid": 5.669462782810167,
     "ballot_surplus": -112
   },
   {
+    "cid": 391,
     "province_thai": "อุตรดิตถ์",
     "province_eng": "UTTARADIT",
     "prov_id": "UTT",
@@ -14207,14 +16449,17 @@ const PARTYLIST_RAW = [
     "invalid": 3876,
     "blank": 2483,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 20448,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 17163,
     "margin": 3285,
     "percent_invalid": 5.038215566994229,
     "ballot_surplus": 327
   },
   {
+    "cid": 392,
     "province_thai": "อุตรดิตถ์",
     "province_eng": "UTTARADIT",
     "prov_id": "UTT",
@@ -14226,14 +16471,17 @@ const PARTYLIST_RAW = [
     "invalid": 4962,
     "blank": 2926,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 16165,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 14338,
     "margin": 1827,
     "percent_invalid": 6.763719636869224,
     "ballot_surplus": -228
   },
   {
+    "cid": 393,
     "province_thai": "อุตรดิตถ์",
     "province_eng": "UTTARADIT",
     "prov_id": "UTT",
@@ -14245,14 +16493,17 @@ const PARTYLIST_RAW = [
     "invalid": 3941,
     "blank": 3102,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 21021,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 20614,
     "margin": 407,
     "percent_invalid": 5.233036781303944,
     "ballot_surplus": 30
   },
   {
+    "cid": 389,
     "province_thai": "อุทัยธานี",
     "province_eng": "UTHAI THANI",
     "prov_id": "UTI",
@@ -14264,14 +16515,17 @@ const PARTYLIST_RAW = [
     "invalid": 3681,
     "blank": 2710,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 29050,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 18411,
     "margin": 10639,
     "percent_invalid": 4.779588391871713,
     "ballot_surplus": -429
   },
   {
+    "cid": 390,
     "province_thai": "อุทัยธานี",
     "province_eng": "UTHAI THANI",
     "prov_id": "UTI",
@@ -14283,14 +16537,17 @@ const PARTYLIST_RAW = [
     "invalid": 4040,
     "blank": 2100,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 29584,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 14712,
     "margin": 14872,
     "percent_invalid": 5.326863743044751,
     "ballot_surplus": 746
   },
   {
+    "cid": 368,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -14302,14 +16559,17 @@ const PARTYLIST_RAW = [
     "invalid": 2930,
     "blank": 3614,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 27151,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 19332,
     "margin": 7819,
     "percent_invalid": 3.3747206929119344,
     "ballot_surplus": -415
   },
   {
+    "cid": 369,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -14321,14 +16581,17 @@ const PARTYLIST_RAW = [
     "invalid": 3868,
     "blank": 2509,
     "winner_party": "ไทรวมพลัง",
+    "winner_pid": 72,
     "winner_votes": 15909,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 15504,
     "margin": 405,
     "percent_invalid": 4.5745372834249896,
     "ballot_surplus": 246
   },
   {
+    "cid": 370,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -14340,14 +16603,17 @@ const PARTYLIST_RAW = [
     "invalid": 4197,
     "blank": 2699,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 17496,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 17330,
     "margin": 166,
     "percent_invalid": 4.7549991502860705,
     "ballot_surplus": -314
   },
   {
+    "cid": 371,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -14359,14 +16625,17 @@ const PARTYLIST_RAW = [
     "invalid": 4797,
     "blank": 3996,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 31662,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 26003,
     "margin": 5659,
     "percent_invalid": 4.521717819168992,
     "ballot_surplus": -21
   },
   {
+    "cid": 372,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -14378,14 +16647,17 @@ const PARTYLIST_RAW = [
     "invalid": 3644,
     "blank": 1725,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 18130,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 14826,
     "margin": 3304,
     "percent_invalid": 4.8802046364622536,
     "ballot_surplus": -103
   },
   {
+    "cid": 373,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -14397,14 +16669,17 @@ const PARTYLIST_RAW = [
     "invalid": 4884,
     "blank": 1552,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 18746,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 15026,
     "margin": 3720,
     "percent_invalid": 6.092434354144577,
     "ballot_surplus": -83
   },
   {
+    "cid": 374,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -14416,14 +16691,17 @@ const PARTYLIST_RAW = [
     "invalid": 4012,
     "blank": 1290,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 26602,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 19541,
     "margin": 7061,
     "percent_invalid": 4.670384037810088,
     "ballot_surplus": 250
   },
   {
+    "cid": 375,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -14435,14 +16713,17 @@ const PARTYLIST_RAW = [
     "invalid": 4231,
     "blank": 1891,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 16959,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 13591,
     "margin": 3368,
     "percent_invalid": 5.2348960073246475,
     "ballot_surplus": -2163
   },
   {
+    "cid": 376,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -14454,14 +16735,17 @@ const PARTYLIST_RAW = [
     "invalid": 4456,
     "blank": 1214,
     "winner_party": "ไทรวมพลัง",
+    "winner_pid": 72,
     "winner_votes": 18274,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 12678,
     "margin": 5596,
     "percent_invalid": 5.981770099203952,
     "ballot_surplus": -65
   },
   {
+    "cid": 377,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -14473,14 +16757,17 @@ const PARTYLIST_RAW = [
     "invalid": 4213,
     "blank": 1409,
     "winner_party": "ไทรวมพลัง",
+    "winner_pid": 72,
     "winner_votes": 38510,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 10881,
     "margin": 27629,
     "percent_invalid": 4.958745777474371,
     "ballot_surplus": -849
   },
   {
+    "cid": 378,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -14492,14 +16779,17 @@ const PARTYLIST_RAW = [
     "invalid": 4442,
     "blank": 2267,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 17013,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 15753,
     "margin": 1260,
     "percent_invalid": 5.486863396617958,
     "ballot_surplus": -565
   },
   {
+    "cid": 2,
     "province_thai": "อ่างทอง",
     "province_eng": "ANG THONG",
     "prov_id": "ATG",
@@ -14511,14 +16801,17 @@ const PARTYLIST_RAW = [
     "invalid": 4107,
     "blank": 2835,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 27461,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 23974,
     "margin": 3487,
     "percent_invalid": 5.089913123226214,
     "ballot_surplus": -169
   },
   {
+    "cid": 3,
     "province_thai": "อ่างทอง",
     "province_eng": "ANG THONG",
     "prov_id": "ATG",
@@ -14530,14 +16823,17 @@ const PARTYLIST_RAW = [
     "invalid": 5059,
     "blank": 2504,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 27537,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 19205,
     "margin": 8332,
     "percent_invalid": 6.395863359376976,
     "ballot_surplus": 2869
   },
   {
+    "cid": 91,
     "province_thai": "เชียงราย",
     "province_eng": "CHIANG RAI",
     "prov_id": "CRI",
@@ -14549,14 +16845,17 @@ const PARTYLIST_RAW = [
     "invalid": 4000,
     "blank": 4200,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 36307,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 23446,
     "margin": 12861,
     "percent_invalid": 4.192169028255219,
     "ballot_surplus": 21
   },
   {
+    "cid": 92,
     "province_thai": "เชียงราย",
     "province_eng": "CHIANG RAI",
     "prov_id": "CRI",
@@ -14568,14 +16867,17 @@ const PARTYLIST_RAW = [
     "invalid": 4782,
     "blank": 3506,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 30143,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 27731,
     "margin": 2412,
     "percent_invalid": 5.023953605648008,
     "ballot_surplus": -768
   },
   {
+    "cid": 93,
     "province_thai": "เชียงราย",
     "province_eng": "CHIANG RAI",
     "prov_id": "CRI",
@@ -14587,14 +16889,17 @@ const PARTYLIST_RAW = [
     "invalid": 5866,
     "blank": 3030,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 28191,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 23040,
     "margin": 5151,
     "percent_invalid": 6.267830621120003,
     "ballot_surplus": 247
   },
   {
+    "cid": 94,
     "province_thai": "เชียงราย",
     "province_eng": "CHIANG RAI",
     "prov_id": "CRI",
@@ -14606,14 +16911,17 @@ const PARTYLIST_RAW = [
     "invalid": 4486,
     "blank": 2937,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 26247,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 25865,
     "margin": 382,
     "percent_invalid": 4.790227338252411,
     "ballot_surplus": 314
   },
   {
+    "cid": 95,
     "province_thai": "เชียงราย",
     "province_eng": "CHIANG RAI",
     "prov_id": "CRI",
@@ -14625,14 +16933,17 @@ const PARTYLIST_RAW = [
     "invalid": 3998,
     "blank": 2429,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 27994,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 22945,
     "margin": 5049,
     "percent_invalid": 4.587913979481765,
     "ballot_surplus": 143
   },
   {
+    "cid": 96,
     "province_thai": "เชียงราย",
     "province_eng": "CHIANG RAI",
     "prov_id": "CRI",
@@ -14644,14 +16955,17 @@ const PARTYLIST_RAW = [
     "invalid": 4286,
     "blank": 2723,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 30086,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 17847,
     "margin": 12239,
     "percent_invalid": 5.326142336990966,
     "ballot_surplus": 18
   },
   {
+    "cid": 97,
     "province_thai": "เชียงราย",
     "province_eng": "CHIANG RAI",
     "prov_id": "CRI",
@@ -14663,14 +16977,17 @@ const PARTYLIST_RAW = [
     "invalid": 5320,
     "blank": 3436,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 29209,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 27518,
     "margin": 1691,
     "percent_invalid": 5.708215753387911,
     "ballot_surplus": -129
   },
   {
+    "cid": 69,
     "province_thai": "เชียงใหม่",
     "province_eng": "CHIANG MAI",
     "prov_id": "CMI",
@@ -14682,14 +16999,17 @@ const PARTYLIST_RAW = [
     "invalid": 2485,
     "blank": 3648,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 41768,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 18310,
     "margin": 23458,
     "percent_invalid": 2.743310076834761,
     "ballot_surplus": -656
   },
   {
+    "cid": 70,
     "province_thai": "เชียงใหม่",
     "province_eng": "CHIANG MAI",
     "prov_id": "CMI",
@@ -14701,14 +17021,17 @@ const PARTYLIST_RAW = [
     "invalid": 3673,
     "blank": 4986,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 43862,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 23906,
     "margin": 19956,
     "percent_invalid": 3.638542997810732,
     "ballot_surplus": -987
   },
   {
+    "cid": 71,
     "province_thai": "เชียงใหม่",
     "province_eng": "CHIANG MAI",
     "prov_id": "CMI",
@@ -14720,14 +17043,17 @@ const PARTYLIST_RAW = [
     "invalid": 4066,
     "blank": 4506,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 40468,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 26756,
     "margin": 13712,
     "percent_invalid": 4.10342321976425,
     "ballot_surplus": -734
   },
   {
+    "cid": 72,
     "province_thai": "เชียงใหม่",
     "province_eng": "CHIANG MAI",
     "prov_id": "CMI",
@@ -14739,14 +17065,17 @@ const PARTYLIST_RAW = [
     "invalid": 3483,
     "blank": 4095,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 44690,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 21864,
     "margin": 22826,
     "percent_invalid": 3.4050249291230816,
     "ballot_surplus": 102
   },
   {
+    "cid": 73,
     "province_thai": "เชียงใหม่",
     "province_eng": "CHIANG MAI",
     "prov_id": "CMI",
@@ -14758,14 +17087,17 @@ const PARTYLIST_RAW = [
     "invalid": 4580,
     "blank": 3822,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 32624,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 23861,
     "margin": 8763,
     "percent_invalid": 4.982105755528724,
     "ballot_surplus": 9
   },
   {
+    "cid": 74,
     "province_thai": "เชียงใหม่",
     "province_eng": "CHIANG MAI",
     "prov_id": "CMI",
@@ -14777,14 +17109,17 @@ const PARTYLIST_RAW = [
     "invalid": 5111,
     "blank": 2496,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 24304,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 18689,
     "margin": 5615,
     "percent_invalid": 6.4113500087809525,
     "ballot_surplus": 481
   },
   {
+    "cid": 75,
     "province_thai": "เชียงใหม่",
     "province_eng": "CHIANG MAI",
     "prov_id": "CMI",
@@ -14796,14 +17131,17 @@ const PARTYLIST_RAW = [
     "invalid": 5719,
     "blank": 2865,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 30315,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 21181,
     "margin": 9134,
     "percent_invalid": 6.11978470000321,
     "ballot_surplus": -471
   },
   {
+    "cid": 76,
     "province_thai": "เชียงใหม่",
     "province_eng": "CHIANG MAI",
     "prov_id": "CMI",
@@ -14815,14 +17153,17 @@ const PARTYLIST_RAW = [
     "invalid": 4498,
     "blank": 4469,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 48543,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 29101,
     "margin": 19442,
     "percent_invalid": 4.098106743927549,
     "ballot_surplus": -333
   },
   {
+    "cid": 77,
     "province_thai": "เชียงใหม่",
     "province_eng": "CHIANG MAI",
     "prov_id": "CMI",
@@ -14834,14 +17175,17 @@ const PARTYLIST_RAW = [
     "invalid": 5297,
     "blank": 2809,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 32646,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 21176,
     "margin": 11470,
     "percent_invalid": 5.507439253891182,
     "ballot_surplus": 219
   },
   {
+    "cid": 78,
     "province_thai": "เชียงใหม่",
     "province_eng": "CHIANG MAI",
     "prov_id": "CMI",
@@ -14853,14 +17197,17 @@ const PARTYLIST_RAW = [
     "invalid": 6246,
     "blank": 1262,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 26621,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 20206,
     "margin": 6415,
     "percent_invalid": 7.088303051624544,
     "ballot_surplus": 271
   },
   {
+    "cid": 221,
     "province_thai": "เพชรบุรี",
     "province_eng": "PHETCHABURI",
     "prov_id": "PBI",
@@ -14872,14 +17219,17 @@ const PARTYLIST_RAW = [
     "invalid": 4527,
     "blank": 3978,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 27432,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 23294,
     "margin": 4138,
     "percent_invalid": 4.9291173972692235,
     "ballot_surplus": -178
   },
   {
+    "cid": 222,
     "province_thai": "เพชรบุรี",
     "province_eng": "PHETCHABURI",
     "prov_id": "PBI",
@@ -14891,14 +17241,17 @@ const PARTYLIST_RAW = [
     "invalid": 5333,
     "blank": 3725,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 31659,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 22595,
     "margin": 9064,
     "percent_invalid": 5.473167828077053,
     "ballot_surplus": 404
   },
   {
+    "cid": 223,
     "province_thai": "เพชรบุรี",
     "province_eng": "PHETCHABURI",
     "prov_id": "PBI",
@@ -14910,14 +17263,17 @@ const PARTYLIST_RAW = [
     "invalid": 5482,
     "blank": 3976,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 24542,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 21836,
     "margin": 2706,
     "percent_invalid": 5.708038317367763,
     "ballot_surplus": 286
   },
   {
+    "cid": 243,
     "province_thai": "เพชรบูรณ์",
     "province_eng": "PHETCHABUN",
     "prov_id": "PNB",
@@ -14929,14 +17285,17 @@ const PARTYLIST_RAW = [
     "invalid": 4491,
     "blank": 3416,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 23739,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 21527,
     "margin": 2212,
     "percent_invalid": 5.29249552182521,
     "ballot_surplus": 157
   },
   {
+    "cid": 244,
     "province_thai": "เพชรบูรณ์",
     "province_eng": "PHETCHABUN",
     "prov_id": "PNB",
@@ -14948,14 +17307,17 @@ const PARTYLIST_RAW = [
     "invalid": 5614,
     "blank": 2448,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 24706,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 19092,
     "margin": 5614,
     "percent_invalid": 6.288293737468777,
     "ballot_surplus": 142
   },
   {
+    "cid": 245,
     "province_thai": "เพชรบูรณ์",
     "province_eng": "PHETCHABUN",
     "prov_id": "PNB",
@@ -14967,14 +17329,17 @@ const PARTYLIST_RAW = [
     "invalid": 5501,
     "blank": 2736,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 18578,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 17205,
     "margin": 1373,
     "percent_invalid": 6.713203080189888,
     "ballot_surplus": 5823
   },
   {
+    "cid": 246,
     "province_thai": "เพชรบูรณ์",
     "province_eng": "PHETCHABUN",
     "prov_id": "PNB",
@@ -14986,14 +17351,17 @@ const PARTYLIST_RAW = [
     "invalid": 4987,
     "blank": 1929,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 24234,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 12962,
     "margin": 11272,
     "percent_invalid": 7.320152068930086,
     "ballot_surplus": 34
   },
   {
+    "cid": 247,
     "province_thai": "เพชรบูรณ์",
     "province_eng": "PHETCHABUN",
     "prov_id": "PNB",
@@ -15005,14 +17373,17 @@ const PARTYLIST_RAW = [
     "invalid": 4569,
     "blank": 2297,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 20735,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 18921,
     "margin": 1814,
     "percent_invalid": 5.937853327615112,
     "ballot_surplus": -631
   },
   {
+    "cid": 248,
     "province_thai": "เพชรบูรณ์",
     "province_eng": "PHETCHABUN",
     "prov_id": "PNB",
@@ -15024,14 +17395,17 @@ const PARTYLIST_RAW = [
     "invalid": 5904,
     "blank": 2381,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 26886,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 20638,
     "margin": 6248,
     "percent_invalid": 6.771030448993636,
     "ballot_surplus": -331
   },
   {
+    "cid": 130,
     "province_thai": "เลย",
     "province_eng": "LOEI",
     "prov_id": "LEI",
@@ -15043,14 +17417,17 @@ const PARTYLIST_RAW = [
     "invalid": 4129,
     "blank": 2972,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 27278,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 23183,
     "margin": 4095,
     "percent_invalid": 4.636408551922385,
     "ballot_surplus": -24
   },
   {
+    "cid": 131,
     "province_thai": "เลย",
     "province_eng": "LOEI",
     "prov_id": "LEI",
@@ -15062,14 +17439,17 @@ const PARTYLIST_RAW = [
     "invalid": 4856,
     "blank": 2534,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 18791,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 17021,
     "margin": 1770,
     "percent_invalid": 6.509557896994557,
     "ballot_surplus": 331
   },
   {
+    "cid": 132,
     "province_thai": "เลย",
     "province_eng": "LOEI",
     "prov_id": "LEI",
@@ -15081,14 +17461,17 @@ const PARTYLIST_RAW = [
     "invalid": 5004,
     "blank": 2729,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 23032,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 17553,
     "margin": 5479,
     "percent_invalid": 6.124847001223991,
     "ballot_surplus": 284
   },
   {
+    "cid": 133,
     "province_thai": "เลย",
     "province_eng": "LOEI",
     "prov_id": "LEI",
@@ -15100,14 +17483,17 @@ const PARTYLIST_RAW = [
     "invalid": 5072,
     "blank": 2812,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 22080,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 17221,
     "margin": 4859,
     "percent_invalid": 6.554834707539611,
     "ballot_surplus": -48
   },
   {
+    "cid": 249,
     "province_thai": "แพร่",
     "province_eng": "PHRAE",
     "prov_id": "PRE",
@@ -15119,14 +17505,17 @@ const PARTYLIST_RAW = [
     "invalid": 3017,
     "blank": 2244,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 29426,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 21251,
     "margin": 8175,
     "percent_invalid": 3.491776905894471,
     "ballot_surplus": -836
   },
   {
+    "cid": 250,
     "province_thai": "แพร่",
     "province_eng": "PHRAE",
     "prov_id": "PRE",
@@ -15138,14 +17527,17 @@ const PARTYLIST_RAW = [
     "invalid": 3894,
     "blank": 1491,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 26891,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 16517,
     "margin": 10374,
     "percent_invalid": 5.108225108225108,
     "ballot_surplus": 179
   },
   {
+    "cid": 251,
     "province_thai": "แพร่",
     "province_eng": "PHRAE",
     "prov_id": "PRE",
@@ -15157,14 +17549,17 @@ const PARTYLIST_RAW = [
     "invalid": 4298,
     "blank": 2629,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 20473,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 18547,
     "margin": 1926,
     "percent_invalid": 5.988240867166383,
     "ballot_surplus": 11036
   },
   {
+    "cid": 153,
     "province_thai": "แม่ฮ่องสอน",
     "province_eng": "MAE HONG SON",
     "prov_id": "MSN",
@@ -15176,14 +17571,17 @@ const PARTYLIST_RAW = [
     "invalid": 2860,
     "blank": 2159,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 25406,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 5432,
     "margin": 19974,
     "percent_invalid": 4.432047109871378,
     "ballot_surplus": -40
   },
   {
+    "cid": 154,
     "province_thai": "แม่ฮ่องสอน",
     "province_eng": "MAE HONG SON",
     "prov_id": "MSN",
@@ -15195,8 +17593,10 @@ const PARTYLIST_RAW = [
     "invalid": 4421,
     "blank": 1379,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 23545,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 7396,
     "margin": 16149,
     "percent_invalid": 6.275550760844878,
@@ -1,5 +1,6 @@
 const CONST_RAW = [
   {
+    "cid": 9,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -11,14 +12,17 @@ const CONST_RAW = [
     "invalid": 1146,
     "blank": 4200,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 34167,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 14813,
     "margin": 19354,
     "percent_invalid": 1.3904223438201428,
     "ballot_surplus": 0
   },
   {
+    "cid": 18,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -30,14 +34,17 @@ const CONST_RAW = [
     "invalid": 1521,
     "blank": 6223,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 41804,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 19047,
     "margin": 22757,
     "percent_invalid": 1.5262349860019868,
     "ballot_surplus": 1
   },
   {
+    "cid": 19,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -49,14 +56,17 @@ const CONST_RAW = [
     "invalid": 1207,
     "blank": 4167,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 38779,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 24850,
     "margin": 13929,
     "percent_invalid": 1.202586507517411,
     "ballot_surplus": 0
   },
   {
+    "cid": 20,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -68,14 +78,17 @@ const CONST_RAW = [
     "invalid": 1601,
     "blank": 5989,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 49925,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 16106,
     "margin": 33819,
     "percent_invalid": 1.4419656125877023,
     "ballot_surplus": 0
   },
   {
+    "cid": 21,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -87,14 +100,17 @@ const CONST_RAW = [
     "invalid": 1315,
     "blank": 5242,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 44511,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 15227,
     "margin": 29284,
     "percent_invalid": 1.3547622727038582,
     "ballot_surplus": 0
   },
   {
+    "cid": 22,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -106,14 +122,17 @@ const CONST_RAW = [
     "invalid": 1431,
     "blank": 4325,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 41528,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 25491,
     "margin": 16037,
     "percent_invalid": 1.4422059401550045,
     "ballot_surplus": 0
   },
   {
+    "cid": 24,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -125,14 +144,17 @@ const CONST_RAW = [
     "invalid": 1438,
     "blank": 4901,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 46021,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 15424,
     "margin": 30597,
     "percent_invalid": 1.4300347066837713,
     "ballot_surplus": 1
   },
   {
+    "cid": 25,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -144,14 +166,17 @@ const CONST_RAW = [
     "invalid": 1965,
     "blank": 5390,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 28587,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 16132,
     "margin": 12455,
     "percent_invalid": 2.484982611444831,
     "ballot_surplus": 0
   },
   {
+    "cid": 26,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -163,14 +188,17 @@ const CONST_RAW = [
     "invalid": 1421,
     "blank": 5430,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 34738,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 20414,
     "margin": 14324,
     "percent_invalid": 1.6323014186433866,
     "ballot_surplus": -2
   },
   {
+    "cid": 27,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -182,14 +210,17 @@ const CONST_RAW = [
     "invalid": 1634,
     "blank": 5095,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 42820,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 17802,
     "margin": 25018,
     "percent_invalid": 1.6518398706025073,
     "ballot_surplus": 0
   },
   {
+    "cid": 10,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -201,14 +232,17 @@ const CONST_RAW = [
     "invalid": 1384,
     "blank": 4923,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 39499,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 15949,
     "margin": 23550,
     "percent_invalid": 1.534691342965813,
     "ballot_surplus": 0
   },
   {
+    "cid": 28,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -220,14 +254,17 @@ const CONST_RAW = [
     "invalid": 1769,
     "blank": 3782,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 34941,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 27474,
     "margin": 7467,
     "percent_invalid": 2.022037811764168,
     "ballot_surplus": 0
   },
   {
+    "cid": 29,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -239,14 +276,17 @@ const CONST_RAW = [
     "invalid": 1450,
     "blank": 4063,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 45951,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 21155,
     "margin": 24796,
     "percent_invalid": 1.4970059880239521,
     "ballot_surplus": 0
   },
   {
+    "cid": 30,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -258,14 +298,17 @@ const CONST_RAW = [
     "invalid": 1511,
     "blank": 5232,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 42264,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 17486,
     "margin": 24778,
     "percent_invalid": 1.6370353517296672,
     "ballot_surplus": 0
   },
   {
+    "cid": 31,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -277,14 +320,17 @@ const CONST_RAW = [
     "invalid": 1073,
     "blank": 5171,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 46782,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 17592,
     "margin": 29190,
     "percent_invalid": 1.0679060879604287,
     "ballot_surplus": 0
   },
   {
+    "cid": 32,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -296,14 +342,17 @@ const CONST_RAW = [
     "invalid": 1902,
     "blank": 5661,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 46415,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 15300,
     "margin": 31115,
     "percent_invalid": 1.9624635004488282,
     "ballot_surplus": 0
   },
   {
+    "cid": 33,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -315,14 +364,17 @@ const CONST_RAW = [
     "invalid": 1443,
     "blank": 4132,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 37035,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 21904,
     "margin": 15131,
     "percent_invalid": 1.608928830265256,
     "ballot_surplus": 0
   },
   {
+    "cid": 34,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -334,14 +386,17 @@ const CONST_RAW = [
     "invalid": 1820,
     "blank": 5264,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 44271,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 16727,
     "margin": 27544,
     "percent_invalid": 1.873951050751125,
     "ballot_surplus": 0
   },
   {
+    "cid": 35,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -353,14 +408,17 @@ const CONST_RAW = [
     "invalid": 1564,
     "blank": 4331,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 43046,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 26986,
     "margin": 16060,
     "percent_invalid": 1.6244962399767335,
     "ballot_surplus": 0
   },
   {
+    "cid": 36,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -372,14 +430,17 @@ const CONST_RAW = [
     "invalid": 2003,
     "blank": 5946,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 47692,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 13153,
     "margin": 34539,
     "percent_invalid": 2.0128832567908432,
     "ballot_surplus": 0
   },
   {
+    "cid": 37,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -391,14 +452,17 @@ const CONST_RAW = [
     "invalid": 1896,
     "blank": 5822,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 46402,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 16836,
     "margin": 29566,
     "percent_invalid": 1.8236731239058925,
     "ballot_surplus": 0
   },
   {
+    "cid": 11,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -410,14 +474,17 @@ const CONST_RAW = [
     "invalid": 1425,
     "blank": 4161,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 34653,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 19167,
     "margin": 15486,
     "percent_invalid": 1.7301878316193346,
     "ballot_surplus": 0
   },
   {
+    "cid": 38,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -429,14 +496,17 @@ const CONST_RAW = [
     "invalid": 1464,
     "blank": 5355,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 45992,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 14293,
     "margin": 31699,
     "percent_invalid": 1.4735485948949192,
     "ballot_surplus": 0
   },
   {
+    "cid": 39,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -448,14 +518,17 @@ const CONST_RAW = [
     "invalid": 1993,
     "blank": 6963,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 44722,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 15126,
     "margin": 29596,
     "percent_invalid": 1.8531432768928935,
     "ballot_surplus": 0
   },
   {
+    "cid": 40,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -467,14 +540,17 @@ const CONST_RAW = [
     "invalid": 2233,
     "blank": 6053,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 39327,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 13302,
     "margin": 26025,
     "percent_invalid": 2.3776313127548794,
     "ballot_surplus": 0
   },
   {
+    "cid": 41,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -486,14 +562,17 @@ const CONST_RAW = [
     "invalid": 2142,
     "blank": 6070,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 44860,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 16359,
     "margin": 28501,
     "percent_invalid": 2.087149705733328,
     "ballot_surplus": 0
   },
   {
+    "cid": 12,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -505,14 +584,17 @@ const CONST_RAW = [
     "invalid": 1472,
     "blank": 3493,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 34405,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 23594,
     "margin": 10811,
     "percent_invalid": 1.774605777113372,
     "ballot_surplus": -1
   },
   {
+    "cid": 13,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -524,14 +606,17 @@ const CONST_RAW = [
     "invalid": 1289,
     "blank": 4480,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 45269,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 22252,
     "margin": 23017,
     "percent_invalid": 1.3349074678182704,
     "ballot_surplus": 2
   },
   {
+    "cid": 14,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -543,14 +628,17 @@ const CONST_RAW = [
     "invalid": 1412,
     "blank": 5068,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 43239,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 12848,
     "margin": 30391,
     "percent_invalid": 1.3998076751494484,
     "ballot_surplus": -1
   },
   {
+    "cid": 15,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -562,14 +650,17 @@ const CONST_RAW = [
     "invalid": 1649,
     "blank": 5667,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 40962,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 12037,
     "margin": 28925,
     "percent_invalid": 1.7827605219628746,
     "ballot_surplus": 0
   },
   {
+    "cid": 16,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -581,14 +672,17 @@ const CONST_RAW = [
     "invalid": 1622,
     "blank": 6256,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 45092,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 15868,
     "margin": 29224,
     "percent_invalid": 1.550180153488861,
     "ballot_surplus": 0
   },
   {
+    "cid": 17,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -600,14 +694,17 @@ const CONST_RAW = [
     "invalid": 1599,
     "blank": 6010,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 49366,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 17059,
     "margin": 32307,
     "percent_invalid": 1.5566588785046729,
     "ballot_surplus": 0
   },
   {
+    "cid": 325,
     "province_thai": "สมุทรปราการ",
     "province_eng": "SAMUT PRAKAN",
     "prov_id": "SPK",
@@ -619,14 +716,17 @@ const CONST_RAW = [
     "invalid": 4260,
     "blank": 4960,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 43463,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 24150,
     "margin": 19313,
     "percent_invalid": 4.3872748432012685,
     "ballot_surplus": -1
   },
   {
+    "cid": 326,
     "province_thai": "สมุทรปราการ",
     "province_eng": "SAMUT PRAKAN",
     "prov_id": "SPK",
@@ -638,14 +738,17 @@ const CONST_RAW = [
     "invalid": 2529,
     "blank": 4655,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 40979,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 29448,
     "margin": 11531,
     "percent_invalid": 2.625650183245258,
     "ballot_surplus": 0
   },
   {
+    "cid": 327,
     "province_thai": "สมุทรปราการ",
     "province_eng": "SAMUT PRAKAN",
     "prov_id": "SPK",
@@ -657,14 +760,17 @@ const CONST_RAW = [
     "invalid": 2383,
     "blank": 5565,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 45335,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 13276,
     "margin": 32059,
     "percent_invalid": 2.4710688954332407,
     "ballot_surplus": 0
   },
   {
+    "cid": 328,
     "province_thai": "สมุทรปราการ",
     "province_eng": "SAMUT PRAKAN",
     "prov_id": "SPK",
@@ -676,14 +782,17 @@ const CONST_RAW = [
     "invalid": 1776,
     "blank": 6067,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 48876,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 15476,
     "margin": 33400,
     "percent_invalid": 1.7678150164737265,
     "ballot_surplus": 0
   },
   {
+    "cid": 329,
     "province_thai": "สมุทรปราการ",
     "province_eng": "SAMUT PRAKAN",
     "prov_id": "SPK",
@@ -695,14 +804,17 @@ const CONST_RAW = [
     "invalid": 2869,
     "blank": 8126,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 57198,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 15146,
     "margin": 42052,
     "percent_invalid": 2.5791082344480403,
     "ballot_surplus": 0
   },
   {
+    "cid": 330,
     "province_thai": "สมุทรปราการ",
     "province_eng": "SAMUT PRAKAN",
     "prov_id": "SPK",
@@ -714,14 +826,17 @@ const CONST_RAW = [
     "invalid": 2714,
     "blank": 4419,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 35571,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 33018,
     "margin": 2553,
     "percent_invalid": 2.961362619616572,
     "ballot_surplus": 0
   },
   {
+    "cid": 331,
     "province_thai": "สมุทรปราการ",
     "province_eng": "SAMUT PRAKAN",
     "prov_id": "SPK",
@@ -733,14 +848,17 @@ const CONST_RAW = [
     "invalid": 2752,
     "blank": 5134,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 46394,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 28922,
     "margin": 17472,
     "percent_invalid": 2.6066283376114114,
     "ballot_surplus": 0
   },
   {
+    "cid": 332,
     "province_thai": "สมุทรปราการ",
     "province_eng": "SAMUT PRAKAN",
     "prov_id": "SPK",
@@ -752,14 +870,17 @@ const CONST_RAW = [
     "invalid": 3435,
     "blank": 5383,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 40230,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 27991,
     "margin": 12239,
     "percent_invalid": 3.0708302416434976,
     "ballot_surplus": 1
   },
   {
+    "cid": 158,
     "province_thai": "นนทบุรี",
     "province_eng": "NONTHABURI",
     "prov_id": "NBI",
@@ -771,14 +892,17 @@ const CONST_RAW = [
     "invalid": 1731,
     "blank": 5897,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 42123,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 19861,
     "margin": 22262,
     "percent_invalid": 1.7052339155362473,
     "ballot_surplus": -1
   },
   {
+    "cid": 159,
     "province_thai": "นนทบุรี",
     "province_eng": "NONTHABURI",
     "prov_id": "NBI",
@@ -790,14 +914,17 @@ const CONST_RAW = [
     "invalid": 1807,
     "blank": 5674,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 38013,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 20126,
     "margin": 17887,
     "percent_invalid": 2.039411313258995,
     "ballot_surplus": 0
   },
   {
+    "cid": 160,
     "province_thai": "นนทบุรี",
     "province_eng": "NONTHABURI",
     "prov_id": "NBI",
@@ -809,14 +936,17 @@ const CONST_RAW = [
     "invalid": 2416,
     "blank": 7843,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 47505,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 17748,
     "margin": 29757,
     "percent_invalid": 2.262595991758756,
     "ballot_surplus": 0
   },
   {
+    "cid": 161,
     "province_thai": "นนทบุรี",
     "province_eng": "NONTHABURI",
     "prov_id": "NBI",
@@ -828,14 +958,17 @@ const CONST_RAW = [
     "invalid": 2198,
     "blank": 5279,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 33461,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 27997,
     "margin": 5464,
     "percent_invalid": 2.3716012084592144,
     "ballot_surplus": 0
   },
   {
+    "cid": 162,
     "province_thai": "นนทบุรี",
     "province_eng": "NONTHABURI",
     "prov_id": "NBI",
@@ -847,14 +980,17 @@ const CONST_RAW = [
     "invalid": 2233,
     "blank": 6291,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 41888,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 31985,
     "margin": 9903,
     "percent_invalid": 2.134166738347144,
     "ballot_surplus": 0
   },
   {
+    "cid": 163,
     "province_thai": "นนทบุรี",
     "province_eng": "NONTHABURI",
     "prov_id": "NBI",
@@ -866,14 +1002,17 @@ const CONST_RAW = [
     "invalid": 3607,
     "blank": 7390,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 44405,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 25218,
     "margin": 19187,
     "percent_invalid": 3.2784054243203693,
     "ballot_surplus": 2
   },
   {
+    "cid": 164,
     "province_thai": "นนทบุรี",
     "province_eng": "NONTHABURI",
     "prov_id": "NBI",
@@ -885,14 +1024,17 @@ const CONST_RAW = [
     "invalid": 2687,
     "blank": 6633,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 41267,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 18873,
     "margin": 22394,
     "percent_invalid": 2.6008343577284565,
     "ballot_surplus": 0
   },
   {
+    "cid": 165,
     "province_thai": "นนทบุรี",
     "province_eng": "NONTHABURI",
     "prov_id": "NBI",
@@ -904,14 +1046,17 @@ const CONST_RAW = [
     "invalid": 2063,
     "blank": 5586,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 36631,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 26846,
     "margin": 9785,
     "percent_invalid": 2.13762447025666,
     "ballot_surplus": 0
   },
   {
+    "cid": 255,
     "province_thai": "ปทุมธานี",
     "province_eng": "PATHUM THANI",
     "prov_id": "PTE",
@@ -923,14 +1068,17 @@ const CONST_RAW = [
     "invalid": 2882,
     "blank": 4553,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 32835,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 24558,
     "margin": 8277,
     "percent_invalid": 2.8079816048949686,
     "ballot_surplus": 0
   },
   {
+    "cid": 256,
     "province_thai": "ปทุมธานี",
     "province_eng": "PATHUM THANI",
     "prov_id": "PTE",
@@ -942,14 +1090,17 @@ const CONST_RAW = [
     "invalid": 2027,
     "blank": 3753,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 36340,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 31579,
     "margin": 4761,
     "percent_invalid": 1.9715597401081586,
     "ballot_surplus": 0
   },
   {
+    "cid": 257,
     "province_thai": "ปทุมธานี",
     "province_eng": "PATHUM THANI",
     "prov_id": "PTE",
@@ -961,14 +1112,17 @@ const CONST_RAW = [
     "invalid": 2942,
     "blank": 6704,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 42004,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 22852,
     "margin": 19152,
     "percent_invalid": 3.1364939924732673,
     "ballot_surplus": 0
   },
   {
+    "cid": 258,
     "province_thai": "ปทุมธานี",
     "province_eng": "PATHUM THANI",
     "prov_id": "PTE",
@@ -980,14 +1134,17 @@ const CONST_RAW = [
     "invalid": 2539,
     "blank": 5519,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 41039,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 17512,
     "margin": 23527,
     "percent_invalid": 2.567395393047101,
     "ballot_surplus": -2
   },
   {
+    "cid": 259,
     "province_thai": "ปทุมธานี",
     "province_eng": "PATHUM THANI",
     "prov_id": "PTE",
@@ -999,14 +1156,17 @@ const CONST_RAW = [
     "invalid": 1715,
     "blank": 5405,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 35383,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 12941,
     "margin": 22442,
     "percent_invalid": 1.913229732594072,
     "ballot_surplus": 0
   },
   {
+    "cid": 260,
     "province_thai": "ปทุมธานี",
     "province_eng": "PATHUM THANI",
     "prov_id": "PTE",
@@ -1018,14 +1178,17 @@ const CONST_RAW = [
     "invalid": 1781,
     "blank": 5271,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 42684,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 10079,
     "margin": 32605,
     "percent_invalid": 1.9478530962224117,
     "ballot_surplus": 1
   },
   {
+    "cid": 261,
     "province_thai": "ปทุมธานี",
     "province_eng": "PATHUM THANI",
     "prov_id": "PTE",
@@ -1037,14 +1200,17 @@ const CONST_RAW = [
     "invalid": 2194,
     "blank": 3870,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 46202,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 27814,
     "margin": 18388,
     "percent_invalid": 2.3811849488273156,
     "ballot_surplus": 0
   },
   {
+    "cid": 400,
     "province_thai": "ปทุมธานี",
     "province_eng": "PATHUM THANI",
     "prov_id": "PTE",
@@ -1056,14 +1222,17 @@ const CONST_RAW = [
     "invalid": 3525,
     "blank": 3830,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 42730,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 26551,
     "margin": 16179,
     "percent_invalid": 3.8025479768287287,
     "ballot_surplus": 0
   },
   {
+    "cid": 4,
     "province_thai": "พระนครศรีอยุธยา",
     "province_eng": "PHRA NAKHON SI AYUTTHAYA",
     "prov_id": "AYA",
@@ -1075,14 +1244,17 @@ const CONST_RAW = [
     "invalid": 3580,
     "blank": 5196,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 46696,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 37335,
     "margin": 9361,
     "percent_invalid": 3.3670033670033668,
     "ballot_surplus": -100
   },
   {
+    "cid": 5,
     "province_thai": "พระนครศรีอยุธยา",
     "province_eng": "PHRA NAKHON SI AYUTTHAYA",
     "prov_id": "AYA",
@@ -1094,14 +1266,17 @@ const CONST_RAW = [
     "invalid": 3577,
     "blank": 4683,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 53474,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 25836,
     "margin": 27638,
     "percent_invalid": 3.484385045490853,
     "ballot_surplus": 0
   },
   {
+    "cid": 6,
     "province_thai": "พระนครศรีอยุธยา",
     "province_eng": "PHRA NAKHON SI AYUTTHAYA",
     "prov_id": "AYA",
@@ -1113,14 +1288,17 @@ const CONST_RAW = [
     "invalid": 3677,
     "blank": 3858,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 58072,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 31983,
     "margin": 26089,
     "percent_invalid": 3.4088591400441284,
     "ballot_surplus": 0
   },
   {
+    "cid": 7,
     "province_thai": "พระนครศรีอยุธยา",
     "province_eng": "PHRA NAKHON SI AYUTTHAYA",
     "prov_id": "AYA",
@@ -1132,14 +1310,17 @@ const CONST_RAW = [
     "invalid": 3109,
     "blank": 4324,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 51469,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 31956,
     "margin": 19513,
     "percent_invalid": 2.7189407587497594,
     "ballot_surplus": 0
   },
   {
+    "cid": 8,
     "province_thai": "พระนครศรีอยุธยา",
     "province_eng": "PHRA NAKHON SI AYUTTHAYA",
     "prov_id": "AYA",
@@ -1151,14 +1332,17 @@ const CONST_RAW = [
     "invalid": 4482,
     "blank": 3051,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 46623,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 27374,
     "margin": 19249,
     "percent_invalid": 4.231615321430931,
     "ballot_surplus": -1
   },
   {
+    "cid": 2,
     "province_thai": "อ่างทอง",
     "province_eng": "ANG THONG",
     "prov_id": "ATG",
@@ -1170,14 +1354,17 @@ const CONST_RAW = [
     "invalid": 2733,
     "blank": 3108,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 56130,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 17910,
     "margin": 38220,
     "percent_invalid": 3.1921603438609605,
     "ballot_surplus": 0
   },
   {
+    "cid": 3,
     "province_thai": "อ่างทอง",
     "province_eng": "ANG THONG",
     "prov_id": "ATG",
@@ -1189,14 +1376,17 @@ const CONST_RAW = [
     "invalid": 3301,
     "blank": 3239,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 60611,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 13876,
     "margin": 46735,
     "percent_invalid": 3.8215749380629327,
     "ballot_surplus": 0
   },
   {
+    "cid": 140,
     "province_thai": "ลพบุรี",
     "province_eng": "LOP BURI",
     "prov_id": "LRI",
@@ -1208,14 +1398,17 @@ const CONST_RAW = [
     "invalid": 3831,
     "blank": 6323,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 38126,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 25593,
     "margin": 12533,
     "percent_invalid": 3.4744202497664674,
     "ballot_surplus": 0
   },
   {
+    "cid": 141,
     "province_thai": "ลพบุรี",
     "province_eng": "LOP BURI",
     "prov_id": "LRI",
@@ -1227,14 +1420,17 @@ const CONST_RAW = [
     "invalid": 4127,
     "blank": 4679,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 58141,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 24499,
     "margin": 33642,
     "percent_invalid": 3.4724150406811893,
     "ballot_surplus": 0
   },
   {
+    "cid": 142,
     "province_thai": "ลพบุรี",
     "province_eng": "LOP BURI",
     "prov_id": "LRI",
@@ -1246,14 +1442,17 @@ const CONST_RAW = [
     "invalid": 3885,
     "blank": 2819,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 49264,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 27504,
     "margin": 21760,
     "percent_invalid": 3.6675162843387143,
     "ballot_surplus": -1
   },
   {
+    "cid": 143,
     "province_thai": "ลพบุรี",
     "province_eng": "LOP BURI",
     "prov_id": "LRI",
@@ -1265,14 +1464,17 @@ const CONST_RAW = [
     "invalid": 4834,
     "blank": 3084,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 50031,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 33738,
     "margin": 16293,
     "percent_invalid": 4.160247859202204,
     "ballot_surplus": 5932
   },
   {
+    "cid": 289,
     "province_thai": "สิงห์บุรี",
     "province_eng": "SING BURI",
     "prov_id": "SBR",
@@ -1284,14 +1486,17 @@ const CONST_RAW = [
     "invalid": 5450,
     "blank": 7151,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 65555,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 31864,
     "margin": 33691,
     "percent_invalid": 4.280922794146525,
     "ballot_surplus": 0
   },
   {
+    "cid": 79,
     "province_thai": "ชัยนาท",
     "province_eng": "CHAI NAT",
     "prov_id": "CNT",
@@ -1303,14 +1508,17 @@ const CONST_RAW = [
     "invalid": 5718,
     "blank": 7981,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 36058,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 28737,
     "margin": 7321,
     "percent_invalid": 6.05277921857964,
     "ballot_surplus": 1
   },
   {
+    "cid": 80,
     "province_thai": "ชัยนาท",
     "province_eng": "CHAI NAT",
     "prov_id": "CNT",
@@ -1322,14 +1530,17 @@ const CONST_RAW = [
     "invalid": 4951,
     "blank": 5644,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 54585,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 16933,
     "margin": 37652,
     "percent_invalid": 5.207248708968332,
     "ballot_surplus": 0
   },
   {
+    "cid": 333,
     "province_thai": "สระบุรี",
     "province_eng": "SARABURI",
     "prov_id": "SRI",
@@ -1341,14 +1552,17 @@ const CONST_RAW = [
     "invalid": 3702,
     "blank": 6689,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 31958,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 31087,
     "margin": 871,
     "percent_invalid": 3.760513591483483,
     "ballot_surplus": 1
   },
   {
+    "cid": 334,
     "province_thai": "สระบุรี",
     "province_eng": "SARABURI",
     "prov_id": "SRI",
@@ -1360,14 +1574,17 @@ const CONST_RAW = [
     "invalid": 4613,
     "blank": 4056,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 37225,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 27805,
     "margin": 9420,
     "percent_invalid": 4.2786254231785925,
     "ballot_surplus": 0
   },
   {
+    "cid": 335,
     "province_thai": "สระบุรี",
     "province_eng": "SARABURI",
     "prov_id": "SRI",
@@ -1379,14 +1596,17 @@ const CONST_RAW = [
     "invalid": 3593,
     "blank": 4253,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 53967,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 28831,
     "margin": 25136,
     "percent_invalid": 3.6184376164435985,
     "ballot_surplus": 0
   },
   {
+    "cid": 336,
     "province_thai": "สระบุรี",
     "province_eng": "SARABURI",
     "prov_id": "SRI",
@@ -1398,14 +1618,17 @@ const CONST_RAW = [
     "invalid": 4340,
     "blank": 5790,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 48159,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 28119,
     "margin": 20040,
     "percent_invalid": 4.331467009990319,
     "ballot_surplus": 0
   },
   {
+    "cid": 55,
     "province_thai": "ชลบุรี",
     "province_eng": "CHON BURI",
     "prov_id": "CBI",
@@ -1417,14 +1640,17 @@ const CONST_RAW = [
     "invalid": 2237,
     "blank": 4522,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 46253,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 42057,
     "margin": 4196,
     "percent_invalid": 2.143829183677381,
     "ballot_surplus": -2
   },
   {
+    "cid": 64,
     "province_thai": "ชลบุรี",
     "province_eng": "CHON BURI",
     "prov_id": "CBI",
@@ -1436,14 +1662,17 @@ const CONST_RAW = [
     "invalid": 1990,
     "blank": 4652,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 27129,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 23571,
     "margin": 3558,
     "percent_invalid": 2.23347063378938,
     "ballot_surplus": 1
   },
   {
+    "cid": 56,
     "province_thai": "ชลบุรี",
     "province_eng": "CHON BURI",
     "prov_id": "CBI",
@@ -1455,14 +1684,17 @@ const CONST_RAW = [
     "invalid": 1889,
     "blank": 3337,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 30061,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 28820,
     "margin": 1241,
     "percent_invalid": 2.247445003628749,
     "ballot_surplus": 0
   },
   {
+    "cid": 57,
     "province_thai": "ชลบุรี",
     "province_eng": "CHON BURI",
     "prov_id": "CBI",
@@ -1474,14 +1706,17 @@ const CONST_RAW = [
     "invalid": 3292,
     "blank": 4936,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 42501,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 37164,
     "margin": 5337,
     "percent_invalid": 3.341148291365994,
     "ballot_surplus": 0
   },
   {
+    "cid": 58,
     "province_thai": "ชลบุรี",
     "province_eng": "CHON BURI",
     "prov_id": "CBI",
@@ -1493,14 +1728,17 @@ const CONST_RAW = [
     "invalid": 3932,
     "blank": 4107,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 45751,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 24213,
     "margin": 21538,
     "percent_invalid": 4.427479196928239,
     "ballot_surplus": 0
   },
   {
+    "cid": 59,
     "province_thai": "ชลบุรี",
     "province_eng": "CHON BURI",
     "prov_id": "CBI",
@@ -1512,14 +1750,17 @@ const CONST_RAW = [
     "invalid": 3638,
     "blank": 4827,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 52767,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 24799,
     "margin": 27968,
     "percent_invalid": 3.498783408188192,
     "ballot_surplus": 0
   },
   {
+    "cid": 60,
     "province_thai": "ชลบุรี",
     "province_eng": "CHON BURI",
     "prov_id": "CBI",
@@ -1531,14 +1772,17 @@ const CONST_RAW = [
     "invalid": 2214,
     "blank": 4908,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 41248,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 34860,
     "margin": 6388,
     "percent_invalid": 2.2932311357398105,
     "ballot_surplus": 0
   },
   {
+    "cid": 61,
     "province_thai": "ชลบุรี",
     "province_eng": "CHON BURI",
     "prov_id": "CBI",
@@ -1550,14 +1794,17 @@ const CONST_RAW = [
     "invalid": 2097,
     "blank": 3916,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 39986,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 31986,
     "margin": 8000,
     "percent_invalid": 2.362364392172767,
     "ballot_surplus": 1
   },
   {
+    "cid": 62,
     "province_thai": "ชลบุรี",
     "province_eng": "CHON BURI",
     "prov_id": "CBI",
@@ -1569,14 +1816,17 @@ const CONST_RAW = [
     "invalid": 3052,
     "blank": 4262,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 37623,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 34702,
     "margin": 2921,
     "percent_invalid": 3.2362047758408616,
     "ballot_surplus": 1
   },
   {
+    "cid": 63,
     "province_thai": "ชลบุรี",
     "province_eng": "CHON BURI",
     "prov_id": "CBI",
@@ -1588,14 +1838,17 @@ const CONST_RAW = [
     "invalid": 3133,
     "blank": 3638,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 27602,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 23698,
     "margin": 3904,
     "percent_invalid": 4.528765539173171,
     "ballot_surplus": 1
   },
   {
+    "cid": 284,
     "province_thai": "ระยอง",
     "province_eng": "RAYONG",
     "prov_id": "RYG",
@@ -1607,14 +1860,17 @@ const CONST_RAW = [
     "invalid": 2387,
     "blank": 3943,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 36934,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 27277,
     "margin": 9657,
     "percent_invalid": 2.6109974732282515,
     "ballot_surplus": 0
   },
   {
+    "cid": 285,
     "province_thai": "ระยอง",
     "province_eng": "RAYONG",
     "prov_id": "RYG",
@@ -1626,14 +1882,17 @@ const CONST_RAW = [
     "invalid": 3662,
     "blank": 5528,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 33687,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 26878,
     "margin": 6809,
     "percent_invalid": 4.710513114058219,
     "ballot_surplus": 0
   },
   {
+    "cid": 286,
     "province_thai": "ระยอง",
     "province_eng": "RAYONG",
     "prov_id": "RYG",
@@ -1645,14 +1904,17 @@ const CONST_RAW = [
     "invalid": 3562,
     "blank": 5298,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 26873,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 24801,
     "margin": 2072,
     "percent_invalid": 4.174724283018646,
     "ballot_surplus": 0
   },
   {
+    "cid": 287,
     "province_thai": "ระยอง",
     "province_eng": "RAYONG",
     "prov_id": "RYG",
@@ -1664,14 +1926,17 @@ const CONST_RAW = [
     "invalid": 3425,
     "blank": 3773,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 46134,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 32496,
     "margin": 13638,
     "percent_invalid": 3.615767915206283,
     "ballot_surplus": 0
   },
   {
+    "cid": 288,
     "province_thai": "ระยอง",
     "province_eng": "RAYONG",
     "prov_id": "RYG",
@@ -1683,14 +1948,17 @@ const CONST_RAW = [
     "invalid": 3458,
     "blank": 4800,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 37569,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 29469,
     "margin": 8100,
     "percent_invalid": 3.8616592403988967,
     "ballot_surplus": -1
   },
   {
+    "cid": 98,
     "province_thai": "จันทบุรี",
     "province_eng": "CHANTHABURI",
     "prov_id": "CTI",
@@ -1702,14 +1970,17 @@ const CONST_RAW = [
     "invalid": 3234,
     "blank": 6431,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 32984,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 29390,
     "margin": 3594,
     "percent_invalid": 2.9258759985886313,
     "ballot_surplus": 0
   },
   {
+    "cid": 99,
     "province_thai": "จันทบุรี",
     "province_eng": "CHANTHABURI",
     "prov_id": "CTI",
@@ -1721,14 +1992,17 @@ const CONST_RAW = [
     "invalid": 5014,
     "blank": 6059,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 39979,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 29466,
     "margin": 10513,
     "percent_invalid": 4.873639191290825,
     "ballot_surplus": 0
   },
   {
+    "cid": 100,
     "province_thai": "จันทบุรี",
     "province_eng": "CHANTHABURI",
     "prov_id": "CTI",
@@ -1740,14 +2014,17 @@ const CONST_RAW = [
     "invalid": 4249,
     "blank": 5576,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 31798,
     "runnerup_party": "พลังประชารัฐ",
+    "runnerup_pid": 38,
     "runnerup_votes": 26664,
     "margin": 5134,
     "percent_invalid": 4.206889040702568,
     "ballot_surplus": 0
   },
   {
+    "cid": 367,
     "province_thai": "ตราด",
     "province_eng": "TRAT",
     "prov_id": "TRT",
@@ -1759,14 +2036,17 @@ const CONST_RAW = [
     "invalid": 4562,
     "blank": 5077,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 66399,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 27911,
     "margin": 38488,
     "percent_invalid": 3.6433334664377273,
     "ballot_surplus": 0
   },
   {
+    "cid": 65,
     "province_thai": "ฉะเชิงเทรา",
     "province_eng": "CHACHOENGSAO",
     "prov_id": "CCO",
@@ -1778,14 +2058,17 @@ const CONST_RAW = [
     "invalid": 4999,
     "blank": 9013,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 38717,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 34889,
     "margin": 3828,
     "percent_invalid": 4.543884525887144,
     "ballot_surplus": 0
   },
   {
+    "cid": 66,
     "province_thai": "ฉะเชิงเทรา",
     "province_eng": "CHACHOENGSAO",
     "prov_id": "CCO",
@@ -1797,14 +2080,17 @@ const CONST_RAW = [
     "invalid": 4435,
     "blank": 4255,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 50833,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 32111,
     "margin": 18722,
     "percent_invalid": 3.7420476214583434,
     "ballot_surplus": 1
   },
   {
+    "cid": 67,
     "province_thai": "ฉะเชิงเทรา",
     "province_eng": "CHACHOENGSAO",
     "prov_id": "CCO",
@@ -1816,14 +2102,17 @@ const CONST_RAW = [
     "invalid": 5457,
     "blank": 5390,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 52758,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 21616,
     "margin": 31142,
     "percent_invalid": 5.217017208413002,
     "ballot_surplus": 0
   },
   {
+    "cid": 68,
     "province_thai": "ฉะเชิงเทรา",
     "province_eng": "CHACHOENGSAO",
     "prov_id": "CCO",
@@ -1835,14 +2124,17 @@ const CONST_RAW = [
     "invalid": 4490,
     "blank": 5685,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 47969,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 35257,
     "margin": 12712,
     "percent_invalid": 3.67181047242871,
     "ballot_surplus": -1
   },
   {
+    "cid": 252,
     "province_thai": "ปราจีนบุรี",
     "province_eng": "PRACHIN BURI",
     "prov_id": "PRI",
@@ -1854,14 +2146,17 @@ const CONST_RAW = [
     "invalid": 3687,
     "blank": 8201,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 42309,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 28549,
     "margin": 13760,
     "percent_invalid": 3.888789275506007,
     "ballot_surplus": 0
   },
   {
+    "cid": 254,
     "province_thai": "ปราจีนบุรี",
     "province_eng": "PRACHIN BURI",
     "prov_id": "PRI",
@@ -1873,14 +2168,17 @@ const CONST_RAW = [
     "invalid": 4694,
     "blank": 4807,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 45193,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 24795,
     "margin": 20398,
     "percent_invalid": 5.00165158925508,
     "ballot_surplus": -1
   },
   {
+    "cid": 219,
     "province_thai": "นครนายก",
     "province_eng": "NAKHON NAYOK",
     "prov_id": "NYK",
@@ -1892,14 +2190,17 @@ const CONST_RAW = [
     "invalid": 2694,
     "blank": 3355,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 33707,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 29822,
     "margin": 3885,
     "percent_invalid": 3.2524447663889893,
     "ballot_surplus": 0
   },
   {
+    "cid": 220,
     "province_thai": "นครนายก",
     "province_eng": "NAKHON NAYOK",
     "prov_id": "NYK",
@@ -1911,14 +2212,17 @@ const CONST_RAW = [
     "invalid": 3277,
     "blank": 3625,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 34897,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 29375,
     "margin": 5522,
     "percent_invalid": 3.736644659574225,
     "ballot_surplus": 0
   },
   {
+    "cid": 303,
     "province_thai": "สระแก้ว",
     "province_eng": "SA KAEO",
     "prov_id": "SKW",
@@ -1930,14 +2234,17 @@ const CONST_RAW = [
     "invalid": 3764,
     "blank": 4207,
     "winner_party": "พลังประชารัฐ",
+    "winner_pid": 38,
     "winner_votes": 56083,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 19172,
     "margin": 36911,
     "percent_invalid": 3.8571897032300377,
     "ballot_surplus": 1
   },
   {
+    "cid": 304,
     "province_thai": "สระแก้ว",
     "province_eng": "SA KAEO",
     "prov_id": "SKW",
@@ -1949,14 +2256,17 @@ const CONST_RAW = [
     "invalid": 3874,
     "blank": 4239,
     "winner_party": "พลังประชารัฐ",
+    "winner_pid": 38,
     "winner_votes": 60370,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 17343,
     "margin": 43027,
     "percent_invalid": 3.974800952146434,
     "ballot_surplus": 0
   },
   {
+    "cid": 305,
     "province_thai": "สระแก้ว",
     "province_eng": "SA KAEO",
     "prov_id": "SKW",
@@ -1968,14 +2278,17 @@ const CONST_RAW = [
     "invalid": 5224,
     "blank": 3845,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 38812,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 32848,
     "margin": 5964,
     "percent_invalid": 5.124733904274208,
     "ballot_surplus": 0
   },
   {
+    "cid": 172,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -1987,14 +2300,17 @@ const CONST_RAW = [
     "invalid": 2325,
     "blank": 7247,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 32534,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 23435,
     "margin": 9099,
     "percent_invalid": 2.5674437094868425,
     "ballot_surplus": 0
   },
   {
+    "cid": 181,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -2006,14 +2322,17 @@ const CONST_RAW = [
     "invalid": 4162,
     "blank": 3561,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 43185,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 37863,
     "margin": 5322,
     "percent_invalid": 3.7150431576974228,
     "ballot_surplus": 0
   },
   {
+    "cid": 182,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -2025,14 +2344,17 @@ const CONST_RAW = [
     "invalid": 4060,
     "blank": 4526,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 53069,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 15952,
     "margin": 37117,
     "percent_invalid": 4.337514155680434,
     "ballot_surplus": 0
   },
   {
+    "cid": 183,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -2044,14 +2366,17 @@ const CONST_RAW = [
     "invalid": 4617,
     "blank": 4235,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 47794,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 16572,
     "margin": 31222,
     "percent_invalid": 4.867275295705159,
     "ballot_surplus": 0
   },
   {
+    "cid": 184,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -2063,14 +2388,17 @@ const CONST_RAW = [
     "invalid": 6631,
     "blank": 5354,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 28157,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 25404,
     "margin": 2753,
     "percent_invalid": 8.448209963052618,
     "ballot_surplus": 0
   },
   {
+    "cid": 185,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -2082,14 +2410,17 @@ const CONST_RAW = [
     "invalid": 4877,
     "blank": 5528,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 29003,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 28220,
     "margin": 783,
     "percent_invalid": 5.8341507763715095,
     "ballot_surplus": 0
   },
   {
+    "cid": 186,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -2101,14 +2432,17 @@ const CONST_RAW = [
     "invalid": 2835,
     "blank": 1828,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 37242,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 26946,
     "margin": 10296,
     "percent_invalid": 2.8389177064348803,
     "ballot_surplus": 1
   },
   {
+    "cid": 187,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -2120,14 +2454,17 @@ const CONST_RAW = [
     "invalid": 2993,
     "blank": 2351,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 32139,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 31496,
     "margin": 643,
     "percent_invalid": 3.350010633177753,
     "ballot_surplus": 0
   },
   {
+    "cid": 173,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -2139,14 +2476,17 @@ const CONST_RAW = [
     "invalid": 3197,
     "blank": 5943,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 39980,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 39142,
     "margin": 838,
     "percent_invalid": 3.0203117619272555,
     "ballot_surplus": 1
   },
   {
+    "cid": 174,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -2158,14 +2498,17 @@ const CONST_RAW = [
     "invalid": 3626,
     "blank": 6282,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 37699,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 37400,
     "margin": 299,
     "percent_invalid": 3.536525894860041,
     "ballot_surplus": 0
   },
   {
+    "cid": 175,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -2177,14 +2520,17 @@ const CONST_RAW = [
     "invalid": 4030,
     "blank": 5648,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 34719,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 26339,
     "margin": 8380,
     "percent_invalid": 4.288146414130666,
     "ballot_surplus": 0
   },
   {
+    "cid": 176,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -2196,14 +2542,17 @@ const CONST_RAW = [
     "invalid": 3871,
     "blank": 3614,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 38845,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 30864,
     "margin": 7981,
     "percent_invalid": 4.069211281522985,
     "ballot_surplus": -2
   },
   {
+    "cid": 177,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -2215,14 +2564,17 @@ const CONST_RAW = [
     "invalid": 2110,
     "blank": 1841,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 27973,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 19113,
     "margin": 8860,
     "percent_invalid": 2.4602971012802874,
     "ballot_surplus": 0
   },
   {
+    "cid": 178,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -2234,14 +2586,17 @@ const CONST_RAW = [
     "invalid": 2717,
     "blank": 2318,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 40228,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 21229,
     "margin": 18999,
     "percent_invalid": 3.313697510763114,
     "ballot_surplus": 0
   },
   {
+    "cid": 179,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -2253,14 +2608,17 @@ const CONST_RAW = [
     "invalid": 5126,
     "blank": 3579,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 51840,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 14747,
     "margin": 37093,
     "percent_invalid": 5.810078661619024,
     "ballot_surplus": -1
   },
   {
+    "cid": 180,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -2272,14 +2630,17 @@ const CONST_RAW = [
     "invalid": 2909,
     "blank": 1921,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 41235,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 24623,
     "margin": 16612,
     "percent_invalid": 3.1453749256636208,
     "ballot_surplus": 1
   },
   {
+    "cid": 45,
     "province_thai": "บุรีรัมย์",
     "province_eng": "BURI RAM",
     "prov_id": "BRM",
@@ -2291,14 +2652,17 @@ const CONST_RAW = [
     "invalid": 3720,
     "blank": 3573,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 57074,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 14995,
     "margin": 42079,
     "percent_invalid": 4.3164465897751265,
     "ballot_surplus": -1
   },
   {
+    "cid": 54,
     "province_thai": "บุรีรัมย์",
     "province_eng": "BURI RAM",
     "prov_id": "BRM",
@@ -2310,14 +2674,17 @@ const CONST_RAW = [
     "invalid": 3075,
     "blank": 2506,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 52091,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 9229,
     "margin": 42862,
     "percent_invalid": 4.113327180063405,
     "ballot_surplus": 0
   },
   {
+    "cid": 46,
     "province_thai": "บุรีรัมย์",
     "province_eng": "BURI RAM",
     "prov_id": "BRM",
@@ -2329,14 +2696,17 @@ const CONST_RAW = [
     "invalid": 3585,
     "blank": 3016,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 56479,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 11395,
     "margin": 45084,
     "percent_invalid": 4.390369354364652,
     "ballot_surplus": 0
   },
   {
+    "cid": 47,
     "province_thai": "บุรีรัมย์",
     "province_eng": "BURI RAM",
     "prov_id": "BRM",
@@ -2348,14 +2718,17 @@ const CONST_RAW = [
     "invalid": 3521,
     "blank": 1734,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 56210,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 10630,
     "margin": 45580,
     "percent_invalid": 4.547333075035516,
     "ballot_surplus": 0
   },
   {
+    "cid": 48,
     "province_thai": "บุรีรัมย์",
     "province_eng": "BURI RAM",
     "prov_id": "BRM",
@@ -2367,14 +2740,17 @@ const CONST_RAW = [
     "invalid": 3181,
     "blank": 1888,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 51536,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 11667,
     "margin": 39869,
     "percent_invalid": 4.268996430201036,
     "ballot_surplus": 0
   },
   {
+    "cid": 49,
     "province_thai": "บุรีรัมย์",
     "province_eng": "BURI RAM",
     "prov_id": "BRM",
@@ -2386,14 +2762,17 @@ const CONST_RAW = [
     "invalid": 3044,
     "blank": 2621,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 53732,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 10694,
     "margin": 43038,
     "percent_invalid": 3.6979894308449253,
     "ballot_surplus": 0
   },
   {
+    "cid": 50,
     "province_thai": "บุรีรัมย์",
     "province_eng": "BURI RAM",
     "prov_id": "BRM",
@@ -2405,14 +2784,17 @@ const CONST_RAW = [
     "invalid": 3020,
     "blank": 3110,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 51523,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 11551,
     "margin": 39972,
     "percent_invalid": 3.7874037472723163,
     "ballot_surplus": 0
   },
   {
+    "cid": 51,
     "province_thai": "บุรีรัมย์",
     "province_eng": "BURI RAM",
     "prov_id": "BRM",
@@ -2424,14 +2806,17 @@ const CONST_RAW = [
     "invalid": 3080,
     "blank": 2480,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 45919,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 13982,
     "margin": 31937,
     "percent_invalid": 3.8453375282470006,
     "ballot_surplus": 0
   },
   {
+    "cid": 52,
     "province_thai": "บุรีรัมย์",
     "province_eng": "BURI RAM",
     "prov_id": "BRM",
@@ -2443,14 +2828,17 @@ const CONST_RAW = [
     "invalid": 3293,
     "blank": 3544,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 53217,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 15367,
     "margin": 37850,
     "percent_invalid": 3.862077053890811,
     "ballot_surplus": -1
   },
   {
+    "cid": 53,
     "province_thai": "บุรีรัมย์",
     "province_eng": "BURI RAM",
     "prov_id": "BRM",
@@ -2462,14 +2850,17 @@ const CONST_RAW = [
     "invalid": 3433,
     "blank": 2618,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 57197,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 8695,
     "margin": 48502,
     "percent_invalid": 4.304918115015173,
     "ballot_surplus": -1
   },
   {
+    "cid": 337,
     "province_thai": "สุรินทร์",
     "province_eng": "SURIN",
     "prov_id": "SRN",
@@ -2481,14 +2872,17 @@ const CONST_RAW = [
     "invalid": 3504,
     "blank": 4575,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 46167,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 23104,
     "margin": 23063,
     "percent_invalid": 3.7252817350627256,
     "ballot_surplus": 0
   },
   {
+    "cid": 338,
     "province_thai": "สุรินทร์",
     "province_eng": "SURIN",
     "prov_id": "SRN",
@@ -2500,14 +2894,17 @@ const CONST_RAW = [
     "invalid": 3061,
     "blank": 2509,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 53228,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 17069,
     "margin": 36159,
     "percent_invalid": 3.2220035156784523,
     "ballot_surplus": 2
   },
   {
+    "cid": 339,
     "province_thai": "สุรินทร์",
     "province_eng": "SURIN",
     "prov_id": "SRN",
@@ -2519,14 +2916,17 @@ const CONST_RAW = [
     "invalid": 2774,
     "blank": 2242,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 50333,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 14826,
     "margin": 35507,
     "percent_invalid": 3.2768294843777683,
     "ballot_surplus": 1
   },
   {
+    "cid": 340,
     "province_thai": "สุรินทร์",
     "province_eng": "SURIN",
     "prov_id": "SRN",
@@ -2538,14 +2938,17 @@ const CONST_RAW = [
     "invalid": 2402,
     "blank": 2153,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 44913,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 14672,
     "margin": 30241,
     "percent_invalid": 2.8230592936475287,
     "ballot_surplus": 1
   },
   {
+    "cid": 341,
     "province_thai": "สุรินทร์",
     "province_eng": "SURIN",
     "prov_id": "SRN",
@@ -2557,14 +2960,17 @@ const CONST_RAW = [
     "invalid": 2057,
     "blank": 1073,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 41671,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 17798,
     "margin": 23873,
     "percent_invalid": 2.491098893114055,
     "ballot_surplus": 0
   },
   {
+    "cid": 342,
     "province_thai": "สุรินทร์",
     "province_eng": "SURIN",
     "prov_id": "SRN",
@@ -2576,14 +2982,17 @@ const CONST_RAW = [
     "invalid": 3169,
     "blank": 1807,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 52005,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 10955,
     "margin": 41050,
     "percent_invalid": 3.887103500723695,
     "ballot_surplus": 0
   },
   {
+    "cid": 343,
     "province_thai": "สุรินทร์",
     "province_eng": "SURIN",
     "prov_id": "SRN",
@@ -2595,14 +3004,17 @@ const CONST_RAW = [
     "invalid": 4302,
     "blank": 2297,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 43239,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 24474,
     "margin": 18765,
     "percent_invalid": 4.704775861503297,
     "ballot_surplus": 0
   },
   {
+    "cid": 344,
     "province_thai": "สุรินทร์",
     "province_eng": "SURIN",
     "prov_id": "SRN",
@@ -2614,14 +3026,17 @@ const CONST_RAW = [
     "invalid": 4320,
     "blank": 2001,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 52673,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 15302,
     "margin": 37371,
     "percent_invalid": 5.068043172219616,
     "ballot_surplus": 0
   },
   {
+    "cid": 345,
     "province_thai": "ศรีสะเกษ",
     "province_eng": "SI SA KET",
     "prov_id": "SSK",
@@ -2633,14 +3048,17 @@ const CONST_RAW = [
     "invalid": 2365,
     "blank": 1739,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 53220,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 25401,
     "margin": 27819,
     "percent_invalid": 2.394451756606257,
     "ballot_surplus": 2
   },
   {
+    "cid": 346,
     "province_thai": "ศรีสะเกษ",
     "province_eng": "SI SA KET",
     "prov_id": "SSK",
@@ -2652,14 +3070,17 @@ const CONST_RAW = [
     "invalid": 2485,
     "blank": 1854,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 35712,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 30103,
     "margin": 5609,
     "percent_invalid": 2.921467199623795,
     "ballot_surplus": 0
   },
   {
+    "cid": 347,
     "province_thai": "ศรีสะเกษ",
     "province_eng": "SI SA KET",
     "prov_id": "SSK",
@@ -2671,14 +3092,17 @@ const CONST_RAW = [
     "invalid": 3190,
     "blank": 2285,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 51942,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 9196,
     "margin": 42746,
     "percent_invalid": 3.887352091736635,
     "ballot_surplus": 0
   },
   {
+    "cid": 348,
     "province_thai": "ศรีสะเกษ",
     "province_eng": "SI SA KET",
     "prov_id": "SSK",
@@ -2690,14 +3114,17 @@ const CONST_RAW = [
     "invalid": 2762,
     "blank": 2142,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 43534,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 20190,
     "margin": 23344,
     "percent_invalid": 3.337038468973516,
     "ballot_surplus": -1
   },
   {
+    "cid": 349,
     "province_thai": "ศรีสะเกษ",
     "province_eng": "SI SA KET",
     "prov_id": "SSK",
@@ -2709,14 +3136,17 @@ const CONST_RAW = [
     "invalid": 3443,
     "blank": 1948,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 39108,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 25755,
     "margin": 13353,
     "percent_invalid": 4.04763584209165,
     "ballot_surplus": -1
   },
   {
+    "cid": 350,
     "province_thai": "ศรีสะเกษ",
     "province_eng": "SI SA KET",
     "prov_id": "SSK",
@@ -2728,14 +3158,17 @@ const CONST_RAW = [
     "invalid": 3411,
     "blank": 1438,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 31345,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 31072,
     "margin": 273,
     "percent_invalid": 4.065021272538762,
     "ballot_surplus": 1
   },
   {
+    "cid": 351,
     "province_thai": "ศรีสะเกษ",
     "province_eng": "SI SA KET",
     "prov_id": "SSK",
@@ -2747,14 +3180,17 @@ const CONST_RAW = [
     "invalid": 4351,
     "blank": 1221,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 36190,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 31642,
     "margin": 4548,
     "percent_invalid": 5.1672743251428095,
     "ballot_surplus": 0
   },
   {
+    "cid": 352,
     "province_thai": "ศรีสะเกษ",
     "province_eng": "SI SA KET",
     "prov_id": "SSK",
@@ -2766,14 +3202,17 @@ const CONST_RAW = [
     "invalid": 3106,
     "blank": 2073,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 59873,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 12268,
     "margin": 47605,
     "percent_invalid": 3.47606150815856,
     "ballot_surplus": 0
   },
   {
+    "cid": 353,
     "province_thai": "ศรีสะเกษ",
     "province_eng": "SI SA KET",
     "prov_id": "SSK",
@@ -2785,14 +3224,17 @@ const CONST_RAW = [
     "invalid": 2757,
     "blank": 1679,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 39667,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 19391,
     "margin": 20276,
     "percent_invalid": 2.9644523773682288,
     "ballot_surplus": 0
   },
   {
+    "cid": 368,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -2804,14 +3246,17 @@ const CONST_RAW = [
     "invalid": 4184,
     "blank": 7273,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 32328,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 27314,
     "margin": 5014,
     "percent_invalid": 4.207223875794385,
     "ballot_surplus": -3
   },
   {
+    "cid": 377,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -2823,14 +3268,17 @@ const CONST_RAW = [
     "invalid": 5130,
     "blank": 2548,
     "winner_party": "ไทรวมพลัง",
+    "winner_pid": 72,
     "winner_votes": 66909,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 7494,
     "margin": 59415,
     "percent_invalid": 5.50228457429693,
     "ballot_surplus": 0
   },
   {
+    "cid": 378,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -2842,14 +3290,17 @@ const CONST_RAW = [
     "invalid": 3254,
     "blank": 2672,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 58379,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 11868,
     "margin": 46511,
     "percent_invalid": 3.7855696968286843,
     "ballot_surplus": 0
   },
   {
+    "cid": 369,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -2861,14 +3312,17 @@ const CONST_RAW = [
     "invalid": 2402,
     "blank": 3526,
     "winner_party": "ไทรวมพลัง",
+    "winner_pid": 72,
     "winner_votes": 36198,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 33798,
     "margin": 2400,
     "percent_invalid": 2.4728725266127207,
     "ballot_surplus": 0
   },
   {
+    "cid": 370,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -2880,14 +3334,17 @@ const CONST_RAW = [
     "invalid": 3493,
     "blank": 4161,
     "winner_party": "ไทรวมพลัง",
+    "winner_pid": 72,
     "winner_votes": 43632,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 22798,
     "margin": 20834,
     "percent_invalid": 3.7258269245128055,
     "ballot_surplus": 0
   },
   {
+    "cid": 371,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -2899,14 +3356,17 @@ const CONST_RAW = [
     "invalid": 5245,
     "blank": 6931,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 37794,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 28643,
     "margin": 9151,
     "percent_invalid": 4.643442078703909,
     "ballot_surplus": 0
   },
   {
+    "cid": 372,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -2918,14 +3378,17 @@ const CONST_RAW = [
     "invalid": 3073,
     "blank": 2340,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 52151,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 15051,
     "margin": 37100,
     "percent_invalid": 3.556548307948706,
     "ballot_surplus": 0
   },
   {
+    "cid": 373,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -2937,14 +3400,17 @@ const CONST_RAW = [
     "invalid": 4115,
     "blank": 1671,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 33345,
     "runnerup_party": "ไทรวมพลัง",
+    "runnerup_pid": 72,
     "runnerup_votes": 31887,
     "margin": 1458,
     "percent_invalid": 4.902895269867747,
     "ballot_surplus": 0
   },
   {
+    "cid": 374,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -2956,14 +3422,17 @@ const CONST_RAW = [
     "invalid": 2560,
     "blank": 993,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 45003,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 34817,
     "margin": 10186,
     "percent_invalid": 2.8266366336524342,
     "ballot_surplus": 0
   },
   {
+    "cid": 375,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -2975,14 +3444,17 @@ const CONST_RAW = [
     "invalid": 2938,
     "blank": 2070,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 36651,
     "runnerup_party": "ไทรวมพลัง",
+    "runnerup_pid": 72,
     "runnerup_votes": 33084,
     "margin": 3567,
     "percent_invalid": 3.1877956685907733,
     "ballot_surplus": 0
   },
   {
+    "cid": 376,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -2994,14 +3466,17 @@ const CONST_RAW = [
     "invalid": 3831,
     "blank": 1346,
     "winner_party": "ไทรวมพลัง",
+    "winner_pid": 72,
     "winner_votes": 42832,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 15396,
     "margin": 27436,
     "percent_invalid": 4.579961026695518,
     "ballot_surplus": 0
   },
   {
+    "cid": 397,
     "province_thai": "ยโสธร",
     "province_eng": "YASOTHON",
     "prov_id": "YST",
@@ -3013,14 +3488,17 @@ const CONST_RAW = [
     "invalid": 2894,
     "blank": 2099,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 49334,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 36586,
     "margin": 12748,
     "percent_invalid": 2.7370053718695617,
     "ballot_surplus": -1
   },
   {
+    "cid": 398,
     "province_thai": "ยโสธร",
     "province_eng": "YASOTHON",
     "prov_id": "YST",
@@ -3032,14 +3510,17 @@ const CONST_RAW = [
     "invalid": 1961,
     "blank": 1252,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 51233,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 28880,
     "margin": 22353,
     "percent_invalid": 2.083621101843489,
     "ballot_surplus": 0
   },
   {
+    "cid": 399,
     "province_thai": "ยโสธร",
     "province_eng": "YASOTHON",
     "prov_id": "YST",
@@ -3051,14 +3532,17 @@ const CONST_RAW = [
     "invalid": 3651,
     "blank": 2005,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 44970,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 30173,
     "margin": 14797,
     "percent_invalid": 3.6667670985236516,
     "ballot_surplus": 1
   },
   {
+    "cid": 81,
     "province_thai": "ชัยภูมิ",
     "province_eng": "CHAIYAPHUM",
     "prov_id": "CPM",
@@ -3070,14 +3554,17 @@ const CONST_RAW = [
     "invalid": 2894,
     "blank": 4210,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 40748,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 24738,
     "margin": 16010,
     "percent_invalid": 3.2598533403922185,
     "ballot_surplus": 0
   },
   {
+    "cid": 82,
     "province_thai": "ชัยภูมิ",
     "province_eng": "CHAIYAPHUM",
     "prov_id": "CPM",
@@ -3089,14 +3576,17 @@ const CONST_RAW = [
     "invalid": 4464,
     "blank": 3346,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 54996,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 14658,
     "margin": 40338,
     "percent_invalid": 5.123026074182886,
     "ballot_surplus": 0
   },
   {
+    "cid": 83,
     "province_thai": "ชัยภูมิ",
     "province_eng": "CHAIYAPHUM",
     "prov_id": "CPM",
@@ -3108,14 +3598,17 @@ const CONST_RAW = [
     "invalid": 3742,
     "blank": 1720,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 48116,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 15311,
     "margin": 32805,
     "percent_invalid": 4.633998340577826,
     "ballot_surplus": 0
   },
   {
+    "cid": 84,
     "province_thai": "ชัยภูมิ",
     "province_eng": "CHAIYAPHUM",
     "prov_id": "CPM",
@@ -3127,14 +3620,17 @@ const CONST_RAW = [
     "invalid": 2736,
     "blank": 994,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 36907,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 17314,
     "margin": 19593,
     "percent_invalid": 3.5746482185552466,
     "ballot_surplus": 0
   },
   {
+    "cid": 85,
     "province_thai": "ชัยภูมิ",
     "province_eng": "CHAIYAPHUM",
     "prov_id": "CPM",
@@ -3146,14 +3642,17 @@ const CONST_RAW = [
     "invalid": 2651,
     "blank": 1382,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 29851,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 23594,
     "margin": 6257,
     "percent_invalid": 2.9625738967178123,
     "ballot_surplus": 2
   },
   {
+    "cid": 86,
     "province_thai": "ชัยภูมิ",
     "province_eng": "CHAIYAPHUM",
     "prov_id": "CPM",
@@ -3165,14 +3664,17 @@ const CONST_RAW = [
     "invalid": 3852,
     "blank": 2063,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 50655,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 16918,
     "margin": 33737,
     "percent_invalid": 4.315434512272997,
     "ballot_surplus": 2
   },
   {
+    "cid": 87,
     "province_thai": "ชัยภูมิ",
     "province_eng": "CHAIYAPHUM",
     "prov_id": "CPM",
@@ -3184,14 +3686,17 @@ const CONST_RAW = [
     "invalid": 2097,
     "blank": 1093,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 40833,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 23818,
     "margin": 17015,
     "percent_invalid": 2.4748619175754145,
     "ballot_surplus": 0
   },
   {
+    "cid": 0,
     "province_thai": "อำนาจเจริญ",
     "province_eng": "AMNAT CHAROEN",
     "prov_id": "ACR",
@@ -3203,14 +3708,17 @@ const CONST_RAW = [
     "invalid": 2940,
     "blank": 3713,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 44199,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 21040,
     "margin": 23159,
     "percent_invalid": 3.0099204521023375,
     "ballot_surplus": 2
   },
   {
+    "cid": 1,
     "province_thai": "อำนาจเจริญ",
     "province_eng": "AMNAT CHAROEN",
     "prov_id": "ACR",
@@ -3222,14 +3730,17 @@ const CONST_RAW = [
     "invalid": 5715,
     "blank": 3896,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 43016,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 19048,
     "margin": 23968,
     "percent_invalid": 5.523179959989562,
     "ballot_surplus": 0
   },
   {
+    "cid": 42,
     "province_thai": "บึงกาฬ",
     "province_eng": "BUENG KAN",
     "prov_id": "BKN",
@@ -3241,14 +3752,17 @@ const CONST_RAW = [
     "invalid": 2929,
     "blank": 1692,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 37182,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 17532,
     "margin": 19650,
     "percent_invalid": 3.9450468044986198,
     "ballot_surplus": 0
   },
   {
+    "cid": 43,
     "province_thai": "บึงกาฬ",
     "province_eng": "BUENG KAN",
     "prov_id": "BKN",
@@ -3260,14 +3774,17 @@ const CONST_RAW = [
     "invalid": 1869,
     "blank": 1064,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 26482,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 19981,
     "margin": 6501,
     "percent_invalid": 2.4918338777414837,
     "ballot_surplus": 1
   },
   {
+    "cid": 44,
     "province_thai": "บึงกาฬ",
     "province_eng": "BUENG KAN",
     "prov_id": "BKN",
@@ -3279,14 +3796,17 @@ const CONST_RAW = [
     "invalid": 3741,
     "blank": 2447,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 34041,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 15049,
     "margin": 18992,
     "percent_invalid": 4.908096193962294,
     "ballot_surplus": 0
   },
   {
+    "cid": 166,
     "province_thai": "หนองบัวลำภู",
     "province_eng": "NONG BUA LAM PHU",
     "prov_id": "NBP",
@@ -3298,14 +3818,17 @@ const CONST_RAW = [
     "invalid": 2315,
     "blank": 2332,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 31594,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 21721,
     "margin": 9873,
     "percent_invalid": 2.5311888387146153,
     "ballot_surplus": -4
   },
   {
+    "cid": 167,
     "province_thai": "หนองบัวลำภู",
     "province_eng": "NONG BUA LAM PHU",
     "prov_id": "NBP",
@@ -3317,14 +3840,17 @@ const CONST_RAW = [
     "invalid": 2456,
     "blank": 1714,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 36663,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 16062,
     "margin": 20601,
     "percent_invalid": 2.9359728398603737,
     "ballot_surplus": 1
   },
   {
+    "cid": 168,
     "province_thai": "หนองบัวลำภู",
     "province_eng": "NONG BUA LAM PHU",
     "prov_id": "NBP",
@@ -3336,14 +3862,17 @@ const CONST_RAW = [
     "invalid": 2915,
     "blank": 1850,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 26322,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 23670,
     "margin": 2652,
     "percent_invalid": 3.5277744160716447,
     "ballot_surplus": 0
   },
   {
+    "cid": 104,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -3355,14 +3884,17 @@ const CONST_RAW = [
     "invalid": 2621,
     "blank": 5519,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 35303,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 23307,
     "margin": 11996,
     "percent_invalid": 2.875574621216277,
     "ballot_surplus": 0
   },
   {
+    "cid": 113,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -3374,14 +3906,17 @@ const CONST_RAW = [
     "invalid": 3964,
     "blank": 1381,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 39396,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 32727,
     "margin": 6669,
     "percent_invalid": 4.448833920675181,
     "ballot_surplus": 0
   },
   {
+    "cid": 114,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -3393,14 +3928,17 @@ const CONST_RAW = [
     "invalid": 4128,
     "blank": 2121,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 48810,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 13775,
     "margin": 35035,
     "percent_invalid": 4.999878878903127,
     "ballot_surplus": 0
   },
   {
+    "cid": 105,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -3412,14 +3950,17 @@ const CONST_RAW = [
     "invalid": 2789,
     "blank": 6413,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 41012,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 26649,
     "margin": 14363,
     "percent_invalid": 2.6435768381342357,
     "ballot_surplus": 0
   },
   {
+    "cid": 106,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -3431,14 +3972,17 @@ const CONST_RAW = [
     "invalid": 3972,
     "blank": 1909,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 30645,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 29282,
     "margin": 1363,
     "percent_invalid": 4.3827031082766,
     "ballot_surplus": 0
   },
   {
+    "cid": 107,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -3450,14 +3994,17 @@ const CONST_RAW = [
     "invalid": 2779,
     "blank": 2247,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 40255,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 22219,
     "margin": 18036,
     "percent_invalid": 2.903016881163296,
     "ballot_surplus": 0
   },
   {
+    "cid": 108,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -3469,14 +4016,17 @@ const CONST_RAW = [
     "invalid": 2579,
     "blank": 1457,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 36120,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 32006,
     "margin": 4114,
     "percent_invalid": 3.028950613659052,
     "ballot_surplus": -1
   },
   {
+    "cid": 109,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -3488,14 +4038,17 @@ const CONST_RAW = [
     "invalid": 3802,
     "blank": 2436,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 43246,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 19300,
     "margin": 23946,
     "percent_invalid": 4.413027833878868,
     "ballot_surplus": 0
   },
   {
+    "cid": 110,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -3507,14 +4060,17 @@ const CONST_RAW = [
     "invalid": 4413,
     "blank": 2627,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 32796,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 21458,
     "margin": 11338,
     "percent_invalid": 4.889913238113178,
     "ballot_surplus": 0
   },
   {
+    "cid": 111,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -3526,14 +4082,17 @@ const CONST_RAW = [
     "invalid": 3629,
     "blank": 3274,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 33926,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 27594,
     "margin": 6332,
     "percent_invalid": 3.7572733108317977,
     "ballot_surplus": 0
   },
   {
+    "cid": 112,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -3545,14 +4104,17 @@ const CONST_RAW = [
     "invalid": 2531,
     "blank": 1384,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 42803,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 20997,
     "margin": 21806,
     "percent_invalid": 2.977086666039334,
     "ballot_surplus": 0
   },
   {
+    "cid": 379,
     "province_thai": "อุดรธานี",
     "province_eng": "UDON THANI",
     "prov_id": "UDN",
@@ -3564,14 +4126,17 @@ const CONST_RAW = [
     "invalid": 2420,
     "blank": 5631,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 30558,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 29040,
     "margin": 1518,
     "percent_invalid": 2.863668098500716,
     "ballot_surplus": 0
   },
   {
+    "cid": 388,
     "province_thai": "อุดรธานี",
     "province_eng": "UDON THANI",
     "prov_id": "UDN",
@@ -3583,14 +4148,17 @@ const CONST_RAW = [
     "invalid": 4832,
     "blank": 2146,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 31589,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 19691,
     "margin": 11898,
     "percent_invalid": 6.093700737751435,
     "ballot_surplus": 0
   },
   {
+    "cid": 380,
     "province_thai": "อุดรธานี",
     "province_eng": "UDON THANI",
     "prov_id": "UDN",
@@ -3602,14 +4170,17 @@ const CONST_RAW = [
     "invalid": 3107,
     "blank": 3816,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 29377,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 24364,
     "margin": 5013,
     "percent_invalid": 3.472400728678878,
     "ballot_surplus": 0
   },
   {
+    "cid": 381,
     "province_thai": "อุดรธานี",
     "province_eng": "UDON THANI",
     "prov_id": "UDN",
@@ -3621,14 +4192,17 @@ const CONST_RAW = [
     "invalid": 2548,
     "blank": 1446,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 33013,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 27342,
     "margin": 5671,
     "percent_invalid": 3.192862423718407,
     "ballot_surplus": 2
   },
   {
+    "cid": 382,
     "province_thai": "อุดรธานี",
     "province_eng": "UDON THANI",
     "prov_id": "UDN",
@@ -3640,14 +4214,17 @@ const CONST_RAW = [
     "invalid": 2316,
     "blank": 1678,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 29757,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 22361,
     "margin": 7396,
     "percent_invalid": 3.0933618271670897,
     "ballot_surplus": -1
   },
   {
+    "cid": 383,
     "province_thai": "อุดรธานี",
     "province_eng": "UDON THANI",
     "prov_id": "UDN",
@@ -3659,14 +4236,17 @@ const CONST_RAW = [
     "invalid": 2386,
     "blank": 1725,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 28475,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 20246,
     "margin": 8229,
     "percent_invalid": 3.239251143784195,
     "ballot_surplus": 1
   },
   {
+    "cid": 385,
     "province_thai": "อุดรธานี",
     "province_eng": "UDON THANI",
     "prov_id": "UDN",
@@ -3678,14 +4258,17 @@ const CONST_RAW = [
     "invalid": 3440,
     "blank": 3047,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 28786,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 27904,
     "margin": 882,
     "percent_invalid": 4.438022499741975,
     "ballot_surplus": 0
   },
   {
+    "cid": 386,
     "province_thai": "อุดรธานี",
     "province_eng": "UDON THANI",
     "prov_id": "UDN",
@@ -3697,14 +4280,17 @@ const CONST_RAW = [
     "invalid": 2884,
     "blank": 2296,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 38137,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 13901,
     "margin": 24236,
     "percent_invalid": 3.78249350785615,
     "ballot_surplus": 1
   },
   {
+    "cid": 387,
     "province_thai": "อุดรธานี",
     "province_eng": "UDON THANI",
     "prov_id": "UDN",
@@ -3716,14 +4302,17 @@ const CONST_RAW = [
     "invalid": 4633,
     "blank": 2750,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 29522,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 20842,
     "margin": 8680,
     "percent_invalid": 5.733201336468259,
     "ballot_surplus": 0
   },
   {
+    "cid": 130,
     "province_thai": "เลย",
     "province_eng": "LOEI",
     "prov_id": "LEI",
@@ -3735,14 +4324,17 @@ const CONST_RAW = [
     "invalid": 4573,
     "blank": 4242,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 42730,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 18230,
     "margin": 24500,
     "percent_invalid": 4.871163945078239,
     "ballot_surplus": -1
   },
   {
+    "cid": 131,
     "province_thai": "เลย",
     "province_eng": "LOEI",
     "prov_id": "LEI",
@@ -3754,14 +4346,17 @@ const CONST_RAW = [
     "invalid": 6284,
     "blank": 4480,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 27956,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 19571,
     "margin": 8385,
     "percent_invalid": 7.526289314202218,
     "ballot_surplus": 0
   },
   {
+    "cid": 132,
     "province_thai": "เลย",
     "province_eng": "LOEI",
     "prov_id": "LEI",
@@ -3773,14 +4368,17 @@ const CONST_RAW = [
     "invalid": 4484,
     "blank": 4408,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 51525,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 17501,
     "margin": 34024,
     "percent_invalid": 4.876192133279686,
     "ballot_surplus": 50
   },
   {
+    "cid": 133,
     "province_thai": "เลย",
     "province_eng": "LOEI",
     "prov_id": "LEI",
@@ -3792,14 +4390,17 @@ const CONST_RAW = [
     "invalid": 6443,
     "blank": 4458,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 30145,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 20152,
     "margin": 9993,
     "percent_invalid": 7.578306025711899,
     "ballot_surplus": 0
   },
   {
+    "cid": 169,
     "province_thai": "หนองคาย",
     "province_eng": "NONG KHAI",
     "prov_id": "NKI",
@@ -3811,14 +4412,17 @@ const CONST_RAW = [
     "invalid": 3879,
     "blank": 2665,
     "winner_party": "พลังประชารัฐ",
+    "winner_pid": 38,
     "winner_votes": 30866,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 24598,
     "margin": 6268,
     "percent_invalid": 4.061312309576907,
     "ballot_surplus": 1
   },
   {
+    "cid": 170,
     "province_thai": "หนองคาย",
     "province_eng": "NONG KHAI",
     "prov_id": "NKI",
@@ -3830,14 +4434,17 @@ const CONST_RAW = [
     "invalid": 3298,
     "blank": 1185,
     "winner_party": "พลังประชารัฐ",
+    "winner_pid": 38,
     "winner_votes": 30322,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 26423,
     "margin": 3899,
     "percent_invalid": 3.8482631474545217,
     "ballot_surplus": -1
   },
   {
+    "cid": 171,
     "province_thai": "หนองคาย",
     "province_eng": "NONG KHAI",
     "prov_id": "NKI",
@@ -3849,14 +4456,17 @@ const CONST_RAW = [
     "invalid": 5458,
     "blank": 3430,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 36917,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 19988,
     "margin": 16929,
     "percent_invalid": 6.268951575852247,
     "ballot_surplus": 0
   },
   {
+    "cid": 147,
     "province_thai": "มหาสารคาม",
     "province_eng": "MAHA SARAKHAM",
     "prov_id": "MKM",
@@ -3868,14 +4478,17 @@ const CONST_RAW = [
     "invalid": 2106,
     "blank": 3547,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 32493,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 22794,
     "margin": 9699,
     "percent_invalid": 2.3252989433470614,
     "ballot_surplus": 1
   },
   {
+    "cid": 148,
     "province_thai": "มหาสารคาม",
     "province_eng": "MAHA SARAKHAM",
     "prov_id": "MKM",
@@ -3887,14 +4500,17 @@ const CONST_RAW = [
     "invalid": 2177,
     "blank": 1853,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 32203,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 20789,
     "margin": 11414,
     "percent_invalid": 2.6309746812496226,
     "ballot_surplus": 0
   },
   {
+    "cid": 149,
     "province_thai": "มหาสารคาม",
     "province_eng": "MAHA SARAKHAM",
     "prov_id": "MKM",
@@ -3906,14 +4522,17 @@ const CONST_RAW = [
     "invalid": 2024,
     "blank": 866,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 39612,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 34638,
     "margin": 4974,
     "percent_invalid": 2.308499475341028,
     "ballot_surplus": 0
   },
   {
+    "cid": 150,
     "province_thai": "มหาสารคาม",
     "province_eng": "MAHA SARAKHAM",
     "prov_id": "MKM",
@@ -3925,14 +4544,17 @@ const CONST_RAW = [
     "invalid": 2959,
     "blank": 1305,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 30843,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 21773,
     "margin": 9070,
     "percent_invalid": 3.483430455000294,
     "ballot_surplus": -1
   },
   {
+    "cid": 151,
     "province_thai": "มหาสารคาม",
     "province_eng": "MAHA SARAKHAM",
     "prov_id": "MKM",
@@ -3944,14 +4566,17 @@ const CONST_RAW = [
     "invalid": 3056,
     "blank": 4027,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 36149,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 19302,
     "margin": 16847,
     "percent_invalid": 3.607985738066847,
     "ballot_surplus": 1
   },
   {
+    "cid": 152,
     "province_thai": "มหาสารคาม",
     "province_eng": "MAHA SARAKHAM",
     "prov_id": "MKM",
@@ -3963,14 +4588,17 @@ const CONST_RAW = [
     "invalid": 2465,
     "blank": 2140,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 38939,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 30699,
     "margin": 8240,
     "percent_invalid": 2.6891984770299904,
     "ballot_surplus": 0
   },
   {
+    "cid": 275,
     "province_thai": "ร้อยเอ็ด",
     "province_eng": "ROI ET",
     "prov_id": "RET",
@@ -3982,14 +4610,17 @@ const CONST_RAW = [
     "invalid": 2687,
     "blank": 2504,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 50238,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 20122,
     "margin": 30116,
     "percent_invalid": 2.8411013364912874,
     "ballot_surplus": -1
   },
   {
+    "cid": 276,
     "province_thai": "ร้อยเอ็ด",
     "province_eng": "ROI ET",
     "prov_id": "RET",
@@ -4001,14 +4632,17 @@ const CONST_RAW = [
     "invalid": 2981,
     "blank": 1807,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 43764,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 23207,
     "margin": 20557,
     "percent_invalid": 3.2486214337089425,
     "ballot_surplus": 0
   },
   {
+    "cid": 277,
     "province_thai": "ร้อยเอ็ด",
     "province_eng": "ROI ET",
     "prov_id": "RET",
@@ -4020,14 +4654,17 @@ const CONST_RAW = [
     "invalid": 2196,
     "blank": 1738,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 35999,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 30119,
     "margin": 5880,
     "percent_invalid": 2.5634141501394936,
     "ballot_surplus": -1
   },
   {
+    "cid": 278,
     "province_thai": "ร้อยเอ็ด",
     "province_eng": "ROI ET",
     "prov_id": "RET",
@@ -4039,14 +4676,17 @@ const CONST_RAW = [
     "invalid": 1967,
     "blank": 1604,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 22302,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 21829,
     "margin": 473,
     "percent_invalid": 2.342363798749628,
     "ballot_surplus": 0
   },
   {
+    "cid": 279,
     "province_thai": "ร้อยเอ็ด",
     "province_eng": "ROI ET",
     "prov_id": "RET",
@@ -4058,14 +4698,17 @@ const CONST_RAW = [
     "invalid": 4678,
     "blank": 3235,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 43787,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 14428,
     "margin": 29359,
     "percent_invalid": 5.850717894842163,
     "ballot_surplus": 0
   },
   {
+    "cid": 280,
     "province_thai": "ร้อยเอ็ด",
     "province_eng": "ROI ET",
     "prov_id": "RET",
@@ -4077,14 +4720,17 @@ const CONST_RAW = [
     "invalid": 3087,
     "blank": 1640,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 33696,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 20825,
     "margin": 12871,
     "percent_invalid": 3.7979355568952156,
     "ballot_surplus": 2
   },
   {
+    "cid": 281,
     "province_thai": "ร้อยเอ็ด",
     "province_eng": "ROI ET",
     "prov_id": "RET",
@@ -4096,14 +4742,17 @@ const CONST_RAW = [
     "invalid": 2760,
     "blank": 848,
     "winner_party": "ไทยสร้างไทย",
+    "winner_pid": 49,
     "winner_votes": 44414,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 29794,
     "margin": 14620,
     "percent_invalid": 3.2500412142907606,
     "ballot_surplus": 1
   },
   {
+    "cid": 282,
     "province_thai": "ร้อยเอ็ด",
     "province_eng": "ROI ET",
     "prov_id": "RET",
@@ -4115,14 +4764,17 @@ const CONST_RAW = [
     "invalid": 2155,
     "blank": 1617,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 26860,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 25106,
     "margin": 1754,
     "percent_invalid": 2.41578386861723,
     "ballot_surplus": 0
   },
   {
+    "cid": 124,
     "province_thai": "กาฬสินธุ์",
     "province_eng": "KALASIN",
     "prov_id": "KSN",
@@ -4134,14 +4786,17 @@ const CONST_RAW = [
     "invalid": 2808,
     "blank": 3585,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 35888,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 21477,
     "margin": 14411,
     "percent_invalid": 3.1152578852191666,
     "ballot_surplus": -1
   },
   {
+    "cid": 125,
     "province_thai": "กาฬสินธุ์",
     "province_eng": "KALASIN",
     "prov_id": "KSN",
@@ -4153,14 +4808,17 @@ const CONST_RAW = [
     "invalid": 2832,
     "blank": 3071,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 43696,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 17857,
     "margin": 25839,
     "percent_invalid": 3.4442498540572095,
     "ballot_surplus": 0
   },
   {
+    "cid": 126,
     "province_thai": "กาฬสินธุ์",
     "province_eng": "KALASIN",
     "prov_id": "KSN",
@@ -4172,14 +4830,17 @@ const CONST_RAW = [
     "invalid": 2518,
     "blank": 1894,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 27385,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 15030,
     "margin": 12355,
     "percent_invalid": 3.054157316999212,
     "ballot_surplus": 0
   },
   {
+    "cid": 127,
     "province_thai": "กาฬสินธุ์",
     "province_eng": "KALASIN",
     "prov_id": "KSN",
@@ -4191,14 +4852,17 @@ const CONST_RAW = [
     "invalid": 2514,
     "blank": 1941,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 35782,
     "runnerup_party": "พลังประชารัฐ",
+    "runnerup_pid": 38,
     "runnerup_votes": 25187,
     "margin": 10595,
     "percent_invalid": 2.7901092071384177,
     "ballot_surplus": 0
   },
   {
+    "cid": 128,
     "province_thai": "กาฬสินธุ์",
     "province_eng": "KALASIN",
     "prov_id": "KSN",
@@ -4210,14 +4874,17 @@ const CONST_RAW = [
     "invalid": 2305,
     "blank": 1840,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 48271,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 22785,
     "margin": 25486,
     "percent_invalid": 2.4546606604687815,
     "ballot_surplus": 1
   },
   {
+    "cid": 129,
     "province_thai": "กาฬสินธุ์",
     "province_eng": "KALASIN",
     "prov_id": "KSN",
@@ -4229,14 +4896,17 @@ const CONST_RAW = [
     "invalid": 2483,
     "blank": 1863,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 59665,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 15141,
     "margin": 44524,
     "percent_invalid": 2.59153341961341,
     "ballot_surplus": 1
   },
   {
+    "cid": 313,
     "province_thai": "สกลนคร",
     "province_eng": "SAKON NAKHON",
     "prov_id": "SNK",
@@ -4248,14 +4918,17 @@ const CONST_RAW = [
     "invalid": 2335,
     "blank": 3736,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 27337,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 23434,
     "margin": 3903,
     "percent_invalid": 2.428219340481068,
     "ballot_surplus": 1
   },
   {
+    "cid": 314,
     "province_thai": "สกลนคร",
     "province_eng": "SAKON NAKHON",
     "prov_id": "SNK",
@@ -4267,14 +4940,17 @@ const CONST_RAW = [
     "invalid": 3317,
     "blank": 1799,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 25737,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 20809,
     "margin": 4928,
     "percent_invalid": 3.7271338037664616,
     "ballot_surplus": 0
   },
   {
+    "cid": 315,
     "province_thai": "สกลนคร",
     "province_eng": "SAKON NAKHON",
     "prov_id": "SNK",
@@ -4286,14 +4962,17 @@ const CONST_RAW = [
     "invalid": 4110,
     "blank": 3560,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 48088,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 13374,
     "margin": 34714,
     "percent_invalid": 4.771302530763872,
     "ballot_surplus": 0
   },
   {
+    "cid": 316,
     "province_thai": "สกลนคร",
     "province_eng": "SAKON NAKHON",
     "prov_id": "SNK",
@@ -4305,14 +4984,17 @@ const CONST_RAW = [
     "invalid": 3434,
     "blank": 3990,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 29887,
     "runnerup_party": "รวมไทยสร้างชาติ",
+    "runnerup_pid": 50,
     "runnerup_votes": 16643,
     "margin": 13244,
     "percent_invalid": 4.12111320460355,
     "ballot_surplus": 1
   },
   {
+    "cid": 317,
     "province_thai": "สกลนคร",
     "province_eng": "SAKON NAKHON",
     "prov_id": "SNK",
@@ -4324,14 +5006,17 @@ const CONST_RAW = [
     "invalid": 2233,
     "blank": 1651,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 27906,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 22054,
     "margin": 5852,
     "percent_invalid": 2.6730350259762026,
     "ballot_surplus": 0
   },
   {
+    "cid": 318,
     "province_thai": "สกลนคร",
     "province_eng": "SAKON NAKHON",
     "prov_id": "SNK",
@@ -4343,14 +5028,17 @@ const CONST_RAW = [
     "invalid": 3189,
     "blank": 2260,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 34892,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 23101,
     "margin": 11791,
     "percent_invalid": 3.960949435480866,
     "ballot_surplus": -1
   },
   {
+    "cid": 319,
     "province_thai": "สกลนคร",
     "province_eng": "SAKON NAKHON",
     "prov_id": "SNK",
@@ -4362,14 +5050,17 @@ const CONST_RAW = [
     "invalid": 2799,
     "blank": 1528,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 23571,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 17145,
     "margin": 6426,
     "percent_invalid": 3.675302335963864,
     "ballot_surplus": 0
   },
   {
+    "cid": 188,
     "province_thai": "นครพนม",
     "province_eng": "NAKHON PHANOM",
     "prov_id": "NPM",
@@ -4381,14 +5072,17 @@ const CONST_RAW = [
     "invalid": 2636,
     "blank": 1326,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 61803,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 21476,
     "margin": 40327,
     "percent_invalid": 2.67616930121118,
     "ballot_surplus": 1
   },
   {
+    "cid": 189,
     "province_thai": "นครพนม",
     "province_eng": "NAKHON PHANOM",
     "prov_id": "NPM",
@@ -4400,14 +5094,17 @@ const CONST_RAW = [
     "invalid": 4001,
     "blank": 4247,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 51176,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 16967,
     "margin": 34209,
     "percent_invalid": 4.246669850873004,
     "ballot_surplus": 1
   },
   {
+    "cid": 190,
     "province_thai": "นครพนม",
     "province_eng": "NAKHON PHANOM",
     "prov_id": "NPM",
@@ -4419,14 +5116,17 @@ const CONST_RAW = [
     "invalid": 2983,
     "blank": 2220,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 37134,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 35076,
     "margin": 2058,
     "percent_invalid": 3.17117768375396,
     "ballot_surplus": 0
   },
   {
+    "cid": 191,
     "province_thai": "นครพนม",
     "province_eng": "NAKHON PHANOM",
     "prov_id": "NPM",
@@ -4438,14 +5138,17 @@ const CONST_RAW = [
     "invalid": 2349,
     "blank": 1685,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 41312,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 35119,
     "margin": 6193,
     "percent_invalid": 2.441407264979473,
     "ballot_surplus": 0
   },
   {
+    "cid": 145,
     "province_thai": "มุกดาหาร",
     "province_eng": "MUKDAHAN",
     "prov_id": "MDH",
@@ -4457,14 +5160,17 @@ const CONST_RAW = [
     "invalid": 3140,
     "blank": 2679,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 31342,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 23583,
     "margin": 7759,
     "percent_invalid": 2.9960688523338805,
     "ballot_surplus": 0
   },
   {
+    "cid": 146,
     "province_thai": "มุกดาหาร",
     "province_eng": "MUKDAHAN",
     "prov_id": "MDH",
@@ -4476,14 +5182,17 @@ const CONST_RAW = [
     "invalid": 3958,
     "blank": 2701,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 42393,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 23462,
     "margin": 18931,
     "percent_invalid": 3.923317870028944,
     "ballot_surplus": 0
   },
   {
+    "cid": 69,
     "province_thai": "เชียงใหม่",
     "province_eng": "CHIANG MAI",
     "prov_id": "CMI",
@@ -4495,14 +5204,17 @@ const CONST_RAW = [
     "invalid": 2478,
     "blank": 6833,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 47840,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 20164,
     "margin": 27676,
     "percent_invalid": 2.405685105721997,
     "ballot_surplus": -5
   },
   {
+    "cid": 78,
     "province_thai": "เชียงใหม่",
     "province_eng": "CHIANG MAI",
     "prov_id": "CMI",
@@ -4514,14 +5226,17 @@ const CONST_RAW = [
     "invalid": 9656,
     "blank": 1397,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 34102,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 30928,
     "margin": 3174,
     "percent_invalid": 10.524021274740605,
     "ballot_surplus": 0
   },
   {
+    "cid": 70,
     "province_thai": "เชียงใหม่",
     "province_eng": "CHIANG MAI",
     "prov_id": "CMI",
@@ -4533,14 +5248,17 @@ const CONST_RAW = [
     "invalid": 3485,
     "blank": 8719,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 51532,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 26155,
     "margin": 25377,
     "percent_invalid": 3.069727291945599,
     "ballot_surplus": 1
   },
   {
+    "cid": 71,
     "province_thai": "เชียงใหม่",
     "province_eng": "CHIANG MAI",
     "prov_id": "CMI",
@@ -4552,14 +5270,17 @@ const CONST_RAW = [
     "invalid": 3901,
     "blank": 7846,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 49235,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 28351,
     "margin": 20884,
     "percent_invalid": 3.4985605768454655,
     "ballot_surplus": -2
   },
   {
+    "cid": 72,
     "province_thai": "เชียงใหม่",
     "province_eng": "CHIANG MAI",
     "prov_id": "CMI",
@@ -4571,14 +5292,17 @@ const CONST_RAW = [
     "invalid": 2757,
     "blank": 6890,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 49641,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 22208,
     "margin": 27433,
     "percent_invalid": 2.3872196726989348,
     "ballot_surplus": -1
   },
   {
+    "cid": 73,
     "province_thai": "เชียงใหม่",
     "province_eng": "CHIANG MAI",
     "prov_id": "CMI",
@@ -4590,14 +5314,17 @@ const CONST_RAW = [
     "invalid": 4379,
     "blank": 6329,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 39120,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 32589,
     "margin": 6531,
     "percent_invalid": 4.2663263218402,
     "ballot_surplus": -1
   },
   {
+    "cid": 74,
     "province_thai": "เชียงใหม่",
     "province_eng": "CHIANG MAI",
     "prov_id": "CMI",
@@ -4609,14 +5336,17 @@ const CONST_RAW = [
     "invalid": 6347,
     "blank": 3483,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 33043,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 26649,
     "margin": 6394,
     "percent_invalid": 6.943897422432278,
     "ballot_surplus": -1
   },
   {
+    "cid": 75,
     "province_thai": "เชียงใหม่",
     "province_eng": "CHIANG MAI",
     "prov_id": "CMI",
@@ -4628,14 +5358,17 @@ const CONST_RAW = [
     "invalid": 4708,
     "blank": 3177,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 33492,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 20275,
     "margin": 13217,
     "percent_invalid": 4.78149152473518,
     "ballot_surplus": 0
   },
   {
+    "cid": 76,
     "province_thai": "เชียงใหม่",
     "province_eng": "CHIANG MAI",
     "prov_id": "CMI",
@@ -4647,14 +5380,17 @@ const CONST_RAW = [
     "invalid": 3774,
     "blank": 6436,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 57851,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 28146,
     "margin": 29705,
     "percent_invalid": 3.2425744700959713,
     "ballot_surplus": 0
   },
   {
+    "cid": 77,
     "province_thai": "เชียงใหม่",
     "province_eng": "CHIANG MAI",
     "prov_id": "CMI",
@@ -4666,14 +5402,17 @@ const CONST_RAW = [
     "invalid": 5953,
     "blank": 3473,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 43388,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 23465,
     "margin": 19923,
     "percent_invalid": 5.636029690221919,
     "ballot_surplus": 0
   },
   {
+    "cid": 138,
     "province_thai": "ลำพูน",
     "province_eng": "LAMPHUN",
     "prov_id": "LPN",
@@ -4685,14 +5424,17 @@ const CONST_RAW = [
     "invalid": 5765,
     "blank": 9526,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 66093,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 29768,
     "margin": 36325,
     "percent_invalid": 4.099788787984384,
     "ballot_surplus": -1
   },
   {
+    "cid": 139,
     "province_thai": "ลำพูน",
     "province_eng": "LAMPHUN",
     "prov_id": "LPN",
@@ -4704,14 +5446,17 @@ const CONST_RAW = [
     "invalid": 7568,
     "blank": 7232,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 49316,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 34789,
     "margin": 14527,
     "percent_invalid": 5.7473097456693925,
     "ballot_surplus": 0
   },
   {
+    "cid": 134,
     "province_thai": "ลำปาง",
     "province_eng": "LAMPANG",
     "prov_id": "LPG",
@@ -4723,14 +5468,17 @@ const CONST_RAW = [
     "invalid": 4665,
     "blank": 8978,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 47614,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 23642,
     "margin": 23972,
     "percent_invalid": 4.161462979482605,
     "ballot_surplus": 1
   },
   {
+    "cid": 135,
     "province_thai": "ลำปาง",
     "province_eng": "LAMPANG",
     "prov_id": "LPG",
@@ -4742,14 +5490,17 @@ const CONST_RAW = [
     "invalid": 7842,
     "blank": 5448,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 35828,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 33581,
     "margin": 2247,
     "percent_invalid": 7.022665603983272,
     "ballot_surplus": 0
   },
   {
+    "cid": 136,
     "province_thai": "ลำปาง",
     "province_eng": "LAMPANG",
     "prov_id": "LPG",
@@ -4761,14 +5512,17 @@ const CONST_RAW = [
     "invalid": 4528,
     "blank": 7781,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 41016,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 26924,
     "margin": 14092,
     "percent_invalid": 4.008143754979198,
     "ballot_surplus": 0
   },
   {
+    "cid": 137,
     "province_thai": "ลำปาง",
     "province_eng": "LAMPANG",
     "prov_id": "LPG",
@@ -4780,14 +5534,17 @@ const CONST_RAW = [
     "invalid": 6630,
     "blank": 4668,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 38171,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 29656,
     "margin": 8515,
     "percent_invalid": 5.728356661482634,
     "ballot_surplus": 0
   },
   {
+    "cid": 391,
     "province_thai": "อุตรดิตถ์",
     "province_eng": "UTTARADIT",
     "prov_id": "UTT",
@@ -4799,14 +5556,17 @@ const CONST_RAW = [
     "invalid": 3470,
     "blank": 3571,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 37418,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 20826,
     "margin": 16592,
     "percent_invalid": 3.9617751492801445,
     "ballot_surplus": 1
   },
   {
+    "cid": 392,
     "province_thai": "อุตรดิตถ์",
     "province_eng": "UTTARADIT",
     "prov_id": "UTT",
@@ -4818,14 +5578,17 @@ const CONST_RAW = [
     "invalid": 3780,
     "blank": 4342,
     "winner_party": "โอกาสใหม่",
+    "winner_pid": 73,
     "winner_votes": 31560,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 18916,
     "margin": 12644,
     "percent_invalid": 4.5479702577183145,
     "ballot_surplus": 0
   },
   {
+    "cid": 393,
     "province_thai": "อุตรดิตถ์",
     "province_eng": "UTTARADIT",
     "prov_id": "UTT",
@@ -4837,14 +5600,17 @@ const CONST_RAW = [
     "invalid": 4781,
     "blank": 4902,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 40926,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 21012,
     "margin": 19914,
     "percent_invalid": 5.653639212440135,
     "ballot_surplus": 0
   },
   {
+    "cid": 249,
     "province_thai": "แพร่",
     "province_eng": "PHRAE",
     "prov_id": "PRE",
@@ -4856,14 +5622,17 @@ const CONST_RAW = [
     "invalid": 2743,
     "blank": 2901,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 40738,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 24153,
     "margin": 16585,
     "percent_invalid": 2.7925680834818016,
     "ballot_surplus": 0
   },
   {
+    "cid": 250,
     "province_thai": "แพร่",
     "province_eng": "PHRAE",
     "prov_id": "PRE",
@@ -4875,14 +5644,17 @@ const CONST_RAW = [
     "invalid": 3325,
     "blank": 2345,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 54734,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 14577,
     "margin": 40157,
     "percent_invalid": 3.7379290186952656,
     "ballot_surplus": 0
   },
   {
+    "cid": 251,
     "province_thai": "แพร่",
     "province_eng": "PHRAE",
     "prov_id": "PRE",
@@ -4894,14 +5666,17 @@ const CONST_RAW = [
     "invalid": 6065,
     "blank": 4591,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 23987,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 21539,
     "margin": 2448,
     "percent_invalid": 7.199154856016903,
     "ballot_surplus": 1
   },
   {
+    "cid": 156,
     "province_thai": "น่าน",
     "province_eng": "NAN",
     "prov_id": "NAN",
@@ -4913,14 +5688,17 @@ const CONST_RAW = [
     "invalid": 3523,
     "blank": 4552,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 38228,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 28888,
     "margin": 9340,
     "percent_invalid": 3.5744361359969967,
     "ballot_surplus": 1
   },
   {
+    "cid": 157,
     "province_thai": "น่าน",
     "province_eng": "NAN",
     "prov_id": "NAN",
@@ -4932,14 +5710,17 @@ const CONST_RAW = [
     "invalid": 5479,
     "blank": 4820,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 26189,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 16170,
     "margin": 10019,
     "percent_invalid": 6.118916262759376,
     "ballot_surplus": -4
   },
   {
+    "cid": 267,
     "province_thai": "พะเยา",
     "province_eng": "PHAYAO",
     "prov_id": "PYO",
@@ -4951,14 +5732,17 @@ const CONST_RAW = [
     "invalid": 2999,
     "blank": 4010,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 66739,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 18907,
     "margin": 47832,
     "percent_invalid": 3.168883863946154,
     "ballot_surplus": 1
   },
   {
+    "cid": 268,
     "province_thai": "พะเยา",
     "province_eng": "PHAYAO",
     "prov_id": "PYO",
@@ -4970,14 +5754,17 @@ const CONST_RAW = [
     "invalid": 4097,
     "blank": 3423,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 55400,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 20496,
     "margin": 34904,
     "percent_invalid": 4.266019700535205,
     "ballot_surplus": 0
   },
   {
+    "cid": 269,
     "province_thai": "พะเยา",
     "province_eng": "PHAYAO",
     "prov_id": "PYO",
@@ -4989,14 +5776,17 @@ const CONST_RAW = [
     "invalid": 4715,
     "blank": 3488,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 59470,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 16950,
     "margin": 42520,
     "percent_invalid": 4.818402926809328,
     "ballot_surplus": 0
   },
   {
+    "cid": 91,
     "province_thai": "เชียงราย",
     "province_eng": "CHIANG RAI",
     "prov_id": "CRI",
@@ -5008,14 +5798,17 @@ const CONST_RAW = [
     "invalid": 3599,
     "blank": 6801,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 44084,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 38694,
     "margin": 5390,
     "percent_invalid": 3.292260124225875,
     "ballot_surplus": 14
   },
   {
+    "cid": 92,
     "province_thai": "เชียงราย",
     "province_eng": "CHIANG RAI",
     "prov_id": "CRI",
@@ -5027,14 +5820,17 @@ const CONST_RAW = [
     "invalid": 6400,
     "blank": 5520,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 34901,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 25076,
     "margin": 9825,
     "percent_invalid": 6.353555509227547,
     "ballot_surplus": -6
   },
   {
+    "cid": 93,
     "province_thai": "เชียงราย",
     "province_eng": "CHIANG RAI",
     "prov_id": "CRI",
@@ -5046,14 +5842,17 @@ const CONST_RAW = [
     "invalid": 8431,
     "blank": 5016,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 34046,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 25793,
     "margin": 8253,
     "percent_invalid": 8.035493032919693,
     "ballot_surplus": -5
   },
   {
+    "cid": 94,
     "province_thai": "เชียงราย",
     "province_eng": "CHIANG RAI",
     "prov_id": "CRI",
@@ -5065,14 +5864,17 @@ const CONST_RAW = [
     "invalid": 6117,
     "blank": 5736,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 34210,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 29837,
     "margin": 4373,
     "percent_invalid": 5.714259023989238,
     "ballot_surplus": 0
   },
   {
+    "cid": 95,
     "province_thai": "เชียงราย",
     "province_eng": "CHIANG RAI",
     "prov_id": "CRI",
@@ -5084,14 +5886,17 @@ const CONST_RAW = [
     "invalid": 4742,
     "blank": 3497,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 53198,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 17505,
     "margin": 35693,
     "percent_invalid": 4.760852977792056,
     "ballot_surplus": -1
   },
   {
+    "cid": 96,
     "province_thai": "เชียงราย",
     "province_eng": "CHIANG RAI",
     "prov_id": "CRI",
@@ -5103,14 +5908,17 @@ const CONST_RAW = [
     "invalid": 5544,
     "blank": 3867,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 28526,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 24836,
     "margin": 3690,
     "percent_invalid": 6.45461742653565,
     "ballot_surplus": -2
   },
   {
+    "cid": 97,
     "province_thai": "เชียงราย",
     "province_eng": "CHIANG RAI",
     "prov_id": "CRI",
@@ -5122,14 +5930,17 @@ const CONST_RAW = [
     "invalid": 4487,
     "blank": 4146,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 33398,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 24729,
     "margin": 8669,
     "percent_invalid": 4.59408819584515,
     "ballot_surplus": 3
   },
   {
+    "cid": 153,
     "province_thai": "แม่ฮ่องสอน",
     "province_eng": "MAE HONG SON",
     "prov_id": "MSN",
@@ -5141,14 +5952,17 @@ const CONST_RAW = [
     "invalid": 3932,
     "blank": 3093,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 35870,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 18680,
     "margin": 17190,
     "percent_invalid": 5.76886397981191,
     "ballot_surplus": 0
   },
   {
+    "cid": 154,
     "province_thai": "แม่ฮ่องสอน",
     "province_eng": "MAE HONG SON",
     "prov_id": "MSN",
@@ -5160,14 +5974,17 @@ const CONST_RAW = [
     "invalid": 5450,
     "blank": 1763,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 24897,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 24368,
     "margin": 529,
     "percent_invalid": 7.324382803155532,
     "ballot_surplus": 0
   },
   {
+    "cid": 198,
     "province_thai": "นครสวรรค์",
     "province_eng": "NAKHON SAWAN",
     "prov_id": "NSN",
@@ -5179,14 +5996,17 @@ const CONST_RAW = [
     "invalid": 3488,
     "blank": 5515,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 48861,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 30685,
     "margin": 18176,
     "percent_invalid": 3.519215440961327,
     "ballot_surplus": 0
   },
   {
+    "cid": 199,
     "province_thai": "นครสวรรค์",
     "province_eng": "NAKHON SAWAN",
     "prov_id": "NSN",
@@ -5198,14 +6018,17 @@ const CONST_RAW = [
     "invalid": 3889,
     "blank": 3312,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 47296,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 28620,
     "margin": 18676,
     "percent_invalid": 3.7327830301866873,
     "ballot_surplus": 0
   },
   {
+    "cid": 200,
     "province_thai": "นครสวรรค์",
     "province_eng": "NAKHON SAWAN",
     "prov_id": "NSN",
@@ -5217,14 +6040,17 @@ const CONST_RAW = [
     "invalid": 4841,
     "blank": 4190,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 53454,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 21890,
     "margin": 31564,
     "percent_invalid": 4.83964489942816,
     "ballot_surplus": 0
   },
   {
+    "cid": 201,
     "province_thai": "นครสวรรค์",
     "province_eng": "NAKHON SAWAN",
     "prov_id": "NSN",
@@ -5236,14 +6062,17 @@ const CONST_RAW = [
     "invalid": 5325,
     "blank": 3340,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 55825,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 14884,
     "margin": 40941,
     "percent_invalid": 5.762176317184812,
     "ballot_surplus": 1
   },
   {
+    "cid": 202,
     "province_thai": "นครสวรรค์",
     "province_eng": "NAKHON SAWAN",
     "prov_id": "NSN",
@@ -5255,14 +6084,17 @@ const CONST_RAW = [
     "invalid": 4280,
     "blank": 3303,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 61430,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 15839,
     "margin": 45591,
     "percent_invalid": 4.514244127791079,
     "ballot_surplus": 0
   },
   {
+    "cid": 203,
     "province_thai": "นครสวรรค์",
     "province_eng": "NAKHON SAWAN",
     "prov_id": "NSN",
@@ -5274,14 +6106,17 @@ const CONST_RAW = [
     "invalid": 3439,
     "blank": 1589,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 36543,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 32307,
     "margin": 4236,
     "percent_invalid": 3.809006933522362,
     "ballot_surplus": 0
   },
   {
+    "cid": 389,
     "province_thai": "อุทัยธานี",
     "province_eng": "UTHAI THANI",
     "prov_id": "UTI",
@@ -5293,14 +6128,17 @@ const CONST_RAW = [
     "invalid": 3381,
     "blank": 4655,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 56483,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 13059,
     "margin": 43424,
     "percent_invalid": 3.9983443708609268,
     "ballot_surplus": 0
   },
   {
+    "cid": 390,
     "province_thai": "อุทัยธานี",
     "province_eng": "UTHAI THANI",
     "prov_id": "UTI",
@@ -5312,14 +6150,17 @@ const CONST_RAW = [
     "invalid": 3461,
     "blank": 2967,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 54284,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 9062,
     "margin": 45222,
     "percent_invalid": 4.125247324131684,
     "ballot_surplus": 0
   },
   {
+    "cid": 115,
     "province_thai": "กำแพงเพชร",
     "province_eng": "KAMPHAENG PHET",
     "prov_id": "KPT",
@@ -5331,14 +6172,17 @@ const CONST_RAW = [
     "invalid": 5247,
     "blank": 5281,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 45347,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 33203,
     "margin": 12144,
     "percent_invalid": 5.172413793103448,
     "ballot_surplus": -3
   },
   {
+    "cid": 116,
     "province_thai": "กำแพงเพชร",
     "province_eng": "KAMPHAENG PHET",
     "prov_id": "KPT",
@@ -5350,14 +6194,17 @@ const CONST_RAW = [
     "invalid": 4752,
     "blank": 3065,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 42302,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 32930,
     "margin": 9372,
     "percent_invalid": 4.511920699575583,
     "ballot_surplus": 0
   },
   {
+    "cid": 117,
     "province_thai": "กำแพงเพชร",
     "province_eng": "KAMPHAENG PHET",
     "prov_id": "KPT",
@@ -5369,14 +6216,17 @@ const CONST_RAW = [
     "invalid": 4217,
     "blank": 3144,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 33653,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 30151,
     "margin": 3502,
     "percent_invalid": 4.616058234360462,
     "ballot_surplus": 0
   },
   {
+    "cid": 118,
     "province_thai": "กำแพงเพชร",
     "province_eng": "KAMPHAENG PHET",
     "prov_id": "KPT",
@@ -5388,14 +6238,17 @@ const CONST_RAW = [
     "invalid": 4444,
     "blank": 2893,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 38450,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 27423,
     "margin": 11027,
     "percent_invalid": 4.746848963896603,
     "ballot_surplus": 0
   },
   {
+    "cid": 360,
     "province_thai": "ตาก",
     "province_eng": "TAK",
     "prov_id": "TAK",
@@ -5407,14 +6260,17 @@ const CONST_RAW = [
     "invalid": 3819,
     "blank": 5119,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 37819,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 28996,
     "margin": 8823,
     "percent_invalid": 3.6257820733131427,
     "ballot_surplus": -1
   },
   {
+    "cid": 361,
     "province_thai": "ตาก",
     "province_eng": "TAK",
     "prov_id": "TAK",
@@ -5426,14 +6282,17 @@ const CONST_RAW = [
     "invalid": 9782,
     "blank": 17764,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 25259,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 19144,
     "margin": 6115,
     "percent_invalid": 10.968089161976096,
     "ballot_surplus": -23
   },
   {
+    "cid": 362,
     "province_thai": "ตาก",
     "province_eng": "TAK",
     "prov_id": "TAK",
@@ -5445,14 +6304,17 @@ const CONST_RAW = [
     "invalid": 7567,
     "blank": 2991,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 30644,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 18757,
     "margin": 11887,
     "percent_invalid": 7.840475795755967,
     "ballot_surplus": 0
   },
   {
+    "cid": 354,
     "province_thai": "สุโขทัย",
     "province_eng": "SUKHOTHAI",
     "prov_id": "STI",
@@ -5464,14 +6326,17 @@ const CONST_RAW = [
     "invalid": 4044,
     "blank": 5638,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 30925,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 24095,
     "margin": 6830,
     "percent_invalid": 4.794877875266777,
     "ballot_surplus": 0
   },
   {
+    "cid": 355,
     "province_thai": "สุโขทัย",
     "province_eng": "SUKHOTHAI",
     "prov_id": "STI",
@@ -5483,14 +6348,17 @@ const CONST_RAW = [
     "invalid": 3646,
     "blank": 3393,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 32650,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 19265,
     "margin": 13385,
     "percent_invalid": 4.659663113769394,
     "ballot_surplus": 0
   },
   {
+    "cid": 356,
     "province_thai": "สุโขทัย",
     "province_eng": "SUKHOTHAI",
     "prov_id": "STI",
@@ -5502,14 +6370,17 @@ const CONST_RAW = [
     "invalid": 4615,
     "blank": 5806,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 47516,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 15027,
     "margin": 32489,
     "percent_invalid": 5.5116981763026835,
     "ballot_surplus": 0
   },
   {
+    "cid": 357,
     "province_thai": "สุโขทัย",
     "province_eng": "SUKHOTHAI",
     "prov_id": "STI",
@@ -5521,14 +6392,17 @@ const CONST_RAW = [
     "invalid": 2915,
     "blank": 1973,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 48293,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 20045,
     "margin": 28248,
     "percent_invalid": 3.325044486015422,
     "ballot_surplus": -1
   },
   {
+    "cid": 236,
     "province_thai": "พิษณุโลก",
     "province_eng": "PHITSANULOK",
     "prov_id": "PLK",
@@ -5540,14 +6414,17 @@ const CONST_RAW = [
     "invalid": 3147,
     "blank": 6539,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 34692,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 33470,
     "margin": 1222,
     "percent_invalid": 3.1638315840270237,
     "ballot_surplus": 0
   },
   {
+    "cid": 237,
     "province_thai": "พิษณุโลก",
     "province_eng": "PHITSANULOK",
     "prov_id": "PLK",
@@ -5559,14 +6436,17 @@ const CONST_RAW = [
     "invalid": 5057,
     "blank": 8016,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 40429,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 32070,
     "margin": 8359,
     "percent_invalid": 4.991166513684502,
     "ballot_surplus": 0
   },
   {
+    "cid": 238,
     "province_thai": "พิษณุโลก",
     "province_eng": "PHITSANULOK",
     "prov_id": "PLK",
@@ -5578,14 +6458,17 @@ const CONST_RAW = [
     "invalid": 4233,
     "blank": 2907,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 42353,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 21990,
     "margin": 20363,
     "percent_invalid": 4.458699361688681,
     "ballot_surplus": 0
   },
   {
+    "cid": 239,
     "province_thai": "พิษณุโลก",
     "province_eng": "PHITSANULOK",
     "prov_id": "PLK",
@@ -5597,14 +6480,17 @@ const CONST_RAW = [
     "invalid": 3345,
     "blank": 2411,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 42805,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 29467,
     "margin": 13338,
     "percent_invalid": 3.539982220717098,
     "ballot_surplus": 0
   },
   {
+    "cid": 240,
     "province_thai": "พิษณุโลก",
     "province_eng": "PHITSANULOK",
     "prov_id": "PLK",
@@ -5616,14 +6502,17 @@ const CONST_RAW = [
     "invalid": 4367,
     "blank": 2998,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 34149,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 30110,
     "margin": 4039,
     "percent_invalid": 4.619355384664205,
     "ballot_surplus": 0
   },
   {
+    "cid": 224,
     "province_thai": "พิจิตร",
     "province_eng": "PHICHIT",
     "prov_id": "PCT",
@@ -5635,14 +6524,17 @@ const CONST_RAW = [
     "invalid": 5082,
     "blank": 4679,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 53293,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 23172,
     "margin": 30121,
     "percent_invalid": 5.04016661707825,
     "ballot_surplus": 0
   },
   {
+    "cid": 225,
     "province_thai": "พิจิตร",
     "province_eng": "PHICHIT",
     "prov_id": "PCT",
@@ -5654,14 +6546,17 @@ const CONST_RAW = [
     "invalid": 4341,
     "blank": 3559,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 46639,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 20167,
     "margin": 26472,
     "percent_invalid": 4.766191987175969,
     "ballot_surplus": -1
   },
   {
+    "cid": 226,
     "province_thai": "พิจิตร",
     "province_eng": "PHICHIT",
     "prov_id": "PCT",
@@ -5673,14 +6568,17 @@ const CONST_RAW = [
     "invalid": 3740,
     "blank": 2197,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 39021,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 32805,
     "margin": 6216,
     "percent_invalid": 3.717767748861806,
     "ballot_surplus": -1
   },
   {
+    "cid": 243,
     "province_thai": "เพชรบูรณ์",
     "province_eng": "PHETCHABUN",
     "prov_id": "PNB",
@@ -5692,14 +6590,17 @@ const CONST_RAW = [
     "invalid": 3607,
     "blank": 4494,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 50631,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 22369,
     "margin": 28262,
     "percent_invalid": 4.0648665705012625,
     "ballot_surplus": -5
   },
   {
+    "cid": 244,
     "province_thai": "เพชรบูรณ์",
     "province_eng": "PHETCHABUN",
     "prov_id": "PNB",
@@ -5711,14 +6612,17 @@ const CONST_RAW = [
     "invalid": 2599,
     "blank": 2070,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 41515,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 40158,
     "margin": 1357,
     "percent_invalid": 2.5938641489850096,
     "ballot_surplus": 0
   },
   {
+    "cid": 245,
     "province_thai": "เพชรบูรณ์",
     "province_eng": "PHETCHABUN",
     "prov_id": "PNB",
@@ -5730,14 +6634,17 @@ const CONST_RAW = [
     "invalid": 3669,
     "blank": 3099,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 39652,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 19012,
     "margin": 20640,
     "percent_invalid": 3.9760289559808406,
     "ballot_surplus": 0
   },
   {
+    "cid": 246,
     "province_thai": "เพชรบูรณ์",
     "province_eng": "PHETCHABUN",
     "prov_id": "PNB",
@@ -5749,14 +6656,17 @@ const CONST_RAW = [
     "invalid": 3038,
     "blank": 2692,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 48590,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 13294,
     "margin": 35296,
     "percent_invalid": 3.8886897752291225,
     "ballot_surplus": 0
   },
   {
+    "cid": 247,
     "province_thai": "เพชรบูรณ์",
     "province_eng": "PHETCHABUN",
     "prov_id": "PNB",
@@ -5768,14 +6678,17 @@ const CONST_RAW = [
     "invalid": 5215,
     "blank": 3151,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 45747,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 16678,
     "margin": 29069,
     "percent_invalid": 6.372111777715326,
     "ballot_surplus": 0
   },
   {
+    "cid": 248,
     "province_thai": "เพชรบูรณ์",
     "province_eng": "PHETCHABUN",
     "prov_id": "PNB",
@@ -5787,14 +6700,17 @@ const CONST_RAW = [
     "invalid": 3705,
     "blank": 2571,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 59008,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 14303,
     "margin": 44705,
     "percent_invalid": 4.2340437689274895,
     "ballot_surplus": 0
   },
   {
+    "cid": 270,
     "province_thai": "ราชบุรี",
     "province_eng": "RATCHABURI",
     "prov_id": "RBR",
@@ -5806,14 +6722,17 @@ const CONST_RAW = [
     "invalid": 3438,
     "blank": 5389,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 56407,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 28931,
     "margin": 27476,
     "percent_invalid": 3.222087890460258,
     "ballot_surplus": 0
   },
   {
+    "cid": 271,
     "province_thai": "ราชบุรี",
     "province_eng": "RATCHABURI",
     "prov_id": "RBR",
@@ -5825,14 +6744,17 @@ const CONST_RAW = [
     "invalid": 5088,
     "blank": 6537,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 43510,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 26956,
     "margin": 16554,
     "percent_invalid": 5.015624537917845,
     "ballot_surplus": 0
   },
   {
+    "cid": 272,
     "province_thai": "ราชบุรี",
     "province_eng": "RATCHABURI",
     "prov_id": "RBR",
@@ -5844,14 +6766,17 @@ const CONST_RAW = [
     "invalid": 5970,
     "blank": 8286,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 51702,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 26257,
     "margin": 25445,
     "percent_invalid": 5.181257214271456,
     "ballot_surplus": 0
   },
   {
+    "cid": 273,
     "province_thai": "ราชบุรี",
     "province_eng": "RATCHABURI",
     "prov_id": "RBR",
@@ -5863,14 +6788,17 @@ const CONST_RAW = [
     "invalid": 2805,
     "blank": 2544,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 55778,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 25938,
     "margin": 29840,
     "percent_invalid": 2.4838835364125815,
     "ballot_surplus": 0
   },
   {
+    "cid": 274,
     "province_thai": "ราชบุรี",
     "province_eng": "RATCHABURI",
     "prov_id": "RBR",
@@ -5882,14 +6810,17 @@ const CONST_RAW = [
     "invalid": 3139,
     "blank": 2989,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 45150,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 39913,
     "margin": 5237,
     "percent_invalid": 2.7369907924107144,
     "ballot_surplus": 0
   },
   {
+    "cid": 119,
     "province_thai": "กาญจนบุรี",
     "province_eng": "KANCHANABURI",
     "prov_id": "KRI",
@@ -5901,14 +6832,17 @@ const CONST_RAW = [
     "invalid": 3815,
     "blank": 6899,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 38572,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 26849,
     "margin": 11723,
     "percent_invalid": 3.95074769065076,
     "ballot_surplus": 1
   },
   {
+    "cid": 120,
     "province_thai": "กาญจนบุรี",
     "province_eng": "KANCHANABURI",
     "prov_id": "KRI",
@@ -5920,14 +6854,17 @@ const CONST_RAW = [
     "invalid": 2899,
     "blank": 3157,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 39327,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 27028,
     "margin": 12299,
     "percent_invalid": 2.7945939693067015,
     "ballot_surplus": 0
   },
   {
+    "cid": 121,
     "province_thai": "กาญจนบุรี",
     "province_eng": "KANCHANABURI",
     "prov_id": "KRI",
@@ -5939,14 +6876,17 @@ const CONST_RAW = [
     "invalid": 3604,
     "blank": 2404,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 50759,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 40278,
     "margin": 10481,
     "percent_invalid": 3.1625686656487475,
     "ballot_surplus": 0
   },
   {
+    "cid": 122,
     "province_thai": "กาญจนบุรี",
     "province_eng": "KANCHANABURI",
     "prov_id": "KRI",
@@ -5958,14 +6898,17 @@ const CONST_RAW = [
     "invalid": 5654,
     "blank": 4975,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 52505,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 16545,
     "margin": 35960,
     "percent_invalid": 6.04537775591814,
     "ballot_surplus": 0
   },
   {
+    "cid": 123,
     "province_thai": "กาญจนบุรี",
     "province_eng": "KANCHANABURI",
     "prov_id": "KRI",
@@ -5977,14 +6920,17 @@ const CONST_RAW = [
     "invalid": 4176,
     "blank": 1914,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 39023,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 27305,
     "margin": 11718,
     "percent_invalid": 4.689394960247945,
     "ballot_surplus": 0
   },
   {
+    "cid": 320,
     "province_thai": "สุพรรณบุรี",
     "province_eng": "SUPHAN BURI",
     "prov_id": "SPB",
@@ -5996,14 +6942,17 @@ const CONST_RAW = [
     "invalid": 3079,
     "blank": 4763,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 63205,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 23503,
     "margin": 39702,
     "percent_invalid": 3.004605956516648,
     "ballot_surplus": 0
   },
   {
+    "cid": 321,
     "province_thai": "สุพรรณบุรี",
     "province_eng": "SUPHAN BURI",
     "prov_id": "SPB",
@@ -6015,14 +6964,17 @@ const CONST_RAW = [
     "invalid": 3540,
     "blank": 3518,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 45546,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 23117,
     "margin": 22429,
     "percent_invalid": 3.8655572299023784,
     "ballot_surplus": 0
   },
   {
+    "cid": 322,
     "province_thai": "สุพรรณบุรี",
     "province_eng": "SUPHAN BURI",
     "prov_id": "SPB",
@@ -6034,14 +6986,17 @@ const CONST_RAW = [
     "invalid": 3416,
     "blank": 1904,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 47179,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 39798,
     "margin": 7381,
     "percent_invalid": 3.199340651107032,
     "ballot_surplus": 0
   },
   {
+    "cid": 323,
     "province_thai": "สุพรรณบุรี",
     "province_eng": "SUPHAN BURI",
     "prov_id": "SPB",
@@ -6053,14 +7008,17 @@ const CONST_RAW = [
     "invalid": 4733,
     "blank": 3897,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 58049,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 18972,
     "margin": 39077,
     "percent_invalid": 4.750767871840684,
     "ballot_surplus": 0
   },
   {
+    "cid": 324,
     "province_thai": "สุพรรณบุรี",
     "province_eng": "SUPHAN BURI",
     "prov_id": "SPB",
@@ -6072,14 +7030,17 @@ const CONST_RAW = [
     "invalid": 4594,
     "blank": 5497,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 60036,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 24816,
     "margin": 35220,
     "percent_invalid": 4.2290343367393906,
     "ballot_surplus": 0
   },
   {
+    "cid": 192,
     "province_thai": "นครปฐม",
     "province_eng": "NAKHON PATHOM",
     "prov_id": "NPT",
@@ -6091,14 +7052,17 @@ const CONST_RAW = [
     "invalid": 3661,
     "blank": 4830,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 57347,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 27833,
     "margin": 29514,
     "percent_invalid": 3.5059661757100993,
     "ballot_surplus": 0
   },
   {
+    "cid": 193,
     "province_thai": "นครปฐม",
     "province_eng": "NAKHON PATHOM",
     "prov_id": "NPT",
@@ -6110,14 +7074,17 @@ const CONST_RAW = [
     "invalid": 2543,
     "blank": 5352,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 44487,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 31511,
     "margin": 12976,
     "percent_invalid": 2.637638468240468,
     "ballot_surplus": 0
   },
   {
+    "cid": 194,
     "province_thai": "นครปฐม",
     "province_eng": "NAKHON PATHOM",
     "prov_id": "NPT",
@@ -6129,14 +7096,17 @@ const CONST_RAW = [
     "invalid": 3137,
     "blank": 4517,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 48099,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 21739,
     "margin": 26360,
     "percent_invalid": 3.436753653673393,
     "ballot_surplus": 0
   },
   {
+    "cid": 195,
     "province_thai": "นครปฐม",
     "province_eng": "NAKHON PATHOM",
     "prov_id": "NPT",
@@ -6148,14 +7118,17 @@ const CONST_RAW = [
     "invalid": 3676,
     "blank": 3521,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 50336,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 25879,
     "margin": 24457,
     "percent_invalid": 3.496723011215007,
     "ballot_surplus": 0
   },
   {
+    "cid": 196,
     "province_thai": "นครปฐม",
     "province_eng": "NAKHON PATHOM",
     "prov_id": "NPT",
@@ -6167,14 +7140,17 @@ const CONST_RAW = [
     "invalid": 2927,
     "blank": 4539,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 40896,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 25056,
     "margin": 15840,
     "percent_invalid": 2.7302067009924635,
     "ballot_surplus": 0
   },
   {
+    "cid": 197,
     "province_thai": "นครปฐม",
     "province_eng": "NAKHON PATHOM",
     "prov_id": "NPT",
@@ -6186,14 +7162,17 @@ const CONST_RAW = [
     "invalid": 2391,
     "blank": 5203,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 38535,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 36970,
     "margin": 1565,
     "percent_invalid": 2.4556322405718514,
     "ballot_surplus": 0
   },
   {
+    "cid": 300,
     "province_thai": "สมุทรสาคร",
     "province_eng": "SAMUT SAKHON",
     "prov_id": "SKN",
@@ -6205,14 +7184,17 @@ const CONST_RAW = [
     "invalid": 2423,
     "blank": 4653,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 32553,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 23066,
     "margin": 9487,
     "percent_invalid": 2.7519705608431955,
     "ballot_surplus": 0
   },
   {
+    "cid": 301,
     "province_thai": "สมุทรสาคร",
     "province_eng": "SAMUT SAKHON",
     "prov_id": "SKN",
@@ -6224,14 +7206,17 @@ const CONST_RAW = [
     "invalid": 3179,
     "blank": 4377,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 34749,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 29373,
     "margin": 5376,
     "percent_invalid": 3.713524752937878,
     "ballot_surplus": 0
   },
   {
+    "cid": 302,
     "province_thai": "สมุทรสาคร",
     "province_eng": "SAMUT SAKHON",
     "prov_id": "SKN",
@@ -6243,14 +7228,17 @@ const CONST_RAW = [
     "invalid": 3218,
     "blank": 3948,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 30787,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 26064,
     "margin": 4723,
     "percent_invalid": 3.930621717356785,
     "ballot_surplus": -1
   },
   {
+    "cid": 401,
     "province_thai": "สมุทรสาคร",
     "province_eng": "SAMUT SAKHON",
     "prov_id": "SKN",
@@ -6262,14 +7250,17 @@ const CONST_RAW = [
     "invalid": 2625,
     "blank": 3898,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 42758,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 22826,
     "margin": 19932,
     "percent_invalid": 3.0936947554507954,
     "ballot_surplus": 0
   },
   {
+    "cid": 299,
     "province_thai": "สมุทรสงคราม",
     "province_eng": "SAMUT SONGKHRAM",
     "prov_id": "SKM",
@@ -6281,14 +7272,17 @@ const CONST_RAW = [
     "invalid": 4534,
     "blank": 6937,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 39592,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 28382,
     "margin": 11210,
     "percent_invalid": 3.997919036408045,
     "ballot_surplus": 0
   },
   {
+    "cid": 221,
     "province_thai": "เพชรบุรี",
     "province_eng": "PHETCHABURI",
     "prov_id": "PBI",
@@ -6300,14 +7294,17 @@ const CONST_RAW = [
     "invalid": 3957,
     "blank": 5808,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 61734,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 20431,
     "margin": 41303,
     "percent_invalid": 3.9815662638479417,
     "ballot_surplus": 0
   },
   {
+    "cid": 222,
     "province_thai": "เพชรบุรี",
     "province_eng": "PHETCHABURI",
     "prov_id": "PBI",
@@ -6319,14 +7316,17 @@ const CONST_RAW = [
     "invalid": 4694,
     "blank": 5218,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 67251,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 19089,
     "margin": 48162,
     "percent_invalid": 4.435876354907909,
     "ballot_surplus": 0
   },
   {
+    "cid": 223,
     "province_thai": "เพชรบุรี",
     "province_eng": "PHETCHABURI",
     "prov_id": "PBI",
@@ -6338,14 +7338,17 @@ const CONST_RAW = [
     "invalid": 3789,
     "blank": 4500,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 71153,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 14187,
     "margin": 56966,
     "percent_invalid": 3.6681704648866345,
     "ballot_surplus": 0
   },
   {
+    "cid": 227,
     "province_thai": "ประจวบคีรีขันธ์",
     "province_eng": "PRACHUAP KHIRI KHAN",
     "prov_id": "PKN",
@@ -6357,14 +7360,17 @@ const CONST_RAW = [
     "invalid": 3405,
     "blank": 2643,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 51582,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 43544,
     "margin": 8038,
     "percent_invalid": 2.87832423202421,
     "ballot_surplus": 1
   },
   {
+    "cid": 228,
     "province_thai": "ประจวบคีรีขันธ์",
     "province_eng": "PRACHUAP KHIRI KHAN",
     "prov_id": "PKN",
@@ -6376,14 +7382,17 @@ const CONST_RAW = [
     "invalid": 2709,
     "blank": 4402,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 43420,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 22778,
     "margin": 20642,
     "percent_invalid": 2.615748563703954,
     "ballot_surplus": 1
   },
   {
+    "cid": 229,
     "province_thai": "ประจวบคีรีขันธ์",
     "province_eng": "PRACHUAP KHIRI KHAN",
     "prov_id": "PKN",
@@ -6395,14 +7404,17 @@ const CONST_RAW = [
     "invalid": 2641,
     "blank": 2370,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 33978,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 25444,
     "margin": 8534,
     "percent_invalid": 2.5536646683426802,
     "ballot_surplus": 0
   },
   {
+    "cid": 204,
     "province_thai": "นครศรีธรรมราช",
     "province_eng": "NAKHON SI THAMMARAT",
     "prov_id": "NST",
@@ -6414,14 +7426,17 @@ const CONST_RAW = [
     "invalid": 3036,
     "blank": 5139,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 39225,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 29583,
     "margin": 9642,
     "percent_invalid": 3.0421146504473993,
     "ballot_surplus": 0
   },
   {
+    "cid": 205,
     "province_thai": "นครศรีธรรมราช",
     "province_eng": "NAKHON SI THAMMARAT",
     "prov_id": "NST",
@@ -6433,14 +7448,17 @@ const CONST_RAW = [
     "invalid": 2927,
     "blank": 5935,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 45334,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 21111,
     "margin": 24223,
     "percent_invalid": 2.9102370346802418,
     "ballot_surplus": 0
   },
   {
+    "cid": 206,
     "province_thai": "นครศรีธรรมราช",
     "province_eng": "NAKHON SI THAMMARAT",
     "prov_id": "NST",
@@ -6452,14 +7470,17 @@ const CONST_RAW = [
     "invalid": 2694,
     "blank": 2468,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 47554,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 35542,
     "margin": 12012,
     "percent_invalid": 2.7431853126559207,
     "ballot_surplus": 0
   },
   {
+    "cid": 207,
     "province_thai": "นครศรีธรรมราช",
     "province_eng": "NAKHON SI THAMMARAT",
     "prov_id": "NST",
@@ -6471,14 +7492,17 @@ const CONST_RAW = [
     "invalid": 2383,
     "blank": 3732,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 44890,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 36790,
     "margin": 8100,
     "percent_invalid": 2.3099590934646477,
     "ballot_surplus": 1
   },
   {
+    "cid": 208,
     "province_thai": "นครศรีธรรมราช",
     "province_eng": "NAKHON SI THAMMARAT",
     "prov_id": "NST",
@@ -6490,14 +7514,17 @@ const CONST_RAW = [
     "invalid": 2074,
     "blank": 4347,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 36801,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 31394,
     "margin": 5407,
     "percent_invalid": 1.9432940426887546,
     "ballot_surplus": -11
   },
   {
+    "cid": 209,
     "province_thai": "นครศรีธรรมราช",
     "province_eng": "NAKHON SI THAMMARAT",
     "prov_id": "NST",
@@ -6509,14 +7536,17 @@ const CONST_RAW = [
     "invalid": 2007,
     "blank": 2992,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 43293,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 22254,
     "margin": 21039,
     "percent_invalid": 1.9109371875803365,
     "ballot_surplus": 0
   },
   {
+    "cid": 210,
     "province_thai": "นครศรีธรรมราช",
     "province_eng": "NAKHON SI THAMMARAT",
     "prov_id": "NST",
@@ -6528,14 +7558,17 @@ const CONST_RAW = [
     "invalid": 5096,
     "blank": 11238,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 38684,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 28913,
     "margin": 9771,
     "percent_invalid": 5.143422354104846,
     "ballot_surplus": 1
   },
   {
+    "cid": 211,
     "province_thai": "นครศรีธรรมราช",
     "province_eng": "NAKHON SI THAMMARAT",
     "prov_id": "NST",
@@ -6547,14 +7580,17 @@ const CONST_RAW = [
     "invalid": 2720,
     "blank": 4361,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 54040,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 22534,
     "margin": 31506,
     "percent_invalid": 2.7219598110639662,
     "ballot_surplus": 0
   },
   {
+    "cid": 212,
     "province_thai": "นครศรีธรรมราช",
     "province_eng": "NAKHON SI THAMMARAT",
     "prov_id": "NST",
@@ -6566,14 +7602,17 @@ const CONST_RAW = [
     "invalid": 2693,
     "blank": 3334,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 46473,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 36536,
     "margin": 9937,
     "percent_invalid": 2.6376618542968524,
     "ballot_surplus": 0
   },
   {
+    "cid": 101,
     "province_thai": "กระบี่",
     "province_eng": "KRABI",
     "prov_id": "KBI",
@@ -6585,14 +7624,17 @@ const CONST_RAW = [
     "invalid": 2723,
     "blank": 4647,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 50493,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 20554,
     "margin": 29939,
     "percent_invalid": 2.794798370128604,
     "ballot_surplus": 1
   },
   {
+    "cid": 102,
     "province_thai": "กระบี่",
     "province_eng": "KRABI",
     "prov_id": "KBI",
@@ -6604,14 +7646,17 @@ const CONST_RAW = [
     "invalid": 2599,
     "blank": 4518,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 42714,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 21242,
     "margin": 21472,
     "percent_invalid": 3.018022202610432,
     "ballot_surplus": 0
   },
   {
+    "cid": 103,
     "province_thai": "กระบี่",
     "province_eng": "KRABI",
     "prov_id": "KBI",
@@ -6623,14 +7668,17 @@ const CONST_RAW = [
     "invalid": 2937,
     "blank": 3887,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 47416,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 15794,
     "margin": 31622,
     "percent_invalid": 3.1021261763680723,
     "ballot_surplus": 0
   },
   {
+    "cid": 241,
     "province_thai": "พังงา",
     "province_eng": "PHANGNGA",
     "prov_id": "PNA",
@@ -6642,14 +7690,17 @@ const CONST_RAW = [
     "invalid": 2919,
     "blank": 5142,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 36274,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 15654,
     "margin": 20620,
     "percent_invalid": 3.9230707201032176,
     "ballot_surplus": 1
   },
   {
+    "cid": 242,
     "province_thai": "พังงา",
     "province_eng": "PHANGNGA",
     "prov_id": "PNA",
@@ -6661,14 +7712,17 @@ const CONST_RAW = [
     "invalid": 2845,
     "blank": 4746,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 26513,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 23308,
     "margin": 3205,
     "percent_invalid": 3.4238744539251202,
     "ballot_surplus": 1
   },
   {
+    "cid": 230,
     "province_thai": "ภูเก็ต",
     "province_eng": "PHUKET",
     "prov_id": "PKT",
@@ -6680,14 +7734,17 @@ const CONST_RAW = [
     "invalid": 1916,
     "blank": 4613,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 19558,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 16875,
     "margin": 2683,
     "percent_invalid": 2.6286545294900465,
     "ballot_surplus": -2
   },
   {
+    "cid": 231,
     "province_thai": "ภูเก็ต",
     "province_eng": "PHUKET",
     "prov_id": "PKT",
@@ -6699,14 +7756,17 @@ const CONST_RAW = [
     "invalid": 3012,
     "blank": 5394,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 24877,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 20405,
     "margin": 4472,
     "percent_invalid": 4.191191817992069,
     "ballot_surplus": 0
   },
   {
+    "cid": 232,
     "province_thai": "ภูเก็ต",
     "province_eng": "PHUKET",
     "prov_id": "PKT",
@@ -6718,14 +7778,17 @@ const CONST_RAW = [
     "invalid": 2121,
     "blank": 4933,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 30360,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 20277,
     "margin": 10083,
     "percent_invalid": 2.5808571219975174,
     "ballot_surplus": 0
   },
   {
+    "cid": 306,
     "province_thai": "สุราษฎร์ธานี",
     "province_eng": "SURAT THANI",
     "prov_id": "SNI",
@@ -6737,14 +7800,17 @@ const CONST_RAW = [
     "invalid": 1679,
     "blank": 5204,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 27647,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 23183,
     "margin": 4464,
     "percent_invalid": 2.0194609157936516,
     "ballot_surplus": 0
   },
   {
+    "cid": 307,
     "province_thai": "สุราษฎร์ธานี",
     "province_eng": "SURAT THANI",
     "prov_id": "SNI",
@@ -6756,14 +7822,17 @@ const CONST_RAW = [
     "invalid": 2109,
     "blank": 2980,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 27071,
     "runnerup_party": "ไทรวมพลัง",
+    "runnerup_pid": 72,
     "runnerup_votes": 20059,
     "margin": 7012,
     "percent_invalid": 2.4379248162019698,
     "ballot_surplus": 0
   },
   {
+    "cid": 308,
     "province_thai": "สุราษฎร์ธานี",
     "province_eng": "SURAT THANI",
     "prov_id": "SNI",
@@ -6775,14 +7844,17 @@ const CONST_RAW = [
     "invalid": 2218,
     "blank": 3300,
     "winner_party": "ไทรวมพลัง",
+    "winner_pid": 72,
     "winner_votes": 39958,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 24524,
     "margin": 15434,
     "percent_invalid": 2.3543898011825024,
     "ballot_surplus": -1
   },
   {
+    "cid": 309,
     "province_thai": "สุราษฎร์ธานี",
     "province_eng": "SURAT THANI",
     "prov_id": "SNI",
@@ -6794,14 +7866,17 @@ const CONST_RAW = [
     "invalid": 1886,
     "blank": 2460,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 43384,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 28117,
     "margin": 15267,
     "percent_invalid": 1.909119436374495,
     "ballot_surplus": 0
   },
   {
+    "cid": 310,
     "province_thai": "สุราษฎร์ธานี",
     "province_eng": "SURAT THANI",
     "prov_id": "SNI",
@@ -6813,14 +7888,17 @@ const CONST_RAW = [
     "invalid": 2140,
     "blank": 2954,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 30967,
     "runnerup_party": "ไทรวมพลัง",
+    "runnerup_pid": 72,
     "runnerup_votes": 27863,
     "margin": 3104,
     "percent_invalid": 2.289357696093115,
     "ballot_surplus": 0
   },
   {
+    "cid": 311,
     "province_thai": "สุราษฎร์ธานี",
     "province_eng": "SURAT THANI",
     "prov_id": "SNI",
@@ -6832,14 +7910,17 @@ const CONST_RAW = [
     "invalid": 2256,
     "blank": 1819,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 31707,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 30432,
     "margin": 1275,
     "percent_invalid": 2.2069613194811293,
     "ballot_surplus": 0
   },
   {
+    "cid": 312,
     "province_thai": "สุราษฎร์ธานี",
     "province_eng": "SURAT THANI",
     "prov_id": "SNI",
@@ -6851,14 +7932,17 @@ const CONST_RAW = [
     "invalid": 1980,
     "blank": 2652,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 40358,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 30081,
     "margin": 10277,
     "percent_invalid": 2.048904663845111,
     "ballot_surplus": 0
   },
   {
+    "cid": 283,
     "province_thai": "ระนอง",
     "province_eng": "RANONG",
     "prov_id": "RNG",
@@ -6870,14 +7954,17 @@ const CONST_RAW = [
     "invalid": 4782,
     "blank": 7798,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 59363,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 14434,
     "margin": 44929,
     "percent_invalid": 4.965783652997436,
     "ballot_surplus": 0
   },
   {
+    "cid": 88,
     "province_thai": "ชุมพร",
     "province_eng": "CHUMPHON",
     "prov_id": "CPN",
@@ -6889,14 +7976,17 @@ const CONST_RAW = [
     "invalid": 2480,
     "blank": 5441,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 45966,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 34079,
     "margin": 11887,
     "percent_invalid": 2.380769526150065,
     "ballot_surplus": -1
   },
   {
+    "cid": 89,
     "province_thai": "ชุมพร",
     "province_eng": "CHUMPHON",
     "prov_id": "CPN",
@@ -6908,14 +7998,17 @@ const CONST_RAW = [
     "invalid": 2763,
     "blank": 3775,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 35467,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 23041,
     "margin": 12426,
     "percent_invalid": 2.5634126881042065,
     "ballot_surplus": -1
   },
   {
+    "cid": 90,
     "province_thai": "ชุมพร",
     "province_eng": "CHUMPHON",
     "prov_id": "CPN",
@@ -6927,14 +8020,17 @@ const CONST_RAW = [
     "invalid": 2633,
     "blank": 3689,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 42913,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 29590,
     "margin": 13323,
     "percent_invalid": 2.599543870388105,
     "ballot_surplus": 1
   },
   {
+    "cid": 290,
     "province_thai": "สงขลา",
     "province_eng": "SONGKHLA",
     "prov_id": "SKA",
@@ -6946,14 +8042,17 @@ const CONST_RAW = [
     "invalid": 2926,
     "blank": 7430,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 44252,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 21201,
     "margin": 23051,
     "percent_invalid": 3.006854312462106,
     "ballot_surplus": 1
   },
   {
+    "cid": 291,
     "province_thai": "สงขลา",
     "province_eng": "SONGKHLA",
     "prov_id": "SKA",
@@ -6965,14 +8064,17 @@ const CONST_RAW = [
     "invalid": 1411,
     "blank": 2685,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 32205,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 22288,
     "margin": 9917,
     "percent_invalid": 1.7049505189767882,
     "ballot_surplus": -2
   },
   {
+    "cid": 292,
     "province_thai": "สงขลา",
     "province_eng": "SONGKHLA",
     "prov_id": "SKA",
@@ -6984,14 +8086,17 @@ const CONST_RAW = [
     "invalid": 3394,
     "blank": 9408,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 36656,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 27002,
     "margin": 9654,
     "percent_invalid": 3.20252125421074,
     "ballot_surplus": -3432
   },
   {
+    "cid": 293,
     "province_thai": "สงขลา",
     "province_eng": "SONGKHLA",
     "prov_id": "SKA",
@@ -7003,14 +8108,17 @@ const CONST_RAW = [
     "invalid": 2640,
     "blank": 2946,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 45863,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 24612,
     "margin": 21251,
     "percent_invalid": 2.602523659305994,
     "ballot_surplus": 0
   },
   {
+    "cid": 294,
     "province_thai": "สงขลา",
     "province_eng": "SONGKHLA",
     "prov_id": "SKA",
@@ -7022,14 +8130,17 @@ const CONST_RAW = [
     "invalid": 3913,
     "blank": 6804,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 51130,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 25390,
     "margin": 25740,
     "percent_invalid": 3.7436020090887348,
     "ballot_surplus": 0
   },
   {
+    "cid": 295,
     "province_thai": "สงขลา",
     "province_eng": "SONGKHLA",
     "prov_id": "SKA",
@@ -7041,14 +8152,17 @@ const CONST_RAW = [
     "invalid": 2352,
     "blank": 2522,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 48391,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 25751,
     "margin": 22640,
     "percent_invalid": 2.5065541275017584,
     "ballot_surplus": 0
   },
   {
+    "cid": 296,
     "province_thai": "สงขลา",
     "province_eng": "SONGKHLA",
     "prov_id": "SKA",
@@ -7060,14 +8174,17 @@ const CONST_RAW = [
     "invalid": 2797,
     "blank": 2884,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 36128,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 26269,
     "margin": 9859,
     "percent_invalid": 2.8309430066497305,
     "ballot_surplus": 0
   },
   {
+    "cid": 297,
     "province_thai": "สงขลา",
     "province_eng": "SONGKHLA",
     "prov_id": "SKA",
@@ -7079,14 +8196,17 @@ const CONST_RAW = [
     "invalid": 2563,
     "blank": 2827,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 43540,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 36216,
     "margin": 7324,
     "percent_invalid": 2.564051261017017,
     "ballot_surplus": 0
   },
   {
+    "cid": 298,
     "province_thai": "สงขลา",
     "province_eng": "SONGKHLA",
     "prov_id": "SKA",
@@ -7098,14 +8218,17 @@ const CONST_RAW = [
     "invalid": 3170,
     "blank": 6794,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 49475,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 29715,
     "margin": 19760,
     "percent_invalid": 2.870076957899502,
     "ballot_surplus": 0
   },
   {
+    "cid": 358,
     "province_thai": "สตูล",
     "province_eng": "SATUN",
     "prov_id": "STN",
@@ -7117,14 +8240,17 @@ const CONST_RAW = [
     "invalid": 2515,
     "blank": 4629,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 38100,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 17251,
     "margin": 20849,
     "percent_invalid": 2.843253631790176,
     "ballot_surplus": 0
   },
   {
+    "cid": 359,
     "province_thai": "สตูล",
     "province_eng": "SATUN",
     "prov_id": "STN",
@@ -7136,14 +8262,17 @@ const CONST_RAW = [
     "invalid": 3158,
     "blank": 5607,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 56595,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 15947,
     "margin": 40648,
     "percent_invalid": 3.1796214256947244,
     "ballot_surplus": 0
   },
   {
+    "cid": 363,
     "province_thai": "ตรัง",
     "province_eng": "TRANG",
     "prov_id": "TRG",
@@ -7155,14 +8284,17 @@ const CONST_RAW = [
     "invalid": 2166,
     "blank": 6590,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 35584,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 34372,
     "margin": 1212,
     "percent_invalid": 2.1817742276660255,
     "ballot_surplus": 0
   },
   {
+    "cid": 364,
     "province_thai": "ตรัง",
     "province_eng": "TRANG",
     "prov_id": "TRG",
@@ -7174,14 +8306,17 @@ const CONST_RAW = [
     "invalid": 2259,
     "blank": 3814,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 42668,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 38154,
     "margin": 4514,
     "percent_invalid": 2.232345791252446,
     "ballot_surplus": 0
   },
   {
+    "cid": 365,
     "province_thai": "ตรัง",
     "province_eng": "TRANG",
     "prov_id": "TRG",
@@ -7193,14 +8328,17 @@ const CONST_RAW = [
     "invalid": 2502,
     "blank": 4632,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 46916,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 28897,
     "margin": 18019,
     "percent_invalid": 2.6271853835249646,
     "ballot_surplus": 0
   },
   {
+    "cid": 366,
     "province_thai": "ตรัง",
     "province_eng": "TRANG",
     "prov_id": "TRG",
@@ -7212,14 +8350,17 @@ const CONST_RAW = [
     "invalid": 2120,
     "blank": 3726,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 50809,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 29793,
     "margin": 21016,
     "percent_invalid": 2.130289297305988,
     "ballot_surplus": 0
   },
   {
+    "cid": 233,
     "province_thai": "พัทลุง",
     "province_eng": "PHATTHALUNG",
     "prov_id": "PLG",
@@ -7231,14 +8372,17 @@ const CONST_RAW = [
     "invalid": 2001,
     "blank": 3078,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 42209,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 39873,
     "margin": 2336,
     "percent_invalid": 1.7573133568110164,
     "ballot_surplus": 0
   },
   {
+    "cid": 234,
     "province_thai": "พัทลุง",
     "province_eng": "PHATTHALUNG",
     "prov_id": "PLG",
@@ -7250,14 +8394,17 @@ const CONST_RAW = [
     "invalid": 2430,
     "blank": 2863,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 58926,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 35813,
     "margin": 23113,
     "percent_invalid": 1.9857483738110027,
     "ballot_surplus": -1
   },
   {
+    "cid": 235,
     "province_thai": "พัทลุง",
     "province_eng": "PHATTHALUNG",
     "prov_id": "PLG",
@@ -7269,14 +8416,17 @@ const CONST_RAW = [
     "invalid": 3271,
     "blank": 4434,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 47653,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 31894,
     "margin": 15759,
     "percent_invalid": 2.806424489935995,
     "ballot_surplus": 0
   },
   {
+    "cid": 262,
     "province_thai": "ปัตตานี",
     "province_eng": "PATTANI",
     "prov_id": "PTN",
@@ -7288,14 +8438,17 @@ const CONST_RAW = [
     "invalid": 2134,
     "blank": 2867,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 24377,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 16415,
     "margin": 7962,
     "percent_invalid": 2.87542949538503,
     "ballot_surplus": -1
   },
   {
+    "cid": 263,
     "province_thai": "ปัตตานี",
     "province_eng": "PATTANI",
     "prov_id": "PTN",
@@ -7307,14 +8460,17 @@ const CONST_RAW = [
     "invalid": 2861,
     "blank": 2728,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 38541,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 14082,
     "margin": 24459,
     "percent_invalid": 3.5097834754339687,
     "ballot_surplus": 0
   },
   {
+    "cid": 264,
     "province_thai": "ปัตตานี",
     "province_eng": "PATTANI",
     "prov_id": "PTN",
@@ -7326,14 +8482,17 @@ const CONST_RAW = [
     "invalid": 2632,
     "blank": 1756,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 30337,
     "runnerup_party": "ประชาชาติ",
+    "runnerup_pid": 35,
     "runnerup_votes": 24253,
     "margin": 6084,
     "percent_invalid": 3.7497150672441304,
     "ballot_surplus": 0
   },
   {
+    "cid": 265,
     "province_thai": "ปัตตานี",
     "province_eng": "PATTANI",
     "prov_id": "PTN",
@@ -7345,14 +8504,17 @@ const CONST_RAW = [
     "invalid": 2222,
     "blank": 1191,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 30170,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 25931,
     "margin": 4239,
     "percent_invalid": 2.6508553840280595,
     "ballot_surplus": -2
   },
   {
+    "cid": 266,
     "province_thai": "ปัตตานี",
     "province_eng": "PATTANI",
     "prov_id": "PTN",
@@ -7364,14 +8526,17 @@ const CONST_RAW = [
     "invalid": 3279,
     "blank": 1967,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 34313,
     "runnerup_party": "ประชาชาติ",
+    "runnerup_pid": 35,
     "runnerup_votes": 24059,
     "margin": 10254,
     "percent_invalid": 4.17632524135823,
     "ballot_surplus": 0
   },
   {
+    "cid": 394,
     "province_thai": "ยะลา",
     "province_eng": "YALA",
     "prov_id": "YLA",
@@ -7383,14 +8548,17 @@ const CONST_RAW = [
     "invalid": 3077,
     "blank": 5382,
     "winner_party": "ประชาชาติ",
+    "winner_pid": 35,
     "winner_votes": 31446,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 20639,
     "margin": 10807,
     "percent_invalid": 3.1086774229397562,
     "ballot_surplus": 0
   },
   {
+    "cid": 395,
     "province_thai": "ยะลา",
     "province_eng": "YALA",
     "prov_id": "YLA",
@@ -7402,14 +8570,17 @@ const CONST_RAW = [
     "invalid": 5217,
     "blank": 3718,
     "winner_party": "ประชาชาติ",
+    "winner_pid": 35,
     "winner_votes": 46972,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 24226,
     "margin": 22746,
     "percent_invalid": 5.40190728641395,
     "ballot_surplus": 0
   },
   {
+    "cid": 396,
     "province_thai": "ยะลา",
     "province_eng": "YALA",
     "prov_id": "YLA",
@@ -7421,14 +8592,17 @@ const CONST_RAW = [
     "invalid": 4180,
     "blank": 4461,
     "winner_party": "ประชาชาติ",
+    "winner_pid": 35,
     "winner_votes": 34910,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 26180,
     "margin": 8730,
     "percent_invalid": 4.376092714538469,
     "ballot_surplus": 0
   },
   {
+    "cid": 214,
     "province_thai": "นราธิวาส",
     "province_eng": "NARATHIWAT",
     "prov_id": "NWT",
@@ -7440,14 +8614,17 @@ const CONST_RAW = [
     "invalid": 2822,
     "blank": 2851,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 40637,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 35026,
     "margin": 5611,
     "percent_invalid": 2.8362379143299363,
     "ballot_surplus": 0
   },
   {
+    "cid": 215,
     "province_thai": "นราธิวาส",
     "province_eng": "NARATHIWAT",
     "prov_id": "NWT",
@@ -7459,14 +8636,17 @@ const CONST_RAW = [
     "invalid": 3460,
     "blank": 3875,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 43544,
     "runnerup_party": "ประชาชาติ",
+    "runnerup_pid": 35,
     "runnerup_votes": 11389,
     "margin": 32155,
     "percent_invalid": 4.437604206746185,
     "ballot_surplus": 0
   },
   {
+    "cid": 216,
     "province_thai": "นราธิวาส",
     "province_eng": "NARATHIWAT",
     "prov_id": "NWT",
@@ -7478,14 +8658,17 @@ const CONST_RAW = [
     "invalid": 2416,
     "blank": 1195,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 36480,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 36214,
     "margin": 266,
     "percent_invalid": 2.914003135930527,
     "ballot_surplus": -1
   },
   {
+    "cid": 217,
     "province_thai": "นราธิวาส",
     "province_eng": "NARATHIWAT",
     "prov_id": "NWT",
@@ -7497,14 +8680,17 @@ const CONST_RAW = [
     "invalid": 2350,
     "blank": 1065,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 42262,
     "runnerup_party": "ประชาชาติ",
+    "runnerup_pid": 35,
     "runnerup_votes": 35031,
     "margin": 7231,
     "percent_invalid": 2.705658856715215,
     "ballot_surplus": 0
   },
   {
+    "cid": 218,
     "province_thai": "นราธิวาส",
     "province_eng": "NARATHIWAT",
     "prov_id": "NWT",
@@ -7516,8 +8702,10 @@ const CONST_RAW = [
     "invalid": 3121,
     "blank": 1707,
     "winner_party": "ประชาชาติ",
+    "winner_pid": 35,
     "winner_votes": 47012,
     "runnerup_party": "กล้าธรรม",
+    "runnerup_pid": 71,
     "runnerup_votes": 33134,
     "margin": 13878,
     "percent_invalid": 3.334294840977319,
@@ -7527,6 +8715,7 @@ const CONST_RAW = [
 
 const PARTYLIST_RAW = [
   {
+    "cid": 9,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7538,14 +8727,17 @@ const PARTYLIST_RAW = [
     "invalid": 1726,
     "blank": 2178,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 34215,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 16471,
     "margin": 17744,
     "percent_invalid": 2.094126496887929,
     "ballot_surplus": 0
   },
   {
+    "cid": 18,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7557,14 +8749,17 @@ const PARTYLIST_RAW = [
     "invalid": 1779,
     "blank": 2987,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 44757,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 16002,
     "margin": 28755,
     "percent_invalid": 1.7851229717932509,
     "ballot_surplus": 1
   },
   {
+    "cid": 19,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7576,14 +8771,17 @@ const PARTYLIST_RAW = [
     "invalid": 1769,
     "blank": 2486,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 44980,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 18501,
     "margin": 26479,
     "percent_invalid": 1.7625315093606466,
     "ballot_surplus": 0
   },
   {
+    "cid": 20,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7595,14 +8793,17 @@ const PARTYLIST_RAW = [
     "invalid": 1499,
     "blank": 2776,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 52294,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 19124,
     "margin": 33170,
     "percent_invalid": 1.350097722216718,
     "ballot_surplus": 0
   },
   {
+    "cid": 21,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7614,14 +8815,17 @@ const PARTYLIST_RAW = [
     "invalid": 1380,
     "blank": 2222,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 44989,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 17977,
     "margin": 27012,
     "percent_invalid": 1.4217277082367485,
     "ballot_surplus": 0
   },
   {
+    "cid": 22,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7633,14 +8837,17 @@ const PARTYLIST_RAW = [
     "invalid": 1537,
     "blank": 2321,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 44691,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 19346,
     "margin": 25345,
     "percent_invalid": 1.5490360097961158,
     "ballot_surplus": 0
   },
   {
+    "cid": 24,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7652,14 +8859,17 @@ const PARTYLIST_RAW = [
     "invalid": 1437,
     "blank": 2569,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 49131,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 16586,
     "margin": 32545,
     "percent_invalid": 1.4290544572178687,
     "ballot_surplus": 1
   },
   {
+    "cid": 25,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7671,14 +8881,17 @@ const PARTYLIST_RAW = [
     "invalid": 2180,
     "blank": 3122,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 31155,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 13309,
     "margin": 17846,
     "percent_invalid": 2.7568763831805247,
     "ballot_surplus": 0
   },
   {
+    "cid": 26,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7690,14 +8903,17 @@ const PARTYLIST_RAW = [
     "invalid": 2230,
     "blank": 2763,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 36942,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 12973,
     "margin": 23969,
     "percent_invalid": 2.561540140367805,
     "ballot_surplus": -2
   },
   {
+    "cid": 27,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7709,14 +8925,17 @@ const PARTYLIST_RAW = [
     "invalid": 1570,
     "blank": 2350,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 44830,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 18319,
     "margin": 26511,
     "percent_invalid": 1.5871411241407198,
     "ballot_surplus": 0
   },
   {
+    "cid": 10,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7728,14 +8947,17 @@ const PARTYLIST_RAW = [
     "invalid": 1516,
     "blank": 2445,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 40383,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 18021,
     "margin": 22362,
     "percent_invalid": 1.6810636386822058,
     "ballot_surplus": 0
   },
   {
+    "cid": 28,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7747,14 +8969,17 @@ const PARTYLIST_RAW = [
     "invalid": 1904,
     "blank": 2462,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 39727,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 12703,
     "margin": 27024,
     "percent_invalid": 2.1763482157145146,
     "ballot_surplus": 0
   },
   {
+    "cid": 29,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7766,14 +8991,17 @@ const PARTYLIST_RAW = [
     "invalid": 1517,
     "blank": 2554,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 46471,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 15843,
     "margin": 30628,
     "percent_invalid": 1.5661779888498866,
     "ballot_surplus": 0
   },
   {
+    "cid": 30,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7785,14 +9013,17 @@ const PARTYLIST_RAW = [
     "invalid": 1503,
     "blank": 2515,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 42832,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 17736,
     "margin": 25096,
     "percent_invalid": 1.6283680566841097,
     "ballot_surplus": 0
   },
   {
+    "cid": 31,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7804,14 +9035,17 @@ const PARTYLIST_RAW = [
     "invalid": 1321,
     "blank": 2644,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 47932,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 19116,
     "margin": 28816,
     "percent_invalid": 1.3147287438916369,
     "ballot_surplus": 0
   },
   {
+    "cid": 32,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7823,14 +9057,17 @@ const PARTYLIST_RAW = [
     "invalid": 1814,
     "blank": 2884,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 45577,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 17174,
     "margin": 28403,
     "percent_invalid": 1.8716660303965165,
     "ballot_surplus": 0
   },
   {
+    "cid": 33,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7842,14 +9079,17 @@ const PARTYLIST_RAW = [
     "invalid": 1910,
     "blank": 2448,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 41485,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 15076,
     "margin": 26409,
     "percent_invalid": 2.129628597232598,
     "ballot_surplus": 0
   },
   {
+    "cid": 34,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7861,14 +9101,17 @@ const PARTYLIST_RAW = [
     "invalid": 2079,
     "blank": 2614,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 46203,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 15036,
     "margin": 31167,
     "percent_invalid": 2.1406287002810926,
     "ballot_surplus": 0
   },
   {
+    "cid": 35,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7880,14 +9123,17 @@ const PARTYLIST_RAW = [
     "invalid": 1780,
     "blank": 2623,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 46136,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 13474,
     "margin": 32662,
     "percent_invalid": 1.8488512194108604,
     "ballot_surplus": 0
   },
   {
+    "cid": 36,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7899,14 +9145,17 @@ const PARTYLIST_RAW = [
     "invalid": 1949,
     "blank": 2948,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 48541,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 15648,
     "margin": 32893,
     "percent_invalid": 1.9586168085298818,
     "ballot_surplus": 0
   },
   {
+    "cid": 37,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7918,14 +9167,17 @@ const PARTYLIST_RAW = [
     "invalid": 2373,
     "blank": 2983,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 47605,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 16702,
     "margin": 30903,
     "percent_invalid": 2.282476963622723,
     "ballot_surplus": 0
   },
   {
+    "cid": 11,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7937,14 +9189,17 @@ const PARTYLIST_RAW = [
     "invalid": 1453,
     "blank": 2033,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 35819,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 15604,
     "margin": 20215,
     "percent_invalid": 1.76418450480203,
     "ballot_surplus": 0
   },
   {
+    "cid": 38,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7956,14 +9211,17 @@ const PARTYLIST_RAW = [
     "invalid": 1900,
     "blank": 2707,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 46986,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 15715,
     "margin": 31271,
     "percent_invalid": 1.9123923021177227,
     "ballot_surplus": 0
   },
   {
+    "cid": 39,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7975,14 +9233,17 @@ const PARTYLIST_RAW = [
     "invalid": 2072,
     "blank": 3520,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 46204,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 19622,
     "margin": 26582,
     "percent_invalid": 1.9283926028646683,
     "ballot_surplus": 0
   },
   {
+    "cid": 40,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -7994,14 +9255,17 @@ const PARTYLIST_RAW = [
     "invalid": 2107,
     "blank": 2895,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 41432,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 16304,
     "margin": 25128,
     "percent_invalid": 2.243470298242065,
     "ballot_surplus": 0
   },
   {
+    "cid": 41,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -8013,14 +9277,17 @@ const PARTYLIST_RAW = [
     "invalid": 1892,
     "blank": 2972,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 44347,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 18532,
     "margin": 25815,
     "percent_invalid": 1.8435514674357876,
     "ballot_surplus": 0
   },
   {
+    "cid": 12,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -8032,14 +9299,17 @@ const PARTYLIST_RAW = [
     "invalid": 1703,
     "blank": 1943,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 36150,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 16202,
     "margin": 19948,
     "percent_invalid": 2.05309350436418,
     "ballot_surplus": -1
   },
   {
+    "cid": 13,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -8051,14 +9321,17 @@ const PARTYLIST_RAW = [
     "invalid": 1462,
     "blank": 2211,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 46080,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 19329,
     "margin": 26751,
     "percent_invalid": 1.51410018745016,
     "ballot_surplus": 2
   },
   {
+    "cid": 14,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -8070,14 +9343,17 @@ const PARTYLIST_RAW = [
     "invalid": 1835,
     "blank": 2538,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 44984,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 17561,
     "margin": 27423,
     "percent_invalid": 1.8191371242763106,
     "ballot_surplus": -1
   },
   {
+    "cid": 15,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -8089,14 +9365,17 @@ const PARTYLIST_RAW = [
     "invalid": 1672,
     "blank": 2772,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 40808,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 16552,
     "margin": 24256,
     "percent_invalid": 1.8076261932819442,
     "ballot_surplus": 0
   },
   {
+    "cid": 16,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -8108,14 +9387,17 @@ const PARTYLIST_RAW = [
     "invalid": 1639,
     "blank": 2758,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 46772,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 20176,
     "margin": 26596,
     "percent_invalid": 1.5664274177362782,
     "ballot_surplus": 0
   },
   {
+    "cid": 17,
     "province_thai": "กรุงเทพมหานคร",
     "province_eng": "BANGKOK",
     "prov_id": "BKK",
@@ -8127,14 +9409,17 @@ const PARTYLIST_RAW = [
     "invalid": 1557,
     "blank": 2802,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 47230,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 19538,
     "margin": 27692,
     "percent_invalid": 1.515771028037383,
     "ballot_surplus": 0
   },
   {
+    "cid": 325,
     "province_thai": "สมุทรปราการ",
     "province_eng": "SAMUT PRAKAN",
     "prov_id": "SPK",
@@ -8146,14 +9431,17 @@ const PARTYLIST_RAW = [
     "invalid": 3047,
     "blank": 3114,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 43207,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 15344,
     "margin": 27863,
     "percent_invalid": 3.1380020597322344,
     "ballot_surplus": -1
   },
   {
+    "cid": 326,
     "province_thai": "สมุทรปราการ",
     "province_eng": "SAMUT PRAKAN",
     "prov_id": "SPK",
@@ -8165,14 +9453,17 @@ const PARTYLIST_RAW = [
     "invalid": 3075,
     "blank": 3272,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 43068,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 16377,
     "margin": 26691,
     "percent_invalid": 3.1925165336018857,
     "ballot_surplus": 0
   },
   {
+    "cid": 327,
     "province_thai": "สมุทรปราการ",
     "province_eng": "SAMUT PRAKAN",
     "prov_id": "SPK",
@@ -8184,14 +9475,17 @@ const PARTYLIST_RAW = [
     "invalid": 2252,
     "blank": 3285,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 45185,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 14946,
     "margin": 30239,
     "percent_invalid": 2.335227508399353,
     "ballot_surplus": 0
   },
   {
+    "cid": 328,
     "province_thai": "สมุทรปราการ",
     "province_eng": "SAMUT PRAKAN",
     "prov_id": "SPK",
@@ -8203,14 +9497,17 @@ const PARTYLIST_RAW = [
     "invalid": 1705,
     "blank": 3221,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 50487,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 16280,
     "margin": 34207,
     "percent_invalid": 1.697142231468302,
     "ballot_surplus": 0
   },
   {
+    "cid": 329,
     "province_thai": "สมุทรปราการ",
     "province_eng": "SAMUT PRAKAN",
     "prov_id": "SPK",
@@ -8222,14 +9519,17 @@ const PARTYLIST_RAW = [
     "invalid": 2210,
     "blank": 4078,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 56547,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 16262,
     "margin": 40285,
     "percent_invalid": 1.9866954332973752,
     "ballot_surplus": 0
   },
   {
+    "cid": 330,
     "province_thai": "สมุทรปราการ",
     "province_eng": "SAMUT PRAKAN",
     "prov_id": "SPK",
@@ -8241,14 +9541,17 @@ const PARTYLIST_RAW = [
     "invalid": 3421,
     "blank": 3117,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 35615,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 22294,
     "margin": 13321,
     "percent_invalid": 3.7328008554562615,
     "ballot_surplus": 0
   },
   {
+    "cid": 331,
     "province_thai": "สมุทรปราการ",
     "province_eng": "SAMUT PRAKAN",
     "prov_id": "SPK",
@@ -8260,14 +9563,17 @@ const PARTYLIST_RAW = [
     "invalid": 3291,
     "blank": 4022,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 48816,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 16854,
     "margin": 31962,
     "percent_invalid": 3.117156198793298,
     "ballot_surplus": 0
   },
   {
+    "cid": 332,
     "province_thai": "สมุทรปราการ",
     "province_eng": "SAMUT PRAKAN",
     "prov_id": "SPK",
@@ -8279,14 +9585,17 @@ const PARTYLIST_RAW = [
     "invalid": 4044,
     "blank": 3572,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 47267,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 15086,
     "margin": 32181,
     "percent_invalid": 3.615297967065387,
     "ballot_surplus": 1
   },
   {
+    "cid": 158,
     "province_thai": "นนทบุรี",
     "province_eng": "NONTHABURI",
     "prov_id": "NBI",
@@ -8298,14 +9607,17 @@ const PARTYLIST_RAW = [
     "invalid": 1903,
     "blank": 2999,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 43908,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 19003,
     "margin": 24905,
     "percent_invalid": 1.8746552131767673,
     "ballot_surplus": -1
   },
   {
+    "cid": 159,
     "province_thai": "นนทบุรี",
     "province_eng": "NONTHABURI",
     "prov_id": "NBI",
@@ -8317,14 +9629,17 @@ const PARTYLIST_RAW = [
     "invalid": 1809,
     "blank": 3107,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 38205,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 16577,
     "margin": 21628,
     "percent_invalid": 2.0416685476953638,
     "ballot_surplus": 0
   },
   {
+    "cid": 160,
     "province_thai": "นนทบุรี",
     "province_eng": "NONTHABURI",
     "prov_id": "NBI",
@@ -8336,14 +9651,17 @@ const PARTYLIST_RAW = [
     "invalid": 2231,
     "blank": 3843,
     "winner_party": "พลังประชารัฐ",
+    "winner_pid": 38,
     "winner_votes": 47712,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 18327,
     "margin": 29385,
     "percent_invalid": 2.0893425735156397,
     "ballot_surplus": 0
   },
   {
+    "cid": 161,
     "province_thai": "นนทบุรี",
     "province_eng": "NONTHABURI",
     "prov_id": "NBI",
@@ -8355,14 +9673,17 @@ const PARTYLIST_RAW = [
     "invalid": 1706,
     "blank": 2973,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 38204,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 20330,
     "margin": 17874,
     "percent_invalid": 1.8407423392317652,
     "ballot_surplus": 0
   },
   {
+    "cid": 162,
     "province_thai": "นนทบุรี",
     "province_eng": "NONTHABURI",
     "prov_id": "NBI",
@@ -8374,14 +9695,17 @@ const PARTYLIST_RAW = [
     "invalid": 2432,
     "blank": 3387,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 43742,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 22453,
     "margin": 21289,
     "percent_invalid": 2.3243589375997553,
     "ballot_surplus": 0
   },
   {
+    "cid": 163,
     "province_thai": "นนทบุรี",
     "province_eng": "NONTHABURI",
     "prov_id": "NBI",
@@ -8393,14 +9717,17 @@ const PARTYLIST_RAW = [
     "invalid": 2576,
     "blank": 4084,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 46633,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 18715,
     "margin": 27918,
     "percent_invalid": 2.341371192772289,
     "ballot_surplus": 2
   },
   {
+    "cid": 164,
     "province_thai": "นนทบุรี",
     "province_eng": "NONTHABURI",
     "prov_id": "NBI",
@@ -8412,14 +9739,17 @@ const PARTYLIST_RAW = [
     "invalid": 2544,
     "blank": 3962,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 44379,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 16712,
     "margin": 27667,
     "percent_invalid": 2.462420024585483,
     "ballot_surplus": 0
   },
   {
+    "cid": 165,
     "province_thai": "นนทบุรี",
     "province_eng": "NONTHABURI",
     "prov_id": "NBI",
@@ -8431,14 +9761,17 @@ const PARTYLIST_RAW = [
     "invalid": 2555,
     "blank": 3171,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 39512,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 20403,
     "margin": 19109,
     "percent_invalid": 2.647421484006673,
     "ballot_surplus": 0
   },
   {
+    "cid": 255,
     "province_thai": "ปทุมธานี",
     "province_eng": "PATHUM THANI",
     "prov_id": "PTE",
@@ -8450,14 +9783,17 @@ const PARTYLIST_RAW = [
     "invalid": 3358,
     "blank": 3548,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 40343,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 14877,
     "margin": 25466,
     "percent_invalid": 3.271756498694415,
     "ballot_surplus": 0
   },
   {
+    "cid": 256,
     "province_thai": "ปทุมธานี",
     "province_eng": "PATHUM THANI",
     "prov_id": "PTE",
@@ -8469,14 +9805,17 @@ const PARTYLIST_RAW = [
     "invalid": 3225,
     "blank": 3025,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 39803,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 18839,
     "margin": 20964,
     "percent_invalid": 3.136793370423686,
     "ballot_surplus": 0
   },
   {
+    "cid": 257,
     "province_thai": "ปทุมธานี",
     "province_eng": "PATHUM THANI",
     "prov_id": "PTE",
@@ -8488,14 +9827,17 @@ const PARTYLIST_RAW = [
     "invalid": 1840,
     "blank": 3179,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 45220,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 16287,
     "margin": 28933,
     "percent_invalid": 1.9616413821042868,
     "ballot_surplus": 0
   },
   {
+    "cid": 258,
     "province_thai": "ปทุมธานี",
     "province_eng": "PATHUM THANI",
     "prov_id": "PTE",
@@ -8507,14 +9849,17 @@ const PARTYLIST_RAW = [
     "invalid": 2473,
     "blank": 2910,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 44890,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 14450,
     "margin": 30440,
     "percent_invalid": 2.500606697945316,
     "ballot_surplus": -2
   },
   {
+    "cid": 259,
     "province_thai": "ปทุมธานี",
     "province_eng": "PATHUM THANI",
     "prov_id": "PTE",
@@ -8526,14 +9871,17 @@ const PARTYLIST_RAW = [
     "invalid": 1838,
     "blank": 2784,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 38966,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 14717,
     "margin": 24249,
     "percent_invalid": 2.0504467921328886,
     "ballot_surplus": 0
   },
   {
+    "cid": 260,
     "province_thai": "ปทุมธานี",
     "province_eng": "PATHUM THANI",
     "prov_id": "PTE",
@@ -8545,14 +9893,17 @@ const PARTYLIST_RAW = [
     "invalid": 1489,
     "blank": 2779,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 44639,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 13846,
     "margin": 30793,
     "percent_invalid": 1.6285148688110418,
     "ballot_surplus": 1
   },
   {
+    "cid": 261,
     "province_thai": "ปทุมธานี",
     "province_eng": "PATHUM THANI",
     "prov_id": "PTE",
@@ -8564,14 +9915,17 @@ const PARTYLIST_RAW = [
     "invalid": 2885,
     "blank": 2699,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 35826,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 23403,
     "margin": 12423,
     "percent_invalid": 3.1311388228654535,
     "ballot_surplus": 0
   },
   {
+    "cid": 400,
     "province_thai": "ปทุมธานี",
     "province_eng": "PATHUM THANI",
     "prov_id": "PTE",
@@ -8583,14 +9937,17 @@ const PARTYLIST_RAW = [
     "invalid": 3575,
     "blank": 2756,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 32473,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 21685,
     "margin": 10788,
     "percent_invalid": 3.8564848275638877,
     "ballot_surplus": 0
   },
   {
+    "cid": 4,
     "province_thai": "พระนครศรีอยุธยา",
     "province_eng": "PHRA NAKHON SI AYUTTHAYA",
     "prov_id": "AYA",
@@ -8602,14 +9959,17 @@ const PARTYLIST_RAW = [
     "invalid": 4398,
     "blank": 4468,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 39154,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 25327,
     "margin": 13827,
     "percent_invalid": 4.136335421251623,
     "ballot_surplus": -100
   },
   {
+    "cid": 5,
     "province_thai": "พระนครศรีอยุธยา",
     "province_eng": "PHRA NAKHON SI AYUTTHAYA",
     "prov_id": "AYA",
@@ -8621,14 +9981,17 @@ const PARTYLIST_RAW = [
     "invalid": 5739,
     "blank": 4270,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 31722,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 25406,
     "margin": 6316,
     "percent_invalid": 5.590406982407606,
     "ballot_surplus": 0
   },
   {
+    "cid": 6,
     "province_thai": "พระนครศรีอยุธยา",
     "province_eng": "PHRA NAKHON SI AYUTTHAYA",
     "prov_id": "AYA",
@@ -8640,14 +10003,17 @@ const PARTYLIST_RAW = [
     "invalid": 4733,
     "blank": 3599,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 40508,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 24058,
     "margin": 16450,
     "percent_invalid": 4.3878515936439655,
     "ballot_surplus": 0
   },
   {
+    "cid": 7,
     "province_thai": "พระนครศรีอยุธยา",
     "province_eng": "PHRA NAKHON SI AYUTTHAYA",
     "prov_id": "AYA",
@@ -8659,14 +10025,17 @@ const PARTYLIST_RAW = [
     "invalid": 4351,
     "blank": 3614,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 42043,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 29154,
     "margin": 12889,
     "percent_invalid": 3.80511780036031,
     "ballot_surplus": 0
   },
   {
+    "cid": 8,
     "province_thai": "พระนครศรีอยุธยา",
     "province_eng": "PHRA NAKHON SI AYUTTHAYA",
     "prov_id": "AYA",
@@ -8678,14 +10047,17 @@ const PARTYLIST_RAW = [
     "invalid": 5586,
     "blank": 3144,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 30671,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 27098,
     "margin": 3573,
     "percent_invalid": 5.273940916000265,
     "ballot_surplus": -1
   },
   {
+    "cid": 2,
     "province_thai": "อ่างทอง",
     "province_eng": "ANG THONG",
     "prov_id": "ATG",
@@ -8697,14 +10069,17 @@ const PARTYLIST_RAW = [
     "invalid": 4357,
     "blank": 2955,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 29240,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 25348,
     "margin": 3892,
     "percent_invalid": 5.089002055690525,
     "ballot_surplus": 0
   },
   {
+    "cid": 3,
     "province_thai": "อ่างทอง",
     "province_eng": "ANG THONG",
     "prov_id": "ATG",
@@ -8716,14 +10091,17 @@ const PARTYLIST_RAW = [
     "invalid": 5357,
     "blank": 2755,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 29687,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 21563,
     "margin": 8124,
     "percent_invalid": 6.201810646229363,
     "ballot_surplus": 0
   },
   {
+    "cid": 140,
     "province_thai": "ลพบุรี",
     "province_eng": "LOP BURI",
     "prov_id": "LRI",
@@ -8735,14 +10113,17 @@ const PARTYLIST_RAW = [
     "invalid": 6429,
     "blank": 5019,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 32064,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 22112,
     "margin": 9952,
     "percent_invalid": 5.830605008026264,
     "ballot_surplus": 0
   },
   {
+    "cid": 141,
     "province_thai": "ลพบุรี",
     "province_eng": "LOP BURI",
     "prov_id": "LRI",
@@ -8754,14 +10135,17 @@ const PARTYLIST_RAW = [
     "invalid": 6589,
     "blank": 4403,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 33148,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 30490,
     "margin": 2658,
     "percent_invalid": 5.543916332214286,
     "ballot_surplus": 0
   },
   {
+    "cid": 142,
     "province_thai": "ลพบุรี",
     "province_eng": "LOP BURI",
     "prov_id": "LRI",
@@ -8773,14 +10157,17 @@ const PARTYLIST_RAW = [
     "invalid": 6371,
     "blank": 2897,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 25969,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 23514,
     "margin": 2455,
     "percent_invalid": 6.014349098461248,
     "ballot_surplus": -1
   },
   {
+    "cid": 143,
     "province_thai": "ลพบุรี",
     "province_eng": "LOP BURI",
     "prov_id": "LRI",
@@ -8792,14 +10179,17 @@ const PARTYLIST_RAW = [
     "invalid": 6429,
     "blank": 5019,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 32064,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 22112,
     "margin": 9952,
     "percent_invalid": 5.830605008026264,
     "ballot_surplus": 5932
   },
   {
+    "cid": 289,
     "province_thai": "สิงห์บุรี",
     "province_eng": "SING BURI",
     "prov_id": "SBR",
@@ -8811,14 +10201,17 @@ const PARTYLIST_RAW = [
     "invalid": 7036,
     "blank": 5532,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 36568,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 25435,
     "margin": 11133,
     "percent_invalid": 5.526710601764211,
     "ballot_surplus": 0
   },
   {
+    "cid": 79,
     "province_thai": "ชัยนาท",
     "province_eng": "CHAI NAT",
     "prov_id": "CNT",
@@ -8830,14 +10223,17 @@ const PARTYLIST_RAW = [
     "invalid": 5608,
     "blank": 4739,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 27137,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 14665,
     "margin": 12472,
     "percent_invalid": 5.936401744506076,
     "ballot_surplus": 1
   },
   {
+    "cid": 80,
     "province_thai": "ชัยนาท",
     "province_eng": "CHAI NAT",
     "prov_id": "CNT",
@@ -8849,14 +10245,17 @@ const PARTYLIST_RAW = [
     "invalid": 7016,
     "blank": 3866,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 26315,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 22973,
     "margin": 3342,
     "percent_invalid": 7.379126831371807,
     "ballot_surplus": 0
   },
   {
+    "cid": 333,
     "province_thai": "สระบุรี",
     "province_eng": "SARABURI",
     "prov_id": "SRI",
@@ -8868,14 +10267,17 @@ const PARTYLIST_RAW = [
     "invalid": 4541,
     "blank": 4402,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 34618,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 18236,
     "margin": 16382,
     "percent_invalid": 4.612774775506887,
     "ballot_surplus": 1
   },
   {
+    "cid": 334,
     "province_thai": "สระบุรี",
     "province_eng": "SARABURI",
     "prov_id": "SRI",
@@ -8887,14 +10289,17 @@ const PARTYLIST_RAW = [
     "invalid": 6242,
     "blank": 3949,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 34912,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 17661,
     "margin": 17251,
     "percent_invalid": 5.789546909057181,
     "ballot_surplus": 0
   },
   {
+    "cid": 335,
     "province_thai": "สระบุรี",
     "province_eng": "SARABURI",
     "prov_id": "SRI",
@@ -8906,14 +10311,17 @@ const PARTYLIST_RAW = [
     "invalid": 5123,
     "blank": 4347,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 34702,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 20026,
     "margin": 14676,
     "percent_invalid": 5.159269665750224,
     "ballot_surplus": 0
   },
   {
+    "cid": 336,
     "province_thai": "สระบุรี",
     "province_eng": "SARABURI",
     "prov_id": "SRI",
@@ -8925,14 +10333,17 @@ const PARTYLIST_RAW = [
     "invalid": 5645,
     "blank": 5508,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 34034,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 12817,
     "margin": 21217,
     "percent_invalid": 5.633901214607224,
     "ballot_surplus": 0
   },
   {
+    "cid": 55,
     "province_thai": "ชลบุรี",
     "province_eng": "CHON BURI",
     "prov_id": "CBI",
@@ -8944,14 +10355,17 @@ const PARTYLIST_RAW = [
     "invalid": 3108,
     "blank": 3024,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 44014,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 28747,
     "margin": 15267,
     "percent_invalid": 2.9785521246621816,
     "ballot_surplus": -2
   },
   {
+    "cid": 64,
     "province_thai": "ชลบุรี",
     "province_eng": "CHON BURI",
     "prov_id": "CBI",
@@ -8963,14 +10377,17 @@ const PARTYLIST_RAW = [
     "invalid": 2723,
     "blank": 4354,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 33067,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 19065,
     "margin": 14002,
     "percent_invalid": 3.056185324025231,
     "ballot_surplus": 1
   },
   {
+    "cid": 56,
     "province_thai": "ชลบุรี",
     "province_eng": "CHON BURI",
     "prov_id": "CBI",
@@ -8982,14 +10399,17 @@ const PARTYLIST_RAW = [
     "invalid": 2290,
     "blank": 2602,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 34047,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 21207,
     "margin": 12840,
     "percent_invalid": 2.724536293440887,
     "ballot_surplus": 0
   },
   {
+    "cid": 57,
     "province_thai": "ชลบุรี",
     "province_eng": "CHON BURI",
     "prov_id": "CBI",
@@ -9001,14 +10421,17 @@ const PARTYLIST_RAW = [
     "invalid": 3382,
     "blank": 3220,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 40642,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 21635,
     "margin": 19007,
     "percent_invalid": 3.432491956682804,
     "ballot_surplus": 0
   },
   {
+    "cid": 58,
     "province_thai": "ชลบุรี",
     "province_eng": "CHON BURI",
     "prov_id": "CBI",
@@ -9020,14 +10443,17 @@ const PARTYLIST_RAW = [
     "invalid": 4979,
     "blank": 2951,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 27214,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 20031,
     "margin": 7183,
     "percent_invalid": 5.606413764370728,
     "ballot_surplus": 0
   },
   {
+    "cid": 59,
     "province_thai": "ชลบุรี",
     "province_eng": "CHON BURI",
     "prov_id": "CBI",
@@ -9039,14 +10465,17 @@ const PARTYLIST_RAW = [
     "invalid": 5121,
     "blank": 3802,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 31880,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 24984,
     "margin": 6896,
     "percent_invalid": 4.925032939343521,
     "ballot_surplus": 0
   },
   {
+    "cid": 60,
     "province_thai": "ชลบุรี",
     "province_eng": "CHON BURI",
     "prov_id": "CBI",
@@ -9058,14 +10487,17 @@ const PARTYLIST_RAW = [
     "invalid": 3018,
     "blank": 2850,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 42133,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 22453,
     "margin": 19680,
     "percent_invalid": 3.1260034180951886,
     "ballot_surplus": 0
   },
   {
+    "cid": 61,
     "province_thai": "ชลบุรี",
     "province_eng": "CHON BURI",
     "prov_id": "CBI",
@@ -9077,14 +10509,17 @@ const PARTYLIST_RAW = [
     "invalid": 2295,
     "blank": 2482,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 43372,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 17853,
     "margin": 25519,
     "percent_invalid": 2.5854493837730663,
     "ballot_surplus": 1
   },
   {
+    "cid": 62,
     "province_thai": "ชลบุรี",
     "province_eng": "CHON BURI",
     "prov_id": "CBI",
@@ -9096,14 +10531,17 @@ const PARTYLIST_RAW = [
     "invalid": 3271,
     "blank": 2826,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 38807,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 21336,
     "margin": 17471,
     "percent_invalid": 3.468459393258189,
     "ballot_surplus": 1
   },
   {
+    "cid": 63,
     "province_thai": "ชลบุรี",
     "province_eng": "CHON BURI",
     "prov_id": "CBI",
@@ -9115,14 +10553,17 @@ const PARTYLIST_RAW = [
     "invalid": 2010,
     "blank": 2080,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 30288,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 14834,
     "margin": 15454,
     "percent_invalid": 2.905506006157938,
     "ballot_surplus": 1
   },
   {
+    "cid": 284,
     "province_thai": "ระยอง",
     "province_eng": "RAYONG",
     "prov_id": "RYG",
@@ -9134,14 +10575,17 @@ const PARTYLIST_RAW = [
     "invalid": 2322,
     "blank": 2762,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 40117,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 17260,
     "margin": 22857,
     "percent_invalid": 2.539897835289485,
     "ballot_surplus": 0
   },
   {
+    "cid": 285,
     "province_thai": "ระยอง",
     "province_eng": "RAYONG",
     "prov_id": "RYG",
@@ -9153,14 +10597,17 @@ const PARTYLIST_RAW = [
     "invalid": 2183,
     "blank": 2701,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 31608,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 17477,
     "margin": 14131,
     "percent_invalid": 2.8080420884732638,
     "ballot_surplus": 0
   },
   {
+    "cid": 286,
     "province_thai": "ระยอง",
     "province_eng": "RAYONG",
     "prov_id": "RYG",
@@ -9172,14 +10619,17 @@ const PARTYLIST_RAW = [
     "invalid": 3657,
     "blank": 4014,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 27801,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 17400,
     "margin": 10401,
     "percent_invalid": 4.286065890791463,
     "ballot_surplus": 0
   },
   {
+    "cid": 287,
     "province_thai": "ระยอง",
     "province_eng": "RAYONG",
     "prov_id": "RYG",
@@ -9191,14 +10641,17 @@ const PARTYLIST_RAW = [
     "invalid": 3406,
     "blank": 2856,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 36093,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 19236,
     "margin": 16857,
     "percent_invalid": 4.0201123648552946,
     "ballot_surplus": 0
   },
   {
+    "cid": 288,
     "province_thai": "ระยอง",
     "province_eng": "RAYONG",
     "prov_id": "RYG",
@@ -9210,14 +10663,17 @@ const PARTYLIST_RAW = [
     "invalid": 3110,
     "blank": 2897,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 39716,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 16119,
     "margin": 23597,
     "percent_invalid": 3.4729977218921695,
     "ballot_surplus": -1
   },
   {
+    "cid": 98,
     "province_thai": "จันทบุรี",
     "province_eng": "CHANTHABURI",
     "prov_id": "CTI",
@@ -9229,14 +10685,17 @@ const PARTYLIST_RAW = [
     "invalid": 4473,
     "blank": 5629,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 36381,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 25749,
     "margin": 10632,
     "percent_invalid": 4.046828491554406,
     "ballot_surplus": 0
   },
   {
+    "cid": 99,
     "province_thai": "จันทบุรี",
     "province_eng": "CHANTHABURI",
     "prov_id": "CTI",
@@ -9248,14 +10707,17 @@ const PARTYLIST_RAW = [
     "invalid": 5530,
     "blank": 5400,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 29101,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 20491,
     "margin": 8610,
     "percent_invalid": 5.375194401244168,
     "ballot_surplus": 0
   },
   {
+    "cid": 100,
     "province_thai": "จันทบุรี",
     "province_eng": "CHANTHABURI",
     "prov_id": "CTI",
@@ -9267,14 +10729,17 @@ const PARTYLIST_RAW = [
     "invalid": 5733,
     "blank": 4671,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 26341,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 21523,
     "margin": 4818,
     "percent_invalid": 5.676181423946298,
     "ballot_surplus": 0
   },
   {
+    "cid": 367,
     "province_thai": "ตราด",
     "province_eng": "TRAT",
     "prov_id": "TRT",
@@ -9286,14 +10751,17 @@ const PARTYLIST_RAW = [
     "invalid": 6120,
     "blank": 4149,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 34158,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 32353,
     "margin": 1805,
     "percent_invalid": 4.887593339456135,
     "ballot_surplus": 0
   },
   {
+    "cid": 65,
     "province_thai": "ฉะเชิงเทรา",
     "province_eng": "CHACHOENGSAO",
     "prov_id": "CCO",
@@ -9305,14 +10773,17 @@ const PARTYLIST_RAW = [
     "invalid": 4049,
     "blank": 5350,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 40400,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 16774,
     "margin": 23626,
     "percent_invalid": 3.680373763816172,
     "ballot_surplus": 0
   },
   {
+    "cid": 66,
     "province_thai": "ฉะเชิงเทรา",
     "province_eng": "CHACHOENGSAO",
     "prov_id": "CCO",
@@ -9324,14 +10795,17 @@ const PARTYLIST_RAW = [
     "invalid": 6636,
     "blank": 4075,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 32949,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 17513,
     "margin": 15436,
     "percent_invalid": 5.599102253647095,
     "ballot_surplus": 1
   },
   {
+    "cid": 67,
     "province_thai": "ฉะเชิงเทรา",
     "province_eng": "CHACHOENGSAO",
     "prov_id": "CCO",
@@ -9343,14 +10817,17 @@ const PARTYLIST_RAW = [
     "invalid": 6896,
     "blank": 3536,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 31106,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 14171,
     "margin": 16935,
     "percent_invalid": 6.592734225621415,
     "ballot_surplus": 0
   },
   {
+    "cid": 68,
     "province_thai": "ฉะเชิงเทรา",
     "province_eng": "CHACHOENGSAO",
     "prov_id": "CCO",
@@ -9362,14 +10839,17 @@ const PARTYLIST_RAW = [
     "invalid": 6509,
     "blank": 4310,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 44634,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 15240,
     "margin": 29394,
     "percent_invalid": 5.322898522280284,
     "ballot_surplus": -1
   },
   {
+    "cid": 252,
     "province_thai": "ปราจีนบุรี",
     "province_eng": "PRACHIN BURI",
     "prov_id": "PRI",
@@ -9381,14 +10861,17 @@ const PARTYLIST_RAW = [
     "invalid": 4566,
     "blank": 5346,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 30816,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 19725,
     "margin": 11091,
     "percent_invalid": 4.815896889601418,
     "ballot_surplus": 0
   },
   {
+    "cid": 254,
     "province_thai": "ปราจีนบุรี",
     "province_eng": "PRACHIN BURI",
     "prov_id": "PRI",
@@ -9400,14 +10883,17 @@ const PARTYLIST_RAW = [
     "invalid": 5140,
     "blank": 3816,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 29333,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 18183,
     "margin": 11150,
     "percent_invalid": 5.476883078136155,
     "ballot_surplus": -1
   },
   {
+    "cid": 219,
     "province_thai": "นครนายก",
     "province_eng": "NAKHON NAYOK",
     "prov_id": "NYK",
@@ -9419,14 +10905,17 @@ const PARTYLIST_RAW = [
     "invalid": 4579,
     "blank": 3269,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 22429,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 15677,
     "margin": 6752,
     "percent_invalid": 5.528190269226125,
     "ballot_surplus": 0
   },
   {
+    "cid": 220,
     "province_thai": "นครนายก",
     "province_eng": "NAKHON NAYOK",
     "prov_id": "NYK",
@@ -9438,14 +10927,17 @@ const PARTYLIST_RAW = [
     "invalid": 5064,
     "blank": 3229,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 23599,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 16575,
     "margin": 7024,
     "percent_invalid": 5.774296172134232,
     "ballot_surplus": 0
   },
   {
+    "cid": 303,
     "province_thai": "สระแก้ว",
     "province_eng": "SA KAEO",
     "prov_id": "SKW",
@@ -9457,14 +10949,17 @@ const PARTYLIST_RAW = [
     "invalid": 5988,
     "blank": 3163,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 24351,
     "runnerup_party": "พลังประชารัฐ",
+    "runnerup_pid": 38,
     "runnerup_votes": 17510,
     "margin": 6841,
     "percent_invalid": 6.136314726950391,
     "ballot_surplus": 1
   },
   {
+    "cid": 304,
     "province_thai": "สระแก้ว",
     "province_eng": "SA KAEO",
     "prov_id": "SKW",
@@ -9476,14 +10971,17 @@ const PARTYLIST_RAW = [
     "invalid": 4936,
     "blank": 3187,
     "winner_party": "พลังประชารัฐ",
+    "winner_pid": 38,
     "winner_votes": 22924,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 22827,
     "margin": 97,
     "percent_invalid": 5.064434047443159,
     "ballot_surplus": 0
   },
   {
+    "cid": 305,
     "province_thai": "สระแก้ว",
     "province_eng": "SA KAEO",
     "prov_id": "SKW",
@@ -9495,14 +10993,17 @@ const PARTYLIST_RAW = [
     "invalid": 6205,
     "blank": 3399,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 20087,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 17896,
     "margin": 2191,
     "percent_invalid": 6.087093008426773,
     "ballot_surplus": 0
   },
   {
+    "cid": 172,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -9514,14 +11015,17 @@ const PARTYLIST_RAW = [
     "invalid": 2694,
     "blank": 4321,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 33049,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 16325,
     "margin": 16724,
     "percent_invalid": 2.9749218724118514,
     "ballot_surplus": 0
   },
   {
+    "cid": 181,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -9533,14 +11037,17 @@ const PARTYLIST_RAW = [
     "invalid": 6762,
     "blank": 3682,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 28421,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 26222,
     "margin": 2199,
     "percent_invalid": 6.03582936865689,
     "ballot_surplus": 0
   },
   {
+    "cid": 182,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -9552,14 +11059,17 @@ const PARTYLIST_RAW = [
     "invalid": 5329,
     "blank": 3407,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 27538,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 20978,
     "margin": 6560,
     "percent_invalid": 5.693254417640649,
     "ballot_surplus": 0
   },
   {
+    "cid": 183,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -9571,14 +11081,17 @@ const PARTYLIST_RAW = [
     "invalid": 5872,
     "blank": 3556,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 24403,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 17486,
     "margin": 6917,
     "percent_invalid": 6.190305509287566,
     "ballot_surplus": 0
   },
   {
+    "cid": 184,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -9590,14 +11103,17 @@ const PARTYLIST_RAW = [
     "invalid": 5171,
     "blank": 3521,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 23462,
     "runnerup_party": "เศรษฐกิจ",
+    "runnerup_pid": -1,
     "runnerup_votes": 16963,
     "margin": 6499,
     "percent_invalid": 6.588100394954771,
     "ballot_surplus": 0
   },
   {
+    "cid": 185,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -9609,14 +11125,17 @@ const PARTYLIST_RAW = [
     "invalid": 3781,
     "blank": 3907,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 29452,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 13130,
     "margin": 16322,
     "percent_invalid": 4.52305189367658,
     "ballot_surplus": 0
   },
   {
+    "cid": 186,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -9628,14 +11147,17 @@ const PARTYLIST_RAW = [
     "invalid": 5696,
     "blank": 2093,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 24078,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 23134,
     "margin": 944,
     "percent_invalid": 5.703928460560179,
     "ballot_surplus": 1
   },
   {
+    "cid": 187,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -9647,14 +11169,17 @@ const PARTYLIST_RAW = [
     "invalid": 5370,
     "blank": 2049,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 20331,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 18961,
     "margin": 1370,
     "percent_invalid": 6.010543635203653,
     "ballot_surplus": 0
   },
   {
+    "cid": 173,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -9666,14 +11191,17 @@ const PARTYLIST_RAW = [
     "invalid": 4214,
     "blank": 4761,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 41053,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 16583,
     "margin": 24470,
     "percent_invalid": 3.981142948917798,
     "ballot_surplus": 1
   },
   {
+    "cid": 174,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -9685,14 +11213,17 @@ const PARTYLIST_RAW = [
     "invalid": 4294,
     "blank": 4434,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 38269,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 17187,
     "margin": 21082,
     "percent_invalid": 4.188042524139276,
     "ballot_surplus": 0
   },
   {
+    "cid": 175,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -9704,14 +11235,17 @@ const PARTYLIST_RAW = [
     "invalid": 4683,
     "blank": 4102,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 27663,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 17928,
     "margin": 9735,
     "percent_invalid": 4.982975101085337,
     "ballot_surplus": 0
   },
   {
+    "cid": 176,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -9723,14 +11257,17 @@ const PARTYLIST_RAW = [
     "invalid": 5849,
     "blank": 3277,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 22285,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 22017,
     "margin": 268,
     "percent_invalid": 6.148363835132606,
     "ballot_surplus": -2
   },
   {
+    "cid": 177,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -9742,14 +11279,17 @@ const PARTYLIST_RAW = [
     "invalid": 4838,
     "blank": 1683,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 21489,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 19790,
     "margin": 1699,
     "percent_invalid": 5.641193069191484,
     "ballot_surplus": 0
   },
   {
+    "cid": 178,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -9761,14 +11301,17 @@ const PARTYLIST_RAW = [
     "invalid": 4463,
     "blank": 1940,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 23996,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 19324,
     "margin": 4672,
     "percent_invalid": 5.443147585769517,
     "ballot_surplus": 0
   },
   {
+    "cid": 179,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -9780,14 +11323,17 @@ const PARTYLIST_RAW = [
     "invalid": 4520,
     "blank": 3003,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 25325,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 20201,
     "margin": 5124,
     "percent_invalid": 5.123148242601471,
     "ballot_surplus": -1
   },
   {
+    "cid": 180,
     "province_thai": "นครราชสีมา",
     "province_eng": "NAKHON RATCHASIMA",
     "prov_id": "NMA",
@@ -9799,14 +11345,17 @@ const PARTYLIST_RAW = [
     "invalid": 5140,
     "blank": 1989,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 26202,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 20305,
     "margin": 5897,
     "percent_invalid": 5.557718091778037,
     "ballot_surplus": 1
   },
   {
+    "cid": 45,
     "province_thai": "บุรีรัมย์",
     "province_eng": "BURI RAM",
     "prov_id": "BRM",
@@ -9818,14 +11367,17 @@ const PARTYLIST_RAW = [
     "invalid": 3698,
     "blank": 1840,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 47958,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 16650,
     "margin": 31308,
     "percent_invalid": 4.2908694290057205,
     "ballot_surplus": -1
   },
   {
+    "cid": 54,
     "province_thai": "บุรีรัมย์",
     "province_eng": "BURI RAM",
     "prov_id": "BRM",
@@ -9837,14 +11389,17 @@ const PARTYLIST_RAW = [
     "invalid": 3791,
     "blank": 1359,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 40255,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 12025,
     "margin": 28230,
     "percent_invalid": 5.071097021014754,
     "ballot_surplus": 0
   },
   {
+    "cid": 46,
     "province_thai": "บุรีรัมย์",
     "province_eng": "BURI RAM",
     "prov_id": "BRM",
@@ -9856,14 +11411,17 @@ const PARTYLIST_RAW = [
     "invalid": 4324,
     "blank": 1559,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 45437,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 13822,
     "margin": 31615,
     "percent_invalid": 5.2953855197413535,
     "ballot_surplus": 0
   },
   {
+    "cid": 47,
     "province_thai": "บุรีรัมย์",
     "province_eng": "BURI RAM",
     "prov_id": "BRM",
@@ -9875,14 +11433,17 @@ const PARTYLIST_RAW = [
     "invalid": 3622,
     "blank": 974,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 44617,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 13202,
     "margin": 31415,
     "percent_invalid": 4.677773472814155,
     "ballot_surplus": 0
   },
   {
+    "cid": 48,
     "province_thai": "บุรีรัมย์",
     "province_eng": "BURI RAM",
     "prov_id": "BRM",
@@ -9894,14 +11455,17 @@ const PARTYLIST_RAW = [
     "invalid": 3723,
     "blank": 1201,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 35215,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 13215,
     "margin": 22000,
     "percent_invalid": 4.996376519848619,
     "ballot_surplus": 0
   },
   {
+    "cid": 49,
     "province_thai": "บุรีรัมย์",
     "province_eng": "BURI RAM",
     "prov_id": "BRM",
@@ -9913,14 +11477,17 @@ const PARTYLIST_RAW = [
     "invalid": 3841,
     "blank": 1521,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 40093,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 14597,
     "margin": 25496,
     "percent_invalid": 4.6662212233493285,
     "ballot_surplus": 0
   },
   {
+    "cid": 50,
     "province_thai": "บุรีรัมย์",
     "province_eng": "BURI RAM",
     "prov_id": "BRM",
@@ -9932,14 +11499,17 @@ const PARTYLIST_RAW = [
     "invalid": 3578,
     "blank": 1555,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 41500,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 13468,
     "margin": 28032,
     "percent_invalid": 4.487195565476937,
     "ballot_surplus": 0
   },
   {
+    "cid": 51,
     "province_thai": "บุรีรัมย์",
     "province_eng": "BURI RAM",
     "prov_id": "BRM",
@@ -9951,14 +11521,17 @@ const PARTYLIST_RAW = [
     "invalid": 3961,
     "blank": 1497,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 36407,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 13949,
     "margin": 22458,
     "percent_invalid": 4.945253879670899,
     "ballot_surplus": 0
   },
   {
+    "cid": 52,
     "province_thai": "บุรีรัมย์",
     "province_eng": "BURI RAM",
     "prov_id": "BRM",
@@ -9970,14 +11543,17 @@ const PARTYLIST_RAW = [
     "invalid": 4384,
     "blank": 2295,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 39318,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 16425,
     "margin": 22893,
     "percent_invalid": 5.141557009828068,
     "ballot_surplus": -1
   },
   {
+    "cid": 53,
     "province_thai": "บุรีรัมย์",
     "province_eng": "BURI RAM",
     "prov_id": "BRM",
@@ -9989,14 +11565,17 @@ const PARTYLIST_RAW = [
     "invalid": 4448,
     "blank": 1703,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 41216,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 12065,
     "margin": 29151,
     "percent_invalid": 5.5776392842363975,
     "ballot_surplus": -1
   },
   {
+    "cid": 337,
     "province_thai": "สุรินทร์",
     "province_eng": "SURIN",
     "prov_id": "SRN",
@@ -10008,14 +11587,17 @@ const PARTYLIST_RAW = [
     "invalid": 4039,
     "blank": 2895,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 30151,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 25820,
     "margin": 4331,
     "percent_invalid": 4.294067616415054,
     "ballot_surplus": 0
   },
   {
+    "cid": 338,
     "province_thai": "สุรินทร์",
     "province_eng": "SURIN",
     "prov_id": "SRN",
@@ -10027,14 +11609,17 @@ const PARTYLIST_RAW = [
     "invalid": 4756,
     "blank": 1878,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 33078,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 20648,
     "margin": 12430,
     "percent_invalid": 5.006263091967453,
     "ballot_surplus": 2
   },
   {
+    "cid": 339,
     "province_thai": "สุรินทร์",
     "province_eng": "SURIN",
     "prov_id": "SRN",
@@ -10046,14 +11631,17 @@ const PARTYLIST_RAW = [
     "invalid": 4074,
     "blank": 1743,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 25142,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 19444,
     "margin": 5698,
     "percent_invalid": 4.812531008576086,
     "ballot_surplus": 1
   },
   {
+    "cid": 340,
     "province_thai": "สุรินทร์",
     "province_eng": "SURIN",
     "prov_id": "SRN",
@@ -10065,14 +11653,17 @@ const PARTYLIST_RAW = [
     "invalid": 3634,
     "blank": 1656,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 23054,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 21779,
     "margin": 1275,
     "percent_invalid": 4.271073292275869,
     "ballot_surplus": 1
   },
   {
+    "cid": 341,
     "province_thai": "สุรินทร์",
     "province_eng": "SURIN",
     "prov_id": "SRN",
@@ -10084,14 +11675,17 @@ const PARTYLIST_RAW = [
     "invalid": 4414,
     "blank": 1058,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 21659,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 17796,
     "margin": 3863,
     "percent_invalid": 5.345508271368712,
     "ballot_surplus": 0
   },
   {
+    "cid": 342,
     "province_thai": "สุรินทร์",
     "province_eng": "SURIN",
     "prov_id": "SRN",
@@ -10103,14 +11697,17 @@ const PARTYLIST_RAW = [
     "invalid": 4392,
     "blank": 1411,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 26445,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 16083,
     "margin": 10362,
     "percent_invalid": 5.387238427004882,
     "ballot_surplus": 0
   },
   {
+    "cid": 343,
     "province_thai": "สุรินทร์",
     "province_eng": "SURIN",
     "prov_id": "SRN",
@@ -10122,14 +11719,17 @@ const PARTYLIST_RAW = [
     "invalid": 4423,
     "blank": 1805,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 27891,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 20389,
     "margin": 7502,
     "percent_invalid": 4.837104517765942,
     "ballot_surplus": 0
   },
   {
+    "cid": 344,
     "province_thai": "สุรินทร์",
     "province_eng": "SURIN",
     "prov_id": "SRN",
@@ -10141,14 +11741,17 @@ const PARTYLIST_RAW = [
     "invalid": 4605,
     "blank": 1749,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 26405,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 17064,
     "margin": 9341,
     "percent_invalid": 5.4023932426091035,
     "ballot_surplus": 0
   },
   {
+    "cid": 345,
     "province_thai": "ศรีสะเกษ",
     "province_eng": "SI SA KET",
     "prov_id": "SSK",
@@ -10160,14 +11763,17 @@ const PARTYLIST_RAW = [
     "invalid": 4099,
     "blank": 1827,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 29342,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 25832,
     "margin": 3510,
     "percent_invalid": 4.150129596630488,
     "ballot_surplus": 2
   },
   {
+    "cid": 346,
     "province_thai": "ศรีสะเกษ",
     "province_eng": "SI SA KET",
     "prov_id": "SSK",
@@ -10179,14 +11785,17 @@ const PARTYLIST_RAW = [
     "invalid": 4128,
     "blank": 1580,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 25212,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 17903,
     "margin": 7309,
     "percent_invalid": 4.853044909475664,
     "ballot_surplus": 0
   },
   {
+    "cid": 347,
     "province_thai": "ศรีสะเกษ",
     "province_eng": "SI SA KET",
     "prov_id": "SSK",
@@ -10198,14 +11807,17 @@ const PARTYLIST_RAW = [
     "invalid": 4816,
     "blank": 1912,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 20441,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 17697,
     "margin": 2744,
     "percent_invalid": 5.868804913418067,
     "ballot_surplus": 0
   },
   {
+    "cid": 348,
     "province_thai": "ศรีสะเกษ",
     "province_eng": "SI SA KET",
     "prov_id": "SSK",
@@ -10217,14 +11829,17 @@ const PARTYLIST_RAW = [
     "invalid": 4624,
     "blank": 1606,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 26965,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 13876,
     "margin": 13089,
     "percent_invalid": 5.5866326764851575,
     "ballot_surplus": -1
   },
   {
+    "cid": 349,
     "province_thai": "ศรีสะเกษ",
     "province_eng": "SI SA KET",
     "prov_id": "SSK",
@@ -10236,14 +11851,17 @@ const PARTYLIST_RAW = [
     "invalid": 5120,
     "blank": 1627,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 23418,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 19832,
     "margin": 3586,
     "percent_invalid": 6.019068220025158,
     "ballot_surplus": -1
   },
   {
+    "cid": 350,
     "province_thai": "ศรีสะเกษ",
     "province_eng": "SI SA KET",
     "prov_id": "SSK",
@@ -10255,14 +11873,17 @@ const PARTYLIST_RAW = [
     "invalid": 4905,
     "blank": 1156,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 23357,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 21166,
     "margin": 2191,
     "percent_invalid": 5.8454791386111475,
     "ballot_surplus": 1
   },
   {
+    "cid": 351,
     "province_thai": "ศรีสะเกษ",
     "province_eng": "SI SA KET",
     "prov_id": "SSK",
@@ -10274,14 +11895,17 @@ const PARTYLIST_RAW = [
     "invalid": 4270,
     "blank": 1008,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 31498,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 17847,
     "margin": 13651,
     "percent_invalid": 5.071078227616593,
     "ballot_surplus": 0
   },
   {
+    "cid": 352,
     "province_thai": "ศรีสะเกษ",
     "province_eng": "SI SA KET",
     "prov_id": "SSK",
@@ -10293,14 +11917,17 @@ const PARTYLIST_RAW = [
     "invalid": 4162,
     "blank": 1681,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 30867,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 19414,
     "margin": 11453,
     "percent_invalid": 4.657877655169326,
     "ballot_surplus": 0
   },
   {
+    "cid": 353,
     "province_thai": "ศรีสะเกษ",
     "province_eng": "SI SA KET",
     "prov_id": "SSK",
@@ -10312,14 +11939,17 @@ const PARTYLIST_RAW = [
     "invalid": 3885,
     "blank": 1632,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 33299,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 17999,
     "margin": 15300,
     "percent_invalid": 4.177329519795273,
     "ballot_surplus": 0
   },
   {
+    "cid": 368,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -10331,14 +11961,17 @@ const PARTYLIST_RAW = [
     "invalid": 3139,
     "blank": 4106,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 33820,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 20879,
     "margin": 12941,
     "percent_invalid": 3.1531576779741033,
     "ballot_surplus": -3
   },
   {
+    "cid": 377,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -10350,14 +11983,17 @@ const PARTYLIST_RAW = [
     "invalid": 4729,
     "blank": 1497,
     "winner_party": "ไทรวมพลัง",
+    "winner_pid": 72,
     "winner_votes": 43161,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 11557,
     "margin": 31604,
     "percent_invalid": 5.072183967222258,
     "ballot_surplus": 0
   },
   {
+    "cid": 378,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -10369,14 +12005,17 @@ const PARTYLIST_RAW = [
     "invalid": 4742,
     "blank": 2423,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 17866,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 16830,
     "margin": 1036,
     "percent_invalid": 5.516647665138788,
     "ballot_surplus": 0
   },
   {
+    "cid": 369,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -10388,14 +12027,17 @@ const PARTYLIST_RAW = [
     "invalid": 4165,
     "blank": 2929,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 21060,
     "runnerup_party": "ไทรวมพลัง",
+    "runnerup_pid": 72,
     "runnerup_votes": 16800,
     "margin": 4260,
     "percent_invalid": 4.2878909547635224,
     "ballot_surplus": 0
   },
   {
+    "cid": 370,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -10407,14 +12049,17 @@ const PARTYLIST_RAW = [
     "invalid": 4485,
     "blank": 2916,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 18627,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 18496,
     "margin": 131,
     "percent_invalid": 4.7839489712109735,
     "ballot_surplus": 0
   },
   {
+    "cid": 371,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -10426,14 +12071,17 @@ const PARTYLIST_RAW = [
     "invalid": 5080,
     "blank": 4325,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 33818,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 27545,
     "margin": 6273,
     "percent_invalid": 4.497366207781861,
     "ballot_surplus": 0
   },
   {
+    "cid": 372,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -10445,14 +12093,17 @@ const PARTYLIST_RAW = [
     "invalid": 4168,
     "blank": 2049,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 20418,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 19738,
     "margin": 680,
     "percent_invalid": 4.823850747650572,
     "ballot_surplus": 0
   },
   {
+    "cid": 373,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -10464,14 +12115,17 @@ const PARTYLIST_RAW = [
     "invalid": 5162,
     "blank": 1595,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 19393,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 15567,
     "margin": 3826,
     "percent_invalid": 6.15036339806982,
     "ballot_surplus": 0
   },
   {
+    "cid": 374,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -10483,14 +12137,17 @@ const PARTYLIST_RAW = [
     "invalid": 4240,
     "blank": 1364,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 27922,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 20649,
     "margin": 7273,
     "percent_invalid": 4.681616924486844,
     "ballot_surplus": 0
   },
   {
+    "cid": 375,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -10502,14 +12159,17 @@ const PARTYLIST_RAW = [
     "invalid": 4698,
     "blank": 2111,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 18739,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 17380,
     "margin": 1359,
     "percent_invalid": 5.097435007161147,
     "ballot_surplus": 0
   },
   {
+    "cid": 376,
     "province_thai": "อุบลราชธานี",
     "province_eng": "UBON RATCHATHANI",
     "prov_id": "UBN",
@@ -10521,14 +12181,17 @@ const PARTYLIST_RAW = [
     "invalid": 4786,
     "blank": 1388,
     "winner_party": "ไทรวมพลัง",
+    "winner_pid": 72,
     "winner_votes": 20412,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 13847,
     "margin": 6565,
     "percent_invalid": 5.7216636579913205,
     "ballot_surplus": 0
   },
   {
+    "cid": 397,
     "province_thai": "ยโสธร",
     "province_eng": "YASOTHON",
     "prov_id": "YST",
@@ -10540,14 +12203,17 @@ const PARTYLIST_RAW = [
     "invalid": 4066,
     "blank": 2054,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 35831,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 24263,
     "margin": 11568,
     "percent_invalid": 3.8453899770184514,
     "ballot_surplus": -1
   },
   {
+    "cid": 398,
     "province_thai": "ยโสธร",
     "province_eng": "YASOTHON",
     "prov_id": "YST",
@@ -10559,14 +12225,17 @@ const PARTYLIST_RAW = [
     "invalid": 3614,
     "blank": 1290,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 33275,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 21845,
     "margin": 11430,
     "percent_invalid": 3.8399829995218613,
     "ballot_surplus": 0
   },
   {
+    "cid": 399,
     "province_thai": "ยโสธร",
     "province_eng": "YASOTHON",
     "prov_id": "YST",
@@ -10578,14 +12247,17 @@ const PARTYLIST_RAW = [
     "invalid": 4069,
     "blank": 1712,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 33291,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 21424,
     "margin": 11867,
     "percent_invalid": 4.086613303337384,
     "ballot_surplus": 1
   },
   {
+    "cid": 81,
     "province_thai": "ชัยภูมิ",
     "province_eng": "CHAIYAPHUM",
     "prov_id": "CPM",
@@ -10597,14 +12269,17 @@ const PARTYLIST_RAW = [
     "invalid": 4386,
     "blank": 3054,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 26286,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 21476,
     "margin": 4810,
     "percent_invalid": 4.940468815121034,
     "ballot_surplus": 0
   },
   {
+    "cid": 82,
     "province_thai": "ชัยภูมิ",
     "province_eng": "CHAIYAPHUM",
     "prov_id": "CPM",
@@ -10616,14 +12291,17 @@ const PARTYLIST_RAW = [
     "invalid": 4999,
     "blank": 2763,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 25099,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 20039,
     "margin": 5060,
     "percent_invalid": 5.737008813808299,
     "ballot_surplus": 0
   },
   {
+    "cid": 83,
     "province_thai": "ชัยภูมิ",
     "province_eng": "CHAIYAPHUM",
     "prov_id": "CPM",
@@ -10635,14 +12313,17 @@ const PARTYLIST_RAW = [
     "invalid": 5668,
     "blank": 1977,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 17273,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 15890,
     "margin": 1383,
     "percent_invalid": 7.019108122500032,
     "ballot_surplus": 0
   },
   {
+    "cid": 84,
     "province_thai": "ชัยภูมิ",
     "province_eng": "CHAIYAPHUM",
     "prov_id": "CPM",
@@ -10654,14 +12335,17 @@ const PARTYLIST_RAW = [
     "invalid": 4413,
     "blank": 1301,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 17094,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 16714,
     "margin": 380,
     "percent_invalid": 5.765688080586368,
     "ballot_surplus": 0
   },
   {
+    "cid": 85,
     "province_thai": "ชัยภูมิ",
     "province_eng": "CHAIYAPHUM",
     "prov_id": "CPM",
@@ -10673,14 +12357,17 @@ const PARTYLIST_RAW = [
     "invalid": 5362,
     "blank": 1646,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 22074,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 18890,
     "margin": 3184,
     "percent_invalid": 5.99219963568499,
     "ballot_surplus": 2
   },
   {
+    "cid": 86,
     "province_thai": "ชัยภูมิ",
     "province_eng": "CHAIYAPHUM",
     "prov_id": "CPM",
@@ -10692,14 +12379,17 @@ const PARTYLIST_RAW = [
     "invalid": 5691,
     "blank": 1758,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 21029,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 19853,
     "margin": 1176,
     "percent_invalid": 6.375827647632172,
     "ballot_surplus": 2
   },
   {
+    "cid": 87,
     "province_thai": "ชัยภูมิ",
     "province_eng": "CHAIYAPHUM",
     "prov_id": "CPM",
@@ -10711,14 +12401,17 @@ const PARTYLIST_RAW = [
     "invalid": 4399,
     "blank": 1485,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 27810,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 19770,
     "margin": 8040,
     "percent_invalid": 5.191663126091677,
     "ballot_surplus": 0
   },
   {
+    "cid": 0,
     "province_thai": "อำนาจเจริญ",
     "province_eng": "AMNAT CHAROEN",
     "prov_id": "ACR",
@@ -10730,14 +12423,17 @@ const PARTYLIST_RAW = [
     "invalid": 4066,
     "blank": 2441,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 25624,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 22197,
     "margin": 3427,
     "percent_invalid": 4.1627847453288975,
     "ballot_surplus": 2
   },
   {
+    "cid": 1,
     "province_thai": "อำนาจเจริญ",
     "province_eng": "AMNAT CHAROEN",
     "prov_id": "ACR",
@@ -10749,14 +12445,17 @@ const PARTYLIST_RAW = [
     "invalid": 5084,
     "blank": 2522,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 23395,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 22514,
     "margin": 881,
     "percent_invalid": 4.913359040522648,
     "ballot_surplus": 0
   },
   {
+    "cid": 42,
     "province_thai": "บึงกาฬ",
     "province_eng": "BUENG KAN",
     "prov_id": "BKN",
@@ -10768,14 +12467,17 @@ const PARTYLIST_RAW = [
     "invalid": 3156,
     "blank": 1395,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 23183,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 17216,
     "margin": 5967,
     "percent_invalid": 4.250791299077379,
     "ballot_surplus": 0
   },
   {
+    "cid": 43,
     "province_thai": "บึงกาฬ",
     "province_eng": "BUENG KAN",
     "prov_id": "BKN",
@@ -10787,14 +12489,17 @@ const PARTYLIST_RAW = [
     "invalid": 3295,
     "blank": 1145,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 23892,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 15895,
     "margin": 7997,
     "percent_invalid": 4.3930404639690686,
     "ballot_surplus": 1
   },
   {
+    "cid": 44,
     "province_thai": "บึงกาฬ",
     "province_eng": "BUENG KAN",
     "prov_id": "BKN",
@@ -10806,14 +12511,17 @@ const PARTYLIST_RAW = [
     "invalid": 3410,
     "blank": 1745,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 20137,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 17980,
     "margin": 2157,
     "percent_invalid": 4.473832670786266,
     "ballot_surplus": 0
   },
   {
+    "cid": 166,
     "province_thai": "หนองบัวลำภู",
     "province_eng": "NONG BUA LAM PHU",
     "prov_id": "NBP",
@@ -10825,14 +12533,17 @@ const PARTYLIST_RAW = [
     "invalid": 4425,
     "blank": 1986,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 24813,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 22798,
     "margin": 2015,
     "percent_invalid": 4.838021932366093,
     "ballot_surplus": -4
   },
   {
+    "cid": 167,
     "province_thai": "หนองบัวลำภู",
     "province_eng": "NONG BUA LAM PHU",
     "prov_id": "NBP",
@@ -10844,14 +12555,17 @@ const PARTYLIST_RAW = [
     "invalid": 4125,
     "blank": 1382,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 27355,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 20678,
     "margin": 6677,
     "percent_invalid": 4.931143307990245,
     "ballot_surplus": 1
   },
   {
+    "cid": 168,
     "province_thai": "หนองบัวลำภู",
     "province_eng": "NONG BUA LAM PHU",
     "prov_id": "NBP",
@@ -10863,14 +12577,17 @@ const PARTYLIST_RAW = [
     "invalid": 4279,
     "blank": 1544,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 20104,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 19930,
     "margin": 174,
     "percent_invalid": 5.178506595667433,
     "ballot_surplus": 0
   },
   {
+    "cid": 104,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -10882,14 +12599,17 @@ const PARTYLIST_RAW = [
     "invalid": 2909,
     "blank": 2901,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 37207,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 16428,
     "margin": 20779,
     "percent_invalid": 3.191547719617761,
     "ballot_surplus": 0
   },
   {
+    "cid": 113,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -10901,14 +12621,17 @@ const PARTYLIST_RAW = [
     "invalid": 4486,
     "blank": 974,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 32681,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 17797,
     "margin": 14884,
     "percent_invalid": 5.034679356243407,
     "ballot_surplus": 0
   },
   {
+    "cid": 114,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -10920,14 +12643,17 @@ const PARTYLIST_RAW = [
     "invalid": 4482,
     "blank": 1655,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 20024,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 19952,
     "margin": 72,
     "percent_invalid": 5.42864756183232,
     "ballot_surplus": 0
   },
   {
+    "cid": 105,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -10939,14 +12665,17 @@ const PARTYLIST_RAW = [
     "invalid": 3524,
     "blank": 3429,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 42065,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 18429,
     "margin": 23636,
     "percent_invalid": 3.3402526990265495,
     "ballot_surplus": 0
   },
   {
+    "cid": 106,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -10958,14 +12687,17 @@ const PARTYLIST_RAW = [
     "invalid": 4458,
     "blank": 1650,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 26529,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 24763,
     "margin": 1766,
     "percent_invalid": 4.918955301283254,
     "ballot_surplus": 0
   },
   {
+    "cid": 107,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -10977,14 +12709,17 @@ const PARTYLIST_RAW = [
     "invalid": 4733,
     "blank": 2075,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 28155,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 25475,
     "margin": 2680,
     "percent_invalid": 4.944216948019388,
     "ballot_surplus": 0
   },
   {
+    "cid": 108,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -10996,14 +12731,17 @@ const PARTYLIST_RAW = [
     "invalid": 4885,
     "blank": 1236,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 29853,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 17976,
     "margin": 11877,
     "percent_invalid": 5.737204331383741,
     "ballot_surplus": -1
   },
   {
+    "cid": 109,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -11015,14 +12753,17 @@ const PARTYLIST_RAW = [
     "invalid": 5066,
     "blank": 2018,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 24090,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 20325,
     "margin": 3765,
     "percent_invalid": 5.880168071128445,
     "ballot_surplus": 0
   },
   {
+    "cid": 110,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -11034,14 +12775,17 @@ const PARTYLIST_RAW = [
     "invalid": 5120,
     "blank": 1870,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 27813,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 22019,
     "margin": 5794,
     "percent_invalid": 5.673318780679691,
     "ballot_surplus": 0
   },
   {
+    "cid": 111,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -11053,14 +12797,17 @@ const PARTYLIST_RAW = [
     "invalid": 4641,
     "blank": 2290,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 25603,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 25145,
     "margin": 458,
     "percent_invalid": 4.805044209305696,
     "ballot_surplus": 0
   },
   {
+    "cid": 112,
     "province_thai": "ขอนแก่น",
     "province_eng": "KHON KAEN",
     "prov_id": "KKN",
@@ -11072,14 +12819,17 @@ const PARTYLIST_RAW = [
     "invalid": 3898,
     "blank": 1022,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 35906,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 18297,
     "margin": 17609,
     "percent_invalid": 4.585019290486496,
     "ballot_surplus": 0
   },
   {
+    "cid": 379,
     "province_thai": "อุดรธานี",
     "province_eng": "UDON THANI",
     "prov_id": "UDN",
@@ -11091,14 +12841,17 @@ const PARTYLIST_RAW = [
     "invalid": 2248,
     "blank": 3123,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 33047,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 17892,
     "margin": 15155,
     "percent_invalid": 2.6601346634006653,
     "ballot_surplus": 0
   },
   {
+    "cid": 388,
     "province_thai": "อุดรธานี",
     "province_eng": "UDON THANI",
     "prov_id": "UDN",
@@ -11110,14 +12863,17 @@ const PARTYLIST_RAW = [
     "invalid": 4356,
     "blank": 1918,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 24659,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 19053,
     "margin": 5606,
     "percent_invalid": 5.493410681631881,
     "ballot_surplus": 0
   },
   {
+    "cid": 380,
     "province_thai": "อุดรธานี",
     "province_eng": "UDON THANI",
     "prov_id": "UDN",
@@ -11129,14 +12885,17 @@ const PARTYLIST_RAW = [
     "invalid": 4035,
     "blank": 2556,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 27781,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 26520,
     "margin": 1261,
     "percent_invalid": 4.5095387641516815,
     "ballot_surplus": 0
   },
   {
+    "cid": 381,
     "province_thai": "อุดรธานี",
     "province_eng": "UDON THANI",
     "prov_id": "UDN",
@@ -11148,14 +12907,17 @@ const PARTYLIST_RAW = [
     "invalid": 4002,
     "blank": 1143,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 28705,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 18145,
     "margin": 10560,
     "percent_invalid": 5.014974749689854,
     "ballot_surplus": 2
   },
   {
+    "cid": 382,
     "province_thai": "อุดรธานี",
     "province_eng": "UDON THANI",
     "prov_id": "UDN",
@@ -11167,14 +12929,17 @@ const PARTYLIST_RAW = [
     "invalid": 3910,
     "blank": 1128,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 26237,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 18677,
     "margin": 7560,
     "percent_invalid": 5.222315716365482,
     "ballot_surplus": -1
   },
   {
+    "cid": 383,
     "province_thai": "อุดรธานี",
     "province_eng": "UDON THANI",
     "prov_id": "UDN",
@@ -11186,14 +12951,17 @@ const PARTYLIST_RAW = [
     "invalid": 3466,
     "blank": 1250,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 24444,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 18583,
     "margin": 5861,
     "percent_invalid": 4.705467084809731,
     "ballot_surplus": 1
   },
   {
+    "cid": 385,
     "province_thai": "อุดรธานี",
     "province_eng": "UDON THANI",
     "prov_id": "UDN",
@@ -11205,14 +12973,17 @@ const PARTYLIST_RAW = [
     "invalid": 3585,
     "blank": 1922,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 23469,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 23171,
     "margin": 298,
     "percent_invalid": 4.625090308597379,
     "ballot_surplus": 0
   },
   {
+    "cid": 386,
     "province_thai": "อุดรธานี",
     "province_eng": "UDON THANI",
     "prov_id": "UDN",
@@ -11224,14 +12995,17 @@ const PARTYLIST_RAW = [
     "invalid": 4385,
     "blank": 1727,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 20167,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 19200,
     "margin": 967,
     "percent_invalid": 5.75119679979015,
     "ballot_surplus": 1
   },
   {
+    "cid": 387,
     "province_thai": "อุดรธานี",
     "province_eng": "UDON THANI",
     "prov_id": "UDN",
@@ -11243,14 +13017,17 @@ const PARTYLIST_RAW = [
     "invalid": 4057,
     "blank": 1866,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 24963,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 21162,
     "margin": 3801,
     "percent_invalid": 5.020418265066205,
     "ballot_surplus": 0
   },
   {
+    "cid": 130,
     "province_thai": "เลย",
     "province_eng": "LOEI",
     "prov_id": "LEI",
@@ -11262,14 +13039,17 @@ const PARTYLIST_RAW = [
     "invalid": 4372,
     "blank": 3164,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 28641,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 24473,
     "margin": 4168,
     "percent_invalid": 4.65705855409623,
     "ballot_surplus": -1
   },
   {
+    "cid": 131,
     "province_thai": "เลย",
     "province_eng": "LOEI",
     "prov_id": "LEI",
@@ -11281,14 +13061,17 @@ const PARTYLIST_RAW = [
     "invalid": 5168,
     "blank": 2841,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 21297,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 20153,
     "margin": 1144,
     "percent_invalid": 6.189666323328622,
     "ballot_surplus": 0
   },
   {
+    "cid": 132,
     "province_thai": "เลย",
     "province_eng": "LOEI",
     "prov_id": "LEI",
@@ -11300,14 +13083,17 @@ const PARTYLIST_RAW = [
     "invalid": 5544,
     "blank": 3099,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 24802,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 22107,
     "margin": 2695,
     "percent_invalid": 6.02890481420664,
     "ballot_surplus": 50
   },
   {
+    "cid": 133,
     "province_thai": "เลย",
     "province_eng": "LOEI",
     "prov_id": "LEI",
@@ -11319,14 +13105,17 @@ const PARTYLIST_RAW = [
     "invalid": 5362,
     "blank": 3064,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 23551,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 19786,
     "margin": 3765,
     "percent_invalid": 6.306825533116127,
     "ballot_surplus": 0
   },
   {
+    "cid": 169,
     "province_thai": "หนองคาย",
     "province_eng": "NONG KHAI",
     "prov_id": "NKI",
@@ -11338,14 +13127,17 @@ const PARTYLIST_RAW = [
     "invalid": 4753,
     "blank": 2340,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 27318,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 23205,
     "margin": 4113,
     "percent_invalid": 4.9764422573552505,
     "ballot_surplus": 1
   },
   {
+    "cid": 170,
     "province_thai": "หนองคาย",
     "province_eng": "NONG KHAI",
     "prov_id": "NKI",
@@ -11357,14 +13149,17 @@ const PARTYLIST_RAW = [
     "invalid": 4715,
     "blank": 1236,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 25381,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 20703,
     "margin": 4678,
     "percent_invalid": 5.501621899138877,
     "ballot_surplus": -1
   },
   {
+    "cid": 171,
     "province_thai": "หนองคาย",
     "province_eng": "NONG KHAI",
     "prov_id": "NKI",
@@ -11376,14 +13171,17 @@ const PARTYLIST_RAW = [
     "invalid": 4505,
     "blank": 2195,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 24671,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 22319,
     "margin": 2352,
     "percent_invalid": 5.174354497840669,
     "ballot_surplus": 0
   },
   {
+    "cid": 147,
     "province_thai": "มหาสารคาม",
     "province_eng": "MAHA SARAKHAM",
     "prov_id": "MKM",
@@ -11395,14 +13193,17 @@ const PARTYLIST_RAW = [
     "invalid": 3371,
     "blank": 2512,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 27903,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 22459,
     "margin": 5444,
     "percent_invalid": 3.7220651885875804,
     "ballot_surplus": 1
   },
   {
+    "cid": 148,
     "province_thai": "มหาสารคาม",
     "province_eng": "MAHA SARAKHAM",
     "prov_id": "MKM",
@@ -11414,14 +13215,17 @@ const PARTYLIST_RAW = [
     "invalid": 3814,
     "blank": 1453,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 23466,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 19526,
     "margin": 3940,
     "percent_invalid": 4.609341954196628,
     "ballot_surplus": 0
   },
   {
+    "cid": 149,
     "province_thai": "มหาสารคาม",
     "province_eng": "MAHA SARAKHAM",
     "prov_id": "MKM",
@@ -11433,14 +13237,17 @@ const PARTYLIST_RAW = [
     "invalid": 3505,
     "blank": 975,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 31250,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 17959,
     "margin": 13291,
     "percent_invalid": 3.9976732515169484,
     "ballot_surplus": 0
   },
   {
+    "cid": 150,
     "province_thai": "มหาสารคาม",
     "province_eng": "MAHA SARAKHAM",
     "prov_id": "MKM",
@@ -11452,14 +13259,17 @@ const PARTYLIST_RAW = [
     "invalid": 4101,
     "blank": 1150,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 24851,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 19132,
     "margin": 5719,
     "percent_invalid": 4.827772938101853,
     "ballot_surplus": -1
   },
   {
+    "cid": 151,
     "province_thai": "มหาสารคาม",
     "province_eng": "MAHA SARAKHAM",
     "prov_id": "MKM",
@@ -11471,14 +13281,17 @@ const PARTYLIST_RAW = [
     "invalid": 3676,
     "blank": 2319,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 28008,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 21958,
     "margin": 6050,
     "percent_invalid": 4.340023612750885,
     "ballot_surplus": 1
   },
   {
+    "cid": 152,
     "province_thai": "มหาสารคาม",
     "province_eng": "MAHA SARAKHAM",
     "prov_id": "MKM",
@@ -11490,14 +13303,17 @@ const PARTYLIST_RAW = [
     "invalid": 4068,
     "blank": 1607,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 32155,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 20904,
     "margin": 11251,
     "percent_invalid": 4.437995701646248,
     "ballot_surplus": 0
   },
   {
+    "cid": 275,
     "province_thai": "ร้อยเอ็ด",
     "province_eng": "ROI ET",
     "prov_id": "RET",
@@ -11509,14 +13325,17 @@ const PARTYLIST_RAW = [
     "invalid": 3312,
     "blank": 2225,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 27641,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 21901,
     "margin": 5740,
     "percent_invalid": 3.5019084978377406,
     "ballot_surplus": -1
   },
   {
+    "cid": 276,
     "province_thai": "ร้อยเอ็ด",
     "province_eng": "ROI ET",
     "prov_id": "RET",
@@ -11528,14 +13347,17 @@ const PARTYLIST_RAW = [
     "invalid": 4016,
     "blank": 1619,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 28299,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 21897,
     "margin": 6402,
     "percent_invalid": 4.37653930821037,
     "ballot_surplus": 0
   },
   {
+    "cid": 277,
     "province_thai": "ร้อยเอ็ด",
     "province_eng": "ROI ET",
     "prov_id": "RET",
@@ -11547,14 +13369,17 @@ const PARTYLIST_RAW = [
     "invalid": 3999,
     "blank": 1616,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 29513,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 20224,
     "margin": 9289,
     "percent_invalid": 4.668020731194845,
     "ballot_surplus": -1
   },
   {
+    "cid": 278,
     "province_thai": "ร้อยเอ็ด",
     "province_eng": "ROI ET",
     "prov_id": "RET",
@@ -11566,14 +13391,17 @@ const PARTYLIST_RAW = [
     "invalid": 3340,
     "blank": 1334,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 29021,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 19797,
     "margin": 9224,
     "percent_invalid": 3.9773742185174163,
     "ballot_surplus": 0
   },
   {
+    "cid": 279,
     "province_thai": "ร้อยเอ็ด",
     "province_eng": "ROI ET",
     "prov_id": "RET",
@@ -11585,14 +13413,17 @@ const PARTYLIST_RAW = [
     "invalid": 3208,
     "blank": 2033,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 33314,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 18936,
     "margin": 14378,
     "percent_invalid": 4.012206713692531,
     "ballot_surplus": 0
   },
   {
+    "cid": 280,
     "province_thai": "ร้อยเอ็ด",
     "province_eng": "ROI ET",
     "prov_id": "RET",
@@ -11604,14 +13435,17 @@ const PARTYLIST_RAW = [
     "invalid": 3194,
     "blank": 1266,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 32834,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 18116,
     "margin": 14718,
     "percent_invalid": 3.9296743316231746,
     "ballot_surplus": 2
   },
   {
+    "cid": 281,
     "province_thai": "ร้อยเอ็ด",
     "province_eng": "ROI ET",
     "prov_id": "RET",
@@ -11623,14 +13457,17 @@ const PARTYLIST_RAW = [
     "invalid": 3109,
     "blank": 846,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 33479,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 17446,
     "margin": 16033,
     "percent_invalid": 3.6610496814686586,
     "ballot_surplus": 1
   },
   {
+    "cid": 282,
     "province_thai": "ร้อยเอ็ด",
     "province_eng": "ROI ET",
     "prov_id": "RET",
@@ -11642,14 +13479,17 @@ const PARTYLIST_RAW = [
     "invalid": 3126,
     "blank": 1176,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 31111,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 19392,
     "margin": 11719,
     "percent_invalid": 3.504287876240121,
     "ballot_surplus": 0
   },
   {
+    "cid": 124,
     "province_thai": "กาฬสินธุ์",
     "province_eng": "KALASIN",
     "prov_id": "KSN",
@@ -11661,14 +13501,17 @@ const PARTYLIST_RAW = [
     "invalid": 4696,
     "blank": 2562,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 24763,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 24352,
     "margin": 411,
     "percent_invalid": 5.20978943397901,
     "ballot_surplus": -1
   },
   {
+    "cid": 125,
     "province_thai": "กาฬสินธุ์",
     "province_eng": "KALASIN",
     "prov_id": "KSN",
@@ -11680,14 +13523,17 @@ const PARTYLIST_RAW = [
     "invalid": 3997,
     "blank": 1783,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 29619,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 19762,
     "margin": 9857,
     "percent_invalid": 4.861111111111112,
     "ballot_surplus": 0
   },
   {
+    "cid": 126,
     "province_thai": "กาฬสินธุ์",
     "province_eng": "KALASIN",
     "prov_id": "KSN",
@@ -11699,14 +13545,17 @@ const PARTYLIST_RAW = [
     "invalid": 4820,
     "blank": 1908,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 18003,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 16312,
     "margin": 1691,
     "percent_invalid": 5.846321790284432,
     "ballot_surplus": 0
   },
   {
+    "cid": 127,
     "province_thai": "กาฬสินธุ์",
     "province_eng": "KALASIN",
     "prov_id": "KSN",
@@ -11718,14 +13567,17 @@ const PARTYLIST_RAW = [
     "invalid": 4743,
     "blank": 1775,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 26871,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 20091,
     "margin": 6780,
     "percent_invalid": 5.2639172511764185,
     "ballot_surplus": 0
   },
   {
+    "cid": 128,
     "province_thai": "กาฬสินธุ์",
     "province_eng": "KALASIN",
     "prov_id": "KSN",
@@ -11737,14 +13589,17 @@ const PARTYLIST_RAW = [
     "invalid": 4515,
     "blank": 1749,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 29262,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 20479,
     "margin": 8783,
     "percent_invalid": 4.808204298098017,
     "ballot_surplus": 1
   },
   {
+    "cid": 129,
     "province_thai": "กาฬสินธุ์",
     "province_eng": "KALASIN",
     "prov_id": "KSN",
@@ -11756,14 +13611,17 @@ const PARTYLIST_RAW = [
     "invalid": 4604,
     "blank": 1657,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 40190,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 20741,
     "margin": 19449,
     "percent_invalid": 4.805293755414305,
     "ballot_surplus": 1
   },
   {
+    "cid": 313,
     "province_thai": "สกลนคร",
     "province_eng": "SAKON NAKHON",
     "prov_id": "SNK",
@@ -11775,14 +13633,17 @@ const PARTYLIST_RAW = [
     "invalid": 3791,
     "blank": 3349,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 28352,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 20228,
     "margin": 8124,
     "percent_invalid": 3.9423466894063086,
     "ballot_surplus": 1
   },
   {
+    "cid": 314,
     "province_thai": "สกลนคร",
     "province_eng": "SAKON NAKHON",
     "prov_id": "SNK",
@@ -11794,14 +13655,17 @@ const PARTYLIST_RAW = [
     "invalid": 3902,
     "blank": 1791,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 25322,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 21906,
     "margin": 3416,
     "percent_invalid": 4.384466717605286,
     "ballot_surplus": 0
   },
   {
+    "cid": 315,
     "province_thai": "สกลนคร",
     "province_eng": "SAKON NAKHON",
     "prov_id": "SNK",
@@ -11813,14 +13677,17 @@ const PARTYLIST_RAW = [
     "invalid": 3591,
     "blank": 2761,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 33849,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 19590,
     "margin": 14259,
     "percent_invalid": 4.168794984908289,
     "ballot_surplus": 0
   },
   {
+    "cid": 316,
     "province_thai": "สกลนคร",
     "province_eng": "SAKON NAKHON",
     "prov_id": "SNK",
@@ -11832,14 +13699,17 @@ const PARTYLIST_RAW = [
     "invalid": 4045,
     "blank": 3137,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 25255,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 19286,
     "margin": 5969,
     "percent_invalid": 4.854427189592684,
     "ballot_surplus": 1
   },
   {
+    "cid": 317,
     "province_thai": "สกลนคร",
     "province_eng": "SAKON NAKHON",
     "prov_id": "SNK",
@@ -11851,14 +13721,17 @@ const PARTYLIST_RAW = [
     "invalid": 3643,
     "blank": 1597,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 24241,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 20123,
     "margin": 4118,
     "percent_invalid": 4.360889655007302,
     "ballot_surplus": 0
   },
   {
+    "cid": 318,
     "province_thai": "สกลนคร",
     "province_eng": "SAKON NAKHON",
     "prov_id": "SNK",
@@ -11870,14 +13743,17 @@ const PARTYLIST_RAW = [
     "invalid": 3150,
     "blank": 1732,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 23896,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 19628,
     "margin": 4268,
     "percent_invalid": 3.912460254372019,
     "ballot_surplus": -1
   },
   {
+    "cid": 319,
     "province_thai": "สกลนคร",
     "province_eng": "SAKON NAKHON",
     "prov_id": "SNK",
@@ -11889,14 +13765,17 @@ const PARTYLIST_RAW = [
     "invalid": 3623,
     "blank": 551,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 23818,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 19197,
     "margin": 4621,
     "percent_invalid": 4.757277728902136,
     "ballot_surplus": 0
   },
   {
+    "cid": 188,
     "province_thai": "นครพนม",
     "province_eng": "NAKHON PHANOM",
     "prov_id": "NPM",
@@ -11908,14 +13787,17 @@ const PARTYLIST_RAW = [
     "invalid": 4490,
     "blank": 1105,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 35522,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 27029,
     "margin": 8493,
     "percent_invalid": 4.558468192247559,
     "ballot_surplus": 1
   },
   {
+    "cid": 189,
     "province_thai": "นครพนม",
     "province_eng": "NAKHON PHANOM",
     "prov_id": "NPM",
@@ -11927,14 +13809,17 @@ const PARTYLIST_RAW = [
     "invalid": 4599,
     "blank": 2688,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 37522,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 22526,
     "margin": 14996,
     "percent_invalid": 4.881440125671344,
     "ballot_surplus": 1
   },
   {
+    "cid": 190,
     "province_thai": "นครพนม",
     "province_eng": "NAKHON PHANOM",
     "prov_id": "NPM",
@@ -11946,14 +13831,17 @@ const PARTYLIST_RAW = [
     "invalid": 4106,
     "blank": 1886,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 34991,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 21388,
     "margin": 13603,
     "percent_invalid": 4.365020304892309,
     "ballot_surplus": 0
   },
   {
+    "cid": 191,
     "province_thai": "นครพนม",
     "province_eng": "NAKHON PHANOM",
     "prov_id": "NPM",
@@ -11965,14 +13853,17 @@ const PARTYLIST_RAW = [
     "invalid": 4001,
     "blank": 1470,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 33678,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 20198,
     "margin": 13480,
     "percent_invalid": 4.158395260614249,
     "ballot_surplus": 0
   },
   {
+    "cid": 145,
     "province_thai": "มุกดาหาร",
     "province_eng": "MUKDAHAN",
     "prov_id": "MDH",
@@ -11984,14 +13875,17 @@ const PARTYLIST_RAW = [
     "invalid": 5024,
     "blank": 2412,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 30899,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 28089,
     "margin": 2810,
     "percent_invalid": 4.793710163734208,
     "ballot_surplus": 0
   },
   {
+    "cid": 146,
     "province_thai": "มุกดาหาร",
     "province_eng": "MUKDAHAN",
     "prov_id": "MDH",
@@ -12003,14 +13897,17 @@ const PARTYLIST_RAW = [
     "invalid": 5240,
     "blank": 2250,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 29582,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 22928,
     "margin": 6654,
     "percent_invalid": 5.1940842948336705,
     "ballot_surplus": 0
   },
   {
+    "cid": 69,
     "province_thai": "เชียงใหม่",
     "province_eng": "CHIANG MAI",
     "prov_id": "CMI",
@@ -12022,14 +13919,17 @@ const PARTYLIST_RAW = [
     "invalid": 2642,
     "blank": 4031,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 49534,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 19782,
     "margin": 29752,
     "percent_invalid": 2.5647746357185155,
     "ballot_surplus": -5
   },
   {
+    "cid": 78,
     "province_thai": "เชียงใหม่",
     "province_eng": "CHIANG MAI",
     "prov_id": "CMI",
@@ -12041,14 +13941,17 @@ const PARTYLIST_RAW = [
     "invalid": 6489,
     "blank": 1300,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 27489,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 20817,
     "margin": 6672,
     "percent_invalid": 7.072325398901386,
     "ballot_surplus": 0
   },
   {
+    "cid": 70,
     "province_thai": "เชียงใหม่",
     "province_eng": "CHIANG MAI",
     "prov_id": "CMI",
@@ -12060,14 +13963,17 @@ const PARTYLIST_RAW = [
     "invalid": 3895,
     "blank": 5463,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 50775,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 25772,
     "margin": 25003,
     "percent_invalid": 3.430901899988549,
     "ballot_surplus": 1
   },
   {
+    "cid": 71,
     "province_thai": "เชียงใหม่",
     "province_eng": "CHIANG MAI",
     "prov_id": "CMI",
@@ -12079,14 +13985,17 @@ const PARTYLIST_RAW = [
     "invalid": 4359,
     "blank": 4963,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 47748,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 28772,
     "margin": 18976,
     "percent_invalid": 3.909241738038653,
     "ballot_surplus": -2
   },
   {
+    "cid": 72,
     "province_thai": "เชียงใหม่",
     "province_eng": "CHIANG MAI",
     "prov_id": "CMI",
@@ -12098,14 +14007,17 @@ const PARTYLIST_RAW = [
     "invalid": 3710,
     "blank": 4612,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 52240,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 23737,
     "margin": 28503,
     "percent_invalid": 3.2123715267856374,
     "ballot_surplus": -1
   },
   {
+    "cid": 73,
     "province_thai": "เชียงใหม่",
     "province_eng": "CHIANG MAI",
     "prov_id": "CMI",
@@ -12117,14 +14029,17 @@ const PARTYLIST_RAW = [
     "invalid": 4942,
     "blank": 4319,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 37956,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 25761,
     "margin": 12195,
     "percent_invalid": 4.814793164591493,
     "ballot_surplus": -1
   },
   {
+    "cid": 74,
     "province_thai": "เชียงใหม่",
     "province_eng": "CHIANG MAI",
     "prov_id": "CMI",
@@ -12136,14 +14051,17 @@ const PARTYLIST_RAW = [
     "invalid": 5670,
     "blank": 2778,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 30052,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 20086,
     "margin": 9966,
     "percent_invalid": 6.203161752639352,
     "ballot_surplus": -1
   },
   {
+    "cid": 75,
     "province_thai": "เชียงใหม่",
     "province_eng": "CHIANG MAI",
     "prov_id": "CMI",
@@ -12155,14 +14073,17 @@ const PARTYLIST_RAW = [
     "invalid": 6216,
     "blank": 2964,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 31572,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 21961,
     "margin": 9611,
     "percent_invalid": 6.313031290941776,
     "ballot_surplus": 0
   },
   {
+    "cid": 76,
     "province_thai": "เชียงใหม่",
     "province_eng": "CHIANG MAI",
     "prov_id": "CMI",
@@ -12174,14 +14095,17 @@ const PARTYLIST_RAW = [
     "invalid": 4877,
     "blank": 4716,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 51630,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 30638,
     "margin": 20992,
     "percent_invalid": 4.19025852958613,
     "ballot_surplus": 0
   },
   {
+    "cid": 77,
     "province_thai": "เชียงใหม่",
     "province_eng": "CHIANG MAI",
     "prov_id": "CMI",
@@ -12193,14 +14117,17 @@ const PARTYLIST_RAW = [
     "invalid": 5659,
     "blank": 3109,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 37499,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 22241,
     "margin": 15258,
     "percent_invalid": 5.35768385972885,
     "ballot_surplus": 0
   },
   {
+    "cid": 138,
     "province_thai": "ลำพูน",
     "province_eng": "LAMPHUN",
     "prov_id": "LPN",
@@ -12212,14 +14139,17 @@ const PARTYLIST_RAW = [
     "invalid": 5987,
     "blank": 6682,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 61013,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 30632,
     "margin": 30381,
     "percent_invalid": 4.257634157789187,
     "ballot_surplus": -1
   },
   {
+    "cid": 139,
     "province_thai": "ลำพูน",
     "province_eng": "LAMPHUN",
     "prov_id": "LPN",
@@ -12231,14 +14161,17 @@ const PARTYLIST_RAW = [
     "invalid": 8173,
     "blank": 5446,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 46716,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 28211,
     "margin": 18505,
     "percent_invalid": 6.206760379407498,
     "ballot_surplus": 0
   },
   {
+    "cid": 134,
     "province_thai": "ลำปาง",
     "province_eng": "LAMPANG",
     "prov_id": "LPG",
@@ -12250,14 +14183,17 @@ const PARTYLIST_RAW = [
     "invalid": 4276,
     "blank": 5502,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 44941,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 22242,
     "margin": 22699,
     "percent_invalid": 3.8144854102177534,
     "ballot_surplus": 1
   },
   {
+    "cid": 135,
     "province_thai": "ลำปาง",
     "province_eng": "LAMPANG",
     "prov_id": "LPG",
@@ -12269,14 +14205,17 @@ const PARTYLIST_RAW = [
     "invalid": 6936,
     "blank": 3734,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 35003,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 23818,
     "margin": 11185,
     "percent_invalid": 6.2113247423142015,
     "ballot_surplus": 0
   },
   {
+    "cid": 136,
     "province_thai": "ลำปาง",
     "province_eng": "LAMPANG",
     "prov_id": "LPG",
@@ -12288,14 +14227,17 @@ const PARTYLIST_RAW = [
     "invalid": 5993,
     "blank": 5422,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 42856,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 20420,
     "margin": 22436,
     "percent_invalid": 5.304948216340621,
     "ballot_surplus": 0
   },
   {
+    "cid": 137,
     "province_thai": "ลำปาง",
     "province_eng": "LAMPANG",
     "prov_id": "LPG",
@@ -12307,14 +14249,17 @@ const PARTYLIST_RAW = [
     "invalid": 6688,
     "blank": 3528,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 36535,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 22534,
     "margin": 14001,
     "percent_invalid": 5.778468982201486,
     "ballot_surplus": 0
   },
   {
+    "cid": 391,
     "province_thai": "อุตรดิตถ์",
     "province_eng": "UTTARADIT",
     "prov_id": "UTT",
@@ -12326,14 +14271,17 @@ const PARTYLIST_RAW = [
     "invalid": 4107,
     "blank": 2897,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 26296,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 18574,
     "margin": 7722,
     "percent_invalid": 4.689052028269035,
     "ballot_surplus": 1
   },
   {
+    "cid": 392,
     "province_thai": "อุตรดิตถ์",
     "province_eng": "UTTARADIT",
     "prov_id": "UTT",
@@ -12345,14 +14293,17 @@ const PARTYLIST_RAW = [
     "invalid": 5243,
     "blank": 3308,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 21232,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 15685,
     "margin": 5547,
     "percent_invalid": 6.3082031907981815,
     "ballot_surplus": 0
   },
   {
+    "cid": 393,
     "province_thai": "อุตรดิตถ์",
     "province_eng": "UTTARADIT",
     "prov_id": "UTT",
@@ -12364,14 +14315,17 @@ const PARTYLIST_RAW = [
     "invalid": 4226,
     "blank": 3491,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 25905,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 22120,
     "margin": 3785,
     "percent_invalid": 4.997339324779755,
     "ballot_surplus": 0
   },
   {
+    "cid": 249,
     "province_thai": "แพร่",
     "province_eng": "PHRAE",
     "prov_id": "PRE",
@@ -12383,14 +14337,17 @@ const PARTYLIST_RAW = [
     "invalid": 3505,
     "blank": 2538,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 32631,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 24136,
     "margin": 8495,
     "percent_invalid": 3.5683379994909648,
     "ballot_surplus": 0
   },
   {
+    "cid": 250,
     "province_thai": "แพร่",
     "province_eng": "PHRAE",
     "prov_id": "PRE",
@@ -12402,14 +14359,17 @@ const PARTYLIST_RAW = [
     "invalid": 4148,
     "blank": 1799,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 29194,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 22709,
     "margin": 6485,
     "percent_invalid": 4.663136712646004,
     "ballot_surplus": 0
   },
   {
+    "cid": 251,
     "province_thai": "แพร่",
     "province_eng": "PHRAE",
     "prov_id": "PRE",
@@ -12421,14 +14381,17 @@ const PARTYLIST_RAW = [
     "invalid": 4582,
     "blank": 3066,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 25151,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 22383,
     "margin": 2768,
     "percent_invalid": 5.438898450946644,
     "ballot_surplus": 1
   },
   {
+    "cid": 156,
     "province_thai": "น่าน",
     "province_eng": "NAN",
     "prov_id": "NAN",
@@ -12440,14 +14403,17 @@ const PARTYLIST_RAW = [
     "invalid": 4105,
     "blank": 3611,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 30149,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 19622,
     "margin": 10527,
     "percent_invalid": 4.16497564935065,
     "ballot_surplus": 1
   },
   {
+    "cid": 157,
     "province_thai": "น่าน",
     "province_eng": "NAN",
     "prov_id": "NAN",
@@ -12459,14 +14425,17 @@ const PARTYLIST_RAW = [
     "invalid": 4915,
     "blank": 3346,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 28958,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 18897,
     "margin": 10061,
-    "percent_invalid": 0,
+    "percent_invalid": 0.0,
     "ballot_surplus": -4
   },
   {
+    "cid": 267,
     "province_thai": "พะเยา",
     "province_eng": "PHAYAO",
     "prov_id": "PYO",
@@ -12478,14 +14447,17 @@ const PARTYLIST_RAW = [
     "invalid": 3590,
     "blank": 2105,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 51944,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 23565,
     "margin": 28379,
     "percent_invalid": 3.79336214457042,
     "ballot_surplus": 1
   },
   {
+    "cid": 268,
     "province_thai": "พะเยา",
     "province_eng": "PHAYAO",
     "prov_id": "PYO",
@@ -12497,14 +14469,17 @@ const PARTYLIST_RAW = [
     "invalid": 4411,
     "blank": 2116,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 31919,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 24359,
     "margin": 7560,
     "percent_invalid": 4.592973614610883,
     "ballot_surplus": 0
   },
   {
+    "cid": 269,
     "province_thai": "พะเยา",
     "province_eng": "PHAYAO",
     "prov_id": "PYO",
@@ -12516,14 +14491,17 @@ const PARTYLIST_RAW = [
     "invalid": 5204,
     "blank": 2222,
     "winner_party": "กล้าธรรม",
+    "winner_pid": 71,
     "winner_votes": 37613,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 23184,
     "margin": 14429,
     "percent_invalid": 5.318127005538864,
     "ballot_surplus": 0
   },
   {
+    "cid": 91,
     "province_thai": "เชียงราย",
     "province_eng": "CHIANG RAI",
     "prov_id": "CRI",
@@ -12535,14 +14513,17 @@ const PARTYLIST_RAW = [
     "invalid": 4331,
     "blank": 4693,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 44555,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 25309,
     "margin": 19246,
     "percent_invalid": 3.9623798065926827,
     "ballot_surplus": 14
   },
   {
+    "cid": 92,
     "province_thai": "เชียงราย",
     "province_eng": "CHIANG RAI",
     "prov_id": "CRI",
@@ -12554,14 +14535,17 @@ const PARTYLIST_RAW = [
     "invalid": 5143,
     "blank": 3634,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 31654,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 29326,
     "margin": 2328,
     "percent_invalid": 5.105373398056325,
     "ballot_surplus": -6
   },
   {
+    "cid": 93,
     "province_thai": "เชียงราย",
     "province_eng": "CHIANG RAI",
     "prov_id": "CRI",
@@ -12573,14 +14557,17 @@ const PARTYLIST_RAW = [
     "invalid": 6268,
     "blank": 3323,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 33968,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 24648,
     "margin": 9320,
     "percent_invalid": 5.973676937299265,
     "ballot_surplus": -5
   },
   {
+    "cid": 94,
     "province_thai": "เชียงราย",
     "province_eng": "CHIANG RAI",
     "prov_id": "CRI",
@@ -12592,14 +14579,17 @@ const PARTYLIST_RAW = [
     "invalid": 4875,
     "blank": 3369,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 33135,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 28518,
     "margin": 4617,
     "percent_invalid": 4.5540318361856365,
     "ballot_surplus": 0
   },
   {
+    "cid": 95,
     "province_thai": "เชียงราย",
     "province_eng": "CHIANG RAI",
     "prov_id": "CRI",
@@ -12611,14 +14601,17 @@ const PARTYLIST_RAW = [
     "invalid": 4312,
     "blank": 2768,
     "winner_party": "เพื่อไทย",
+    "winner_pid": 3,
     "winner_votes": 30529,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 29300,
     "margin": 1229,
     "percent_invalid": 4.3290999447818885,
     "ballot_surplus": -1
   },
   {
+    "cid": 96,
     "province_thai": "เชียงราย",
     "province_eng": "CHIANG RAI",
     "prov_id": "CRI",
@@ -12630,14 +14623,17 @@ const PARTYLIST_RAW = [
     "invalid": 4825,
     "blank": 2842,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 31622,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 18847,
     "margin": 12775,
     "percent_invalid": 5.617388874659464,
     "ballot_surplus": -2
   },
   {
+    "cid": 97,
     "province_thai": "เชียงราย",
     "province_eng": "CHIANG RAI",
     "prov_id": "CRI",
@@ -12649,14 +14645,17 @@ const PARTYLIST_RAW = [
     "invalid": 5624,
     "blank": 3579,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 30259,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 28773,
     "margin": 1486,
     "percent_invalid": 5.75840108123605,
     "ballot_surplus": 3
   },
   {
+    "cid": 153,
     "province_thai": "แม่ฮ่องสอน",
     "province_eng": "MAE HONG SON",
     "prov_id": "MSN",
@@ -12668,14 +14667,17 @@ const PARTYLIST_RAW = [
     "invalid": 3036,
     "blank": 2275,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 26697,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 5824,
     "margin": 20873,
     "percent_invalid": 4.454290702621811,
     "ballot_surplus": 0
   },
   {
+    "cid": 154,
     "province_thai": "แม่ฮ่องสอน",
     "province_eng": "MAE HONG SON",
     "prov_id": "MSN",
@@ -12687,14 +14689,17 @@ const PARTYLIST_RAW = [
     "invalid": 4732,
     "blank": 1397,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 24494,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 7668,
     "margin": 16826,
     "percent_invalid": 6.35944576596917,
     "ballot_surplus": 0
   },
   {
+    "cid": 198,
     "province_thai": "นครสวรรค์",
     "province_eng": "NAKHON SAWAN",
     "prov_id": "NSN",
@@ -12706,14 +14711,17 @@ const PARTYLIST_RAW = [
     "invalid": 3840,
     "blank": 3726,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 33966,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 27799,
     "margin": 6167,
     "percent_invalid": 3.87436562307669,
     "ballot_surplus": 0
   },
   {
+    "cid": 199,
     "province_thai": "นครสวรรค์",
     "province_eng": "NAKHON SAWAN",
     "prov_id": "NSN",
@@ -12725,14 +14733,17 @@ const PARTYLIST_RAW = [
     "invalid": 6300,
     "blank": 2907,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 28543,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 26024,
     "margin": 2519,
     "percent_invalid": 6.046935739309881,
     "ballot_surplus": 0
   },
   {
+    "cid": 200,
     "province_thai": "นครสวรรค์",
     "province_eng": "NAKHON SAWAN",
     "prov_id": "NSN",
@@ -12744,14 +14755,17 @@ const PARTYLIST_RAW = [
     "invalid": 6512,
     "blank": 3479,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 27442,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 12777,
     "margin": 14665,
     "percent_invalid": 6.5101771503978885,
     "ballot_surplus": 0
   },
   {
+    "cid": 201,
     "province_thai": "นครสวรรค์",
     "province_eng": "NAKHON SAWAN",
     "prov_id": "NSN",
@@ -12763,14 +14777,17 @@ const PARTYLIST_RAW = [
     "invalid": 6953,
     "blank": 2365,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 21276,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 20176,
     "margin": 1100,
     "percent_invalid": 7.523914643119942,
     "ballot_surplus": 1
   },
   {
+    "cid": 202,
     "province_thai": "นครสวรรค์",
     "province_eng": "NAKHON SAWAN",
     "prov_id": "NSN",
@@ -12782,14 +14799,17 @@ const PARTYLIST_RAW = [
     "invalid": 6456,
     "blank": 3084,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 25322,
     "runnerup_party": "พลังประชารัฐ",
+    "runnerup_pid": 38,
     "runnerup_votes": 23122,
     "margin": 2200,
     "percent_invalid": 6.809336469397011,
     "ballot_surplus": 0
   },
   {
+    "cid": 203,
     "province_thai": "นครสวรรค์",
     "province_eng": "NAKHON SAWAN",
     "prov_id": "NSN",
@@ -12801,14 +14821,17 @@ const PARTYLIST_RAW = [
     "invalid": 6832,
     "blank": 1817,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 21582,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 17400,
     "margin": 4182,
     "percent_invalid": 7.56706466118778,
     "ballot_surplus": 0
   },
   {
+    "cid": 389,
     "province_thai": "อุทัยธานี",
     "province_eng": "UTHAI THANI",
     "prov_id": "UTI",
@@ -12820,14 +14843,17 @@ const PARTYLIST_RAW = [
     "invalid": 4102,
     "blank": 2889,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 32183,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 19806,
     "margin": 12377,
     "percent_invalid": 4.8509933774834435,
     "ballot_surplus": 0
   },
   {
+    "cid": 390,
     "province_thai": "อุทัยธานี",
     "province_eng": "UTHAI THANI",
     "prov_id": "UTI",
@@ -12839,14 +14865,17 @@ const PARTYLIST_RAW = [
     "invalid": 4250,
     "blank": 2369,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 31647,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 18309,
     "margin": 13338,
     "percent_invalid": 5.065674986292879,
     "ballot_surplus": 0
   },
   {
+    "cid": 115,
     "province_thai": "กำแพงเพชร",
     "province_eng": "KAMPHAENG PHET",
     "prov_id": "KPT",
@@ -12858,14 +14887,17 @@ const PARTYLIST_RAW = [
     "invalid": 6367,
     "blank": 3907,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 32891,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 13169,
     "margin": 19722,
     "percent_invalid": 6.276492971353089,
     "ballot_surplus": -3
   },
   {
+    "cid": 116,
     "province_thai": "กำแพงเพชร",
     "province_eng": "KAMPHAENG PHET",
     "prov_id": "KPT",
@@ -12877,14 +14909,17 @@ const PARTYLIST_RAW = [
     "invalid": 7616,
     "blank": 3052,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 27524,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 14578,
     "margin": 12946,
     "percent_invalid": 7.231226441070632,
     "ballot_surplus": 0
   },
   {
+    "cid": 117,
     "province_thai": "กำแพงเพชร",
     "province_eng": "KAMPHAENG PHET",
     "prov_id": "KPT",
@@ -12896,14 +14931,17 @@ const PARTYLIST_RAW = [
     "invalid": 6661,
     "blank": 2762,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 24137,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 14924,
     "margin": 9213,
     "percent_invalid": 7.291335996935033,
     "ballot_surplus": 0
   },
   {
+    "cid": 118,
     "province_thai": "กำแพงเพชร",
     "province_eng": "KAMPHAENG PHET",
     "prov_id": "KPT",
@@ -12915,14 +14953,17 @@ const PARTYLIST_RAW = [
     "invalid": 6546,
     "blank": 2576,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 23593,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 18637,
     "margin": 4956,
     "percent_invalid": 6.992095706045717,
     "ballot_surplus": 0
   },
   {
+    "cid": 360,
     "province_thai": "ตาก",
     "province_eng": "TAK",
     "prov_id": "TAK",
@@ -12934,14 +14975,17 @@ const PARTYLIST_RAW = [
     "invalid": 6201,
     "blank": 4335,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 29783,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 17181,
     "margin": 12602,
     "percent_invalid": 5.887267514169887,
     "ballot_surplus": -1
   },
   {
+    "cid": 361,
     "province_thai": "ตาก",
     "province_eng": "TAK",
     "prov_id": "TAK",
@@ -12953,14 +14997,17 @@ const PARTYLIST_RAW = [
     "invalid": 6051,
     "blank": 4408,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 28986,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 14103,
     "margin": 14883,
     "percent_invalid": 6.782947908843279,
     "ballot_surplus": -23
   },
   {
+    "cid": 362,
     "province_thai": "ตาก",
     "province_eng": "TAK",
     "prov_id": "TAK",
@@ -12972,14 +15019,17 @@ const PARTYLIST_RAW = [
     "invalid": 6786,
     "blank": 2305,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 24975,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 10263,
     "margin": 14712,
     "percent_invalid": 7.03125,
     "ballot_surplus": 0
   },
   {
+    "cid": 354,
     "province_thai": "สุโขทัย",
     "province_eng": "SUKHOTHAI",
     "prov_id": "STI",
@@ -12991,14 +15041,17 @@ const PARTYLIST_RAW = [
     "invalid": 4950,
     "blank": 3529,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 24781,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 16005,
     "margin": 8776,
     "percent_invalid": 5.869101256817643,
     "ballot_surplus": 0
   },
   {
+    "cid": 355,
     "province_thai": "สุโขทัย",
     "province_eng": "SUKHOTHAI",
     "prov_id": "STI",
@@ -13010,14 +15063,17 @@ const PARTYLIST_RAW = [
     "invalid": 5228,
     "blank": 2371,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 20189,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 15628,
     "margin": 4561,
     "percent_invalid": 6.681491705646295,
     "ballot_surplus": 0
   },
   {
+    "cid": 356,
     "province_thai": "สุโขทัย",
     "province_eng": "SUKHOTHAI",
     "prov_id": "STI",
@@ -13029,14 +15085,17 @@ const PARTYLIST_RAW = [
     "invalid": 5406,
     "blank": 3649,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 21864,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 19087,
     "margin": 2777,
     "percent_invalid": 6.456390106412201,
     "ballot_surplus": 0
   },
   {
+    "cid": 357,
     "province_thai": "สุโขทัย",
     "province_eng": "SUKHOTHAI",
     "prov_id": "STI",
@@ -13048,14 +15107,17 @@ const PARTYLIST_RAW = [
     "invalid": 5164,
     "blank": 2016,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 22902,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 21639,
     "margin": 1263,
     "percent_invalid": 5.8903375195337,
     "ballot_surplus": -1
   },
   {
+    "cid": 236,
     "province_thai": "พิษณุโลก",
     "province_eng": "PHITSANULOK",
     "prov_id": "PLK",
@@ -13067,14 +15129,17 @@ const PARTYLIST_RAW = [
     "invalid": 3460,
     "blank": 5016,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 38220,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 15962,
     "margin": 22258,
     "percent_invalid": 3.4785056500583105,
     "ballot_surplus": 0
   },
   {
+    "cid": 237,
     "province_thai": "พิษณุโลก",
     "province_eng": "PHITSANULOK",
     "prov_id": "PLK",
@@ -13086,14 +15151,17 @@ const PARTYLIST_RAW = [
     "invalid": 5176,
     "blank": 5489,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 33505,
     "runnerup_party": "เพื่อไทย",
+    "runnerup_pid": 3,
     "runnerup_votes": 17098,
     "margin": 16407,
     "percent_invalid": 5.108617337320739,
     "ballot_surplus": 0
   },
   {
+    "cid": 238,
     "province_thai": "พิษณุโลก",
     "province_eng": "PHITSANULOK",
     "prov_id": "PLK",
@@ -13105,14 +15173,17 @@ const PARTYLIST_RAW = [
     "invalid": 6469,
     "blank": 2649,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 24037,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 19308,
     "margin": 4729,
     "percent_invalid": 6.813920664012303,
     "ballot_surplus": 0
   },
   {
+    "cid": 239,
     "province_thai": "พิษณุโลก",
     "province_eng": "PHITSANULOK",
     "prov_id": "PLK",
@@ -13124,14 +15195,17 @@ const PARTYLIST_RAW = [
     "invalid": 5614,
     "blank": 2319,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 24967,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 23285,
     "margin": 1682,
     "percent_invalid": 5.941243703170638,
     "ballot_surplus": 0
   },
   {
+    "cid": 240,
     "province_thai": "พิษณุโลก",
     "province_eng": "PHITSANULOK",
     "prov_id": "PLK",
@@ -13143,14 +15217,17 @@ const PARTYLIST_RAW = [
     "invalid": 5713,
     "blank": 3085,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 23261,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 18403,
     "margin": 4858,
     "percent_invalid": 6.043136549710695,
     "ballot_surplus": 0
   },
   {
+    "cid": 224,
     "province_thai": "พิจิตร",
     "province_eng": "PHICHIT",
     "prov_id": "PCT",
@@ -13162,14 +15239,17 @@ const PARTYLIST_RAW = [
     "invalid": 6323,
     "blank": 3436,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 27519,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 26589,
     "margin": 930,
     "percent_invalid": 6.2709511058216805,
     "ballot_surplus": 0
   },
   {
+    "cid": 225,
     "province_thai": "พิจิตร",
     "province_eng": "PHICHIT",
     "prov_id": "PCT",
@@ -13181,14 +15261,17 @@ const PARTYLIST_RAW = [
     "invalid": 6237,
     "blank": 2651,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 25652,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 21421,
     "margin": 4231,
     "percent_invalid": 6.847901272521657,
     "ballot_surplus": -1
   },
   {
+    "cid": 226,
     "province_thai": "พิจิตร",
     "province_eng": "PHICHIT",
     "prov_id": "PCT",
@@ -13200,14 +15283,17 @@ const PARTYLIST_RAW = [
     "invalid": 6773,
     "blank": 2241,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 24722,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 24258,
     "margin": 464,
     "percent_invalid": 6.732738225412035,
     "ballot_surplus": -1
   },
   {
+    "cid": 243,
     "province_thai": "เพชรบูรณ์",
     "province_eng": "PHETCHABUN",
     "prov_id": "PNB",
@@ -13219,14 +15305,17 @@ const PARTYLIST_RAW = [
     "invalid": 4651,
     "blank": 3606,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 24966,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 22417,
     "margin": 2549,
     "percent_invalid": 5.241212995413516,
     "ballot_surplus": -5
   },
   {
+    "cid": 244,
     "province_thai": "เพชรบูรณ์",
     "province_eng": "PHETCHABUN",
     "prov_id": "PNB",
@@ -13238,14 +15327,17 @@ const PARTYLIST_RAW = [
     "invalid": 5986,
     "blank": 2803,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 27073,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 24056,
     "margin": 3017,
     "percent_invalid": 5.974171141140542,
     "ballot_surplus": 0
   },
   {
+    "cid": 245,
     "province_thai": "เพชรบูรณ์",
     "province_eng": "PHETCHABUN",
     "prov_id": "PNB",
@@ -13257,14 +15349,17 @@ const PARTYLIST_RAW = [
     "invalid": 5865,
     "blank": 3093,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 23448,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 18717,
     "margin": 4731,
     "percent_invalid": 6.355794447213854,
     "ballot_surplus": 0
   },
   {
+    "cid": 246,
     "province_thai": "เพชรบูรณ์",
     "province_eng": "PHETCHABUN",
     "prov_id": "PNB",
@@ -13276,14 +15371,17 @@ const PARTYLIST_RAW = [
     "invalid": 5347,
     "blank": 2227,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 26151,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 17637,
     "margin": 8514,
     "percent_invalid": 6.844247606369362,
     "ballot_surplus": 0
   },
   {
+    "cid": 247,
     "province_thai": "เพชรบูรณ์",
     "province_eng": "PHETCHABUN",
     "prov_id": "PNB",
@@ -13295,14 +15393,17 @@ const PARTYLIST_RAW = [
     "invalid": 4903,
     "blank": 2436,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 22207,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 19876,
     "margin": 2331,
     "percent_invalid": 5.990884764360162,
     "ballot_surplus": 0
   },
   {
+    "cid": 248,
     "province_thai": "เพชรบูรณ์",
     "province_eng": "PHETCHABUN",
     "prov_id": "PNB",
@@ -13314,14 +15415,17 @@ const PARTYLIST_RAW = [
     "invalid": 5895,
     "blank": 2387,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 26924,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 20704,
     "margin": 6220,
     "percent_invalid": 6.736757899548597,
     "ballot_surplus": 0
   },
   {
+    "cid": 270,
     "province_thai": "ราชบุรี",
     "province_eng": "RATCHABURI",
     "prov_id": "RBR",
@@ -13333,14 +15437,17 @@ const PARTYLIST_RAW = [
     "invalid": 4836,
     "blank": 5286,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 35561,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 22882,
     "margin": 12679,
     "percent_invalid": 4.532291168780049,
     "ballot_surplus": 0
   },
   {
+    "cid": 271,
     "province_thai": "ราชบุรี",
     "province_eng": "RATCHABURI",
     "prov_id": "RBR",
@@ -13352,14 +15459,17 @@ const PARTYLIST_RAW = [
     "invalid": 6388,
     "blank": 5311,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 29423,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 12695,
     "margin": 16728,
     "percent_invalid": 6.297132379760062,
     "ballot_surplus": 0
   },
   {
+    "cid": 272,
     "province_thai": "ราชบุรี",
     "province_eng": "RATCHABURI",
     "prov_id": "RBR",
@@ -13371,14 +15481,17 @@ const PARTYLIST_RAW = [
     "invalid": 6503,
     "blank": 5940,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 32402,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 13782,
     "margin": 18620,
     "percent_invalid": 5.883843181962126,
     "ballot_surplus": 0
   },
   {
+    "cid": 273,
     "province_thai": "ราชบุรี",
     "province_eng": "RATCHABURI",
     "prov_id": "RBR",
@@ -13390,14 +15503,17 @@ const PARTYLIST_RAW = [
     "invalid": 5818,
     "blank": 4257,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 36715,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 24114,
     "margin": 12601,
     "percent_invalid": 5.151955228109946,
     "ballot_surplus": 0
   },
   {
+    "cid": 274,
     "province_thai": "ราชบุรี",
     "province_eng": "RATCHABURI",
     "prov_id": "RBR",
@@ -13409,14 +15525,17 @@ const PARTYLIST_RAW = [
     "invalid": 6231,
     "blank": 3743,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 33133,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 25109,
     "margin": 8024,
     "percent_invalid": 5.433000837053571,
     "ballot_surplus": 0
   },
   {
+    "cid": 119,
     "province_thai": "กาญจนบุรี",
     "province_eng": "KANCHANABURI",
     "prov_id": "KRI",
@@ -13428,14 +15547,17 @@ const PARTYLIST_RAW = [
     "invalid": 4938,
     "blank": 5164,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 31045,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 14347,
     "margin": 16698,
     "percent_invalid": 5.113759928751178,
     "ballot_surplus": 1
   },
   {
+    "cid": 120,
     "province_thai": "กาญจนบุรี",
     "province_eng": "KANCHANABURI",
     "prov_id": "KRI",
@@ -13447,14 +15569,17 @@ const PARTYLIST_RAW = [
     "invalid": 5775,
     "blank": 3731,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 30319,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 19447,
     "margin": 10872,
     "percent_invalid": 5.567016272075268,
     "ballot_surplus": 0
   },
   {
+    "cid": 121,
     "province_thai": "กาญจนบุรี",
     "province_eng": "KANCHANABURI",
     "prov_id": "KRI",
@@ -13466,14 +15591,17 @@ const PARTYLIST_RAW = [
     "invalid": 6433,
     "blank": 3299,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 32756,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 26169,
     "margin": 6587,
     "percent_invalid": 5.645062215904105,
     "ballot_surplus": 0
   },
   {
+    "cid": 122,
     "province_thai": "กาญจนบุรี",
     "province_eng": "KANCHANABURI",
     "prov_id": "KRI",
@@ -13485,14 +15613,17 @@ const PARTYLIST_RAW = [
     "invalid": 7657,
     "blank": 3855,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 23873,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 17963,
     "margin": 5910,
     "percent_invalid": 8.187028206060347,
     "ballot_surplus": 0
   },
   {
+    "cid": 123,
     "province_thai": "กาญจนบุรี",
     "province_eng": "KANCHANABURI",
     "prov_id": "KRI",
@@ -13504,14 +15635,17 @@ const PARTYLIST_RAW = [
     "invalid": 5480,
     "blank": 2129,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 23372,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 16461,
     "margin": 6911,
     "percent_invalid": 6.153707945919238,
     "ballot_surplus": 0
   },
   {
+    "cid": 320,
     "province_thai": "สุพรรณบุรี",
     "province_eng": "SUPHAN BURI",
     "prov_id": "SPB",
@@ -13523,14 +15657,17 @@ const PARTYLIST_RAW = [
     "invalid": 4799,
     "blank": 3780,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 39992,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 31712,
     "margin": 8280,
     "percent_invalid": 4.683047738006948,
     "ballot_surplus": 0
   },
   {
+    "cid": 321,
     "province_thai": "สุพรรณบุรี",
     "province_eng": "SUPHAN BURI",
     "prov_id": "SPB",
@@ -13542,14 +15679,17 @@ const PARTYLIST_RAW = [
     "invalid": 4304,
     "blank": 3055,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 33279,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 27020,
     "margin": 6259,
     "percent_invalid": 4.699818733757016,
     "ballot_surplus": 0
   },
   {
+    "cid": 322,
     "province_thai": "สุพรรณบุรี",
     "province_eng": "SUPHAN BURI",
     "prov_id": "SPB",
@@ -13561,14 +15701,17 @@ const PARTYLIST_RAW = [
     "invalid": 6610,
     "blank": 2808,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 34037,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 29244,
     "margin": 4793,
     "percent_invalid": 6.190761622897389,
     "ballot_surplus": 0
   },
   {
+    "cid": 323,
     "province_thai": "สุพรรณบุรี",
     "province_eng": "SUPHAN BURI",
     "prov_id": "SPB",
@@ -13580,14 +15723,17 @@ const PARTYLIST_RAW = [
     "invalid": 6493,
     "blank": 2984,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 32516,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 27319,
     "margin": 5197,
     "percent_invalid": 6.517374982434304,
     "ballot_surplus": 0
   },
   {
+    "cid": 324,
     "province_thai": "สุพรรณบุรี",
     "province_eng": "SUPHAN BURI",
     "prov_id": "SPB",
@@ -13599,14 +15745,17 @@ const PARTYLIST_RAW = [
     "invalid": 5943,
     "blank": 4154,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 33826,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 31538,
     "margin": 2288,
     "percent_invalid": 5.680015291981267,
     "ballot_surplus": 0
   },
   {
+    "cid": 192,
     "province_thai": "นครปฐม",
     "province_eng": "NAKHON PATHOM",
     "prov_id": "NPT",
@@ -13618,14 +15767,17 @@ const PARTYLIST_RAW = [
     "invalid": 4384,
     "blank": 4280,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 37192,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 23371,
     "margin": 13821,
     "percent_invalid": 4.198349006914252,
     "ballot_surplus": 0
   },
   {
+    "cid": 193,
     "province_thai": "นครปฐม",
     "province_eng": "NAKHON PATHOM",
     "prov_id": "NPT",
@@ -13637,14 +15789,17 @@ const PARTYLIST_RAW = [
     "invalid": 4178,
     "blank": 4733,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 36445,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 14901,
     "margin": 21544,
     "percent_invalid": 4.333485458241713,
     "ballot_surplus": 0
   },
   {
+    "cid": 194,
     "province_thai": "นครปฐม",
     "province_eng": "NAKHON PATHOM",
     "prov_id": "NPT",
@@ -13656,14 +15811,17 @@ const PARTYLIST_RAW = [
     "invalid": 4668,
     "blank": 3970,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 28927,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 18903,
     "margin": 10024,
     "percent_invalid": 5.114047196476697,
     "ballot_surplus": 0
   },
   {
+    "cid": 195,
     "province_thai": "นครปฐม",
     "province_eng": "NAKHON PATHOM",
     "prov_id": "NPT",
@@ -13675,14 +15833,17 @@ const PARTYLIST_RAW = [
     "invalid": 5067,
     "blank": 3351,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 33810,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 22248,
     "margin": 11562,
     "percent_invalid": 4.819884520627431,
     "ballot_surplus": 0
   },
   {
+    "cid": 196,
     "province_thai": "นครปฐม",
     "province_eng": "NAKHON PATHOM",
     "prov_id": "NPT",
@@ -13694,14 +15855,17 @@ const PARTYLIST_RAW = [
     "invalid": 4474,
     "blank": 3909,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 37176,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 24399,
     "margin": 12777,
     "percent_invalid": 4.173196030147004,
     "ballot_surplus": 0
   },
   {
+    "cid": 197,
     "province_thai": "นครปฐม",
     "province_eng": "NAKHON PATHOM",
     "prov_id": "NPT",
@@ -13713,14 +15877,17 @@ const PARTYLIST_RAW = [
     "invalid": 2904,
     "blank": 3428,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 41742,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 19442,
     "margin": 22300,
     "percent_invalid": 2.982499383781119,
     "ballot_surplus": 0
   },
   {
+    "cid": 300,
     "province_thai": "สมุทรสาคร",
     "province_eng": "SAMUT SAKHON",
     "prov_id": "SKN",
@@ -13732,14 +15899,17 @@ const PARTYLIST_RAW = [
     "invalid": 2565,
     "blank": 3210,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 36777,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 12938,
     "margin": 23839,
     "percent_invalid": 2.913249892101856,
     "ballot_surplus": 0
   },
   {
+    "cid": 301,
     "province_thai": "สมุทรสาคร",
     "province_eng": "SAMUT SAKHON",
     "prov_id": "SKN",
@@ -13751,14 +15921,17 @@ const PARTYLIST_RAW = [
     "invalid": 3130,
     "blank": 3108,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 34442,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 16015,
     "margin": 18427,
     "percent_invalid": 3.6562857743616104,
     "ballot_surplus": 0
   },
   {
+    "cid": 302,
     "province_thai": "สมุทรสาคร",
     "province_eng": "SAMUT SAKHON",
     "prov_id": "SKN",
@@ -13770,14 +15943,17 @@ const PARTYLIST_RAW = [
     "invalid": 2506,
     "blank": 2679,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 36221,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 11340,
     "margin": 24881,
     "percent_invalid": 3.0609128995615054,
     "ballot_surplus": -1
   },
   {
+    "cid": 401,
     "province_thai": "สมุทรสาคร",
     "province_eng": "SAMUT SAKHON",
     "prov_id": "SKN",
@@ -13789,14 +15965,17 @@ const PARTYLIST_RAW = [
     "invalid": 4189,
     "blank": 3323,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 29167,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 16769,
     "margin": 12398,
     "percent_invalid": 4.936947554507955,
     "ballot_surplus": 0
   },
   {
+    "cid": 299,
     "province_thai": "สมุทรสงคราม",
     "province_eng": "SAMUT SONGKHRAM",
     "prov_id": "SKM",
@@ -13808,14 +15987,17 @@ const PARTYLIST_RAW = [
     "invalid": 5056,
     "blank": 5134,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 37729,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 19804,
     "margin": 17925,
     "percent_invalid": 4.458199966492959,
     "ballot_surplus": 0
   },
   {
+    "cid": 221,
     "province_thai": "เพชรบุรี",
     "province_eng": "PHETCHABURI",
     "prov_id": "PBI",
@@ -13827,14 +16009,17 @@ const PARTYLIST_RAW = [
     "invalid": 4750,
     "blank": 4289,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 29048,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 26947,
     "margin": 2101,
     "percent_invalid": 4.7794894499059195,
     "ballot_surplus": 0
   },
   {
+    "cid": 222,
     "province_thai": "เพชรบุรี",
     "province_eng": "PHETCHABURI",
     "prov_id": "PBI",
@@ -13846,14 +16031,17 @@ const PARTYLIST_RAW = [
     "invalid": 5665,
     "blank": 4047,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 33531,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 25466,
     "margin": 8065,
     "percent_invalid": 5.353480943875864,
     "ballot_surplus": 0
   },
   {
+    "cid": 223,
     "province_thai": "เพชรบุรี",
     "province_eng": "PHETCHABURI",
     "prov_id": "PBI",
@@ -13865,14 +16053,17 @@ const PARTYLIST_RAW = [
     "invalid": 5599,
     "blank": 4320,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 26391,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 24228,
     "margin": 2163,
     "percent_invalid": 5.420450364977636,
     "ballot_surplus": 0
   },
   {
+    "cid": 227,
     "province_thai": "ประจวบคีรีขันธ์",
     "province_eng": "PRACHUAP KHIRI KHAN",
     "prov_id": "PKN",
@@ -13884,14 +16075,17 @@ const PARTYLIST_RAW = [
     "invalid": 6984,
     "blank": 3313,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 28458,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 25022,
     "margin": 3436,
     "percent_invalid": 5.903734636257587,
     "ballot_surplus": 1
   },
   {
+    "cid": 228,
     "province_thai": "ประจวบคีรีขันธ์",
     "province_eng": "PRACHUAP KHIRI KHAN",
     "prov_id": "PKN",
@@ -13903,14 +16097,17 @@ const PARTYLIST_RAW = [
     "invalid": 4545,
     "blank": 3465,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 31660,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 15685,
     "margin": 15975,
     "percent_invalid": 4.388590629948631,
     "ballot_surplus": 1
   },
   {
+    "cid": 229,
     "province_thai": "ประจวบคีรีขันธ์",
     "province_eng": "PRACHUAP KHIRI KHAN",
     "prov_id": "PKN",
@@ -13922,14 +16119,17 @@ const PARTYLIST_RAW = [
     "invalid": 4931,
     "blank": 2159,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 30621,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 21015,
     "margin": 9606,
     "percent_invalid": 4.76793656932895,
     "ballot_surplus": 0
   },
   {
+    "cid": 204,
     "province_thai": "นครศรีธรรมราช",
     "province_eng": "NAKHON SI THAMMARAT",
     "prov_id": "NST",
@@ -13941,14 +16141,17 @@ const PARTYLIST_RAW = [
     "invalid": 3158,
     "blank": 2495,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 41064,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 21574,
     "margin": 19490,
     "percent_invalid": 3.164360364332308,
     "ballot_surplus": 0
   },
   {
+    "cid": 205,
     "province_thai": "นครศรีธรรมราช",
     "province_eng": "NAKHON SI THAMMARAT",
     "prov_id": "NST",
@@ -13960,14 +16163,17 @@ const PARTYLIST_RAW = [
     "invalid": 3650,
     "blank": 2373,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 54939,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 15699,
     "margin": 39240,
     "percent_invalid": 3.6290964047088767,
     "ballot_surplus": 0
   },
   {
+    "cid": 206,
     "province_thai": "นครศรีธรรมราช",
     "province_eng": "NAKHON SI THAMMARAT",
     "prov_id": "NST",
@@ -13979,14 +16185,17 @@ const PARTYLIST_RAW = [
     "invalid": 3526,
     "blank": 1227,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 60936,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 11737,
     "margin": 49199,
     "percent_invalid": 3.590375431486554,
     "ballot_surplus": 0
   },
   {
+    "cid": 207,
     "province_thai": "นครศรีธรรมราช",
     "province_eng": "NAKHON SI THAMMARAT",
     "prov_id": "NST",
@@ -13998,14 +16207,17 @@ const PARTYLIST_RAW = [
     "invalid": 3372,
     "blank": 1669,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 62772,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 14232,
     "margin": 48540,
     "percent_invalid": 3.2686771163521096,
     "ballot_surplus": 1
   },
   {
+    "cid": 208,
     "province_thai": "นครศรีธรรมราช",
     "province_eng": "NAKHON SI THAMMARAT",
     "prov_id": "NST",
@@ -14017,14 +16229,17 @@ const PARTYLIST_RAW = [
     "invalid": 3098,
     "blank": 2677,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 54686,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 18520,
     "margin": 36166,
     "percent_invalid": 2.902760339561119,
     "ballot_surplus": -11
   },
   {
+    "cid": 209,
     "province_thai": "นครศรีธรรมราช",
     "province_eng": "NAKHON SI THAMMARAT",
     "prov_id": "NST",
@@ -14036,14 +16251,17 @@ const PARTYLIST_RAW = [
     "invalid": 3249,
     "blank": 1633,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 64430,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 13378,
     "margin": 51052,
     "percent_invalid": 3.0934902453654773,
     "ballot_surplus": 0
   },
   {
+    "cid": 210,
     "province_thai": "นครศรีธรรมราช",
     "province_eng": "NAKHON SI THAMMARAT",
     "prov_id": "NST",
@@ -14055,14 +16273,17 @@ const PARTYLIST_RAW = [
     "invalid": 3743,
     "blank": 4000,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 50315,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 14059,
     "margin": 36256,
     "percent_invalid": 3.777831607420416,
     "ballot_surplus": 1
   },
   {
+    "cid": 211,
     "province_thai": "นครศรีธรรมราช",
     "province_eng": "NAKHON SI THAMMARAT",
     "prov_id": "NST",
@@ -14074,14 +16295,17 @@ const PARTYLIST_RAW = [
     "invalid": 3782,
     "blank": 2133,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 49757,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 16857,
     "margin": 32900,
     "percent_invalid": 3.784725002001441,
     "ballot_surplus": 0
   },
   {
+    "cid": 212,
     "province_thai": "นครศรีธรรมราช",
     "province_eng": "NAKHON SI THAMMARAT",
     "prov_id": "NST",
@@ -14093,14 +16317,17 @@ const PARTYLIST_RAW = [
     "invalid": 3255,
     "blank": 1649,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 56510,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 15191,
     "margin": 41319,
     "percent_invalid": 3.1881133812611413,
     "ballot_surplus": 0
   },
   {
+    "cid": 101,
     "province_thai": "กระบี่",
     "province_eng": "KRABI",
     "prov_id": "KBI",
@@ -14112,14 +16339,17 @@ const PARTYLIST_RAW = [
     "invalid": 3424,
     "blank": 2652,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 34327,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 22325,
     "margin": 12002,
     "percent_invalid": 3.5143179718772455,
     "ballot_surplus": 1
   },
   {
+    "cid": 102,
     "province_thai": "กระบี่",
     "province_eng": "KRABI",
     "prov_id": "KBI",
@@ -14131,14 +16361,17 @@ const PARTYLIST_RAW = [
     "invalid": 2948,
     "blank": 1906,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 47619,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 13386,
     "margin": 34233,
     "percent_invalid": 3.423289516466162,
     "ballot_surplus": 0
   },
   {
+    "cid": 103,
     "province_thai": "กระบี่",
     "province_eng": "KRABI",
     "prov_id": "KBI",
@@ -14150,14 +16383,17 @@ const PARTYLIST_RAW = [
     "invalid": 3260,
     "blank": 1985,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 46386,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 15095,
     "margin": 31291,
     "percent_invalid": 3.4432861201770226,
     "ballot_surplus": 0
   },
   {
+    "cid": 241,
     "province_thai": "พังงา",
     "province_eng": "PHANGNGA",
     "prov_id": "PNA",
@@ -14169,14 +16405,17 @@ const PARTYLIST_RAW = [
     "invalid": 2614,
     "blank": 2422,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 32224,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 13045,
     "margin": 19179,
     "percent_invalid": 3.513204757744775,
     "ballot_surplus": 1
   },
   {
+    "cid": 242,
     "province_thai": "พังงา",
     "province_eng": "PHANGNGA",
     "prov_id": "PNA",
@@ -14188,14 +16427,17 @@ const PARTYLIST_RAW = [
     "invalid": 3361,
     "blank": 2898,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 33539,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 15893,
     "margin": 17646,
     "percent_invalid": 4.044914071150051,
     "ballot_surplus": 1
   },
   {
+    "cid": 230,
     "province_thai": "ภูเก็ต",
     "province_eng": "PHUKET",
     "prov_id": "PKT",
@@ -14207,14 +16449,17 @@ const PARTYLIST_RAW = [
     "invalid": 1950,
     "blank": 2245,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 23729,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 19346,
     "margin": 4383,
     "percent_invalid": 2.675227394328518,
     "ballot_surplus": -2
   },
   {
+    "cid": 231,
     "province_thai": "ภูเก็ต",
     "province_eng": "PHUKET",
     "prov_id": "PKT",
@@ -14226,14 +16471,17 @@ const PARTYLIST_RAW = [
     "invalid": 1883,
     "blank": 2676,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 23852,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 18246,
     "margin": 5606,
     "percent_invalid": 2.620190635218813,
     "ballot_surplus": 0
   },
   {
+    "cid": 232,
     "province_thai": "ภูเก็ต",
     "province_eng": "PHUKET",
     "prov_id": "PKT",
@@ -14245,14 +16493,17 @@ const PARTYLIST_RAW = [
     "invalid": 2319,
     "blank": 3214,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 25483,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 23777,
     "margin": 1706,
     "percent_invalid": 2.8217857925093086,
     "ballot_surplus": 0
   },
   {
+    "cid": 306,
     "province_thai": "สุราษฎร์ธานี",
     "province_eng": "SURAT THANI",
     "prov_id": "SNI",
@@ -14264,14 +16515,17 @@ const PARTYLIST_RAW = [
     "invalid": 1656,
     "blank": 2525,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 31184,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 24521,
     "margin": 6663,
     "percent_invalid": 1.9917970676320946,
     "ballot_surplus": 0
   },
   {
+    "cid": 307,
     "province_thai": "สุราษฎร์ธานี",
     "province_eng": "SURAT THANI",
     "prov_id": "SNI",
@@ -14283,14 +16537,17 @@ const PARTYLIST_RAW = [
     "invalid": 2722,
     "blank": 1773,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 40376,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 16645,
     "margin": 23731,
     "percent_invalid": 3.146529800712073,
     "ballot_surplus": 0
   },
   {
+    "cid": 308,
     "province_thai": "สุราษฎร์ธานี",
     "province_eng": "SURAT THANI",
     "prov_id": "SNI",
@@ -14302,14 +16559,17 @@ const PARTYLIST_RAW = [
     "invalid": 3047,
     "blank": 1967,
     "winner_party": "ประชาธิปัตย",
+    "winner_pid": 0,
     "winner_votes": 53083,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 14843,
     "margin": 38240,
     "percent_invalid": 3.2343325407608696,
     "ballot_surplus": -1
   },
   {
+    "cid": 309,
     "province_thai": "สุราษฎร์ธานี",
     "province_eng": "SURAT THANI",
     "prov_id": "SNI",
@@ -14321,14 +16581,17 @@ const PARTYLIST_RAW = [
     "invalid": 2813,
     "blank": 1578,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 57643,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 15127,
     "margin": 42516,
     "percent_invalid": 2.847483019364504,
     "ballot_surplus": 0
   },
   {
+    "cid": 310,
     "province_thai": "สุราษฎร์ธานี",
     "province_eng": "SURAT THANI",
     "prov_id": "SNI",
@@ -14340,14 +16603,17 @@ const PARTYLIST_RAW = [
     "invalid": 3076,
     "blank": 1703,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 58199,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 12823,
     "margin": 45376,
     "percent_invalid": 3.2766628318206994,
     "ballot_surplus": 0
   },
   {
+    "cid": 311,
     "province_thai": "สุราษฎร์ธานี",
     "province_eng": "SURAT THANI",
     "prov_id": "SNI",
@@ -14359,14 +16625,17 @@ const PARTYLIST_RAW = [
     "invalid": 3515,
     "blank": 1410,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 60149,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 12918,
     "margin": 47231,
     "percent_invalid": 3.4385944317270254,
     "ballot_surplus": 0
   },
   {
+    "cid": 312,
     "province_thai": "สุราษฎร์ธานี",
     "province_eng": "SURAT THANI",
     "prov_id": "SNI",
@@ -14378,14 +16647,17 @@ const PARTYLIST_RAW = [
     "invalid": 2846,
     "blank": 1825,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 50510,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 16649,
     "margin": 33861,
     "percent_invalid": 2.9450417541935283,
     "ballot_surplus": 0
   },
   {
+    "cid": 283,
     "province_thai": "ระนอง",
     "province_eng": "RANONG",
     "prov_id": "RNG",
@@ -14397,14 +16669,17 @@ const PARTYLIST_RAW = [
     "invalid": 3703,
     "blank": 3122,
     "winner_party": "ภูมิใจไทย",
+    "winner_pid": 7,
     "winner_votes": 28861,
     "runnerup_party": "ประชาธิปัตย์",
+    "runnerup_pid": 0,
     "runnerup_votes": 28233,
     "margin": 628,
     "percent_invalid": 3.8453151123064617,
     "ballot_surplus": 0
   },
   {
+    "cid": 88,
     "province_thai": "ชุมพร",
     "province_eng": "CHUMPHON",
     "prov_id": "CPN",
@@ -14416,14 +16691,17 @@ const PARTYLIST_RAW = [
     "invalid": 3052,
     "blank": 2727,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 43546,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 25496,
     "margin": 18050,
     "percent_invalid": 2.929854371262084,
     "ballot_surplus": -1
   },
   {
+    "cid": 89,
     "province_thai": "ชุมพร",
     "province_eng": "CHUMPHON",
     "prov_id": "CPN",
@@ -14435,14 +16713,17 @@ const PARTYLIST_RAW = [
     "invalid": 3781,
     "blank": 2326,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 49475,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 20314,
     "margin": 29161,
     "percent_invalid": 3.507876718683317,
     "ballot_surplus": -1
   },
   {
+    "cid": 90,
     "province_thai": "ชุมพร",
     "province_eng": "CHUMPHON",
     "prov_id": "CPN",
@@ -14454,14 +16735,17 @@ const PARTYLIST_RAW = [
     "invalid": 3303,
     "blank": 2101,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 49567,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 19521,
     "margin": 30046,
     "percent_invalid": 3.2610627332504,
     "ballot_surplus": 1
   },
   {
+    "cid": 290,
     "province_thai": "สงขลา",
     "province_eng": "SONGKHLA",
     "prov_id": "SKA",
@@ -14473,14 +16757,17 @@ const PARTYLIST_RAW = [
     "invalid": 3039,
     "blank": 3598,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 39983,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 22764,
     "margin": 17219,
     "percent_invalid": 3.123008940499435,
     "ballot_surplus": 1
   },
   {
+    "cid": 291,
     "province_thai": "สงขลา",
     "province_eng": "SONGKHLA",
     "prov_id": "SKA",
@@ -14492,14 +16779,17 @@ const PARTYLIST_RAW = [
     "invalid": 1830,
     "blank": 2147,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 29277,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 25933,
     "margin": 3344,
     "percent_invalid": 2.211186428390184,
     "ballot_surplus": -2
   },
   {
+    "cid": 292,
     "province_thai": "สงขลา",
     "province_eng": "SONGKHLA",
     "prov_id": "SKA",
@@ -14511,14 +16801,17 @@ const PARTYLIST_RAW = [
     "invalid": 2783,
     "blank": 6937,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 48006,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 25204,
     "margin": 22802,
     "percent_invalid": 2.6259919417997906,
     "ballot_surplus": -3432
   },
   {
+    "cid": 293,
     "province_thai": "สงขลา",
     "province_eng": "SONGKHLA",
     "prov_id": "SKA",
@@ -14530,14 +16823,17 @@ const PARTYLIST_RAW = [
     "invalid": 3935,
     "blank": 1678,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 58115,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 13006,
     "margin": 45109,
     "percent_invalid": 3.8791403785488963,
     "ballot_surplus": 0
   },
   {
+    "cid": 294,
     "province_thai": "สงขลา",
     "province_eng": "SONGKHLA",
     "prov_id": "SKA",
@@ -14549,14 +16845,17 @@ const PARTYLIST_RAW = [
     "invalid": 3923,
     "blank": 2685,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 61655,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 16383,
     "margin": 45272,
     "percent_invalid": 3.7531690983018415,
     "ballot_surplus": 0
   },
   {
+    "cid": 295,
     "province_thai": "สงขลา",
     "province_eng": "SONGKHLA",
     "prov_id": "SKA",
@@ -14568,14 +16867,17 @@ const PARTYLIST_RAW = [
     "invalid": 3164,
     "blank": 1828,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 42391,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 18864,
     "margin": 23527,
     "percent_invalid": 3.3719121000916514,
     "ballot_surplus": 0
   },
   {
+    "cid": 296,
     "province_thai": "สงขลา",
     "province_eng": "SONGKHLA",
     "prov_id": "SKA",
@@ -14587,14 +16889,17 @@ const PARTYLIST_RAW = [
     "invalid": 4053,
     "blank": 1711,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 42395,
     "runnerup_party": "พรรคประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 16329,
     "margin": 26066,
     "percent_invalid": 4.102185200554651,
     "ballot_surplus": 0
   },
   {
+    "cid": 297,
     "province_thai": "สงขลา",
     "province_eng": "SONGKHLA",
     "prov_id": "SKA",
@@ -14606,14 +16911,17 @@ const PARTYLIST_RAW = [
     "invalid": 4014,
     "blank": 1737,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 43026,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 17134,
     "margin": 25892,
     "percent_invalid": 4.0156464150301625,
     "ballot_surplus": 0
   },
   {
+    "cid": 298,
     "province_thai": "สงขลา",
     "province_eng": "SONGKHLA",
     "prov_id": "SKA",
@@ -14625,14 +16933,17 @@ const PARTYLIST_RAW = [
     "invalid": 3119,
     "blank": 2943,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 50913,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 25550,
     "margin": 25363,
     "percent_invalid": 2.82390221819828,
     "ballot_surplus": 0
   },
   {
+    "cid": 358,
     "province_thai": "สตูล",
     "province_eng": "SATUN",
     "prov_id": "STN",
@@ -14644,14 +16955,17 @@ const PARTYLIST_RAW = [
     "invalid": 3570,
     "blank": 3074,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 25287,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 19984,
     "margin": 5303,
     "percent_invalid": 4.035950483296592,
     "ballot_surplus": 0
   },
   {
+    "cid": 359,
     "province_thai": "สตูล",
     "province_eng": "SATUN",
     "prov_id": "STN",
@@ -14663,14 +16977,17 @@ const PARTYLIST_RAW = [
     "invalid": 3464,
     "blank": 3109,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 41257,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 21584,
     "margin": 19673,
     "percent_invalid": 3.487716472009666,
     "ballot_surplus": 0
   },
   {
+    "cid": 363,
     "province_thai": "ตรัง",
     "province_eng": "TRANG",
     "prov_id": "TRG",
@@ -14682,14 +16999,17 @@ const PARTYLIST_RAW = [
     "invalid": 2612,
     "blank": 3443,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 52827,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 19659,
     "margin": 33168,
     "percent_invalid": 2.6310222911651238,
     "ballot_surplus": 0
   },
   {
+    "cid": 364,
     "province_thai": "ตรัง",
     "province_eng": "TRANG",
     "prov_id": "TRG",
@@ -14701,14 +17021,17 @@ const PARTYLIST_RAW = [
     "invalid": 2944,
     "blank": 2345,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 62067,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 14315,
     "margin": 47752,
     "percent_invalid": 2.9092633950629483,
     "ballot_surplus": 0
   },
   {
+    "cid": 365,
     "province_thai": "ตรัง",
     "province_eng": "TRANG",
     "prov_id": "TRG",
@@ -14720,14 +17043,17 @@ const PARTYLIST_RAW = [
     "invalid": 2813,
     "blank": 2436,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 62435,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 12971,
     "margin": 49464,
     "percent_invalid": 2.9537459967448942,
     "ballot_surplus": 0
   },
   {
+    "cid": 366,
     "province_thai": "ตรัง",
     "province_eng": "TRANG",
     "prov_id": "TRG",
@@ -14739,14 +17065,17 @@ const PARTYLIST_RAW = [
     "invalid": 2891,
     "blank": 2153,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 61207,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 15660,
     "margin": 45547,
     "percent_invalid": 2.905031301184722,
     "ballot_surplus": 0
   },
   {
+    "cid": 233,
     "province_thai": "พัทลุง",
     "province_eng": "PHATTHALUNG",
     "prov_id": "PLG",
@@ -14758,14 +17087,17 @@ const PARTYLIST_RAW = [
     "invalid": 3275,
     "blank": 2132,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 54606,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 19237,
     "margin": 35369,
     "percent_invalid": 2.886301744119436,
     "ballot_surplus": 0
   },
   {
+    "cid": 234,
     "province_thai": "พัทลุง",
     "province_eng": "PHATTHALUNG",
     "prov_id": "PLG",
@@ -14777,14 +17109,17 @@ const PARTYLIST_RAW = [
     "invalid": 3700,
     "blank": 1874,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 63946,
     "runnerup_party": "ภูมิใจไทย",
+    "runnerup_pid": 7,
     "runnerup_votes": 17720,
     "margin": 46226,
     "percent_invalid": 3.0235427749585284,
     "ballot_surplus": -1
   },
   {
+    "cid": 235,
     "province_thai": "พัทลุง",
     "province_eng": "PHATTHALUNG",
     "prov_id": "PLG",
@@ -14796,14 +17131,17 @@ const PARTYLIST_RAW = [
     "invalid": 3653,
     "blank": 2014,
     "winner_party": "ประชาธิปัตย์",
+    "winner_pid": 0,
     "winner_votes": 61392,
     "runnerup_party": "ไทยพร้อม",
+    "runnerup_pid": 31,
     "runnerup_votes": 18046,
     "margin": 43346,
     "percent_invalid": 3.1341695694699454,
     "ballot_surplus": 0
   },
   {
+    "cid": 262,
     "province_thai": "ปัตตานี",
     "province_eng": "PATTANI",
     "prov_id": "PTN",
@@ -14815,14 +17153,17 @@ const PARTYLIST_RAW = [
     "invalid": 3270,
     "blank": 2030,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 22902,
     "runnerup_party": "ประชาชาติ",
+    "runnerup_pid": 35,
     "runnerup_votes": 16814,
     "margin": 6088,
     "percent_invalid": 4.406057992885631,
     "ballot_surplus": -1
   },
   {
+    "cid": 263,
     "province_thai": "ปัตตานี",
     "province_eng": "PATTANI",
     "prov_id": "PTN",
@@ -14834,14 +17175,17 @@ const PARTYLIST_RAW = [
     "invalid": 4321,
     "blank": 1656,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 19150,
     "runnerup_party": "ประชาชาติ",
+    "runnerup_pid": 35,
     "runnerup_votes": 17901,
     "margin": 1249,
     "percent_invalid": 5.300864871496044,
     "ballot_surplus": 0
   },
   {
+    "cid": 264,
     "province_thai": "ปัตตานี",
     "province_eng": "PATTANI",
     "prov_id": "PTN",
@@ -14853,14 +17197,17 @@ const PARTYLIST_RAW = [
     "invalid": 3721,
     "blank": 1158,
     "winner_party": "ประชาชาติ",
+    "winner_pid": 35,
     "winner_votes": 25894,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 17990,
     "margin": 7904,
     "percent_invalid": 5.301173922954183,
     "ballot_surplus": 0
   },
   {
+    "cid": 265,
     "province_thai": "ปัตตานี",
     "province_eng": "PATTANI",
     "prov_id": "PTN",
@@ -14872,14 +17219,17 @@ const PARTYLIST_RAW = [
     "invalid": 4144,
     "blank": 1197,
     "winner_party": "ประชาชาติ",
+    "winner_pid": 35,
     "winner_votes": 26673,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 21364,
     "margin": 5309,
     "percent_invalid": 4.943691544187822,
     "ballot_surplus": -2
   },
   {
+    "cid": 266,
     "province_thai": "ปัตตานี",
     "province_eng": "PATTANI",
     "prov_id": "PTN",
@@ -14891,14 +17241,17 @@ const PARTYLIST_RAW = [
     "invalid": 4443,
     "blank": 1230,
     "winner_party": "ประชาชาติ",
+    "winner_pid": 35,
     "winner_votes": 30529,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 20567,
     "margin": 9962,
     "percent_invalid": 5.658863387421351,
     "ballot_surplus": 0
   },
   {
+    "cid": 394,
     "province_thai": "ยะลา",
     "province_eng": "YALA",
     "prov_id": "YLA",
@@ -14910,14 +17263,17 @@ const PARTYLIST_RAW = [
     "invalid": 4121,
     "blank": 3404,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 26129,
     "runnerup_party": "ประชาชาติ",
+    "runnerup_pid": 35,
     "runnerup_votes": 24130,
     "margin": 1999,
     "percent_invalid": 4.163425303846193,
     "ballot_surplus": 0
   },
   {
+    "cid": 395,
     "province_thai": "ยะลา",
     "province_eng": "YALA",
     "prov_id": "YLA",
@@ -14929,14 +17285,17 @@ const PARTYLIST_RAW = [
     "invalid": 5681,
     "blank": 2086,
     "winner_party": "ประชาชาติ",
+    "winner_pid": 35,
     "winner_votes": 45252,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 19577,
     "margin": 25675,
     "percent_invalid": 5.88235294117647,
     "ballot_surplus": 0
   },
   {
+    "cid": 396,
     "province_thai": "ยะลา",
     "province_eng": "YALA",
     "prov_id": "YLA",
@@ -14948,14 +17307,17 @@ const PARTYLIST_RAW = [
     "invalid": 4803,
     "blank": 2781,
     "winner_party": "ประชาชาติ",
+    "winner_pid": 35,
     "winner_votes": 31838,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 22087,
     "margin": 9751,
     "percent_invalid": 5.02831897318858,
     "ballot_surplus": 0
   },
   {
+    "cid": 214,
     "province_thai": "นราธิวาส",
     "province_eng": "NARATHIWAT",
     "prov_id": "NWT",
@@ -14967,14 +17329,17 @@ const PARTYLIST_RAW = [
     "invalid": 5929,
     "blank": 2297,
     "winner_party": "ประชาชาติ",
+    "winner_pid": 35,
     "winner_votes": 28189,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 23124,
     "margin": 5065,
     "percent_invalid": 5.958913747009991,
     "ballot_surplus": 0
   },
   {
+    "cid": 215,
     "province_thai": "นราธิวาส",
     "province_eng": "NARATHIWAT",
     "prov_id": "NWT",
@@ -14986,14 +17351,17 @@ const PARTYLIST_RAW = [
     "invalid": 4933,
     "blank": 2129,
     "winner_party": "ประชาชน",
+    "winner_pid": 70,
     "winner_votes": 17875,
     "runnerup_party": "ประชาชาติ",
+    "runnerup_pid": 35,
     "runnerup_votes": 14820,
     "margin": 3055,
     "percent_invalid": 6.326792356034372,
     "ballot_surplus": 0
   },
   {
+    "cid": 216,
     "province_thai": "นราธิวาส",
     "province_eng": "NARATHIWAT",
     "prov_id": "NWT",
@@ -15005,14 +17373,17 @@ const PARTYLIST_RAW = [
     "invalid": 4914,
     "blank": 933,
     "winner_party": "ประชาชาติ",
+    "winner_pid": 35,
     "winner_votes": 22404,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 18575,
     "margin": 3829,
     "percent_invalid": 5.926837210985273,
     "ballot_surplus": -1
   },
   {
+    "cid": 217,
     "province_thai": "นราธิวาส",
     "province_eng": "NARATHIWAT",
     "prov_id": "NWT",
@@ -15024,14 +17395,17 @@ const PARTYLIST_RAW = [
     "invalid": 4674,
     "blank": 1027,
     "winner_party": "ประชาชาติ",
+    "winner_pid": 35,
     "winner_votes": 29583,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 17263,
     "margin": 12320,
     "percent_invalid": 5.381382764377411,
     "ballot_surplus": 0
   },
   {
+    "cid": 218,
     "province_thai": "นราธิวาส",
     "province_eng": "NARATHIWAT",
     "prov_id": "NWT",
@@ -15043,8 +17417,10 @@ const PARTYLIST_RAW = [
     "invalid": 5493,
     "blank": 1314,
     "winner_party": "ประชาชาติ",
+    "winner_pid": 35,
     "winner_votes": 34879,
     "runnerup_party": "ประชาชน",
+    "runnerup_pid": 70,
     "runnerup_votes": 20739,
     "margin": 14140,
     "percent_invalid": 5.868401653793147,
@@ -0,0 +1,19 @@
+// Shared by the analysis pages: decoding of the columnar JSON artifacts.
+
+// Rebuild record objects from a columnar block ({ length, fields, columns, dicts })
+// written by split_data.py --compact; plain record arrays pass through unchanged.
+function decodeColumnar(block) {
+  if (Array.isArray(block)) return block;
+  if (!block || !block.fields) return [];
+  const { length, fields, columns, dicts = {} } = block;
+  const out = new Array(length);
+  for (let i = 0; i < length; i++) {
+    const rec = {};
+    for (const f of fields) {
+      const v = columns[f][i];
+      rec[f] = dicts[f] ? dicts[f][v] : v;
+    }
+    out[i] = rec;
+  }
+  return out;
+}
@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+"""
+Content-addressed, delta-compressed archive store for dataset snapshots
+Replaces the full-copy-per-run archives in data/archives/.
+
+Layout:
+    data/archives/manifest.json          list of snapshot entries (oldest first)
+    data/archives/objects/<hash>.json.gz one object per distinct snapshot
+
+Each object is either a full keyframe or a per-record delta against a
+keyframe (records keyed by province + constituency; only changed fields are
+stored). Identical snapshots share one object. A snapshot is rebuilt from at
+most one keyframe plus one delta.
+
+Usage:
+    python archive_store.py add data/election_data.json --name "OCR 21:00"
+    python archive_store.py list
+    python archive_store.py export <snapshot_id> -o snapshot.json
+    python archive_store.py compact --keep-last 200
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from artifacts import atomic_write, load_dataset, write_dataset_json
+
+ARCHIVE_DIR = Path(__file__).parent.parent / "data" / "archives"
+TABLES = ("CONST_RAW", "PARTYLIST_RAW")
+
+# Start a new keyframe after this many deltas, or when a delta stops paying off
+KEYFRAME_INTERVAL = 50
+KEYFRAME_DELTA_RATIO = 0.5
+
+
+def record_key(r: Dict[str, Any]) -> str:
+    return f"{r.get('province_thai')}_{r.get('cons_no')}"
+
+
+def encode(obj: Any) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def content_hash(tables: Dict[str, List[Dict]]) -> str:
+    """Hash of the snapshot content (record order and field order included)"""
+    return hashlib.blake2b(encode({t: tables[t] for t in TABLES}), digest_size=16).hexdigest()
+
+
+# ══════════════════════════════════════════════════════════════════════════
+# DELTAS
+# ══════════════════════════════════════════════════════════════════════════
+
+def diff_table(base: List[Dict], new: List[Dict]) -> Optional[Dict[str, Any]]:
+    """
+    Per-record delta of `new` against `base`, or None when records cannot be
+    keyed uniquely (a full keyframe is stored instead)
+    """
+    base_map = {record_key(r): r for r in base}
+    new_keys = [record_key(r) for r in new]
+    if len(base_map) != len(base) or len(set(new_keys)) != len(new_keys):
+        return None
+
+    changed, unset, added = {}, {}, {}
+    for key, rec in zip(new_keys, new):
+        old = base_map.get(key)
+        if old is None:
+            added[key] = rec
+            continue
+        # Compared field by field: dict equality would let 103 stand in for 103.0
+        fields = {f: v for f, v in rec.items() if f not in old or old[f] != v or type(old[f]) is not type(v)}
+        gone = [f for f in old if f not in rec]
+        if not fields and not gone:
+            if list(old) != list(rec):
+                # Same values, different field order: store the record whole
+                added[key] = rec
+            continue
+        if fields:
+            changed[key] = fields
+        if gone:
+            unset[key] = gone
+
+    new_key_set = set(new_keys)
+    delta = {
+        "changed": changed,
+        "unset": unset,
+        "added": added,
+        "removed": [k for k in base_map if k not in new_key_set],
+    }
+    if new_keys != [k for k in base_map if k in new_key_set] + [k for k in new_keys if k not in base_map]:
+        delta["order"] = new_keys
+    return delta
+
+
+def apply_table(base: List[Dict], delta: Dict[str, Any]) -> List[Dict]:
+    """Rebuild a table from its keyframe and delta"""
+    out = {}
+    removed = set(delta.get("removed", []))
+    for r in base:
+        key = record_key(r)
+        if key in removed:
+            continue
+        rec = dict(r)
+        if key in delta.get("changed", {}):
+            rec.update(delta["changed"][key])
+        for f in delta.get("unset", {}).get(key, []):
+            rec.pop(f, None)
+        out[key] = rec
+    for key, rec in delta.get("added", {}).items():
+        out[key] = rec
+    order = delta.get("order")
+    if order is None:
+        return list(out.values())
+    return [out[k] for k in order]
+
+
+# ══════════════════════════════════════════════════════════════════════════
+# STORE
+# ══════════════════════════════════════════════════════════════════════════
+
+class ArchiveStore:
+    """Snapshot manifest plus content-addressed object files"""
+
+    def __init__(self, root: Path = ARCHIVE_DIR):
+        self.root = Path(root)
+        self.objects_dir = self.root / "objects"
+        self.manifest_file = self.root / "manifest.json"
+        self.manifest = self._load_manifest()
+
+    def _load_manifest(self) -> List[Dict[str, Any]]:
+        if not self.manifest_file.exists():
+            return []
+        try:
+            with open(self.manifest_file, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            print(f"⚠️  Could not read {self.manifest_file}, starting an empty manifest")
+            return []
+        # Legacy entries whose file is gone (e.g. the old "latest" entry
+        # pointing at election_data_generated.js) are dropped
+        kept = [e for e in manifest if "hash" in e or self.legacy_path(e).exists()]
+        for e in manifest:
+            if e not in kept:
+                print(f"⚠️  Dropping archive entry {e.get('id')}: {e.get('file')} does not exist")
+        return kept
+
+    def legacy_path(self, e: Dict[str, Any]) -> Path:
+        """File of a legacy full-copy entry ("archives/x.js" or "data/archives/x.js")"""
+        return self.root / e["file"].split("archives/", 1)[-1]
+
+    def _save_manifest(self):
+        self.root.mkdir(parents=True, exist_ok=True)
+        atomic_write(self.manifest_file, json.dumps(self.manifest, ensure_ascii=False, indent=2).encode("utf-8"))
+
+    def object_path(self, digest: str) -> Path:
+        return self.objects_dir / f"{digest}.json.gz"
+
+    def _write_object(self, digest: str, obj: Dict[str, Any]) -> int:
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        data = gzip.compress(encode(obj), compresslevel=9, mtime=0)
+        atomic_write(self.object_path(digest), data)
+        return len(data)
+
+    def read_object(self, digest: str) -> Dict[str, Any]:
+        return _read_object_cached(str(self.object_path(digest)))
+
+    def entry(self, snapshot_id: str) -> Dict[str, Any]:
+        for e in self.manifest:
+            if e["id"] == snapshot_id:
+                return e
+        raise KeyError(f"Unknown snapshot: {snapshot_id}")
+
+    # ── Writing ─────────────────────────────────────────────────────────
+
+    def _recent_keyframes(self, limit: int = 3) -> List[Tuple[str, int]]:
+        """
+        (keyframe hash, deltas stored against it) for the newest keyframes.
+        Several are tried so interleaved series (OCR vs 94%) each find their own.
+        """
+        out: List[Tuple[str, int]] = []
+        for e in reversed(self.manifest):
+            if "hash" not in e:
+                continue
+            base = e.get("base") or e["hash"]
+            if base in (k for k, _ in out):
+                continue
+            out.append((base, sum(1 for x in self.manifest if x.get("base") == base)))
+            if len(out) == limit:
+                break
+        return out
+
+    def add(self, const_raw: List[Dict], pl_raw: List[Dict], name: Optional[str] = None,
+            snapshot_id: Optional[str] = None) -> Dict[str, Any]:
+        """Archive a snapshot; returns its manifest entry"""
+        now = datetime.now()
+        tables = {"CONST_RAW": const_raw, "PARTYLIST_RAW": pl_raw}
+        digest = content_hash(tables)
+        entry = {
+            "id": snapshot_id or now.strftime("%Y%m%d_%H%M%S"),
+            "name": name or f"Archive: {now.strftime('%Y-%m-%d %H:%M:%S')}",
+            "created": now.strftime("%Y-%m-%d %H:%M:%S"),
+            "hash": digest,
+            "records": [len(const_raw), len(pl_raw)],
+        }
+        if any(e["id"] == entry["id"] for e in self.manifest):
+            entry["id"] = f"{entry['id']}_{digest[:6]}"
+
+        existing = next((e for e in self.manifest if e.get("hash") == digest), None)
+        if existing is not None:
+            # Identical content: reuse the stored object
+            entry["base"] = existing.get("base")
+            entry["bytes"] = 0
+            print(f"  📦 Snapshot identical to {existing['id']}, deduplicated")
+        else:
+            entry["base"], entry["bytes"] = self._store(digest, tables)
+
+        self.manifest.append(entry)
+        self._save_manifest()
+        return entry
+
+    def _store(self, digest: str, tables: Dict[str, List[Dict]]) -> Tuple[Optional[str], int]:
+        full = {"kind": "full", **tables}
+        best = None
+        for base, count in self._recent_keyframes():
+            if count >= KEYFRAME_INTERVAL:
+                continue
+            base_obj = self.read_object(base)
+            deltas = {t: diff_table(base_obj[t], tables[t]) for t in TABLES}
+            if any(d is None for d in deltas.values()):
+                continue
+            rebuilt = {t: apply_table(base_obj[t], deltas[t]) for t in TABLES}
+            if content_hash(rebuilt) != digest:
+                continue
+            delta = {"kind": "delta", "base": base, "tables": deltas}
+            size = len(encode(delta))
+            if best is None or size < best[0]:
+                best = (size, base, delta)
+
+        if best is not None and best[0] < KEYFRAME_DELTA_RATIO * len(encode(full)):
+            return best[1], self._write_object(digest, best[2])
+        return None, self._write_object(digest, full)
+
+    # ── Reading ─────────────────────────────────────────────────────────
+
+    def load(self, snapshot_id: str) -> Tuple[List[Dict], List[Dict]]:
+        """Rebuild (CONST_RAW, PARTYLIST_RAW) for a snapshot"""
+        e = self.entry(snapshot_id)
+        if "hash" not in e:
+            # Legacy full-copy archive listed by file name
+            return load_dataset(self.legacy_path(e))
+        obj = self.read_object(e["hash"])
+        if obj["kind"] == "full":
+            return obj["CONST_RAW"], obj["PARTYLIST_RAW"]
+        base_obj = self.read_object(obj["base"])
+        return tuple(apply_table(base_obj[t], obj["tables"][t]) for t in TABLES)
+
+    # ── Retention ───────────────────────────────────────────────────────
+
+    def compact(self, keep_last: Optional[int] = None, keep_ids: Optional[List[str]] = None) -> Dict[str, int]:
+        """
+        Drop snapshots outside the retention window (the newest keep_last plus
+        any pinned ids), then delete objects no retained snapshot needs
+        """
+        keep_ids = set(keep_ids or [])
+        if keep_last is not None:
+            retained = [
+                e for i, e in enumerate(self.manifest)
+                if i >= len(self.manifest) - keep_last or e["id"] in keep_ids
+            ]
+        else:
+            retained = list(self.manifest)
+        dropped = len(self.manifest) - len(retained)
+        self.manifest = retained
+        self._save_manifest()
+
+        needed = set()
+        for e in retained:
+            if "hash" in e:
+                needed.add(e["hash"])
+                if e.get("base"):
+                    needed.add(e["base"])
+        removed = 0
+        if self.objects_dir.exists():
+            for f in self.objects_dir.glob("*.json.gz"):
+                if f.name[:-len(".json.gz")] not in needed:
+                    f.unlink()
+                    removed += 1
+        return {"snapshots_dropped": dropped, "objects_removed": removed}
+
+
+@lru_cache(maxsize=8)
+def _read_object_cached(path: str) -> Dict[str, Any]:
+    # Objects are immutable (named by content hash), so caching by path is safe
+    with gzip.open(path, "rb") as f:
+        return json.loads(f.read().decode("utf-8"))
+
+
+# ══════════════════════════════════════════════════════════════════════════
+# CLI
+# ══════════════════════════════════════════════════════════════════════════
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage archived dataset snapshots")
+    parser.add_argument("--root", type=Path, default=ARCHIVE_DIR, help="Archive directory")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_add = sub.add_parser("add", help="Archive a dataset file (.json or .js)")
+    p_add.add_argument("path", type=Path)
+    p_add.add_argument("--name")
+    p_add.add_argument("--id")
+
+    sub.add_parser("list", help="List snapshots")
+
+    p_export = sub.add_parser("export", help="Rebuild a snapshot as a JSON artifact")
+    p_export.add_argument("snapshot_id")
+    p_export.add_argument("-o", "--output", type=Path, required=True)
+
+    p_compact = sub.add_parser("compact", help="Apply retention and delete unreferenced objects")
+    p_compact.add_argument("--keep-last", type=int)
+    p_compact.add_argument("--keep", nargs="*", default=[], help="Snapshot ids to always keep")
+
+    args = parser.parse_args()
+    store = ArchiveStore(args.root)
+
+    if args.command == "add":
+        const_raw, pl_raw = load_dataset(args.path)
+        e = store.add(const_raw, pl_raw, name=args.name, snapshot_id=args.id)
+        kind = "delta" if e.get("base") else "full"
+        print(f"✓ Archived {e['id']} ({kind}, {e['bytes']:,} bytes)")
+    elif args.command == "list":
+        for e in store.manifest:
+            kind = "legacy" if "hash" not in e else ("delta" if e.get("base") else "full")
+            print(f"{e['id']:<28} {kind:<6} {e.get('bytes', 0):>10,}  {e['name']}")
+    elif args.command == "export":
+        const_raw, pl_raw = store.load(args.snapshot_id)
+        write_dataset_json(args.output, const_raw, pl_raw, generated=store.entry(args.snapshot_id).get("created"))
+        print(f"✓ Exported {args.snapshot_id} to {args.output}")
+    elif args.command == "compact":
+        stats = store.compact(keep_last=args.keep_last, keep_ids=args.keep)
+        print(f"✓ Dropped {stats['snapshots_dropped']} snapshots, removed {stats['objects_removed']} objects")
+
+
+if __name__ == "__main__":
+    main()
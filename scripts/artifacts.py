@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Dataset artifact writer/reader
+Writes each dataset as minified JSON plus precompressed .json.gz and
+.json.br siblings, and reads datasets back from either the JSON artifact or
+a legacy `var CONST_RAW = [...]` JavaScript file.
+"""
+
+import gzip
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import brotli
+except ImportError:  # optional: .json.br is skipped without it
+    brotli = None
+
+
+# Marker for payloads whose arrays are dictionary-encoded column blocks
+COLUMNAR_FORMAT = "columnar-v1"
+
+
+def dataset_payload(const_raw: List[Dict], pl_raw: List[Dict], generated: Optional[str] = None,
+                    parties: Optional[List[Dict]] = None) -> Dict[str, Any]:
+    """
+    JSON artifact shape read by the pages' loadArchive (PARTIES: the party
+    registry the pids refer to). The builders leave `generated` out so the
+    hashed copies only change with the records; asset_manifest.py records the
+    build time in data/assets.json instead
+    """
+    payload: Dict[str, Any] = {"generated": generated} if generated else {}
+    payload["CONST_RAW"] = const_raw
+    payload["PARTYLIST_RAW"] = pl_raw
+    if parties is not None:
+        payload["PARTIES"] = parties
+    return payload
+
+
+def columnar_payload(const_block: Dict[str, Any], pl_block: Dict[str, Any],
+                     generated: Optional[str] = None, parties: Optional[List[Dict]] = None) -> Dict[str, Any]:
+    """Compact artifact shape: CONST_RAW / PARTYLIST_RAW as columnar blocks"""
+    payload = dataset_payload(const_block, pl_block, generated, parties)
+    payload["format"] = COLUMNAR_FORMAT
+    return payload
+
+
+def decode_columnar(block: Any) -> List[Dict]:
+    """Rebuild record dicts from a columnar block (plain lists pass through)"""
+    if isinstance(block, list):
+        return block
+    fields = block["fields"]
+    dicts = block.get("dicts", {})
+    cols = [
+        [dicts[f][code] for code in block["columns"][f]] if f in dicts else block["columns"][f]
+        for f in fields
+    ]
+    return [dict(zip(fields, row)) for row in zip(*cols)]
+
+
+def encode_json(payload: Any) -> bytes:
+    """Minified UTF-8 JSON (Thai text kept as-is, no whitespace)"""
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def atomic_write(path: Path, data: bytes):
+    """Write `data` to a sibling .tmp file and rename it over `path`"""
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def write_json_artifacts(json_path: Path, payload: Any, fast: bool = False) -> List[Path]:
+    """
+    Write X.json, X.json.gz and (if brotli is installed) X.json.br
+    fast=True trades a few percent of compression for ~100x faster brotli
+    (used by watch mode; the next full build recompresses at max level)
+
+    All three are staged first, the JSON before its siblings, and X.json is
+    replaced first: until the siblings follow they are older than X.json,
+    which serve.py treats as stale. Without brotli an existing X.json.br
+    would be stale and is removed.
+    """
+    json_path = Path(json_path)
+    data = encode_json(payload)
+
+    gz_path = json_path.with_name(json_path.name + ".gz")
+    br_path = json_path.with_name(json_path.name + ".br")
+    bodies = [(json_path, data), (gz_path, gzip.compress(data, compresslevel=6 if fast else 9, mtime=0))]
+    if brotli is not None:
+        bodies.append((br_path, brotli.compress(data, quality=5 if fast else 11)))
+
+    staged = []
+    for path, body in bodies:
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "wb") as f:
+            f.write(body)
+        staged.append((tmp, path))
+    if brotli is None:
+        print(f"⚠️  brotli not installed, skipping {br_path.name}")
+        br_path.unlink(missing_ok=True)
+    for tmp, path in staged:
+        os.replace(tmp, path)
+    return [path for path, _ in bodies]
+
+
+def write_dataset_json(json_path: Path, const_raw: List[Dict], pl_raw: List[Dict],
+                       generated: Optional[str] = None, fast: bool = False,
+                       parties: Optional[List[Dict]] = None) -> List[Path]:
+    """Write a CONST_RAW/PARTYLIST_RAW dataset as JSON artifacts"""
+    return write_json_artifacts(json_path, dataset_payload(const_raw, pl_raw, generated, parties), fast=fast)
+
+
+def parse_js_vars(text: str) -> Tuple[List[Dict], List[Dict]]:
+    """Extract CONST_RAW / PARTYLIST_RAW arrays from a legacy JS data file"""
+    decoder = json.JSONDecoder()
+    out = []
+    for name in ("CONST_RAW", "PARTYLIST_RAW"):
+        idx = text.find(name)
+        start = text.find("[", idx) if idx != -1 else -1
+        if start == -1:
+            out.append([])
+            continue
+        value, _ = decoder.raw_decode(text, start)
+        out.append(value)
+    return out[0], out[1]
+
+
+def load_dataset(path: Path) -> Tuple[List[Dict], List[Dict]]:
+    """
+    Load (CONST_RAW, PARTYLIST_RAW) for a dataset.
+    Given `X.js`, prefers the `X.json` artifact when it is at least as new.
+    """
+    path = Path(path)
+    json_path = path.with_suffix(".json")
+    js_path = path.with_suffix(".js")
+
+    use_json = json_path.exists() and (
+        not js_path.exists() or json_path.stat().st_mtime >= js_path.stat().st_mtime
+    )
+    if use_json:
+        with open(json_path, "r", encoding="utf-8") as f:
+            payload = json.load(f)
+        return decode_columnar(payload.get("CONST_RAW", [])), decode_columnar(payload.get("PARTYLIST_RAW", []))
+
+    if not js_path.exists():
+        return [], []
+    with open(js_path, "r", encoding="utf-8") as f:
+        return parse_js_vars(f.read())
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Content-hashed data artifacts and the asset manifest the pages load first
+Each published artifact (datasets, pairwise comparisons, summary cubes) is
+copied to `<name>.<hash>.json` (plus its .gz / .br siblings) next to the
+fixed-name file, and data/assets.json maps logical ids to those files. The
+hashed files never change, so browsers and proxies can cache them forever
+(see serve.py); a rebuild only changes the manifest and the files whose
+content changed. The files the previous manifest pointed at are kept for one
+more generation, so a page that loaded it can still fetch them. The manifest also drives the pages' dataset dropdowns.
+
+Fixed-name files are kept for Python tooling and older links.
+
+Usage: python asset_manifest.py
+"""
+
+import hashlib
+import json
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from artifacts import atomic_write
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+ASSET_MANIFEST = DATA_DIR / "assets.json"
+HASH_LEN = 12
+HASHED_FILE = re.compile(r"\.[0-9a-f]{%d}\.json$" % HASH_LEN)
+ENCODINGS = {"gzip": ".gz", "br": ".br"}
+
+# Dropdown order and labels (Thai pages / English surplus page)
+DATASETS = {
+    "election66_data": {"th": "เลือกตั้ง 2566", "en": "Election 2566 (Baseline)"},
+    "election69_ocr": {"th": "เลือกตั้ง 2569 (OCR)", "en": "Election 2569 (OCR Latest)"},
+    "election69_94pct": {"th": "เลือกตั้ง 2569 (94%)", "en": "Election 2569 (94% Unofficial)"},
+}
+PAIR_DIRS = {"compare": DATA_DIR / "compare", "cube": DATA_DIR / "cube"}
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()[:HASH_LEN]
+
+
+def read_index(path: Path) -> Dict[str, Any]:
+    """A previously written manifest or index, or {} when there is none"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def publish_file(path: Path, root: Path = DATA_DIR.parent, previous: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Copy `X.json` (and X.json.gz / X.json.br) to `X.<hash>.json…` and return
+    its manifest entry. Older hashed copies of X are removed, except
+    `previous` (the file the last manifest or index pointed at): pages and
+    caches still holding that manifest fetch it until they reload
+    """
+    data = path.read_bytes()
+    digest = content_hash(data)
+    stem = path.name[: -len(".json")]
+    hashed = path.with_name(f"{stem}.{digest}.json")
+
+    entry: Dict[str, Any] = {
+        "file": hashed.relative_to(root).as_posix(),
+        "hash": digest,
+        "bytes": len(data),
+        "encodings": {},
+    }
+    for coding, suffix in [("identity", "")] + list(ENCODINGS.items()):
+        src = path.with_name(path.name + suffix)
+        if not src.exists():
+            continue
+        dst = hashed.with_name(hashed.name + suffix)
+        if not dst.exists():
+            atomic_write(dst, src.read_bytes())
+        if coding != "identity":
+            entry["encodings"][coding] = src.stat().st_size
+
+    current = {hashed.name} | ({Path(previous).name} if previous else set())
+    keep = {name + s for name in current for s in [""] + list(ENCODINGS.values())}
+    for old in path.parent.glob(f"{stem}.*.json*"):
+        base = old.name[: -len(old.suffix)] if old.suffix in ENCODINGS.values() else old.name
+        if HASHED_FILE.search(base) and base[: -(HASH_LEN + 6)] == stem and old.name not in keep:
+            old.unlink()
+    return entry
+
+
+def logical_files(folder: Path) -> List[Path]:
+    """Fixed-name .json artifacts in a folder (hashed copies excluded)"""
+    return sorted(p for p in folder.glob("*.json") if not HASHED_FILE.search(p.name))
+
+
+def build_asset_manifest(data_dir: Path = DATA_DIR) -> Dict[str, Any]:
+    """Publish every artifact (and the shard and station indexes) under its hashed name and write data/assets.json"""
+    root = data_dir.parent
+    previous = read_index(data_dir / "assets.json")
+    datasets = {}
+    for ds_id, label in DATASETS.items():
+        path = data_dir / f"{ds_id}.json"
+        if not path.exists():
+            print(f"⚠️  {path.name} not found, left out of the asset manifest")
+            continue
+        entry = publish_file(path, root, previous.get("datasets", {}).get(ds_id, {}).get("file"))
+        # Build time of the fixed-name file; kept out of the hashed payload
+        entry["generated"] = datetime.fromtimestamp(path.stat().st_mtime).strftime("%Y-%m-%d %H:%M:%S")
+        datasets[ds_id] = {"label": label, **entry}
+
+    pairs: Dict[str, Dict[str, str]] = {}
+    for kind, folder in PAIR_DIRS.items():
+        folder = data_dir / folder.name
+        if not folder.exists():
+            continue
+        for path in logical_files(folder):
+            key = path.name[: -len(".json")]
+            last = previous.get("pairs", {}).get(key, {}).get(kind)
+            pairs.setdefault(key, {})[kind] = publish_file(path, root, last)["file"]
+
+    manifest = {
+        "generated": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "order": list(datasets),
+        "datasets": datasets,
+        "pairs": pairs,
+    }
+    # Province shard index (province_shards.py); the shards it lists are already hashed
+    shard_index = data_dir / "shards" / "index.json"
+    if shard_index.exists():
+        manifest["shards"] = publish_file(shard_index, root, previous.get("shards"))["file"]
+    # Station rollups and outliers (stations.py), likewise already hashed
+    station_index = data_dir / "stations" / "index.json"
+    if station_index.exists():
+        manifest["stations"] = publish_file(station_index, root, previous.get("stations"))["file"]
+    atomic_write(data_dir / "assets.json", json.dumps(manifest, ensure_ascii=False, indent=2).encode("utf-8"))
+    print(f"✓ Asset manifest: {len(datasets)} datasets, {len(pairs)} pairs → {data_dir / 'assets.json'}")
+    return manifest
+
+
+if __name__ == "__main__":
+    build_asset_manifest()
@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the pipeline stages on synthetic inputs (synth_data.py)
+Times and memory-profiles load_json_folder, process_election69_to_datasets,
+process_66_enhanced, compute_surpluses, extract_js_vars and the JS writers at
+multiples of today's ~400 constituencies, plus archive store add/load at
+growing snapshot counts. Results go to a JSON report so runs can be compared
+over time; --baseline flags stages that got slower.
+
+Each case is timed `--repeat` times (median and min reported; slow cases
+stop repeating after MAX_CASE_SECONDS) and then run once more under
+tracemalloc for its peak Python heap allocation. The writers include max-level
+brotli, which dominates their time.
+
+Usage:
+    python benchmark.py                              # scales 1 10 100, 10/100 snapshots
+    python benchmark.py --scales 1 10 --repeat 5 -o bench.json
+    python benchmark.py --baseline bench.json        # exit 1 on a >25% regression
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+import archive_store
+import build_election_data
+import split_data
+from archive_store import ArchiveStore
+from artifacts import load_dataset
+from parse_cache import CACHE_DIR
+from synth_data import SyntheticElection, use_sources
+
+ROOT = Path(__file__).parent.parent
+REPORT_DIR = CACHE_DIR / "benchmarks"
+# 2: inputs from synth_data.py (OCR plus a matching synthetic ECT 2566 tree)
+# 3: no province-name typos in the inputs
+# 4: typos back (resolved through the province name index)
+REPORT_VERSION = 4
+MAX_CASE_SECONDS = 10.0
+
+
+# ══════════════════════════════════════════════════════════════════════════
+# SYNTHETIC INPUTS
+# ══════════════════════════════════════════════════════════════════════════
+
+def baseline_records() -> Tuple[List[Dict], List[Dict]]:
+    """Today's constituency / party-list records (the 2566 baseline dataset)"""
+    return load_dataset(ROOT / "data" / "election66_data.json")
+
+
+def write_inputs(root: Path, scale: int, seed: int = 0) -> Tuple[Path, Path]:
+    """
+    Synthetic OCR folders and ECT 2566 files at `scale` (see synth_data.py),
+    with the builders pointed at them; returns the two OCR folders
+    """
+    paths = SyntheticElection(scale, seed).write(root, formats=("ect", "ocr"))
+    use_sources(root)
+    return paths["ocr_constituency"], paths["ocr_party_list"]
+
+
+# ══════════════════════════════════════════════════════════════════════════
+# MEASUREMENT
+# ══════════════════════════════════════════════════════════════════════════
+
+def measure(name: str, size: Dict[str, Any], op: Callable[[Any], Any],
+            setup: Callable[[], Any] = lambda: None, repeat: int = 3) -> Dict[str, Any]:
+    """
+    Median/min wall time over up to `repeat` runs (fewer once a case has used
+    MAX_CASE_SECONDS), then peak traced memory of one more run
+    """
+    times = []
+    peak = None
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(repeat):
+            arg = setup()
+            start = time.perf_counter()
+            op(arg)
+            times.append(time.perf_counter() - start)
+            if sum(times) > MAX_CASE_SECONDS:
+                break
+
+        # tracemalloc slows pure-Python code several-fold; skip it for very slow cases
+        if statistics.median(times) < MAX_CASE_SECONDS / 2:
+            arg = setup()
+            tracemalloc.start()
+            try:
+                op(arg)
+                peak = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+    result = {
+        "name": name,
+        **size,
+        "median_s": round(statistics.median(times), 6),
+        "min_s": round(min(times), 6),
+        "times_s": [round(t, 6) for t in times],
+        "peak_mb": round(peak / 2**20, 3) if peak is not None else None,
+    }
+    mem = f"{result['peak_mb']:>9.1f} MB" if peak is not None else f"{'-':>9} MB"
+    print(f"  {name:<40} {_size_label(size):<22} {result['median_s'] * 1000:>10.1f} ms {mem}")
+    return result
+
+
+def _size_label(size: Dict[str, Any]) -> str:
+    return ", ".join(f"{k}={v}" for k, v in size.items())
+
+
+def result_key(r: Dict[str, Any]) -> str:
+    return f"{r['name']}|{_size_label({k: v for k, v in r.items() if k in ('scale', 'snapshots')})}"
+
+
+# ══════════════════════════════════════════════════════════════════════════
+# CASES
+# ══════════════════════════════════════════════════════════════════════════
+
+def bench_scale(scale: int, workdir: Path, repeat: int) -> List[Dict[str, Any]]:
+    """Every pipeline stage at `scale` × today's constituency count"""
+    results = []
+    const_dir, pl_dir = write_inputs(workdir / f"synth_{scale}", scale)
+    n_files = sum(1 for _ in const_dir.glob("*.json"))
+    size = {"scale": scale, "records": n_files}
+
+    # The parse cache and the builder's output go to the scratch directory
+    build_election_data.CACHE_DIR = workdir / "cache"
+    build_election_data.OUTPUT_FILE = workdir / "election_data.js"
+
+    load = build_election_data.load_json_folder
+    results.append(measure("load_json_folder[no-cache]", size, lambda _: load(const_dir, use_cache=False), repeat=repeat))
+    with contextlib.redirect_stdout(io.StringIO()):
+        load(const_dir, use_cache=True)
+    results.append(measure("load_json_folder[cached]", size, lambda _: load(const_dir, use_cache=True), repeat=repeat))
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        const_rows = load(const_dir, use_cache=True)
+        pl_rows = load(pl_dir, use_cache=True)
+    prov_eng_mapping = build_election_data.load_province_eng_mapping()
+    results.append(measure(
+        "process_election69_to_datasets", size,
+        lambda _: build_election_data.process_election69_to_datasets(const_rows, pl_rows, prov_eng_mapping),
+        repeat=repeat))
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        gen_const, gen_pl = build_election_data.process_election69_to_datasets(
+            const_rows, pl_rows, prov_eng_mapping)
+    results.append(measure("process_66_enhanced", size,
+                           lambda _: split_data.process_66_enhanced(gen_const, gen_pl), repeat=repeat))
+    results.append(measure("process_69", size,
+                           lambda _: (split_data.process_69(gen_const), split_data.process_69(gen_pl)), repeat=repeat))
+
+    tables = lambda: (split_data.process_69(gen_const), split_data.process_69(gen_pl))
+    results.append(measure("compute_surpluses", size, lambda t: split_data.compute_surpluses(*t),
+                           setup=tables, repeat=repeat))
+
+    const_t, pl_t = tables()
+    split_data.compute_surpluses(const_t, pl_t)
+    js_path = workdir / "out" / "dataset.js"
+    js_path.parent.mkdir()
+    results.append(measure("write_js", size, lambda _: split_data.write_js(str(js_path), const_t, pl_t), repeat=repeat))
+    results.append(measure("write_js[compact]", size,
+                           lambda _: split_data.write_js(str(js_path), const_t, pl_t, compact=True), repeat=repeat))
+    results.append(measure("export_to_javascript", size,
+                           lambda _: build_election_data.export_to_javascript(gen_const, gen_pl), repeat=repeat))
+
+    # extract_js_vars prefers the .json artifact; the legacy .js path is timed on its own
+    split_data.write_js(str(js_path), const_t, pl_t)
+    results.append(measure("extract_js_vars[json]", size,
+                           lambda _: split_data.extract_js_vars(str(js_path)), repeat=repeat))
+    legacy = workdir / "legacy" / "dataset.js"
+    legacy.parent.mkdir()
+    legacy.write_bytes(js_path.read_bytes())
+    results.append(measure("extract_js_vars[js]", size,
+                           lambda _: split_data.extract_js_vars(str(legacy)), repeat=repeat))
+    return results
+
+
+def live_snapshots(const_raw: List[Dict], pl_raw: List[Dict], count: int, seed: int = 0):
+    """`count` successive snapshots, each updating ~2% of the records (live counting)"""
+    rng = random.Random(seed)
+    const_raw = [dict(r) for r in const_raw]
+    pl_raw = [dict(r) for r in pl_raw]
+    for _ in range(count):
+        for table in (const_raw, pl_raw):
+            for i in rng.sample(range(len(table)), max(1, len(table) // 50)):
+                table[i] = {**table[i], "valid": table[i].get("valid", 0) + rng.randint(1, 500)}
+        yield const_raw, pl_raw
+
+
+def bench_archive(snapshots: int, workdir: Path, repeat: int) -> List[Dict[str, Any]]:
+    """Archive store cost after `snapshots` live-counting snapshots"""
+    const_raw, pl_raw = baseline_records()
+    root = workdir / f"archive_{snapshots}"
+    store = ArchiveStore(root)
+    adds = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for i, (c, p) in enumerate(live_snapshots(const_raw, pl_raw, snapshots)):
+            start = time.perf_counter()
+            store.add(c, p, snapshot_id=f"snap_{i:05d}")
+            adds.append(time.perf_counter() - start)
+    stored = sum(f.stat().st_size for f in root.rglob("*") if f.is_file())
+    size = {"snapshots": snapshots, "records": len(const_raw)}
+
+    results = [{
+        "name": "archive_add",
+        **size,
+        "median_s": round(statistics.median(adds), 6),
+        "min_s": round(min(adds), 6),
+        "total_s": round(sum(adds), 6),
+        "store_bytes": stored,
+    }]
+    print(f"  {'archive_add':<40} {_size_label(size):<22} {results[0]['median_s'] * 1000:>10.1f} ms "
+          f"{stored / 2**10:>9.1f} KB on disk")
+
+    last = f"snap_{snapshots - 1:05d}"
+    store = ArchiveStore(root)
+
+    def fresh():
+        archive_store._read_object_cached.cache_clear()
+
+    results.append(measure("archive_load[latest]", size, lambda _: store.load(last), setup=fresh, repeat=repeat))
+    results.append(measure("archive_load[first]", size, lambda _: store.load("snap_00000"), setup=fresh, repeat=repeat))
+    return results
+
+
+# ══════════════════════════════════════════════════════════════════════════
+# REPORT
+# ══════════════════════════════════════════════════════════════════════════
+
+def environment() -> Dict[str, Any]:
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "numpy": np.__version__,
+        "commit": commit,
+    }
+
+
+def compare_reports(report: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[Dict[str, Any]]:
+    """Cases whose median time grew by more than `threshold` (fraction) over the baseline"""
+    old = {result_key(r): r for r in baseline.get("results", [])}
+    regressions = []
+    for r in report["results"]:
+        b = old.get(result_key(r))
+        if not b or not b.get("median_s"):
+            continue
+        ratio = r["median_s"] / b["median_s"]
+        r["baseline_median_s"] = b["median_s"]
+        r["ratio"] = round(ratio, 3)
+        if ratio > 1 + threshold:
+            regressions.append(r)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the pipeline stages on synthetic inputs")
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100],
+                        help="Multiples of today's constituency count (default: 1 10 100)")
+    parser.add_argument("--snapshots", type=int, nargs="*", default=[10, 100],
+                        help="Archive sizes in snapshots (default: 10 100)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per case (default: 3)")
+    parser.add_argument("-o", "--output", type=Path, help="Report path (default: .cache/benchmarks/<timestamp>.json)")
+    parser.add_argument("--baseline", type=Path, help="Earlier report to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Regression threshold (default: 0.25 = +25%%)")
+    args = parser.parse_args()
+
+    report: Dict[str, Any] = {
+        "version": REPORT_VERSION,
+        "generated": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "environment": environment(),
+        "config": {"scales": args.scales, "snapshots": args.snapshots, "repeat": args.repeat},
+        "results": [],
+    }
+
+    print("⏱  Pipeline benchmarks")
+    print("═" * 50)
+    with tempfile.TemporaryDirectory(prefix="election-bench-") as tmp:
+        for scale in args.scales:
+            print(f"\n▶ Scale {scale}×")
+            report["results"].extend(bench_scale(scale, Path(tmp) / f"scale_{scale}", args.repeat))
+        for snapshots in args.snapshots:
+            print(f"\n▶ Archive, {snapshots} snapshots")
+            report["results"].extend(bench_archive(snapshots, Path(tmp), args.repeat))
+
+    regressions: List[Dict[str, Any]] = []
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("version") != REPORT_VERSION:
+            print(f"⚠️  Baseline is report version {baseline.get('version')} (now {REPORT_VERSION}); "
+                  f"its inputs differ, so timings are not comparable")
+        regressions = compare_reports(report, baseline, args.threshold)
+        report["baseline"] = {"path": str(args.baseline), "threshold": args.threshold,
+                              "regressions": [result_key(r) for r in regressions]}
+
+    output: Optional[Path] = args.output
+    if output is None:
+        REPORT_DIR.mkdir(parents=True, exist_ok=True)
+        output = REPORT_DIR / f"{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n✓ Report written to {output}")
+
+    if regressions:
+        print(f"\n⚠️  {len(regressions)} regression(s) over {args.threshold:.0%}:")
+        for r in regressions:
+            print(f"  {result_key(r)}: {r['baseline_median_s'] * 1000:.1f} → {r['median_s'] * 1000:.1f} ms (×{r['ratio']})")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
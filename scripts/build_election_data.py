@@ -6,12 +6,23 @@ Exports as JavaScript arrays for use in index.html
 """
 
 import json
+import multiprocessing
 import os
 import glob
 import argparse
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List, Any, Optional
+
+import numpy as np
+
+from archive_store import ArchiveStore
+from artifacts import atomic_write, write_dataset_json
+from constituency_registry import load_registry
+from party_registry import load_party_registry
+from parse_cache import ParseCache, CACHE_DIR, parse_with_stat
+import run_report
 
 # ══════════════════════════════════════════════════════════════════════════
 # CONFIGURATION
@@ -97,23 +108,6 @@ def load_election66_constituency_data() -> Dict[str, Any]:
     return cons_info
 
 
-def load_province_mapping() -> Dict[str, str]:
-    """Load mapping from Thai province names to prov_id codes"""
-    prov_mapping = {}
-    
-    prov_file = ELECTION66_JSON_DIR / "th_election66_info_province.json"
-    if prov_file.exists():
-        with open(prov_file, 'r', encoding='utf-8-sig') as f:
-            data = json.load(f)
-            for prov in data.get('province', []):
-                thai_name = prov.get('province')
-                prov_id = prov.get('prov_id')
-                if thai_name and prov_id:
-                    prov_mapping[thai_name] = prov_id
-    
-    return prov_mapping
-
-
 def load_province_eng_mapping() -> Dict[str, str]:
     """Load mapping from prov_id to province English name"""
     prov_eng_map = {}
@@ -135,8 +129,73 @@ def load_province_eng_mapping() -> Dict[str, str]:
 # LOAD ELECTION69 DATA
 # ══════════════════════════════════════════════════════════════════════════
 
-def load_json_folder(folder_path: Path, ballot_type: str = "constituency") -> List[Dict[str, Any]]:
-    """Load election results from JSON folder"""
+def extract_summary_row(d: Dict[str, Any]) -> Dict[str, Any]:
+    """Extract the per-constituency summary row from one OCR result document"""
+    province    = d.get("province_name_normalized", "Unknown")
+    cons_no     = d.get("constituency_number", 0)
+    summary     = d.get("summary", {})
+    results     = d.get("results", [])
+
+    # Sort by votes descending to get winner / runner-up
+    sorted_results = sorted(results, key=lambda x: x.get("votes", 0), reverse=True)
+    winner   = sorted_results[0]  if len(sorted_results) > 0 else {"party": None, "votes": 0}
+    runnerup = sorted_results[1]  if len(sorted_results) > 1 else {"party": None, "votes": 0}
+
+    total_valid = summary.get("good_votes", 0)
+    invalid = summary.get("invalid_votes", 0)
+    no_votes = summary.get("no_votes", 0)
+    voters_came = summary.get("voters_came", 0)
+    
+    others = total_valid - winner.get("votes", 0) - runnerup.get("votes", 0)
+
+    return {
+        "province_thai": province,
+        "cons_no": cons_no,
+        "total_valid": total_valid,
+        "invalid_ballots": invalid,
+        "no_votes": no_votes,
+        "voters_came": voters_came,
+        "winning_score": winner.get("votes", 0),
+        "winning_party": winner.get("party"),
+        "runnerUp_score": runnerup.get("votes", 0),
+        "runnerUp_party": runnerup.get("party"),
+        "others_score": max(others, 0),
+    }
+
+
+def parse_summary_row(raw: bytes) -> Dict[str, Any]:
+    """Parse raw OCR JSON bytes into a summary row"""
+    return extract_summary_row(json.loads(raw.decode("utf-8")))
+
+
+def parse_file_chunk(paths: List[str]) -> List[tuple]:
+    """Worker entry point: parse a chunk of OCR files as (row, mtime_ns, size, hash)"""
+    return [parse_with_stat(p, parse_summary_row) for p in paths]
+
+
+def parse_files(paths: List[str], pool: Optional[Executor] = None, workers: int = 1) -> List[tuple]:
+    """Parse OCR files in order, spreading chunks across a process pool if given"""
+    if pool is None or workers <= 1 or len(paths) < 2:
+        return parse_file_chunk(paths)
+
+    # A few chunks per worker keeps the pool busy without per-file IPC overhead
+    chunk_size = max(1, -(-len(paths) // (workers * 4)))
+    chunks = [paths[i:i + chunk_size] for i in range(0, len(paths), chunk_size)]
+    parsed = []
+    for chunk_result in pool.map(parse_file_chunk, chunks):
+        parsed.extend(chunk_result)
+    return parsed
+
+
+def load_json_folder(folder_path: Path, ballot_type: str = "constituency", use_cache: bool = True,
+                     pool: Optional[Executor] = None, workers: int = 1) -> List[Dict[str, Any]]:
+    """
+    Load election results from JSON folder
+    With use_cache, rows come from the persistent parse cache and only new or
+    changed files are parsed; entries for deleted files are dropped.
+    With a process pool, files to parse are split into chunks across workers;
+    rows are returned in the same (sorted filename) order either way.
+    """
     rows = []
     
     if not folder_path.exists():
@@ -145,53 +204,50 @@ def load_json_folder(folder_path: Path, ballot_type: str = "constituency") -> Li
     
     json_files = sorted(glob.glob(os.path.join(folder_path, "*.json")))
     print(f"  Found {len(json_files)} {ballot_type} files")
-    
-    for fpath in json_files:
-        with open(fpath, encoding="utf-8") as f:
-            d = json.load(f)
-
-        province    = d.get("province_name_normalized", "Unknown")
-        cons_no     = d.get("constituency_number", 0)
-        summary     = d.get("summary", {})
-        results     = d.get("results", [])
-
-        # Sort by votes descending to get winner / runner-up
-        sorted_results = sorted(results, key=lambda x: x.get("votes", 0), reverse=True)
-        winner   = sorted_results[0]  if len(sorted_results) > 0 else {"party": None, "votes": 0}
-        runnerup = sorted_results[1]  if len(sorted_results) > 1 else {"party": None, "votes": 0}
-
-        total_valid = summary.get("good_votes", 0)
-        invalid = summary.get("invalid_votes", 0)
-        no_votes = summary.get("no_votes", 0)
-        voters_came = summary.get("voters_came", 0)
-        
-        others = total_valid - winner.get("votes", 0) - runnerup.get("votes", 0)
-
-        rows.append({
-            "province_thai": province,
-            "cons_no": cons_no,
-            "total_valid": total_valid,
-            "invalid_ballots": invalid,
-            "no_votes": no_votes,
-            "voters_came": voters_came,
-            "winning_score": winner.get("votes", 0),
-            "winning_party": winner.get("party"),
-            "runnerUp_score": runnerup.get("votes", 0),
-            "runnerUp_party": runnerup.get("party"),
-            "others_score": max(others, 0),
-        })
+    run_report.records(inputs=len(json_files), **{f"{ballot_type}_files": len(json_files)})
+
+    if not use_cache:
+        return [row for row, *_ in parse_files(json_files, pool, workers)]
+
+    cache = ParseCache(CACHE_DIR / f"ocr_{ballot_type}.json")
+    rows = [cache.lookup(fpath) for fpath in json_files]
+    todo = [i for i, row in enumerate(rows) if row is None]
+    parsed = parse_files([json_files[i] for i in todo], pool, workers)
+    for i, (row, mtime_ns, size, digest) in zip(todo, parsed):
+        cache.store(json_files[i], row, mtime_ns, size, digest)
+        rows[i] = row
+    removed = cache.prune(json_files)
+    cache.save()
+    print(f"  Parse cache: {cache.misses} parsed, {cache.hits} reused, {removed} removed")
     
     return rows
 
 
-def load_election69_data() -> tuple:
-    """Load election 2569 (2026) data"""
+def load_election69_data(use_cache: bool = True, workers: int = 1) -> tuple:
+    """
+    Load election 2569 (2026) data
+    With workers > 1 both folders are ingested at the same time, sharing one
+    process pool.
+    """
     print("\n📥 Loading election69 data...")
-    
-    const_data = load_json_folder(ELECTION69_CONST_DIR, "constituency")
+
+    if workers > 1:
+        # The pool starts its workers lazily from the folder threads, and forking a
+        # multithreaded process is unsafe; spawned workers start clean
+        pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        with pool, ThreadPoolExecutor(max_workers=2) as folders:
+            # bound(): the folder threads still count towards the running pipeline stage
+            const_future = folders.submit(run_report.bound(load_json_folder), ELECTION69_CONST_DIR, "constituency",
+                                          use_cache, pool, workers)
+            pl_future = folders.submit(run_report.bound(load_json_folder), ELECTION69_PL_DIR, "party_list",
+                                       use_cache, pool, workers)
+            const_data = const_future.result()
+            pl_data = pl_future.result()
+    else:
+        const_data = load_json_folder(ELECTION69_CONST_DIR, "constituency", use_cache)
+        pl_data = load_json_folder(ELECTION69_PL_DIR, "party_list", use_cache)
+
     print(f"✓ Loaded {len(const_data)} constituency results")
-    
-    pl_data = load_json_folder(ELECTION69_PL_DIR, "party_list")
     print(f"✓ Loaded {len(pl_data)} party_list results")
     
     return const_data, pl_data
@@ -213,34 +269,50 @@ def process_election66_to_const_raw(election66_data: Dict) -> List[Dict[str, Any
     return []
 
 
-def process_election69_to_datasets(const_data: List[Dict], pl_data: List[Dict], prov_mapping: Dict[str, str], prov_eng_mapping: Dict[str, str]) -> tuple:
+def process_election69_to_datasets(const_data: List[Dict], pl_data: List[Dict],
+                                   prov_eng_mapping: Dict[str, str], verbose: bool = True) -> tuple:
     """
     Transform election69 data into CONST_RAW and PARTYLIST_RAW
     Calculate differences between election66 and election69
     """
-    print("\n🔄 Processing election69 data...")
+    if verbose:
+        print("\n🔄 Processing election69 data...")
     
     const_raw = []
     pl_raw = []
-    
-    # Build lookup by province + cons_no
-    pl_lookup = {
-        f"{d['province_thai']}_{d['cons_no']}": d 
-        for d in pl_data
-    }
-    
-    for c_data in const_data:
+    no_pl = []
+
+    # Both ballots are keyed by registry id; unknown names or numbers raise
+    registry = load_registry(ELECTION66_JSON_DIR)
+    const_ids = registry.ids_by_name([d['province_thai'] for d in const_data], [d['cons_no'] for d in const_data],
+                                     "OCR constituency")
+    pl_ids = registry.ids_by_name([d['province_thai'] for d in pl_data], [d['cons_no'] for d in pl_data],
+                                  "OCR party-list")
+    pl_row = np.full(len(registry), -1, dtype=np.int64)
+    # Duplicate files of one constituency resolve to the last one
+    np.maximum.at(pl_row, pl_ids, np.arange(len(pl_ids)))
+    matched = np.zeros(len(registry), dtype=bool)
+
+    # OCR party names as (canonical spelling, registry pid) where the match is confident
+    parties = load_party_registry(ELECTION66_JSON_DIR).resolve(
+        [d[k] for d in const_data + pl_data for k in ('winning_party', 'runnerUp_party')], "OCR party")
+    party = lambda name: parties.get(str(name), (name, -1))[0]
+    pid = lambda name: parties.get(str(name), (name, -1))[1]
+
+    for c_data, cid in zip(const_data, const_ids.tolist()):
         prov_thai = c_data['province_thai']
         cons_no = c_data['cons_no']
-        key = f"{prov_thai}_{cons_no}"
-        
+
         # Find matching party list data
-        pl_match = pl_lookup.get(key)
-        if not pl_match:
+        if pl_row[cid] < 0:
+            no_pl.append(f"{prov_thai}_{cons_no}")
             continue
-        
-        # Get prov_id and province_eng from mappings
-        prov_id = prov_mapping.get(prov_thai, prov_thai[:3].upper())
+        pl_match = pl_data[pl_row[cid]]
+        matched[cid] = True
+
+        prov_id = registry.prov_id[cid]
+        # Canonical spelling, also when the OCR name was matched fuzzily
+        prov_thai = registry.province_thai(prov_id) or prov_thai
         province_eng = prov_eng_mapping.get(prov_id, "")
         region = REGION_MAP.get(prov_id, "")
         
@@ -255,6 +327,7 @@ def process_election69_to_datasets(const_data: List[Dict], pl_data: List[Dict],
         
         # Create constituency MP record
         const_record = {
+            "cid": cid,
             "prov_id": prov_id,
             "province_thai": prov_thai,
             "province_eng": province_eng,
@@ -266,9 +339,11 @@ def process_election69_to_datasets(const_data: List[Dict], pl_data: List[Dict],
             "total_used_2569": const_total_used,
             "turn_out_2569": const_total_used,
             "percent_invalid_2569": const_invalid_pct,
-            "winner_party_2569": c_data['winning_party'],
+            "winner_party_2569": party(c_data['winning_party']),
+            "winner_pid_2569": pid(c_data['winning_party']),
             "winner_votes_2569": c_data['winning_score'],
-            "runnerup_party_2569": c_data['runnerUp_party'],
+            "runnerup_party_2569": party(c_data['runnerUp_party']),
+            "runnerup_pid_2569": pid(c_data['runnerUp_party']),
             "runnerup_votes_2569": c_data['runnerUp_score'],
             "margin_2569": const_margin,
         }
@@ -283,6 +358,7 @@ def process_election69_to_datasets(const_data: List[Dict], pl_data: List[Dict],
         pl_margin = pl_match['winning_score'] - pl_match['runnerUp_score']
         
         pl_record = {
+            "cid": cid,
             "prov_id": prov_id,
             "province_thai": prov_thai,
             "province_eng": province_eng,
@@ -294,16 +370,23 @@ def process_election69_to_datasets(const_data: List[Dict], pl_data: List[Dict],
             "total_used_2569": pl_total_used,
             "turn_out_2569": pl_total_used,
             "percent_invalid_2569": pl_invalid_pct,
-            "winner_party_2569": pl_match['winning_party'],
+            "winner_party_2569": party(pl_match['winning_party']),
+            "winner_pid_2569": pid(pl_match['winning_party']),
             "winner_votes_2569": pl_match['winning_score'],
-            "runnerup_party_2569": pl_match['runnerUp_party'],
+            "runnerup_party_2569": party(pl_match['runnerUp_party']),
+            "runnerup_pid_2569": pid(pl_match['runnerUp_party']),
             "runnerup_votes_2569": pl_match['runnerUp_score'],
             "margin_2569": pl_margin,
         }
         pl_raw.append(pl_record)
     
-    print(f"✓ Created {len(const_raw)} constituency records")
-    print(f"✓ Created {len(pl_raw)} party list records")
+    if verbose:
+        print(f"✓ Created {len(const_raw)} constituency records")
+        print(f"✓ Created {len(pl_raw)} party list records")
+
+    run_report.drop("constituency result without a party-list result", no_pl)
+    run_report.drop("party-list result without a constituency result",
+                    [f"{d['province_thai']}_{d['cons_no']}" for d, cid in zip(pl_data, pl_ids.tolist()) if not matched[cid]])
     
     return const_raw, pl_raw
 
@@ -312,41 +395,9 @@ def process_election69_to_datasets(const_data: List[Dict], pl_data: List[Dict],
 # ARCHIVING & EXPORT
 # ══════════════════════════════════════════════════════════════════════════
 
-def update_manifest(archive_filename: str, timestamp_str: str):
-    """Update manifest.json with new archive info"""
-    if not MANIFEST_FILE.exists():
-        manifest = []
-    else:
-        try:
-            with open(MANIFEST_FILE, 'r', encoding='utf-8') as f:
-                manifest = json.load(f)
-        except:
-            manifest = []
-    
-    # Check if latest entry exists, if not add it
-    has_latest = any(item['id'] == 'latest' for item in manifest)
-    if not has_latest:
-        manifest.insert(0, {
-            "id": "latest",
-            "name": "Latest (Active)",
-            "file": "election_data_generated.js"
-        })
-
-    # Add new archive
-    archive_id = timestamp_str.replace(" ", "_").replace(":", "").replace("-", "")
-    manifest.append({
-        "id": archive_id,
-        "name": f"Archive: {timestamp_str}",
-        "file": f"archives/{archive_filename}"
-    })
-    
-    with open(MANIFEST_FILE, 'w', encoding='utf-8') as f:
-        json.dump(manifest, f, ensure_ascii=False, indent=2)
-    print(f"✓ Updated manifest: {MANIFEST_FILE}")
-
-
-def export_to_javascript(const_raw: List[Dict], pl_raw: List[Dict], archive: bool = False):
-    """Export data as JavaScript arrays"""
+def export_to_javascript(const_raw: List[Dict], pl_raw: List[Dict], archive: bool = False,
+                         fast: bool = False, verbose: bool = True):
+    """Export data as JavaScript arrays (each file replaced atomically)"""
     now = datetime.now()
     timestamp_str = now.strftime("%Y-%m-%d %H:%M:%S")
     
@@ -365,23 +416,20 @@ var PARTYLIST_RAW = {pl_json};
 """
     
     # Always write to main output file
-    with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
-        f.write(js_content)
-    print(f"✓ JavaScript file saved to: {OUTPUT_FILE}")
+    atomic_write(OUTPUT_FILE, js_content.encode('utf-8'))
+    if verbose:
+        print(f"✓ JavaScript file saved to: {OUTPUT_FILE}")
+
+    # Minified JSON (+ .gz / .br) artifact for loaders
+    write_dataset_json(OUTPUT_FILE.with_suffix(".json"), const_raw, pl_raw, fast=fast)
+    if verbose:
+        print(f"✓ JSON artifacts saved to: {OUTPUT_FILE.with_suffix('.json')}")
     
-    # Optionally save to archive
+    # Optionally snapshot into the archive store (deduplicated, delta-compressed)
     if archive:
-        if not ARCHIVE_DIR.exists():
-            ARCHIVE_DIR.mkdir(parents=True)
-            
-        archive_filename = f"election_data_{now.strftime('%Y%md_%H%M')}.js"
-        archive_path = ARCHIVE_DIR / archive_filename
-        
-        with open(archive_path, 'w', encoding='utf-8') as f:
-            f.write(js_content)
-        print(f"  📦 Archived as: {archive_path}")
-        
-        update_manifest(archive_filename, timestamp_str)
+        entry = ArchiveStore(ARCHIVE_DIR).add(const_raw, pl_raw, name=f"Archive: {timestamp_str}")
+        kind = "delta" if entry.get("base") else "full"
+        print(f"  📦 Archived as: {entry['id']} ({kind}, {entry['bytes']:,} bytes)")
 
 
 
@@ -389,29 +437,52 @@ var PARTYLIST_RAW = {pl_json};
 # MAIN
 # ══════════════════════════════════════════════════════════════════════════
 
-def main():
-    parser = argparse.ArgumentParser(description="Build election data for Thailand election visualization")
-    parser.add_argument("--archive", action="store_true", help="Save a copy of the data to the archives folder")
-    args = parser.parse_args()
-
-    print("🔍 Thailand Election Data Builder")
-    print("═" * 50)
-    
+def build_ocr_datasets(use_cache: bool = True, workers: int = 1, archive: bool = False) -> tuple:
+    """Load, merge and export the 2569 OCR data; returns (const_raw, pl_raw)"""
     # Load data
     election66_data = load_election66_constituency_data()
-    prov_mapping = load_province_mapping()
     prov_eng_mapping = load_province_eng_mapping()
-    const_data, pl_data = load_election69_data()
+    const_data, pl_data = load_election69_data(use_cache=use_cache, workers=workers)
     
     # Process and merge
     const_raw = []
     pl_raw = []
     
     if const_data or pl_data:
-        const_raw, pl_raw = process_election69_to_datasets(const_data, pl_data, prov_mapping, prov_eng_mapping)
+        const_raw, pl_raw = process_election69_to_datasets(const_data, pl_data, prov_eng_mapping)
     
     # Export
-    export_to_javascript(const_raw, pl_raw, archive=args.archive)
+    export_to_javascript(const_raw, pl_raw, archive=archive)
+    run_report.records(outputs=len(const_raw) + len(pl_raw))
+    return const_raw, pl_raw
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build election data for Thailand election visualization")
+    parser.add_argument("--archive", action="store_true", help="Save a copy of the data to the archives folder")
+    parser.add_argument("--no-cache", action="store_true", help="Re-parse every OCR file instead of using the parse cache")
+    parser.add_argument("--workers", type=int, default=1, help="Parse OCR files across N worker processes (default: 1)")
+    parser.add_argument("--watch", action="store_true",
+                        help="Keep running and patch the outputs as OCR files arrive (see ocr_watch.py)")
+    parser.add_argument("--interval", type=float, default=0.25, help="Watch poll interval in seconds (default: 0.25)")
+    parser.add_argument("--compact", action="store_true",
+                        help="With --watch, write election69_ocr.json in the columnar format")
+    args = parser.parse_args()
+
+    print("🔍 Thailand Election Data Builder")
+    print("═" * 50)
+
+    if args.watch:
+        from ocr_watch import OcrWatcher
+        watcher = OcrWatcher(compact=args.compact)
+        watcher.build()
+        try:
+            watcher.run(args.interval)
+        except KeyboardInterrupt:
+            print("\n✓ Stopped watching")
+        return
+
+    build_ocr_datasets(use_cache=not args.no_cache, workers=args.workers, archive=args.archive)
     
     print("\n✅ Complete!")
     print(f"\nNext steps:")
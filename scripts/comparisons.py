@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Precomputed Left/Right comparison artifacts
+invalid_analysis.html and blank_analysis.html join the Left and Right
+datasets on province + constituency, compute the changes and danger flags
+and re-sort on every dataset switch. This precomputes that work for every
+ordered pair of datasets into data/compare/<left>__<right>.json, so the
+pages only index into the loaded arrays.
+
+Per table ("constituency" / "partylist") an artifact holds:
+    left / right        matched row indices (in Left order, as the pages pair them)
+    missing_from_r/_l   indices of Left rows absent on the Right and vice versa
+    metrics             per matched row: changes and danger flags
+    sorts               per page ("invalid" / "blank"), sort-select key and
+                        direction ("desc" / "asc"), the permutation of matched
+                        rows the page's comparator gives
+
+left_hash / right_hash are the content hashes of the data/<name>.json files the
+artifact was built from (the hash in their published names, asset_manifest.py).
+The pages use an artifact only when both match the files they loaded, and
+pair in the browser otherwise.
+
+Party sorts rank registered parties by pid (party_registry.py), as the pages'
+cmpParty does, so both sides order parties the same way.
+
+Usage:
+    python comparisons.py                       # the three standard datasets
+    python comparisons.py --archive <snapshot>  # also pair archived snapshots
+"""
+
+import argparse
+import math
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from artifacts import load_dataset, write_json_artifacts
+from asset_manifest import content_hash
+from constituency_table import ConstituencyTable
+from party_registry import load_party_registry
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+COMPARE_DIR = DATA_DIR / "compare"
+DATASETS = ("election66_data", "election69_ocr", "election69_94pct")
+TABLE_SOURCES = {"constituency": 0, "partylist": 1}
+
+
+# ══════════════════════════════════════════════════════════════════════════
+# NORMALISATION (mirrors the pages' normalizeRecord)
+# ══════════════════════════════════════════════════════════════════════════
+
+def _num(v: Any) -> float:
+    """JS `Number(v) || 0`"""
+    try:
+        x = float(v) if v is not None else 0.0
+    except (TypeError, ValueError):
+        return 0.0
+    return 0.0 if math.isnan(x) else x
+
+
+def _str(v: Any) -> str:
+    return str(v) if v and v != "Unknown" else "Unknown"
+
+
+def _pick(r: Dict[str, Any], name: str) -> Any:
+    return r[name] if r.get(name) is not None else r.get(f"{name}_2569")
+
+
+def normalize(records: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """Columns the comparison needs, with the pages' defaults applied"""
+    nums = ("cons_no", "turn_out", "percent_invalid", "invalid", "blank", "margin")
+    cols = {f: np.array([_num(r.get(f) if f == "cons_no" else _pick(r, f)) for r in records], dtype=np.float64)
+            for f in nums}
+    for f in ("province_thai", "province_eng", "region", "winner_party"):
+        src = (lambda r: r.get(f)) if f.startswith("province") else (lambda r: _pick(r, f))
+        cols[f] = np.array([_str(src(r)) for r in records], dtype=object)
+    if records and all(r.get("cid") is not None for r in records):
+        cols["cid"] = np.array([r["cid"] for r in records], dtype=np.int64)
+    turn_out = cols["turn_out"]
+    cols["percent_blank"] = np.divide(cols["blank"], turn_out, out=np.zeros(len(records)), where=turn_out > 0) * 100
+    return cols
+
+
+def party_sort_key(ranks: Dict[str, int], name: str) -> Tuple[float, str]:
+    """
+    The pages' cmpParty: registered parties in pid order, then unregistered
+    names by code point
+    """
+    pid = ranks.get(name)
+    return (pid, "") if pid is not None else (math.inf, name)
+
+
+# ══════════════════════════════════════════════════════════════════════════
+# PAIRING
+# ══════════════════════════════════════════════════════════════════════════
+
+def _key_table(cols: Dict[str, np.ndarray]) -> ConstituencyTable:
+    """Join keys: the registry id when the records carry one, and always province + number (older snapshots)"""
+    fields = (["cid"] if "cid" in cols else []) + ["province_thai", "cons_no"]
+    return ConstituencyTable.from_columns(
+        fields,
+        {"cid": cols.get("cid"), "province_thai": cols["province_thai"], "cons_no": cols["cons_no"].astype(np.int64)},
+    )
+
+
+def sort_specs(page: str, ranks: Dict[str, int]) -> Dict[str, Callable[[Dict[str, Any], int], Any]]:
+    """Sort keys equivalent to each page's SORTS_BASE comparators (`ranks`: party name -> pid)"""
+    metric = "percent_invalid" if page == "invalid" else "percent_blank"
+    pct_change = f"{page}_pct_change"
+    return {
+        "pct_change": lambda m, i: -m[pct_change][i],
+        "pct_2569": lambda m, i: -m["R"][metric][i],
+        f"{page}_change": lambda m, i: -m[f"{page}_change"][i],
+        f"{page}_l": lambda m, i: -m["L"][page][i],
+        f"{page}_r": lambda m, i: -m["R"][page][i],
+        "province": lambda m, i: (m["L"]["province_eng"][i].casefold(), m["L"]["cons_no"][i]),
+        "party_2566": lambda m, i: (party_sort_key(ranks, m["L"]["winner_party"][i]), -m[pct_change][i]),
+        "party_2569": lambda m, i: (party_sort_key(ranks, m["R"]["winner_party"][i]), -m[pct_change][i]),
+    }
+
+
+def _plain(values: np.ndarray) -> List[Any]:
+    """Float column as JSON numbers, using ints where the value is whole"""
+    return [int(v) if float(v).is_integer() else float(v) for v in values.tolist()]
+
+
+def pair_tables(left: List[Dict], right: List[Dict]) -> Dict[str, Any]:
+    """
+    Pair two record lists the way processRawData does: matched indices,
+    unmatched masks, paired columns ("L" / "R") and per-pair metrics
+    """
+    L, R = normalize(left), normalize(right)
+    lt, rt = _key_table(L), _key_table(R)
+    to_right = lt.join_index(rt) if len(rt) else np.full(len(lt), -1, dtype=np.int64)
+    to_left = rt.join_index(lt) if len(lt) else np.full(len(rt), -1, dtype=np.int64)
+
+    li = np.flatnonzero(to_right >= 0)
+    ri = to_right[li]
+    pairs = {"L": {f: c[li] for f, c in L.items()}, "R": {f: c[ri] for f, c in R.items()}}
+    m = {
+        "invalid_change": pairs["R"]["invalid"] - pairs["L"]["invalid"],
+        "invalid_pct_change": pairs["R"]["percent_invalid"] - pairs["L"]["percent_invalid"],
+        "blank_change": pairs["R"]["blank"] - pairs["L"]["blank"],
+        "blank_pct_change": pairs["R"]["percent_blank"] - pairs["L"]["percent_blank"],
+        "danger_invalid": (pairs["R"]["invalid"] > pairs["R"]["margin"]).astype(np.int64),
+        "danger_blank": (pairs["R"]["blank"] > pairs["R"]["margin"]).astype(np.int64),
+    }
+    return {"left": li, "right": ri, "to_right": to_right, "to_left": to_left, "pairs": pairs, "metrics": m}
+
+
+def compare_tables(left: List[Dict], right: List[Dict]) -> Dict[str, Any]:
+    """Comparison artifact block for one table"""
+    p = pair_tables(left, right)
+    li, m, pairs = p["left"], p["metrics"], p["pairs"]
+
+    sorts = {}
+    lookup = {**m, **pairs}
+    ranks = {party["name"]: party["pid"] for party in load_party_registry().parties}
+    rows = range(len(li))
+    for page in ("invalid", "blank"):
+        # sorted() is stable, like Array.prototype.sort, so ties keep Left order. The
+        # pages sort ascending with the comparator's arguments swapped, which is
+        # reverse=True: every key component flips and ties still keep Left order.
+        sorts[page] = {
+            name: {
+                "desc": sorted(rows, key=lambda i, key=key: key(lookup, i)),
+                "asc": sorted(rows, key=lambda i, key=key: key(lookup, i), reverse=True),
+            }
+            for name, key in sort_specs(page, ranks).items()
+        }
+
+    return {
+        "left_rows": len(left),
+        "right_rows": len(right),
+        "left": li.tolist(),
+        "right": p["right"].tolist(),
+        "missing_from_r": np.flatnonzero(p["to_right"] < 0).tolist(),
+        "missing_from_l": np.flatnonzero(p["to_left"] < 0).tolist(),
+        "metrics": {k: _plain(v) for k, v in m.items()},
+        "sorts": sorts,
+    }
+
+
+def compare_datasets(left: Tuple[List, List], right: Tuple[List, List]) -> Dict[str, Any]:
+    return {name: compare_tables(left[i], right[i]) for name, i in TABLE_SOURCES.items()}
+
+
+def dataset_hash(name: str) -> Optional[str]:
+    """Content hash of data/<name>.json, or None when there is no such file (archived snapshots)"""
+    path = DATA_DIR / f"{name}.json"
+    return content_hash(path.read_bytes()) if path.exists() else None
+
+
+def build_comparisons(datasets: Dict[str, Tuple[List, List]], out_dir: Path = COMPARE_DIR,
+                      touching: Optional[str] = None, fast: bool = False) -> List[Path]:
+    """
+    Write one artifact per ordered pair (including a dataset against itself),
+    or only the pairs involving `touching`
+    """
+    out_dir.mkdir(parents=True, exist_ok=True)
+    written = []
+    hashes = {name: dataset_hash(name) for name in datasets}
+    for lname, ldata in datasets.items():
+        for rname, rdata in datasets.items():
+            if touching is not None and touching not in (lname, rname):
+                continue
+            payload = {"left": lname, "right": rname, "left_hash": hashes[lname], "right_hash": hashes[rname],
+                       **compare_datasets(ldata, rdata)}
+            path = out_dir / f"{lname}__{rname}.json"
+            write_json_artifacts(path, payload, fast=fast)
+            written.append(path)
+    if touching is None:
+        print(f"✓ Wrote {len(written)} comparison artifacts to {out_dir}")
+    return written
+
+
+def load_standard_datasets() -> Dict[str, Tuple[List, List]]:
+    return {name: load_dataset(DATA_DIR / f"{name}.json") for name in DATASETS}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Precompute Left/Right comparison artifacts for the analysis pages")
+    parser.add_argument("--archive", nargs="*", default=[], help="Archived snapshot ids to include")
+    parser.add_argument("--out", type=Path, default=COMPARE_DIR, help="Output directory")
+    args = parser.parse_args()
+
+    datasets = load_standard_datasets()
+    if args.archive:
+        from archive_store import ArchiveStore
+        store = ArchiveStore()
+        for sid in args.archive:
+            datasets[f"archive_{sid}"] = store.load(sid)
+    build_comparisons(datasets, args.out)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Canonical constituency registry
+Every constituency gets one dense integer id (`cid`): its row in the ECT 2566
+constituency list (th_election66_info_constituency.json) ordered by prov_id and
+cons_no, followed by the constituencies drawn since. Every stage tags its
+records with it and joins on it by array indexing. Keys that do not resolve
+raise ConstituencyKeyError naming them, instead of silently dropping rows.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from name_resolver import province_index, resolve_names
+
+ELECTION66_DIR = Path(__file__).parent.parent / "data" / "election66"
+
+# Constituencies of 2569 that the 2566 list does not have. They are appended
+# after it, so the 2566 ids never move.
+ADDED_CONSTITUENCIES = [("PTE", 8), ("SKN", 4)]
+
+MAX_SHOWN = 10
+
+
+class ConstituencyKeyError(KeyError):
+    """Keys that are not registered constituencies"""
+
+    def __init__(self, source: str, keys: Sequence[str]):
+        self.source = source
+        self.keys = list(keys)
+        shown = ", ".join(self.keys[:MAX_SHOWN]) + (" …" if len(self.keys) > MAX_SHOWN else "")
+        super().__init__(f"{len(self.keys)} {source} keys are not registered constituencies: {shown}")
+
+    def __str__(self) -> str:
+        return self.args[0]
+
+
+class ConstituencyRegistry:
+    """Dense cid <-> (prov_id, cons_no), plus the province names"""
+
+    def __init__(self, keys: Sequence[Tuple[str, int]], provinces: Sequence[Dict[str, Any]] = ()):
+        self.prov_id = np.empty(len(keys), dtype=object)
+        self.prov_id[:] = [p for p, _ in keys]
+        self.cons_no = np.array([c for _, c in keys], dtype=np.int64)
+        self.provinces = {p["prov_id"]: p for p in provinces}
+        self.names = province_index(provinces)
+
+        # (province code, cons_no) packed into one sorted int64 key for vectorised lookups
+        self._prov_code = {p: i for i, p in enumerate(sorted(set(self.prov_id.tolist()) | set(self.provinces)))}
+        self._stride = int(self.cons_no.max(initial=0)) + 1
+        packed = np.array([self._prov_code[p] for p in self.prov_id.tolist()], dtype=np.int64) * self._stride + self.cons_no
+        self._order = np.argsort(packed, kind="stable")
+        self._sorted = packed[self._order]
+
+    @classmethod
+    def load(cls, election66_dir: Optional[Path] = None) -> "ConstituencyRegistry":
+        folder = Path(election66_dir or ELECTION66_DIR)
+        with open(folder / "th_election66_info_constituency.json", "r", encoding="utf-8-sig") as f:
+            constituencies = json.load(f)
+        with open(folder / "th_election66_info_province.json", "r", encoding="utf-8-sig") as f:
+            provinces = json.load(f).get("province", [])
+        keys = sorted({(c["prov_id"], int(c["cons_no"])) for c in constituencies})
+        known = set(keys)
+        keys += [k for k in ADDED_CONSTITUENCIES if k not in known]
+        return cls(keys, provinces)
+
+    def __len__(self) -> int:
+        return len(self.cons_no)
+
+    def key(self, cid: int) -> str:
+        """ECT-style "BKK_1" key of an id"""
+        return f"{self.prov_id[cid]}_{self.cons_no[cid]}"
+
+    def lookup(self, prov_ids: Sequence[Optional[str]], cons_nos: Sequence[Any]) -> np.ndarray:
+        """cid per (prov_id, cons_no) pair, -1 where it is not registered"""
+        n = len(prov_ids)
+        if len(self) == 0:
+            return np.full(n, -1, dtype=np.int64)
+        codes = np.fromiter((self._prov_code.get(p, -1) for p in prov_ids), dtype=np.int64, count=n)
+        cons = np.fromiter((_int_or(c, -1) for c in cons_nos), dtype=np.int64, count=n)
+        packed = codes * self._stride + cons
+        pos = np.clip(np.searchsorted(self._sorted, packed), 0, len(self) - 1)
+        found = (codes >= 0) & (cons >= 0) & (cons < self._stride)
+        found[found] = self._sorted[pos[found]] == packed[found]
+        return np.where(found, self._order[pos], -1)
+
+    def ids(self, prov_ids: Sequence[Optional[str]], cons_nos: Sequence[Any], source: str) -> np.ndarray:
+        """cid per (prov_id, cons_no) pair; raises ConstituencyKeyError listing every unregistered pair"""
+        cids = self.lookup(prov_ids, cons_nos)
+        _check(cids, prov_ids, cons_nos, source)
+        return cids
+
+    def ids_by_name(self, province_thai: Sequence[Optional[str]], cons_nos: Sequence[Any], source: str) -> np.ndarray:
+        """
+        cid per (Thai province name, cons_no) pair. Names are resolved through
+        the fuzzy province index (fuzzy and unresolved names are reported);
+        raises ConstituencyKeyError like `ids`
+        """
+        matches = resolve_names(self.names, province_thai, f"{source} province")
+        prov_ids = [m.value if m else None for m in (matches.get(str(n)) for n in province_thai)]
+        cids = self.lookup(prov_ids, cons_nos)
+        _check(cids, province_thai, cons_nos, source)
+        return cids
+
+    def record_ids(self, records: Sequence[Dict[str, Any]], source: str) -> np.ndarray:
+        """cid per record: its own `cid` when every record carries one, otherwise resolved from its names"""
+        if all(r.get("cid") is not None for r in records):
+            return np.fromiter((r["cid"] for r in records), dtype=np.int64, count=len(records))
+        return self.ids_by_name([r.get("province_thai") for r in records],
+                                [r.get("cons_no") for r in records], source)
+
+    def province_thai(self, prov_id: str) -> str:
+        return self.provinces.get(prov_id, {}).get("province", "")
+
+    def province_eng(self, prov_id: str) -> str:
+        return self.provinces.get(prov_id, {}).get("eng", "")
+
+
+def _int_or(v: Any, default: int) -> int:
+    try:
+        return int(v)
+    except (TypeError, ValueError):
+        return default
+
+
+def _check(cids: np.ndarray, names: Sequence[Any], cons_nos: Sequence[Any], source: str):
+    if (cids < 0).any():
+        missing = np.flatnonzero(cids < 0).tolist()
+        raise ConstituencyKeyError(source, [f"{names[i]}_{cons_nos[i]}" for i in missing])
+
+
+_registries: Dict[Tuple[str, Tuple[int, ...]], ConstituencyRegistry] = {}
+
+
+def load_registry(election66_dir: Optional[Path] = None) -> ConstituencyRegistry:
+    """The registry of `election66_dir` (default ELECTION66_DIR), rebuilt only when its files change"""
+    folder = Path(election66_dir or ELECTION66_DIR)
+    files = [folder / "th_election66_info_constituency.json", folder / "th_election66_info_province.json"]
+    stamp = (str(folder), tuple(f.stat().st_mtime_ns for f in files))
+    if stamp not in _registries:
+        _registries.clear()
+        _registries[stamp] = ConstituencyRegistry.load(folder)
+    return _registries[stamp]
+
+
+def main():
+    registry = load_registry()
+    provinces = sorted(set(registry.prov_id.tolist()))
+    print(f"✓ {len(registry)} constituencies in {len(provinces)} provinces ({ELECTION66_DIR})")
+    added = registry.lookup([p for p, _ in ADDED_CONSTITUENCIES], [c for _, c in ADDED_CONSTITUENCIES])
+    print(f"  Added since 2566: {', '.join(f'{registry.key(i)} = {i}' for i in added.tolist())}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Columnar constituency table used by the data pipeline
+Holds one typed NumPy array per field instead of one dict per constituency.
+Text fields (province, region, party) are stored as integer codes into a
+per-column category list.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+# ══════════════════════════════════════════════════════════════════════════
+# FIELD TYPES
+# ══════════════════════════════════════════════════════════════════════════
+
+CATEGORICAL_FIELDS = (
+    "province_thai", "province_eng", "prov_id", "region",
+    "winner_party", "runnerup_party",
+)
+INT_FIELDS = (
+    "cid", "cons_no", "turn_out", "total_used", "valid", "invalid", "blank",
+    "winner_pid", "winner_votes", "runnerup_pid", "runnerup_votes", "margin", "ballot_surplus",
+)
+FLOAT_FIELDS = ("percent_invalid",)
+
+
+def encode_categorical(values: Iterable[Any]) -> tuple:
+    """Encode values as (int32 codes, categories) in first-seen order"""
+    index: Dict[Any, int] = {}
+    codes = np.fromiter(
+        (index.setdefault(v, len(index)) for v in values), dtype=np.int32
+    )
+    return codes, list(index)
+
+
+class ConstituencyTable:
+    """One row per constituency, stored column by column"""
+
+    def __init__(self, fields: Sequence[str], columns: Dict[str, np.ndarray],
+                 categories: Optional[Dict[str, List[Any]]] = None):
+        self.fields = list(fields)
+        self.columns = columns
+        self.categories = categories or {}
+
+    @classmethod
+    def from_columns(cls, fields: Sequence[str], values: Dict[str, Sequence[Any]]) -> "ConstituencyTable":
+        """Build a table from plain per-field value lists"""
+        columns = {}
+        categories = {}
+        for name in fields:
+            col = values[name]
+            if name in CATEGORICAL_FIELDS:
+                columns[name], categories[name] = encode_categorical(col)
+            elif name in FLOAT_FIELDS:
+                columns[name] = np.asarray(col, dtype=np.float64)
+            else:
+                columns[name] = np.asarray(col, dtype=np.int64)
+        return cls(fields, columns, categories)
+
+    @classmethod
+    def from_records(cls, records: Sequence[Dict[str, Any]], fields: Sequence[str]) -> "ConstituencyTable":
+        """Build a table from a list of flat record dicts"""
+        return cls.from_columns(fields, {f: [r.get(f) for r in records] for f in fields})
+
+    def __len__(self) -> int:
+        if not self.fields:
+            return 0
+        return len(self.columns[self.fields[0]])
+
+    def codes(self, name: str) -> np.ndarray:
+        """Integer codes of a categorical column"""
+        return self.columns[name]
+
+    def column(self, name: str) -> np.ndarray:
+        """Column values; categorical columns are decoded to objects"""
+        col = self.columns[name]
+        if name in self.categories:
+            cats = np.empty(len(self.categories[name]), dtype=object)
+            cats[:] = self.categories[name]
+            return cats[col]
+        return col
+
+    def set_column(self, name: str, values: np.ndarray):
+        """Add or replace a numeric column (appended to the field order if new)"""
+        self.columns[name] = values
+        if name not in self.fields:
+            self.fields.append(name)
+
+    def join_index(self, other: "ConstituencyTable",
+                   key: str = "province_thai") -> np.ndarray:
+        """
+        Row index into `other` for each row of this table matched on the
+        registry id `cid` when both tables have one (otherwise on
+        (key, cons_no)), or -1 where there is no match.
+        Duplicate keys in `other` resolve to the last row, like a dict build.
+        """
+        if len(other) == 0:
+            return np.full(len(self), -1, dtype=np.int64)
+        if "cid" in self.columns and "cid" in other.columns:
+            left, right = self.columns["cid"], other.columns["cid"]
+            rows = np.full(int(max(left.max(initial=-1), right.max())) + 1, -1, dtype=np.int64)
+            np.maximum.at(rows, right, np.arange(len(other)))
+            return rows[left]
+        lookup = {c: i for i, c in enumerate(other.categories[key])}
+        remap = np.array([lookup.get(c, -1) for c in self.categories[key]], dtype=np.int64)
+        left_prov = remap[self.codes(key)] if len(remap) else np.full(len(self), -1, dtype=np.int64)
+
+        right_cons = other.columns["cons_no"]
+        left_cons = self.columns["cons_no"]
+        stride = int(max(right_cons.max(initial=0), left_cons.max(initial=0))) + 1
+        right_keys = other.codes(key).astype(np.int64) * stride + right_cons
+        left_keys = left_prov * stride + left_cons
+
+        order = np.argsort(right_keys, kind="stable")
+        sorted_keys = right_keys[order]
+        pos = np.searchsorted(sorted_keys, left_keys, side="right") - 1
+        found = (pos >= 0) & (left_prov >= 0)
+        found[found] = sorted_keys[pos[found]] == left_keys[found]
+        return np.where(found, order[np.clip(pos, 0, None)], -1)
+
+    def to_columnar(self) -> Dict[str, Any]:
+        """
+        Dictionary-encoded wire block: one value list per field, with
+        categorical fields sent as codes into a per-field lookup table
+        """
+        return {
+            "length": len(self),
+            "fields": list(self.fields),
+            "columns": {f: self.columns[f].tolist() for f in self.fields},
+            "dicts": {f: list(self.categories[f]) for f in self.fields if f in self.categories},
+        }
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Materialise the table back into a list of dicts (JSON-ready)"""
+        cols = [self.column(f).tolist() for f in self.fields]
+        return [dict(zip(self.fields, row)) for row in zip(*cols)]
@@ -0,0 +1,403 @@
+#!/usr/bin/env python3
+"""
+Embedded SQLite store for every dataset and archived snapshot
+The datasets live as JS/JSON artifacts and the archive as delta objects, so a
+narrow question ("danger-zone constituencies in the Northeast across every
+snapshot") otherwise means re-reading whole files. The pipeline's `store`
+stage loads them into data/election.sqlite:
+
+    constituencies  cid, prov_id, cons_no, names, region (constituency registry)
+    parties         pid, name, abbr, color, ect_id, party_no (party registry)
+    snapshots       one row per dataset file and per archived snapshot
+    results         one row per (snapshot, ballot, constituency)
+    candidates      ECT 2566 candidate rows per constituency
+
+Results are indexed on constituency, party and snapshot, constituencies on
+province and region. Snapshots are keyed by content hash, so a rebuild only
+loads what changed. `export` writes any snapshot back out as a dataset JSON
+artifact.
+
+Usage:
+    python election_store.py build
+    python election_store.py query --region Northeast --danger invalid
+    python election_store.py sql "SELECT region, COUNT(*) FROM constituencies GROUP BY region"
+    python election_store.py export election69_ocr -o election69_ocr.json
+"""
+
+import argparse
+import hashlib
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from archive_store import ARCHIVE_DIR, ArchiveStore, content_hash
+from artifacts import load_dataset, write_dataset_json
+from build_election_data import REGION_MAP
+from constituency_registry import ConstituencyKeyError, load_registry
+from party_registry import load_party_registry
+import run_report
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+ELECTION66_DIR = DATA_DIR / "election66"
+STORE_PATH = DATA_DIR / "election.sqlite"
+DATASETS = ("election66_data", "election69_ocr", "election69_94pct")
+BALLOTS = {"constituency": "CONST_RAW", "partylist": "PARTYLIST_RAW"}
+
+# Bumped whenever SCHEMA changes; an older file is rebuilt from scratch
+SCHEMA_VERSION = 1
+
+RESULT_FIELDS = [
+    "turn_out", "total_used", "valid", "invalid", "blank", "percent_invalid",
+    "winner_party", "winner_pid", "winner_votes", "runnerup_party", "runnerup_pid", "runnerup_votes",
+    "margin", "ballot_surplus",
+]
+CONSTITUENCY_FIELDS = ["cid", "province_thai", "province_eng", "prov_id", "cons_no", "region"]
+# Danger zone, as the pages flag it: more invalid (or blank) ballots than the winning margin
+DANGER = ("invalid", "blank")
+
+SCHEMA = """
+CREATE TABLE constituencies (
+    cid INTEGER PRIMARY KEY, prov_id TEXT NOT NULL, cons_no INTEGER NOT NULL,
+    province_thai TEXT, province_eng TEXT, region TEXT
+);
+CREATE INDEX constituencies_province ON constituencies (prov_id, cons_no);
+CREATE INDEX constituencies_region ON constituencies (region);
+
+CREATE TABLE parties (
+    pid INTEGER PRIMARY KEY, name TEXT NOT NULL, abbr TEXT, color TEXT, ect_id INTEGER, party_no INTEGER
+);
+CREATE INDEX parties_name ON parties (name);
+
+CREATE TABLE snapshots (
+    snapshot_id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE, kind TEXT NOT NULL,
+    label TEXT, created TEXT, hash TEXT
+);
+
+CREATE TABLE results (
+    snapshot_id INTEGER NOT NULL REFERENCES snapshots ON DELETE CASCADE,
+    ballot TEXT NOT NULL, seq INTEGER NOT NULL, cid INTEGER NOT NULL,
+    turn_out INTEGER, total_used INTEGER, valid INTEGER, invalid INTEGER, blank INTEGER, percent_invalid REAL,
+    winner_party TEXT, winner_pid INTEGER, winner_votes INTEGER,
+    runnerup_party TEXT, runnerup_pid INTEGER, runnerup_votes INTEGER,
+    margin INTEGER, ballot_surplus INTEGER,
+    PRIMARY KEY (snapshot_id, ballot, seq)
+);
+CREATE INDEX results_cid ON results (cid, snapshot_id);
+CREATE INDEX results_winner ON results (winner_pid);
+
+CREATE TABLE candidates (
+    cid INTEGER NOT NULL, rank INTEGER, no INTEGER, name TEXT, pid INTEGER, votes INTEGER
+);
+CREATE INDEX candidates_cid ON candidates (cid);
+CREATE INDEX candidates_pid ON candidates (pid);
+"""
+
+
+def _file_hash(path: Path) -> str:
+    with open(path, "rb") as f:
+        return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+
+
+def _pick(r: Dict[str, Any], name: str) -> Any:
+    """Plain field, or the _2569-suffixed one raw builder records use"""
+    return r[name] if r.get(name) is not None else r.get(f"{name}_2569")
+
+
+class ElectionStore:
+    """The SQLite file plus loaders and the query API over it"""
+
+    def __init__(self, path: Path = STORE_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(self.path)
+        self.db.row_factory = sqlite3.Row
+        self.db.execute("PRAGMA foreign_keys = ON")
+        if self.db.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            self._create()
+
+    def _create(self):
+        tables = [r[0] for r in self.db.execute("SELECT name FROM sqlite_master WHERE type = 'table'")]
+        with self.db:
+            for t in tables:
+                self.db.execute(f"DROP TABLE {t}")
+            self.db.executescript(SCHEMA)
+            self.db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def close(self):
+        self.db.close()
+
+    # ── Loading ─────────────────────────────────────────────────────────
+
+    def load_reference(self, election66_dir: Optional[Path] = None):
+        """Constituencies, parties and 2566 candidates from the registries and ECT files"""
+        election66_dir = Path(election66_dir or ELECTION66_DIR)
+        registry = load_registry(election66_dir)
+        parties = load_party_registry(election66_dir)
+        with self.db:
+            self.db.execute("DELETE FROM constituencies")
+            self.db.executemany(
+                "INSERT INTO constituencies VALUES (?, ?, ?, ?, ?, ?)",
+                [(cid, prov_id, int(cons_no), registry.province_thai(prov_id), registry.province_eng(prov_id),
+                  REGION_MAP.get(prov_id, ""))
+                 for cid, (prov_id, cons_no) in enumerate(zip(registry.prov_id.tolist(), registry.cons_no.tolist()))],
+            )
+            self.db.execute("DELETE FROM parties")
+            self.db.executemany(
+                "INSERT INTO parties VALUES (:pid, :name, :abbr, :color, :ect_id, :party_no)", parties.to_table())
+            self.db.execute("DELETE FROM candidates")
+            self.db.executemany("INSERT INTO candidates VALUES (?, ?, ?, ?, ?, ?)",
+                                _candidate_rows(election66_dir, registry, parties))
+
+    def stored_hash(self, name: str) -> Optional[str]:
+        """Content hash `name` was stored with, None if it is not stored"""
+        row = self.db.execute("SELECT hash FROM snapshots WHERE name = ?", (name,)).fetchone()
+        return row["hash"] if row is not None else None
+
+    def load_tables(self, name: str, kind: str, digest: str, const_raw: List[Dict], pl_raw: List[Dict],
+                    label: str = "", created: str = "") -> int:
+        """Store one snapshot's two tables; returns the rows written (0 when unchanged)"""
+        if self.stored_hash(name) == digest:
+            return 0
+        registry = load_registry(ELECTION66_DIR)
+        parties = load_party_registry(ELECTION66_DIR)
+        rows = []
+        for ballot, records in (("constituency", const_raw), ("partylist", pl_raw)):
+            cids = registry.record_ids(records, f"{name} {ballot}").tolist()
+            pids = {}
+            for role in ("winner", "runnerup"):
+                codes = [_pick(r, f"{role}_pid") for r in records]
+                if any(c is None for c in codes):
+                    codes = parties.codes([_pick(r, f"{role}_party") or "Unknown" for r in records],
+                                          f"{name} party").tolist()
+                pids[role] = codes
+            for seq, (r, cid) in enumerate(zip(records, cids)):
+                values = {f: _pick(r, f) for f in RESULT_FIELDS}
+                values["winner_pid"], values["runnerup_pid"] = pids["winner"][seq], pids["runnerup"][seq]
+                rows.append((ballot, seq, cid, *(values[f] for f in RESULT_FIELDS)))
+        with self.db:
+            # Replaced snapshots take their result rows with them (ON DELETE CASCADE)
+            self.db.execute("DELETE FROM snapshots WHERE name = ?", (name,))
+            snapshot_id = self.db.execute(
+                "INSERT INTO snapshots (name, kind, label, created, hash) VALUES (?, ?, ?, ?, ?)",
+                (name, kind, label, created, digest)).lastrowid
+            self.db.executemany(
+                f"INSERT INTO results VALUES ({snapshot_id}, {', '.join('?' * (3 + len(RESULT_FIELDS)))})", rows)
+        return len(rows)
+
+    def load_datasets(self, data_dir: Path = DATA_DIR, names: Sequence[str] = DATASETS) -> int:
+        """The current dataset files (reloaded only when their content changed)"""
+        written = 0
+        for name in names:
+            path = data_dir / f"{name}.json"
+            if not path.exists():
+                print(f"⚠️  {path.name} not found, not stored")
+                continue
+            const_raw, pl_raw = load_dataset(path)
+            written += self.load_tables(name, "dataset", _file_hash(path), const_raw, pl_raw, label=name)
+        return written
+
+    def load_archive(self, archive_dir: Path = ARCHIVE_DIR) -> int:
+        """Every archived snapshot not stored yet (dropped ones are removed)"""
+        archive = ArchiveStore(archive_dir)
+        ids = {e["id"] for e in archive.manifest}
+        with self.db:
+            for row in self.db.execute("SELECT name FROM snapshots WHERE kind = 'archive'").fetchall():
+                if row["name"] not in ids:
+                    self.db.execute("DELETE FROM snapshots WHERE name = ?", (row["name"],))
+        written, skipped = 0, []
+        for e in archive.manifest:
+            # Legacy full-copy entries have no hash and are compared after loading
+            if e.get("hash") is not None and self.stored_hash(e["id"]) == e["hash"]:
+                continue
+            const_raw, pl_raw = archive.load(e["id"])
+            digest = e.get("hash") or content_hash({"CONST_RAW": const_raw, "PARTYLIST_RAW": pl_raw})
+            try:
+                written += self.load_tables(e["id"], "archive", digest, const_raw, pl_raw,
+                                            label=e.get("name", ""), created=e.get("created", ""))
+            except ConstituencyKeyError as err:
+                skipped.append(f"{e['id']}: {err}")
+        run_report.drop("archived snapshot with unregistered constituencies", skipped)
+        return written
+
+    # ── Queries ─────────────────────────────────────────────────────────
+
+    def sql(self, query: str, params: Sequence[Any] = ()) -> List[Dict[str, Any]]:
+        """Rows of any read query as dicts"""
+        return [dict(r) for r in self.db.execute(query, params)]
+
+    def results(self, snapshot: Optional[str] = None, kind: Optional[str] = None, ballot: str = "constituency",
+                region: Optional[str] = None, province: Optional[str] = None, party: Optional[str] = None,
+                cid: Optional[int] = None, danger: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Result rows with their constituency and snapshot, filtered on any of:
+        snapshot name, snapshot kind ("dataset" / "archive"), ballot, region,
+        province (prov_id, Thai or English name), winning party (name,
+        abbreviation or pid), cid and danger ("invalid" / "blank": more such
+        ballots than the winning margin)
+        """
+        where, params = ["r.ballot = ?"], [ballot]
+        if snapshot is not None:
+            where.append("s.name = ?")
+            params.append(snapshot)
+        if kind is not None:
+            where.append("s.kind = ?")
+            params.append(kind)
+        if region is not None:
+            where.append("c.region = ?")
+            params.append(region)
+        if province is not None:
+            where.append("c.prov_id IN (SELECT prov_id FROM constituencies "
+                         "WHERE prov_id = ? OR province_thai = ? OR province_eng = UPPER(?))")
+            params += [province] * 3
+        if party is not None:
+            where.append("r.winner_pid IN (SELECT pid FROM parties WHERE pid = ? OR name = ? OR abbr = ?)")
+            params += [int(party) if str(party).isdigit() else None, party, party]
+        if cid is not None:
+            where.append("r.cid = ?")
+            params.append(int(cid))
+        if danger is not None:
+            if danger not in DANGER:
+                raise ValueError(f"danger must be one of {DANGER}, not {danger!r}")
+            where.append(f"r.{danger} > r.margin")
+        return self.sql(
+            f"SELECT s.name AS snapshot, s.kind, s.created, {', '.join(f'c.{f}' for f in CONSTITUENCY_FIELDS)}, "
+            f"{', '.join(f'r.{f}' for f in RESULT_FIELDS)} "
+            "FROM results r JOIN snapshots s USING (snapshot_id) JOIN constituencies c USING (cid) "
+            f"WHERE {' AND '.join(where)} ORDER BY s.snapshot_id, r.seq",
+            params,
+        )
+
+    def snapshots(self) -> List[Dict[str, Any]]:
+        return self.sql("SELECT s.*, COUNT(r.seq) AS rows FROM snapshots s LEFT JOIN results r USING (snapshot_id) "
+                        "GROUP BY s.snapshot_id ORDER BY s.snapshot_id")
+
+    def export_tables(self, snapshot: str) -> Tuple[List[Dict], List[Dict]]:
+        """(CONST_RAW, PARTYLIST_RAW) of a stored snapshot, in the original record order"""
+        if self.db.execute("SELECT 1 FROM snapshots WHERE name = ?", (snapshot,)).fetchone() is None:
+            raise KeyError(f"Unknown snapshot: {snapshot}")
+        tables = []
+        for ballot in BALLOTS:
+            rows = self.results(snapshot=snapshot, ballot=ballot)
+            fields = CONSTITUENCY_FIELDS + RESULT_FIELDS
+            tables.append([{f: r[f] for f in fields if r[f] is not None} for r in rows])
+        return tables[0], tables[1]
+
+
+def _candidate_rows(election66_dir: Path, registry, parties) -> List[Tuple]:
+    """(cid, rank, no, name, pid, votes) for every ECT 2566 candidate"""
+    def load(name):
+        with open(Path(election66_dir) / name, "r", encoding="utf-8-sig") as f:
+            return json.load(f)
+
+    meta = {c["mp_app_id"]: c for c in load("th_election66_info_mp_candidate.json")}
+    keys, rows = [], []
+    for prov in load("th_election66_stats_cons.json").get("result_province", []):
+        for cons in prov.get("constituencies", []):
+            for c in cons.get("candidates", []):
+                m = meta.get(c.get("mp_app_id"), {})
+                keys.append((prov.get("prov_id"), cons.get("cons_id", "_").split("_")[-1]))
+                rows.append((c.get("mp_app_rank"), m.get("mp_app_no"), m.get("mp_app_name", ""),
+                             c.get("party_id") or m.get("mp_app_party_id"), c.get("mp_app_vote")))
+    cids = registry.ids([k[0] for k in keys], [k[1] for k in keys], "ECT 2566 candidates").tolist()
+    pids = parties.ect_codes([r[3] for r in rows]).tolist()
+    return [(cid, _int(r[0]), _int(r[1]), r[2], pid, _int(r[4])) for cid, pid, r in zip(cids, pids, rows)]
+
+
+def _int(v: Any) -> Optional[int]:
+    try:
+        return int(v)
+    except (TypeError, ValueError):
+        return None
+
+
+def build_store(path: Path = STORE_PATH, data_dir: Path = DATA_DIR, archive_dir: Path = ARCHIVE_DIR) -> Dict[str, int]:
+    """Load the reference tables, the dataset files and the archive; returns the row counts"""
+    store = ElectionStore(path)
+    try:
+        store.load_reference()
+        datasets = store.load_datasets(data_dir)
+        archived = store.load_archive(archive_dir)
+        counts = {t: store.db.execute(f"SELECT COUNT(*) FROM {t}").fetchone()[0]
+                  for t in ("constituencies", "parties", "snapshots", "results", "candidates")}
+        run_report.records(outputs=counts["results"], written=datasets + archived)
+        print(f"✓ Store: {counts['snapshots']} snapshots, {counts['results']:,} result rows "
+              f"({datasets + archived:,} loaded now) → {path}")
+        return counts
+    finally:
+        store.close()
+
+
+# ══════════════════════════════════════════════════════════════════════════
+# CLI
+# ══════════════════════════════════════════════════════════════════════════
+
+def _print_rows(rows: List[Dict[str, Any]], columns: Iterable[str]):
+    columns = list(columns)
+    for r in rows:
+        print("  " + "  ".join(str(r.get(c, "")) for c in columns))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Embedded SQLite store of every dataset and archived snapshot")
+    parser.add_argument("--db", type=Path, default=STORE_PATH, help="Store file")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("build", help="Load the reference tables, dataset files and archive")
+    sub.add_parser("snapshots", help="List stored snapshots")
+
+    p_query = sub.add_parser("query", help="Filter result rows")
+    p_query.add_argument("--snapshot", help="Snapshot name (dataset name or archive id); default: all")
+    p_query.add_argument("--kind", choices=["dataset", "archive"])
+    p_query.add_argument("--ballot", choices=list(BALLOTS), default="constituency")
+    p_query.add_argument("--region")
+    p_query.add_argument("--province", help="prov_id, Thai or English name")
+    p_query.add_argument("--party", help="Winning party: name, abbreviation or pid")
+    p_query.add_argument("--cid", type=int)
+    p_query.add_argument("--danger", choices=list(DANGER), help="More invalid/blank ballots than the margin")
+    p_query.add_argument("--json", action="store_true", help="Print the rows as JSON")
+
+    p_sql = sub.add_parser("sql", help="Run a read-only SQL query")
+    p_sql.add_argument("query")
+
+    p_export = sub.add_parser("export", help="Write a stored snapshot as a dataset JSON artifact")
+    p_export.add_argument("snapshot")
+    p_export.add_argument("-o", "--output", type=Path, required=True)
+
+    args = parser.parse_args()
+
+    if args.command == "build":
+        build_store(args.db)
+        return
+
+    store = ElectionStore(args.db)
+    try:
+        t0 = time.perf_counter()
+        if args.command == "snapshots":
+            _print_rows(store.snapshots(), ("snapshot_id", "name", "kind", "created", "rows", "label"))
+        elif args.command == "query":
+            rows = store.results(snapshot=args.snapshot, kind=args.kind, ballot=args.ballot, region=args.region,
+                                 province=args.province, party=args.party, cid=args.cid, danger=args.danger)
+            if args.json:
+                print(json.dumps(rows, ensure_ascii=False, indent=2))
+            else:
+                _print_rows(rows, ("snapshot", "cid", "province_thai", "cons_no", "region", "winner_party",
+                                   "margin", "invalid", "blank"))
+                print(f"✓ {len(rows)} rows in {(time.perf_counter() - t0) * 1000:.1f} ms")
+        elif args.command == "sql":
+            store.db.execute("PRAGMA query_only = ON")
+            rows = store.sql(args.query)
+            print(json.dumps(rows, ensure_ascii=False, indent=2))
+        elif args.command == "export":
+            const_raw, pl_raw = store.export_tables(args.snapshot)
+            created = store.db.execute("SELECT created FROM snapshots WHERE name = ?", (args.snapshot,)).fetchone()[0]
+            write_dataset_json(args.output, const_raw, pl_raw, generated=created or None,
+                               parties=load_party_registry(ELECTION66_DIR).to_table())
+            print(f"✓ Exported {args.snapshot}: {len(const_raw)} + {len(pl_raw)} records → {args.output}")
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
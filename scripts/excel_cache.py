@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Columnar cache for Excel worksheets
+pd.read_excel is slow; this converts each sheet once into a NumPy .npz
+(one array per column) and serves later reads from it. The cache is keyed
+by the workbook's content hash, with an mtime/size check in front so an
+unchanged workbook is not even re-hashed.
+
+Usage (scripts and notebooks):
+    from excel_cache import read_sheet
+    df = read_sheet(excel_path, 'สสแบ่งเขต')
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict
+
+import numpy as np
+import pandas as pd
+
+from parse_cache import CACHE_DIR
+
+EXCEL_CACHE_DIR = CACHE_DIR / "excel"
+
+# Bump when the on-disk layout changes
+CACHE_VERSION = 1
+
+
+def workbook_hash(path: Path) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _meta_file(path: Path) -> Path:
+    return EXCEL_CACHE_DIR / f"{path.stem}.json"
+
+
+def _load_meta(path: Path) -> Dict[str, Any]:
+    meta_file = _meta_file(path)
+    if not meta_file.exists():
+        return {}
+    try:
+        with open(meta_file, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return meta if meta.get("version") == CACHE_VERSION else {}
+
+
+def _save_meta(path: Path, meta: Dict[str, Any]):
+    EXCEL_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    meta_file = _meta_file(path)
+    tmp = meta_file.with_suffix(".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False, indent=2)
+    os.replace(tmp, meta_file)
+
+
+def current_hash(path: Path, meta: Dict[str, Any]) -> str:
+    """Workbook hash, reusing the recorded one when mtime and size are unchanged"""
+    st = os.stat(path)
+    if meta.get("mtime_ns") == st.st_mtime_ns and meta.get("size") == st.st_size:
+        return meta["hash"]
+    digest = workbook_hash(path)
+    meta.update({"mtime_ns": st.st_mtime_ns, "size": st.st_size})
+    return digest
+
+
+# ══════════════════════════════════════════════════════════════════════════
+# FRAME <-> NPZ
+# ══════════════════════════════════════════════════════════════════════════
+
+def frame_to_arrays(df: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """
+    One array per column without pickled objects: numeric columns as-is,
+    everything else as unicode with a null mask so NaN round-trips
+    """
+    arrays = {}
+    for i, name in enumerate(df.columns):
+        col = df[name]
+        if pd.api.types.is_numeric_dtype(col) or pd.api.types.is_bool_dtype(col):
+            arrays[f"c{i}"] = col.to_numpy()
+        else:
+            mask = col.isna().to_numpy()
+            arrays[f"c{i}"] = col.astype(str).where(~mask, "").to_numpy(dtype=str)
+            arrays[f"m{i}"] = mask
+    return arrays
+
+
+def arrays_to_frame(npz, columns, dtypes) -> pd.DataFrame:
+    data = {}
+    for i, name in enumerate(columns):
+        values = npz[f"c{i}"]
+        if f"m{i}" in npz:
+            col = pd.Series(values, dtype=object)
+            col[npz[f"m{i}"]] = np.nan
+            # Restore pandas' own text dtype (object on pandas < 3, str on 3+)
+            data[name] = col if dtypes[i] == "object" else col.astype(dtypes[i])
+        else:
+            data[name] = values
+    return pd.DataFrame(data, columns=list(columns))
+
+
+def read_sheet(excel_path, sheet_name: str, refresh: bool = False) -> pd.DataFrame:
+    """pd.read_excel(excel_path, sheet_name=...) served from the columnar cache"""
+    path = Path(excel_path)
+    meta = _load_meta(path)
+    digest = current_hash(path, meta)
+
+    if meta.get("hash") != digest:
+        meta = {"version": CACHE_VERSION, "mtime_ns": meta.get("mtime_ns"),
+                "size": meta.get("size"), "hash": digest, "sheets": {}}
+
+    sheet = meta.setdefault("sheets", {}).get(sheet_name)
+    npz_path = EXCEL_CACHE_DIR / sheet["file"] if sheet else None
+
+    if not refresh and sheet and npz_path.exists():
+        if meta != _load_meta(path):
+            _save_meta(path, meta)
+        with np.load(npz_path, allow_pickle=False) as npz:
+            return arrays_to_frame(npz, sheet["columns"], sheet["dtypes"])
+
+    print(f"📄 Reading sheet '{sheet_name}' from {path.name} (caching as columns)...")
+    df = pd.read_excel(path, sheet_name=sheet_name)
+
+    EXCEL_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    sheet_index = list(meta["sheets"]).index(sheet_name) if sheet_name in meta["sheets"] else len(meta["sheets"])
+    npz_name = f"{path.stem}.{digest[:12]}.{sheet_index}.npz"
+    tmp = EXCEL_CACHE_DIR / (npz_name + ".tmp.npz")
+    np.savez(tmp, **frame_to_arrays(df))
+    os.replace(tmp, EXCEL_CACHE_DIR / npz_name)
+
+    meta["sheets"][sheet_name] = {
+        "file": npz_name,
+        "columns": [str(c) for c in df.columns],
+        "dtypes": [str(t) for t in df.dtypes],
+    }
+    meta["hash"] = digest
+    _save_meta(path, meta)
+    _prune(path, meta)
+    return df
+
+
+def _prune(path: Path, meta: Dict[str, Any]):
+    """Remove .npz files from older versions of this workbook"""
+    keep = {s["file"] for s in meta.get("sheets", {}).values()}
+    for f in EXCEL_CACHE_DIR.glob(f"{path.stem}.*.npz"):
+        if f.name not in keep:
+            f.unlink()
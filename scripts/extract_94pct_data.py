@@ -1,81 +1,119 @@
+import argparse
 import pandas as pd
 import json
 from datetime import datetime
 from pathlib import Path
 
-def extract_data():
-    excel_path = '/home/ronnie-rattan/Documents/GitHub/th-election69-visualization/data/election69/ElectionData-Analysis-Public-Transfer-unofficial94percent.xlsx'
-    
+from artifacts import write_dataset_json
+from excel_cache import read_sheet
+from party_registry import UNKNOWN, load_party_registry
+import run_report
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+EXCEL_PATH = DATA_DIR / "election69" / "ElectionData-Analysis-Public-Transfer-unofficial94percent.xlsx"
+OUTPUT_FILE = DATA_DIR / "election69_94pct.js"
+
+KEY_COLS = ['จังหวัด', 'เขตเลือกตั้งที่']
+RANK_COL = 'ลำดับคะแนน'
+VOTES_COL = 'คะแนนเสียง'
+
+def _int_col(frame, name):
+    """Integer column, or zeros if the sheet does not have it"""
+    if name not in frame.columns:
+        return pd.Series(0, index=frame.index, dtype='int64')
+    return pd.to_numeric(frame[name], errors='coerce').fillna(0).astype('int64')
+
+def summarise_sheet(df, party_col):
+    """
+    One record per (province, constituency) from candidate-level rows.
+    Rank 1 and rank 2 rows are pivoted side by side with whole-frame
+    operations; ballot totals come from the rank 1 row.
+    """
+    keyed = df.dropna(subset=KEY_COLS)
+    run_report.drop("workbook rows without province / constituency", [f"row {i + 2}" for i in df.index.difference(keyed.index)])
+    df = keyed
+    # First row per (constituency, rank), as the per-group .iloc[0] did
+    ranked = df.drop_duplicates(subset=KEY_COLS + [RANK_COL], keep='first')
+
+    winners = ranked[ranked[RANK_COL] == 1].set_index(KEY_COLS)
+    runners = ranked[ranked[RANK_COL] == 2].set_index(KEY_COLS)
+
+    out = pd.DataFrame(index=winners.index)
+    out['voters'] = _int_col(winners, 'ผู้มาใช้สิทธิ์')
+    out['valid'] = _int_col(winners, 'บัตรดี')
+    out['invalid'] = _int_col(winners, 'บัตรเสีย')
+    out['blank'] = _int_col(winners, 'บัตรไม่เลือกผู้ใด')
+    out['winner_votes'] = _int_col(winners, VOTES_COL)
+    out['winner_party'] = winners[party_col].astype(str) if party_col in winners.columns else 'Unknown'
+
+    has_runner = out.index.isin(runners.index)
+    out['runnerup_votes'] = _int_col(runners, VOTES_COL).reindex(out.index).fillna(0).astype('int64')
+    runner_party = runners[party_col].astype(str) if party_col in runners.columns else pd.Series('Unknown', index=runners.index)
+    out['runnerup_party'] = runner_party.reindex(out.index).fillna('Unknown')
+    # Party names as (canonical spelling, registry pid) where the match is confident
+    parties = load_party_registry().resolve(pd.unique(out[['winner_party', 'runnerup_party']].values.ravel()),
+                                            "workbook party")
+    for c in ('winner', 'runnerup'):
+        resolved = out[f'{c}_party'].map(lambda p: parties.get(p, (p, UNKNOWN)))
+        out[f'{c}_party'] = resolved.str[0]
+        out[f'{c}_pid'] = resolved.str[1].astype('int64')
+    out['margin'] = (out['winner_votes'] - out['runnerup_votes']).where(has_runner, 0)
+
+    voters = out['voters']
+    out['percent_invalid'] = (out['invalid'].astype(float) / voters.where(voters > 0) * 100).fillna(0.0)
+    out = out.sort_index()
+
+    prov = out.index.get_level_values(0).astype(str).tolist()
+    cons = out.index.get_level_values(1).astype('int64').tolist()
+    cols = {c: out[c].tolist() for c in out.columns}
+    return [
+        {
+            "province_thai": prov[i],
+            "cons_no": cons[i],
+            "turn_out_2569": cols['voters'][i],
+            "total_used_2569": cols['voters'][i],
+            "valid_2569": cols['valid'][i],
+            "invalid_2569": cols['invalid'][i],
+            "blank_2569": cols['blank'][i],
+            "percent_invalid_2569": cols['percent_invalid'][i],
+            "winner_party_2569": cols['winner_party'][i],
+            "winner_pid_2569": cols['winner_pid'][i],
+            "winner_votes_2569": cols['winner_votes'][i],
+            "runnerup_party_2569": cols['runnerup_party'][i],
+            "runnerup_pid_2569": cols['runnerup_pid'][i],
+            "runnerup_votes_2569": cols['runnerup_votes'][i],
+            "margin_2569": cols['margin'][i],
+        }
+        for i in range(len(out))
+    ]
+
+def load_sheet(excel_path, sheet_name, use_cache=True):
+    """Worksheet as a DataFrame, served from the columnar cache unless disabled"""
+    if use_cache:
+        return read_sheet(excel_path, sheet_name)
+    return pd.read_excel(excel_path, sheet_name=sheet_name)
+
+def extract_records(excel_path=None, use_cache=True):
+    """Read the 94% workbook (default: EXCEL_PATH, looked up at call time) and return (const_raw, pl_raw) records"""
+    excel_path = Path(excel_path or EXCEL_PATH)
     # 1. CONSTITUENCY DATA
-    df_const_full = pd.read_excel(excel_path, sheet_name='สสแบ่งเขต')
-    
-    # Group by province and constituency to get summaries
-    # Assume ลำดับคะแนน 1 is the winner
-    const_raw = []
-    for (prov, cons), group in df_const_full.groupby(['จังหวัด', 'เขตเลือกตั้งที่']):
-        winner_row = group[group['ลำดับคะแนน'] == 1].iloc[0] if not group[group['ลำดับคะแนน'] == 1].empty else None
-        runnerup_row = group[group['ลำดับคะแนน'] == 2].iloc[0] if len(group) > 1 else None
-        
-        if winner_row is not None:
-            voters = int(winner_row.get('ผู้มาใช้สิทธิ์', 0))
-            valid = int(winner_row.get('บัตรดี', 0))
-            invalid = int(winner_row.get('บัตรเสีย', 0))
-            blank = int(winner_row.get('บัตรไม่เลือกผู้ใด', 0))
-            margin = int(winner_row.get('คะแนนเสียง', 0)) - int(runnerup_row.get('คะแนนเสียง', 0)) if runnerup_row is not None else 0
-            
-            const_raw.append({
-                "province_thai": str(prov),
-                "cons_no": int(cons),
-                "turn_out_2569": voters,
-                "total_used_2569": voters,
-                "valid_2569": valid,
-                "invalid_2569": invalid,
-                "blank_2569": blank,
-                "percent_invalid_2569": (float(invalid) / float(voters) * 100) if voters > 0 else 0,
-                "winner_party_2569": str(winner_row.get('พรรคที่สังกัด', 'Unknown')),
-                "winner_votes_2569": int(winner_row.get('คะแนนเสียง', 0)),
-                "runnerup_party_2569": str(runnerup_row.get('พรรคที่สังกัด', 'Unknown')) if runnerup_row is not None else "Unknown",
-                "runnerup_votes_2569": int(runnerup_row.get('คะแนนเสียง', 0)) if runnerup_row is not None else 0,
-                "margin_2569": int(margin)
-            })
-
-    # 2. PARTY LIST DATA (Simplified - assume voters/invalid same structure or similar)
-    # The 'party list' sheet may have different columns, but let's try to load it
+    df_const_full = load_sheet(excel_path, 'สสแบ่งเขต', use_cache)
+    const_raw = summarise_sheet(df_const_full, 'พรรคที่สังกัด')
+    run_report.records(inputs=len(df_const_full), outputs=len(const_raw))
+
+    # 2. PARTY LIST DATA (same layout; party column is named differently)
     try:
-        df_pl_full = pd.read_excel(excel_path, sheet_name='party list')
-        pl_raw = []
-        for (prov, cons), group in df_pl_full.groupby(['จังหวัด', 'เขตเลือกตั้งที่']):
-            # Logic similar to constituency
-            winner_row = group[group['ลำดับคะแนน'] == 1].iloc[0] if not group[group['ลำดับคะแนน'] == 1].empty else None
-            runnerup_row = group[group['ลำดับคะแนน'] == 2].iloc[0] if len(group) > 1 else None
-            
-            if winner_row is not None:
-                voters = int(winner_row.get('ผู้มาใช้สิทธิ์', 0))
-                valid = int(winner_row.get('บัตรดี', 0))
-                invalid = int(winner_row.get('บัตรเสีย', 0))
-                blank = int(winner_row.get('บัตรไม่เลือกผู้ใด', 0))
-                margin = int(winner_row.get('คะแนนเสียง', 0)) - int(runnerup_row.get('คะแนนเสียง', 0)) if runnerup_row is not None else 0
-                
-                pl_raw.append({
-                    "province_thai": str(prov),
-                    "cons_no": int(cons),
-                    "turn_out_2569": voters,
-                    "total_used_2569": voters,
-                    "valid_2569": valid,
-                    "invalid_2569": invalid,
-                    "blank_2569": blank,
-                    "percent_invalid_2569": (float(invalid) / float(voters) * 100) if voters > 0 else 0,
-                    "winner_party_2569": str(winner_row.get('พรรคการเมือง', 'Unknown')),
-                    "winner_votes_2569": int(winner_row.get('คะแนนเสียง', 0)),
-                    "runnerup_party_2569": str(runnerup_row.get('พรรคการเมือง', 'Unknown')) if runnerup_row is not None else "Unknown",
-                    "runnerup_votes_2569": int(runnerup_row.get('คะแนนเสียง', 0)) if runnerup_row is not None else 0,
-                    "margin_2569": int(margin)
-                })
+        df_pl_full = load_sheet(excel_path, 'party list', use_cache)
+        pl_raw = summarise_sheet(df_pl_full, 'พรรคการเมือง')
+        run_report.records(inputs=len(df_pl_full), outputs=len(pl_raw))
     except Exception as e:
-        print(f"Party list extraction failed: {e}. Using empty/const fallback.")
+        run_report.warn(f"Party list extraction failed ({type(e).__name__}: {e}); party-list records left empty")
         pl_raw = []
 
-    # OUTPUT TO JS
+    return const_raw, pl_raw
+
+def write_94pct(const_raw, pl_raw):
+    """Write the raw 94% records as JS + JSON artifacts"""
     timestamp_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     const_json = json.dumps(const_raw, ensure_ascii=False, indent=2)
     pl_json = json.dumps(pl_raw, ensure_ascii=False, indent=2)
@@ -88,10 +126,21 @@ var PARTYLIST_RAW = {pl_json};
 """
     
     # Write directly to data/ (no versioning needed for 94pct)
-    out_path = Path('../data/election69_94pct.js')
+    out_path = OUTPUT_FILE
     with open(out_path, 'w', encoding='utf-8') as f:
         f.write(js_content)
     print(f"✓ Created {out_path}")
 
+    write_dataset_json(out_path.with_suffix('.json'), const_raw, pl_raw)
+    print(f"✓ Created {out_path.with_suffix('.json')}")
+
+def extract_data(use_cache=True):
+    const_raw, pl_raw = extract_records(use_cache=use_cache)
+    write_94pct(const_raw, pl_raw)
+    return const_raw, pl_raw
+
 if __name__ == "__main__":
-    extract_data()
+    parser = argparse.ArgumentParser(description="Extract the unofficial 94% workbook into election69_94pct.js")
+    parser.add_argument("--no-cache", action="store_true", help="Re-read the workbook with pandas instead of the columnar cache")
+    args = parser.parse_args()
+    extract_data(use_cache=not args.no_cache)
@@ -11,16 +11,26 @@ Endpoints discovered from index-87630a5f.js:
   - /data/stats/stats_party.json        → party list vote stats
   - /data/excel/2566_election_result.xlsx → full results as Excel (bulk download)
 
-Run: python fetch_ect_data.py
+Endpoints are fetched concurrently with conditional requests against a local
+response cache (see http_cache.py): unchanged endpoints cost a 304 and the
+outputs are only rewritten when something changed. New responses are cached
+only once the outputs built from them are written, so a failed build is
+retried on the next run instead of being skipped as unchanged.
+
+Run: python fetch_ect_data.py [--base-url URL] [--poll SECONDS]
 Output: ect_mp_votes.csv, ect_mp_votes.json
 """
 
-import requests
+import argparse
+import asyncio
 import json
 import csv
 import os
 
-BASE_URL = "https://ectreport66.ect.go.th"
+from http_cache import AsyncFetcher, HTTP_CACHE_DIR
+
+# Override with --base-url or ECT_BASE_URL (e.g. a local stand-in server)
+BASE_URL = os.environ.get("ECT_BASE_URL", "https://ectreport66.ect.go.th")
 
 ENDPOINTS = {
     "province":      "/data/refs/info_province.json",
@@ -29,51 +39,42 @@ ENDPOINTS = {
     "stats_cons":    "/data/stats/stats_cons.json",
 }
 
-EXCEL_URL = BASE_URL + "/data/excel/2566_election_result.xlsx"
+EXCEL_PATH = "/data/excel/2566_election_result.xlsx"
 
-session = requests.Session()
-session.headers.update({
-    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36",
-    "Accept": "application/json, text/plain, */*",
-    "Accept-Language": "th-TH,th;q=0.9,en-US;q=0.8,en;q=0.7",
-    "Referer": "https://ectreport66.ect.go.th/",
-    "Origin": "https://ectreport66.ect.go.th",
-})
 
+def request_headers(base_url):
+    return {
+        "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36",
+        "Accept": "application/json, text/plain, */*",
+        "Accept-Language": "th-TH,th;q=0.9,en-US;q=0.8,en;q=0.7",
+        "Referer": base_url.rstrip("/") + "/",
+        "Origin": base_url.rstrip("/"),
+    }
 
-def fetch(key, path):
-    url = BASE_URL + path
-    print(f"Fetching {key} from {url} ...")
-    r = session.get(url, timeout=30)
-    r.raise_for_status()
-    return r.json()
 
+async def fetch(fetcher):
+    """Fetch all endpoints; returns ({key: parsed JSON}, [changed keys])"""
+    results = await fetcher.fetch_all(ENDPOINTS)
+    for key, res in results.items():
+        print(f"{'📥' if res.changed else '✓'} {key}: {res.url} "
+              f"({'304 not modified' if res.status == 304 else f'{len(res.body):,} bytes'})")
+    return {k: r.json() for k, r in results.items()}, [k for k, r in results.items() if r.changed]
 
-def main():
-    # ── Fetch all reference data ─────────────────────────────────────────────
-    data = {k: fetch(k, v) for k, v in ENDPOINTS.items()}
 
+def build_outputs(data, verbose=True):
     # ── Build lookup dictionaries ────────────────────────────────────────────
     # Province: province_id → province_name (Thai + Eng if available)
     province_map = {}
     for p in data["province"]:
         province_map[p["province_id"]] = p.get("province_name", p.get("name_th", ""))
 
-    # Constituency: constituency_id / zone_id → metadata
-    # Print first item to understand schema
-    print("\n── Sample constituency record ──")
-    if data["constituency"]:
-        print(json.dumps(data["constituency"][0], ensure_ascii=False, indent=2))
-
-    # MP candidate: candidate_id → candidate info
-    print("\n── Sample MP candidate record ──")
-    if data["mp_candidate"]:
-        print(json.dumps(data["mp_candidate"][0], ensure_ascii=False, indent=2))
-
-    # Stats cons: constituency-level vote summary
-    print("\n── Sample stats_cons record ──")
-    if data["stats_cons"]:
-        print(json.dumps(data["stats_cons"][0], ensure_ascii=False, indent=2))
+    # Print first items to understand the schemas
+    if verbose:
+        for key, label in (("constituency", "constituency"), ("mp_candidate", "MP candidate"),
+                           ("stats_cons", "stats_cons")):
+            print(f"\n── Sample {label} record ──")
+            if data[key]:
+                print(json.dumps(data[key][0], ensure_ascii=False, indent=2))
 
     # ── Build constituency lookup ────────────────────────────────────────────
     cons_map = {}
@@ -127,20 +128,75 @@ def main():
     # ── Write CSV ────────────────────────────────────────────────────────────
     if rows:
         csv_path = "../data/ect_mp_votes.csv"
-        with open(csv_path, "w", newline="", encoding="utf-8-sig") as f:
+        with open(csv_path + ".tmp", "w", newline="", encoding="utf-8-sig") as f:
             writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
             writer.writeheader()
             writer.writerows(rows)
+        os.replace(csv_path + ".tmp", csv_path)
         print(f"Saved: {csv_path}")
 
     # ── Write JSON ───────────────────────────────────────────────────────────
     json_path = "../data/ect_mp_votes.json"
-    with open(json_path, "w", encoding="utf-8") as f:
+    with open(json_path + ".tmp", "w", encoding="utf-8") as f:
         json.dump(rows, f, ensure_ascii=False, indent=2)
+    os.replace(json_path + ".tmp", json_path)
     print(f"Saved: {json_path}")
 
+
+async def run(args):
+    fetcher = AsyncFetcher(
+        args.base_url,
+        headers=request_headers(args.base_url),
+        concurrency=args.concurrency,
+        retries=args.retries,
+        cache_dir=None if args.no_cache else HTTP_CACHE_DIR,
+        defer_store=True,
+    )
+    try:
+        data, changed = await fetch(fetcher)
+        if changed or args.force:
+            build_outputs(data)
+        else:
+            print("⏭ No endpoint changed, outputs left as they are")
+        fetcher.commit()
+
+        # Live counting: keep polling, rebuilding only when an endpoint changes
+        while args.poll:
+            await asyncio.sleep(args.poll)
+            try:
+                data, changed = await fetch(fetcher)
+            except Exception as e:
+                print(f"⚠️  Poll failed: {e}")
+                continue
+            if changed:
+                print(f"🔄 Changed: {', '.join(changed)}")
+                build_outputs(data, verbose=False)
+            fetcher.commit()
+    finally:
+        fetcher.close()
+        st = fetcher.stats
+        print(f"\n{st['requests']} requests, {st['not_modified']} not modified, "
+              f"{st['downloaded']} downloaded ({st['bytes']:,} bytes on the wire), {st['retries']} retries")
+
     # ── Optional: also download the bulk Excel ───────────────────────────────
-    print(f"\nTo download the full Excel file:\n  curl -L '{EXCEL_URL}' -o ../data/2566_election_result.xlsx")
+    excel_url = args.base_url.rstrip("/") + EXCEL_PATH
+    print(f"\nTo download the full Excel file:\n  curl -L '{excel_url}' -o ../data/2566_election_result.xlsx")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fetch ECT 2566 MP vote data")
+    parser.add_argument("--base-url", default=BASE_URL, help=f"ECT report origin (default: {BASE_URL}, env ECT_BASE_URL)")
+    parser.add_argument("--concurrency", type=int, default=4, help="Max parallel connections (default: 4)")
+    parser.add_argument("--retries", type=int, default=3, help="Retries per request on errors / 429 / 5xx (default: 3)")
+    parser.add_argument("--poll", type=float, default=0, metavar="SECONDS",
+                        help="Keep polling every SECONDS, rebuilding outputs when an endpoint changes")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore the local response cache")
+    parser.add_argument("--force", action="store_true", help="Rebuild outputs even if nothing changed")
+    args = parser.parse_args()
+    try:
+        asyncio.run(run(args))
+    except KeyboardInterrupt:
+        print("\n✓ Stopped")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Concurrent, conditional HTTP fetcher with an on-disk response cache
+Responses are stored under .cache/http/ with their ETag / Last-Modified
+validators; the next request for the same URL sends If-None-Match /
+If-Modified-Since, so an unchanged endpoint costs a 304 with no body and no
+re-parse. Requests run on a bounded pool of keep-alive connections with
+retries and exponential backoff. Standard library only.
+
+Usage (see fetch_ect_data.py):
+    fetcher = AsyncFetcher(base_url, headers=HEADERS, concurrency=4)
+    results = asyncio.run(fetcher.fetch_all({"stats": "/data/stats/stats_cons.json"}))
+    results["stats"].changed, results["stats"].json()
+"""
+
+import asyncio
+import gzip
+import hashlib
+import http.client
+import json
+import os
+import queue
+import random
+import threading
+import time
+import zlib
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
+
+from parse_cache import CACHE_DIR
+
+HTTP_CACHE_DIR = CACHE_DIR / "http"
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _decode_body(body: bytes, encoding: Optional[str]) -> bytes:
+    encoding = (encoding or "identity").strip().lower()
+    if encoding == "gzip":
+        return gzip.decompress(body)
+    if encoding == "deflate":
+        return zlib.decompress(body)
+    return body
+
+
+def _retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After header (seconds or HTTP date) as a delay in seconds"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError, IndexError, OverflowError):
+        return None
+
+
+class FetchError(Exception):
+    """A request that still failed after all retries"""
+
+
+class FetchResult:
+    """Body of one URL plus whether it changed since the cached copy"""
+
+    # Last parsed body per URL, reused while its content hash is unchanged
+    _parsed: Dict[str, Tuple[str, Any]] = {}
+
+    def __init__(self, url: str, status: int, body: bytes, digest: str, changed: bool, from_cache: bool):
+        self.url = url
+        self.status = status
+        self.body = body
+        self.hash = digest
+        self.changed = changed
+        self.from_cache = from_cache
+
+    def json(self) -> Any:
+        """Parsed JSON body, decoded once per distinct content"""
+        hit = self._parsed.get(self.url)
+        if hit is None or hit[0] != self.hash:
+            hit = self._parsed[self.url] = (self.hash, json.loads(self.body))
+        return hit[1]
+
+
+class ResponseCache:
+    """URL -> (validators, body) on disk: <key>.json metadata + <key>.body"""
+
+    def __init__(self, root: Path = HTTP_CACHE_DIR):
+        self.root = Path(root)
+
+    def _paths(self, url: str) -> Tuple[Path, Path]:
+        key = _digest(url.encode("utf-8"))
+        return self.root / f"{key}.json", self.root / f"{key}.body"
+
+    def lookup(self, url: str) -> Optional[Dict[str, Any]]:
+        """Cached metadata for url (with the body under "body"), or None"""
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            body = body_path.read_bytes()
+        except (OSError, json.JSONDecodeError):
+            return None
+        if meta.get("url") != url or meta.get("hash") != _digest(body):
+            return None
+        meta["body"] = body
+        return meta
+
+    def store(self, url: str, body: bytes, headers: http.client.HTTPMessage) -> Dict[str, Any]:
+        meta_path, body_path = self._paths(url)
+        self.root.mkdir(parents=True, exist_ok=True)
+        meta = {
+            "url": url,
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+            "fetched": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "hash": _digest(body),
+            "bytes": len(body),
+        }
+        for path, data in ((body_path, body), (meta_path, json.dumps(meta, ensure_ascii=False).encode("utf-8"))):
+            tmp = path.with_name(path.name + ".tmp")
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        return meta
+
+
+class ConnectionPool:
+    """At most `size` keep-alive connections per host, reused across requests"""
+
+    def __init__(self, size: int, timeout: float):
+        self.size = size
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._pools: Dict[Tuple[str, str, int], "queue.LifoQueue[Optional[http.client.HTTPConnection]]"] = {}
+
+    def _pool(self, key: Tuple[str, str, int]) -> "queue.LifoQueue":
+        with self._lock:
+            if key not in self._pools:
+                q: "queue.LifoQueue" = queue.LifoQueue(self.size)
+                for _ in range(self.size):
+                    q.put(None)
+                self._pools[key] = q
+            return self._pools[key]
+
+    def request(self, url: str, headers: Dict[str, str]) -> Tuple[int, http.client.HTTPMessage, bytes]:
+        """Blocking GET; waits for a free connection slot"""
+        parts = urlsplit(url)
+        https = parts.scheme == "https"
+        key = (parts.scheme, parts.hostname or "", parts.port or (443 if https else 80))
+        target = parts.path or "/"
+        if parts.query:
+            target += "?" + parts.query
+
+        pool = self._pool(key)
+        conn = pool.get()
+        try:
+            if conn is None:
+                cls = http.client.HTTPSConnection if https else http.client.HTTPConnection
+                conn = cls(key[1], key[2], timeout=self.timeout)
+            conn.request("GET", target, headers=headers)
+            resp = conn.getresponse()
+            body = resp.read()
+            if resp.will_close:
+                conn.close()
+                conn = None
+            return resp.status, resp.headers, body
+        except Exception:
+            if conn is not None:
+                conn.close()
+            conn = None
+            raise
+        finally:
+            pool.put(conn)
+
+    def close(self):
+        with self._lock:
+            for q in self._pools.values():
+                while not q.empty():
+                    conn = q.get_nowait()
+                    if conn is not None:
+                        conn.close()
+            self._pools.clear()
+
+
+class AsyncFetcher:
+    """
+    Fetch endpoints under `base_url` concurrently, with conditional requests
+    against the response cache and retries with exponential backoff. With
+    defer_store, new responses reach the cache only on commit(), so a caller
+    whose processing of them fails gets them again (not a 304) next run
+    """
+
+    def __init__(self, base_url: str, headers: Optional[Dict[str, str]] = None, concurrency: int = 4,
+                 retries: int = 3, backoff: float = 0.5, timeout: float = 30.0,
+                 cache_dir: Optional[Path] = HTTP_CACHE_DIR, defer_store: bool = False):
+        self.base_url = base_url.rstrip("/") + "/"
+        self.headers = dict(headers or {})
+        self.retries = retries
+        self.backoff = backoff
+        self.cache = ResponseCache(cache_dir) if cache_dir else None
+        self.defer_store = defer_store
+        # url -> (body, headers) of 200s held back until commit()
+        self.pending: Dict[str, Tuple[bytes, http.client.HTTPMessage]] = {}
+        self.pool = ConnectionPool(concurrency, timeout)
+        self._slots = asyncio.Semaphore(concurrency)
+        self.stats = {"requests": 0, "not_modified": 0, "downloaded": 0, "retries": 0, "bytes": 0}
+        self._stats_lock = threading.Lock()
+
+    def url(self, path: str) -> str:
+        return urljoin(self.base_url, path.lstrip("/"))
+
+    def _count(self, **deltas: int):
+        with self._stats_lock:
+            for k, v in deltas.items():
+                self.stats[k] += v
+
+    async def fetch(self, path: str) -> FetchResult:
+        url = self.url(path)
+        cached = self.cache.lookup(url) if self.cache else None
+        headers = {**self.headers, "Accept-Encoding": "gzip"}
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        for attempt in range(self.retries + 1):
+            delay = None
+            try:
+                async with self._slots:
+                    status, resp_headers, raw = await asyncio.to_thread(self.pool.request, url, headers)
+                self._count(requests=1, bytes=len(raw))
+            except (OSError, http.client.HTTPException) as e:
+                if attempt == self.retries:
+                    raise FetchError(f"{url}: {e}") from e
+            else:
+                if status == 304 and cached:
+                    self._count(not_modified=1)
+                    return FetchResult(url, status, cached["body"], cached["hash"], False, True)
+                if status == 200:
+                    body = _decode_body(raw, resp_headers.get("Content-Encoding"))
+                    self._count(downloaded=1)
+                    digest = _digest(body)
+                    if self.cache and self.defer_store:
+                        self.pending[url] = (body, resp_headers)
+                    elif self.cache:
+                        self.cache.store(url, body, resp_headers)
+                    changed = not cached or cached["hash"] != digest
+                    return FetchResult(url, status, body, digest, changed, False)
+                if status not in RETRY_STATUS or attempt == self.retries:
+                    raise FetchError(f"{url}: HTTP {status}")
+                delay = _retry_after(resp_headers.get("Retry-After"))
+
+            if delay is None:
+                delay = self.backoff * (2 ** attempt) * (1 + random.random() / 2)
+            self._count(retries=1)
+            await asyncio.sleep(delay)
+        raise FetchError(url)
+
+    async def fetch_all(self, paths: Dict[str, str]) -> Dict[str, FetchResult]:
+        """{name: path} -> {name: FetchResult}, fetched concurrently"""
+        results = await asyncio.gather(*(self.fetch(p) for p in paths.values()))
+        return dict(zip(paths, results))
+
+    def commit(self):
+        """Store the responses held back by defer_store"""
+        for url, (body, headers) in self.pending.items():
+            self.cache.store(url, body, headers)
+        self.pending.clear()
+
+    def close(self):
+        self.pool.close()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Fuzzy resolver for OCR / workbook province and party names
+A NameIndex holds the canonical names (province names from
+th_election66_info_province.json, party names from party_registry.py) under
+a normalised spelling plus a character-bigram index. A lookup is an exact hit on the normalised text or an
+alias, or else the edit distance to the few names sharing the most bigrams.
+The confidence is 1 - distance / length. Matches below MIN_CONFIDENCE, or
+tied with a different name, are not used, so nothing is invented. Lookups are
+memoized, so resolving every row of a large input costs one dict hit per row.
+"""
+
+import re
+import unicodedata
+from collections import Counter
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+import run_report
+
+MIN_CONFIDENCE = 0.75
+# The runner-up (a different name) must score at least this much lower
+MIN_MARGIN = 0.05
+CANDIDATES = 8
+
+PROVINCE_PREFIXES = ("จังหวัด", "จ.")
+PARTY_PREFIXES = ("พรรค",)
+
+_INVISIBLE = re.compile(r"[\s\u200b\u200c\u200d\ufeff]+")
+
+
+class Match(NamedTuple):
+    name: str           # canonical name
+    value: Any          # what the name stands for (prov_id, party name, ...)
+    confidence: float   # 1.0 for an exact (normalised) or alias hit
+
+    @property
+    def exact(self) -> bool:
+        return self.confidence >= 1.0
+
+
+def normalize(text: Any, prefixes: Sequence[str] = ()) -> str:
+    """NFC, no whitespace / zero-width characters, nikhahit + sara aa as sara am, no leading prefixes"""
+    s = _INVISIBLE.sub("", unicodedata.normalize("NFC", str(text or "")))
+    s = s.replace("\u0e4d\u0e32", "\u0e33")
+    for p in prefixes:
+        if s.startswith(p) and len(s) > len(p):
+            s = s[len(p):]
+    return s
+
+
+def edit_distance(a: str, b: str) -> int:
+    """Levenshtein distance (code points)"""
+    if len(a) < len(b):
+        a, b = b, a
+    prev = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        cur = [i]
+        for j, cb in enumerate(b, 1):
+            cur.append(min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (ca != cb)))
+        prev = cur
+    return prev[-1]
+
+
+def _bigrams(s: str) -> List[str]:
+    padded = f"^{s}$"
+    return [padded[i:i + 2] for i in range(len(padded) - 1)]
+
+
+class NameIndex:
+    """Canonical names, looked up exactly, by alias or by edit distance"""
+
+    def __init__(self, names: Dict[str, Any], aliases: Optional[Dict[str, str]] = None,
+                 prefixes: Sequence[str] = (), min_confidence: float = MIN_CONFIDENCE):
+        self.values = dict(names)
+        self.prefixes = tuple(prefixes)
+        self.min_confidence = min_confidence
+        self.exact: Dict[str, str] = {}
+        for name in names:
+            self.exact.setdefault(normalize(name, self.prefixes), name)
+        # Aliases (abbreviations, old spellings) only ever match exactly
+        for alias, name in (aliases or {}).items():
+            self.exact.setdefault(normalize(alias, self.prefixes), name)
+        self.grams: Dict[str, List[str]] = {}
+        for name in names:
+            for g in set(_bigrams(normalize(name, self.prefixes))):
+                self.grams.setdefault(g, []).append(name)
+        self._memo: Dict[str, Optional[Match]] = {}
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def match(self, text: Any) -> Optional[Match]:
+        """Best canonical name for `text` with its confidence (possibly below the threshold); None if nothing is close"""
+        key = str(text or "")
+        if key not in self._memo:
+            self._memo[key] = self._match(key)
+        return self._memo[key]
+
+    def resolve(self, text: Any) -> Optional[Match]:
+        """match() when it is confident enough to use, else None"""
+        m = self.match(text)
+        return m if m is not None and m.confidence >= self.min_confidence else None
+
+    def _match(self, text: str) -> Optional[Match]:
+        q = normalize(text, self.prefixes)
+        if not q:
+            return None
+        if q in self.exact:
+            name = self.exact[q]
+            return Match(name, self.values[name], 1.0)
+
+        shared = Counter(name for g in set(_bigrams(q)) for name in self.grams.get(g, ()))
+        scored: List[Tuple[float, str]] = []
+        for name, _ in shared.most_common(CANDIDATES):
+            n = normalize(name, self.prefixes)
+            scored.append((1.0 - edit_distance(q, n) / max(len(q), len(n)), name))
+        if not scored:
+            return None
+        scored.sort(key=lambda s: -s[0])
+        best, name = scored[0]
+        runner_up = next((s for s, other in scored[1:] if self.values[other] != self.values[name]), 0.0)
+        if best - runner_up < MIN_MARGIN:
+            # Too close to call: report it, but as unusable
+            best = min(best, self.min_confidence - 0.01)
+        return Match(name, self.values[name], round(max(best, 0.0), 3))
+
+
+def resolve_names(index: NameIndex, texts: Iterable[Any], source: str) -> Dict[str, Optional[Match]]:
+    """
+    {text: usable match or None} for the distinct texts; fuzzy matches and
+    texts left unresolved are reported to the run report
+    """
+    out: Dict[str, Optional[Match]] = {}
+    fuzzy, unresolved = [], []
+    for text in dict.fromkeys(str(t) for t in texts if t is not None):
+        m = index.match(text)
+        usable = m if m is not None and m.confidence >= index.min_confidence else None
+        out[text] = usable
+        if usable is not None and not usable.exact:
+            fuzzy.append(f"{text} → {m.name} ({m.confidence:.2f})")
+        elif usable is None:
+            unresolved.append(f"{text} (best: {m.name}, {m.confidence:.2f})" if m else text)
+    if fuzzy:
+        run_report.warn(f"{len(fuzzy)} {source} names matched fuzzily", fuzzy)
+    if unresolved:
+        run_report.warn(f"{len(unresolved)} {source} names not resolved (below {index.min_confidence:.2f})",
+                        unresolved)
+    return out
+
+
+# ══════════════════════════════════════════════════════════════════════════
+# CANONICAL NAME SETS
+# ══════════════════════════════════════════════════════════════════════════
+
+def province_index(provinces: Sequence[Dict[str, Any]]) -> NameIndex:
+    """Thai province name -> prov_id, with the Thai abbreviations as aliases"""
+    names = {p["province"]: p["prov_id"] for p in provinces if p.get("province")}
+    aliases = {p["abbre_thai"]: p["province"] for p in provinces if p.get("abbre_thai") and p.get("province")}
+    aliases.setdefault("กรุงเทพฯ", next((p["province"] for p in provinces if p.get("prov_id") == "BKK"), ""))
+    return NameIndex(names, {a: n for a, n in aliases.items() if n}, prefixes=PROVINCE_PREFIXES)
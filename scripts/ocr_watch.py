@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Watch mode for live OCR ingestion
+Polls the OCR matched/constituency and matched/party_list folders; when files
+appear, change or disappear only those files are re-parsed (through the
+parse cache), and the affected constituency records are rebuilt and patched
+into election_data.js/.json and election69_ocr.js/.json, ballot_surplus
+included. Every file is replaced atomically, and an update counts as
+published once data/assets.json (which the pages resolve data through) names
+the new files. Comparisons and summary cubes for pairs involving
+election69_ocr and the SQLite store's election69_ocr snapshot are refreshed
+right after. Province shards hold only ECT 2566 results and are not touched.
+
+OCR files that cannot be parsed, or whose province and number are not a
+registered constituency, are reported and left out, at startup as while
+polling, until they change.
+
+Usage: python build_election_data.py --watch [--interval 0.25]
+"""
+
+import os
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import build_election_data
+from archive_store import record_key
+from artifacts import load_dataset
+from build_election_data import (
+    export_to_javascript, load_province_eng_mapping, parse_summary_row,
+    process_election69_to_datasets,
+)
+from constituency_registry import ConstituencyKeyError, load_registry
+from constituency_table import ConstituencyTable
+from parse_cache import CACHE_DIR, ParseCache
+from split_data import DATA_DIR, FIELDS_69, compute_surpluses, process_69, write_js
+
+OCR_DATASET = "election69_ocr"
+OCR_FIELDS = FIELDS_69 + ["ballot_surplus"]
+
+
+def scan_folder(folder: Path) -> Dict[str, Tuple[int, int]]:
+    """{path: (mtime_ns, size)} for the .json files in folder (same paths as glob)"""
+    out = {}
+    try:
+        with os.scandir(folder) as it:
+            for e in it:
+                if e.name.endswith(".json") and e.is_file():
+                    st = e.stat()
+                    out[e.path] = (st.st_mtime_ns, st.st_size)
+    except FileNotFoundError:
+        pass
+    return out
+
+
+def group_by_key(records: Iterable[Dict]) -> Dict[str, List[Dict]]:
+    out = defaultdict(list)
+    for r in records:
+        out[record_key(r)].append(r)
+    return out
+
+
+def patch_records(records: List[Dict], updates: Dict[str, List[Dict]], keys: Set[str]) -> List[Dict]:
+    """
+    Replace the records of `keys` with updates[key], in place of the first
+    old record; keys that are new are appended, keys without updates dropped
+    """
+    out, done = [], set()
+    for r in records:
+        k = record_key(r)
+        if k not in keys:
+            out.append(r)
+        elif k not in done:
+            out.extend(updates.get(k, []))
+            done.add(k)
+    for k in sorted(keys - done):
+        out.extend(updates.get(k, []))
+    return out
+
+
+class OcrWatcher:
+    """In-memory rows and outputs, patched per changed OCR file"""
+
+    def __init__(self, const_dir: Optional[Path] = None, pl_dir: Optional[Path] = None,
+                 compact: bool = False, derived: bool = True):
+        # Source paths are read at call time, so synth_data.use_sources() applies
+        self.folders = {
+            "constituency": Path(const_dir or build_election_data.ELECTION69_CONST_DIR),
+            "party_list": Path(pl_dir or build_election_data.ELECTION69_PL_DIR),
+        }
+        self.caches = {t: ParseCache(CACHE_DIR / f"ocr_{t}.json") for t in self.folders}
+        self.rows: Dict[str, Dict[str, Dict]] = {t: {} for t in self.folders}
+        # record_key of each file's row, computed when the row is read
+        self.keys: Dict[str, Dict[str, str]] = {t: {} for t in self.folders}
+        self.seen: Dict[str, Dict[str, Tuple[int, int]]] = {t: {} for t in self.folders}
+        self.compact = compact
+        self.derived = derived
+        self.prov_eng_mapping = load_province_eng_mapping()
+        self.registry = load_registry(build_election_data.ELECTION66_JSON_DIR)
+        self.const_raw: List[Dict] = []
+        self.pl_raw: List[Dict] = []
+        self.ocr_const: List[Dict] = []
+        self.ocr_pl: List[Dict] = []
+
+    def _key(self, row: Dict) -> str:
+        """record_key of the output record an OCR row becomes (province name in its canonical spelling)"""
+        m = self.registry.names.resolve(row.get("province_thai"))
+        name = self.registry.province_thai(m.value) if m else row.get("province_thai")
+        return record_key({"province_thai": name, "cons_no": row.get("cons_no")})
+
+    def _sorted_rows(self, ballot_type: str, keys: Set[str] = None) -> List[Dict]:
+        """Rows in filename order (as load_json_folder returns them), optionally only `keys`"""
+        items = sorted(self.rows[ballot_type].items())
+        if keys is None:
+            return [r for _, r in items]
+        row_keys = self.keys[ballot_type]
+        return [r for p, r in items if row_keys[p] in keys]
+
+    def _ocr_records(self, const_raw: List[Dict], pl_raw: List[Dict]) -> Tuple[List[Dict], List[Dict]]:
+        """election69_ocr records (split_data.process_69 + compute_surpluses)"""
+        const_t, pl_t = process_69(const_raw), process_69(pl_raw)
+        compute_surpluses(const_t, pl_t)
+        return const_t.to_records(), pl_t.to_records()
+
+    def _read(self, ballot_type: str, path: str) -> Optional[Dict]:
+        """The file's row, or None (reported) when it cannot be parsed yet"""
+        try:
+            return self.caches[ballot_type].get_row(path, parse_summary_row)
+        except (OSError, ValueError) as e:
+            # Usually a file still being written: retried when it changes again
+            print(f"⚠️  Skipping {Path(path).name} for now: {e}")
+            return None
+
+    def _process(self, keys: Set[str], verbose: bool = False) -> Tuple[List[Dict], List[Dict], Set[str]]:
+        """
+        process_election69_to_datasets over the rows of `keys`; keys that are
+        not registered constituencies are reported and left out until their
+        files change. Returns (const_raw, pl_raw, keys processed)
+        """
+        while keys:
+            try:
+                const_raw, pl_raw = process_election69_to_datasets(
+                    self._sorted_rows("constituency", keys), self._sorted_rows("party_list", keys),
+                    self.prov_eng_mapping, verbose=verbose)
+                return const_raw, pl_raw, keys
+            except ConstituencyKeyError as e:
+                bad = {self._key(dict(zip(("province_thai", "cons_no"), k.rsplit("_", 1)))) for k in e.keys}
+                if not keys & bad:
+                    raise
+                print(f"⚠️  {e}; left out until their files change")
+                keys = keys - bad
+        return [], [], keys
+
+    def build(self):
+        """Full build from every file (parse cache applies), then remember their stats"""
+        for t, folder in self.folders.items():
+            self.seen[t] = scan_folder(folder)
+            cache = self.caches[t]
+            rows = {p: self._read(t, p) for p in sorted(self.seen[t])}
+            self.rows[t] = {p: r for p, r in rows.items() if r is not None}
+            self.keys[t] = {p: self._key(r) for p, r in self.rows[t].items()}
+            cache.prune(list(self.seen[t]))
+            cache.save()
+            print(f"  {t}: {len(self.rows[t])} files ({cache.misses} parsed, {cache.hits} reused)")
+
+        keys = set(self.keys["constituency"].values()) | set(self.keys["party_list"].values())
+        self.const_raw, self.pl_raw, _ = self._process(keys, verbose=True)
+        self.ocr_const, self.ocr_pl = self._ocr_records(self.const_raw, self.pl_raw)
+        self.publish()
+        if self.derived:
+            self.refresh_derived()
+
+    def poll(self) -> Set[str]:
+        """Pick up new, changed and deleted files; returns the affected constituency keys"""
+        affected: Set[str] = set()
+        for t, folder in self.folders.items():
+            current = scan_folder(folder)
+            seen, rows, row_keys, cache = self.seen[t], self.rows[t], self.keys[t], self.caches[t]
+            removed = [p for p in seen if p not in current]
+            changed = sorted(p for p, st in current.items() if seen.get(p) != st)
+            if not removed and not changed:
+                continue
+
+            for p in removed:
+                del seen[p]
+                if rows.pop(p, None) is not None:
+                    affected.add(row_keys.pop(p))
+            for p in changed:
+                seen[p] = current[p]
+                row = self._read(t, p)
+                if row is None:
+                    continue
+                if p in row_keys:
+                    affected.add(row_keys[p])
+                rows[p] = row
+                row_keys[p] = self._key(row)
+                affected.add(row_keys[p])
+            if removed:
+                cache.prune(list(current), prefix=str(folder))
+            cache.save()
+        return affected
+
+    def patch(self, keys: Set[str]) -> Set[str]:
+        """
+        Rebuild the records of `keys` and patch them into every output list;
+        returns the keys patched (unregistered ones wait until their files change)
+        """
+        const_new, pl_new, keys = self._process(keys)
+        if not keys:
+            return keys
+        ocr_const_new, ocr_pl_new = self._ocr_records(const_new, pl_new)
+
+        self.const_raw = patch_records(self.const_raw, group_by_key(const_new), keys)
+        self.pl_raw = patch_records(self.pl_raw, group_by_key(pl_new), keys)
+        self.ocr_const = patch_records(self.ocr_const, group_by_key(ocr_const_new), keys)
+        self.ocr_pl = patch_records(self.ocr_pl, group_by_key(ocr_pl_new), keys)
+        return keys
+
+    def publish(self):
+        """
+        Write election_data.* and election69_ocr.* (atomic replace, fast
+        compression), then the asset manifest that points the pages at them
+        """
+        from asset_manifest import build_asset_manifest
+
+        export_to_javascript(self.const_raw, self.pl_raw, fast=True, verbose=False)
+        write_js(str(DATA_DIR / f"{OCR_DATASET}.js"),
+                 ConstituencyTable.from_records(self.ocr_const, OCR_FIELDS),
+                 ConstituencyTable.from_records(self.ocr_pl, OCR_FIELDS),
+                 compact=self.compact, fast=True)
+        build_asset_manifest()
+
+    def refresh_derived(self):
+        """
+        Comparisons and cubes for the pairs involving election69_ocr, the
+        asset manifest that lists them, and the store's election69_ocr snapshot
+        """
+        from asset_manifest import build_asset_manifest
+        from comparisons import DATASETS, build_comparisons
+        from election_store import ElectionStore
+        from summary_cube import build_cubes
+
+        datasets = {}
+        for name in DATASETS:
+            path = DATA_DIR / f"{name}.json"
+            if name == OCR_DATASET:
+                datasets[name] = (self.ocr_const, self.ocr_pl)
+            elif path.exists():
+                datasets[name] = load_dataset(path)
+        build_comparisons(datasets, touching=OCR_DATASET, fast=True)
+        build_cubes(datasets, touching=OCR_DATASET, fast=True)
+        build_asset_manifest()
+        store = ElectionStore()
+        try:
+            store.load_datasets(names=[OCR_DATASET])
+        finally:
+            store.close()
+
+    def run(self, interval: float = 0.25):
+        print(f"\n👀 Watching every {interval:g}s:")
+        for t, folder in self.folders.items():
+            print(f"  {t}: {folder}")
+        while True:
+            start = time.perf_counter()
+            keys = self.patch(self.poll())
+            if keys:
+                # Published once the manifest names the new files
+                self.publish()
+                published = time.perf_counter() - start
+                if self.derived:
+                    self.refresh_derived()
+                total = time.perf_counter() - start
+                print(f"🔄 {time.strftime('%H:%M:%S')} patched {len(keys)} constituencies "
+                      f"({', '.join(sorted(keys)[:5])}{' …' if len(keys) > 5 else ''}): "
+                      f"published in {published * 1000:.0f} ms, derived artifacts in {total * 1000:.0f} ms")
+            time.sleep(max(0.0, interval - (time.perf_counter() - start)))
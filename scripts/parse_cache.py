@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Persistent parse cache for folders of OCR result JSON files
+Each entry stores the extracted summary row for one file, keyed by path and
+validated by mtime, size and content hash, so a rebuild only re-parses files
+that are new or have changed.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+# Bump when the row extraction logic changes so stale rows are discarded
+CACHE_VERSION = 1
+
+CACHE_DIR = Path(__file__).parent.parent / ".cache"
+
+
+def file_digest(data: bytes) -> str:
+    """Content hash used to detect real changes behind a touched mtime"""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def parse_with_stat(fpath: str, parse: Callable[[bytes], Dict[str, Any]]) -> tuple:
+    """Parse one file and return (row, mtime_ns, size, hash) for storing in the cache"""
+    st = os.stat(fpath)
+    with open(fpath, 'rb') as f:
+        raw = f.read()
+    return parse(raw), st.st_mtime_ns, st.st_size, file_digest(raw)
+
+
+class ParseCache:
+    """On-disk map of file path -> {mtime_ns, size, hash, row}"""
+
+    def __init__(self, cache_file: Path):
+        self.cache_file = Path(cache_file)
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        if not self.cache_file.exists():
+            return
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                payload = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            print(f"⚠️  Ignoring unreadable parse cache: {self.cache_file}")
+            return
+        if payload.get("version") == CACHE_VERSION:
+            self.entries = payload.get("entries", {})
+
+    def lookup(self, fpath: str) -> Optional[Dict[str, Any]]:
+        """Return the cached row if fpath is unchanged, else None"""
+        st = os.stat(fpath)
+        entry = self.entries.get(fpath)
+        if not entry:
+            return None
+        if entry["mtime_ns"] == st.st_mtime_ns and entry["size"] == st.st_size:
+            self.hits += 1
+            return entry["row"]
+
+        with open(fpath, 'rb') as f:
+            digest = file_digest(f.read())
+        if entry["hash"] != digest:
+            return None
+
+        # Touched but not modified: keep the row, refresh the stat key
+        self.hits += 1
+        entry["mtime_ns"] = st.st_mtime_ns
+        entry["size"] = st.st_size
+        self._dirty = True
+        return entry["row"]
+
+    def store(self, fpath: str, row: Dict[str, Any], mtime_ns: int, size: int, digest: str):
+        """Record a freshly parsed row"""
+        self.misses += 1
+        self.entries[fpath] = {
+            "mtime_ns": mtime_ns,
+            "size": size,
+            "hash": digest,
+            "row": row,
+        }
+        self._dirty = True
+
+    def get_row(self, fpath: str, parse: Callable[[bytes], Dict[str, Any]]) -> Dict[str, Any]:
+        """Return the cached row for fpath, re-parsing only if the file changed"""
+        row = self.lookup(fpath)
+        if row is not None:
+            return row
+        row, mtime_ns, size, digest = parse_with_stat(fpath, parse)
+        self.store(fpath, row, mtime_ns, size, digest)
+        return row
+
+    def prune(self, keep: List[str], prefix: Optional[str] = None) -> int:
+        """Drop entries for files no longer present (optionally only under prefix)"""
+        keep_set = set(keep)
+        stale = [
+            p for p in self.entries
+            if p not in keep_set and (prefix is None or p.startswith(prefix))
+        ]
+        for p in stale:
+            del self.entries[p]
+        if stale:
+            self._dirty = True
+        return len(stale)
+
+    def save(self):
+        """Write the cache atomically (only if something changed)"""
+        if not self._dirty:
+            return
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.cache_file.with_suffix(self.cache_file.suffix + ".tmp")
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump({"version": CACHE_VERSION, "entries": self.entries}, f, ensure_ascii=False)
+        os.replace(tmp, self.cache_file)
+        self._dirty = False
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Canonical party registry
+Every party gets one stable integer code (`pid`): its row in the ECT 2566
+party overview (th_election66_info_party_overview.json) ordered by ECT party
+id, followed by the parties that have stood since. An entry carries the name,
+abbreviation, colour, ECT id / 2566 ballot number and aliases. Builders tag
+their records with `winner_pid` / `runnerup_pid` against it, so both elections
+share one set of codes and grouping by party is integer work. Names that do not
+resolve get UNKNOWN (-1).
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from name_resolver import PARTY_PREFIXES, NameIndex, resolve_names
+
+ELECTION66_DIR = Path(__file__).parent.parent / "data" / "election66"
+
+UNKNOWN = -1
+# Placeholders the builders write where there is no party; never looked up
+PLACEHOLDERS = ("", "Unknown", "None")
+
+# Parties on the 2569 ballot that the 2566 overview does not list. They are
+# appended after it, so the 2566 codes never move.
+ADDED_PARTIES = [
+    {"name": "ประชาชน", "abbr": "", "color": "#FF6413"},
+    {"name": "กล้าธรรม", "abbr": "", "color": "#4EC86F"},
+    {"name": "ไทรวมพลัง", "abbr": "", "color": "#5266AD"},
+    {"name": "โอกาสใหม่", "abbr": "", "color": "#c61a12"},
+]
+
+
+class PartyRegistry:
+    """Dense pid <-> party entry, plus the name index the builders resolve through"""
+
+    def __init__(self, parties: Sequence[Dict[str, Any]]):
+        self.parties = [dict(p, pid=i) for i, p in enumerate(parties)]
+        self.name = [p["name"] for p in self.parties]
+        self._by_ect = {p["ect_id"]: p["pid"] for p in self.parties if p.get("ect_id") is not None}
+        aliases = {a: p["name"] for p in self.parties for a in p.get("aliases", [])}
+        self.names = NameIndex({p["name"]: p["pid"] for p in self.parties}, aliases, prefixes=PARTY_PREFIXES)
+
+    @classmethod
+    def load(cls, election66_dir: Optional[Path] = None) -> "PartyRegistry":
+        folder = Path(election66_dir or ELECTION66_DIR)
+        with open(folder / "th_election66_info_party_overview.json", "r", encoding="utf-8-sig") as f:
+            overview = json.load(f)
+        parties = []
+        for p in sorted((p for p in overview if p.get("name")), key=lambda p: int(p["id"])):
+            parties.append({
+                "name": p["name"],
+                "abbr": p.get("abbr", ""),
+                "color": p.get("color", ""),
+                "ect_id": int(p["id"]),
+                "party_no": int(p["party_no"]) if p.get("party_no") else None,
+            })
+        known = {p["name"] for p in parties}
+        parties += [dict(p, ect_id=None, party_no=None) for p in ADDED_PARTIES if p["name"] not in known]
+        for p in parties:
+            # Abbreviations only ever match exactly
+            p["aliases"] = [p["abbr"]] if p["abbr"] else []
+        return cls(parties)
+
+    def __len__(self) -> int:
+        return len(self.parties)
+
+    def resolve(self, texts: Iterable[Any], source: str) -> Dict[str, Tuple[str, int]]:
+        """
+        {text: (canonical name, pid)} for the distinct texts. Unresolved names
+        keep their text with UNKNOWN and are reported (see resolve_names)
+        """
+        texts = [str(t) for t in texts if t is not None]
+        matches = resolve_names(self.names, [t for t in texts if t not in PLACEHOLDERS], source)
+        out = {t: (t, UNKNOWN) for t in texts}
+        out.update({t: (m.name, m.value) for t, m in matches.items() if m is not None})
+        return out
+
+    def codes(self, texts: Sequence[Any], source: str) -> np.ndarray:
+        """pid per party name, UNKNOWN where it does not resolve"""
+        resolved = self.resolve(texts, source)
+        return np.fromiter((resolved[str(t)][1] if t is not None else UNKNOWN for t in texts),
+                           dtype=np.int64, count=len(texts))
+
+    def ect_codes(self, ect_ids: Sequence[Any]) -> np.ndarray:
+        """pid per ECT party id, UNKNOWN where the overview does not list it"""
+        return np.fromiter((self._by_ect.get(_int_or(i, None), UNKNOWN) for i in ect_ids),
+                           dtype=np.int64, count=len(ect_ids))
+
+    def to_table(self) -> List[Dict[str, Any]]:
+        """The PARTIES table shipped with the datasets: one entry per pid, in pid order"""
+        fields = ("pid", "name", "abbr", "color", "ect_id", "party_no", "aliases")
+        return [{f: p.get(f) for f in fields} for p in self.parties]
+
+
+def _int_or(v: Any, default: Any) -> Any:
+    try:
+        return int(v)
+    except (TypeError, ValueError):
+        return default
+
+
+_registries: Dict[Tuple[str, int], PartyRegistry] = {}
+
+
+def load_party_registry(election66_dir: Optional[Path] = None) -> PartyRegistry:
+    """The registry of `election66_dir` (default ELECTION66_DIR), rebuilt only when the overview changes"""
+    path = Path(election66_dir or ELECTION66_DIR) / "th_election66_info_party_overview.json"
+    stamp = (str(path), path.stat().st_mtime_ns)
+    if stamp not in _registries:
+        _registries.clear()
+        _registries[stamp] = PartyRegistry.load(path.parent)
+    return _registries[stamp]
+
+
+def main():
+    registry = load_party_registry()
+    added = [p for p in registry.parties if p["ect_id"] is None]
+    print(f"✓ {len(registry)} parties ({len(registry) - len(added)} from {ELECTION66_DIR})")
+    shown = ", ".join(f"{p['name']} = {p['pid']}" for p in added)
+    print(f"  Added since 2566: {shown}")
+
+
+if __name__ == "__main__":
+    main()
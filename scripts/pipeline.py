@@ -0,0 +1,395 @@
+#!/usr/bin/env python3
+"""
+In-process data pipeline for the election visualization
+Runs build_election_data, extract_94pct_data, split_data, comparisons,
+summary_cube, province_shards, stations, election_store and asset_manifest as functions,
+handing data between stages in memory. Each stage records a fingerprint of its inputs and is skipped
+(make-style) when nothing it depends on changed. Independent stages run in
+parallel.
+
+Every run writes data/run_report.json with per-stage timings, memory and
+record counts (run_report.py); --profile adds cProfile/tracemalloc dumps.
+
+Usage: python scripts/pipeline.py [--force] [--workers N] [--archive] [--compact] [--profile]
+"""
+
+import argparse
+import contextlib
+import glob
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import build_election_data
+import extract_94pct_data
+import run_report
+from parse_cache import CACHE_DIR
+from run_report import RunReport
+
+SCRIPT_DIR = Path(__file__).parent
+DATA_DIR = SCRIPT_DIR.parent / "data"
+STATE_DIR = CACHE_DIR / "pipeline"
+STATE_FILE = STATE_DIR / "state.json"
+
+# ══════════════════════════════════════════════════════════════════════════
+# FINGERPRINTS
+# ══════════════════════════════════════════════════════════════════════════
+
+def stat_entries(paths: List[Path]) -> List[list]:
+    """(path, mtime_ns, size) for files, expanding directories to their *.json files"""
+    entries = []
+    for p in paths:
+        p = Path(p)
+        if p.is_dir():
+            files = sorted(glob.glob(os.path.join(p, "*.json")))
+        elif p.exists():
+            files = [str(p)]
+        else:
+            entries.append([str(p), None, None])
+            continue
+        for fpath in files:
+            st = os.stat(fpath)
+            entries.append([fpath, st.st_mtime_ns, st.st_size])
+    return entries
+
+
+def digest(obj: Any) -> str:
+    """Stable hash of any JSON-serialisable value"""
+    raw = json.dumps(obj, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def code_hash(modules: List[str]) -> str:
+    """Hash of stage source files so code changes also invalidate a stage"""
+    h = hashlib.blake2b(digest_size=16)
+    for name in modules:
+        with open(SCRIPT_DIR / name, "rb") as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+# ══════════════════════════════════════════════════════════════════════════
+# STAGES
+# ══════════════════════════════════════════════════════════════════════════
+
+class Stage:
+    """A pipeline step: run(inputs) -> JSON-serialisable result"""
+
+    def __init__(self, name: str, run: Callable[[Dict[str, Any]], Any],
+                 sources: List[Path], code: List[str], deps: Optional[List[str]] = None,
+                 options: Optional[Dict[str, Any]] = None, outputs: Optional[List[Path]] = None):
+        self.name = name
+        self.run = run
+        self.sources = sources
+        self.code = code
+        self.deps = deps or []
+        self.options = options or {}
+        self.outputs = outputs or []
+
+    def fingerprint(self, dep_hashes: Dict[str, str]) -> str:
+        return digest({
+            "sources": stat_entries(self.sources),
+            "code": code_hash(self.code),
+            "deps": {d: dep_hashes[d] for d in self.deps},
+            "options": self.options,
+        })
+
+    @property
+    def result_file(self) -> Path:
+        return STATE_DIR / f"{self.name}.json"
+
+
+def _run_build_ocr(inputs, workers=1, use_cache=True, archive=False):
+    const_raw, pl_raw = build_election_data.build_ocr_datasets(use_cache=use_cache, workers=workers, archive=archive)
+    return {"const": const_raw, "pl": pl_raw}
+
+
+def _run_extract_94pct(inputs):
+    # Records go straight to the split stage; writing the raw rows to
+    # election69_94pct.js here would clobber split's output when only this stage reruns
+    const_raw, pl_raw = extract_94pct_data.extract_records()
+    return {"const": const_raw, "pl": pl_raw}
+
+
+def _run_split(inputs, compact=False):
+    import split_data
+    ocr = inputs["build_ocr"]
+    pct94 = inputs["extract_94pct"]
+    datasets = split_data.split_datasets(
+        ocr["const"], ocr["pl"],
+        # split_data enriches 94% rows in place; keep the cached stage result pristine
+        [dict(r) for r in pct94["const"]], [dict(r) for r in pct94["pl"]],
+        compact=compact,
+    )
+    return {name: [len(c), len(p)] for name, (c, p) in datasets.items()}
+
+
+def file_digests(paths: List[Path]) -> Dict[str, str]:
+    """Content hash per written file, so dependent stages see content changes"""
+    out = {}
+    for p in paths:
+        with open(p, "rb") as f:
+            out[Path(p).name] = hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+    return out
+
+
+def _run_compare(inputs):
+    import comparisons
+    paths = comparisons.build_comparisons(comparisons.load_standard_datasets())
+    run_report.records(outputs=len(paths))
+    return file_digests(paths)
+
+
+def _run_cube(inputs):
+    import comparisons
+    import summary_cube
+    paths = summary_cube.build_cubes(comparisons.load_standard_datasets())
+    run_report.records(outputs=len(paths))
+    return file_digests(paths)
+
+
+def _run_shards(inputs):
+    import province_shards
+    province_shards.write_shards()
+    with open(province_shards.SHARD_DIR / "index.json", "r", encoding="utf-8") as f:
+        provinces = json.load(f)["provinces"]
+    run_report.records(outputs=len(provinces))
+    return {k: v["file"] for k, v in provinces.items()}
+
+
+def _run_stations(inputs):
+    import stations
+    paths = stations.station_files()
+    if not paths:
+        print(f"⚠️  No station CSVs in {stations.STATION_DIR}, stage left empty")
+        return {}
+    agg = stations.build_station_rollup(paths)
+    stations.write_stations(agg, source=os.path.relpath(stations.STATION_DIR, DATA_DIR.parent))
+    with open(stations.OUT_DIR / "index.json", "r", encoding="utf-8") as f:
+        index = json.load(f)
+    return {"summary": index["summary"], "provinces": {k: v["file"] for k, v in index["provinces"].items()}}
+
+
+def _run_store(inputs):
+    import election_store
+    return election_store.build_store()
+
+
+def _run_assets(inputs):
+    import asset_manifest
+    manifest = asset_manifest.build_asset_manifest()
+    return {"datasets": {k: v["hash"] for k, v in manifest["datasets"].items()}, "pairs": manifest["pairs"]}
+
+
+def build_stages(args) -> List[Stage]:
+    election66 = build_election_data.ELECTION66_JSON_DIR
+    # split's result only holds record counts, so later stages fingerprint its files
+    names = ("election66_data", "election69_ocr", "election69_94pct")
+    split_json = [DATA_DIR / f"{name}.json" for name in names]
+    # Fixed-name pair files only; the hashed copies belong to the assets stage
+    pair_files = lambda folder: [DATA_DIR / folder / f"{l}__{r}.json" for l in names for r in names]
+    return [
+        Stage(
+            "build_ocr",
+            lambda inputs: _run_build_ocr(inputs, workers=args.workers, use_cache=not args.no_cache, archive=args.archive),
+            sources=[build_election_data.ELECTION69_CONST_DIR, build_election_data.ELECTION69_PL_DIR, election66],
+            code=["build_election_data.py", "artifacts.py", "parse_cache.py", "archive_store.py",
+                  "constituency_registry.py", "name_resolver.py", "party_registry.py"],
+            options={"archive": args.archive},
+            outputs=[build_election_data.OUTPUT_FILE],
+        ),
+        Stage(
+            "extract_94pct",
+            _run_extract_94pct,
+            sources=[extract_94pct_data.EXCEL_PATH, election66],
+            code=["extract_94pct_data.py", "excel_cache.py", "artifacts.py", "name_resolver.py", "party_registry.py"],
+        ),
+        Stage(
+            "split",
+            lambda inputs: _run_split(inputs, compact=args.compact),
+            sources=[election66],
+            code=["split_data.py", "constituency_table.py", "artifacts.py",
+                  "constituency_registry.py", "name_resolver.py", "party_registry.py"],
+            deps=["build_ocr", "extract_94pct"],
+            options={"compact": args.compact},
+            outputs=[DATA_DIR / "election66_data.js", DATA_DIR / "election69_ocr.js", DATA_DIR / "election69_94pct.js"],
+        ),
+        Stage(
+            "compare",
+            _run_compare,
+            sources=split_json,
+            code=["comparisons.py", "constituency_table.py", "artifacts.py"],
+            deps=["split"],
+            outputs=pair_files("compare"),
+        ),
+        Stage(
+            "cube",
+            _run_cube,
+            sources=split_json,
+            code=["summary_cube.py", "comparisons.py", "constituency_table.py", "artifacts.py"],
+            deps=["split"],
+            outputs=pair_files("cube"),
+        ),
+        Stage(
+            "shards",
+            _run_shards,
+            # Names and regions come from the baseline dataset
+            sources=[election66, DATA_DIR / "election66_data.json"],
+            code=["province_shards.py", "asset_manifest.py", "artifacts.py"],
+            deps=["split"],
+            outputs=[DATA_DIR / "shards" / "index.json"],
+        ),
+        Stage(
+            "stations",
+            _run_stations,
+            # The folder's CSVs, listed now so added or removed files change the fingerprint
+            sources=sorted((DATA_DIR / "election69" / "stations").glob("*.csv")),
+            code=["stations.py", "asset_manifest.py", "artifacts.py"],
+            outputs=[DATA_DIR / "stations" / "index.json"],
+        ),
+        Stage(
+            "store",
+            _run_store,
+            sources=split_json + [DATA_DIR / "archives" / "manifest.json", election66],
+            code=["election_store.py", "archive_store.py", "artifacts.py",
+                  "constituency_registry.py", "name_resolver.py", "party_registry.py"],
+            deps=["split"],
+            outputs=[DATA_DIR / "election.sqlite"],
+        ),
+        Stage(
+            "assets",
+            _run_assets,
+            sources=split_json,
+            code=["asset_manifest.py", "artifacts.py"],
+            deps=["split", "compare", "cube", "shards", "stations"],
+            outputs=[DATA_DIR / "assets.json"],
+        ),
+    ]
+
+
+# ══════════════════════════════════════════════════════════════════════════
+# RUNNER
+# ══════════════════════════════════════════════════════════════════════════
+
+def load_state() -> Dict[str, Any]:
+    if not STATE_FILE.exists():
+        return {}
+    try:
+        with open(STATE_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def save_state(state: Dict[str, Any]):
+    STATE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = STATE_FILE.with_suffix(".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(state, f, ensure_ascii=False, indent=2)
+    os.replace(tmp, STATE_FILE)
+
+
+def save_result(stage: Stage, result: Any):
+    STATE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = stage.result_file.with_suffix(".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(result, f, ensure_ascii=False)
+    os.replace(tmp, stage.result_file)
+
+
+def load_result(stage: Stage) -> Any:
+    with open(stage.result_file, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def run_pipeline(stages: List[Stage], force: bool = False, max_parallel: int = 4,
+                 report: Optional[RunReport] = None) -> Dict[str, Any]:
+    """
+    Run stages in dependency order. Stages whose dependencies are all done
+    run together in a thread pool; a stage is skipped when its fingerprint
+    matches the last successful run and its outputs are unchanged since.
+    Each stage is measured in `report` (see run_report.py) when given.
+    """
+    state = load_state()
+    by_name = {s.name: s for s in stages}
+    results: Dict[str, Any] = {}
+    result_hashes: Dict[str, str] = {}
+    pending = list(stages)
+
+    def execute(stage: Stage):
+        fp = stage.fingerprint(result_hashes)
+        prev = state.get(stage.name, {})
+        # Outputs must also be untouched since the last run (nothing overwrote them)
+        fresh = (
+            not force
+            and prev.get("fingerprint") == fp
+            and stage.result_file.exists()
+            and prev.get("outputs") == stat_entries(stage.outputs)
+        )
+        if fresh:
+            print(f"⏭  {stage.name}: up to date, skipped")
+            if report:
+                report.skipped(stage.name)
+            return stage, fp, load_result(stage), True, 0.0
+
+        print(f"▶ {stage.name}: running...")
+        t0 = time.perf_counter()
+        with report.stage(stage.name) if report else contextlib.nullcontext():
+            result = stage.run({d: results[d] for d in stage.deps})
+        elapsed = time.perf_counter() - t0
+        save_result(stage, result)
+        print(f"✓ {stage.name}: done in {elapsed:.2f}s")
+        return stage, fp, result, False, elapsed
+
+    with ThreadPoolExecutor(max_workers=max_parallel) as pool:
+        while pending:
+            ready = [s for s in pending if all(d in results for d in s.deps)]
+            if not ready:
+                missing = {s.name: [d for d in s.deps if d not in by_name] for s in pending}
+                raise RuntimeError(f"Unresolvable stage dependencies: {missing}")
+            for stage, fp, result, skipped, elapsed in pool.map(execute, ready):
+                results[stage.name] = result
+                result_hashes[stage.name] = digest(result)
+                state[stage.name] = {
+                    "fingerprint": fp,
+                    "outputs": stat_entries(stage.outputs),
+                    "skipped": skipped,
+                    "seconds": round(elapsed, 3),
+                    "finished": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                }
+                pending.remove(stage)
+            save_state(state)
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Regenerate all election data files in one process")
+    parser.add_argument("--force", action="store_true", help="Run every stage even if its inputs are unchanged")
+    parser.add_argument("--archive", action="store_true", help="Save a copy of the OCR data to the archives folder")
+    parser.add_argument("--no-cache", action="store_true", help="Re-parse every OCR file instead of using the parse cache")
+    parser.add_argument("--workers", type=int, default=1, help="Parse OCR files across N worker processes (default: 1)")
+    parser.add_argument("--compact", action="store_true", help="Write JSON artifacts in the columnar format")
+    parser.add_argument("--profile", action="store_true",
+                        help="Run stages one at a time with cProfile and tracemalloc dumps per stage")
+    args = parser.parse_args()
+
+    print("🔍 Thailand Election Data Pipeline")
+    print("═" * 50)
+    report = RunReport(options=vars(args), profile=args.profile)
+    try:
+        # Profiles and traced memory peaks are per process, so profiled stages must not overlap
+        run_pipeline(build_stages(args), force=args.force, max_parallel=1 if args.profile else 4, report=report)
+    finally:
+        report.write()
+        report.print_summary()
+    print("\n✅ Pipeline complete!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Per-province shards with candidate-level 2566 results
+The dataset files only carry one summary row per constituency. The ECT 2566
+candidate and party-list rows (info_mp_candidate plus `candidates` /
+`result_party` in stats_cons) are too large to ship up front, so they are
+split into one shard per province under data/shards/, each published under a
+content-hashed name. data/shards/index.json is the light national index: party
+names and colours, plus per province its name, constituency count and shard
+file. The pages fetch a shard only when the user hovers into that province.
+
+Shard rows are arrays, with field names given once per shard:
+    candidates   candidate_fields  (rank, no, name, party_id, votes), by rank
+    party_list   party_list_fields (party_id, votes), by votes descending
+
+Usage: python province_shards.py
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from artifacts import atomic_write, encode_json, load_dataset, write_json_artifacts
+from asset_manifest import publish_file, read_index
+from constituency_registry import load_registry
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+ELECTION66_DIR = DATA_DIR / "election66"
+SHARD_DIR = DATA_DIR / "shards"
+
+CANDIDATE_FIELDS = ["rank", "no", "name", "party_id", "votes"]
+PARTY_LIST_FIELDS = ["party_id", "votes"]
+
+
+def _load(name: str) -> Any:
+    with open(ELECTION66_DIR / name, "r", encoding="utf-8-sig") as f:
+        return json.load(f)
+
+
+def _int(v: Any) -> int:
+    return int(v or 0)
+
+
+def load_sources() -> Dict[str, Any]:
+    """The ECT 2566 reference and stats files the shards are built from"""
+    return {
+        "provinces": _load("th_election66_info_province.json")["province"],
+        "constituencies": {c["cons_id"]: c for c in _load("th_election66_info_constituency.json")},
+        "candidates": {c["mp_app_id"]: c for c in _load("th_election66_info_mp_candidate.json")},
+        "parties": _load("th_election66_info_party_overview.json"),
+        "stats": _load("th_election66_stats_cons.json"),
+    }
+
+
+def constituency_shard_row(cons: Dict[str, Any], info: Dict[str, Any],
+                           candidates: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """One constituency: ballot totals plus every candidate and party-list row"""
+    cand_rows = []
+    for c in sorted(cons.get("candidates", []), key=lambda c: c.get("mp_app_rank") or 1 << 30):
+        meta = candidates.get(c["mp_app_id"], {})
+        cand_rows.append([
+            _int(c.get("mp_app_rank")),
+            _int(meta.get("mp_app_no")),
+            meta.get("mp_app_name", ""),
+            _int(c.get("party_id") or meta.get("mp_app_party_id")),
+            _int(c.get("mp_app_vote")),
+        ])
+    pl_rows = sorted(([_int(p["party_id"]), _int(p.get("party_list_vote"))] for p in cons.get("result_party", [])),
+                     key=lambda r: -r[1])
+
+    return {
+        "cons_no": int(cons["cons_id"].split("_")[1]),
+        "zone": info.get("zone", []),
+        "registered": _int(info.get("registered_vote")),
+        "constituency": {
+            "turn_out": _int(cons.get("turn_out")),
+            "valid": _int(cons.get("valid_votes")),
+            "invalid": _int(cons.get("invalid_votes")),
+            "blank": _int(cons.get("blank_votes")),
+        },
+        "partylist": {
+            "turn_out": _int(cons.get("party_list_turn_out")),
+            "valid": _int(cons.get("party_list_valid_votes")),
+            "invalid": _int(cons.get("party_list_invalid_votes")),
+            "blank": _int(cons.get("party_list_blank_votes")),
+        },
+        "candidates": cand_rows,
+        "party_list": pl_rows,
+    }
+
+
+def build_shards(sources: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]:
+    """(index without file entries, {prov_id: shard payload})"""
+    # Province names and regions as the dataset files spell them
+    meta: Dict[str, Dict[str, str]] = {}
+    baseline = DATA_DIR / "election66_data.json"
+    if baseline.exists():
+        for r in load_dataset(baseline)[0]:
+            meta.setdefault(r.get("prov_id", ""), {
+                "province_thai": r.get("province_thai", ""),
+                "province_eng": r.get("province_eng", ""),
+                "region": r.get("region", ""),
+            })
+
+    registry = load_registry(ELECTION66_DIR)
+    stats_by_prov = {p["prov_id"]: p for p in sources["stats"].get("result_province", []) if p.get("prov_id")}
+    shards, provinces = {}, {}
+    for p in sources["provinces"]:
+        prov_id = p["prov_id"]
+        stats = stats_by_prov.get(prov_id)
+        if stats is None:
+            continue
+        m = meta.get(prov_id, {})
+        names = {
+            "province_thai": m.get("province_thai") or p.get("province", ""),
+            "province_eng": m.get("province_eng") or p.get("eng", "").title(),
+            "region": m.get("region", ""),
+        }
+        rows = [constituency_shard_row(c, sources["constituencies"].get(c["cons_id"], {}), sources["candidates"])
+                for c in stats.get("constituencies", [])]
+        cids = registry.ids([prov_id] * len(rows), [r["cons_no"] for r in rows], "ECT 2566 stats")
+        rows = sorted(({"cid": cid, **r} for cid, r in zip(cids.tolist(), rows)), key=lambda r: r["cons_no"])
+        shards[prov_id] = {
+            "prov_id": prov_id,
+            **names,
+            "candidate_fields": CANDIDATE_FIELDS,
+            "party_list_fields": PARTY_LIST_FIELDS,
+            "constituencies": rows,
+        }
+        provinces[prov_id] = {**names, "constituencies": len(rows), "registered": _int(p.get("total_registered_vote"))}
+
+    index = {
+        "source": "ECT 2566 (data/election66)",
+        "last_update": sources["stats"].get("last_update"),
+        "parties": {
+            str(int(pt["id"])): {"name": pt.get("name", ""), "abbr": pt.get("abbr", ""), "color": pt.get("color", "")}
+            for pt in sources["parties"]
+        },
+        "provinces": provinces,
+    }
+    return index, shards
+
+
+def write_shards(out_dir: Path = SHARD_DIR) -> List[Path]:
+    """Write every province shard (published under hashed names) and index.json"""
+    index, shards = build_shards(load_sources())
+    out_dir.mkdir(parents=True, exist_ok=True)
+    root = out_dir.parent.parent
+    # The previous index's shards stay fetchable until pages pick up the new one
+    previous = read_index(out_dir / "index.json").get("provinces", {})
+    kept = {Path(p["file"]).name for p in previous.values() if p.get("file")}
+
+    written = []
+    for prov_id, payload in shards.items():
+        path = out_dir / f"{prov_id}.json"
+        fixed = write_json_artifacts(path, payload)
+        entry = publish_file(path, root, previous.get(prov_id, {}).get("file"))
+        index["provinces"][prov_id].update(file=entry["file"], bytes=entry["bytes"])
+        written.append(root / entry["file"])
+        # Shards are only ever fetched through the index, so only the hashed copy is kept
+        for p in fixed:
+            p.unlink()
+
+    # Provinces that no longer exist
+    for path in out_dir.glob("*.json*"):
+        base = path.name.split(".")[0]
+        if base != "index" and base not in shards and path.name.split(".json")[0] + ".json" not in kept:
+            path.unlink()
+
+    index_path = out_dir / "index.json"
+    atomic_write(index_path, encode_json(index))
+    written.append(index_path)
+
+    total = sum(p["bytes"] for p in index["provinces"].values())
+    print(f"✓ Wrote {len(shards)} province shards ({total:,} bytes) + index → {out_dir}")
+    return written
+
+
+if __name__ == "__main__":
+    write_shards()
@@ -6,7 +6,7 @@
 #   data/election69_ocr.js
 #   data/election69_94pct.js
 #
-# Usage: bash scripts/regenerate_data.sh
+# Usage: bash scripts/regenerate_data.sh [--force] [--workers N] [--archive]
 #        (Run from the project root)
 # ============================================================
 
@@ -21,22 +21,14 @@ echo "║   Thailand Election Data Regeneration Script     ║"
 echo "╚══════════════════════════════════════════════════╝"
 echo ""
 
-# ── Step 1: Build election66_data.js and election69_ocr.js ──
-echo "▶ Step 1/3: Building election66_data.js + election69_ocr.js..."
+# ── Run all stages in one process ───────────────────────
+# pipeline.py runs build_election_data → extract_94pct_data → split_data as
+# in-process stages, skipping any stage whose inputs are unchanged and running
+# the OCR build and the 94% extraction in parallel. Extra arguments
+# (e.g. --force, --workers 8, --archive) are passed through.
+echo "▶ Running pipeline (build → extract 94% → split)..."
 cd "$SCRIPT_DIR"
-python build_election_data.py
-echo "✓ Done."
-echo ""
-
-# ── Step 2: Build election69_94pct.js from Excel ────────────
-echo "▶ Step 2/3: Extracting 94% unofficial data → data/election69_94pct.js..."
-python extract_94pct_data.py
-echo "✓ Done."
-echo ""
-
-# ── Step 3: Run split_data.py to finalise all split files ───
-echo "▶ Step 3/3: Running split_data.py to generate final split files..."
-python split_data.py
+python pipeline.py "$@"
 echo "✓ Done."
 echo ""
 
@@ -53,5 +45,5 @@ TIMESTAMP=$(date "+%Y-%m-%d %H:%M:%S %Z")
 echo "  Timestamp: $TIMESTAMP"
 echo "════════════════════════════════════════════════"
 echo ""
-echo "To preview: python -m http.server (from project root)"
+echo "To preview: python scripts/serve.py (from project root)"
 echo ""
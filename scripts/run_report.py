@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Structured run report for the data pipeline
+Every stage runs inside `RunReport.stage(name)`, which records its wall time,
+CPU time (of the stage's thread), the process peak RSS and the record counts
+and warnings reported from inside it. Code anywhere below a stage calls
+`records(...)`, `drop(...)` and `warn(...)`; they attach to the stage running in
+the current context and only print outside a report, so the builders still
+work on their own.
+
+With profile=True the stages run one at a time, and each also gets its traced
+Python heap peak, a cProfile dump (<stage>.prof plus a <stage>.txt top list)
+and the largest allocations still live at its end (<stage>.mem.txt) under
+.cache/pipeline/profile/<run>/.
+
+The report is written to data/run_report.json. A skipped stage keeps the
+measurements of the run that last executed it, marked with that run's id, so
+a no-op rerun does not lose them.
+"""
+
+import contextlib
+import contextvars
+import cProfile
+import io
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from parse_cache import CACHE_DIR
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+REPORT_FILE = DATA_DIR / "run_report.json"
+PROFILE_DIR = CACHE_DIR / "pipeline" / "profile"
+MAX_EXAMPLES = 10
+
+_current: contextvars.ContextVar = contextvars.ContextVar("run_report_stage", default=None)
+
+
+def _rss_peak_mb() -> Optional[float]:
+    """Peak resident set size of this process so far"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return round(peak / (2**20 if sys.platform == "darwin" else 2**10), 1)
+
+
+# ══════════════════════════════════════════════════════════════════════════
+# REPORTING FROM INSIDE A STAGE
+# ══════════════════════════════════════════════════════════════════════════
+
+def records(inputs: int = 0, outputs: int = 0, **counts: int):
+    """Add to the current stage's input / output record counts (and any named counts)"""
+    entry = _current.get()
+    if entry is None:
+        return
+    with entry["lock"]:
+        entry["records"]["in"] += inputs
+        entry["records"]["out"] += outputs
+        for name, n in counts.items():
+            entry["counts"][name] = entry["counts"].get(name, 0) + n
+
+
+def drop(reason: str, keys: Iterable[Any]):
+    """Records the current stage left out, with up to MAX_EXAMPLES example keys"""
+    keys = list(keys)
+    if not keys:
+        return
+    entry = _current.get()
+    if entry is None:
+        print(f"⚠️  Dropped {len(keys)}: {reason} (e.g. {', '.join(map(str, keys[:3]))})")
+        return
+    with entry["lock"]:
+        entry["records"]["dropped"] += len(keys)
+        d = entry["drops"].setdefault(reason, {"count": 0, "examples": []})
+        d["count"] += len(keys)
+        d["examples"].extend(str(k) for k in keys[:max(0, MAX_EXAMPLES - len(d["examples"]))])
+
+
+def warn(message: str, keys: Iterable[Any] = ()):
+    """A problem the stage worked around (fallback values, guessed ids, ...)"""
+    keys = [str(k) for k in list(keys)[:MAX_EXAMPLES]]
+    print(f"⚠️  {message}" + (f" (e.g. {', '.join(keys[:3])})" if keys else ""))
+    entry = _current.get()
+    if entry is None:
+        return
+    with entry["lock"]:
+        entry["warnings"].append({"message": message, **({"examples": keys} if keys else {})})
+
+
+def bound(fn: Callable) -> Callable:
+    """fn bound to a copy of the current context, so work handed to another thread still reports to the stage"""
+    ctx = contextvars.copy_context()
+    return lambda *args, **kwargs: ctx.run(fn, *args, **kwargs)
+
+
+# ══════════════════════════════════════════════════════════════════════════
+# REPORT
+# ══════════════════════════════════════════════════════════════════════════
+
+class RunReport:
+    """Per-stage measurements of one pipeline run"""
+
+    def __init__(self, options: Optional[Dict[str, Any]] = None, profile: bool = False,
+                 path: Path = REPORT_FILE):
+        self.path = Path(path)
+        self.options = options or {}
+        self.profile = profile
+        self.started = datetime.now()
+        self.run_id = self.started.strftime("%Y%m%d-%H%M%S")
+        self.profile_dir = PROFILE_DIR / self.run_id
+        self.stages: List[Dict[str, Any]] = []
+        self._t0 = time.perf_counter()
+        self._cpu0 = time.process_time()
+        self._lock = threading.Lock()
+        self._previous = self._previous_stages()
+        if profile:
+            tracemalloc.start()
+
+    def _previous_stages(self) -> Dict[str, Dict[str, Any]]:
+        """Stage entries of the last written report, by name"""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                previous = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        run_id = previous.get("run_id")
+        return {
+            s["name"]: {**s, "from_run": s.get("from_run", run_id)}
+            for s in previous.get("stages", [])
+            if s.get("status") in ("ok", "skipped") and "wall_s" in s
+        }
+
+    def skipped(self, name: str):
+        """An up-to-date stage: keep the measurements from the run that last executed it"""
+        entry = {**self._previous.get(name, {}), "name": name, "status": "skipped"}
+        with self._lock:
+            self.stages.append(entry)
+
+    @contextlib.contextmanager
+    def stage(self, name: str):
+        """Measure the stage run inside this block; reporting calls below it attach to it"""
+        entry: Dict[str, Any] = {
+            "name": name,
+            "status": "running",
+            "records": {"in": 0, "out": 0, "dropped": 0},
+            "counts": {},
+            "drops": {},
+            "warnings": [],
+            "lock": threading.Lock(),
+        }
+        token = _current.set(entry)
+        profiler = None
+        if self.profile:
+            tracemalloc.reset_peak()
+            profiler = cProfile.Profile()
+            profiler.enable()
+        rss_before = _rss_peak_mb()
+        wall0, cpu0 = time.perf_counter(), time.thread_time()
+        try:
+            yield entry
+            entry["status"] = "ok"
+        except BaseException as e:
+            entry["status"] = "failed"
+            entry["error"] = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            entry["wall_s"] = round(time.perf_counter() - wall0, 3)
+            entry["cpu_s"] = round(time.thread_time() - cpu0, 3)
+            entry["rss_peak_mb"] = _rss_peak_mb()
+            if rss_before is not None:
+                entry["rss_growth_mb"] = round(entry["rss_peak_mb"] - rss_before, 1)
+            if profiler is not None:
+                profiler.disable()
+                entry["traced_peak_mb"] = round(tracemalloc.get_traced_memory()[1] / 2**20, 1)
+                entry["profile"] = self._dump_profile(name, profiler)
+            _current.reset(token)
+            del entry["lock"]
+            with self._lock:
+                self.stages.append(entry)
+
+    def _dump_profile(self, name: str, profiler: cProfile.Profile) -> Dict[str, str]:
+        self.profile_dir.mkdir(parents=True, exist_ok=True)
+        prof_path = self.profile_dir / f"{name}.prof"
+        profiler.dump_stats(prof_path)
+
+        text = io.StringIO()
+        pstats.Stats(profiler, stream=text).sort_stats("cumulative").print_stats(30)
+        txt_path = self.profile_dir / f"{name}.txt"
+        txt_path.write_text(text.getvalue(), encoding="utf-8")
+
+        mem_path = self.profile_dir / f"{name}.mem.txt"
+        top = tracemalloc.take_snapshot().statistics("lineno")[:30]
+        mem_path.write_text("\n".join(str(s) for s in top) + "\n", encoding="utf-8")
+        return {"cprofile": str(prof_path), "cprofile_top": str(txt_path), "tracemalloc_top": str(mem_path)}
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "run_id": self.run_id,
+            "started": self.started.strftime("%Y-%m-%d %H:%M:%S"),
+            "finished": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "wall_s": round(time.perf_counter() - self._t0, 3),
+            "cpu_s": round(time.process_time() - self._cpu0, 3),
+            "rss_peak_mb": _rss_peak_mb(),
+            "options": self.options,
+            "profile": str(self.profile_dir) if self.profile else None,
+            "stages": self.stages,
+        }
+
+    def write(self) -> Dict[str, Any]:
+        report = self.to_dict()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        os.replace(tmp, self.path)
+        return report
+
+    def print_summary(self):
+        print(f"\n📊 Run report → {self.path}")
+        print(f"  {'stage':<15} {'wall':>8} {'cpu':>8} {'peak RSS':>10} {'in':>8} {'out':>8} {'dropped':>8}")
+        for s in self.stages:
+            if s["status"] == "skipped":
+                since = f" (measured in run {s['from_run']})" if s.get("from_run") else ""
+                print(f"  {s['name']:<15} {'skipped':>8}{since}")
+                continue
+            r = s["records"]
+            rss = f"{s['rss_peak_mb']:.0f} MB" if s.get("rss_peak_mb") is not None else "-"
+            print(f"  {s['name']:<15} {s['wall_s']:>7.2f}s {s['cpu_s']:>7.2f}s {rss:>10} "
+                  f"{r['in']:>8} {r['out']:>8} {r['dropped']:>8}")
+            for reason, d in s["drops"].items():
+                print(f"    ⚠️  dropped {d['count']}: {reason}")
+            if s["warnings"]:
+                print(f"    ⚠️  {len(s['warnings'])} warning(s)")
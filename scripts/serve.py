@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+Local/production static server for the visualization pages and data/
+A drop-in replacement for `python -m http.server` that adds:
+  - strong ETags (content hash) and If-None-Match / If-Modified-Since 304s
+  - precompressed .br / .gz siblings when the client accepts them, with
+    on-the-fly gzip for other text responses
+  - Cache-Control: immutable for content-hashed filenames, revalidation otherwise
+  - single byte-range requests (206 / 416), honouring If-Range
+  - one thread per connection (ThreadingHTTPServer)
+
+Usage:
+    python scripts/serve.py                  # http://localhost:8000
+    python scripts/serve.py --port 9000 --bind 0.0.0.0
+"""
+
+import argparse
+import email.utils
+import gzip
+import hashlib
+import os
+import re
+import threading
+from collections import OrderedDict
+from functools import partial
+from http import HTTPStatus
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+ROOT = Path(__file__).parent.parent
+
+# data/election69_ocr.3f9a1c2b4d5e.json -> safe to cache forever
+HASHED_NAME = re.compile(r"\.[0-9a-f]{8,}\.")
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+
+COMPRESSIBLE = ("text/", "application/javascript", "application/json", "image/svg+xml")
+MIN_COMPRESS_BYTES = 1024
+PRECOMPRESSED = (("br", ".br"), ("gzip", ".gz"))
+
+
+def accepted_encodings(header: Optional[str]) -> Dict[str, float]:
+    """Accept-Encoding as {coding: q}"""
+    out = {}
+    for part in (header or "").split(","):
+        coding, _, params = part.strip().partition(";")
+        if not coding:
+            continue
+        q = 1.0
+        m = re.search(r"q=([0-9.]+)", params)
+        if m:
+            try:
+                q = float(m.group(1))
+            except ValueError:
+                q = 0.0
+        out[coding.strip().lower()] = q
+    return out
+
+
+def parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    Inclusive (start, end) for a single `bytes=` range, None when the header
+    is not one we serve (then the full body is sent), or (-1, -1) when the
+    range cannot be satisfied
+    """
+    m = re.fullmatch(r"\s*bytes=(\d*)-(\d*)\s*", header or "")
+    if not m or (m.group(1) == "" and m.group(2) == ""):
+        return None
+    start_s, end_s = m.groups()
+    if start_s == "":
+        length = int(end_s)
+        if length == 0:
+            return -1, -1
+        return max(0, size - length), size - 1
+    start = int(start_s)
+    end = min(int(end_s), size - 1) if end_s else size - 1
+    if start >= size or start > end:
+        return -1, -1
+    return start, end
+
+
+def representation_tag(etag: str, coding: Optional[str]) -> str:
+    """Strong ETags must differ per representation: "<hash>-br" / "<hash>-gzip" for encoded bodies"""
+    return f'{etag[:-1]}-{coding}"' if coding else etag
+
+
+class ETagCache:
+    """Content hash per file, recomputed only when (mtime, size) changes"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Tuple[int, int, str]] = {}
+
+    def etag(self, path: str, st: os.stat_result) -> str:
+        with self._lock:
+            hit = self._entries.get(path)
+        if hit and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+            return hit[2]
+        h = hashlib.blake2b(digest_size=16)
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                h.update(block)
+        tag = f'"{h.hexdigest()}"'
+        with self._lock:
+            self._entries[path] = (st.st_mtime_ns, st.st_size, tag)
+        return tag
+
+
+class GzipCache:
+    """Small LRU of gzip bodies for responses without a precompressed sibling"""
+
+    def __init__(self, max_bytes: int = 64 << 20):
+        self._lock = threading.Lock()
+        self._items: "OrderedDict[str, bytes]" = OrderedDict()
+        self._bytes = 0
+        self.max_bytes = max_bytes
+
+    def get(self, etag: str, path: str) -> bytes:
+        with self._lock:
+            if etag in self._items:
+                self._items.move_to_end(etag)
+                return self._items[etag]
+        with open(path, "rb") as f:
+            body = gzip.compress(f.read(), compresslevel=6, mtime=0)
+        with self._lock:
+            self._items[etag] = body
+            self._bytes += len(body)
+            while self._bytes > self.max_bytes and len(self._items) > 1:
+                _, old = self._items.popitem(last=False)
+                self._bytes -= len(old)
+        return body
+
+
+class DataRequestHandler(SimpleHTTPRequestHandler):
+    """SimpleHTTPRequestHandler with caching, compression and range support"""
+
+    protocol_version = "HTTP/1.1"
+    etags = ETagCache()
+    gzip_cache = GzipCache()
+
+    extensions_map = {
+        **SimpleHTTPRequestHandler.extensions_map,
+        ".js": "application/javascript",
+        ".json": "application/json",
+        ".ipynb": "application/json",
+    }
+
+    def end_headers(self):
+        self.send_header("X-Content-Type-Options", "nosniff")
+        super().end_headers()
+
+    def do_GET(self):
+        self._serve(head_only=False)
+
+    def do_HEAD(self):
+        self._serve(head_only=True)
+
+    # ── Helpers ─────────────────────────────────────────────────────────
+
+    def _hidden(self, path: str) -> bool:
+        rel = os.path.relpath(path, self.directory)
+        return rel.startswith("..") or any(p.startswith(".") for p in Path(rel).parts)
+
+    def _not_modified(self, etag: str, st: os.stat_result) -> Optional[str]:
+        """
+        The matched tag when the client's copy is current ("" for a match on
+        `*` or If-Modified-Since, which name no representation), else None
+        """
+        inm = self.headers.get("If-None-Match")
+        if inm is not None:
+            for tag in (t.strip().removeprefix("W/") for t in inm.split(",")):
+                if tag == "*":
+                    return ""
+                # Representation tags ("<hash>-br") revalidate against the file's tag
+                if re.sub(r'-(br|gzip)"$', '"', tag) == etag:
+                    return tag
+            return None
+        ims = self.headers.get("If-Modified-Since")
+        if ims:
+            try:
+                since = email.utils.parsedate_to_datetime(ims).timestamp()
+            except (TypeError, ValueError, IndexError, OverflowError):
+                return None
+            return "" if int(st.st_mtime) <= since else None
+        return None
+
+    def _choose_encoding(self, path: str, ctype: str, st: os.stat_result) -> Tuple[Optional[str], Optional[str]]:
+        """
+        (Content-Encoding, precompressed file) for this request, or (None, None)
+        A sibling older than the source is stale and is not served
+        """
+        accepted = accepted_encodings(self.headers.get("Accept-Encoding"))
+        for coding, suffix in PRECOMPRESSED:
+            if accepted.get(coding, 0) <= 0:
+                continue
+            try:
+                if os.stat(path + suffix).st_mtime_ns >= st.st_mtime_ns:
+                    return coding, path + suffix
+            except OSError:
+                continue
+        if accepted.get("gzip", 0) > 0 and st.st_size >= MIN_COMPRESS_BYTES and ctype.startswith(COMPRESSIBLE):
+            return "gzip", None
+        return None, None
+
+    def _serve(self, head_only: bool):
+        path = self.translate_path(self.path)
+        if self._hidden(path):
+            self.send_error(HTTPStatus.NOT_FOUND, "File not found")
+            return
+        if os.path.isdir(path):
+            index = os.path.join(path, "index.html")
+            if not os.path.isfile(index):
+                # Directory listings and the trailing-slash redirect as before
+                f = self.send_head()
+                if f:
+                    try:
+                        if not head_only:
+                            self.copyfile(f, self.wfile)
+                    finally:
+                        f.close()
+                return
+            if not self.path.split("?", 1)[0].endswith("/"):
+                self.send_response(HTTPStatus.MOVED_PERMANENTLY)
+                self.send_header("Location", self.path.split("?", 1)[0] + "/")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            path = index
+        if not os.path.isfile(path):
+            self.send_error(HTTPStatus.NOT_FOUND, "File not found")
+            return
+
+        st = os.stat(path)
+        ctype = self.guess_type(path)
+        etag = self.etags.etag(path, st)
+        name = os.path.basename(path)
+        common = {
+            "ETag": etag,
+            "Last-Modified": self.date_time_string(int(st.st_mtime)),
+            "Cache-Control": IMMUTABLE if HASHED_NAME.search(name) else REVALIDATE,
+            "Vary": "Accept-Encoding",
+            "Accept-Ranges": "bytes",
+        }
+
+        matched = self._not_modified(etag, st)
+        if matched is not None:
+            # Echo the representation the client holds, or the one it would get now
+            common["ETag"] = matched or representation_tag(etag, self._choose_encoding(path, ctype, st)[0])
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            for k, v in common.items():
+                self.send_header(k, v)
+            self.end_headers()
+            return
+
+        # Ranges are served from the identity body only
+        rng = None
+        range_header = self.headers.get("Range")
+        if range_header:
+            if_range = self.headers.get("If-Range")
+            if if_range is None or if_range.strip() == etag:
+                rng = parse_range(range_header, st.st_size)
+        if rng == (-1, -1):
+            self.send_response(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+            for k, v in common.items():
+                self.send_header(k, v)
+            self.send_header("Content-Range", f"bytes */{st.st_size}")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        coding, variant = (None, None) if rng else self._choose_encoding(path, ctype, st)
+
+        body: Optional[bytes] = None
+        if rng:
+            start, end = rng
+            length = end - start + 1
+            self.send_response(HTTPStatus.PARTIAL_CONTENT)
+            self.send_header("Content-Range", f"bytes {start}-{end}/{st.st_size}")
+        else:
+            start = 0
+            if coding and variant is None:
+                body = self.gzip_cache.get(etag, path)
+                length = len(body)
+            else:
+                length = os.path.getsize(variant) if variant else st.st_size
+            self.send_response(HTTPStatus.OK)
+
+        self.send_header("Content-Type", ctype)
+        self.send_header("Content-Length", str(length))
+        common["ETag"] = representation_tag(etag, coding)
+        for k, v in common.items():
+            self.send_header(k, v)
+        if coding:
+            self.send_header("Content-Encoding", coding)
+        self.end_headers()
+
+        if head_only:
+            return
+        if body is not None:
+            self.wfile.write(body)
+            return
+        with open(variant or path, "rb") as f:
+            f.seek(start)
+            remaining = length
+            while remaining > 0:
+                chunk = f.read(min(1 << 16, remaining))
+                if not chunk:
+                    break
+                self.wfile.write(chunk)
+                remaining -= len(chunk)
+
+
+def make_server(root: Path = ROOT, host: str = "127.0.0.1", port: int = 8000) -> ThreadingHTTPServer:
+    """Build (but do not start) a server for `root`; port 0 picks a free port"""
+    handler = partial(DataRequestHandler, directory=str(root))
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the visualization with ETags, compression and range support")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--bind", default="127.0.0.1", help="Address to bind (default: 127.0.0.1)")
+    parser.add_argument("--root", type=Path, default=ROOT, help="Directory to serve (default: project root)")
+    args = parser.parse_args()
+
+    server = make_server(args.root, args.bind, args.port)
+    host, port = server.server_address[:2]
+    print(f"🌐 Serving {args.root.resolve()} at http://{host}:{port}/")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n✓ Stopped")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Snapshot-to-snapshot diff for archived datasets
+Answers "what changed between snapshot A and snapshot B": changed, added and
+removed constituencies, per-field deltas, winner changes and danger-zone
+transitions (the pages' ⚠ filter: invalid or blank ballots > margin).
+
+Records are compared through a keyed index (province + constituency). When
+both snapshots are deltas against the same archive keyframe only the keys
+their deltas touch are visited, so a diff costs O(changed records).
+
+Usage:
+    python snapshot_diff.py <snapshot_a> <snapshot_b> [-o diff.json]
+    python snapshot_diff.py ../data/election69_ocr.json <snapshot_b>
+"""
+
+import argparse
+import json
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional, Set
+
+from archive_store import ARCHIVE_DIR, TABLES, ArchiveStore, record_key
+from artifacts import load_dataset
+
+# Danger zone rules, as in invalid_analysis.html / blank_analysis.html
+DANGER_RULES = {
+    "invalid": lambda r: r["invalid"] > r["margin"],
+    "blank": lambda r: r["blank"] > r["margin"],
+}
+NUMERIC_FIELDS = ("turn_out", "valid", "invalid", "blank", "winner_votes", "runnerup_votes", "margin", "percent_invalid")
+
+
+def field(r: Dict[str, Any], name: str) -> Any:
+    """Plain field, falling back to the _2569-suffixed name (build_election_data output)"""
+    return r[name] if name in r else r.get(f"{name}_2569")
+
+
+def normalize(r: Dict[str, Any]) -> Dict[str, Any]:
+    """Fields the winner and danger checks need, like the pages' normalizeRecord"""
+    out = {f: field(r, f) or 0 for f in NUMERIC_FIELDS}
+    out["winner_party"] = field(r, "winner_party") or "Unknown"
+    return out
+
+
+# ══════════════════════════════════════════════════════════════════════════
+# SNAPSHOTS
+# ══════════════════════════════════════════════════════════════════════════
+
+@lru_cache(maxsize=4)
+def _keyframe_index(root: str, digest: str) -> Dict[str, Dict[str, Dict]]:
+    obj = ArchiveStore(Path(root)).read_object(digest)
+    return {t: {record_key(r): r for r in obj[t]} for t in TABLES}
+
+
+class Snapshot:
+    """Keyed view of a snapshot: a keyframe index plus an optional delta"""
+
+    def __init__(self, label: str, content_hash: Optional[str], base: Optional[str],
+                 index: Dict[str, Dict[str, Dict]], delta: Optional[Dict[str, Dict]] = None):
+        self.label = label
+        self.hash = content_hash
+        self.base = base
+        self.index = index
+        self.delta = delta or {}
+
+    def get(self, table: str, key: str) -> Optional[Dict]:
+        d = self.delta.get(table)
+        if d is None:
+            return self.index[table].get(key)
+        if key in d.get("added", {}):
+            return d["added"][key]
+        if key in d.get("removed", ()):
+            return None
+        rec = self.index[table].get(key)
+        if rec is None:
+            return None
+        if key in d.get("changed", {}) or key in d.get("unset", {}):
+            rec = dict(rec)
+            rec.update(d.get("changed", {}).get(key, {}))
+            for f in d.get("unset", {}).get(key, []):
+                rec.pop(f, None)
+        return rec
+
+    def keys(self, table: str) -> Set[str]:
+        keys = set(self.index[table])
+        d = self.delta.get(table)
+        if d is not None:
+            keys.difference_update(d.get("removed", ()))
+            keys.update(d.get("added", {}))
+        return keys
+
+    def touched(self, table: str) -> Set[str]:
+        """Keys that differ from the keyframe"""
+        d = self.delta.get(table, {})
+        return set(d.get("changed", {})) | set(d.get("unset", {})) | set(d.get("added", {})) | set(d.get("removed", ()))
+
+
+def open_snapshot(store: ArchiveStore, ref: str) -> Snapshot:
+    """Snapshot by archive id, or by dataset file path (.json / .js)"""
+    path = Path(ref)
+    if path.exists():
+        const_raw, pl_raw = load_dataset(path)
+        index = {"CONST_RAW": {record_key(r): r for r in const_raw},
+                 "PARTYLIST_RAW": {record_key(r): r for r in pl_raw}}
+        return Snapshot(ref, None, None, index)
+
+    e = store.entry(ref)
+    if "hash" not in e:
+        const_raw, pl_raw = store.load(ref)
+        index = {"CONST_RAW": {record_key(r): r for r in const_raw},
+                 "PARTYLIST_RAW": {record_key(r): r for r in pl_raw}}
+        return Snapshot(ref, None, None, index)
+
+    obj = store.read_object(e["hash"])
+    if obj["kind"] == "full":
+        return Snapshot(ref, e["hash"], e["hash"], _keyframe_index(str(store.root), e["hash"]))
+    return Snapshot(ref, e["hash"], obj["base"], _keyframe_index(str(store.root), obj["base"]), obj["tables"])
+
+
+# ══════════════════════════════════════════════════════════════════════════
+# DIFF
+# ══════════════════════════════════════════════════════════════════════════
+
+def diff_record(ra: Dict[str, Any], rb: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Field deltas and flags for one constituency, or None if unchanged"""
+    fields = {}
+    for f in dict.fromkeys(list(ra) + list(rb)):
+        va, vb = ra.get(f), rb.get(f)
+        if va == vb:
+            continue
+        change = {"a": va, "b": vb}
+        if isinstance(va, (int, float)) and isinstance(vb, (int, float)) \
+                and not isinstance(va, bool) and not isinstance(vb, bool):
+            change["delta"] = vb - va
+        fields[f] = change
+    if not fields:
+        return None
+
+    na, nb = normalize(ra), normalize(rb)
+    flags = []
+    if na["winner_party"] != nb["winner_party"]:
+        flags.append("winner_changed")
+    danger = {}
+    for name, rule in DANGER_RULES.items():
+        da, db = bool(rule(na)), bool(rule(nb))
+        danger[name] = [da, db]
+        if da != db:
+            flags.append(f"{'entered' if db else 'left'}_danger_{name}")
+
+    return {
+        "province_thai": rb.get("province_thai"),
+        "cons_no": rb.get("cons_no"),
+        "fields": fields,
+        "danger": danger,
+        "flags": flags,
+    }
+
+
+def diff_table(a: Snapshot, b: Snapshot, table: str) -> Dict[str, Any]:
+    if a.hash is not None and a.hash == b.hash:
+        candidates: Set[str] = set()
+    elif a.base is not None and a.base == b.base:
+        # Same keyframe: only keys touched by either delta can differ
+        candidates = a.touched(table) | b.touched(table)
+    else:
+        candidates = a.keys(table) | b.keys(table)
+
+    changed, added, removed = {}, [], []
+    for key in sorted(candidates):
+        ra, rb = a.get(table, key), b.get(table, key)
+        if ra is None and rb is None:
+            continue
+        if ra is None:
+            added.append(key)
+        elif rb is None:
+            removed.append(key)
+        else:
+            d = diff_record(ra, rb)
+            if d is not None:
+                changed[key] = d
+    return {"changed": changed, "added": added, "removed": removed}
+
+
+def diff_snapshots(a: Snapshot, b: Snapshot) -> Dict[str, Any]:
+    """Diff every table of two snapshots, with a per-table summary"""
+    tables = {t: diff_table(a, b, t) for t in TABLES}
+    summary = {}
+    for t, d in tables.items():
+        flags = [f for rec in d["changed"].values() for f in rec["flags"]]
+        summary[t] = {
+            "changed": len(d["changed"]),
+            "added": len(d["added"]),
+            "removed": len(d["removed"]),
+            "winner_changed": flags.count("winner_changed"),
+            "entered_danger": sum(1 for f in flags if f.startswith("entered_danger")),
+            "left_danger": sum(1 for f in flags if f.startswith("left_danger")),
+        }
+    return {"a": a.label, "b": b.label, "summary": summary, "tables": tables}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Diff two archived snapshots (ids or dataset files)")
+    parser.add_argument("a", help="Older snapshot id or dataset path")
+    parser.add_argument("b", help="Newer snapshot id or dataset path")
+    parser.add_argument("--root", type=Path, default=ARCHIVE_DIR, help="Archive directory")
+    parser.add_argument("-o", "--output", type=Path, help="Write JSON here instead of stdout")
+    parser.add_argument("--summary", action="store_true", help="Only emit the per-table summary")
+    args = parser.parse_args()
+
+    store = ArchiveStore(args.root)
+    result = diff_snapshots(open_snapshot(store, args.a), open_snapshot(store, args.b))
+    if args.summary:
+        result = {k: result[k] for k in ("a", "b", "summary")}
+
+    text = json.dumps(result, ensure_ascii=False, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+        print(f"✓ Diff written to {args.output}", file=sys.stderr)
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,293 +1,313 @@
+import argparse
 import json
 import re
 from pathlib import Path
 
+import numpy as np
+
+from artifacts import atomic_write, columnar_payload, load_dataset, write_dataset_json, write_json_artifacts
+from build_election_data import REGION_MAP
+from constituency_registry import ConstituencyKeyError, load_registry
+from constituency_table import ConstituencyTable
+from party_registry import UNKNOWN, load_party_registry
+import run_report
+
 # Base directory paths
 SCRIPT_DIR = Path(__file__).parent
 DATA_DIR = SCRIPT_DIR.parent / "data"
 ELECTION66_DIR = DATA_DIR / "election66"
 
 def extract_js_vars(filepath):
-    with open(filepath, 'r', encoding='utf-8') as f:
-        text = f.read()
-    
-    const_idx = text.find('CONST_RAW = [')
-    if const_idx == -1:
-        const_idx = text.find('CONST_RAW= [')
-        if const_idx == -1: return [], []
-        
-    const_start = text.find('[', const_idx)
-    pl_idx = text.find('PARTYLIST_RAW = [', const_start)
-    if pl_idx == -1: pl_idx = text.find('PARTYLIST_RAW= [', const_start)
-    
-    if pl_idx != -1:
-        const_end = text.rfind(']', const_start, pl_idx) + 1
-        const_str = text[const_start:const_end]
-        
-        pl_start = text.find('[', pl_idx)
-        pl_end = text.rfind(']') + 1
-        pl_str = text[pl_start:pl_end]
-    else:
-        const_end = text.rfind(']') + 1
-        const_str = text[const_start:const_end]
-        pl_str = '[]'
-        
+    """Load CONST_RAW / PARTYLIST_RAW, preferring the sibling .json artifact"""
     try:
-        const_data = json.loads(const_str) if const_str else []
-        pl_data = json.loads(pl_str) if pl_str and pl_str != '[]' else []
+        return load_dataset(Path(filepath))
     except json.JSONDecodeError as e:
         print(f"JSON Decode Error in {filepath}: {e}")
         return [], []
-        
-    return const_data, pl_data
+
+# Output field order for each dataset file
+FIELDS_66 = [
+    "cid", "province_thai", "province_eng", "prov_id", "cons_no", "region",
+    "turn_out", "percent_invalid",
+    "winner_party", "winner_pid", "winner_votes", "runnerup_party", "runnerup_pid", "runnerup_votes", "margin",
+    "valid", "invalid", "blank",
+]
+FIELDS_69 = [
+    "cid", "province_thai", "province_eng", "prov_id", "cons_no", "region",
+    "turn_out", "total_used", "valid", "invalid", "blank",
+    "winner_party", "winner_pid", "winner_votes", "runnerup_party", "runnerup_pid", "runnerup_votes", "margin",
+    "percent_invalid",
+]
+
+def _top_two(rows, vote_key, party_map):
+    """(winner name, pid, votes, runner-up name, pid, votes) by ECT party id"""
+    unknown = ('Unknown', UNKNOWN)
+    if not rows:
+        return (*unknown, 0, 'None', UNKNOWN, 0)
+    rows.sort(key=lambda x: x.get(vote_key, 0), reverse=True)
+    w_party = party_map.get(rows[0].get('party_id'), unknown)
+    w_votes = int(rows[0].get(vote_key, 0))
+    if len(rows) == 1:
+        return (*w_party, w_votes, 'None', UNKNOWN, 0)
+    r_party = party_map.get(rows[1].get('party_id'), unknown)
+    r_votes = int(rows[1].get(vote_key, 0))
+    return (*w_party, w_votes, *r_party, r_votes)
+
+def _gather(source, idx, fallback, dtype=None):
+    """Pick source[idx] where idx >= 0, otherwise the per-row fallback"""
+    source = np.asarray(source, dtype=dtype)
+    fallback = np.asarray(fallback, dtype=source.dtype)
+    if len(source) == 0:
+        return fallback
+    return np.where(idx >= 0, source[np.clip(idx, 0, None)], fallback)
+
+def _object_array(values):
+    arr = np.empty(len(values), dtype=object)
+    arr[:] = values
+    return arr
+
+def load_ect_66():
+    """Read ECT 2566 stats into per-field columns plus a cid -> row index array (-1: no stats)"""
+    parties = load_party_registry(ELECTION66_DIR)
+    party_map = {p['ect_id']: (p['name'], p['pid']) for p in parties.parties if p['ect_id'] is not None}
+
+    stats_file = ELECTION66_DIR / "th_election66_stats_cons.json"
+    with open(stats_file, 'r', encoding='utf-8-sig') as f:
+        stats = json.load(f)
+
+    keys = []
+    cols = {k: [] for k in (
+        'c_winner_party', 'c_winner_pid', 'c_winner_votes', 'c_runner_party', 'c_runner_pid', 'c_runner_votes',
+        'c_valid', 'c_invalid', 'c_blank', 'c_turn_out', 'c_percent_invalid',
+        'p_winner_party', 'p_winner_pid', 'p_winner_votes', 'p_runner_party', 'p_runner_pid', 'p_runner_votes',
+        'p_valid', 'p_invalid', 'p_blank', 'p_turn_out', 'p_percent_invalid',
+    )}
+    for prov in stats.get('result_province', []):
+        prov_id = prov.get('prov_id')
+        if not prov_id: continue
+        for cons in prov.get('constituencies', []):
+            cons_str = cons.get('cons_id', '')
+            try:
+                cons_no = int(cons_str.split('_')[1])
+            except (ValueError, IndexError):
+                run_report.drop("ECT 2566 constituency with a malformed cons_id", [cons_str])
+                continue
+
+            c_top = _top_two(cons.get('candidates', []), 'mp_app_vote', party_map)
+            p_top = _top_two(cons.get('result_party', []), 'party_list_vote', party_map)
+
+            keys.append((prov_id, cons_no))
+            for prefix, top in (('c', c_top), ('p', p_top)):
+                cols[f'{prefix}_winner_party'].append(top[0])
+                cols[f'{prefix}_winner_pid'].append(top[1])
+                cols[f'{prefix}_winner_votes'].append(top[2])
+                cols[f'{prefix}_runner_party'].append(top[3])
+                cols[f'{prefix}_runner_pid'].append(top[4])
+                cols[f'{prefix}_runner_votes'].append(top[5])
+
+            cols['c_valid'].append(int(cons.get('valid_votes', 0)))
+            cols['c_invalid'].append(int(cons.get('invalid_votes', 0)))
+            cols['c_blank'].append(int(cons.get('blank_votes', 0)))
+            cols['c_turn_out'].append(int(cons.get('turn_out', 0)))
+            cols['c_percent_invalid'].append(float(cons.get('percent_invalid_votes', 0)))
+
+            cols['p_valid'].append(int(cons.get('party_list_valid_votes', 0)))
+            cols['p_invalid'].append(int(cons.get('party_list_invalid_votes', 0)))
+            cols['p_blank'].append(int(cons.get('party_list_blank_votes', 0)))
+            cols['p_turn_out'].append(int(cons.get('party_list_turn_out', 0)))
+            cols['p_percent_invalid'].append(float(cons.get('party_list_percent_invalid_votes', 0)))
+
+    registry = load_registry(ELECTION66_DIR)
+    cids = registry.ids([k[0] for k in keys], [k[1] for k in keys], "ECT 2566 stats")
+    index = np.full(len(registry), -1, dtype=np.int64)
+    index[cids] = np.arange(len(cids))
+    return index, cols
 
 def process_66_enhanced(gen_const, gen_pl):
     try:
-        party_file = ELECTION66_DIR / "th_election66_info_party_overview.json"
-        with open(party_file, 'r', encoding='utf-8-sig') as f:
-            parties = json.load(f)
-        party_map = {int(p['id']): p['name'] for p in parties}
-        
-        stats_file = ELECTION66_DIR / "th_election66_stats_cons.json"
-        with open(stats_file, 'r', encoding='utf-8-sig') as f:
-            stats = json.load(f)
-            
-        enrich_map = {}
-        for prov in stats.get('result_province', []):
-            prov_id = prov.get('prov_id')
-            if not prov_id: continue
-            for cons in prov.get('constituencies', []):
-                cons_str = cons.get('cons_id', '')
-                try:
-                    cons_no = int(cons_str.split('_')[1])
-                except:
-                    continue
-                
-                # Cons candidates
-                cands = cons.get('candidates', [])
-                if len(cands) >= 2:
-                    cands.sort(key=lambda x: x.get('mp_app_vote', 0), reverse=True)
-                    c_winner = cands[0]
-                    c_runnerup = cands[1]
-                    c_winner_party = party_map.get(c_winner.get('party_id'), 'Unknown')
-                    c_winner_votes = int(c_winner.get('mp_app_vote', 0))
-                    c_runner_party = party_map.get(c_runnerup.get('party_id'), 'Unknown')
-                    c_runner_votes = int(c_runnerup.get('mp_app_vote', 0))
-                elif len(cands) == 1:
-                    c_winner = cands[0]
-                    c_winner_party = party_map.get(c_winner.get('party_id'), 'Unknown')
-                    c_winner_votes = int(c_winner.get('mp_app_vote', 0))
-                    c_runner_party = 'None'
-                    c_runner_votes = 0
-                else:
-                    c_winner_party = 'Unknown'
-                    c_winner_votes = 0
-                    c_runner_party = 'None'
-                    c_runner_votes = 0
-                
-                # PL results
-                pls = cons.get('result_party', [])
-                if len(pls) >= 2:
-                    pls.sort(key=lambda x: x.get('party_list_vote', 0), reverse=True)
-                    p_winner = pls[0]
-                    p_runnerup = pls[1]
-                    p_winner_party = party_map.get(p_winner.get('party_id'), 'Unknown')
-                    p_winner_votes = int(p_winner.get('party_list_vote', 0))
-                    p_runner_party = party_map.get(p_runnerup.get('party_id'), 'Unknown')
-                    p_runner_votes = int(p_runnerup.get('party_list_vote', 0))
-                elif len(pls) == 1:
-                    p_winner = pls[0]
-                    p_winner_party = party_map.get(p_winner.get('party_id'), 'Unknown')
-                    p_winner_votes = int(p_winner.get('party_list_vote', 0))
-                    p_runner_party = 'None'
-                    p_runner_votes = 0
-                else:
-                    p_winner_party = 'Unknown'
-                    p_winner_votes = 0
-                    p_runner_party = 'None'
-                    p_runner_votes = 0
-                
-                valid = int(cons.get('valid_votes', 0))
-                invalid = int(cons.get('invalid_votes', 0))
-                blank = int(cons.get('blank_votes', 0))
-                turn_out = int(cons.get('turn_out', 0))
-                percent_invalid = float(cons.get('percent_invalid_votes', 0))
-                
-                pl_valid = int(cons.get('party_list_valid_votes', 0))
-                pl_invalid = int(cons.get('party_list_invalid_votes', 0))
-                pl_blank = int(cons.get('party_list_blank_votes', 0))
-                pl_turn_out = int(cons.get('party_list_turn_out', 0))
-                pl_percent_invalid = float(cons.get('party_list_percent_invalid_votes', 0))
-                
-                enrich_map[(prov_id, cons_no)] = {
-                    'c_winner_party': c_winner_party,
-                    'c_winner_votes': c_winner_votes,
-                    'c_runner_party': c_runner_party,
-                    'c_runner_votes': c_runner_votes,
-                    'c_margin': c_winner_votes - c_runner_votes,
-                    'c_valid': valid,
-                    'c_invalid': invalid,
-                    'c_blank': blank,
-                    'c_turn_out': turn_out,
-                    'c_percent_invalid': percent_invalid,
-                    
-                    'p_winner_party': p_winner_party,
-                    'p_winner_votes': p_winner_votes,
-                    'p_runner_party': p_runner_party,
-                    'p_runner_votes': p_runner_votes,
-                    'p_margin': p_winner_votes - p_runner_votes,
-                    'p_valid': pl_valid,
-                    'p_invalid': pl_invalid,
-                    'p_blank': pl_blank,
-                    'p_turn_out': pl_turn_out,
-                    'p_percent_invalid': pl_percent_invalid,
-                }
+        ect_index, ect = load_ect_66()
+    except ConstituencyKeyError:
+        raise
     except Exception as e:
-        print(f"Error logic: {e}")
-        enrich_map = {}
-        
-    out_c = []
-    for d in gen_const:
-        prov_id = d.get('prov_id', '')
-        cons_no = d.get('cons_no', 0)
-        info = enrich_map.get((prov_id, cons_no), {})
-        
-        rec = {
-            "province_thai": d.get("province_thai", d.get("province", "Unknown")),
-            "province_eng": d.get("province_eng", ""),
-            "prov_id": prov_id,
-            "cons_no": cons_no,
-            "region": d.get("region", ""),
-            "turn_out": info.get('c_turn_out', d.get("turn_out_2566", d.get("turn_out", 0))),
-            "percent_invalid": info.get('c_percent_invalid', d.get("percent_invalid_2566", d.get("percent_invalid", 0))),
-            
-            "winner_party": info.get('c_winner_party', d.get("winner_party_2566", "Unknown")),
-            "winner_votes": info.get('c_winner_votes', 0),
-            "runnerup_party": info.get('c_runner_party', "Unknown"),
-            "runnerup_votes": info.get('c_runner_votes', 0),
-            "margin": info.get('c_margin', 0),
-            
-            "valid": info.get('c_valid', 0),
-            "invalid": info.get('c_invalid', 0),
-            "blank": info.get('c_blank', 0),
-        }
-        out_c.append(rec)
-        
-    out_p = []
-    for d in gen_pl:
-        prov_id = d.get('prov_id', '')
-        cons_no = d.get('cons_no', 0)
-        info = enrich_map.get((prov_id, cons_no), {})
-        
-        rec = {
-            "province_thai": d.get("province_thai", d.get("province", "Unknown")),
-            "province_eng": d.get("province_eng", ""),
-            "prov_id": prov_id,
-            "cons_no": cons_no,
-            "region": d.get("region", ""),
-            "turn_out": info.get('p_turn_out', d.get("turn_out_2566", d.get("turn_out", 0))),
-            "percent_invalid": info.get('p_percent_invalid', d.get("percent_invalid_2566", d.get("percent_invalid", 0))),
-            
-            "winner_party": info.get('p_winner_party', "Unknown"),
-            "winner_votes": info.get('p_winner_votes', 0),
-            "runnerup_party": info.get('p_runner_party', "Unknown"),
-            "runnerup_votes": info.get('p_runner_votes', 0),
-            "margin": info.get('p_margin', 0),
-            
-            "valid": info.get('p_valid', 0),
-            "invalid": info.get('p_invalid', 0),
-            "blank": info.get('p_blank', 0),
-        }
-        out_p.append(rec)
-        
+        run_report.warn(f"ECT 2566 stats could not be read ({type(e).__name__}: {e}); 2566 columns use fallbacks")
+        ect_index, ect = None, {}
+    registry = load_registry(ELECTION66_DIR)
+    parties = load_party_registry(ELECTION66_DIR)
+
+    def build(records, prefix, winner_fallback):
+        n = len(records)
+        cids = registry.record_ids(records, f"{prefix}-ballot")
+        idx = ect_index[cids] if ect_index is not None else np.full(n, -1, dtype=np.int64)
+        if ect_index is not None and (idx < 0).any():
+            missing = [registry.key(c) for c in cids[idx < 0].tolist()]
+            run_report.warn(f"{len(missing)} {prefix}-ballot records without ECT 2566 stats, 2566 columns use fallbacks",
+                            missing)
+        col = lambda name: ect.get(f'{prefix}_{name}', [])
+        zeros = np.zeros(n, dtype=np.int64)
+        unknown = _object_array(['Unknown'] * n)
+        no_pid = np.full(n, UNKNOWN, dtype=np.int64)
+        winner_names = winner_fallback(records)
+        winner_votes = _gather(col('winner_votes'), idx, zeros, np.int64)
+        runner_votes = _gather(col('runner_votes'), idx, zeros, np.int64)
+        return ConstituencyTable.from_columns(FIELDS_66, {
+            "cid": cids,
+            "province_thai": [d.get("province_thai", d.get("province", "Unknown")) for d in records],
+            "province_eng": [d.get("province_eng", "") for d in records],
+            "prov_id": [d.get('prov_id', '') for d in records],
+            "cons_no": [d.get('cons_no', 0) for d in records],
+            "region": [d.get("region", "") for d in records],
+            "turn_out": _gather(col('turn_out'), idx,
+                                [d.get("turn_out_2566", d.get("turn_out", 0)) for d in records], np.int64),
+            "percent_invalid": _gather(col('percent_invalid'), idx,
+                                       [d.get("percent_invalid_2566", d.get("percent_invalid", 0)) for d in records], np.float64),
+            "winner_party": _gather(_object_array(col('winner_party')), idx, winner_names),
+            "winner_pid": _gather(col('winner_pid'), idx,
+                                  parties.codes(winner_names, "2566 winner") if (idx < 0).any() else no_pid, np.int64),
+            "winner_votes": winner_votes,
+            "runnerup_party": _gather(_object_array(col('runner_party')), idx, unknown),
+            "runnerup_pid": _gather(col('runner_pid'), idx, no_pid, np.int64),
+            "runnerup_votes": runner_votes,
+            # ECT stats margin; rows without stats have no votes, so 0
+            "margin": winner_votes - runner_votes,
+            "valid": _gather(col('valid'), idx, zeros, np.int64),
+            "invalid": _gather(col('invalid'), idx, zeros, np.int64),
+            "blank": _gather(col('blank'), idx, zeros, np.int64),
+        })
+
+    out_c = build(gen_const, 'c', lambda rs: _object_array([d.get("winner_party_2566", "Unknown") for d in rs]))
+    out_p = build(gen_pl, 'p', lambda rs: _object_array(['Unknown'] * len(rs)))
     return out_c, out_p
 
 def process_69(records):
-    out = []
-    for d in records:
-        rec = {
-            "province_thai": d.get("province_thai", d.get("province", "Unknown")),
-            "province_eng": d.get("province_eng", ""),
-            "prov_id": d.get("prov_id", ""),
-            "cons_no": d.get("cons_no", 0),
-            "region": d.get("region", ""),
-            
-            "turn_out": d.get("turn_out_2569", d.get("turn_out", 0)),
-            "total_used": d.get("total_used_2569", d.get("total_used", 0)),
-            "valid": d.get("valid_2569", d.get("valid", 0)),
-            "invalid": d.get("invalid_2569", d.get("invalid", 0)),
-            "blank": d.get("blank_2569", d.get("blank", 0)),
-            "winner_party": d.get("winner_party_2569", d.get("winner_party", "Unknown")),
-            "winner_votes": d.get("winner_votes_2569", d.get("winner_votes", 0)),
-            "runnerup_party": d.get("runnerup_party_2569", d.get("runnerup_party", "Unknown")),
-            "runnerup_votes": d.get("runnerup_votes_2569", d.get("runnerup_votes", 0)),
-            "margin": d.get("margin_2569", d.get("margin", 0)),
-            "percent_invalid": d.get("percent_invalid_2569", d.get("percent_invalid", 0))
-        }
-        out.append(rec)
-    return out
-
-def compute_surpluses(const_records, pl_records):
-    pl_map = {f"{r.get('province_thai')}_{r.get('cons_no')}": r for r in pl_records}
-    for c in const_records:
-        k = f"{c.get('province_thai')}_{c.get('cons_no')}"
-        p = pl_map.get(k)
-        if p:
-            if 'valid' in c and 'invalid' in c and 'blank' in c and \
-               'valid' in p and 'invalid' in p and 'blank' in p:
-                c_sum = c['valid'] + c['invalid'] + c['blank']
-                p_sum = p['valid'] + p['invalid'] + p['blank']
-                surplus = c_sum - p_sum
-            else:
-                surplus = 0
-            
-            c['ballot_surplus'] = surplus
-            p['ballot_surplus'] = surplus
-        else:
-            c['ballot_surplus'] = 0
-
-def write_js(filename, const_data, pl_data):
-    with open(filename, 'w', encoding='utf-8') as f:
-        f.write(f"const CONST_RAW = {json.dumps(const_data, ensure_ascii=False, indent=2)};\n\n")
-        f.write(f"const PARTYLIST_RAW = {json.dumps(pl_data, ensure_ascii=False, indent=2)};\n")
-
-# Main execution
-gen_const, gen_pl = extract_js_vars(str(DATA_DIR / "election_data.js"))
-pct94_const, pct94_pl = extract_js_vars(str(DATA_DIR / "election69_94pct.js"))
-
-# Map missing metadata in 94pct by using gen_const (which is complete)
-meta_map = { f"{d.get('province_thai')}_{d.get('cons_no')}": d for d in gen_const }
-
-for r in pct94_const:
-    k = f"{r.get('province_thai')}_{r.get('cons_no')}"
-    if k in meta_map:
-        for fld in ['province_eng', 'prov_id', 'region']:
-            if fld in meta_map[k]:
-                r[fld] = meta_map[k][fld]
-
-for r in pct94_pl:
-    k = f"{r.get('province_thai')}_{r.get('cons_no')}"
-    if k in meta_map:
-        for fld in ['province_eng', 'prov_id', 'region']:
-            if fld in meta_map[k]:
-                r[fld] = meta_map[k][fld]
-
-# Extract 66 data
-const_66, pl_66 = process_66_enhanced(gen_const, gen_pl)
-compute_surpluses(const_66, pl_66)
-write_js(str(DATA_DIR / "election66_data.js"), const_66, pl_66)
-print("Created election66_data.js")
-
-# Extract 69 OCR data
-const_69ocr = process_69(gen_const)
-pl_69ocr = process_69(gen_pl)
-compute_surpluses(const_69ocr, pl_69ocr)
-write_js(str(DATA_DIR / "election69_ocr.js"), const_69ocr, pl_69ocr)
-print("Created election69_ocr.js")
-
-# Extract 69 94pct data
-const_6994 = process_69(pct94_const)
-pl_6994 = process_69(pct94_pl)
-compute_surpluses(const_6994, pl_6994)
-write_js(str(DATA_DIR / "election69_94pct.js"), const_6994, pl_6994)
-print("Created election69_94pct.js")
+    def get(plain, default):
+        suffixed = f"{plain}_2569"
+        return [d.get(suffixed, d.get(plain, default)) for d in records]
+
+    def pid(role):
+        """Registry codes the builders emitted, or resolved from the names (older files)"""
+        codes = get(f"{role}_pid", None)
+        if all(c is not None for c in codes):
+            return codes
+        return load_party_registry(ELECTION66_DIR).codes(get(f"{role}_party", "Unknown"), "dataset party")
+
+    values = {
+        "cid": load_registry(ELECTION66_DIR).record_ids(records, "dataset"),
+        "province_thai": [d.get("province_thai", d.get("province", "Unknown")) for d in records],
+        "province_eng": [d.get("province_eng", "") for d in records],
+        "prov_id": [d.get("prov_id", "") for d in records],
+        "cons_no": [d.get("cons_no", 0) for d in records],
+        "region": [d.get("region", "") for d in records],
+        "turn_out": get("turn_out", 0),
+        "total_used": get("total_used", 0),
+        "valid": get("valid", 0),
+        "invalid": get("invalid", 0),
+        "blank": get("blank", 0),
+        "winner_party": get("winner_party", "Unknown"),
+        "winner_pid": pid("winner"),
+        "winner_votes": get("winner_votes", 0),
+        "runnerup_party": get("runnerup_party", "Unknown"),
+        "runnerup_pid": pid("runnerup"),
+        "runnerup_votes": get("runnerup_votes", 0),
+        "margin": get("margin", 0),
+        "percent_invalid": get("percent_invalid", 0),
+    }
+    return ConstituencyTable.from_columns(FIELDS_69, values)
+
+def compute_surpluses(const_table, pl_table):
+    """
+    Vectorised ballot_surplus = (valid + invalid + blank) constituency - party
+    list, matched by constituency; 0 on rows without a counterpart
+    """
+    c_sum = const_table.columns['valid'] + const_table.columns['invalid'] + const_table.columns['blank']
+    p_sum = pl_table.columns['valid'] + pl_table.columns['invalid'] + pl_table.columns['blank']
+
+    idx = const_table.join_index(pl_table)
+    matched = idx >= 0
+    surplus = np.zeros(len(const_table), dtype=np.int64)
+    surplus[matched] = c_sum[matched] - p_sum[idx[matched]]
+
+    pl_surplus = np.zeros(len(pl_table), dtype=np.int64)
+    pl_surplus[idx[matched]] = surplus[matched]
+
+    const_table.set_column('ballot_surplus', surplus)
+    pl_table.set_column('ballot_surplus', pl_surplus)
+
+def write_js(filename, const_table, pl_table, compact=False, fast=False):
+    """
+    Write the JS data file plus its JSON artifacts (with the PARTIES table the
+    pids refer to). With compact=True the JSON artifact uses the
+    dictionary-encoded columnar format (see decode_columnar).
+    Every file is replaced atomically, so readers never see a partial write.
+    """
+    const_data = const_table.to_records()
+    pl_data = pl_table.to_records()
+    js = (f"const CONST_RAW = {json.dumps(const_data, ensure_ascii=False, indent=2)};\n\n"
+          f"const PARTYLIST_RAW = {json.dumps(pl_data, ensure_ascii=False, indent=2)};\n")
+    atomic_write(Path(filename), js.encode('utf-8'))
+    json_path = Path(filename).with_suffix('.json')
+    parties = load_party_registry(ELECTION66_DIR).to_table()
+    if compact:
+        write_json_artifacts(json_path, columnar_payload(const_table.to_columnar(), pl_table.to_columnar(),
+                                                         parties=parties), fast=fast)
+    else:
+        write_dataset_json(json_path, const_data, pl_data, fast=fast, parties=parties)
+
+def enrich_94pct_metadata(pct94_const, pct94_pl):
+    """Tag the 94pct rows (province name + number only) with their registry id, prov_id, English name and region"""
+    registry = load_registry(ELECTION66_DIR)
+    for rows, source in ((pct94_const, "94% constituency"), (pct94_pl, "94% party-list")):
+        cids = registry.ids_by_name([r.get('province_thai') for r in rows], [r.get('cons_no') for r in rows], source)
+        for r, cid in zip(rows, cids.tolist()):
+            prov_id = registry.prov_id[cid]
+            r['cid'] = cid
+            r['province_thai'] = registry.province_thai(prov_id) or r.get('province_thai')
+            r['prov_id'] = prov_id
+            r['province_eng'] = registry.province_eng(prov_id)
+            r['region'] = REGION_MAP.get(prov_id, "")
+
+def split_datasets(gen_const, gen_pl, pct94_const, pct94_pl, compact=False):
+    """Build, write and return {name: (const_table, pl_table)} for the three dataset files"""
+    run_report.records(inputs=len(gen_const) + len(gen_pl) + len(pct94_const) + len(pct94_pl))
+    enrich_94pct_metadata(pct94_const, pct94_pl)
+    datasets = {}
+
+    # Extract 66 data
+    const_66, pl_66 = process_66_enhanced(gen_const, gen_pl)
+    compute_surpluses(const_66, pl_66)
+    write_js(str(DATA_DIR / "election66_data.js"), const_66, pl_66, compact=compact)
+    datasets["election66_data"] = (const_66, pl_66)
+    print("Created election66_data.js")
+
+    # Extract 69 OCR data
+    const_69ocr = process_69(gen_const)
+    pl_69ocr = process_69(gen_pl)
+    compute_surpluses(const_69ocr, pl_69ocr)
+    write_js(str(DATA_DIR / "election69_ocr.js"), const_69ocr, pl_69ocr, compact=compact)
+    datasets["election69_ocr"] = (const_69ocr, pl_69ocr)
+    print("Created election69_ocr.js")
+
+    # Extract 69 94pct data
+    const_6994 = process_69(pct94_const)
+    pl_6994 = process_69(pct94_pl)
+    compute_surpluses(const_6994, pl_6994)
+    write_js(str(DATA_DIR / "election69_94pct.js"), const_6994, pl_6994, compact=compact)
+    datasets["election69_94pct"] = (const_6994, pl_6994)
+    print("Created election69_94pct.js")
+
+    for name, (c, p) in datasets.items():
+        run_report.records(outputs=len(c) + len(p), **{name: len(c) + len(p)})
+
+    return datasets
+
+def main():
+    parser = argparse.ArgumentParser(description="Split election_data.js into per-dataset files")
+    parser.add_argument("--compact", action="store_true",
+                        help="Write JSON artifacts in the dictionary-encoded columnar format")
+    args = parser.parse_args()
+
+    gen_const, gen_pl = extract_js_vars(str(DATA_DIR / "election_data.js"))
+    pct94_const, pct94_pl = extract_js_vars(str(DATA_DIR / "election69_94pct.js"))
+    split_datasets(gen_const, gen_pl, pct94_const, pct94_pl, compact=args.compact)
+
+if __name__ == "__main__":
+    main()
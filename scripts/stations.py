@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Polling-station (ส.ส. 6/1) results: streaming surplus, rollups and outliers
+The ballot surplus is defined per polling station, so it is computed there:
+each station's constituency ballots (valid + invalid + blank) minus its
+party-list ballots. The station CSVs are read in chunks of CHUNK_ROWS rows,
+so memory stays bounded by the chunk size, the per-constituency accumulators
+and at most `max_outliers` kept stations per province. Nothing holds one dict
+per station.
+
+Input: data/election69/stations/*.csv, one row per station with both ballots
+    prov_id, cons_no, district, unit_no, eligible,
+    c_valid, c_invalid, c_blank, p_valid, p_invalid, p_blank
+
+Outputs under data/stations/:
+    summary.<hash>.json   rollups per constituency, province, region and nationally
+    <PROV>.<hash>.json    outlier stations of one province (|surplus| above the
+                          threshold), largest first; rows are arrays, with
+                          field names given once per file
+    index.json            summary file, plus per province its outlier file and counts
+
+Usage: python stations.py [--min-surplus 10] [--min-share 0.02] [--max-outliers 500]
+"""
+
+import argparse
+import heapq
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from artifacts import atomic_write, encode_json, write_json_artifacts
+from asset_manifest import publish_file, read_index
+from build_election_data import REGION_MAP
+from constituency_registry import ConstituencyRegistry, load_registry
+import run_report
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+STATION_DIR = DATA_DIR / "election69" / "stations"
+OUT_DIR = DATA_DIR / "stations"
+
+CHUNK_ROWS = 100_000
+KEY_COLUMNS = ["prov_id", "cons_no"]
+TEXT_COLUMNS = ["prov_id", "district"]
+COUNT_COLUMNS = ["unit_no", "eligible", "c_valid", "c_invalid", "c_blank", "p_valid", "p_invalid", "p_blank"]
+STATION_COLUMNS = KEY_COLUMNS + ["district"] + COUNT_COLUMNS
+
+# Summed per constituency; max_abs_surplus is a running maximum
+ROLLUP_SUMS = ["stations", "eligible", "c_total", "c_invalid", "c_blank", "p_total", "p_invalid", "p_blank",
+               "surplus", "abs_surplus", "surplus_stations", "outliers"]
+ROLLUP_FIELDS = ROLLUP_SUMS + ["max_abs_surplus"]
+OUTLIER_FIELDS = ["cons_no", "district", "unit_no", "eligible", "c_total", "p_total", "surplus", "c_invalid", "p_invalid"]
+
+
+# ══════════════════════════════════════════════════════════════════════════
+# READER
+# ══════════════════════════════════════════════════════════════════════════
+
+def read_station_chunks(paths: Iterable[Path], chunk_rows: int = CHUNK_ROWS) -> Iterable[Tuple[pd.DataFrame, List[str]]]:
+    """
+    (chunk, dropped) per chunk of every station CSV: key and count columns
+    typed; rows with a missing key or count are left out and returned as
+    "<file>:<line>"
+    """
+    for path in paths:
+        reader = pd.read_csv(path, usecols=STATION_COLUMNS, chunksize=chunk_rows,
+                             dtype={c: str for c in TEXT_COLUMNS}, encoding="utf-8-sig")
+        for chunk in reader:
+            numeric = chunk[["cons_no"] + COUNT_COLUMNS].apply(pd.to_numeric, errors="coerce")
+            ok = numeric.notna().all(axis=1).to_numpy() & chunk["prov_id"].notna().to_numpy()
+            frame = numeric[ok].astype(np.int64)
+            frame["prov_id"] = chunk["prov_id"][ok].str.strip()
+            frame["district"] = chunk["district"][ok].fillna("")
+            yield frame, [f"{Path(path).name}:{i + 2}" for i in chunk.index[~ok]]
+
+
+# ══════════════════════════════════════════════════════════════════════════
+# STREAMING ROLLUP
+# ══════════════════════════════════════════════════════════════════════════
+
+class StationRollup:
+    """Running per-constituency totals and the largest outliers per province"""
+
+    def __init__(self, min_surplus: int = 10, min_share: float = 0.02, max_outliers: int = 500,
+                 registry: Optional[ConstituencyRegistry] = None):
+        self.min_surplus = min_surplus
+        self.min_share = min_share
+        self.max_outliers = max_outliers
+        # Accumulator rows are registry ids
+        self.registry = registry or load_registry()
+        self.sums = np.zeros((len(self.registry), len(ROLLUP_SUMS)), dtype=np.int64)
+        self.max_abs = np.zeros(len(self.registry), dtype=np.int64)
+        # prov_id -> min-heap of (|surplus|, sequence, row), at most max_outliers long
+        self.outliers: Dict[str, List[Tuple[int, int, list]]] = {}
+        self.outlier_total: Dict[str, int] = {}
+        self.rows = 0
+        self.dropped = 0
+        self._seq = 0
+
+    def _ids(self, keys: pd.DataFrame) -> np.ndarray:
+        """Registry ids for a chunk's (prov_id, cons_no) rows; unregistered keys raise ConstituencyKeyError"""
+        codes, uniques = pd.MultiIndex.from_frame(keys).factorize()
+        local = self.registry.ids([k[0] for k in uniques], [k[1] for k in uniques], "station CSV")
+        return local[codes]
+
+    def add(self, chunk: pd.DataFrame, dropped: Sequence[str] = ()):
+        """Fold one chunk of stations into the rollups"""
+        self.rows += len(chunk)
+        self.dropped += len(dropped)
+        run_report.drop("station rows with a missing key or count", dropped)
+        if chunk.empty:
+            return
+        ids = self._ids(chunk[KEY_COLUMNS])
+        col = {c: chunk[c].to_numpy() for c in COUNT_COLUMNS}
+        c_total = col["c_valid"] + col["c_invalid"] + col["c_blank"]
+        p_total = col["p_valid"] + col["p_invalid"] + col["p_blank"]
+        surplus = c_total - p_total
+        abs_surplus = np.abs(surplus)
+        outlier = abs_surplus >= np.maximum(self.min_surplus, self.min_share * c_total)
+
+        values = {
+            "stations": np.ones(len(chunk), dtype=np.int64),
+            "eligible": col["eligible"],
+            "c_total": c_total, "c_invalid": col["c_invalid"], "c_blank": col["c_blank"],
+            "p_total": p_total, "p_invalid": col["p_invalid"], "p_blank": col["p_blank"],
+            "surplus": surplus,
+            "abs_surplus": abs_surplus,
+            "surplus_stations": (surplus != 0).astype(np.int64),
+            "outliers": outlier.astype(np.int64),
+        }
+        n = len(self.max_abs)
+        for j, name in enumerate(ROLLUP_SUMS):
+            self.sums[:, j] += np.bincount(ids, weights=values[name], minlength=n).astype(np.int64)
+        np.maximum.at(self.max_abs, ids, abs_surplus)
+
+        if outlier.any():
+            self._keep_outliers(chunk[outlier], c_total[outlier], p_total[outlier], surplus[outlier])
+
+    def _keep_outliers(self, rows: pd.DataFrame, c_total: np.ndarray, p_total: np.ndarray, surplus: np.ndarray):
+        prov = rows["prov_id"].tolist()
+        cols = [rows["cons_no"].tolist(), rows["district"].tolist(), rows["unit_no"].tolist(),
+                rows["eligible"].tolist(), c_total.tolist(), p_total.tolist(), surplus.tolist(),
+                rows["c_invalid"].tolist(), rows["p_invalid"].tolist()]
+        for i, prov_id in enumerate(prov):
+            heap = self.outliers.setdefault(prov_id, [])
+            self.outlier_total[prov_id] = self.outlier_total.get(prov_id, 0) + 1
+            self._seq += 1
+            item = (abs(cols[6][i]), -self._seq, [c[i] for c in cols])
+            if len(heap) < self.max_outliers:
+                heapq.heappush(heap, item)
+            elif item > heap[0]:
+                heapq.heapreplace(heap, item)
+
+    # ══════════════════════════════════════════════════════════════════════
+    # RESULTS
+    # ══════════════════════════════════════════════════════════════════════
+
+    def constituencies(self) -> List[Dict[str, Any]]:
+        """One rollup per constituency with stations, by province and number"""
+        reg = self.registry
+        present = np.flatnonzero(self.sums[:, ROLLUP_SUMS.index("stations")] > 0).tolist()
+        out = []
+        for i in sorted(present, key=lambda i: (reg.prov_id[i], reg.cons_no[i])):
+            prov_id = reg.prov_id[i]
+            row = dict(zip(ROLLUP_SUMS, self.sums[i].tolist()))
+            out.append({"cid": i, "prov_id": prov_id, "cons_no": int(reg.cons_no[i]), "region": REGION_MAP.get(prov_id, ""),
+                        **row, "max_abs_surplus": int(self.max_abs[i])})
+        return out
+
+    def station_outliers(self, prov_id: str) -> List[list]:
+        """Kept outlier rows of a province, largest |surplus| first"""
+        return [row for _, _, row in sorted(self.outliers.get(prov_id, []), reverse=True)]
+
+
+def rollup(rows: List[Dict[str, Any]], key: Optional[str]) -> Dict[str, Dict[str, Any]]:
+    """Sum constituency rollups by `key` (None: one national total)"""
+    out: Dict[str, Dict[str, Any]] = {}
+    for r in rows:
+        k = r[key] if key else "national"
+        acc = out.setdefault(k, {f: 0 for f in ROLLUP_FIELDS})
+        acc["constituencies"] = acc.get("constituencies", 0) + 1
+        for f in ROLLUP_SUMS:
+            acc[f] += r[f]
+        acc["max_abs_surplus"] = max(acc["max_abs_surplus"], r["max_abs_surplus"])
+    return out
+
+
+def station_files(station_dir: Optional[Path] = None) -> List[Path]:
+    return sorted(Path(station_dir or STATION_DIR).glob("*.csv"))
+
+
+def build_station_rollup(paths: List[Path], min_surplus: int = 10, min_share: float = 0.02,
+                         max_outliers: int = 500, chunk_rows: int = CHUNK_ROWS) -> StationRollup:
+    """Stream every station CSV through a StationRollup"""
+    agg = StationRollup(min_surplus, min_share, max_outliers)
+    for chunk, dropped in read_station_chunks(paths, chunk_rows):
+        agg.add(chunk, dropped)
+    run_report.records(inputs=agg.rows + agg.dropped, outputs=len(agg.constituencies()))
+    return agg
+
+
+def write_stations(agg: StationRollup, out_dir: Path = OUT_DIR, source: str = "") -> List[Path]:
+    """Write the rollup summary and one outlier file per province (hashed), then index.json"""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    root = out_dir.parent.parent
+    cons = agg.constituencies()
+    thresholds = {"min_surplus": agg.min_surplus, "min_share": agg.min_share, "max_outliers": agg.max_outliers}
+
+    # The previous index's files stay fetchable until pages pick up the new one
+    previous = read_index(out_dir / "index.json")
+    last = {prov_id: p["file"] for prov_id, p in previous.get("provinces", {}).items()}
+    if previous.get("summary"):
+        last["summary"] = previous["summary"]
+    kept = {Path(f).name for f in last.values()}
+
+    written = []
+    published: Dict[str, Dict[str, Any]] = {}
+
+    def publish(name: str, payload: Any) -> Dict[str, Any]:
+        path = out_dir / f"{name}.json"
+        fixed = write_json_artifacts(path, payload)
+        entry = publish_file(path, root, last.get(name))
+        written.append(root / entry["file"])
+        # Only fetched through the index, so only the hashed copy is kept
+        for p in fixed:
+            p.unlink()
+        return entry
+
+    summary = publish("summary", {
+        "source": source,
+        "stations": agg.rows,
+        "dropped": agg.dropped,
+        "thresholds": thresholds,
+        "national": rollup(cons, None)["national"],
+        "regions": rollup(cons, "region"),
+        "provinces": rollup(cons, "prov_id"),
+        "constituencies": cons,
+    })
+    for prov_id in sorted(agg.outliers):
+        entry = publish(prov_id, {"prov_id": prov_id, "fields": OUTLIER_FIELDS,
+                                  "stations": agg.station_outliers(prov_id)})
+        published[prov_id] = {"file": entry["file"], "bytes": entry["bytes"],
+                              "outliers": agg.outlier_total[prov_id], "kept": len(agg.outliers[prov_id])}
+
+    # Provinces without outliers any more
+    for path in out_dir.glob("*.json*"):
+        base = path.name.split(".")[0]
+        if (base not in published and base not in ("index", "summary")
+                and path.name.split(".json")[0] + ".json" not in kept):
+            path.unlink()
+
+    index = {"stations": agg.rows, "dropped": agg.dropped, "thresholds": thresholds,
+             "summary": summary["file"], "provinces": published}
+    atomic_write(out_dir / "index.json", encode_json(index))
+    written.append(out_dir / "index.json")
+
+    kept = sum(p["kept"] for p in published.values())
+    print(f"✓ {agg.rows:,} stations in {len(cons)} constituencies ({agg.dropped:,} rows dropped), "
+          f"{kept:,} outlier stations in {len(published)} provinces → {out_dir}")
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Station-level surplus rollups and outlier shards")
+    parser.add_argument("--input", type=Path, default=STATION_DIR, help="Folder of station CSVs (default: data/election69/stations)")
+    parser.add_argument("--min-surplus", type=int, default=10,
+                        help="Outlier when |surplus| is at least this many ballots (default: 10)")
+    parser.add_argument("--min-share", type=float, default=0.02,
+                        help="... and at least this share of the station's ballots (default: 0.02)")
+    parser.add_argument("--max-outliers", type=int, default=500,
+                        help="Outlier stations kept per province, largest first (default: 500)")
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS, help=f"Rows per chunk (default: {CHUNK_ROWS})")
+    args = parser.parse_args()
+
+    paths = station_files(args.input)
+    if not paths:
+        print(f"⚠️  No station CSVs in {args.input}")
+        return
+    print(f"📥 Streaming {len(paths)} station file(s) from {args.input}...")
+    agg = build_station_rollup(paths, args.min_surplus, args.min_share, args.max_outliers, args.chunk_rows)
+    write_stations(agg, source=os.path.relpath(args.input, DATA_DIR.parent))
+
+
+if __name__ == "__main__":
+    main()
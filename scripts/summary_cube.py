@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Pre-aggregated summary cube for the analysis pages' header counters
+The danger / improved / worse counters (counts plus Left and Right ballot
+sums) are otherwise recomputed by filter passes over every paired record.
+This aggregates them per Left/Right dataset pair into
+data/cube/<left>__<right>.json, a few KB that the pages paint from before
+the full records arrive.
+
+Cells are keyed by region × winning party (Left) × winning party (Right), so
+the counters can also be regrouped the way the grp-select options do. Each
+cell holds, for each page metric ("invalid" / "blank"), the count and the
+Left/Right sums of every counter category. Quantiles of the % change are
+included overall and per region.
+
+Usage: python summary_cube.py
+"""
+
+import argparse
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from artifacts import write_json_artifacts
+from comparisons import TABLE_SOURCES, load_standard_datasets, pair_tables
+from constituency_table import encode_categorical
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+CUBE_DIR = DATA_DIR / "cube"
+
+PAGES = ("invalid", "blank")
+CATEGORIES = ("all", "danger", "improved", "worse", "improved_raw", "worse_raw")
+CELL_FIELDS = [f"{c}_{s}" for c in CATEGORIES for s in ("n", "l", "r")]
+QUANTILES = (0.1, 0.25, 0.5, 0.75, 0.9)
+
+
+def category_masks(page: str, p: Dict[str, Any]) -> Dict[str, np.ndarray]:
+    """The pages' header-stat filters (see buildChart) over paired rows"""
+    m = p["metrics"]
+    pct, raw = np.asarray(m[f"{page}_pct_change"]), np.asarray(m[f"{page}_change"])
+    return {
+        "all": np.ones(len(pct), dtype=bool),
+        "danger": np.asarray(m[f"danger_{page}"], dtype=bool),
+        "improved": pct < 0,
+        "worse": pct > 0,
+        "improved_raw": raw < 0,
+        "worse_raw": raw > 0,
+    }
+
+
+def _quantiles(values: np.ndarray) -> List[float]:
+    if len(values) == 0:
+        return []
+    return [round(float(q), 4) for q in np.quantile(values, QUANTILES)]
+
+
+def cube_table(left: List[Dict], right: List[Dict], regions: Dict[str, int],
+               parties: Dict[str, int]) -> Dict[str, Any]:
+    """Cells and quantiles for one table of a dataset pair"""
+    p = pair_tables(left, right)
+    L, R = p["pairs"]["L"], p["pairs"]["R"]
+    region = np.array([regions.setdefault(v, len(regions)) for v in L["region"]], dtype=np.int64)
+    party_l = np.array([parties.setdefault(v, len(parties)) for v in L["winner_party"]], dtype=np.int64)
+    party_r = np.array([parties.setdefault(v, len(parties)) for v in R["winner_party"]], dtype=np.int64)
+
+    # One group per (region, party L, party R) combination, in first-seen order
+    group, keys = encode_categorical(zip(region.tolist(), party_l.tolist(), party_r.tolist()))
+    n_groups = len(keys)
+
+    out: Dict[str, Any] = {"keys": [list(k) for k in keys], "cells": {}, "quantiles": {}}
+    for page in PAGES:
+        vals_l, vals_r = L[page], R[page]
+        columns = []
+        for name, mask in category_masks(page, p).items():
+            columns.append(np.bincount(group[mask], minlength=n_groups))
+            columns.append(np.bincount(group[mask], weights=vals_l[mask], minlength=n_groups))
+            columns.append(np.bincount(group[mask], weights=vals_r[mask], minlength=n_groups))
+        out["cells"][page] = np.stack(columns, axis=1).astype(np.int64).tolist() if n_groups else []
+
+        pct = np.asarray(p["metrics"][f"{page}_pct_change"], dtype=np.float64)
+        out["quantiles"][page] = {
+            "pct_change": _quantiles(pct),
+            "pct_change_by_region": {str(r): _quantiles(pct[region == r]) for r in np.unique(region).tolist()},
+        }
+    return out
+
+
+def build_cube(left: Tuple[List, List], right: Tuple[List, List], lname: str, rname: str) -> Dict[str, Any]:
+    regions: Dict[str, int] = {}
+    parties: Dict[str, int] = {}
+    tables = {name: cube_table(left[i], right[i], regions, parties) for name, i in TABLE_SOURCES.items()}
+    return {
+        "left": lname,
+        "right": rname,
+        "regions": list(regions),
+        "parties": list(parties),
+        "fields": CELL_FIELDS,
+        "quantile_points": list(QUANTILES),
+        **tables,
+    }
+
+
+def build_cubes(datasets: Dict[str, Tuple[List, List]], out_dir: Path = CUBE_DIR,
+                touching: Optional[str] = None, fast: bool = False) -> List[Path]:
+    """Write one cube per ordered dataset pair, or only the pairs involving `touching`"""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    written = []
+    for lname, ldata in datasets.items():
+        for rname, rdata in datasets.items():
+            if touching is not None and touching not in (lname, rname):
+                continue
+            path = out_dir / f"{lname}__{rname}.json"
+            write_json_artifacts(path, build_cube(ldata, rdata, lname, rname), fast=fast)
+            written.append(path)
+    if touching is None:
+        print(f"✓ Wrote {len(written)} summary cubes to {out_dir}")
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the pre-aggregated summary cubes for the analysis pages")
+    parser.add_argument("--out", type=Path, default=CUBE_DIR, help="Output directory")
+    args = parser.parse_args()
+    build_cubes(load_standard_datasets(), args.out)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,564 @@
+#!/usr/bin/env python3
+"""
+Synthetic election data in every source format the builders read
+Writes, from one seeded draw:
+    election66/   ECT 2566 reference + stats files (th_election66_info_*.json,
+                  th_election66_stats_cons.json with the result_province ->
+                  constituencies -> candidates / result_party nesting)
+    ocr/          OCR 2569 documents, constituency/ and party_list/
+                  (province_name_normalized, summary.good_votes, ..., results[])
+    election69/   the unofficial 94% workbook ('สสแบ่งเขต' and 'party list')
+                  and stations/stations.csv, the 2569 counts split over polling
+                  stations (ส.ส. 6/1 rows, see stations.py)
+    anomalies.json  every injected anomaly, for checking what the builders catch
+
+The constituencies are today's (data/election66 reference files) repeated
+`scale` times; copies keep their province and shift cons_no by 1000, so keys
+stay unique. Provinces and parties are the real ones, with party popularity
+seeded from the real 2566 party-list vote. The OCR documents and the workbook
+carry the same 2569 counts (the workbook's party-list sheet keeps the leading
+EXCEL_PARTY_ROWS parties per constituency); the ECT files are a separate 2566
+draw.
+
+Injected anomalies (fractions of the constituencies, exact counts):
+    surplus        party-list ballot total differs from the constituency one
+                   (at station level: in a few of its stations, listed)
+    danger         invalid ballots greater than the winning margin
+    province_typo  OCR-style typo in the province name of one ballot's
+                   OCR document and workbook rows
+Outside the `danger` set every ballot has invalid < margin, and outside the
+`surplus` set both ballots add up to the same total.
+
+Usage:
+    python synth_data.py -o /tmp/synth --scale 100
+    python synth_data.py -o /tmp/synth --seed 7 --surplus 0.05 --typos 0 --formats ocr ect
+    python synth_data.py -o /tmp/synth --formats stations     # ~95k polling stations
+"""
+
+import argparse
+import csv
+import json
+import random
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import openpyxl
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+REFERENCE_DIR = DATA_DIR / "election66"
+EXCEL_NAME = "ElectionData-Analysis-Public-Transfer-unofficial94percent.xlsx"
+FORMATS = ("ect", "ocr", "excel", "stations")
+DEFAULT_FORMATS = ("ect", "ocr", "excel")
+# Registered voters per polling station (~95k stations nationally)
+STATION_SIZE = 550
+EXCEL_PARTY_ROWS = 10
+# Fixed so that the same seed writes byte-identical JSON
+SYNTH_TIMESTAMP = "2023-05-15T00:00:00"
+BALLOTS = ("constituency", "party_list")
+
+# Characters OCR commonly confuses in Thai print, and marks it drops
+CONFUSABLE = {
+    "ข": "ช", "ช": "ซ", "ซ": "ช", "ด": "ต", "ต": "ด", "บ": "ป", "ป": "บ", "ผ": "พ", "พ": "ผ",
+    "ฝ": "ฟ", "ฟ": "ฝ", "ร": "ธ", "ล": "ส", "ส": "ล", "ท": "ห", "ฎ": "ฏ", "ค": "ศ", "ศ": "ค",
+    "ุ": "ู", "ู": "ุ", "ิ": "ี", "ี": "ิ", "่": "้", "้": "่",
+}
+MARKS = set("่้๊๋ัิีึืุู็์")
+
+FIRST_NAMES = ["สมชาย", "สมศักดิ์", "วิชัย", "ประเสริฐ", "สุนทร", "ธนากร", "กิตติ", "อนุชา", "ณัฐพล", "พงศกร",
+               "สุดารัตน์", "วรรณา", "กนกพร", "ศิริพร", "ปิยะนุช", "ชลธิชา", "อรอุมา", "จิราพร", "พิมพ์ชนก", "รัชนี"]
+LAST_NAMES = ["ใจดี", "ศรีสุข", "แก้วมณี", "บุญมา", "ทองคำ", "สุวรรณรัตน์", "พรหมวงศ์", "จันทร์เพ็ญ", "รุ่งเรือง",
+              "วงศ์สวัสดิ์", "เพชรรัตน์", "สายทอง", "มีสุข", "ชัยมงคล", "อินทร์แก้ว"]
+
+
+# ══════════════════════════════════════════════════════════════════════════
+# REFERENCE DATA
+# ══════════════════════════════════════════════════════════════════════════
+
+def _load(name: str, reference_dir: Path) -> Any:
+    with open(reference_dir / name, "r", encoding="utf-8-sig") as f:
+        return json.load(f)
+
+
+def load_reference(reference_dir: Path = REFERENCE_DIR) -> Dict[str, Any]:
+    """Real provinces, constituencies and parties the synthetic data is laid out on"""
+    province_info = _load("th_election66_info_province.json", reference_dir)
+    return {
+        "province_info": province_info,
+        "provinces": {p["prov_id"]: p for p in province_info["province"]},
+        "constituencies": _load("th_election66_info_constituency.json", reference_dir),
+        "parties": _load("th_election66_info_party_overview.json", reference_dir),
+        "party_votes": {int(p["party_id"]): p.get("party_vote") or 0
+                        for p in _load("th_election66_stats_party.json", reference_dir)["result_party"]},
+    }
+
+
+def ocr_typo(name: str, rng: random.Random, avoid: set) -> str:
+    """`name` with one OCR-style error: confused character, dropped mark, split or doubled letter"""
+    for _ in range(20):
+        i = rng.randrange(len(name))
+        op = rng.choice(("confuse", "drop_mark", "space", "double"))
+        if op == "confuse":
+            swaps = [j for j, ch in enumerate(name) if ch in CONFUSABLE]
+            if not swaps:
+                continue
+            i = rng.choice(swaps)
+            typo = name[:i] + CONFUSABLE[name[i]] + name[i + 1:]
+        elif op == "drop_mark":
+            marks = [j for j, ch in enumerate(name) if ch in MARKS]
+            if not marks:
+                continue
+            i = rng.choice(marks)
+            typo = name[:i] + name[i + 1:]
+        elif op == "space":
+            typo = name[:max(i, 1)] + " " + name[max(i, 1):]
+        else:
+            typo = name[:i + 1] + name[i] + name[i + 1:]
+        if typo != name and typo not in avoid:
+            return typo
+    return name + " "
+
+
+# ══════════════════════════════════════════════════════════════════════════
+# DRAWS
+# ══════════════════════════════════════════════════════════════════════════
+
+def _split_votes(total: int, weights: List[float]) -> List[int]:
+    """Integer votes summing to `total`, proportional to weights (remainder to the largest)"""
+    s = sum(weights) or 1.0
+    votes = [int(total * w / s) for w in weights]
+    votes[max(range(len(votes)), key=lambda i: weights[i])] += total - sum(votes)
+    return votes
+
+
+def draw_ballot(rng: random.Random, voters: int, weights: Dict[int, float], k: Optional[int]) -> Dict[str, Any]:
+    """
+    One ballot's counts: `voters` ballots split into invalid, blank and valid
+    votes over `k` contesting parties drawn by weight (all parties if k is None)
+    """
+    invalid = round(voters * rng.uniform(0.01, 0.05))
+    blank = round(voters * rng.uniform(0.005, 0.03))
+    valid = voters - invalid - blank
+
+    ids = list(weights)
+    if k is not None and k < len(ids):
+        # Weighted sample without replacement (Efraimidis-Spirakis keys)
+        ids = sorted(ids, key=lambda p: rng.random() ** (1.0 / weights[p]), reverse=True)[:k]
+    shares = [weights[p] * rng.gammavariate(4.0, 0.25) for p in ids]
+    results = sorted(zip(ids, _split_votes(valid, shares)), key=lambda r: -r[1])
+    return {"voters": voters, "valid": valid, "invalid": invalid, "blank": blank,
+            "results": [list(r) for r in results]}
+
+
+def set_margin(ballot: Dict[str, Any], rng: random.Random, danger: bool):
+    """
+    Move ballots so the invalid count is above (danger) or below the winning
+    margin; the ballot total is unchanged
+    """
+    res = ballot["results"]
+    if len(res) < 2:
+        return
+    margin = res[0][1] - res[1][1]
+    if danger and ballot["invalid"] <= margin:
+        # Shift winner votes to the runner-up until the margin is below the invalid count
+        target = rng.randint(0, max(ballot["invalid"] - 1, 0))
+        moved = (margin - target) // 2
+        res[0][1] -= moved
+        res[1][1] += moved
+        if ballot["invalid"] <= res[0][1] - res[1][1]:
+            ballot["invalid"] += 1
+            ballot["valid"] -= 1
+            res[0][1] -= 1
+    elif not danger and ballot["invalid"] >= margin:
+        # Count part of the invalid ballots as valid votes for the winner
+        keep = margin // 2
+        res[0][1] += ballot["invalid"] - keep
+        ballot["valid"] += ballot["invalid"] - keep
+        ballot["invalid"] = keep
+    res.sort(key=lambda r: -r[1])
+
+
+class SyntheticElection:
+    """A seeded draw of both elections at `scale` × today's constituencies"""
+
+    def __init__(self, scale: int = 1, seed: int = 0, surplus: float = 0.02, danger: float = 0.02,
+                 typos: float = 0.01, reference_dir: Path = REFERENCE_DIR):
+        self.scale = scale
+        self.seed = seed
+        self.rates = {"surplus": surplus, "danger": danger, "province_typo": typos}
+        self.ref = load_reference(reference_dir)
+        self.party_names = {int(p["id"]): p["name"] for p in self.ref["parties"]}
+        self.anomalies: List[Dict[str, Any]] = []
+        self.constituencies = self._layout()
+        self.election66 = self._draw("2566")
+        self.election69 = self._draw("2569")
+        self._inject_typos()
+
+    def _layout(self) -> List[Dict[str, Any]]:
+        """(prov_id, province names, cons_no, registered voters) of every synthetic constituency"""
+        rng = random.Random(f"{self.seed}:layout")
+        base = sorted(self.ref["constituencies"], key=lambda c: (c["prov_id"], c["cons_no"]))
+        out = []
+        for copy in range(self.scale):
+            for c in base:
+                prov = self.ref["provinces"][c["prov_id"]]
+                registered = c["registered_vote"] if copy == 0 else round(c["registered_vote"] * rng.uniform(0.85, 1.15))
+                out.append({
+                    "prov_id": c["prov_id"],
+                    "province_thai": prov["province"],
+                    "province_eng": prov["eng"],
+                    "cons_no": c["cons_no"] + copy * 1000,
+                    "zone": c.get("zone", []),
+                    "registered": registered,
+                })
+        return out
+
+    def _pick(self, rng: random.Random, kind: str) -> set:
+        n = len(self.constituencies)
+        return set(rng.sample(range(n), min(n, round(self.rates[kind] * n))))
+
+    def _draw(self, year: str) -> List[Dict[str, Dict[str, Any]]]:
+        """Constituency and party-list counts for every constituency, anomalies included"""
+        rng = random.Random(f"{self.seed}:{year}")
+        # National popularity from the real 2566 party-list vote, varied per election and province
+        total = sum(self.ref["party_votes"].values()) or 1
+        national = {pid: (self.ref["party_votes"].get(pid, 0) / total + 0.002) * rng.lognormvariate(0, 0.2)
+                    for pid in self.party_names}
+        regional: Dict[str, Dict[int, float]] = {}
+
+        surplus, danger = self._pick(rng, "surplus"), self._pick(rng, "danger")
+        draws = []
+        for i, c in enumerate(self.constituencies):
+            weights = regional.get(c["prov_id"])
+            if weights is None:
+                weights = regional[c["prov_id"]] = {p: w * rng.lognormvariate(0, 0.5) for p, w in national.items()}
+            voters = round(c["registered"] * rng.uniform(0.62, 0.82))
+            pl_voters = voters
+            if i in surplus:
+                pl_voters = max(0, voters - rng.choice((-1, 1)) * rng.randint(50, 3000))
+            ballots = {
+                "constituency": draw_ballot(rng, voters, weights, rng.randint(6, 12)),
+                "party_list": draw_ballot(rng, pl_voters, weights, None),
+            }
+
+            danger_ballot = rng.choice(BALLOTS) if i in danger else None
+            for b in BALLOTS:
+                set_margin(ballots[b], rng, b == danger_ballot)
+
+            key = f"{c['prov_id']}_{c['cons_no']}"
+            if i in surplus:
+                self.anomalies.append({"election": year, "kind": "surplus", "key": key,
+                                       "ballot_surplus": voters - pl_voters})
+            if danger_ballot:
+                ballot = ballots[danger_ballot]
+                self.anomalies.append({"election": year, "kind": "danger", "key": key, "ballot": danger_ballot,
+                                       "invalid": ballot["invalid"],
+                                       "margin": ballot["results"][0][1] - ballot["results"][1][1]})
+            draws.append(ballots)
+        return draws
+
+    def _inject_typos(self):
+        """Province names as written per ballot in the 2569 sources, typos included"""
+        rng = random.Random(f"{self.seed}:typos")
+        names = {p["province"] for p in self.ref["provinces"].values()}
+        self.province_text = [{b: c["province_thai"] for b in BALLOTS} for c in self.constituencies]
+        for i in sorted(self._pick(rng, "province_typo")):
+            c = self.constituencies[i]
+            ballot = rng.choice(BALLOTS)
+            typo = ocr_typo(c["province_thai"], rng, names)
+            self.province_text[i][ballot] = typo
+            self.anomalies.append({"election": "2569", "kind": "province_typo", "key": f"{c['prov_id']}_{c['cons_no']}",
+                                   "ballot": ballot, "province_thai": c["province_thai"], "written": typo})
+
+    # ══════════════════════════════════════════════════════════════════════
+    # WRITERS
+    # ══════════════════════════════════════════════════════════════════════
+
+    def ocr_document(self, i: int, ballot: str) -> Dict[str, Any]:
+        """OCR result document of one constituency and ballot (matched/<ballot> schema)"""
+        c, b = self.constituencies[i], self.election69[i][ballot]
+        return {
+            "province_name_normalized": self.province_text[i][ballot],
+            "constituency_number": c["cons_no"],
+            "summary": {
+                "good_votes": b["valid"],
+                "invalid_votes": b["invalid"],
+                "no_votes": b["blank"],
+                "voters_came": b["voters"],
+            },
+            "results": [{"party": self.party_names[p], "votes": v} for p, v in b["results"]],
+        }
+
+    def write_ocr(self, root: Path) -> Tuple[Path, Path]:
+        """root/constituency/ and root/party_list/, one <prov_id>_<cons_no>.json per constituency"""
+        dirs = {b: Path(root) / b for b in BALLOTS}
+        for folder in dirs.values():
+            folder.mkdir(parents=True, exist_ok=True)
+        for i, c in enumerate(self.constituencies):
+            for b, folder in dirs.items():
+                with open(folder / f"{c['prov_id']}_{c['cons_no']}.json", "w", encoding="utf-8") as f:
+                    json.dump(self.ocr_document(i, b), f, ensure_ascii=False)
+        return dirs["constituency"], dirs["party_list"]
+
+    def _ect_totals(self, rows: List[Tuple[Dict, Dict]], registered: int) -> Dict[str, Any]:
+        """Ballot totals and percentages as ECT reports them for a set of constituencies"""
+        out: Dict[str, Any] = {}
+        for prefix, ballot in (("", "constituency"), ("party_list_", "party_list")):
+            t = {f: sum(r[ballot][f] for r in rows) for f in ("voters", "valid", "invalid", "blank")}
+            out[f"{prefix}turn_out"] = t["voters"]
+            out[f"{prefix}valid_votes"] = t["valid"]
+            out[f"{prefix}invalid_votes"] = t["invalid"]
+            out[f"{prefix}blank_votes"] = t["blank"]
+            out[f"{prefix}percent_turn_out"] = round(t["voters"] / registered * 100, 5) if registered else 0.0
+            for f in ("valid", "invalid", "blank"):
+                out[f"{prefix}percent_{f}_votes"] = round(t[f] / t["voters"] * 100, 5) if t["voters"] else 0.0
+        return out
+
+    def _candidate_name(self, rng: random.Random) -> str:
+        return f"{rng.choice(('นาย', 'นาง', 'นางสาว'))}{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+
+    def ect_files(self) -> Dict[str, Any]:
+        """{file name: content} of the th_election66_* files (2566 draw)"""
+        rng = random.Random(f"{self.seed}:names")
+        by_prov: Dict[str, List[int]] = {}
+        for i, c in enumerate(self.constituencies):
+            by_prov.setdefault(c["prov_id"], []).append(i)
+
+        info_cons, info_cand, result_province = [], [], []
+        for prov_id, idx in by_prov.items():
+            cons_rows = []
+            prov_party: Dict[int, Dict[str, float]] = {}
+            for i in idx:
+                c, d = self.constituencies[i], self.election66[i]
+                cons_id = f"{prov_id}_{c['cons_no']}"
+                info_cons.append({"cons_id": cons_id, "cons_no": c["cons_no"], "prov_id": prov_id,
+                                  "zone": c["zone"], "registered_vote": c["registered"]})
+                candidates = []
+                order = list(range(1, len(d["constituency"]["results"]) + 1))
+                rng.shuffle(order)
+                for rank, ((party_id, votes), no) in enumerate(zip(d["constituency"]["results"], order), 1):
+                    app_id = f"{cons_id}_{no}"
+                    info_cand.append({"mp_app_id": app_id, "mp_app_no": no, "mp_app_party_id": party_id,
+                                      "mp_app_name": self._candidate_name(rng), "image_url": ""})
+                    candidates.append({"mp_app_id": app_id, "mp_app_vote": float(votes), "party_id": party_id,
+                                       "mp_app_rank": rank})
+                    agg = prov_party.setdefault(party_id, {"party_list_vote": 0, "party_cons_votes": None,
+                                                           "first_mp_app_count": None})
+                    # ECT leaves both null for parties without constituency candidates in the province
+                    agg["party_cons_votes"] = (agg["party_cons_votes"] or 0.0) + votes
+                    agg["first_mp_app_count"] = (agg["first_mp_app_count"] or 0.0) + (rank == 1)
+                for party_id, votes in d["party_list"]["results"]:
+                    prov_party.setdefault(party_id, {"party_list_vote": 0, "party_cons_votes": None,
+                                                     "first_mp_app_count": None})["party_list_vote"] += votes
+
+                cons_rows.append({
+                    "cons_id": cons_id,
+                    **self._ect_totals([d], c["registered"]),
+                    "note_cons": None, "note_party": None, "note_candidate_cons": None, "note_candidate_party": None,
+                    "candidates": candidates,
+                    "result_party": [{"party_id": p, "party_list_vote": v} for p, v in d["party_list"]["results"]],
+                })
+
+            registered = sum(self.constituencies[i]["registered"] for i in idx)
+            result_province.append({
+                "prov_id": prov_id,
+                **self._ect_totals([self.election66[i] for i in idx], registered),
+                "total_registered_vote": registered,
+                "result_party": sorted(({"party_id": p, **agg} for p, agg in prov_party.items()),
+                                       key=lambda r: -r["party_list_vote"]),
+                "constituencies": cons_rows,
+            })
+
+        registered = sum(c["registered"] for c in self.constituencies)
+        provinces = [{**p, "total_registered_vote": sum(r["total_registered_vote"] for r in result_province
+                                                         if r["prov_id"] == p["prov_id"])}
+                     for p in self.ref["province_info"]["province"]]
+        return {
+            "th_election66_info_province.json": {"total_registered_vote": registered, "province": provinces},
+            "th_election66_info_constituency.json": info_cons,
+            "th_election66_info_mp_candidate.json": info_cand,
+            "th_election66_info_party_overview.json": self.ref["parties"],
+            "th_election66_stats_cons.json": {
+                **self._ect_totals(self.election66, registered),
+                "result_province": result_province,
+                "last_update": SYNTH_TIMESTAMP,
+                "processor": "synth_data.py",
+                "source": f"synthetic (scale={self.scale}, seed={self.seed})",
+                "acknowledgement": "",
+            },
+        }
+
+    def write_ect(self, out_dir: Path) -> Path:
+        out_dir = Path(out_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        for name, content in self.ect_files().items():
+            with open(out_dir / name, "w", encoding="utf-8") as f:
+                json.dump(content, f, ensure_ascii=False)
+        return out_dir
+
+    def excel_rows(self) -> Dict[str, List[tuple]]:
+        """
+        The 94% workbook's sheets as header + rows: one row per constituency
+        and candidate / party by rank (party list: the EXCEL_PARTY_ROWS leading parties)
+        """
+        sheets = {}
+        for sheet, ballot, party_col, limit in (("สสแบ่งเขต", "constituency", "พรรคที่สังกัด", None),
+                                                ("party list", "party_list", "พรรคการเมือง", EXCEL_PARTY_ROWS)):
+            rows = [("จังหวัด", "เขตเลือกตั้งที่", "ลำดับคะแนน", "ผู้มาใช้สิทธิ์", "บัตรดี", "บัตรเสีย",
+                     "บัตรไม่เลือกผู้ใด", "คะแนนเสียง", party_col)]
+            for i, c in enumerate(self.constituencies):
+                b = self.election69[i][ballot]
+                province = self.province_text[i][ballot]
+                for rank, (party_id, votes) in enumerate(b["results"][:limit], 1):
+                    rows.append((province, c["cons_no"], rank, b["voters"], b["valid"], b["invalid"], b["blank"],
+                                 votes, self.party_names[party_id]))
+            sheets[sheet] = rows
+        return sheets
+
+    def write_excel(self, path: Path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write-only mode streams the rows instead of building every cell in memory
+        wb = openpyxl.Workbook(write_only=True)
+        for sheet, rows in self.excel_rows().items():
+            ws = wb.create_sheet(sheet)
+            for row in rows:
+                ws.append(row)
+        wb.save(path)
+        return path
+
+    def write_stations(self, path: Path) -> Path:
+        """
+        stations.csv: every constituency's 2569 counts split over polling
+        stations of ~STATION_SIZE registered voters. Both ballots of a
+        station add up to the same total, except in the stations that carry
+        a `surplus` anomaly; their unit numbers are added to the anomaly.
+        """
+        from stations import STATION_COLUMNS
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        rng = np.random.default_rng([self.seed, 6901])
+        surplus = {a["key"]: a for a in self.anomalies if a["kind"] == "surplus" and a["election"] == "2569"}
+
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(STATION_COLUMNS)
+            for i, c in enumerate(self.constituencies):
+                ballots = self.election69[i]
+                n = max(1, round(c["registered"] / STATION_SIZE))
+                share = rng.dirichlet(np.full(n, 50.0))
+                eligible = rng.multinomial(c["registered"], share)
+                voters = {"constituency": rng.multinomial(ballots["constituency"]["voters"], share)}
+
+                key = f"{c['prov_id']}_{c['cons_no']}"
+                pl = voters["constituency"].copy()
+                delta = ballots["constituency"]["voters"] - ballots["party_list"]["voters"]
+                if delta:
+                    # Spread the mismatch over a few stations, ~200 ballots at most each
+                    k = int(min(n, max(rng.integers(1, 4), -(-abs(delta) // 200))))
+                    units = rng.choice(n, size=k, replace=False)
+                    parts = rng.multinomial(abs(delta), np.full(k, 1.0 / k))
+                    if delta > 0 and np.any(pl[units] < parts):
+                        units, parts = np.arange(n), rng.multinomial(delta, pl / pl.sum())
+                    pl[units] -= np.sign(delta) * parts
+                    if key in surplus:
+                        surplus[key]["stations"] = sorted(int(u) + 1 for u in units[parts > 0])
+                voters["party_list"] = pl
+
+                cols = {}
+                for prefix, ballot in (("c", "constituency"), ("p", "party_list")):
+                    b, v = ballots[ballot], voters[ballot]
+                    weights = v / v.sum() if v.sum() else np.full(n, 1.0 / n)
+                    invalid = rng.multinomial(b["invalid"], weights)
+                    blank = rng.multinomial(b["blank"], weights)
+                    cols[f"{prefix}_valid"], cols[f"{prefix}_invalid"], cols[f"{prefix}_blank"] = \
+                        v - invalid - blank, invalid, blank
+
+                zone = c["zone"] or [""]
+                writer.writerows(zip(
+                    [c["prov_id"]] * n, [c["cons_no"]] * n, [zone[u * len(zone) // n] for u in range(n)],
+                    range(1, n + 1), eligible.tolist(),
+                    *(cols[k].tolist() for k in ("c_valid", "c_invalid", "c_blank", "p_valid", "p_invalid", "p_blank")),
+                ))
+        return path
+
+    def write(self, out: Path, formats=DEFAULT_FORMATS) -> Dict[str, Path]:
+        """Write the requested formats under `out` (data/-like layout) plus anomalies.json"""
+        out = Path(out)
+        paths = {}
+        if "ect" in formats:
+            paths["election66"] = self.write_ect(out / "election66")
+        if "ocr" in formats:
+            paths["ocr_constituency"], paths["ocr_party_list"] = self.write_ocr(out / "ocr")
+        if "excel" in formats:
+            paths["excel"] = self.write_excel(out / "election69" / EXCEL_NAME)
+        if "stations" in formats:
+            paths["stations"] = self.write_stations(out / "election69" / "stations" / "stations.csv")
+
+        paths["anomalies"] = out / "anomalies.json"
+        with open(paths["anomalies"], "w", encoding="utf-8") as f:
+            json.dump({
+                "scale": self.scale,
+                "seed": self.seed,
+                "rates": self.rates,
+                "constituencies": len(self.constituencies),
+                "anomalies": self.anomalies,
+            }, f, ensure_ascii=False, indent=1)
+        return paths
+
+
+def use_sources(out: Path):
+    """Point the builders' module-level source paths at a synthetic tree written by `write`"""
+    import build_election_data
+    import constituency_registry
+    import election_store
+    import extract_94pct_data
+    import party_registry
+    import province_shards
+    import split_data
+    import stations
+
+    out = Path(out)
+    build_election_data.ELECTION66_JSON_DIR = out / "election66"
+    constituency_registry.ELECTION66_DIR = out / "election66"
+    party_registry.ELECTION66_DIR = out / "election66"
+    build_election_data.ELECTION69_CONST_DIR = out / "ocr" / "constituency"
+    build_election_data.ELECTION69_PL_DIR = out / "ocr" / "party_list"
+    split_data.ELECTION66_DIR = out / "election66"
+    election_store.ELECTION66_DIR = out / "election66"
+    province_shards.ELECTION66_DIR = out / "election66"
+    extract_94pct_data.EXCEL_PATH = out / "election69" / EXCEL_NAME
+    stations.STATION_DIR = out / "election69" / "stations"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write seeded synthetic OCR, ECT and 94% workbook inputs")
+    parser.add_argument("-o", "--out", required=True, help="Output directory")
+    parser.add_argument("--scale", type=int, default=1, help="Multiple of today's constituency count (default: 1)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    parser.add_argument("--surplus", type=float, default=0.02,
+                        help="Fraction of constituencies whose two ballots add up differently (default: 0.02)")
+    parser.add_argument("--danger", type=float, default=0.02,
+                        help="Fraction of constituencies with invalid ballots > margin on one ballot (default: 0.02)")
+    parser.add_argument("--typos", type=float, default=0.01,
+                        help="Fraction of constituencies with a province-name typo on one ballot (default: 0.01)")
+    parser.add_argument("--formats", nargs="+", choices=FORMATS, default=list(DEFAULT_FORMATS),
+                        help=f"Formats to write (default: {' '.join(DEFAULT_FORMATS)})")
+    args = parser.parse_args()
+
+    synth = SyntheticElection(args.scale, args.seed, args.surplus, args.danger, args.typos)
+    paths = synth.write(Path(args.out), args.formats)
+
+    counts: Dict[str, int] = {}
+    for a in synth.anomalies:
+        counts[f"{a['kind']} ({a['election']})"] = counts.get(f"{a['kind']} ({a['election']})", 0) + 1
+    print(f"✓ {len(synth.constituencies):,} constituencies (scale={args.scale}, seed={args.seed})")
+    for name, path in paths.items():
+        print(f"  {name:<18} {path}")
+    for kind, n in sorted(counts.items()):
+        print(f"  ⚠️  {kind}: {n}")
+
+
+if __name__ == "__main__":
+    main()
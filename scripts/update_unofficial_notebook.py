@@ -81,36 +81,15 @@ var PARTYLIST_RAW = {pl_json};
         f.write(js_content)
     print(f"✓ Exported {output_js}")
 
-    # ARCHIVING
-    archives_dir = Path('../data/archives')
-    archives_dir.mkdir(exist_ok=True, parents=True)
-    
+    # ARCHIVING (content-addressed store; scripts/ is on sys.path from the loading cell)
+    from archive_store import ArchiveStore
     timestamp_file = datetime.now().strftime("%Y%m%d_%H%M%S")
-    archive_filename = f"election_data_94pct_{timestamp_file}.js"
-    archive_path = archives_dir / archive_filename
-    
-    with open(archive_path, 'w', encoding='utf-8') as f:
-        f.write(js_content)
-    print(f"✓ Archived to {archive_path}")
-
-    # UPDATE MANIFEST
-    manifest_file = archives_dir / 'manifest.json'
-    if manifest_file.exists():
-        with open(manifest_file, 'r', encoding='utf-8') as f:
-            manifest = json.load(f)
-    else:
-        manifest = []
-    
-    archive_id = f"94pct_{timestamp_file}"
-    manifest.append({
-        "id": archive_id,
-        "name": f"Unofficial 94%: {timestamp_str}",
-        "file": f"data/archives/{archive_filename}"
-    })
-    
-    with open(manifest_file, 'w', encoding='utf-8') as f:
-        json.dump(manifest, f, indent=2, ensure_ascii=False)
-    print("✓ Manifest updated.")
+    entry = ArchiveStore(Path('../data/archives')).add(
+        const_raw, pl_raw,
+        name=f"Unofficial 94%: {timestamp_str}",
+        snapshot_id=f"94pct_{timestamp_file}",
+    )
+    print(f"✓ Archived as {entry['id']}; manifest updated.")
 
 # Execution call
 # Assumes 'voters' dataframe is available from the previous cells
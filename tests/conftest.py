@@ -0,0 +1,43 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# The scripts import each other as top-level modules
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+# Module-level source paths synth_data.use_sources() repoints
+SOURCE_PATHS = {
+    "build_election_data": ("ELECTION66_JSON_DIR", "ELECTION69_CONST_DIR", "ELECTION69_PL_DIR"),
+    "constituency_registry": ("ELECTION66_DIR",),
+    "party_registry": ("ELECTION66_DIR",),
+    "split_data": ("ELECTION66_DIR",),
+    "election_store": ("ELECTION66_DIR",),
+    "province_shards": ("ELECTION66_DIR",),
+    "extract_94pct_data": ("EXCEL_PATH",),
+    "stations": ("STATION_DIR",),
+}
+
+
+@pytest.fixture(scope="session")
+def synthetic_tree(tmp_path_factory) -> Path:
+    """A seeded synthetic ECT 2566 + OCR tree (synth_data.py), written once per session"""
+    from synth_data import SyntheticElection
+
+    root = tmp_path_factory.mktemp("synthetic")
+    SyntheticElection(1, 0, typos=0).write(root, formats=("ect", "ocr"))
+    return root
+
+
+@pytest.fixture
+def synthetic(synthetic_tree, monkeypatch) -> Path:
+    """The builders pointed at the synthetic tree for the length of one test"""
+    import importlib
+    from synth_data import use_sources
+
+    for name, attrs in SOURCE_PATHS.items():
+        module = importlib.import_module(name)
+        for attr in attrs:
+            monkeypatch.setattr(module, attr, getattr(module, attr))
+    use_sources(synthetic_tree)
+    return synthetic_tree
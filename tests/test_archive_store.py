@@ -0,0 +1,95 @@
+"""archive_store.ArchiveStore: keyframe + delta round trips, dedupe and compaction"""
+
+import copy
+
+import pytest
+
+from archive_store import ArchiveStore
+
+
+def snapshot(n=40, seed=0):
+    const = [{"province_thai": f"จังหวัด{i // 4}", "cons_no": i % 4 + 1, "invalid": 100 + i + seed,
+              "blank": 50 + i, "margin": 1000 - i, "winner_party": "ก"} for i in range(n)]
+    pl = [{**r, "winner_party": "ข"} for r in const]
+    return const, pl
+
+
+def edit(const, pl):
+    """A later count: a few changed fields, one unset, one removed, one added and a reorder"""
+    const, pl = copy.deepcopy(const), copy.deepcopy(pl)
+    const[0]["invalid"] += 7
+    const[1]["winner_party"] = "ค"
+    const[2].pop("blank", None)
+    const[3]["invalid"] = float(const[3]["invalid"])
+    const.pop(5)
+    const.append({"province_thai": "ใหม่", "cons_no": 1, "invalid": 1, "blank": 2, "margin": 3, "winner_party": "ก"})
+    const[6], const[7] = const[7], const[6]
+    const[8] = {k: const[8][k] for k in reversed(list(const[8]))}
+    pl[0]["blank"] += 1
+    return const, pl
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ArchiveStore(tmp_path / "archives")
+
+
+def test_round_trip_keyframe_and_delta(store):
+    first = snapshot()
+    second = edit(*first)
+    e1 = store.add(*first, snapshot_id="s1")
+    e2 = store.add(*second, snapshot_id="s2")
+    assert e1["base"] is None
+    assert e2["base"] == e1["hash"]
+    assert store.load("s1") == first
+    assert store.load("s2") == second
+    # Types survive the delta (an int that became a float is a change)
+    assert type(store.load("s2")[0][3]["invalid"]) is float
+
+    reopened = ArchiveStore(store.root)
+    assert reopened.load("s2") == second
+
+
+def test_identical_snapshots_are_deduplicated(store):
+    first = snapshot()
+    store.add(*first, snapshot_id="s1")
+    objects = sorted(store.objects_dir.iterdir())
+    e2 = store.add(*copy.deepcopy(first), snapshot_id="s2")
+    assert e2["bytes"] == 0 and e2["hash"] == store.entry("s1")["hash"]
+    assert sorted(store.objects_dir.iterdir()) == objects
+    assert store.load("s2") == first
+
+
+def test_duplicate_ids_get_a_suffix(store):
+    store.add(*snapshot(), snapshot_id="s")
+    e = store.add(*snapshot(seed=1), snapshot_id="s")
+    assert e["id"] != "s" and e["id"].startswith("s_")
+
+
+def test_compact_preserves_every_retained_snapshot(store):
+    snaps = {}
+    current = snapshot()
+    for i in range(6):
+        snaps[f"s{i}"] = current
+        store.add(*current, snapshot_id=f"s{i}")
+        current = edit(*current)
+
+    assert store.compact() == {"snapshots_dropped": 0, "objects_removed": 0}
+    for sid, data in snaps.items():
+        assert store.load(sid) == data
+
+    # The keyframe's own entry goes, but the deltas that need it keep it alive
+    result = store.compact(keep_last=2, keep_ids=["s1"])
+    assert result["snapshots_dropped"] == 3
+    assert [e["id"] for e in store.manifest] == ["s1", "s4", "s5"]
+    reopened = ArchiveStore(store.root)
+    for sid in ("s1", "s4", "s5"):
+        assert reopened.load(sid) == snaps[sid]
+
+
+def test_legacy_entries_without_a_file_are_dropped(tmp_path):
+    root = tmp_path / "archives"
+    root.mkdir()
+    (root / "manifest.json").write_text(
+        '[{"id": "latest", "name": "Latest (Active)", "file": "election_data_generated.js"}]', encoding="utf-8")
+    assert ArchiveStore(root).manifest == []
@@ -0,0 +1,33 @@
+"""artifacts.write_json_artifacts: the compressed siblings always agree with X.json"""
+
+import gzip
+import json
+
+import artifacts
+from artifacts import load_dataset, write_dataset_json, write_json_artifacts
+
+
+def test_siblings_match_and_are_not_older(tmp_path):
+    path = tmp_path / "x.json"
+    written = write_json_artifacts(path, {"a": [1, 2, 3]})
+    assert gzip.decompress((tmp_path / "x.json.gz").read_bytes()) == path.read_bytes()
+    for sibling in written[1:]:
+        assert sibling.stat().st_mtime_ns >= path.stat().st_mtime_ns
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_stale_brotli_sibling_is_removed_without_brotli(tmp_path, monkeypatch):
+    path = tmp_path / "x.json"
+    (tmp_path / "x.json.br").write_bytes(b"old")
+    monkeypatch.setattr(artifacts, "brotli", None)
+    written = write_json_artifacts(path, {"a": 1})
+    assert not (tmp_path / "x.json.br").exists()
+    assert written == [path, tmp_path / "x.json.gz"]
+    assert json.loads(path.read_text()) == {"a": 1}
+
+
+def test_dataset_round_trip_without_build_time(tmp_path):
+    path = tmp_path / "d.json"
+    write_dataset_json(path, [{"cons_no": 1}], [{"cons_no": 2}])
+    assert "generated" not in json.loads(path.read_text())
+    assert load_dataset(path) == ([{"cons_no": 1}], [{"cons_no": 2}])
@@ -0,0 +1,33 @@
+"""asset_manifest.build_asset_manifest: hashed names and the generations it keeps"""
+
+import json
+
+from asset_manifest import build_asset_manifest
+from artifacts import write_dataset_json
+
+
+def publish(data_dir, n):
+    write_dataset_json(data_dir / "election66_data.json", [{"cons_no": n}], [])
+    return build_asset_manifest(data_dir)["datasets"]["election66_data"]["file"]
+
+
+def test_unchanged_records_keep_their_hashed_name(tmp_path):
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    assert publish(data_dir, 1) == publish(data_dir, 1)
+    entry = json.loads((data_dir / "assets.json").read_text())["datasets"]["election66_data"]
+    assert entry["generated"]
+    assert "generated" not in json.loads((tmp_path / entry["file"]).read_text())
+
+
+def test_previous_generation_is_kept(tmp_path):
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    first = publish(data_dir, 1)
+    second = publish(data_dir, 2)
+    assert (tmp_path / first).exists() and (tmp_path / second).exists()
+
+    third = publish(data_dir, 3)
+    assert not (tmp_path / first).exists()
+    assert not (tmp_path / (first + ".gz")).exists()
+    assert (tmp_path / second).exists() and (tmp_path / third).exists()
@@ -0,0 +1,50 @@
+"""comparisons.compare_tables: pairing as the pages do it, and sort permutations that keep Left order on ties"""
+
+from comparisons import compare_tables
+
+
+def row(province, cons_no, invalid, turn_out=1000, margin=100, party="ก"):
+    return {
+        "province_thai": province, "province_eng": province.upper(), "cons_no": cons_no,
+        "turn_out": turn_out, "invalid": invalid, "percent_invalid": invalid / turn_out * 100,
+        "blank": invalid // 2, "margin": margin, "winner_party": party,
+    }
+
+
+def test_pairs_on_province_and_number():
+    left = [row("a", 1, 10), row("a", 2, 20), row("b", 1, 30), row("c", 1, 40)]
+    right = [row("b", 1, 35), row("d", 1, 50), row("a", 1, 150), row("a", 2, 20)]
+    c = compare_tables(left, right)
+
+    assert (c["left_rows"], c["right_rows"]) == (4, 4)
+    # Matched pairs in Left order, indexing into each side's own list
+    assert c["left"] == [0, 1, 2]
+    assert c["right"] == [2, 3, 0]
+    assert c["missing_from_r"] == [3]
+    assert c["missing_from_l"] == [1]
+    assert c["metrics"]["invalid_change"] == [140, 0, 5]
+    # Right invalid above the Right margin
+    assert c["metrics"]["danger_invalid"] == [1, 0, 0]
+
+
+def test_sorts_keep_left_order_on_ties():
+    invalid = [30, 10, 30, 20, 10, 30]
+    left = [row("p", i + 1, 0) for i in range(len(invalid))]
+    right = [row("p", i + 1, v) for i, v in enumerate(invalid)]
+    c = compare_tables(left, right)
+    change = c["metrics"]["invalid_change"]
+    rows = range(len(change))
+
+    for page in ("invalid", "blank"):
+        by_change = c["sorts"][page]["invalid_change" if page == "invalid" else "pct_change"]
+        if page == "invalid":
+            # The pages' comparator b - a (desc) and, with its arguments swapped, a - b (asc)
+            assert by_change["desc"] == sorted(rows, key=lambda i: -change[i]) == [0, 2, 5, 3, 1, 4]
+            assert by_change["asc"] == sorted(rows, key=lambda i: change[i]) == [1, 4, 3, 0, 2, 5]
+        for perms in c["sorts"][page].values():
+            assert sorted(perms["desc"]) == sorted(perms["asc"]) == list(rows)
+
+    # Every row ties on the party key: the secondary key orders them, ties again in Left order
+    party = c["sorts"]["invalid"]["party_2569"]
+    assert party["desc"] == c["sorts"]["invalid"]["pct_change"]["desc"]
+    assert party["asc"] == [1, 4, 3, 0, 2, 5]
@@ -0,0 +1,80 @@
+"""constituency_registry: dense ids over the ECT 2566 list plus the constituencies drawn since"""
+
+import json
+import shutil
+
+import pytest
+
+from constituency_registry import (
+    ADDED_CONSTITUENCIES, ELECTION66_DIR, ConstituencyKeyError, ConstituencyRegistry, load_registry,
+)
+from name_resolver import MIN_CONFIDENCE
+
+CONSTITUENCY_FILE = "th_election66_info_constituency.json"
+PROVINCE_FILE = "th_election66_info_province.json"
+
+
+@pytest.fixture(scope="module")
+def registry():
+    return load_registry(ELECTION66_DIR)
+
+
+def test_ids_follow_the_2566_list_then_the_added_constituencies(registry):
+    with open(ELECTION66_DIR / CONSTITUENCY_FILE, "r", encoding="utf-8-sig") as f:
+        keys = sorted({(c["prov_id"], int(c["cons_no"])) for c in json.load(f)})
+    assert len(registry) == len(keys) + len(ADDED_CONSTITUENCIES)
+    assert [registry.key(i) for i in range(len(keys))] == [f"{p}_{c}" for p, c in keys]
+    # PTE_8 and SKN_4 are not in the 2566 list and come after it, in that order
+    added = registry.ids(["PTE", "SKN"], [8, 4], "test").tolist()
+    assert added == [len(keys), len(keys) + 1]
+    assert registry.key(added[0]) == "PTE_8" and registry.key(added[1]) == "SKN_4"
+
+
+def test_ids_do_not_depend_on_the_file_order(registry, tmp_path):
+    with open(ELECTION66_DIR / CONSTITUENCY_FILE, "r", encoding="utf-8-sig") as f:
+        constituencies = json.load(f)
+    with open(tmp_path / CONSTITUENCY_FILE, "w", encoding="utf-8") as f:
+        json.dump(constituencies[::-1], f, ensure_ascii=False)
+    shutil.copy(ELECTION66_DIR / PROVINCE_FILE, tmp_path / PROVINCE_FILE)
+    shuffled = ConstituencyRegistry.load(tmp_path)
+    assert shuffled.prov_id.tolist() == registry.prov_id.tolist()
+    assert shuffled.cons_no.tolist() == registry.cons_no.tolist()
+
+
+def test_lookup_by_code_and_number(registry):
+    cid = registry.ids(["BKK", "CMI"], [1, "2"], "test").tolist()
+    assert [registry.key(i) for i in cid] == ["BKK_1", "CMI_2"]
+    assert registry.lookup(["BKK", "XXX", None], [99, 1, 1]).tolist() == [-1, -1, -1]
+
+
+def test_unregistered_keys_raise_naming_every_key(registry):
+    with pytest.raises(ConstituencyKeyError) as e:
+        registry.ids(["BKK", "BKK", "XXX"], [1, 99, 1], "station CSV")
+    assert e.value.keys == ["BKK_99", "XXX_1"]
+    assert e.value.source == "station CSV"
+    assert "2 station CSV keys" in str(e.value)
+    assert isinstance(e.value, KeyError)
+
+
+def test_lookup_by_province_name(registry):
+    bkk1, cmi1 = registry.ids(["BKK", "CMI"], [1, 1], "test").tolist()
+    # Exact, alias (Thai abbreviation) and with the จ. prefix
+    assert registry.ids_by_name(["กรุงเทพมหานคร", "กทม", "จ.เชียงใหม่"], [1, 1, 1], "test").tolist() == [bkk1, bkk1, cmi1]
+    # One OCR slip in nine characters is confident and clear of every other province
+    assert registry.ids_by_name(["เชียงไหม่"], [1], "test").tolist() == [cmi1]
+
+
+def test_unresolved_province_name_raises(registry):
+    m = registry.names.match("เชียง")
+    assert m is not None and m.confidence < MIN_CONFIDENCE
+    with pytest.raises(ConstituencyKeyError) as e:
+        registry.ids_by_name(["เชียง", "กรุงเทพมหานคร"], [1, 1], "OCR")
+    assert e.value.keys == ["เชียง_1"]
+
+
+def test_records_use_their_own_ids_when_every_record_has_one(registry):
+    assert registry.record_ids([{"cid": 5}, {"cid": 7}], "test").tolist() == [5, 7]
+    # Otherwise (older records, or a mix) every record is resolved from its names
+    bkk1, bkk2 = registry.ids(["BKK", "BKK"], [1, 2], "test").tolist()
+    mixed = [{"cid": 5, "province_thai": "กรุงเทพมหานคร", "cons_no": 2}, {"province_thai": "กทม", "cons_no": 1}]
+    assert registry.record_ids(mixed, "test").tolist() == [bkk2, bkk1]
@@ -0,0 +1,86 @@
+"""election_store: build from dataset files, query, and export back to a dataset"""
+
+import pytest
+
+from artifacts import load_dataset, write_dataset_json
+from election_store import ElectionStore, build_store
+
+
+def result(province, cons_no, invalid, blank, margin, winner="เพื่อไทย", runnerup="ก้าวไกล"):
+    valid = 10000
+    return {
+        "province_thai": province, "cons_no": cons_no, "turn_out": valid + invalid + blank,
+        "valid": valid, "invalid": invalid, "blank": blank,
+        "percent_invalid": round(invalid / (valid + invalid + blank) * 100, 4),
+        "winner_party": winner, "winner_votes": 5000 + margin // 2,
+        "runnerup_party": runnerup, "runnerup_votes": 5000 - margin // 2, "margin": margin,
+    }
+
+
+CONST = [
+    result("กรุงเทพมหานคร", 1, 300, 100, 2000),
+    result("กรุงเทพมหานคร", 2, 900, 100, 400),            # invalid danger
+    result("เชียงไหม่", 1, 100, 700, 600, winner="ก้าวไกล", runnerup="เพื่อไทย"),  # OCR slip; blank danger
+    result("ปทุมธานี", 8, 200, 200, 5000, winner="พท."),  # drawn after 2566; abbreviation
+]
+PARTYLIST = [result("กรุงเทพมหานคร", 1, 50, 50, 3000)]
+
+
+@pytest.fixture
+def store(tmp_path):
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    write_dataset_json(data_dir / "election69_ocr.json", CONST, PARTYLIST)
+    counts = build_store(tmp_path / "election.sqlite", data_dir, tmp_path / "archives")
+    assert counts["snapshots"] == 1 and counts["results"] == len(CONST) + len(PARTYLIST)
+    store = ElectionStore(tmp_path / "election.sqlite")
+    yield store
+    store.close()
+
+
+def test_results_carry_registry_ids_and_party_codes(store):
+    rows = store.results(snapshot="election69_ocr")
+    assert [(r["prov_id"], r["cons_no"]) for r in rows] == [("BKK", 1), ("BKK", 2), ("CMI", 1), ("PTE", 8)]
+    # Canonical names from the registry, whatever the file spelled
+    assert rows[2]["province_thai"] == "เชียงใหม่"
+    pt = store.sql("SELECT pid FROM parties WHERE name = 'เพื่อไทย'")[0]["pid"]
+    assert rows[0]["winner_pid"] == rows[3]["winner_pid"] == pt
+
+
+def test_danger_filters(store):
+    assert [r["cons_no"] for r in store.results(danger="invalid")] == [2]
+    assert [r["province_thai"] for r in store.results(danger="blank")] == ["เชียงใหม่"]
+    assert store.results(danger="invalid", ballot="partylist") == []
+    with pytest.raises(ValueError):
+        store.results(danger="turnout")
+
+
+def test_other_filters(store):
+    assert len(store.results(province="กรุงเทพมหานคร")) == 2
+    assert len(store.results(province="BANGKOK")) == len(store.results(province="bangkok")) == 2
+    assert [r["province_thai"] for r in store.results(party="ก้าวไกล")] == ["เชียงใหม่"]
+    assert len(store.results(party="พท.")) == 3
+    assert len(store.results(ballot="partylist")) == 1
+
+
+def test_rebuild_skips_unchanged_snapshots(store, tmp_path):
+    assert store.load_datasets(tmp_path / "data", names=["election69_ocr"]) == 0
+
+
+def test_export_round_trip(store, tmp_path):
+    const, pl = store.export_tables("election69_ocr")
+    assert len(const) == len(CONST) and len(pl) == len(PARTYLIST)
+    for exported, source in zip(const, CONST):
+        for field in ("cons_no", "turn_out", "invalid", "blank", "margin", "winner_votes", "percent_invalid"):
+            assert exported[field] == source[field]
+
+    write_dataset_json(tmp_path / "exported.json", const, pl)
+    again = load_dataset(tmp_path / "exported.json")
+    assert store.load_tables("exported", "dataset", "x", *again) == len(CONST) + len(PARTYLIST)
+    strip = lambda rows: [{k: v for k, v in r.items() if k not in ("snapshot", "created")} for r in rows]
+    for ballot in ("constituency", "partylist"):
+        assert strip(store.results(snapshot="exported", ballot=ballot)) == \
+            strip(store.results(snapshot="election69_ocr", ballot=ballot))
+
+    with pytest.raises(KeyError):
+        store.export_tables("missing")
@@ -0,0 +1,140 @@
+"""http_cache.AsyncFetcher against a local stand-in server: 304s, retries and Retry-After"""
+
+import asyncio
+import gzip
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import http_cache
+from http_cache import AsyncFetcher, FetchError
+
+PAYLOAD = b'{"constituencies": [1, 2, 3]}'
+
+
+class StandIn(BaseHTTPRequestHandler):
+    """Serves PAYLOAD with an ETag; `script` queues statuses to answer first, per path"""
+
+    protocol_version = "HTTP/1.1"
+    etag = '"v1"'
+    script = {}
+    seen = []
+
+    def do_GET(self):
+        self.seen.append((self.path, dict(self.headers)))
+        queued = self.script.get(self.path)
+        if queued:
+            status, headers = queued.pop(0)
+            self._reply(status, b"", headers)
+        elif self.headers.get("If-None-Match") == self.etag:
+            self._reply(304, b"", {"ETag": self.etag})
+        elif "gzip" in self.headers.get("Accept-Encoding", ""):
+            self._reply(200, gzip.compress(PAYLOAD), {"ETag": self.etag, "Content-Encoding": "gzip"})
+        else:
+            self._reply(200, PAYLOAD, {"ETag": self.etag})
+
+    def _reply(self, status, body, headers):
+        self.send_response(status)
+        for k, v in headers.items():
+            self.send_header(k, v)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def base_url():
+    StandIn.script, StandIn.seen, StandIn.etag = {}, [], '"v1"'
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), StandIn)
+    srv.daemon_threads = True
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{srv.server_address[1]}"
+    srv.shutdown()
+    srv.server_close()
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Backoff delays the fetcher asked for, without waiting them out"""
+    delays = []
+    real_sleep = asyncio.sleep
+
+    async def sleep(delay):
+        delays.append(delay)
+        await real_sleep(0)
+
+    monkeypatch.setattr(http_cache.asyncio, "sleep", sleep)
+    return delays
+
+
+def fetch(fetcher, path="/data/stats.json"):
+    try:
+        return asyncio.run(fetcher.fetch(path))
+    finally:
+        fetcher.close()
+
+
+def test_conditional_request_gets_304(base_url, tmp_path):
+    first = fetch(AsyncFetcher(base_url, cache_dir=tmp_path))
+    assert first.status == 200 and first.changed and not first.from_cache
+    assert first.json() == {"constituencies": [1, 2, 3]}
+
+    fetcher = AsyncFetcher(base_url, cache_dir=tmp_path)
+    second = fetch(fetcher)
+    assert StandIn.seen[-1][1].get("If-None-Match") == '"v1"'
+    assert second.status == 304 and not second.changed and second.from_cache
+    assert second.body == PAYLOAD and second.hash == first.hash
+    assert fetcher.stats["not_modified"] == 1 and fetcher.stats["downloaded"] == 0
+
+    # A new validator is downloaded, but the same bytes are not reported as changed
+    StandIn.etag = '"v2"'
+    third = fetch(AsyncFetcher(base_url, cache_dir=tmp_path))
+    assert third.status == 200 and not third.from_cache and not third.changed
+
+
+def test_retries_with_backoff(base_url, tmp_path, sleeps):
+    StandIn.script["/data/stats.json"] = [(503, {}), (502, {})]
+    fetcher = AsyncFetcher(base_url, cache_dir=tmp_path, retries=3, backoff=0.5)
+    result = fetch(fetcher)
+    assert result.status == 200 and result.body == PAYLOAD
+    assert fetcher.stats["retries"] == 2
+    # Exponential backoff with up to 50% jitter
+    assert 0.5 <= sleeps[0] <= 0.75 and 1.0 <= sleeps[1] <= 1.5
+
+
+def test_retry_after_is_honoured(base_url, tmp_path, sleeps):
+    StandIn.script["/data/stats.json"] = [(429, {"Retry-After": "7"}), (503, {"Retry-After": "2"})]
+    result = fetch(AsyncFetcher(base_url, cache_dir=tmp_path, backoff=0.5))
+    assert result.status == 200
+    assert sleeps == [7.0, 2.0]
+
+
+def test_gives_up_after_retries(base_url, tmp_path, sleeps):
+    StandIn.script["/data/stats.json"] = [(503, {})] * 3
+    with pytest.raises(FetchError, match="HTTP 503"):
+        fetch(AsyncFetcher(base_url, cache_dir=tmp_path, retries=2))
+    assert len(sleeps) == 2
+
+
+def test_client_errors_are_not_retried(base_url, tmp_path, sleeps):
+    StandIn.script["/data/stats.json"] = [(404, {})]
+    with pytest.raises(FetchError, match="HTTP 404"):
+        fetch(AsyncFetcher(base_url, cache_dir=tmp_path))
+    assert sleeps == []
+
+
+def test_deferred_responses_are_cached_on_commit(base_url, tmp_path):
+    fetcher = AsyncFetcher(base_url, cache_dir=tmp_path, defer_store=True)
+    assert fetch(fetcher).changed
+    # Not committed (the caller's build failed): the next run downloads it again
+    again = fetch(AsyncFetcher(base_url, cache_dir=tmp_path, defer_store=True))
+    assert again.status == 200 and again.changed
+
+    fetcher = AsyncFetcher(base_url, cache_dir=tmp_path, defer_store=True)
+    fetch(fetcher)
+    fetcher.commit()
+    assert fetch(AsyncFetcher(base_url, cache_dir=tmp_path)).status == 304
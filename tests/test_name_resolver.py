@@ -0,0 +1,55 @@
+"""name_resolver.NameIndex: exact and alias hits, and the confidence / margin rules for fuzzy ones"""
+
+from name_resolver import MIN_CONFIDENCE, MIN_MARGIN, NameIndex, normalize
+
+
+def test_exact_after_normalising():
+    index = NameIndex({"เชียงใหม่": "CMI"}, prefixes=("จังหวัด", "จ."))
+    for text in ("เชียงใหม่", "จ.เชียงใหม่", "จังหวัด เชียงใหม่", "เชียง​ใหม่ "):
+        m = index.resolve(text)
+        assert m.name == "เชียงใหม่" and m.value == "CMI" and m.exact
+    # Nikhahit + sara aa is the same text as sara am
+    assert normalize("นํา") == normalize("นำ")
+
+
+def test_alias_hits_exactly_and_only_exactly():
+    index = NameIndex({"กรุงเทพมหานคร": "BKK", "กระบี่": "KBI"}, {"กทม": "กรุงเทพมหานคร"})
+    m = index.resolve("กทม")
+    assert (m.name, m.value, m.confidence) == ("กรุงเทพมหานคร", "BKK", 1.0)
+    # One edit away from the alias is not a match for it
+    assert index.resolve("กทน") is None
+
+
+def test_fuzzy_accepted_at_the_threshold():
+    index = NameIndex({"abcdefgh": 1, "zyxwvuts": 2})
+    assert index.resolve("abcdefgx") == ("abcdefgh", 1, 0.875)
+    # Two edits in eight: exactly MIN_CONFIDENCE, still usable
+    m = index.resolve("abcdefxx")
+    assert m.confidence == MIN_CONFIDENCE and m.value == 1 and not m.exact
+
+
+def test_fuzzy_rejected_below_the_threshold():
+    index = NameIndex({"abcdefgh": 1, "zyxwvuts": 2})
+    m = index.match("abcdexxx")
+    assert m.name == "abcdefgh" and m.confidence < MIN_CONFIDENCE
+    assert index.resolve("abcdexxx") is None
+    assert index.match("qqqq") is None
+
+
+def test_fuzzy_rejected_when_too_close_to_another_name():
+    index = NameIndex({"abcdefgh": 1, "abcdefgk": 2})
+    m = index.match("abcdefgx")
+    # Both are one edit away: reported below the threshold instead of picking one
+    assert m.confidence < MIN_CONFIDENCE
+    assert index.resolve("abcdefgx") is None
+
+    # Far enough ahead of the runner-up
+    index = NameIndex({"abcdefgh": 1, "abcdefkl": 2})
+    m = index.resolve("abcdefgx")
+    assert m.value == 1 and m.confidence - 0.75 >= MIN_MARGIN
+
+
+def test_runner_up_with_the_same_value_does_not_count():
+    # Two spellings of one province: a tie between them is no ambiguity
+    index = NameIndex({"abcdefgh": 1, "abcdefgk": 1})
+    assert index.resolve("abcdefgx").value == 1
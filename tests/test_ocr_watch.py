@@ -0,0 +1,57 @@
+"""ocr_watch.OcrWatcher: bad OCR files are reported and left out, at startup as while polling"""
+
+import json
+import shutil
+
+import pytest
+
+import ocr_watch
+from ocr_watch import OcrWatcher
+
+
+@pytest.fixture
+def watcher(synthetic, tmp_path, monkeypatch):
+    """A watcher over a private copy of the synthetic OCR folders that publishes nothing"""
+    ocr = tmp_path / "ocr"
+    shutil.copytree(synthetic / "ocr", ocr)
+    monkeypatch.setattr(ocr_watch, "CACHE_DIR", tmp_path / "cache")
+    w = OcrWatcher(ocr / "constituency", ocr / "party_list", derived=False)
+    monkeypatch.setattr(w, "publish", lambda: None)
+    return w
+
+
+def unregistered_copy(folder, name):
+    """An OCR file for a constituency number its province does not have"""
+    row = json.loads((folder / "ACR_1.json").read_text(encoding="utf-8"))
+    row["constituency_number"] = 99
+    (folder / name).write_text(json.dumps(row, ensure_ascii=False), encoding="utf-8")
+
+
+def test_build_leaves_out_bad_files(watcher):
+    folder = watcher.folders["constituency"]
+    expected = len(list(folder.glob("*.json")))
+    unregistered_copy(folder, "ACR_99.json")
+    (folder / "BROKEN.json").write_text("{", encoding="utf-8")
+
+    watcher.build()
+    assert len(watcher.const_raw) == expected
+    assert not any(r["cons_no"] == 99 for r in watcher.const_raw)
+
+
+def test_poll_patches_good_files_only(watcher):
+    watcher.build()
+    folder = watcher.folders["constituency"]
+    before = {(r["province_thai"], r["cons_no"]): r for r in watcher.const_raw}
+
+    unregistered_copy(folder, "ACR_99.json")
+    row = json.loads((folder / "ATG_1.json").read_text(encoding="utf-8"))
+    row["summary"]["invalid_votes"] += 11
+    (folder / "ATG_1.json").write_text(json.dumps(row, ensure_ascii=False), encoding="utf-8")
+
+    keys = watcher.patch(watcher.poll())
+    assert len(keys) == 1
+    after = {(r["province_thai"], r["cons_no"]): r for r in watcher.const_raw}
+    assert after.keys() == before.keys()
+    changed = [k for k in after if after[k] != before[k]]
+    assert len(changed) == 1
+    assert after[changed[0]]["invalid_2569"] == before[changed[0]]["invalid_2569"] + 11
@@ -0,0 +1,60 @@
+"""party_registry: stable pids from the ECT 2566 overview, and name resolution against them"""
+
+import json
+
+import pytest
+
+from party_registry import ADDED_PARTIES, ELECTION66_DIR, UNKNOWN, PartyRegistry, load_party_registry
+
+OVERVIEW_FILE = "th_election66_info_party_overview.json"
+
+
+@pytest.fixture(scope="module")
+def registry():
+    return load_party_registry(ELECTION66_DIR)
+
+
+def pid(registry, name):
+    return next(p["pid"] for p in registry.parties if p["name"] == name)
+
+
+def test_pids_follow_ect_ids_then_the_added_parties(registry):
+    ect = [p for p in registry.parties if p["ect_id"] is not None]
+    assert [p["ect_id"] for p in ect] == sorted(p["ect_id"] for p in ect)
+    assert [p["pid"] for p in registry.parties] == list(range(len(registry)))
+    assert [p["name"] for p in registry.parties[len(ect):]] == [p["name"] for p in ADDED_PARTIES]
+
+
+def test_pids_do_not_depend_on_the_file_order(registry, tmp_path):
+    with open(ELECTION66_DIR / OVERVIEW_FILE, "r", encoding="utf-8-sig") as f:
+        overview = json.load(f)
+    with open(tmp_path / OVERVIEW_FILE, "w", encoding="utf-8") as f:
+        json.dump(overview[::-1], f, ensure_ascii=False)
+    assert PartyRegistry.load(tmp_path).to_table() == registry.to_table()
+
+
+def test_exact_and_prefixed_names(registry):
+    resolved = registry.resolve(["เพื่อไทย", "พรรคเพื่อไทย", "ประชาชน"], "test")
+    assert resolved["เพื่อไทย"] == resolved["พรรคเพื่อไทย"] == ("เพื่อไทย", pid(registry, "เพื่อไทย"))
+    assert resolved["ประชาชน"] == ("ประชาชน", pid(registry, "ประชาชน"))
+
+
+def test_abbreviation_is_an_alias(registry):
+    assert registry.resolve(["พท."], "test")["พท."] == ("เพื่อไทย", pid(registry, "เพื่อไทย"))
+
+
+def test_fuzzy_name_accepted(registry):
+    assert registry.resolve(["ก้าวไกร"], "test")["ก้าวไกร"] == ("ก้าวไกล", pid(registry, "ก้าวไกล"))
+
+
+def test_unresolved_names_and_placeholders_get_unknown(registry):
+    resolved = registry.resolve(["ไทย", "Unknown", ""], "test")
+    # ไทย is closest to เพื่อไทย, but far below the threshold
+    assert resolved["ไทย"] == ("ไทย", UNKNOWN)
+    assert resolved["Unknown"] == ("Unknown", UNKNOWN) and resolved[""] == ("", UNKNOWN)
+    assert registry.codes(["เพื่อไทย", None, "ไทย"], "test").tolist() == [pid(registry, "เพื่อไทย"), UNKNOWN, UNKNOWN]
+
+
+def test_ect_codes(registry):
+    pt = next(p for p in registry.parties if p["name"] == "เพื่อไทย")
+    assert registry.ect_codes([pt["ect_id"], str(pt["ect_id"]), 99999, None]).tolist() == [pt["pid"], pt["pid"], UNKNOWN, UNKNOWN]
@@ -0,0 +1,42 @@
+"""run_report.RunReport: skipped stages keep the measurements of the run that executed them"""
+
+import run_report
+from run_report import RunReport
+
+
+def run(path, skip=()):
+    report = RunReport(path=path)
+    for name in ("split", "cube"):
+        if name in skip:
+            report.skipped(name)
+            continue
+        with report.stage(name):
+            run_report.records(inputs=3, outputs=2)
+    report.write()
+    return report
+
+
+def test_skipped_stage_keeps_previous_entry(tmp_path):
+    path = tmp_path / "run_report.json"
+    first = run(path)
+    second = run(path, skip=("split",))
+
+    split = second.stages[0]
+    assert split["status"] == "skipped"
+    assert split["from_run"] == first.run_id
+    assert split["records"] == {"in": 3, "out": 2, "dropped": 0}
+    assert "from_run" not in second.stages[1]
+
+
+def test_measurements_survive_repeated_skips(tmp_path):
+    path = tmp_path / "run_report.json"
+    first = run(path)
+    run(path, skip=("split", "cube"))
+    third = run(path, skip=("split", "cube"))
+    assert {s["from_run"] for s in third.stages} == {first.run_id}
+    assert all("wall_s" in s for s in third.stages)
+
+
+def test_skip_without_previous_report(tmp_path):
+    report = run(tmp_path / "run_report.json", skip=("split",))
+    assert report.stages[0] == {"name": "split", "status": "skipped"}
@@ -0,0 +1,120 @@
+"""serve.py against real requests: ETags, 304s, precompressed bodies and ranges"""
+
+import gzip
+import http.client
+import os
+import threading
+
+import pytest
+
+from serve import make_server
+
+BODY = b'{"CONST_RAW":[' + b",".join(b'{"cons_no":%d}' % i for i in range(200)) + b"]}"
+
+
+@pytest.fixture
+def server(tmp_path):
+    (tmp_path / "data.json").write_bytes(BODY)
+    (tmp_path / "data.json.gz").write_bytes(gzip.compress(BODY, mtime=0))
+    (tmp_path / "data.0123456789ab.json").write_bytes(BODY)
+    srv = make_server(tmp_path, port=0)
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    yield srv.server_address[1]
+    srv.shutdown()
+    srv.server_close()
+
+
+def get(port, path, **headers):
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+    try:
+        conn.request("GET", path, headers={k.replace("_", "-"): v for k, v in headers.items()})
+        resp = conn.getresponse()
+        return resp.status, resp.headers, resp.read()
+    finally:
+        conn.close()
+
+
+def test_etag_and_not_modified(server):
+    status, headers, body = get(server, "/data.json")
+    assert status == 200 and body == BODY
+    etag = headers["ETag"]
+    assert etag.startswith('"') and not etag.startswith("W/")
+    assert headers["Cache-Control"] == "no-cache"
+
+    status, headers, body = get(server, "/data.json", If_None_Match=etag)
+    assert status == 304 and body == b""
+    assert headers["ETag"] == etag
+
+    status, _, body = get(server, "/data.json", If_None_Match='"stale"')
+    assert status == 200 and body == BODY
+
+
+def test_precompressed_representation(server):
+    status, headers, body = get(server, "/data.json", Accept_Encoding="br, gzip")
+    assert status == 200
+    assert headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(body) == BODY
+    tag = headers["ETag"]
+    assert tag.endswith('-gzip"')
+
+    # The 304 names the representation the client revalidated, not the identity body
+    status, headers, _ = get(server, "/data.json", Accept_Encoding="gzip", If_None_Match=tag)
+    assert status == 304
+    assert headers["ETag"] == tag
+
+
+def test_stale_precompressed_sibling_is_not_served(server, tmp_path):
+    new_body = BODY.replace(b"cons_no", b"cons_id")
+    (tmp_path / "data.json").write_bytes(new_body)
+    st = os.stat(tmp_path / "data.json")
+    os.utime(tmp_path / "data.json.gz", ns=(st.st_atime_ns, st.st_mtime_ns - 10**9))
+
+    # Falls back to compressing the current file on the fly
+    status, headers, body = get(server, "/data.json", Accept_Encoding="gzip")
+    assert status == 200
+    assert gzip.decompress(body) == new_body
+
+    status, headers, body = get(server, "/data.json")
+    assert status == 200 and body == new_body
+
+
+def test_if_modified_since(server):
+    _, headers, _ = get(server, "/data.json")
+    status, _, body = get(server, "/data.json", If_Modified_Since=headers["Last-Modified"])
+    assert status == 304 and body == b""
+
+
+def test_ranges(server):
+    _, headers, _ = get(server, "/data.json")
+    etag = headers["ETag"]
+
+    status, headers, body = get(server, "/data.json", Range="bytes=2-11", Accept_Encoding="gzip")
+    assert status == 206
+    assert body == BODY[2:12]
+    assert headers["Content-Range"] == f"bytes 2-11/{len(BODY)}"
+    assert "Content-Encoding" not in headers
+
+    status, _, body = get(server, "/data.json", Range="bytes=-5")
+    assert status == 206 and body == BODY[-5:]
+
+    status, headers, _ = get(server, "/data.json", Range=f"bytes={len(BODY)}-")
+    assert status == 416
+    assert headers["Content-Range"] == f"bytes */{len(BODY)}"
+
+    # A stale If-Range validator gets the whole body
+    status, _, body = get(server, "/data.json", Range="bytes=0-3", If_Range='"stale"')
+    assert status == 200 and body == BODY
+    status, _, body = get(server, "/data.json", Range="bytes=0-3", If_Range=etag)
+    assert status == 206 and body == BODY[:4]
+
+
+def test_hashed_names_are_immutable(server):
+    _, headers, _ = get(server, "/data.0123456789ab.json")
+    assert "immutable" in headers["Cache-Control"]
+
+
+def test_hidden_files(server, tmp_path):
+    (tmp_path / ".secret").write_bytes(b"x")
+    status, _, _ = get(server, "/.secret")
+    assert status == 404
@@ -0,0 +1,58 @@
+"""snapshot_diff: the touched-keys path over a shared keyframe matches a full diff"""
+
+import copy
+
+from archive_store import ArchiveStore
+from artifacts import write_dataset_json
+from snapshot_diff import diff_snapshots, open_snapshot
+from test_archive_store import edit, snapshot
+
+
+def full_diff(tmp_path, a, b):
+    """Diff of the same data loaded from dataset files, which visits every key"""
+    paths = []
+    for name, data in (("a", a), ("b", b)):
+        path = tmp_path / f"{name}.json"
+        write_dataset_json(path, *data)
+        paths.append(str(path))
+    store = ArchiveStore(tmp_path / "unused")
+    return diff_snapshots(open_snapshot(store, paths[0]), open_snapshot(store, paths[1]))
+
+
+def test_shared_keyframe_diff_equals_full_diff(tmp_path):
+    store = ArchiveStore(tmp_path / "archives")
+    base = snapshot()
+    first = edit(*base)
+    second = copy.deepcopy(first)
+    second[0][10]["invalid"] = 5000      # enters the invalid danger zone
+    second[0][11]["winner_party"] = "ง"
+    second[1][0]["blank"] = 0
+    for sid, data in (("k", base), ("a", first), ("b", second)):
+        store.add(*data, snapshot_id=sid)
+    a, b = open_snapshot(store, "a"), open_snapshot(store, "b")
+    assert a.base == b.base == store.entry("k")["hash"]
+
+    fast = diff_snapshots(a, b)
+    full = full_diff(tmp_path, first, second)
+    assert fast["tables"] == full["tables"]
+    assert fast["summary"] == full["summary"]
+    assert fast["summary"]["CONST_RAW"]["entered_danger"] == 1
+    assert fast["summary"]["CONST_RAW"]["winner_changed"] == 1
+    assert fast["summary"]["PARTYLIST_RAW"]["changed"] == 1
+
+
+def test_keyframe_against_delta_and_identical_snapshots(tmp_path):
+    store = ArchiveStore(tmp_path / "archives")
+    base = snapshot()
+    later = edit(*base)
+    store.add(*base, snapshot_id="k")
+    store.add(*later, snapshot_id="d")
+    store.add(*copy.deepcopy(later), snapshot_id="same")
+
+    fast = diff_snapshots(open_snapshot(store, "k"), open_snapshot(store, "d"))
+    assert fast["tables"] == full_diff(tmp_path, base, later)["tables"]
+    assert fast["tables"]["CONST_RAW"]["added"] == ["ใหม่_1"]
+    assert fast["tables"]["CONST_RAW"]["removed"] == ["จังหวัด1_2"]
+
+    none = diff_snapshots(open_snapshot(store, "d"), open_snapshot(store, "same"))
+    assert all(not any(t.values()) for t in none["tables"].values())
@@ -0,0 +1,79 @@
+"""stations: streaming surplus rollups, outlier selection and the published files"""
+
+import json
+
+import pytest
+
+from constituency_registry import ConstituencyKeyError
+from stations import OUTLIER_FIELDS, STATION_COLUMNS, build_station_rollup, write_stations
+
+# prov_id, cons_no, district, unit_no, eligible, c_valid, c_invalid, c_blank, p_valid, p_invalid, p_blank
+STATIONS = [
+    ("BKK", 1, "พระนคร", 1, 800, 500, 10, 5, 500, 10, 5),     # balanced
+    ("BKK", 1, "พระนคร", 2, 800, 520, 10, 5, 500, 10, 5),     # +20: outlier
+    ("BKK", 2, "บางรัก", 1, 800, 500, 10, 5, 505, 10, 5),     # -5: below min_surplus
+    ("PTE", 8, "ลำลูกกา", 1, 900, 600, 20, 10, 560, 20, 10),  # +40: outlier, constituency drawn after 2566
+    ("PTE", 8, "ลำลูกกา", 2, 900, 600, 20, 10, 570, 20, 10),  # +30: outlier
+]
+
+
+def write_csv(path, rows, extra=""):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    lines = [",".join(STATION_COLUMNS)] + [",".join(str(v) for v in r) for r in rows]
+    path.write_text("\n".join(lines) + "\n" + extra, encoding="utf-8")
+    return path
+
+
+def test_rollup_streams_across_chunks(tmp_path):
+    # A row without a count is dropped and reported, not folded in as zero
+    csv = write_csv(tmp_path / "stations.csv", STATIONS, extra="BKK,1,พระนคร,3,800,,10,5,500,10,5\n")
+    agg = build_station_rollup([csv], min_surplus=10, min_share=0.02, chunk_rows=2)
+    assert (agg.rows, agg.dropped) == (5, 1)
+
+    cons = {(c["prov_id"], c["cons_no"]): c for c in agg.constituencies()}
+    assert list(cons) == [("BKK", 1), ("BKK", 2), ("PTE", 8)]
+    assert cons["BKK", 1]["stations"] == 2 and cons["BKK", 1]["surplus"] == 20 and cons["BKK", 1]["outliers"] == 1
+    assert cons["BKK", 2]["surplus"] == -5 and cons["BKK", 2]["surplus_stations"] == 1 and cons["BKK", 2]["outliers"] == 0
+    assert cons["PTE", 8]["surplus"] == 70 and cons["PTE", 8]["max_abs_surplus"] == 40
+
+    # Largest |surplus| first
+    unit = OUTLIER_FIELDS.index("unit_no")
+    assert [row[unit] for row in agg.station_outliers("PTE")] == [1, 2]
+
+
+def test_outliers_are_capped_per_province(tmp_path):
+    csv = write_csv(tmp_path / "stations.csv", STATIONS)
+    agg = build_station_rollup([csv], max_outliers=1)
+    assert agg.outlier_total["PTE"] == 2
+    assert len(agg.station_outliers("PTE")) == 1 and agg.station_outliers("PTE")[0][OUTLIER_FIELDS.index("surplus")] == 40
+
+
+def test_unregistered_constituency_raises(tmp_path):
+    csv = write_csv(tmp_path / "stations.csv", STATIONS + [("BKK", 99, "x", 1, 800, 500, 10, 5, 500, 10, 5)])
+    with pytest.raises(ConstituencyKeyError) as e:
+        build_station_rollup([csv])
+    assert e.value.keys == ["BKK_99"]
+
+
+def test_write_keeps_the_previous_generation(tmp_path):
+    out = tmp_path / "data" / "stations"
+    csv = write_csv(tmp_path / "stations.csv", STATIONS)
+    write_stations(build_station_rollup([csv]), out)
+    first = json.loads((out / "index.json").read_text(encoding="utf-8"))
+    assert sorted(first["provinces"]) == ["BKK", "PTE"]
+    assert first["provinces"]["PTE"]["outliers"] == 2
+    assert (tmp_path / first["summary"]).exists()
+
+    # BKK loses its outlier: its file stays for pages still holding the first index
+    write_csv(csv, [s for s in STATIONS if s[:2] != ("BKK", 1)])
+    write_stations(build_station_rollup([csv]), out)
+    second = json.loads((out / "index.json").read_text(encoding="utf-8"))
+    assert sorted(second["provinces"]) == ["PTE"]
+    assert (tmp_path / first["provinces"]["BKK"]["file"]).exists()
+    assert (tmp_path / first["summary"]).exists() and (tmp_path / second["summary"]).exists()
+
+    # A generation later it is gone
+    write_csv(csv, STATIONS[2:3] + STATIONS[4:])
+    write_stations(build_station_rollup([csv]), out)
+    assert not (tmp_path / first["provinces"]["BKK"]["file"]).exists()
+    assert not (tmp_path / first["summary"]).exists()